@@ -1,4 +1,3 @@
-import ast
 import base64
 import io
 import json
@@ -6,6 +5,7 @@ import logging
 import os
 import re
 import sys
+import threading
 from datetime import date
 from datetime import datetime
 from typing import Optional
@@ -15,7 +15,6 @@ import boto3
 import numpy as np
 import pandas as pd
 from botocore.exceptions import ClientError
-from flatten_json import flatten
 
 
 class DataProcessor:
@@ -118,24 +117,15 @@ class DataProcessor:
                 self.logger.error("Exception occurred:  %s", e)
                 return e
 
-            try:
-                self.logger.info("Dealing with empty child elements...")
-                payload = payload.replace("{}", "null").replace("[]", "null")
-                self.logger.info("Successfully dealt with empty child elements!")
-            except Exception as e:
-                self.logger.error("Payload:  %s", payload)
-                self.logger.error("Exception occurred:  %s", e)
-                return e
-
             try:
                 # Flatten JSON and convert to pandas
                 self.logger.info("Flattening JSON...")
                 json_payload = json.loads(payload)
-                flat_json = flatten(json_payload)
+                flat_json = flatten_dynamodb_record(json_payload)
                 self.logger.info("Success in flattening JSON!")
                 frames.append(flat_json)
             except Exception as e:
-                self.logger.error("Flat JSON:  %s", flat_json)
+                self.logger.error("Payload:  %s", payload)
                 self.logger.error("Exception occurred:  %s", e)
                 return e
 
@@ -335,58 +325,187 @@ def setup_logger(
     return logger
 
 
-def get_actual_dtypes(df) -> dict:
-    """Takes a target dataframe, returns the schemas dict
-    to be used while creating aws glue table,
-    data types references from https://docs.aws.amazon.com/athena/latest/ug/data-types.html
+def flatten_dynamodb_record(json_payload: dict, separator: str = "_") -> dict:
     """
-    result_dict = {}
-    for column_name in df.columns:
-        column_values = df[column_name].replace("None", None).replace("", None).dropna().astype(str)
-        try:
-            if "date" not in column_name.lower():
-                column_values = pd.Series([ast.literal_eval(entry.capitalize()) for entry in column_values.values])
-            else:
-                raise Exception
+    Flattens a decoded DynamoDB stream record into a single level dict in one pass,
+    using the same key layout as flatten_json.flatten.
+    Empty maps and lists are turned into None structurally, instead of rewriting
+    "{}" and "[]" in the raw payload text (which also rewrote string values).
+
+    :param json_payload: The decoded stream record
+    :param separator: The separator used to join nested keys
+    :return: The flattened record
+    """
+    flat_json = {}
 
-        except Exception:
-            try:
-                column_values = pd.Series([pd.to_datetime(entry) for entry in column_values.values])
-            except Exception:
-                pass
+    def _flatten(value, key):
+        if isinstance(value, dict) and value:
+            for child_key, child in value.items():
+                _flatten(child, f"{key}{separator}{child_key}" if key is not None else str(child_key))
+        elif isinstance(value, (list, tuple)) and value:
+            for index, item in enumerate(value):
+                _flatten(item, f"{key}{separator}{index}")
+        elif isinstance(value, (dict, list, tuple)):
+            flat_json[key] = None
+        else:
+            flat_json[key] = value
 
-        try:
-            if pd.api.types.is_integer_dtype(column_values):
-                max_value = column_values.max()
-                if max_value >= -(2**31) and max_value <= (2**31 - 1):
-                    athena_dtype = "int"
-                else:
-                    athena_dtype = "bigint"
-            elif pd.api.types.is_float_dtype(column_values):
-                max_value = column_values.max()
-                if str(max_value.dtype) == "float32":
-                    athena_dtype = "float"
-                else:
-                    athena_dtype = "double"
-            elif pd.api.types.is_bool_dtype(column_values):
-                athena_dtype = "boolean"
-            elif pd.api.types.is_datetime64_any_dtype(column_values) and column_name != "date":
-                if column_values.equals(column_values.dt.normalize()):
-                    athena_dtype = "date"
-                else:
-                    athena_dtype = "timestamp"
+    if json_payload:
+        _flatten(json_payload, None)
+
+    return flat_json
 
-            else:
-                athena_dtype = "string"
 
-        except Exception:
-            athena_dtype = "string"
+INFERENCE_SAMPLE_SIZE = 1000
+# Python int/float literals, ex. "007" is not an int and stays a string
+INT_LITERAL_PATTERN = r"[+-]?(?:0|[1-9]\d*)"
+FLOAT_LITERAL_PATTERN = r"[+-]?(?:\d+\.\d*|\.\d+|\d+(?=[eE]))(?:[eE][+-]?\d+)?"
+INT32_MIN, INT32_MAX = -(2**31), 2**31 - 1
+# Ordered from narrowest to widest
+NUMERIC_ATHENA_DTYPES = ["int", "bigint", "double"]
 
+logger = logging.getLogger(__name__)
+_table_dtypes = {}
+_table_dtypes_lock = threading.Lock()
+
+
+def _fits_int32(values: pd.Series) -> bool:
+    numbers = pd.to_numeric(values, errors="coerce")
+    return numbers.isna().all() or (
+        INT32_MIN <= numbers.min() and numbers.max() <= INT32_MAX
+    )
+
+
+def infer_athena_dtype(column_name: str, values: pd.Series) -> str:
+    """
+    Infers the Athena type of a column from its values with vectorized checks:
+    boolean, int/bigint, double, then date/timestamp (not for the "date" partition
+    column), else string. Columns named *date* are only tried as dates.
+    """
+    values = values[values.notna()].astype(str)
+    values = values[~values.isin(["None", ""])]
+    if values.empty:
+        return "string"
+
+    if "date" not in column_name.lower():
+        if values.str.lower().isin(["true", "false"]).all():
+            return "boolean"
+        ints = values.str.fullmatch(INT_LITERAL_PATTERN)
+        if ints.all():
+            numbers = pd.to_numeric(values, errors="coerce")
+            if numbers.dtype.kind != "i":
+                # Beyond int64
+                return "string"
+            return "int" if _fits_int32(numbers) else "bigint"
+        if (ints | values.str.fullmatch(FLOAT_LITERAL_PATTERN)).all():
+            return "double"
+
+    if column_name != "date":
+        # Most string columns already fail on their first values
+        probe = pd.to_datetime(values.head(10), errors="coerce", format="mixed", utc=True)
+        if probe.isna().any():
+            return "string"
+        parsed = pd.to_datetime(values, errors="coerce", format="mixed", utc=True)
+        if parsed.notna().all():
+            return "date" if (parsed == parsed.dt.normalize()).all() else "timestamp"
+
+    return "string"
+
+
+def widen_athena_dtype(athena_dtype: str, other: str) -> str:
+    """
+    Narrowest Athena type holding the values of both types: the widest of two
+    numeric types, timestamp for date and timestamp, else string.
+    """
+    if athena_dtype == other:
+        return athena_dtype
+    if athena_dtype in NUMERIC_ATHENA_DTYPES and other in NUMERIC_ATHENA_DTYPES:
+        return max(athena_dtype, other, key=NUMERIC_ATHENA_DTYPES.index)
+    if {athena_dtype, other} == {"date", "timestamp"}:
+        return "timestamp"
+    return "string"
+
+
+def get_actual_dtypes(
+    df, sample_size: Optional[int] = INFERENCE_SAMPLE_SIZE, known_dtypes: Optional[dict] = None
+) -> dict:
+    """Takes a target dataframe, returns the schemas dict
+    to be used while creating aws glue table,
+    data types references from https://docs.aws.amazon.com/athena/latest/ug/data-types.html
+
+    Types are inferred on a random sample of sample_size rows (None: all rows), the
+    int/bigint choice is checked on the whole column. Columns of known_dtypes (ex. the
+    data catalog schema) keep their known type.
+    """
+    sample = df
+    if sample_size is not None and len(df) > sample_size:
+        sample = df.sample(n=sample_size, random_state=0)
+
+    result_dict = {}
+    for position, column_name in enumerate(df.columns):
+        if column_name in result_dict:
+            continue
+        if known_dtypes and column_name in known_dtypes:
+            result_dict[column_name] = known_dtypes[column_name]
+            continue
+
+        athena_dtype = infer_athena_dtype(column_name, sample.iloc[:, position])
+        if athena_dtype == "int" and sample is not df and not _fits_int32(df.iloc[:, position]):
+            athena_dtype = "bigint"
         result_dict[column_name] = athena_dtype
 
     return result_dict
 
 
+def get_table_dtypes(
+    athena_table: str,
+    df,
+    known_dtypes: Optional[dict] = None,
+    sample_size: Optional[int] = INFERENCE_SAMPLE_SIZE,
+) -> dict:
+    """
+    get_actual_dtypes cached per Athena table: the columns of a table are inferred the
+    first time they are seen (ex. on the first scan page), then every page is inferred
+    again and a cached type its values do not fit is widened (widen_athena_dtype, ex.
+    int to bigint, double or string), so a page is never coerced to a narrower type.
+    Columns without values in a page keep their cached type.
+    """
+    df = df.loc[:, ~df.columns.duplicated()]
+    columns = [
+        column_name
+        for column_name in df.columns
+        if not (known_dtypes and column_name in known_dtypes)
+    ]
+
+    with _table_dtypes_lock:
+        cached = _table_dtypes.setdefault(athena_table, {})
+        # string holds any value, nothing to check
+        checked = [
+            column_name
+            for column_name in columns
+            if cached.get(column_name) != "string"
+            and (column_name not in cached or df[column_name].notna().any())
+        ]
+        if checked:
+            page_dtypes = get_actual_dtypes(df[checked], sample_size)
+            for column_name, athena_dtype in page_dtypes.items():
+                if column_name not in cached:
+                    cached[column_name] = athena_dtype
+                    continue
+                widened = widen_athena_dtype(cached[column_name], athena_dtype)
+                if widened != cached[column_name]:
+                    logger.warning(
+                        f"{athena_table}.{column_name} widened from "
+                        f"{cached[column_name]} to {widened}."
+                    )
+                    cached[column_name] = widened
+
+        return {
+            column_name: (known_dtypes or {}).get(column_name, cached.get(column_name))
+            for column_name in df.columns
+        }
+
+
 def apply_iso_format(timestamp_column: pd.Series) -> pd.Series:
     """
     Apply ISO format to a timestamp column, trying multiple formats for each record.
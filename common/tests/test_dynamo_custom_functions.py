@@ -0,0 +1,90 @@
+import pandas as pd
+import pytest
+
+import dynamo_custom_functions
+from dynamo_custom_functions import (
+    get_table_dtypes,
+    infer_athena_dtype,
+    widen_athena_dtype,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_table_dtypes():
+    dynamo_custom_functions._table_dtypes.clear()
+    yield
+    dynamo_custom_functions._table_dtypes.clear()
+
+
+@pytest.mark.parametrize(
+    "column_name, values, athena_dtype",
+    [
+        ("flag", ["true", "False", None], "boolean"),
+        ("count", ["1", "-2", "3"], "int"),
+        ("count", ["1", str(2**40)], "bigint"),
+        ("count", ["1", str(2**70)], "string"),
+        ("amount", ["1", "2.5", "1e3"], "double"),
+        ("code", ["007", "1"], "string"),
+        ("created", ["2025-01-31", "2025-02-01"], "date"),
+        ("created", ["2025-01-31T10:00:00Z", "2025-02-01"], "timestamp"),
+        ("update_date", ["1", "2"], "string"),
+        ("date", ["2025-01-31"], "string"),
+        ("name", ["a", "b"], "string"),
+        ("empty", [None, ""], "string"),
+    ],
+)
+def test_infer_athena_dtype(column_name, values, athena_dtype):
+    assert infer_athena_dtype(column_name, pd.Series(values)) == athena_dtype
+
+
+@pytest.mark.parametrize(
+    "athena_dtype, other, widened",
+    [
+        ("int", "int", "int"),
+        ("int", "bigint", "bigint"),
+        ("double", "int", "double"),
+        ("int", "string", "string"),
+        ("boolean", "int", "string"),
+        ("date", "timestamp", "timestamp"),
+        ("date", "string", "string"),
+    ],
+)
+def test_widen_athena_dtype(athena_dtype, other, widened):
+    assert widen_athena_dtype(athena_dtype, other) == widened
+
+
+def test_get_table_dtypes_caches_the_first_page():
+    first = pd.DataFrame({"x": ["1", "2"], "y": ["a", "b"]})
+
+    assert get_table_dtypes("table", first) == {"x": "int", "y": "string"}
+    # A page without values keeps the cached types
+    assert get_table_dtypes("table", pd.DataFrame({"x": [None], "z": ["1"]})) == {
+        "x": "int",
+        "z": "int",
+    }
+
+
+@pytest.mark.parametrize(
+    "values, widened",
+    [
+        ([str(2**40)], "bigint"),
+        (["1.5"], "double"),
+        (["a", "b"], "string"),
+    ],
+)
+def test_get_table_dtypes_widens_on_conflicting_pages(values, widened):
+    get_table_dtypes("table", pd.DataFrame({"x": ["1", "2"]}))
+
+    assert get_table_dtypes("table", pd.DataFrame({"x": values})) == {"x": widened}
+    # Never narrowed back
+    assert get_table_dtypes("table", pd.DataFrame({"x": ["3"]})) == {"x": widened}
+
+
+def test_get_table_dtypes_keeps_known_dtypes():
+    df = pd.DataFrame({"x": ["a"], "y": ["1"]})
+
+    assert get_table_dtypes("table", df, known_dtypes={"x": "int"}) == {
+        "x": "int",
+        "y": "int",
+    }
+    assert "x" not in dynamo_custom_functions._table_dtypes["table"]
@@ -0,0 +1,458 @@
+# Compaction of the date partitions of a datalake_raw table
+# BECAREFUL: double check function arguments before execution
+import io
+import json
+import math
+import re
+import sys
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+import awswrangler as wr
+import boto3
+import pyarrow as pa
+import pyarrow.parquet as pq
+from awsglue.utils import getResolvedOptions
+from botocore.exceptions import ClientError
+from ddb_read_write_parquet import get_athena_schema, setup_logger
+
+logger = setup_logger("glue_compaction")
+
+COMPACTION_PREFIX = "_compaction"
+MB = 1024 * 1024
+# Arrow types of the scalar Athena types, as written by awswrangler
+ATHENA_ARROW_TYPES = {
+    "string": pa.string(),
+    "varchar": pa.string(),
+    "char": pa.string(),
+    "tinyint": pa.int8(),
+    "smallint": pa.int16(),
+    "int": pa.int32(),
+    "integer": pa.int32(),
+    "bigint": pa.int64(),
+    "float": pa.float32(),
+    "double": pa.float64(),
+    "boolean": pa.bool_(),
+    "date": pa.date32(),
+    "timestamp": pa.timestamp("ns"),
+}
+
+
+def list_partitions(
+    s3_bucket_name: str, athena_table_name: str, start_date: str, end_date: str
+) -> List[str]:
+    """
+    Lists the date partitions of a table between two dates (inclusive).
+
+    Args:
+        start_date (str), end_date (str): Partition dates, format %Y-%m-%d.
+
+    Returns:
+        List[str]: Partition prefixes, ex. s3://bucket/table/date=2025-01-31/
+    """
+    partitions = []
+    for prefix in wr.s3.list_directories(f"s3://{s3_bucket_name}/{athena_table_name}/"):
+        partition = prefix.rstrip("/").rsplit("/", 1)[-1]
+        if not partition.startswith("date="):
+            continue
+        # ISO dates compare lexicographically
+        if start_date <= partition[len("date=") :] <= end_date:
+            partitions.append(prefix)
+
+    return sorted(partitions)
+
+
+def plan_files(
+    input_bytes: int, num_rows: int, target_file_mb: int, row_group_mb: int
+) -> dict:
+    """
+    Sizes the compacted files from the compressed bytes per row of the input files.
+
+    Returns:
+        dict: files (number of output files), rows_per_file and rows_per_row_group.
+    """
+    bytes_per_row = max(input_bytes / max(num_rows, 1), 1)
+    rows_per_file = max(int(target_file_mb * MB / bytes_per_row), 1)
+    rows_per_row_group = min(max(int(row_group_mb * MB / bytes_per_row), 1), rows_per_file)
+
+    return {
+        "files": max(math.ceil(num_rows / rows_per_file), 1),
+        "rows_per_file": rows_per_file,
+        "rows_per_row_group": rows_per_row_group,
+    }
+
+
+def athena_to_arrow(athena_type: str) -> Optional[pa.DataType]:
+    """
+    Arrow type of a scalar Athena type (ex. bigint, decimal(10,2), varchar(20)), None
+    for the complex types (array, map, struct).
+    """
+    athena_type = athena_type.strip().lower()
+    decimal = re.fullmatch(r"decimal\((\d+),\s*(\d+)\)", athena_type)
+    if decimal:
+        return pa.decimal128(int(decimal.group(1)), int(decimal.group(2)))
+    return ATHENA_ARROW_TYPES.get(re.sub(r"\(.*\)$", "", athena_type))
+
+
+def merge_tables(tables: List[pa.Table], athena_schema: Dict[str, str]) -> pa.Table:
+    """
+    Concatenates the Arrow tables of the files of a partition, typed to the Glue
+    schema of the table.
+
+    Every column is cast to the Arrow type of its Glue type with a safe cast, so a
+    value the Glue type cannot hold (ex. "a" or 1.5 in a bigint column, an int64
+    overflowing an int column) raises an ArrowInvalid instead of being truncated.
+    The stream Lambda drops the all-null columns of a batch, so files can miss
+    columns: they are filled with nulls. Complex columns (no Arrow type) keep the
+    type of the files. Columns missing from the Glue schema raise a ValueError.
+    """
+    unknown = sorted(
+        {column for table in tables for column in table.column_names}
+        - set(athena_schema)
+    )
+    if unknown:
+        raise ValueError(f"Columns {unknown} are not in the Glue schema")
+
+    fields = []
+    for column, athena_type in athena_schema.items():
+        file_types = [
+            table.schema.field(column).type
+            for table in tables
+            if column in table.column_names
+        ]
+        if not file_types:
+            continue
+        arrow_type = athena_to_arrow(athena_type)
+        if arrow_type is None:
+            arrow_type = next(
+                (file_type for file_type in file_types if file_type != pa.null()),
+                file_types[0],
+            )
+        fields.append(pa.field(column, arrow_type))
+    schema = pa.schema(fields)
+
+    typed = []
+    for table in tables:
+        arrays = []
+        for field in schema:
+            if field.name not in table.column_names:
+                arrays.append(pa.nulls(table.num_rows, field.type))
+                continue
+            column = table.column(field.name)
+            if column.type != field.type:
+                column = column.cast(field.type, safe=True)
+            arrays.append(column)
+        typed.append(pa.Table.from_arrays(arrays, schema=schema))
+
+    # Same schema for all the tables, no type promotion needed (pyarrow < 14)
+    return pa.concat_tables(typed)
+
+
+class PartitionCompactor:
+    """
+    Rewrites the small Parquet files of one date partition into a few large ones.
+
+    Files are read as Arrow tables and written typed to the Glue schema of the table
+    (see merge_tables), a partition with values the Glue types cannot hold fails.
+
+    The compacted files are staged under s3://<bucket>/_compaction/<table>/date=<date>/
+    and swapped in through a manifest (_manifest.json) listing the original and the
+    compacted keys:
+    1. status "staged": compacted files are written and their row count checked;
+    2. status "copied": compacted files are copied into the partition;
+    3. the original files, the staged files and the manifest are deleted.
+    Files added to the partition during the compaction are not in the manifest and
+    are left untouched. A manifest left by a failed run is resumed (copied) or rolled
+    back (staged) before the partition is compacted again.
+    """
+
+    def __init__(
+        self,
+        s3_bucket_name: str,
+        athena_table_name: str,
+        target_file_mb: int,
+        row_group_mb: int,
+        athena_schema: Dict[str, str],
+    ):
+        self.s3_bucket_name = s3_bucket_name
+        self.athena_table_name = athena_table_name
+        self.athena_schema = athena_schema
+        self.target_file_mb = target_file_mb
+        self.row_group_mb = row_group_mb
+        self.s3_client = boto3.client("s3")
+
+    def _staging_prefix(self, partition: str) -> str:
+        return f"{COMPACTION_PREFIX}/{self.athena_table_name}/{partition}/"
+
+    def _manifest_key(self, partition: str) -> str:
+        return f"{self._staging_prefix(partition)}_manifest.json"
+
+    def _read_manifest(self, partition: str) -> Optional[dict]:
+        try:
+            response = self.s3_client.get_object(
+                Bucket=self.s3_bucket_name, Key=self._manifest_key(partition)
+            )
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "NoSuchKey":
+                return None
+            raise
+        return json.loads(response["Body"].read())
+
+    def _write_manifest(self, partition: str, manifest: dict) -> None:
+        self.s3_client.put_object(
+            Bucket=self.s3_bucket_name,
+            Key=self._manifest_key(partition),
+            Body=json.dumps(manifest),
+        )
+
+    def _delete_paths(self, paths: List[str]) -> None:
+        if paths:
+            wr.s3.delete_objects(paths)
+
+    def _clean_staging(self, partition: str) -> None:
+        self._delete_paths(
+            wr.s3.list_objects(f"s3://{self.s3_bucket_name}/{self._staging_prefix(partition)}")
+        )
+
+    def recover(self, partition: str) -> None:
+        """
+        Completes or rolls back the swap of a run that failed on this partition.
+        """
+        manifest = self._read_manifest(partition)
+        if manifest is None:
+            return
+
+        if manifest["status"] == "copied":
+            logger.warning(f"{partition}: resuming swap of run {manifest['run_id']}")
+            self._delete_paths(manifest["originals"])
+        else:
+            logger.warning(f"{partition}: rolling back run {manifest['run_id']}")
+            self._delete_paths(manifest["compacted"])
+        self._clean_staging(partition)
+
+    def _get_object(self, path: str) -> bytes:
+        bucket, key = path[len("s3://") :].split("/", 1)
+        return self.s3_client.get_object(Bucket=bucket, Key=key)["Body"].read()
+
+    def _read_table(self, path: str) -> pa.Table:
+        return pq.read_table(io.BytesIO(self._get_object(path)))
+
+    def _write_staged(
+        self, table: pa.Table, partition: str, run_id: str, plan: dict
+    ) -> List[str]:
+        staged = []
+        for part in range(plan["files"]):
+            chunk = table.slice(part * plan["rows_per_file"], plan["rows_per_file"])
+            sink = io.BytesIO()
+            pq.write_table(
+                chunk,
+                sink,
+                compression="snappy",
+                row_group_size=plan["rows_per_row_group"],
+            )
+            key = (
+                f"{self._staging_prefix(partition)}{run_id}/part-{part:05d}.snappy.parquet"
+            )
+            self.s3_client.put_object(
+                Bucket=self.s3_bucket_name, Key=key, Body=sink.getvalue()
+            )
+            staged.append(f"s3://{self.s3_bucket_name}/{key}")
+
+        return staged
+
+    def compact(self, partition_prefix: str) -> dict:
+        """
+        Compacts one date partition.
+
+        Args:
+            partition_prefix (str): ex. s3://bucket/table/date=2025-01-31/
+
+        Returns:
+            dict: File and byte counts before and after the compaction.
+        """
+        partition = partition_prefix.rstrip("/").rsplit("/", 1)[-1]
+        self.recover(partition)
+
+        sizes = wr.s3.size_objects(
+            wr.s3.list_objects(partition_prefix, suffix=".parquet")
+        )
+        originals = sorted(sizes)
+        input_bytes = sum(sizes.values())
+        stats = {
+            "partition": partition,
+            "files_before": len(originals),
+            "bytes_before": input_bytes,
+            "files_after": len(originals),
+            "bytes_after": input_bytes,
+        }
+        if math.ceil(input_bytes / (self.target_file_mb * MB)) >= len(originals):
+            logger.info(f"{partition}: {len(originals)} files already compacted")
+            return stats
+
+        table = merge_tables(
+            [self._read_table(file) for file in originals], self.athena_schema
+        )
+
+        plan = plan_files(input_bytes, table.num_rows, self.target_file_mb, self.row_group_mb)
+        if plan["files"] >= len(originals):
+            logger.info(f"{partition}: {len(originals)} files already compacted")
+            return stats
+
+        run_id = uuid.uuid4().hex
+        staged = self._write_staged(table, partition, run_id, plan)
+        staged_rows = sum(
+            pq.read_metadata(io.BytesIO(self._get_object(path))).num_rows
+            for path in staged
+        )
+        if staged_rows != table.num_rows:
+            self._clean_staging(partition)
+            raise ValueError(
+                f"{partition}: staged {staged_rows} rows instead of {table.num_rows}"
+            )
+
+        compacted = [
+            f"{partition_prefix.rstrip('/')}/compacted_{run_id}_{path.rsplit('part-', 1)[-1]}"
+            for path in staged
+        ]
+        manifest = {
+            "run_id": run_id,
+            "originals": originals,
+            "compacted": compacted,
+            "rows": table.num_rows,
+            "status": "staged",
+        }
+        self._write_manifest(partition, manifest)
+
+        for source, target in zip(staged, compacted):
+            self.s3_client.copy_object(
+                Bucket=self.s3_bucket_name,
+                Key=target.split("/", 3)[-1],
+                CopySource={"Bucket": self.s3_bucket_name, "Key": source.split("/", 3)[-1]},
+            )
+        manifest["status"] = "copied"
+        self._write_manifest(partition, manifest)
+
+        self._delete_paths(originals)
+        self._clean_staging(partition)
+
+        stats["files_after"] = len(compacted)
+        stats["bytes_after"] = sum(wr.s3.size_objects(compacted).values())
+        logger.info(
+            f"{partition}: {stats['files_before']} -> {stats['files_after']} files, "
+            f"{stats['bytes_before']} -> {stats['bytes_after']} bytes"
+        )
+        return stats
+
+
+def compact_partitions(
+    compactor: PartitionCompactor, partitions: List[str], parallelism: int
+) -> List[dict]:
+    """
+    Compacts partitions, parallelism at a time. A failing partition does not stop
+    the others: its stats only hold the partition and the error.
+    """
+    stats = []
+    with ThreadPoolExecutor(max_workers=parallelism) as executor:
+        futures = {
+            partition: executor.submit(compactor.compact, partition)
+            for partition in partitions
+        }
+        for partition, future in futures.items():
+            try:
+                stats.append(future.result())
+            except Exception as e:
+                partition = partition.rstrip("/").rsplit("/", 1)[-1]
+                logger.error(f"{partition}: compaction failed: {e}")
+                stats.append({"partition": partition, "error": str(e)})
+
+    return stats
+
+
+def report(stats: List[dict]) -> dict:
+    """
+    Sums the per partition stats of a compaction run, failed partitions are listed
+    in failed_partitions.
+    """
+    failed = [partition_stats for partition_stats in stats if "error" in partition_stats]
+    stats = [partition_stats for partition_stats in stats if "error" not in partition_stats]
+    totals = {
+        key: sum(partition_stats[key] for partition_stats in stats)
+        for key in ("files_before", "files_after", "bytes_before", "bytes_after")
+    }
+    totals["partitions"] = len(stats) + len(failed)
+    totals["compacted_partitions"] = sum(
+        partition_stats["files_after"] < partition_stats["files_before"]
+        for partition_stats in stats
+    )
+    totals["file_reduction_pct"] = round(
+        100 * (1 - totals["files_after"] / max(totals["files_before"], 1)), 2
+    )
+    totals["byte_reduction_pct"] = round(
+        100 * (1 - totals["bytes_after"] / max(totals["bytes_before"], 1)), 2
+    )
+    totals["failed_partitions"] = [
+        partition_stats["partition"] for partition_stats in failed
+    ]
+
+    return totals
+
+
+def main():
+    try:
+        # STEP_1: Initialize global variables
+        args = getResolvedOptions(
+            sys.argv,
+            [
+                "ATHENA_TABLE_NAME",
+                "S3_BUCKET_NAME",
+                "START_DATE",
+                "END_DATE",
+                "PARALLELISM",
+                "TARGET_FILE_SIZE_MB",
+                "ROW_GROUP_SIZE_MB",
+            ],
+        )
+
+        athena_table_name = args["ATHENA_TABLE_NAME"]
+        s3_bucket_name = args["S3_BUCKET_NAME"]
+        start_date = args["START_DATE"]  # format %Y-%m-%d
+        end_date = args["END_DATE"]  # format %Y-%m-%d
+        parallelism = int(args["PARALLELISM"])
+
+        # STEP_2: Get the Glue schema the compacted files are typed to, and the
+        # partitions to compact
+        schema = get_athena_schema("datalake_raw", athena_table_name, boto3.client("glue"))
+        if schema is None:
+            raise ValueError(f"No Glue schema for table {athena_table_name}")
+
+        partitions = list_partitions(s3_bucket_name, athena_table_name, start_date, end_date)
+        logger.info(f"Compacting {len(partitions)} partitions of {athena_table_name}")
+
+        # STEP_3: Compact the partitions, PARALLELISM at a time
+        compactor = PartitionCompactor(
+            s3_bucket_name,
+            athena_table_name,
+            int(args["TARGET_FILE_SIZE_MB"]),
+            int(args["ROW_GROUP_SIZE_MB"]),
+            schema,
+        )
+        stats = compact_partitions(compactor, partitions, parallelism)
+
+        totals = report(stats)
+        if totals["failed_partitions"]:
+            raise RuntimeError(
+                f"Compaction of {len(totals['failed_partitions'])} partitions of "
+                f"{athena_table_name} failed: {totals['failed_partitions']} "
+                f"{json.dumps(totals)}"
+            )
+        res = f"[Success] Finished compaction of table: {athena_table_name} {json.dumps(totals)}"
+        logger.info(res)
+        return res
+    except Exception as e:
+        logger.error("Error in Glue job: %s", e)
+        raise
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,255 @@
+import io
+import json
+import os
+from datetime import date
+from unittest.mock import patch
+
+import boto3
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+from moto import mock_aws
+
+from ddb_compact_partitions import (
+    PartitionCompactor,
+    athena_to_arrow,
+    compact_partitions,
+    list_partitions,
+    plan_files,
+    report,
+)
+
+BUCKET = "test-raw-bucket"
+TABLE = "test_table"
+PARTITION = f"s3://{BUCKET}/{TABLE}/date=2025-01-31/"
+SCHEMA = {
+    "id": "string",
+    "amount": "bigint",
+    "price": "double",
+    "active": "boolean",
+    "opened": "date",
+}
+
+
+@pytest.fixture
+def s3():
+    with patch.dict(
+        os.environ,
+        {
+            "AWS_DEFAULT_REGION": "eu-west-2",
+            "AWS_ACCESS_KEY_ID": "testing",
+            "AWS_SECRET_ACCESS_KEY": "testing",
+        },
+    ), mock_aws():
+        client = boto3.client("s3")
+        client.create_bucket(
+            Bucket=BUCKET,
+            CreateBucketConfiguration={"LocationConstraint": "eu-west-2"},
+        )
+        yield client
+
+
+def put_table(s3, key: str, table: pa.Table) -> None:
+    sink = io.BytesIO()
+    pq.write_table(table, sink, compression="snappy")
+    s3.put_object(Bucket=BUCKET, Key=key, Body=sink.getvalue())
+
+
+def read_partition(s3) -> pa.Table:
+    response = s3.list_objects_v2(Bucket=BUCKET, Prefix=f"{TABLE}/date=2025-01-31/")
+    keys = [obj["Key"] for obj in response["Contents"]]
+    assert len(keys) == 1
+    body = s3.get_object(Bucket=BUCKET, Key=keys[0])["Body"].read()
+    return pq.read_table(io.BytesIO(body))
+
+
+def test_plan_files():
+    plan = plan_files(100 * 1024 * 1024, 1000000, 64, 16)
+
+    assert plan["files"] == 2
+    assert plan["rows_per_file"] == 640000
+    assert plan["rows_per_row_group"] == 160000
+
+
+def test_list_partitions(s3):
+    for day in ("2025-01-30", "2025-01-31", "2025-02-01"):
+        s3.put_object(Bucket=BUCKET, Key=f"{TABLE}/date={day}/a.parquet", Body=b"")
+
+    assert list_partitions(BUCKET, TABLE, "2025-01-31", "2025-02-01") == [
+        f"s3://{BUCKET}/{TABLE}/date=2025-01-31/",
+        f"s3://{BUCKET}/{TABLE}/date=2025-02-01/",
+    ]
+
+
+def test_compact_keeps_types_and_missing_columns(s3):
+    put_table(
+        s3,
+        f"{TABLE}/date=2025-01-31/batch-1.snappy.parquet",
+        pa.table(
+            {
+                "id": ["1", "2"],
+                "amount": pa.array([10, None], pa.int64()),
+                "price": [1.5, 2.25],
+                "active": [True, False],
+                "opened": [date(2025, 1, 1), date(2025, 1, 2)],
+            }
+        ),
+    )
+    # The stream Lambda drops the all-null columns of a batch
+    put_table(
+        s3,
+        f"{TABLE}/date=2025-01-31/batch-2.snappy.parquet",
+        pa.table(
+            {
+                "id": ["3"],
+                "amount": pa.array([30], pa.int64()),
+                "opened": [date(2025, 1, 3)],
+            }
+        ),
+    )
+    put_table(
+        s3,
+        f"{TABLE}/date=2025-01-31/batch-3.snappy.parquet",
+        pa.table(
+            {
+                "id": ["4"],
+                "amount": pa.array([None], pa.null()),
+                "price": [4.0],
+                "active": [True],
+                "opened": [date(2025, 1, 4)],
+            }
+        ),
+    )
+
+    stats = PartitionCompactor(BUCKET, TABLE, 1, 1, SCHEMA).compact(PARTITION)
+
+    assert (stats["files_before"], stats["files_after"]) == (3, 1)
+    table = read_partition(s3).sort_by("id")
+    assert table.schema.field("id").type == pa.string()
+    assert table.schema.field("amount").type == pa.int64()
+    assert table.schema.field("price").type == pa.float64()
+    assert table.schema.field("active").type == pa.bool_()
+    assert table.schema.field("opened").type == pa.date32()
+    assert table.to_pydict() == {
+        "id": ["1", "2", "3", "4"],
+        "amount": [10, None, 30, None],
+        "price": [1.5, 2.25, None, 4.0],
+        "active": [True, False, None, True],
+        "opened": [date(2025, 1, day) for day in range(1, 5)],
+    }
+    assert "Contents" not in s3.list_objects_v2(Bucket=BUCKET, Prefix="_compaction/")
+
+
+def test_athena_to_arrow():
+    assert athena_to_arrow("bigint") == pa.int64()
+    assert athena_to_arrow("varchar(20)") == pa.string()
+    assert athena_to_arrow("decimal(10, 2)") == pa.decimal128(10, 2)
+    assert athena_to_arrow("array<string>") is None
+
+
+def test_compact_casts_to_the_glue_schema(s3):
+    put_table(
+        s3,
+        f"{TABLE}/date=2025-01-31/batch-1.snappy.parquet",
+        pa.table({"id": ["1"], "amount": pa.array([1], pa.int64())}),
+    )
+    # All null in this batch, and a number the stream Lambda typed as a string
+    put_table(
+        s3,
+        f"{TABLE}/date=2025-01-31/batch-2.snappy.parquet",
+        pa.table({"id": ["2"], "amount": pa.array([None], pa.null()), "count": ["3"]}),
+    )
+    schema = {"id": "string", "amount": "int", "count": "bigint"}
+
+    PartitionCompactor(BUCKET, TABLE, 1, 1, schema).compact(PARTITION)
+
+    table = read_partition(s3).sort_by("id")
+    assert table.schema.field("amount").type == pa.int32()
+    assert table.schema.field("count").type == pa.int64()
+    assert table.to_pydict() == {
+        "id": ["1", "2"],
+        "amount": [1, None],
+        "count": [None, 3],
+    }
+
+
+def test_compact_fails_on_columns_missing_from_the_glue_schema(s3):
+    for batch in ("1", "2"):
+        put_table(
+            s3,
+            f"{TABLE}/date=2025-01-31/batch-{batch}.snappy.parquet",
+            pa.table({"id": [batch], "unknown": [batch]}),
+        )
+
+    with pytest.raises(ValueError, match="unknown"):
+        PartitionCompactor(BUCKET, TABLE, 1, 1, SCHEMA).compact(PARTITION)
+
+
+def test_compact_fails_on_lossy_casts(s3):
+    put_table(
+        s3,
+        f"{TABLE}/date=2025-01-31/batch-1.snappy.parquet",
+        pa.table({"id": ["1"], "amount": pa.array([1], pa.int64())}),
+    )
+    put_table(
+        s3,
+        f"{TABLE}/date=2025-01-31/batch-2.snappy.parquet",
+        pa.table({"id": ["2"], "amount": ["one"]}),
+    )
+
+    with pytest.raises(pa.ArrowInvalid):
+        PartitionCompactor(BUCKET, TABLE, 1, 1, SCHEMA).compact(PARTITION)
+
+    assert len(s3.list_objects_v2(Bucket=BUCKET, Prefix=f"{TABLE}/")["Contents"]) == 2
+
+
+def test_compact_partitions_continues_after_a_failed_partition(s3):
+    for day, amounts in (("2025-01-30", ["one", "two"]), ("2025-01-31", [1, 2])):
+        for index, amount in enumerate(amounts):
+            put_table(
+                s3,
+                f"{TABLE}/date={day}/batch-{index}.snappy.parquet",
+                pa.table({"id": [str(index)], "amount": [amount]}),
+            )
+    partitions = list_partitions(BUCKET, TABLE, "2025-01-30", "2025-01-31")
+
+    stats = compact_partitions(
+        PartitionCompactor(BUCKET, TABLE, 1, 1, SCHEMA), partitions, 2
+    )
+    totals = report(stats)
+
+    assert totals["failed_partitions"] == ["date=2025-01-30"]
+    assert totals["partitions"] == 2
+    assert totals["compacted_partitions"] == 1
+    assert (totals["files_before"], totals["files_after"]) == (2, 1)
+    assert read_partition(s3).to_pydict() == {"id": ["0", "1"], "amount": [1, 2]}
+
+
+def test_recover_resumes_copied_swap(s3):
+    put_table(
+        s3,
+        f"{TABLE}/date=2025-01-31/batch-1.snappy.parquet",
+        pa.table({"id": ["1"]}),
+    )
+    put_table(
+        s3,
+        f"{TABLE}/date=2025-01-31/compacted_run_00000.snappy.parquet",
+        pa.table({"id": ["1"]}),
+    )
+    s3.put_object(
+        Bucket=BUCKET,
+        Key=f"_compaction/{TABLE}/date=2025-01-31/_manifest.json",
+        Body=json.dumps(
+            {
+                "run_id": "run",
+                "originals": [f"{PARTITION}batch-1.snappy.parquet"],
+                "compacted": [f"{PARTITION}compacted_run_00000.snappy.parquet"],
+                "status": "copied",
+            }
+        ),
+    )
+
+    PartitionCompactor(BUCKET, TABLE, 1, 1, SCHEMA).recover("date=2025-01-31")
+
+    assert read_partition(s3).to_pydict() == {"id": ["1"]}
+    assert "Contents" not in s3.list_objects_v2(Bucket=BUCKET, Prefix="_compaction/")
@@ -1,14 +1,24 @@
 # Generic backfill lambda (DynamoDB >> Athena/S3)
 # BECAREFUL: double check function arguments before execution
+import abc
 import ast
+import json
 import logging
+import os
+import pickle
+import queue
 import re
+import shutil
 import sys
+import tempfile
+import threading
 import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 from datetime import datetime
 from datetime import timezone
-from typing import Optional
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 import awswrangler as wr
 import boto3
@@ -16,7 +26,9 @@ import numpy as np
 import pandas as pd
 from awsglue.utils import getResolvedOptions
 from flatten_json import flatten
+import data_catalog
 from data_catalog import schemas
+from dynamo_custom_functions import get_actual_dtypes, get_table_dtypes
 
 
 def setup_logger(
@@ -59,68 +71,30 @@ def setup_logger(
 logger = setup_logger("glue_migration")
 
 
-def get_actual_dtypes(df) -> dict:
-    """Takes a target dataframe, returns the schemas dict
-    to be used while creating aws glue table,
-    data types references from https://docs.aws.amazon.com/athena/latest/ug/data-types.html
-    """
-    result_dict = {}
-    for column_name in df.columns:
-        column_values = (
-            df[column_name].replace("None", None).replace("", None).dropna().astype(str)
-        )
-        try:
-            if "date" not in column_name.lower():
-                column_values = pd.Series(
-                    [
-                        ast.literal_eval(entry.capitalize())
-                        for entry in column_values.values
-                    ]
-                )
-            else:
-                raise Exception
-
-        except Exception:
-            try:
-                column_values = pd.Series(
-                    [pd.to_datetime(entry) for entry in column_values.values]
-                )
-            except Exception:
-                pass
-
-        try:
-            if pd.api.types.is_integer_dtype(column_values):
-                max_value = column_values.max()
-                if max_value >= -(2**31) and max_value <= (2**31 - 1):
-                    athena_dtype = "int"
-                else:
-                    athena_dtype = "bigint"
-            elif pd.api.types.is_float_dtype(column_values):
-                max_value = column_values.max()
-                if str(max_value.dtype) == "float32":
-                    athena_dtype = "float"
-                else:
-                    athena_dtype = "double"
-            elif pd.api.types.is_bool_dtype(column_values):
-                athena_dtype = "boolean"
-            elif (
-                pd.api.types.is_datetime64_any_dtype(column_values)
-                and column_name != "date"
-            ):
-                if column_values.equals(column_values.dt.normalize()):
-                    athena_dtype = "date"
-                else:
-                    athena_dtype = "timestamp"
-
-            else:
-                athena_dtype = "string"
+NUMERIC_ATHENA_DTYPES = ["int", "bigint", "float", "double"]
 
-        except Exception:
-            athena_dtype = "string"
 
-        result_dict[column_name] = athena_dtype
+def merge_athena_dtypes(schema: dict, other: dict) -> dict:
+    """
+    Merges two inferred schemas (ex. of two scan windows), a column typed differently
+    in both is widened to the larger numeric type, or to string.
+    """
+    merged = dict(schema)
+    for column_name, athena_dtype in other.items():
+        current_dtype = merged.setdefault(column_name, athena_dtype)
+        if current_dtype == athena_dtype:
+            continue
+        if (
+            current_dtype in NUMERIC_ATHENA_DTYPES
+            and athena_dtype in NUMERIC_ATHENA_DTYPES
+        ):
+            merged[column_name] = max(
+                current_dtype, athena_dtype, key=NUMERIC_ATHENA_DTYPES.index
+            )
+        else:
+            merged[column_name] = "string"
 
-    return result_dict
+    return merged
 
 
 def apply_iso_format(timestamp_column: pd.Series) -> pd.Series:
@@ -239,10 +213,16 @@ def apply_schema(df: pd.DataFrame, schema: dict) -> pd.DataFrame:
 
 
 def write_to_s3(
-    df, target_athena_table, s3_bucket_name, wrangler_write_mode, athena_schema
+    df,
+    target_athena_table,
+    s3_bucket_name,
+    wrangler_write_mode,
+    athena_schema,
+    filename_prefix=None,
 ):
     """
     Write the given DataFrame to S3 as a Parquet file.
+    Returns the written S3 paths.
     """
 
     path = f"s3://{s3_bucket_name}/{target_athena_table}/"
@@ -252,7 +232,7 @@ def write_to_s3(
     logger.info("Uploading to S3 location:  %s", path)
 
     try:
-        wr.s3.to_parquet(
+        res = wr.s3.to_parquet(
             df=df,
             path=path,
             index=False,
@@ -264,8 +244,10 @@ def write_to_s3(
             table=target_athena_table,
             schema_evolution="true",
             dtype=athena_schema,
+            filename_prefix=filename_prefix,
         )
         logger.info("Uploaded to S3 location: %s", path)
+        return res["paths"]
     except Exception as e:
         logger.error("Failed uploading to S3 location: %s", path)
         logger.error("Exception occurred: %s", e)
@@ -325,6 +307,878 @@ def process_json(json_string, dyanmo_partition_column):
         raise
 
 
+NEW_IMAGE_COLUMN_PREFIX = "dynamodb_new_image_"
+DYNAMODB_TYPE_CODES = {"s", "n", "b", "bool", "null", "m", "l", "ss", "ns", "bs"}
+
+
+def to_snake_case(attribute_name: str) -> str:
+    """
+    Column name of a DynamoDB attribute, as converted by process_json.
+    """
+    return (
+        re.sub("(?!^)([A-Z]+)", r"_\1", attribute_name)
+        .lower()
+        .replace("__", "_")
+        .replace("-", "")
+    )
+
+
+def get_schema_attributes(schema: dict) -> set:
+    """
+    Snake case names of the top level DynamoDB attributes of a catalog schema, i.e.
+    the part of each dynamodb_new_image_* column before its first type code.
+    """
+    attributes = set()
+    for column_name in schema:
+        if not column_name.startswith(NEW_IMAGE_COLUMN_PREFIX):
+            continue
+        tokens = column_name[len(NEW_IMAGE_COLUMN_PREFIX) :].split("_")
+        for end in range(1, len(tokens)):
+            if tokens[end] in DYNAMODB_TYPE_CODES:
+                attributes.add("_".join(tokens[:end]))
+                break
+
+    return attributes
+
+
+def build_projection(
+    schema: dict,
+    sample_items: list,
+    required_attributes: list,
+    attribute_names: Iterable[str] = (),
+) -> Tuple[str, dict]:
+    """
+    Builds a ProjectionExpression fetching only the attributes of the catalog schema.
+
+    Catalog columns are snake case, so the real attribute names are taken from a
+    sample of items and from attribute_names (the DynamoDB names of catalog
+    attributes). The catalog attributes found in neither are projected under their
+    catalog name: projecting an attribute no item has is harmless, but one whose
+    DynamoDB name is not snake case is not backfilled, so they are logged.
+
+    Returns:
+        tuple: ProjectionExpression and its ExpressionAttributeNames.
+    """
+    columns = [
+        column_name[len(NEW_IMAGE_COLUMN_PREFIX) :]
+        for column_name in schema
+        if column_name.startswith(NEW_IMAGE_COLUMN_PREFIX)
+    ]
+    attributes = set(required_attributes) | set(attribute_names)
+    for attribute_name in {name for item in sample_items for name in item}:
+        snake_name = to_snake_case(attribute_name)
+        if any(column.startswith(f"{snake_name}_") for column in columns):
+            attributes.add(attribute_name)
+
+    found = {to_snake_case(attribute_name) for attribute_name in attributes}
+    missing = get_schema_attributes(schema) - found
+    if missing:
+        logger.warning(
+            "PROJECTION: catalog attributes %s are not in the sampled items, projected "
+            "under their catalog names. Add their DynamoDB names to "
+            "PROJECTION_ATTRIBUTES if they are not snake case.",
+            sorted(missing),
+        )
+        attributes |= missing
+
+    names = {
+        f"#p{index}": attribute_name
+        for index, attribute_name in enumerate(sorted(attributes))
+    }
+    return ", ".join(names), names
+
+
+class CheckpointStore(abc.ABC):
+    """
+    Durable storage of the backfill checkpoint (one JSON document).
+    """
+
+    @abc.abstractmethod
+    def load(self) -> Optional[dict]:
+        """
+        Returns the saved checkpoint, None when there is none.
+        """
+
+    @abc.abstractmethod
+    def save(self, checkpoint: dict) -> None:
+        """
+        Replaces the saved checkpoint.
+        """
+
+
+class S3CheckpointStore(CheckpointStore):
+    def __init__(self, path: str):
+        self.bucket, self.key = path[len("s3://") :].split("/", 1)
+        self.s3_client = boto3.client("s3")
+
+    def load(self) -> Optional[dict]:
+        try:
+            response = self.s3_client.get_object(Bucket=self.bucket, Key=self.key)
+        except self.s3_client.exceptions.NoSuchKey:
+            return None
+        return json.loads(response["Body"].read())
+
+    def save(self, checkpoint: dict) -> None:
+        self.s3_client.put_object(
+            Bucket=self.bucket, Key=self.key, Body=json.dumps(checkpoint)
+        )
+
+
+class LocalCheckpointStore(CheckpointStore):
+    def __init__(self, path: str):
+        self.path = path
+
+    def load(self) -> Optional[dict]:
+        try:
+            with open(self.path, "r") as checkpoint_file:
+                return json.load(checkpoint_file)
+        except FileNotFoundError:
+            return None
+
+    def save(self, checkpoint: dict) -> None:
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        # Write then rename, so a crash never leaves a truncated checkpoint
+        with open(f"{self.path}.tmp", "w") as checkpoint_file:
+            json.dump(checkpoint, checkpoint_file)
+        os.replace(f"{self.path}.tmp", self.path)
+
+
+def get_checkpoint_store(location: str, target_athena_table: str) -> CheckpointStore:
+    """
+    Checkpoint store of a target table, in S3 (s3:// location) or on the local disk.
+    """
+    path = f"{location.rstrip('/')}/{target_athena_table}.json"
+    if path.startswith("s3://"):
+        return S3CheckpointStore(path)
+    return LocalCheckpointStore(path)
+
+
+class Checkpoint:
+    """
+    Progress of a backfill run: per scan segment, the LastEvaluatedKey to continue
+    from, the number of pages processed and the S3 files of the last page (the
+    checkpoint is saved every page, so it does not grow with the table).
+
+    Each page is written with the filename prefix <run_id>_<segment>_<page>_ and
+    recorded right after, so a page written by a run that died before recording it
+    is found, deleted and rewritten on resume instead of being duplicated.
+    """
+
+    def __init__(self, store: CheckpointStore, params: dict, resume: bool):
+        self.store = store
+        self.lock = threading.Lock()
+        self.resumed = False
+
+        state = store.load() if resume else None
+        if state is None:
+            if resume:
+                logger.warning("No checkpoint found, starting a new backfill.")
+            state = {"run_id": uuid.uuid4().hex[:8], "params": params, "segments": {}}
+        else:
+            if state["params"] != params:
+                raise ValueError(
+                    f"Cannot resume: checkpoint was created with {state['params']}, "
+                    f"job runs with {params}."
+                )
+            self.resumed = True
+            logger.info("Resuming backfill run %s", state["run_id"])
+        self.state = state
+        self.store.save(self.state)
+
+    @property
+    def run_id(self) -> str:
+        return self.state["run_id"]
+
+    def segment(self, segment: int) -> dict:
+        with self.lock:
+            return dict(
+                self.state["segments"].setdefault(
+                    str(segment),
+                    {"start_key": None, "pages": 0, "files": [], "done": False},
+                )
+            )
+
+    def record_page(
+        self, segment: int, start_key: Optional[dict], pages: int, files: list
+    ) -> None:
+        """
+        Records a processed page and its files, the segment is done when there is
+        no next page.
+        """
+        with self.lock:
+            state = self.state["segments"][str(segment)]
+            state["start_key"] = start_key
+            state["pages"] = pages
+            state["files"] = files
+            state["done"] = start_key is None
+            self.store.save(self.state)
+
+    def bulk(self) -> dict:
+        """
+        Bulk mode progress: per scan segment, the LastEvaluatedKey after its last
+        written window, the number of windows written and whether the segment is
+        done, plus the partition dates written to and the schema they were written
+        with.
+        """
+        empty = {"segments": {}, "dates": [], "schema": None}
+        with self.lock:
+            # A copy, the state is updated by record_window
+            return json.loads(json.dumps(self.state.get("bulk", empty)))
+
+    def record_window(
+        self,
+        segment: int,
+        start_key: Optional[dict],
+        windows: int,
+        partition_dates: Iterable[str],
+        schema: dict,
+    ) -> None:
+        """
+        Records a written bulk mode window, the segment is done when there is no
+        next page.
+        """
+        with self.lock:
+            bulk = self.state.setdefault(
+                "bulk", {"segments": {}, "dates": [], "schema": None}
+            )
+            bulk["segments"][str(segment)] = {
+                "start_key": start_key,
+                "windows": windows,
+                "done": start_key is None,
+            }
+            bulk["dates"] = sorted(set(bulk["dates"]) | set(partition_dates))
+            bulk["schema"] = schema
+            self.store.save(self.state)
+
+    def record_bulk_write(self, files: list) -> None:
+        with self.lock:
+            self.state["bulk_files"] = files
+            self.store.save(self.state)
+
+
+class CapacityThrottle:
+    """
+    Token bucket shared by the scan segments, keeps the read capacity consumed by the
+    whole scan under max_rcu_per_second.
+    """
+
+    def __init__(self, max_rcu_per_second: float):
+        self.max_rcu_per_second = max_rcu_per_second
+        self.tokens = max_rcu_per_second
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def consume(self, capacity_units: float) -> None:
+        """
+        Records the capacity consumed by a scan page, sleeps while over the limit.
+        """
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.max_rcu_per_second,
+                self.tokens + (now - self.updated_at) * self.max_rcu_per_second,
+            )
+            self.updated_at = now
+            self.tokens -= capacity_units
+            wait = max(-self.tokens / self.max_rcu_per_second, 0)
+
+        if wait:
+            time.sleep(wait)
+
+
+class StageMetrics:
+    """
+    Time spent by one pipeline stage, summed over the scan segments:
+    busy (doing its work), starved (waiting for input) and blocked (waiting for the
+    next stage, i.e. back-pressure). The bottleneck is the busiest stage.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.pages = 0
+        self.busy_seconds = 0.0
+        self.starved_seconds = 0.0
+        self.blocked_seconds = 0.0
+        self.lock = threading.Lock()
+
+    def add(
+        self,
+        busy: float = 0.0,
+        starved: float = 0.0,
+        blocked: float = 0.0,
+        pages: int = 0,
+    ) -> None:
+        with self.lock:
+            self.pages += pages
+            self.busy_seconds += busy
+            self.starved_seconds += starved
+            self.blocked_seconds += blocked
+
+    def summary(self) -> str:
+        pages_per_second = self.pages / self.busy_seconds if self.busy_seconds else 0
+        return (
+            f"Stage {self.name}: {self.pages} pages, busy {self.busy_seconds:.1f}s "
+            f"({pages_per_second:.2f} pages/s), starved {self.starved_seconds:.1f}s, "
+            f"blocked {self.blocked_seconds:.1f}s"
+        )
+
+
+_END_OF_PIPELINE = object()
+
+
+def run_pipeline(
+    source: Iterable,
+    stages: List[Tuple[str, Callable]],
+    queue_size: int,
+    metrics: Dict[str, StageMetrics],
+    source_name: str = "scan",
+) -> None:
+    """
+    Runs the items of source through stages (name, function), each function
+    receiving the result of the previous one.
+
+    With queue_size > 0 every stage runs in its own thread, connected to the next by
+    a queue of queue_size items: stages overlap, and a slow stage makes the previous
+    ones wait instead of piling up pages in memory. Items keep their order. With
+    queue_size 0 the stages run one after the other in the calling thread.
+    """
+    iterator = iter(source)
+
+    def next_item():
+        start = time.monotonic()
+        item = next(iterator, _END_OF_PIPELINE)
+        if item is not _END_OF_PIPELINE:
+            metrics[source_name].add(busy=time.monotonic() - start, pages=1)
+        return item
+
+    if queue_size <= 0:
+        item = next_item()
+        while item is not _END_OF_PIPELINE:
+            for name, function in stages:
+                start = time.monotonic()
+                item = function(item)
+                metrics[name].add(busy=time.monotonic() - start, pages=1)
+            item = next_item()
+        return
+
+    queues = [queue.Queue(maxsize=queue_size) for _ in stages]
+    failed = threading.Event()
+    errors = []
+
+    def put(stage_queue, item, stage_metrics):
+        start = time.monotonic()
+        while not failed.is_set():
+            try:
+                stage_queue.put(item, timeout=1)
+                break
+            except queue.Full:
+                continue
+        stage_metrics.add(blocked=time.monotonic() - start)
+
+    def get(stage_queue, stage_metrics):
+        start = time.monotonic()
+        while not failed.is_set():
+            try:
+                item = stage_queue.get(timeout=1)
+                stage_metrics.add(starved=time.monotonic() - start)
+                return item
+            except queue.Empty:
+                continue
+        return _END_OF_PIPELINE
+
+    def work(index, name, function):
+        try:
+            while True:
+                item = get(queues[index], metrics[name])
+                if item is _END_OF_PIPELINE:
+                    if index + 1 < len(stages):
+                        put(queues[index + 1], item, metrics[name])
+                    return
+                start = time.monotonic()
+                result = function(item)
+                metrics[name].add(busy=time.monotonic() - start, pages=1)
+                if index + 1 < len(stages):
+                    put(queues[index + 1], result, metrics[name])
+        except Exception as e:
+            errors.append(e)
+            failed.set()
+
+    threads = [
+        threading.Thread(target=work, args=(index, name, function), daemon=True)
+        for index, (name, function) in enumerate(stages)
+    ]
+    for thread in threads:
+        thread.start()
+
+    try:
+        while not failed.is_set():
+            item = next_item()
+            put(queues[0], item, metrics[source_name])
+            if item is _END_OF_PIPELINE:
+                break
+    except Exception:
+        failed.set()
+        raise
+    finally:
+        for thread in threads:
+            thread.join()
+
+    if errors:
+        raise errors[0]
+
+
+class PageSpill:
+    """
+    Flattened scan windows spilled to local disk, one file per window of pages, so
+    bulk mode only holds one window per scan segment in memory.
+
+    Windows are identified by (segment, index in the segment) and keep the
+    LastEvaluatedKey after their last page, the key a resumed run scans the segment
+    from once the window is written.
+    """
+
+    def __init__(self, window_pages: int):
+        self.window_pages = window_pages
+        self.directory = tempfile.mkdtemp(prefix="backfill_spill_")
+        self.paths = {}
+        self.lock = threading.Lock()
+
+    def spill(
+        self, window_id: Tuple[int, int], df: pd.DataFrame, next_key: Optional[dict]
+    ) -> None:
+        path = os.path.join(self.directory, "window_{}_{}.pkl".format(*window_id))
+        with open(path, "wb") as spill_file:
+            pickle.dump(df, spill_file, protocol=pickle.HIGHEST_PROTOCOL)
+        with self.lock:
+            self.paths[window_id] = (path, next_key)
+
+    def windows(self) -> Iterator[Tuple[int, int, Optional[dict], pd.DataFrame]]:
+        """
+        Yields the spilled windows one at a time in segment order, as (segment,
+        index, next_key, df), deleting each once read.
+        """
+        for segment, index in sorted(self.paths):
+            path, next_key = self.paths[(segment, index)]
+            with open(path, "rb") as spill_file:
+                df = pickle.load(spill_file)
+            os.remove(path)
+            yield segment, index, next_key, df
+
+    def close(self) -> None:
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+
+class Backfill:
+    """
+    Scans a DynamoDB table, sequentially or as TotalSegments parallel segments (or
+    queries a GSI, one segment per partition key value), and loads it to its
+    datalake_raw Athena table.
+    """
+
+    def __init__(
+        self,
+        client,
+        scan_kwargs: dict,
+        dyanmo_partition_column: str,
+        target_athena_table: str,
+        s3_bucket_name: str,
+        auto_schema: bool,
+        throttle: Optional[CapacityThrottle] = None,
+        checkpoint: Optional[Checkpoint] = None,
+        bulk_window_pages: int = 50,
+        pipeline_queue_size: int = 0,
+        query_partition_values: Optional[List[str]] = None,
+        inference_sample_size: int = 1000,
+    ):
+        self.client = client
+        self.scan_kwargs = scan_kwargs
+        self.dyanmo_partition_column = dyanmo_partition_column
+        self.target_athena_table = target_athena_table
+        self.s3_bucket_name = s3_bucket_name
+        self.auto_schema = auto_schema
+        self.throttle = throttle
+        self.checkpoint = checkpoint
+        self.bulk_window_pages = bulk_window_pages
+        self.pipeline_queue_size = pipeline_queue_size
+        # Query mode: one "segment" per GSI partition key value
+        self.query_partition_values = query_partition_values
+        self.metrics = {
+            name: StageMetrics(name) for name in ("scan", "transform", "write")
+        }
+        self.inference_sample_size = inference_sample_size
+        # AUTO_SCHEMA: catalog types are kept, only the other columns are inferred
+        self.known_dtypes = (
+            schemas[target_athena_table]
+            if auto_schema and target_athena_table in schemas
+            else None
+        )
+        self.inferred_schema = {}
+
+        self.total_items = 0
+        self.total_rows = 0
+        self.consumed_rcu = 0.0
+        self.stats_lock = threading.Lock()
+        # Glue catalog updates (table creation, schema evolution) are not safe to run
+        # concurrently, segments only overlap their scans and transformations.
+        self.write_lock = threading.Lock()
+
+    def scan_pages(
+        self,
+        segment: Optional[int] = None,
+        total_segments: int = 1,
+        start_key: Optional[dict] = None,
+    ):
+        """
+        Yields the items of each scan (or query) page of one segment (or of the whole
+        table), with the LastEvaluatedKey to continue from (None after the last page).
+        """
+        scan_kwargs = dict(self.scan_kwargs, ReturnConsumedCapacity="TOTAL")
+        read_page = self.client.scan
+        if self.query_partition_values is not None:
+            read_page = self.client.query
+            scan_kwargs["ExpressionAttributeValues"] = dict(
+                scan_kwargs["ExpressionAttributeValues"],
+                **{":qpk": {"S": self.query_partition_values[segment or 0]}},
+            )
+        elif total_segments > 1:
+            scan_kwargs.update(Segment=segment, TotalSegments=total_segments)
+
+        while True:
+            if start_key:
+                scan_kwargs["ExclusiveStartKey"] = start_key
+            logger.info(
+                "Reading DynamoDB (%s) segment %s/%s...",
+                read_page.__name__,
+                segment,
+                total_segments,
+            )
+            page = read_page(**scan_kwargs)
+            capacity_units = page.get("ConsumedCapacity", {}).get("CapacityUnits", 0)
+            with self.stats_lock:
+                self.total_items += len(page["Items"])
+                self.consumed_rcu += capacity_units
+            if self.throttle:
+                self.throttle.consume(capacity_units)
+
+            start_key = page.get("LastEvaluatedKey", None)
+            yield page["Items"], start_key
+
+            if start_key is None:
+                return
+
+    def spill_segment(
+        self,
+        spill: PageSpill,
+        segment: Optional[int] = None,
+        total_segments: int = 1,
+        start_key: Optional[dict] = None,
+        first_window: int = 0,
+    ) -> None:
+        """
+        Scans one segment from start_key, flattens it and spills it window by
+        window, numbered from first_window. With AUTO_SCHEMA the types of each
+        window are inferred and merged into inferred_schema.
+        """
+        segment_id = segment or 0
+        window, window_pages, index = [], 0, first_window
+        pages = self.scan_pages(segment, total_segments, start_key)
+        for items, next_key in pages:
+            window.extend(items)
+            window_pages += 1
+            if window and (window_pages >= spill.window_pages or next_key is None):
+                df = process_json(window, self.dyanmo_partition_column)
+                if self.auto_schema:
+                    window_schema = get_actual_dtypes(
+                        df, self.inference_sample_size, self.known_dtypes
+                    )
+                    with self.stats_lock:
+                        self.inferred_schema = merge_athena_dtypes(
+                            self.inferred_schema, window_schema
+                        )
+                spill.spill((segment_id, index), df, next_key)
+                window, window_pages, index = [], 0, index + 1
+                del df
+
+    def scan_to_spill(
+        self, spill: PageSpill, total_segments: int = 1, progress: Optional[dict] = None
+    ) -> None:
+        """
+        Scans the whole table, segments in parallel, into the spill. progress (the
+        "segments" of Checkpoint.bulk) resumes each segment after its last written
+        window and skips the done ones.
+        """
+        progress = progress or {}
+        arguments = []
+        for segment in range(total_segments):
+            state = progress.get(str(segment), {})
+            if state.get("done"):
+                logger.info("Segment %s already backfilled, skipping.", segment)
+                continue
+            arguments.append(
+                (
+                    segment if total_segments > 1 else None,
+                    state.get("start_key"),
+                    state.get("windows", 0),
+                )
+            )
+        if len(arguments) == 1:
+            segment, start_key, first_window = arguments[0]
+            self.spill_segment(spill, segment, total_segments, start_key, first_window)
+            return
+
+        with ThreadPoolExecutor(max_workers=max(len(arguments), 1)) as executor:
+            futures = [
+                executor.submit(
+                    self.spill_segment,
+                    spill,
+                    segment,
+                    total_segments,
+                    start_key,
+                    first_window,
+                )
+                for segment, start_key, first_window in arguments
+            ]
+            for future in futures:
+                future.result()
+
+    def transform(self, items: list, athena_schema: Optional[dict] = None):
+        """
+        Flattens scanned items and applies the Athena schema (STEP_5), inferred from
+        the items with AUTO_SCHEMA unless given.
+        """
+        return self.transform_frame(
+            process_json(items, self.dyanmo_partition_column), athena_schema
+        )
+
+    def transform_frame(self, df: pd.DataFrame, athena_schema: Optional[dict] = None):
+        """
+        Applies the Athena schema to flattened items, see transform.
+        """
+        if athena_schema is not None:
+            athena_schema = dict(athena_schema)
+        elif self.auto_schema:
+            athena_schema = get_table_dtypes(
+                self.target_athena_table,
+                df,
+                self.known_dtypes,
+                self.inference_sample_size,
+            )
+        else:
+            athena_schema = dict(schemas[self.target_athena_table])
+        df, schema = apply_schema(df, athena_schema)
+
+        with self.stats_lock:
+            self.total_rows += df.shape[0]
+
+        return df, schema
+
+    def write(
+        self,
+        df: pd.DataFrame,
+        schema: dict,
+        wrangler_write_mode: str,
+        filename_prefix: Optional[str] = None,
+    ) -> list:
+        """
+        Loads a DataFrame to S3 (STEP_6), returns the written S3 paths.
+        """
+        with self.write_lock:
+            return write_to_s3(
+                df,
+                self.target_athena_table,
+                self.s3_bucket_name,
+                wrangler_write_mode,
+                schema,
+                filename_prefix,
+            )
+
+    def delete_unrecorded_outputs(
+        self, filename_prefix: str, recorded_prefixes: Iterable[str] = ()
+    ) -> None:
+        """
+        Deletes the files of pages (or windows) written by a run that died before
+        recording them: files named filename_prefix*, except recorded_prefixes*, in
+        any partition, as the rescanned page may not span the same dates.
+        """
+        recorded_prefixes = tuple(recorded_prefixes)
+        paths = [
+            path
+            for path in wr.s3.list_objects(
+                f"s3://{self.s3_bucket_name}/{self.target_athena_table}/"
+            )
+            if path.rsplit("/", 1)[-1].startswith(filename_prefix)
+            and not path.rsplit("/", 1)[-1].startswith(recorded_prefixes)
+        ]
+        if paths:
+            logger.warning("Deleting %d unrecorded files: %s", len(paths), paths)
+            wr.s3.delete_objects(paths)
+
+    def delete_partitions(self, partition_dates) -> None:
+        """
+        Deletes the files of target partitions, as overwrite_partitions does.
+        """
+        for partition_date in partition_dates:
+            paths = wr.s3.list_objects(
+                f"s3://{self.s3_bucket_name}/{self.target_athena_table}/"
+                f"date={partition_date}/"
+            )
+            if paths:
+                logger.info("Overwriting partition date=%s", partition_date)
+                wr.s3.delete_objects(paths)
+
+    def run_segment(
+        self,
+        wrangler_write_mode: str,
+        segment: Optional[int] = None,
+        total_segments: int = 1,
+    ) -> None:
+        """
+        Scans, transforms and writes the pages of one segment from its checkpoint if
+        any, as a pipeline when pipeline_queue_size > 0.
+        """
+        segment_id = segment or 0
+        start_key, page = None, 0
+        if self.checkpoint:
+            state = self.checkpoint.segment(segment_id)
+            if state["done"]:
+                logger.info("Segment %s already backfilled, skipping.", segment_id)
+                return
+            start_key, page = state["start_key"], state["pages"]
+        first_page = page
+        if page:
+            wrangler_write_mode = "append"
+
+        def scan():
+            pages = self.scan_pages(segment, total_segments, start_key)
+            for page_number, (items, next_key) in enumerate(pages, start=first_page):
+                yield page_number, items, next_key
+
+        def transform(scanned):
+            page_number, items, next_key = scanned
+            df, schema = self.transform(items) if items else (None, None)
+            return page_number, df, schema, next_key
+
+        def write(transformed):
+            nonlocal wrangler_write_mode
+            page_number, df, schema, next_key = transformed
+            files = []
+            if df is not None:
+                filename_prefix = None
+                if self.checkpoint:
+                    filename_prefix = (
+                        f"{self.checkpoint.run_id}_{segment_id}_{page_number}_"
+                    )
+                    if self.checkpoint.resumed and page_number == first_page:
+                        self.delete_unrecorded_outputs(filename_prefix)
+                files = self.write(df, schema, wrangler_write_mode, filename_prefix)
+                # If table data is bigger than 1 iteration, write mode shifted to append.
+                wrangler_write_mode = "append"
+                logger.info("Writing to S3 succeeded, proceeding to next iteration...")
+
+            if self.checkpoint:
+                self.checkpoint.record_page(segment_id, next_key, page_number + 1, files)
+
+        run_pipeline(
+            scan(),
+            [("transform", transform), ("write", write)],
+            self.pipeline_queue_size,
+            self.metrics,
+        )
+
+    def run_incremental(self, wrangler_write_mode: str, total_segments: int = 1) -> None:
+        """
+        Saves each scan page separately, segments in parallel.
+        """
+        if total_segments == 1:
+            self.run_segment(wrangler_write_mode)
+            return
+
+        with ThreadPoolExecutor(max_workers=total_segments) as executor:
+            futures = [
+                executor.submit(self.run_segment, "append", segment, total_segments)
+                for segment in range(total_segments)
+            ]
+            for future in futures:
+                future.result()
+
+    def run_bulk(self, wrangler_write_mode: str, total_segments: int = 1) -> None:
+        """
+        Saves all the scan pages in bulk with bounded memory: the pages are spilled to
+        local disk in windows, the schema is settled over all the windows, then the
+        windows are written one by one with that schema. With overwrite_partitions,
+        each target partition is emptied before the first window writing to it.
+
+        Each window is written with the filename prefix <run_id>_w<segment>_<index>_
+        and recorded right after with the LastEvaluatedKey after its last page. A
+        resumed run deletes the files of the unrecorded windows and scans each
+        segment from its last recorded key, so the rows of the written windows are
+        neither scanned again nor duplicated, even if the table changed since.
+        """
+        if self.checkpoint and "bulk_files" in self.checkpoint.state:
+            logger.info("Table already backfilled by run %s.", self.checkpoint.run_id)
+            return
+
+        progress, written_dates = {}, set()
+        if self.checkpoint:
+            bulk = self.checkpoint.bulk()
+            progress, written_dates = bulk["segments"], set(bulk["dates"])
+            if self.auto_schema and bulk["schema"]:
+                # The next windows are written with the types of the written ones
+                self.inferred_schema = bulk["schema"]
+            if self.checkpoint.resumed:
+                window_prefix = f"{self.checkpoint.run_id}_w"
+                self.delete_unrecorded_outputs(
+                    window_prefix,
+                    [
+                        f"{window_prefix}{segment}_{index}_"
+                        for segment, state in progress.items()
+                        for index in range(state["windows"])
+                    ],
+                )
+
+        spill = PageSpill(self.bulk_window_pages)
+        try:
+            self.scan_to_spill(spill, total_segments, progress)
+            logger.info(
+                "Scanned %d items, %d windows to write (%d already written).",
+                self.total_items,
+                len(spill.paths),
+                sum(state["windows"] for state in progress.values()),
+            )
+
+            if self.auto_schema:
+                athena_schema = self.inferred_schema
+            else:
+                athena_schema = schemas[self.target_athena_table]
+
+            files = []
+            for segment, index, next_key, df in spill.windows():
+                df, schema = self.transform_frame(df, athena_schema)
+                window_dates = set(df["date"].unique())
+                if wrangler_write_mode == "overwrite_partitions":
+                    self.delete_partitions(sorted(window_dates - written_dates))
+                written_dates |= window_dates
+                filename_prefix = None
+                if self.checkpoint:
+                    filename_prefix = f"{self.checkpoint.run_id}_w{segment}_{index}_"
+                files.extend(self.write(df, schema, "append", filename_prefix))
+                if self.checkpoint:
+                    self.checkpoint.record_window(
+                        segment,
+                        next_key,
+                        index + 1,
+                        window_dates,
+                        athena_schema if self.auto_schema else None,
+                    )
+                del df
+        finally:
+            spill.close()
+
+        if self.checkpoint:
+            self.checkpoint.record_bulk_write(files)
+        logger.info("Writing to S3 succeeded.")
+
+
 def main():
     try:
         # STEP_1: Initialize global variables
@@ -339,6 +1193,20 @@ def main():
                 "WRANGLER_WRITE_MODE",
                 "START_DATE",
                 "AUTO_SCHEMA",
+                "DATA_CATALOG_DIR",
+                "TOTAL_SEGMENTS",
+                "MAX_CONSUMED_RCU",
+                "RESUME",
+                "CHECKPOINT_LOCATION",
+                "BULK_WINDOW_PAGES",
+                "PIPELINE_QUEUE_SIZE",
+                "PROJECTION",
+                "PROJECTION_ATTRIBUTES",
+                "QUERY_INDEX_NAME",
+                "QUERY_PARTITION_KEY",
+                "QUERY_PARTITION_VALUES",
+                "QUERY_SORT_KEY",
+                "INFERENCE_SAMPLE_SIZE",
             ],
         )
         dynamo_table_name = args["TARGET_DYNAMO_TABLE"]
@@ -349,6 +1217,22 @@ def main():
         start_date = args.get("START_DATE")
         incremental_mode = ast.literal_eval(args["INCREMENTAL_MODE"])
         auto_schema = ast.literal_eval(args["AUTO_SCHEMA"])
+        data_catalog.CATALOG_DIR = args["DATA_CATALOG_DIR"]
+        total_segments = int(args["TOTAL_SEGMENTS"])
+        max_consumed_rcu = float(args["MAX_CONSUMED_RCU"])
+        resume = ast.literal_eval(args["RESUME"])
+        checkpoint_location = args["CHECKPOINT_LOCATION"]
+        bulk_window_pages = int(args["BULK_WINDOW_PAGES"])
+        pipeline_queue_size = int(args["PIPELINE_QUEUE_SIZE"])
+        projection = ast.literal_eval(args["PROJECTION"])
+        projection_attributes = [
+            value.strip()
+            for value in args["PROJECTION_ATTRIBUTES"].split(",")
+            if value.strip() not in ("", "None")
+        ]
+        query_index_name = args["QUERY_INDEX_NAME"]
+        query_mode = query_index_name not in ("", "None")
+        inference_sample_size = int(args["INFERENCE_SAMPLE_SIZE"])
 
         if wrangler_write_mode not in {
             "append",
@@ -357,6 +1241,8 @@ def main():
             raise ValueError(
                 "Invalid write mode. Please use 'append' or 'overwrite_partitions'."
             )
+        if total_segments < 1:
+            raise ValueError("TOTAL_SEGMENTS must be at least 1.")
 
         logger.info(
             "Starting migration from DynamoDB table: %s to Athena table: %s stored in s3://%s",
@@ -382,90 +1268,116 @@ def main():
                 f"Start date ({start_date}) is not formatted in %d-%m-%Y, backfilling without filters."
             )
 
-        done = False
-        start_key = None
-        total_items = 0
-        total_rows = 0
-
-        if incremental_mode:
+        # STEP_3.1: Query a GSI instead of scanning, time filter as sort key condition
+        query_partition_values = None
+        if query_mode:
+            query_partition_values = [
+                value.strip() for value in args["QUERY_PARTITION_VALUES"].split(",")
+            ]
+            query_sort_key = args["QUERY_SORT_KEY"]
+            key_condition = "#qpk = :qpk"
+            attribute_names = {"#qpk": args["QUERY_PARTITION_KEY"]}
+            if "FilterExpression" in scan_kwargs and query_sort_key not in ("", "None"):
+                del scan_kwargs["FilterExpression"]
+                key_condition += " AND #qsk > :ts"
+                attribute_names["#qsk"] = query_sort_key
+            scan_kwargs.update(
+                IndexName=query_index_name,
+                KeyConditionExpression=key_condition,
+                ExpressionAttributeNames=attribute_names,
+            )
+            scan_kwargs.setdefault("ExpressionAttributeValues", {})
+            # One segment per partition key value, queried in parallel
+            total_segments = len(query_partition_values)
             logger.info(
-                "\nIncremental mode ON, each scan page will be saved separately."
+                "Query mode ON: index %s, %d partition values.",
+                query_index_name,
+                total_segments,
             )
-            # STEP_4: Pagination loop for scanning DynamoDB
-            while not done:
-                # If table data is bigger than 1 iteration, write mode shifted to append.
-                if start_key:
-                    scan_kwargs["ExclusiveStartKey"] = start_key
-                    wrangler_write_mode = "append"
 
-                logger.info("Scanning DynamoDB...")
-                json_string = client.scan(**scan_kwargs)
-                total_items += len(json_string["Items"])
-
-                df = process_json(json_string["Items"], dyanmo_partition_column)
-
-                # STEP_5: Generate Athena schema and apply it to the DataFrame
-                if auto_schema:
-                    athena_schema = get_actual_dtypes(df)
-                else:
-                    athena_schema = schemas[target_athena_table]
-                df, schema = apply_schema(df, athena_schema)
-
-                total_rows += df.shape[0]
-
-                # STEP_6: Load DataFrame to S3
-                write_to_s3(
-                    df,
-                    target_athena_table,
-                    s3_bucket_name,
-                    wrangler_write_mode,
-                    schema,
-                )
+        if incremental_mode and total_segments > 1 and wrangler_write_mode != "append":
+            # Parallel segments write pages of the same partitions concurrently
+            raise ValueError(
+                "Parallel incremental backfill (TOTAL_SEGMENTS > 1 or several "
+                "QUERY_PARTITION_VALUES) only supports 'append'."
+            )
 
-                logger.info("Writing to S3 succeeded, proceeding to next iteration...")
-                start_key = json_string.get("LastEvaluatedKey", None)
-                done = start_key is None
+        # STEP_3.2: Only fetch the attributes of the catalog schema
+        if projection and auto_schema:
+            logger.warning("PROJECTION needs the catalog schema, ignored with AUTO_SCHEMA.")
+        elif projection:
+            sample = client.scan(TableName=dynamo_table_name, Limit=100)
+            projection_expression, projection_names = build_projection(
+                schemas[target_athena_table],
+                sample["Items"],
+                [dyanmo_partition_column, "updatedAt"],
+                projection_attributes,
+            )
+            scan_kwargs["ProjectionExpression"] = projection_expression
+            scan_kwargs["ExpressionAttributeNames"] = dict(
+                scan_kwargs.get("ExpressionAttributeNames", {}), **projection_names
+            )
+            logger.info(
+                "Projecting %d attributes: %s",
+                len(projection_names),
+                sorted(projection_names.values()),
+            )
         else:
-            logger.info("\nIncremental mode OFF, all scan pages will be saved in bulk.")
-            all_pages = []
-            # STEP_4: Pagination loop for scanning DynamoDB
-            while not done:
-                # If table data is bigger than 1 iteration.
-                if start_key:
-                    scan_kwargs["ExclusiveStartKey"] = start_key
-
-                logger.info("Scanning DynamoDB...")
-                json_string = client.scan(**scan_kwargs)
-                all_pages.extend(json_string["Items"])
-                total_items += len(json_string["Items"])
-
-                start_key = json_string.get("LastEvaluatedKey", None)
-                done = start_key is None
-
-            df = process_json(all_pages, dyanmo_partition_column)
-
-            # STEP_5: Generate Athena schema and apply it to the DataFrame
-            if auto_schema:
-                athena_schema = get_actual_dtypes(df)
-            else:
-                athena_schema = schemas[target_athena_table]
-            df, schema = apply_schema(df, athena_schema)
+            logger.info("PROJECTION off, scanning all the attributes.")
+
+        # A checkpoint can only be resumed by a job scanning the same way
+        checkpoint = Checkpoint(
+            get_checkpoint_store(checkpoint_location, target_athena_table),
+            {
+                "dynamo_table": dynamo_table_name,
+                "incremental_mode": incremental_mode,
+                "total_segments": total_segments,
+                "filter": scan_kwargs.get("ExpressionAttributeValues"),
+                **(
+                    {"query": [query_index_name, query_partition_values]}
+                    if query_mode
+                    else {}
+                ),
+            },
+            resume,
+        )
 
-            total_rows += df.shape[0]
+        backfill = Backfill(
+            client,
+            scan_kwargs,
+            dyanmo_partition_column,
+            target_athena_table,
+            s3_bucket_name,
+            auto_schema,
+            CapacityThrottle(max_consumed_rcu) if max_consumed_rcu > 0 else None,
+            checkpoint,
+            bulk_window_pages,
+            pipeline_queue_size,
+            query_partition_values,
+            inference_sample_size,
+        )
 
-            # STEP_6: Load DataFrame to S3
-            write_to_s3(
-                df,
-                target_athena_table,
-                s3_bucket_name,
-                wrangler_write_mode,
-                schema,
+        if incremental_mode:
+            logger.info(
+                "\nIncremental mode ON, each scan page will be saved separately."
             )
+            # STEP_4: Pagination loop for scanning DynamoDB, one loop per segment
+            backfill.run_incremental(wrangler_write_mode, total_segments)
+        else:
+            logger.info("\nIncremental mode OFF, all scan pages will be saved in bulk.")
+            # STEP_4: Pagination loop for scanning DynamoDB, one loop per segment
+            backfill.run_bulk(wrangler_write_mode, total_segments)
 
-            logger.info("Writing to S3 succeeded, proceeding to next iteration...")
-
-        logger.info("Total items read from DynamoDB: %d", total_items)
-        logger.info("Total rows written to S3/Athena: %d", total_rows)
+        logger.info("Total items read from DynamoDB: %d", backfill.total_items)
+        logger.info("Total rows written to S3/Athena: %d", backfill.total_rows)
+        logger.info(
+            "Total read capacity consumed: %.1f RCU (%.3f RCU per item)",
+            backfill.consumed_rcu,
+            backfill.consumed_rcu / max(backfill.total_items, 1),
+        )
+        if incremental_mode:
+            for stage_metrics in backfill.metrics.values():
+                logger.info(stage_metrics.summary())
 
         res = (
             f"[Success] Finished processing migration from DynamoDB table: {dynamo_table_name} "
@@ -0,0 +1,388 @@
+import itertools
+import os
+import threading
+from unittest.mock import patch
+
+import awswrangler as wr
+import boto3
+import pytest
+from moto import mock_aws
+
+import ddb_generic_backfill_to_s3_raw as backfill_job
+from ddb_generic_backfill_to_s3_raw import (
+    Backfill,
+    CapacityThrottle,
+    Checkpoint,
+    CheckpointStore,
+    LocalCheckpointStore,
+    S3CheckpointStore,
+    StageMetrics,
+    build_projection,
+    get_checkpoint_store,
+    merge_athena_dtypes,
+    run_pipeline,
+)
+
+BUCKET = "test-raw-bucket"
+DYNAMO_TABLE = "test-dynamo-table"
+ITEMS = 40
+
+
+@pytest.fixture
+def aws():
+    with patch.dict(
+        os.environ,
+        {
+            "AWS_DEFAULT_REGION": "eu-west-2",
+            "AWS_ACCESS_KEY_ID": "testing",
+            "AWS_SECRET_ACCESS_KEY": "testing",
+        },
+    ), mock_aws():
+        boto3.client("s3").create_bucket(
+            Bucket=BUCKET,
+            CreateBucketConfiguration={"LocationConstraint": "eu-west-2"},
+        )
+        boto3.client("glue").create_database(DatabaseInput={"Name": "datalake_raw"})
+        client = boto3.client("dynamodb")
+        client.create_table(
+            TableName=DYNAMO_TABLE,
+            KeySchema=[{"AttributeName": "id", "KeyType": "HASH"}],
+            AttributeDefinitions=[{"AttributeName": "id", "AttributeType": "S"}],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        for index in range(ITEMS):
+            client.put_item(
+                TableName=DYNAMO_TABLE,
+                Item={
+                    "id": {"S": f"id-{index:03d}"},
+                    "amount": {"N": str(index)},
+                    # Two days, i.e. two target partitions
+                    "updatedAt": {"N": str(1735603200000 + index % 2 * 86400000)},
+                },
+            )
+        yield client
+
+
+def make_backfill(client, target_athena_table: str, **kwargs) -> Backfill:
+    return Backfill(
+        client,
+        {"TableName": DYNAMO_TABLE, "Limit": 5},
+        "id",
+        target_athena_table,
+        BUCKET,
+        auto_schema=True,
+        **kwargs,
+    )
+
+
+def read_ids(target_athena_table: str) -> list:
+    df = wr.s3.read_parquet(f"s3://{BUCKET}/{target_athena_table}/", dataset=True)
+    return sorted(df["dynamodb_new_image_id_s"])
+
+
+def test_merge_athena_dtypes_widens_conflicting_types():
+    merged = merge_athena_dtypes(
+        {"a": "int", "b": "double", "c": "string", "d": "boolean"},
+        {"a": "bigint", "b": "int", "c": "int", "d": "string", "e": "int"},
+    )
+
+    assert merged == {
+        "a": "bigint",
+        "b": "double",
+        "c": "string",
+        "d": "string",
+        "e": "int",
+    }
+
+
+PROJECTION_SCHEMA = {
+    "dynamodb_new_image_id_s": "string",
+    "dynamodb_new_image_updated_at_n": "bigint",
+    "dynamodb_new_image_order_id_s": "string",
+    "dynamodb_new_image_address_m_city_s": "string",
+}
+
+
+def test_build_projection_uses_the_sampled_names():
+    sample_items = [
+        {
+            "id": {"S": "1"},
+            "updatedAt": {"N": "1"},
+            "orderID": {"S": "o"},
+            "address": {"M": {"city": {"S": "Paris"}}},
+            "notInCatalog": {"S": "x"},
+        }
+    ]
+
+    expression, names = build_projection(
+        PROJECTION_SCHEMA, sample_items, ["id", "updatedAt"]
+    )
+
+    assert sorted(names.values()) == ["address", "id", "orderID", "updatedAt"]
+    assert expression == ", ".join(names)
+
+
+def test_build_projection_projects_unsampled_attributes_by_catalog_name():
+    sample_items = [{"id": {"S": "1"}, "updatedAt": {"N": "1"}}]
+
+    _, names = build_projection(PROJECTION_SCHEMA, sample_items, ["id"])
+
+    assert sorted(names.values()) == ["address", "id", "order_id", "updatedAt"]
+
+
+def test_build_projection_uses_the_given_attribute_names():
+    _, names = build_projection(PROJECTION_SCHEMA, [], ["id"], ["orderID", "updatedAt"])
+
+    assert sorted(names.values()) == ["address", "id", "orderID", "updatedAt"]
+
+
+def test_capacity_throttle_sleeps_over_the_limit():
+    with patch.object(backfill_job.time, "monotonic", return_value=100.0), patch.object(
+        backfill_job.time, "sleep"
+    ) as sleep:
+        throttle = CapacityThrottle(10)
+        throttle.consume(5)
+        sleep.assert_not_called()
+
+        throttle.consume(25)
+        sleep.assert_called_once_with(2.0)
+
+
+def test_capacity_throttle_refills_over_time():
+    now = [100.0]
+    with patch.object(
+        backfill_job.time, "monotonic", side_effect=lambda: now[0]
+    ), patch.object(backfill_job.time, "sleep") as sleep:
+        throttle = CapacityThrottle(10)
+        throttle.consume(10)
+        now[0] += 1
+        throttle.consume(10)
+
+        sleep.assert_not_called()
+
+
+def pipeline_metrics() -> dict:
+    return {name: StageMetrics(name) for name in ("scan", "transform", "write")}
+
+
+@pytest.mark.parametrize("queue_size", [0, 2])
+def test_run_pipeline_keeps_order(queue_size):
+    written = []
+    metrics = pipeline_metrics()
+
+    run_pipeline(
+        range(10),
+        [("transform", lambda item: item * 2), ("write", written.append)],
+        queue_size,
+        metrics,
+    )
+
+    assert written == [item * 2 for item in range(10)]
+    assert metrics["scan"].pages == metrics["write"].pages == 10
+
+
+def test_run_pipeline_stops_when_a_stage_raises():
+    def transform(item):
+        if item == 3:
+            raise ValueError("bad page")
+        return item
+
+    threads = threading.active_count()
+    # An endless scan only stops if the failure shuts the pipeline down
+    with pytest.raises(ValueError, match="bad page"):
+        run_pipeline(
+            itertools.count(),
+            [("transform", transform), ("write", lambda item: None)],
+            1,
+            pipeline_metrics(),
+        )
+
+    assert threading.active_count() == threads
+
+
+def test_run_pipeline_stops_when_the_scan_raises():
+    def scan():
+        yield 1
+        raise ConnectionError("scan failed")
+
+    written = []
+    threads = threading.active_count()
+    with pytest.raises(ConnectionError):
+        run_pipeline(
+            scan(),
+            [("transform", lambda item: item), ("write", written.append)],
+            1,
+            pipeline_metrics(),
+        )
+
+    assert threading.active_count() == threads
+    assert written in ([], [1])
+
+
+def test_parallel_segments_write_under_the_write_lock(aws):
+    backfill = make_backfill(aws, "parallel_table", pipeline_queue_size=2)
+    writing, max_writing = [0], [0]
+    counter_lock = threading.Lock()
+    write_to_s3 = backfill_job.write_to_s3
+
+    def tracked_write_to_s3(*args, **kwargs):
+        assert backfill.write_lock.locked()
+        with counter_lock:
+            writing[0] += 1
+            max_writing[0] = max(max_writing[0], writing[0])
+        try:
+            return write_to_s3(*args, **kwargs)
+        finally:
+            with counter_lock:
+                writing[0] -= 1
+
+    with patch.object(backfill_job, "write_to_s3", side_effect=tracked_write_to_s3):
+        backfill.run_incremental("append", total_segments=4)
+
+    assert max_writing[0] == 1
+    assert backfill.total_items == ITEMS
+    assert backfill.total_rows == ITEMS
+    assert read_ids("parallel_table") == [f"id-{index:03d}" for index in range(ITEMS)]
+
+
+def test_checkpoint_store_is_abstract():
+    with pytest.raises(TypeError):
+        CheckpointStore()
+
+
+def test_s3_checkpoint_store_round_trip(aws):
+    store = get_checkpoint_store(f"s3://{BUCKET}/checkpoints/", "store_table")
+
+    assert isinstance(store, S3CheckpointStore)
+    assert store.load() is None
+    store.save({"run_id": "run"})
+    assert store.load() == {"run_id": "run"}
+
+
+def test_checkpoint_keeps_last_page_files(tmp_path):
+    store = LocalCheckpointStore(str(tmp_path / "table.json"))
+    checkpoint = Checkpoint(store, {"total_segments": 1}, resume=False)
+    checkpoint.segment(0)
+
+    checkpoint.record_page(0, {"id": {"S": "a"}}, 1, ["s3://bucket/a.parquet"])
+    checkpoint.record_page(0, None, 2, ["s3://bucket/b.parquet"])
+
+    assert store.load()["segments"]["0"] == {
+        "start_key": None,
+        "pages": 2,
+        "files": ["s3://bucket/b.parquet"],
+        "done": True,
+    }
+
+
+def test_checkpoint_refuses_other_params(tmp_path):
+    store = LocalCheckpointStore(str(tmp_path / "table.json"))
+    Checkpoint(store, {"total_segments": 1}, resume=False)
+
+    with pytest.raises(ValueError):
+        Checkpoint(store, {"total_segments": 2}, resume=True)
+
+
+def test_resume_rewrites_the_unrecorded_page(aws, tmp_path):
+    store = LocalCheckpointStore(str(tmp_path / "resume_table.json"))
+    params = {"dynamo_table": DYNAMO_TABLE}
+    write_to_s3 = backfill_job.write_to_s3
+    writes = [0]
+
+    def crashing_write_to_s3(*args, **kwargs):
+        # The third page is written, but the job dies before recording it
+        paths = write_to_s3(*args, **kwargs)
+        writes[0] += 1
+        if writes[0] == 3:
+            raise RuntimeError("Glue job lost")
+        return paths
+
+    checkpoint = Checkpoint(store, params, resume=False)
+    with patch.object(backfill_job, "write_to_s3", side_effect=crashing_write_to_s3):
+        with pytest.raises(RuntimeError):
+            make_backfill(aws, "resume_table", checkpoint=checkpoint).run_incremental(
+                "append"
+            )
+    assert store.load()["segments"]["0"]["pages"] == 2
+
+    checkpoint = Checkpoint(store, params, resume=True)
+    backfill = make_backfill(aws, "resume_table", checkpoint=checkpoint)
+    backfill.run_incremental("append")
+
+    assert checkpoint.resumed
+    assert store.load()["segments"]["0"]["done"]
+    # Only the pages after the last recorded one are scanned again
+    assert backfill.total_items == ITEMS - 10
+    assert read_ids("resume_table") == [f"id-{index:03d}" for index in range(ITEMS)]
+
+
+def test_bulk_flattens_each_window_once(aws):
+    backfill = make_backfill(aws, "bulk_table", bulk_window_pages=2)
+
+    with patch.object(
+        backfill_job, "process_json", wraps=backfill_job.process_json
+    ) as process_json:
+        backfill.run_bulk("overwrite_partitions")
+
+    # 40 items, 5 per page, 2 pages per window
+    assert process_json.call_count == 4
+    assert read_ids("bulk_table") == [f"id-{index:03d}" for index in range(ITEMS)]
+
+
+def put_item(client, item_id: str, amount: int) -> None:
+    client.put_item(
+        TableName=DYNAMO_TABLE,
+        Item={
+            "id": {"S": item_id},
+            "amount": {"N": str(amount)},
+            "updatedAt": {"N": "1735603200000"},
+        },
+    )
+
+
+def test_bulk_resume_continues_after_the_written_windows(aws, tmp_path):
+    store = LocalCheckpointStore(str(tmp_path / "bulk_resume_table.json"))
+    params = {"dynamo_table": DYNAMO_TABLE}
+    write_to_s3 = backfill_job.write_to_s3
+    writes = [0]
+
+    def crashing_write_to_s3(*args, **kwargs):
+        # The second window is written, but the job dies before recording it
+        paths = write_to_s3(*args, **kwargs)
+        writes[0] += 1
+        if writes[0] == 2:
+            raise RuntimeError("Glue job lost")
+        return paths
+
+    checkpoint = Checkpoint(store, params, resume=False)
+    backfill = make_backfill(
+        aws, "bulk_resume_table", checkpoint=checkpoint, bulk_window_pages=2
+    )
+    with patch.object(backfill_job, "write_to_s3", side_effect=crashing_write_to_s3):
+        with pytest.raises(RuntimeError):
+            backfill.run_bulk("overwrite_partitions")
+    segment = store.load()["bulk"]["segments"]["0"]
+    assert segment["windows"] == 1 and segment["start_key"] is not None
+
+    # The table changes between the runs: an item of the written window is
+    # deleted, which moves the page boundaries, and an item is added
+    scanned = aws.scan(TableName=DYNAMO_TABLE)["Items"]
+    deleted_id = scanned[0]["id"]["S"]
+    aws.delete_item(TableName=DYNAMO_TABLE, Key={"id": {"S": deleted_id}})
+    put_item(aws, "id-new", 1)
+
+    checkpoint = Checkpoint(store, params, resume=True)
+    backfill = make_backfill(
+        aws, "bulk_resume_table", checkpoint=checkpoint, bulk_window_pages=2
+    )
+    backfill.run_bulk("overwrite_partitions")
+
+    # Only the rows after the written window are scanned again
+    assert backfill.total_items == ITEMS - 10 + 1
+    assert store.load()["bulk"]["segments"]["0"]["done"]
+    assert "bulk_files" in store.load()
+    # The deleted item was backfilled before its deletion, no row is lost or
+    # written twice
+    assert read_ids("bulk_resume_table") == sorted(
+        [f"id-{index:03d}" for index in range(ITEMS)] + ["id-new"]
+    )
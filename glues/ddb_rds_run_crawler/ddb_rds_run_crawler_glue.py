@@ -12,6 +12,12 @@ from awsglue.utils import getResolvedOptions
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+# Crawler polling: exponential backoff from POLL_INITIAL_SECONDS to POLL_MAX_SECONDS
+POLL_INITIAL_SECONDS = 5
+POLL_MAX_SECONDS = 60
+POLL_TIMEOUT_SECONDS = 6 * 60 * 60
+METRIC_NAMESPACE = "Datalake/RdsExport"
+
 
 def retrieve_args():
     try:
@@ -39,32 +45,38 @@ def retrieve_args():
         logger.error(f"ERROR: An unexpected error occurred: {e}")
         raise e
 
-def wait_for_crawler(glue_session, crawler_name):
+def wait_for_crawler(glue_session, crawler_name, previous_crawl=None,
+                     timeout_seconds=POLL_TIMEOUT_SECONDS):
     """
-            Waits until the glue job is ready to avoid concurrent runs
+            Waits until the glue crawler is ready to avoid concurrent runs, polling with
+            exponential backoff (POLL_INITIAL_SECONDS doubling up to POLL_MAX_SECONDS)
 
             :param glue_session: The Glue session that will be used
             :param crawler_name: The name of the glue crawler job
+            :param previous_crawl: The LastCrawl before a start, the crawler is only ready once
+                a newer crawl has finished
+            :param timeout_seconds: Raises a TimeoutError after waiting this long
+            :return: The crawler, as returned by get_crawler, and the seconds waited
         """
+    started = time.monotonic()
+    delay = POLL_INITIAL_SECONDS
     while True:
-        crawler = glue_session.get_crawler(Name=crawler_name)
-        state = crawler['Crawler']['State']
-        logger.info(f"Crawler state: {state}")
-
-        if state == 'READY':
-            logger.info("Crawler is ready to start.. Double-checking!")
-            time.sleep(10)
-            crawler = glue_session.get_crawler(Name=crawler_name)
-            state = crawler['Crawler']['State']
-            if state == 'READY':
-                logger.info("Crawler is ready to start.")
-                break
-        elif state == 'RUNNING':
-            logger.info("Crawler is currently running. Waiting...")
-            time.sleep(30)
-        else:
-            logger.warning(f"Crawler is not ready: {state}. Waiting...")
-            time.sleep(30)
+        crawler = glue_session.get_crawler(Name=crawler_name)['Crawler']
+        state = crawler['State']
+        waited = time.monotonic() - started
+        new_crawl = (
+            previous_crawl is None
+            or crawler.get('LastCrawl', {}).get('StartTime') != previous_crawl.get('StartTime')
+        )
+        if state == 'READY' and new_crawl:
+            logger.info(f"Crawler is ready to start after {waited:.0f}s.")
+            return crawler, waited
+
+        if waited >= timeout_seconds:
+            raise TimeoutError(f"Crawler {crawler_name} still {state} after {waited:.0f}s")
+        logger.info(f"Crawler state: {state}. Polling again in {delay}s...")
+        time.sleep(delay)
+        delay = min(delay * 2, POLL_MAX_SECONDS)
 
 def check_file_exists(s3_client, bucket_name, file_key, region_name='eu-west-2'):
     """
@@ -142,22 +154,25 @@ def glue_start_crawler(glue_session, crawler_name):
         logger.error(f"ERROR: An unexpected error occurred: {e}")
         raise e
 
-def glue_update_crawler(glue_session, crawler_path, crawler_name, s3_bucket):
+def glue_update_crawler(glue_session, crawler_paths, crawler_name, s3_bucket):
     """
-        Update the Glue Crawler's S3 target
+        Update the Glue Crawler's S3 targets
 
         :param glue_session: The Glue session that will be used
-        :param crawler_path: The S3 file path that the crawler will create an athena based on
+        :param crawler_paths: The S3 paths that the crawler will create athena tables based on
         :param crawler_name: The name of the glue crawler job
         :param s3_bucket: The name of the S3 bucket
     """
     try:
-        logger.info(f"Updating Glue Crawler: {crawler_name} with path: {crawler_path}")
+        logger.info(f"Updating Glue Crawler: {crawler_name} with paths: {crawler_paths}")
 
         glue_session.update_crawler(
             Name=crawler_name,
             Targets={
-                "S3Targets": [{"Path": f"s3://{s3_bucket}/{crawler_path}"}]
+                "S3Targets": [
+                    {"Path": f"s3://{s3_bucket}/{crawler_path}"}
+                    for crawler_path in crawler_paths
+                ]
             }
         )
     except Exception as e:
@@ -166,6 +181,94 @@ def glue_update_crawler(glue_session, crawler_path, crawler_name, s3_bucket):
 
     logger.info("Crawler updated successfully")
 
+class CrawlerCoordinator:
+    """
+    Runs the crawler once for all the new tables of an export.
+
+    The paths of the new tables are collected while the export files are copied, then
+    crawled by a single run with one S3Target per table:
+    1. wait (exponential backoff) until the crawler is READY;
+    2. update its S3Targets and start it, waiting again if another run started in
+       between (CrawlerRunningException);
+    3. wait for the run to finish and check its LastCrawl status.
+    The seconds spent waiting for the crawler to be free (CrawlerWaitSeconds) and for
+    the run to finish (CrawlerRunSeconds) are logged and sent to CloudWatch.
+    """
+
+    def __init__(self, glue_session, cloudwatch_session, crawler_name, s3_bucket):
+        self.glue_session = glue_session
+        self.cloudwatch_session = cloudwatch_session
+        self.crawler_name = crawler_name
+        self.s3_bucket = s3_bucket
+        self.paths = []
+
+    def add_path(self, crawler_path):
+        if crawler_path not in self.paths:
+            self.paths.append(crawler_path)
+
+    def put_metric(self, metric_name, seconds):
+        logger.info(f"{metric_name}: {seconds:.1f}s for crawler {self.crawler_name}")
+        try:
+            self.cloudwatch_session.put_metric_data(
+                Namespace=METRIC_NAMESPACE,
+                MetricData=[
+                    {
+                        "MetricName": metric_name,
+                        "Dimensions": [{"Name": "CrawlerName", "Value": self.crawler_name}],
+                        "Value": seconds,
+                        "Unit": "Seconds",
+                    }
+                ],
+            )
+        except ClientError as e:
+            # The metric is informative, a missing permission must not fail the export
+            logger.warning(f"Could not put metric {metric_name}: {e}")
+
+    def run(self):
+        """
+            Crawls the collected paths in a single crawler run
+
+            :return: The LastCrawl of the run, None if there was no path to crawl
+        """
+        if not self.paths:
+            logger.info("No new table to crawl.")
+            return None
+
+        wait_seconds = 0
+        while True:
+            crawler, waited = wait_for_crawler(self.glue_session, self.crawler_name)
+            wait_seconds += waited
+            try:
+                glue_update_crawler(
+                    glue_session=self.glue_session,
+                    crawler_paths=self.paths,
+                    crawler_name=self.crawler_name,
+                    s3_bucket=self.s3_bucket,
+                )
+                glue_start_crawler(glue_session=self.glue_session, crawler_name=self.crawler_name)
+                break
+            except ClientError as e:
+                if e.response['Error']['Code'] != 'CrawlerRunningException':
+                    raise
+                logger.info("Crawler was started by another run. Waiting...")
+        self.put_metric("CrawlerWaitSeconds", wait_seconds)
+        logger.info(f"Crawler {self.crawler_name} started for {len(self.paths)} tables: {self.paths}")
+
+        crawler, run_seconds = wait_for_crawler(
+            self.glue_session, self.crawler_name, previous_crawl=crawler.get("LastCrawl", {})
+        )
+        self.put_metric("CrawlerRunSeconds", run_seconds)
+        last_crawl = crawler.get("LastCrawl", {})
+        if last_crawl.get("Status") != "SUCCEEDED":
+            raise RuntimeError(
+                f"Crawler {self.crawler_name} run {last_crawl.get('Status')}: "
+                f"{last_crawl.get('ErrorMessage')}"
+            )
+        logger.info(f"Crawler {self.crawler_name} finished successfully")
+
+        return last_crawl
+
+
 def copy_s3_object(s3_client, bucket_name, source_key, destination_key):
     """
     Copy a file from one S3 location to another within the same bucket.
@@ -205,6 +308,12 @@ def main():
             json_data = json.loads(content)
             export_only_list = json_data.get("exportOnly", [])
             exported_files_path = json_data.get("exportedFilesPath", [])
+            coordinator = CrawlerCoordinator(
+                glue_session=boto3.client('glue'),
+                cloudwatch_session=boto3.client('cloudwatch'),
+                crawler_name=crawler_name,
+                s3_bucket=s3_bucket,
+            )
 
             for table in export_only_list:
                 print(f"Processing table: {table} ...")
@@ -230,27 +339,14 @@ def main():
                         copy_s3_object(s3_client, s3_bucket, source_file_name, destination_file_name)
                         counter+=1
 
-                        if run_crawler:
-                            logger.info(f"Athena table does not exist. Creating new {table_name} table...")
-                            crawler_path = destination_folder
-
-                            # Wait if crawler is already running
-                            glue = boto3.client('glue')
-                            wait_for_crawler(glue_session=glue, crawler_name=crawler_name)
-                            # Update the crawler target path
-                            glue_update_crawler(glue_session=glue, crawler_path=crawler_path, crawler_name=crawler_name,
-                                                s3_bucket=s3_bucket)
-
-                            # Start crawler
-                            wait_for_crawler(glue_session=glue, crawler_name=crawler_name)
-                            # start the glue crawler job
-                            response = glue_start_crawler(glue_session=glue, crawler_name=crawler_name)
-                            print('response', response)
-
-                            logger.info(f"Crawler {crawler_name} started successfully for table {table_name}")
+                if run_crawler and counter:
+                    logger.info(f"Athena table does not exist. Creating new {table_name} table...")
+                    coordinator.add_path(destination_folder)
+                elif counter:
+                    logger.info(f"Athena table {table_name} exists. Data is updated!")
 
-                        else:
-                            logger.info(f"Athena table {table_name} exists. Data is updated!")
+            # crawl all the new tables of the export in a single run
+            coordinator.run()
 
             return {
                 'statusCode': 200,
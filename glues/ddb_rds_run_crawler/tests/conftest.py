@@ -0,0 +1,17 @@
+import os
+import sys
+import types
+
+GLUES_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(os.path.join(GLUES_DIR, "ddb_rds_run_crawler"))
+
+try:
+    import awsglue.utils  # noqa: F401
+except ImportError:
+    # awsglue ships with the Glue runtime only, the job reads its arguments with it in
+    # main, which the tests do not run
+    awsglue = types.ModuleType("awsglue")
+    awsglue.utils = types.ModuleType("awsglue.utils")
+    awsglue.utils.getResolvedOptions = None
+    sys.modules["awsglue"] = awsglue
+    sys.modules["awsglue.utils"] = awsglue.utils
@@ -0,0 +1,172 @@
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+from botocore.exceptions import ClientError
+
+from ddb_rds_run_crawler_glue import CrawlerCoordinator, wait_for_crawler
+
+CRAWLER = "rds-export-crawler"
+BUCKET = "test-export-bucket"
+PREVIOUS_CRAWL = {"Status": "SUCCEEDED", "StartTime": datetime(2025, 1, 30)}
+NEW_CRAWL = {"Status": "SUCCEEDED", "StartTime": datetime(2025, 1, 31)}
+
+
+def crawler(state, last_crawl=PREVIOUS_CRAWL):
+    return {"Crawler": {"Name": CRAWLER, "State": state, "LastCrawl": last_crawl}}
+
+
+@pytest.fixture
+def clock():
+    """
+    Patches time.monotonic and time.sleep, sleeping moves the clock forward.
+    """
+    now = [0.0]
+
+    def sleep(seconds):
+        now[0] += seconds
+
+    with patch(
+        "ddb_rds_run_crawler_glue.time.monotonic", side_effect=lambda: now[0]
+    ), patch("ddb_rds_run_crawler_glue.time.sleep", side_effect=sleep) as mock_sleep:
+        yield mock_sleep
+
+
+def delays(mock_sleep):
+    return [call.args[0] for call in mock_sleep.call_args_list]
+
+
+def test_wait_for_crawler_backs_off_exponentially(clock):
+    glue = MagicMock()
+    glue.get_crawler.side_effect = [crawler("RUNNING")] * 6 + [crawler("READY")]
+
+    ready, waited = wait_for_crawler(glue, CRAWLER)
+
+    assert ready["State"] == "READY"
+    assert delays(clock) == [5, 10, 20, 40, 60, 60]
+    assert waited == 195
+
+
+def test_wait_for_crawler_waits_for_a_new_crawl(clock):
+    glue = MagicMock()
+    # READY with the previous crawl: the started run is not visible yet
+    glue.get_crawler.side_effect = [
+        crawler("READY"),
+        crawler("RUNNING"),
+        crawler("READY", NEW_CRAWL),
+    ]
+
+    ready, _ = wait_for_crawler(glue, CRAWLER, previous_crawl=PREVIOUS_CRAWL)
+
+    assert ready["LastCrawl"] == NEW_CRAWL
+    assert delays(clock) == [5, 10]
+
+
+def test_wait_for_crawler_times_out(clock):
+    glue = MagicMock()
+    glue.get_crawler.return_value = crawler("RUNNING")
+
+    with pytest.raises(TimeoutError):
+        wait_for_crawler(glue, CRAWLER, timeout_seconds=100)
+
+    assert delays(clock) == [5, 10, 20, 40, 60]
+
+
+def test_coordinator_crawls_all_paths_in_one_run(clock):
+    glue = MagicMock()
+    glue.get_crawler.side_effect = [crawler("READY"), crawler("READY", NEW_CRAWL)]
+    cloudwatch = MagicMock()
+    coordinator = CrawlerCoordinator(glue, cloudwatch, CRAWLER, BUCKET)
+    for path in ("temporal/dev/crawler/a", "temporal/dev/crawler/b"):
+        coordinator.add_path(path)
+    coordinator.add_path("temporal/dev/crawler/a")
+
+    assert coordinator.run() == NEW_CRAWL
+
+    glue.update_crawler.assert_called_once_with(
+        Name=CRAWLER,
+        Targets={
+            "S3Targets": [
+                {"Path": f"s3://{BUCKET}/temporal/dev/crawler/a"},
+                {"Path": f"s3://{BUCKET}/temporal/dev/crawler/b"},
+            ]
+        },
+    )
+    glue.start_crawler.assert_called_once_with(Name=CRAWLER)
+    metrics = [
+        call.kwargs["MetricData"][0]["MetricName"]
+        for call in cloudwatch.put_metric_data.call_args_list
+    ]
+    assert metrics == ["CrawlerWaitSeconds", "CrawlerRunSeconds"]
+
+
+def test_coordinator_without_paths_does_not_crawl():
+    glue = MagicMock()
+
+    assert CrawlerCoordinator(glue, MagicMock(), CRAWLER, BUCKET).run() is None
+    glue.start_crawler.assert_not_called()
+
+
+def test_coordinator_retries_when_another_run_started(clock):
+    glue = MagicMock()
+    glue.get_crawler.side_effect = [
+        crawler("READY"),
+        crawler("RUNNING"),
+        crawler("READY"),
+        crawler("READY", NEW_CRAWL),
+    ]
+    glue.start_crawler.side_effect = [
+        ClientError({"Error": {"Code": "CrawlerRunningException"}}, "StartCrawler"),
+        {},
+    ]
+    coordinator = CrawlerCoordinator(glue, MagicMock(), CRAWLER, BUCKET)
+    coordinator.add_path("temporal/dev/crawler/a")
+
+    assert coordinator.run() == NEW_CRAWL
+    assert glue.start_crawler.call_count == 2
+    assert glue.update_crawler.call_count == 2
+
+
+def test_coordinator_retries_when_another_run_started_before_the_update(clock):
+    glue = MagicMock()
+    glue.get_crawler.side_effect = [
+        crawler("READY"),
+        crawler("RUNNING"),
+        crawler("READY"),
+        crawler("READY", NEW_CRAWL),
+    ]
+    glue.update_crawler.side_effect = [
+        ClientError({"Error": {"Code": "CrawlerRunningException"}}, "UpdateCrawler"),
+        {},
+    ]
+    coordinator = CrawlerCoordinator(glue, MagicMock(), CRAWLER, BUCKET)
+    coordinator.add_path("temporal/dev/crawler/a")
+
+    assert coordinator.run() == NEW_CRAWL
+    assert glue.update_crawler.call_count == 2
+    glue.start_crawler.assert_called_once_with(Name=CRAWLER)
+
+
+def test_coordinator_raises_on_other_start_errors(clock):
+    glue = MagicMock()
+    glue.get_crawler.return_value = crawler("READY")
+    glue.start_crawler.side_effect = ClientError(
+        {"Error": {"Code": "AccessDeniedException"}}, "StartCrawler"
+    )
+    coordinator = CrawlerCoordinator(glue, MagicMock(), CRAWLER, BUCKET)
+    coordinator.add_path("temporal/dev/crawler/a")
+
+    with pytest.raises(ClientError):
+        coordinator.run()
+    assert glue.start_crawler.call_count == 1
+
+
+def test_coordinator_raises_on_a_failed_crawl(clock):
+    glue = MagicMock()
+    failed_crawl = dict(NEW_CRAWL, Status="FAILED", ErrorMessage="Access denied")
+    glue.get_crawler.side_effect = [crawler("READY"), crawler("READY", failed_crawl)]
+    coordinator = CrawlerCoordinator(glue, MagicMock(), CRAWLER, BUCKET)
+    coordinator.add_path("temporal/dev/crawler/a")
+
+    with pytest.raises(RuntimeError, match="FAILED: Access denied"):
+        coordinator.run()
@@ -3,11 +3,31 @@ dynamo_tables = {
         "reconcile_sql_path": "6518_cards.sql",
         "dynamo_table_env_var_name": "DYNAMODB_CARDS",
         "threshold": 0.9995,
+        "key_diff": {
+            "athena_key": "athena_id",
+            "dynamo_key": "id",
+            "compare": {"athena_state": "state"},
+        },
+        "incremental": {
+            "source_table": "dynamo_sls_cards",
+            "columns": {
+                "athena_id": "dynamodb_keys_id_s",
+                "athena_state": "dynamodb_new_image_state_s",
+            },
+        },
     },
     "dynamo_card_fast_messages_recon": {
         "reconcile_sql_path": "6978_card_fast_messages.sql",
         "dynamo_table_env_var_name": "DYNAMODB_CARD_FAST_MESSAGES",
         "threshold": 0.999,
+        "key_diff": {
+            "athena_key": "athena_id",
+            "dynamo_key": "id",
+        },
+        "incremental": {
+            "source_table": "dynamo_card_fast_messages_default",
+            "columns": {"athena_id": "dynamodb_keys_id_s"},
+        },
     },
     "dynamo_onfido_recon": {
         "reconcile_sql_path": "7485_onfido.sql",
@@ -18,11 +38,27 @@ dynamo_tables = {
         "reconcile_sql_path": "11130_mortgage_application.sql",
         "dynamo_table_env_var_name": "DYNAMODB_MORTGAGE_APP",
         "threshold": 0.9995,
+        "key_diff": {
+            "athena_key": "athena_id",
+            "dynamo_key": "id",
+        },
+        "incremental": {
+            "source_table": "dynamo_sls_home_financing_mortgage_application",
+            "columns": {"athena_id": "dynamodb_keys_id_s"},
+        },
     },
     "dynamo_mortgage_in_principle": {
         "reconcile_sql_path": "11131_mortgage_in_principle.sql",
         "dynamo_table_env_var_name": "DYNAMODB_MORTGAGE_IN_PRINC",
         "threshold": 0.9995,
+        "key_diff": {
+            "athena_key": "athena_id",
+            "dynamo_key": "id",
+        },
+        "incremental": {
+            "source_table": "dynamo_sls_home_financing_mortgage_in_principle",
+            "columns": {"athena_id": "dynamodb_keys_id_s"},
+        },
     },
     "dynamo_customer_finances": {
         "reconcile_sql_path": "11675_customer_finances.sql",
@@ -157,4 +157,33 @@ data_types = {
         "athena_count": "int",
         "timestamp": "timestamp",
     },
+    "dynamo_recon_history": {
+        "recon_table": "string",
+        "count_dynamo": "bigint",
+        "count_athena": "bigint",
+        "count_diff": "bigint",
+        "all_match": "boolean",
+        "error": "string",
+        "timestamp_extract": "timestamp",
+        "date": "date",
+    },
+    "dynamo_recon_key_diff": {
+        "status": "string",
+        "key": "string",
+        "dynamo_values": "string",
+        "athena_values": "string",
+        "timestamp_extract": "timestamp",
+        "recon_table": "string",
+        "date": "date",
+    },
+    "dynamo_recon_incremental_diff": {
+        "status": "string",
+        "key": "string",
+        "dynamo_values": "string",
+        "athena_values": "string",
+        "timestamp_extract": "timestamp",
+        "run_id": "string",
+        "recon_table": "string",
+        "date": "date",
+    },
 }
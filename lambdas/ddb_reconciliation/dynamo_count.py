@@ -0,0 +1,238 @@
+"""
+Item counts of the DynamoDB tables reconciled against Athena.
+
+Three counting modes, selected with the DYNAMO_COUNT_MODE environment variable or
+the `count_mode` key of the invocation event:
+- "scan": exact count, parallel segmented scan with Select="COUNT" so that no item
+  bodies are returned. Costs a full table read (RCU), see `consumed_rcu`.
+- "describe": approximate count from DescribeTable.ItemCount, refreshed by DynamoDB
+  about every six hours. Free and immediate.
+- "cached": the last exact count stored under s3://<S3_RECON>/_dynamo_counts/, when
+  it is younger than DYNAMO_COUNT_CACHE_MAX_AGE_SECONDS, else an exact scan whose
+  result is stored for the next invocations.
+
+Every mode returns a dict with the count, the consumed RCU, the latency and
+whether the count is approximate, and logs it.
+"""
+import json
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from datetime import timezone
+from typing import Optional
+
+import boto3
+from botocore.exceptions import ClientError
+
+logger = logging.getLogger()
+
+COUNT_MODES = ("scan", "describe", "cached")
+COUNT_MODE = os.environ.get("DYNAMO_COUNT_MODE", "scan")
+COUNT_SEGMENTS = int(os.environ.get("DYNAMO_COUNT_SEGMENTS", 8))
+CACHE_MAX_AGE_SECONDS = int(
+    os.environ.get("DYNAMO_COUNT_CACHE_MAX_AGE_SECONDS", 6 * 60 * 60)
+)
+CACHE_PREFIX = "_dynamo_counts"
+
+_dynamodb_client = None
+_s3_client = None
+
+
+def _dynamodb():
+    global _dynamodb_client
+    if _dynamodb_client is None:
+        _dynamodb_client = boto3.client("dynamodb")
+    return _dynamodb_client
+
+
+def _s3():
+    global _s3_client
+    if _s3_client is None:
+        _s3_client = boto3.client("s3")
+    return _s3_client
+
+
+def _count_result(
+    table_name: str,
+    mode: str,
+    count: int,
+    consumed_rcu: float,
+    started: float,
+    approximate: bool,
+    counted_at: Optional[str] = None,
+) -> dict:
+    result = {
+        "table_name": table_name,
+        "mode": mode,
+        "count": int(count),
+        "consumed_rcu": round(consumed_rcu, 2),
+        "latency_seconds": round(time.perf_counter() - started, 3),
+        "approximate": approximate,
+        "counted_at": counted_at or datetime.now(timezone.utc).isoformat(),
+    }
+    logger.info("Dynamo count: %s", json.dumps(result))
+
+    return result
+
+
+def _count_segment(table_name: str, segment: int, total_segments: int) -> tuple:
+    """
+    Counts the items of one scan segment, following its pages.
+    :return: The item count and the consumed RCU of the segment
+    """
+    count = 0
+    consumed_rcu = 0.0
+    scan_kwargs = {
+        "TableName": table_name,
+        "Select": "COUNT",
+        "ReturnConsumedCapacity": "TOTAL",
+        "Segment": segment,
+        "TotalSegments": total_segments,
+    }
+    while True:
+        response = _dynamodb().scan(**scan_kwargs)
+        count += response["Count"]
+        consumed_rcu += response.get("ConsumedCapacity", {}).get("CapacityUnits", 0)
+        if "LastEvaluatedKey" not in response:
+            return count, consumed_rcu
+        scan_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+
+def count_scan(table_name: str, total_segments: int = None) -> dict:
+    """
+    Exact item count of a table, from a parallel Select="COUNT" scan.
+    :param table_name: The DynamoDB table name
+    :type table_name: str
+    :param total_segments: Number of scan segments counted concurrently
+    :type total_segments: int, optional
+    :return: The count result
+    :rtype: dict
+    """
+    total_segments = total_segments or COUNT_SEGMENTS
+    started = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=total_segments) as executor:
+        segments = list(
+            executor.map(
+                lambda segment: _count_segment(table_name, segment, total_segments),
+                range(total_segments),
+            )
+        )
+
+    return _count_result(
+        table_name,
+        "scan",
+        sum(count for count, _ in segments),
+        sum(consumed_rcu for _, consumed_rcu in segments),
+        started,
+        approximate=False,
+    )
+
+
+def count_describe(table_name: str) -> dict:
+    """
+    Approximate item count of a table, from DescribeTable (no RCU consumed).
+    :param table_name: The DynamoDB table name
+    :type table_name: str
+    :return: The count result
+    :rtype: dict
+    """
+    started = time.perf_counter()
+    table = _dynamodb().describe_table(TableName=table_name)["Table"]
+
+    return _count_result(
+        table_name, "describe", table["ItemCount"], 0, started, approximate=True
+    )
+
+
+def _cache_key(table_name: str) -> str:
+    return f"{CACHE_PREFIX}/{table_name}.json"
+
+
+def read_cached_count(table_name: str, s3_bucket: str) -> Optional[dict]:
+    """
+    Reads the last exact count stored for a table, None if there is none.
+    """
+    try:
+        response = _s3().get_object(Bucket=s3_bucket, Key=_cache_key(table_name))
+    except ClientError as e:
+        if e.response["Error"]["Code"] == "NoSuchKey":
+            return None
+        raise
+
+    return json.loads(response["Body"].read())
+
+
+def write_cached_count(result: dict, s3_bucket: str) -> None:
+    """
+    Stores an exact count for the cached mode.
+    """
+    _s3().put_object(
+        Bucket=s3_bucket,
+        Key=_cache_key(result["table_name"]),
+        Body=json.dumps(result),
+    )
+
+
+def count_cached(
+    table_name: str,
+    s3_bucket: str = None,
+    max_age_seconds: int = None,
+    total_segments: int = None,
+) -> dict:
+    """
+    Item count of a table from the count cache, or from an exact scan when the
+    cached count is missing or older than max_age_seconds.
+    :param table_name: The DynamoDB table name
+    :type table_name: str
+    :param s3_bucket: Bucket of the count cache, defaults to S3_RECON
+    :type s3_bucket: str, optional
+    :return: The count result
+    :rtype: dict
+    """
+    if s3_bucket is None:
+        s3_bucket = os.environ["S3_RECON"]
+    if max_age_seconds is None:
+        max_age_seconds = CACHE_MAX_AGE_SECONDS
+
+    started = time.perf_counter()
+    cached = read_cached_count(table_name, s3_bucket)
+    if cached is not None:
+        age = (
+            datetime.now(timezone.utc) - datetime.fromisoformat(cached["counted_at"])
+        ).total_seconds()
+        if age <= max_age_seconds:
+            return _count_result(
+                table_name,
+                "cached",
+                cached["count"],
+                0,
+                started,
+                approximate=cached["approximate"],
+                counted_at=cached["counted_at"],
+            )
+        logger.info(f"Cached count of {table_name} is {int(age)}s old, rescanning")
+
+    result = count_scan(table_name, total_segments)
+    write_cached_count(result, s3_bucket)
+
+    return result
+
+
+def count_items(table_name: str, mode: str = None, **kwargs) -> dict:
+    """
+    Counts the items of a table with one of COUNT_MODES, defaults to DYNAMO_COUNT_MODE.
+    :return: The count result
+    :rtype: dict
+    """
+    mode = mode or COUNT_MODE
+    if mode == "scan":
+        return count_scan(table_name, kwargs.get("total_segments"))
+    if mode == "describe":
+        return count_describe(table_name)
+    if mode == "cached":
+        return count_cached(table_name, **kwargs)
+
+    raise ValueError(f"Unknown Dynamo count mode {mode}, expected one of {COUNT_MODES}")
@@ -0,0 +1,283 @@
+"""
+Incremental reconciliation of the keys changed in the datalake since the last run.
+
+Instead of the latest state of the whole table (the window functions of the
+reconciliation SQL files), each run only reads the date partitions written since
+the table watermark, the max timestamp_extracted reconciled by the previous run
+(held back to WATERMARK_LAG_SECONDS before that run started), stored in
+s3://<S3_RECON>/_recon_watermarks/<recon_table>.json. The latest row of every key
+changed since the watermark is compared with the current DynamoDB item (BatchGetItem
+on the key), emitting:
+- "extra": key in the datalake, no longer in DynamoDB;
+- "stale": compared attributes differ between the datalake and DynamoDB.
+Keys written to DynamoDB but never received by the datalake do not show up in the
+datalake partitions, they are caught by the count (or full key diff) reconciliation.
+The diff is appended to datalake_reconciliation.dynamo_recon_incremental_diff and the
+watermark is moved forward once it is written. Every row has the run_id of its run
+(the start of the run, a sortable timestamp string).
+
+The lag is needed because rows do not land in the datalake in timestamp_extracted
+order: the stream Lambda buffers batches up to BUFFER_FLUSH_AGE_SECONDS before
+writing them (with the timestamp of their extraction), and Athena reads are not
+atomic with concurrent writes. A watermark at the max timestamp_extracted read
+would skip the rows landing later with an older timestamp, so
+INCREMENTAL_WATERMARK_LAG_SECONDS must be at least the buffer flush age; the keys
+of the lag window are compared again by the next run. A key still out of sync is then
+appended again, by each run comparing it: readers take the row of the latest run_id
+per recon_table, key and date instead of counting rows.
+
+Tables are reconciled incrementally when config.dynamo_tables has, next to their
+"key_diff" entry, an "incremental" entry:
+{"source_table": "dynamo_sls_cards",
+ "columns": {"athena_id": "dynamodb_keys_id_s",
+             "athena_state": "dynamodb_new_image_state_s"}}
+where "columns" maps the key_diff Athena columns to the datalake_raw columns.
+"""
+import json
+import logging
+import os
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from datetime import timedelta
+from typing import Dict, Iterable, Iterator, List, Optional
+
+import boto3
+import pandas as pd
+from boto3.dynamodb.types import TypeDeserializer
+from botocore.exceptions import ClientError
+from key_diff import normalize_value
+
+logger = logging.getLogger()
+
+INCREMENTAL_DIFF_TABLE = "dynamo_recon_incremental_diff"
+WATERMARK_PREFIX = "_recon_watermarks"
+WATERMARK_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
+INITIAL_LOOKBACK_DAYS = int(os.environ.get("INCREMENTAL_INITIAL_LOOKBACK_DAYS", 1))
+# At least the BUFFER_FLUSH_AGE_SECONDS (15 minutes) of the stream Lambda
+WATERMARK_LAG_SECONDS = int(
+    os.environ.get("INCREMENTAL_WATERMARK_LAG_SECONDS", 60 * 60)
+)
+BATCH_GET_SIZE = 100
+BATCH_GET_MAX_ATTEMPTS = int(os.environ.get("INCREMENTAL_BATCH_GET_MAX_ATTEMPTS", 8))
+BATCH_GET_WORKERS = int(os.environ.get("INCREMENTAL_BATCH_GET_WORKERS", 8))
+
+_dynamodb_client = None
+_s3_client = None
+_deserializer = TypeDeserializer()
+
+
+def _dynamodb():
+    global _dynamodb_client
+    if _dynamodb_client is None:
+        _dynamodb_client = boto3.client("dynamodb")
+    return _dynamodb_client
+
+
+def _s3():
+    global _s3_client
+    if _s3_client is None:
+        _s3_client = boto3.client("s3")
+    return _s3_client
+
+
+def _watermark_key(recon_table: str) -> str:
+    return f"{WATERMARK_PREFIX}/{recon_table}.json"
+
+
+def format_watermark(timestamp: datetime) -> str:
+    """
+    Formats a timestamp as an Athena timestamp literal, millisecond precision.
+    """
+    return timestamp.strftime(WATERMARK_FORMAT)[:-3]
+
+
+def read_watermark(recon_table: str, s3_bucket: str = None) -> Optional[str]:
+    """
+    Reads the watermark of a table, None before its first incremental run.
+    """
+    if s3_bucket is None:
+        s3_bucket = os.environ["S3_RECON"]
+
+    try:
+        response = _s3().get_object(Bucket=s3_bucket, Key=_watermark_key(recon_table))
+    except ClientError as e:
+        if e.response["Error"]["Code"] == "NoSuchKey":
+            return None
+        raise
+
+    return json.loads(response["Body"].read())["timestamp_extracted"]
+
+
+def write_watermark(recon_table: str, watermark: str, s3_bucket: str = None) -> None:
+    """
+    Stores the watermark of a table for its next incremental run.
+    """
+    if s3_bucket is None:
+        s3_bucket = os.environ["S3_RECON"]
+
+    _s3().put_object(
+        Bucket=s3_bucket,
+        Key=_watermark_key(recon_table),
+        Body=json.dumps(
+            {
+                "timestamp_extracted": watermark,
+                "updated_at": datetime.utcnow().isoformat(),
+            }
+        ),
+    )
+
+
+def initial_watermark() -> str:
+    """
+    Watermark of a first incremental run, INITIAL_LOOKBACK_DAYS ago.
+    """
+    return format_watermark(datetime.utcnow() - timedelta(days=INITIAL_LOOKBACK_DAYS))
+
+
+def next_watermark(watermark: str, max_extracted: str, run_start: datetime) -> str:
+    """
+    Watermark stored after a run: the max timestamp_extracted read, but no later
+    than WATERMARK_LAG_SECONDS before the run started (rows still in flight then
+    are read again by the next run), and never behind the previous watermark.
+    :param watermark: The watermark the run started from
+    :param max_extracted: The max timestamp_extracted read by the run
+    :param run_start: UTC start time of the run, before its Athena query
+    """
+    lagged = format_watermark(run_start - timedelta(seconds=WATERMARK_LAG_SECONDS))
+    # Same fixed width format, the strings compare as the timestamps
+    return max(watermark, min(max_extracted, lagged))
+
+
+def incremental_sql(
+    source_table: str, columns: Dict[str, str], athena_key: str, watermark: str
+) -> str:
+    """
+    Builds the query of the latest row of every key extracted after the watermark,
+    reading only the date partitions from the watermark date onwards.
+    :param source_table: The datalake_raw table
+    :param columns: Output column -> datalake_raw column, including athena_key
+    :param athena_key: The output key column
+    :param watermark: Timestamp literal, ex. 2025-01-31 01:02:03.456
+    :return: The query, with the output columns and timestamp_extracted
+    :rtype: str
+    """
+    selected = ",\n        ".join(
+        f"{source} AS {column}" for column, source in columns.items()
+    )
+
+    return f"""SELECT {", ".join(columns)}, timestamp_extracted
+FROM (
+    SELECT {selected},
+        timestamp_extracted,
+        ROW_NUMBER() OVER (
+            PARTITION BY {columns[athena_key]}
+            ORDER BY timestamp_extracted DESC, date DESC
+        ) AS rn
+    FROM datalake_raw.{source_table}
+    WHERE date >= '{watermark[:10]}'
+        AND timestamp_extracted > TIMESTAMP '{watermark}'
+)
+WHERE rn = 1"""
+
+
+def batch_get_items(
+    table_name: str, dynamo_key: str, attributes: List[str], keys: List[str]
+) -> Dict[str, list]:
+    """
+    Reads the compared attributes of up to BATCH_GET_SIZE items by their string
+    hash key, retrying unprocessed keys with exponential backoff and jitter, up to
+    BATCH_GET_MAX_ATTEMPTS requests.
+    :return: Key -> normalized values of attributes, for the keys found
+    :raises RuntimeError: If keys are still unprocessed after the last attempt
+    """
+    names = {
+        f"#a{i}": attribute for i, attribute in enumerate([dynamo_key, *attributes])
+    }
+    request = {
+        table_name: {
+            "Keys": [{dynamo_key: {"S": key}} for key in keys],
+            "ProjectionExpression": ", ".join(names),
+            "ExpressionAttributeNames": names,
+        }
+    }
+
+    items = {}
+    for attempt in range(1, BATCH_GET_MAX_ATTEMPTS + 1):
+        response = _dynamodb().batch_get_item(RequestItems=request)
+        for item in response["Responses"].get(table_name, []):
+            items[normalize_value(_deserializer.deserialize(item[dynamo_key]))] = [
+                normalize_value(_deserializer.deserialize(item[attribute]))
+                if attribute in item
+                else None
+                for attribute in attributes
+            ]
+        request = response.get("UnprocessedKeys")
+        if not request:
+            return items
+        if attempt < BATCH_GET_MAX_ATTEMPTS:
+            delay = min(0.05 * 2**attempt, 5) * random.uniform(0.5, 1)
+            logger.warning(
+                f"Retrying {len(request[table_name]['Keys'])} unprocessed keys of "
+                f"{table_name} in {delay:.2f}s."
+            )
+            time.sleep(delay)
+
+    raise RuntimeError(
+        f"{len(request[table_name]['Keys'])} keys of {table_name} still unprocessed "
+        f"after {BATCH_GET_MAX_ATTEMPTS} BatchGetItem attempts."
+    )
+
+
+def diff_changed_keys(
+    chunks: Iterable[pd.DataFrame],
+    dynamo_table_name: str,
+    dynamo_key: str,
+    compare: Dict[str, str],
+    athena_key: str,
+    state: dict,
+) -> Iterator[tuple]:
+    """
+    Compares the chunks of the incremental query with the current DynamoDB items.
+    state["watermark"] is moved to the max timestamp_extracted read and
+    state["keys"] counts the keys compared.
+    :return: (status, key, dynamo values, athena values) of every key that differs
+    """
+    compare_columns = list(compare)
+    with ThreadPoolExecutor(max_workers=BATCH_GET_WORKERS) as executor:
+        for chunk in chunks:
+            if chunk.empty:
+                continue
+
+            max_extracted = pd.Timestamp(chunk["timestamp_extracted"].max())
+            if max_extracted > pd.Timestamp(state["watermark"]):
+                state["watermark"] = format_watermark(max_extracted)
+
+            athena_values = {}
+            for key, *values in chunk[[athena_key, *compare_columns]].itertuples(
+                index=False, name=None
+            ):
+                key = normalize_value(key)
+                if key is not None:
+                    athena_values[key] = [normalize_value(value) for value in values]
+            state["keys"] += len(athena_values)
+
+            keys = sorted(athena_values)
+            dynamo_items = {}
+            for items in executor.map(
+                lambda batch: batch_get_items(
+                    dynamo_table_name, dynamo_key, list(compare.values()), batch
+                ),
+                [
+                    keys[start : start + BATCH_GET_SIZE]
+                    for start in range(0, len(keys), BATCH_GET_SIZE)
+                ],
+            ):
+                dynamo_items.update(items)
+
+            for key in keys:
+                if key not in dynamo_items:
+                    yield "extra", key, None, athena_values[key]
+                elif dynamo_items[key] != athena_values[key]:
+                    yield "stale", key, dynamo_items[key], athena_values[key]
@@ -0,0 +1,313 @@
+"""
+Key level diff between a DynamoDB table and its datalake_raw reconciliation query.
+
+Both sides are streamed into sorted runs on local disk, at most KEY_DIFF_RUN_SIZE
+records in memory at a time:
+- DynamoDB: parallel scan projected on the key and compared attributes, one set of
+  runs per scan segment;
+- Athena: the chunks of the reconciliation query (UNLOAD to Parquet), keyed on its
+  athena_id column.
+The runs are then merged (heapq.merge) and walked side by side, emitting:
+- "missing": key in DynamoDB, not in the datalake;
+- "extra": key in the datalake, not in DynamoDB;
+- "stale": key on both sides whose compared attributes differ.
+The diff is written, KEY_DIFF_WRITE_ROWS rows per file, to the Parquet table
+datalake_reconciliation.dynamo_recon_key_diff partitioned by recon_table and date.
+
+Tables are diffed when config.dynamo_tables has a "key_diff" entry:
+{"athena_key": "athena_id", "dynamo_key": "id", "compare": {"athena_state": "state"}}
+where "compare" maps the Athena columns to the DynamoDB attributes to compare.
+"""
+import heapq
+import json
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from datetime import datetime
+from decimal import Decimal
+from operator import itemgetter
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+import awswrangler as wr
+import boto3
+import pandas as pd
+from boto3.dynamodb.types import TypeDeserializer
+from data_catalog import data_types
+
+logger = logging.getLogger()
+
+KEY_DIFF_TABLE = "dynamo_recon_key_diff"
+KEY_DIFF_RUN_SIZE = int(os.environ.get("KEY_DIFF_RUN_SIZE", 500000))
+KEY_DIFF_WRITE_ROWS = int(os.environ.get("KEY_DIFF_WRITE_ROWS", 500000))
+KEY_DIFF_SEGMENTS = int(os.environ.get("KEY_DIFF_SEGMENTS", 8))
+
+_dynamodb_client = None
+_deserializer = TypeDeserializer()
+
+
+def _dynamodb():
+    global _dynamodb_client
+    if _dynamodb_client is None:
+        _dynamodb_client = boto3.client("dynamodb")
+    return _dynamodb_client
+
+
+def normalize_value(value) -> Optional[str]:
+    """
+    Normalizes a DynamoDB or Athena value to a comparable string, None for nulls.
+    Integral numbers compare equal whatever their type (Decimal, int, float).
+    """
+    if value is None or (not isinstance(value, (list, dict, set)) and pd.isna(value)):
+        return None
+    if isinstance(value, Decimal) and value == value.to_integral_value():
+        return str(int(value))
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    if isinstance(value, (list, dict, set)):
+        return json.dumps(value, sort_keys=True, default=str)
+
+    return str(value)
+
+
+class SortedRuns:
+    """
+    Spills (key, values) records to JSON lines files of at most run_size records,
+    each sorted by key, and reads them back as one stream sorted by key.
+    """
+
+    def __init__(self, directory: str, name: str, run_size: int = None):
+        self.directory = directory
+        self.name = name
+        self.run_size = run_size or KEY_DIFF_RUN_SIZE
+        self.buffer = []
+        self.paths = []
+        self.records = 0
+
+    def add(self, key: str, values: List[Optional[str]]) -> None:
+        self.buffer.append((key, values))
+        self.records += 1
+        if len(self.buffer) >= self.run_size:
+            self._spill()
+
+    def _spill(self) -> None:
+        if not self.buffer:
+            return
+
+        self.buffer.sort(key=itemgetter(0))
+        path = os.path.join(self.directory, f"{self.name}-{len(self.paths):05d}.jsonl")
+        with open(path, "w") as run_file:
+            for record in self.buffer:
+                run_file.write(json.dumps(record))
+                run_file.write("\n")
+        self.paths.append(path)
+        self.buffer = []
+
+    def close(self) -> "SortedRuns":
+        self._spill()
+        return self
+
+    def _read(self, path: str) -> Iterator[tuple]:
+        with open(path, "r") as run_file:
+            for line in run_file:
+                yield tuple(json.loads(line))
+
+    def __iter__(self) -> Iterator[tuple]:
+        return heapq.merge(
+            *(self._read(path) for path in self.paths), key=itemgetter(0)
+        )
+
+
+def merge_runs(runs: List[SortedRuns]) -> Iterator[tuple]:
+    """
+    Merges several sets of sorted runs into one stream sorted by key.
+    """
+    return heapq.merge(*runs, key=itemgetter(0))
+
+
+def scan_dynamo_keys(
+    table_name: str,
+    dynamo_key: str,
+    compare_attributes: List[str],
+    directory: str,
+    total_segments: int = None,
+    run_size: int = None,
+) -> List[SortedRuns]:
+    """
+    Scans the key and compared attributes of a table into sorted runs, one set of
+    runs per scan segment, segments scanned concurrently.
+    """
+    total_segments = total_segments or KEY_DIFF_SEGMENTS
+    attributes = [dynamo_key, *compare_attributes]
+    names = {f"#a{i}": attribute for i, attribute in enumerate(attributes)}
+
+    def scan_segment(segment: int) -> SortedRuns:
+        runs = SortedRuns(directory, f"dynamo-{segment:03d}", run_size)
+        scan_kwargs = {
+            "TableName": table_name,
+            "ProjectionExpression": ", ".join(names),
+            "ExpressionAttributeNames": names,
+            "Segment": segment,
+            "TotalSegments": total_segments,
+        }
+        while True:
+            response = _dynamodb().scan(**scan_kwargs)
+            for item in response["Items"]:
+                if dynamo_key not in item:
+                    continue
+                runs.add(
+                    normalize_value(_deserializer.deserialize(item[dynamo_key])),
+                    [
+                        normalize_value(_deserializer.deserialize(item[attribute]))
+                        if attribute in item
+                        else None
+                        for attribute in compare_attributes
+                    ],
+                )
+            if "LastEvaluatedKey" not in response:
+                return runs.close()
+            scan_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+    with ThreadPoolExecutor(max_workers=total_segments) as executor:
+        return list(executor.map(scan_segment, range(total_segments)))
+
+
+def spill_athena_keys(
+    chunks: Iterable[pd.DataFrame],
+    athena_key: str,
+    compare_columns: List[str],
+    directory: str,
+    run_size: int = None,
+) -> SortedRuns:
+    """
+    Spills the chunks of a reconciliation query into sorted runs.
+    """
+    runs = SortedRuns(directory, "athena", run_size)
+    for chunk in chunks:
+        for key, *values in chunk[[athena_key, *compare_columns]].itertuples(
+            index=False, name=None
+        ):
+            key = normalize_value(key)
+            if key is not None:
+                runs.add(key, [normalize_value(value) for value in values])
+
+    return runs.close()
+
+
+def _unique(records: Iterator[tuple]) -> Iterator[tuple]:
+    """
+    Keeps the first record of each key of a sorted stream.
+    """
+    previous_key = None
+    for record in records:
+        if record[0] != previous_key:
+            previous_key = record[0]
+            yield record
+
+
+def diff_sorted(
+    dynamo_records: Iterator[tuple], athena_records: Iterator[tuple]
+) -> Iterator[Tuple[str, str, Optional[list], Optional[list]]]:
+    """
+    Walks two key sorted streams side by side.
+    :return: (status, key, dynamo values, athena values) of every key that differs
+    """
+    dynamo_records = _unique(dynamo_records)
+    athena_records = _unique(athena_records)
+    dynamo_record = next(dynamo_records, None)
+    athena_record = next(athena_records, None)
+
+    while dynamo_record is not None or athena_record is not None:
+        if athena_record is None or (
+            dynamo_record is not None and dynamo_record[0] < athena_record[0]
+        ):
+            yield "missing", dynamo_record[0], dynamo_record[1], None
+            dynamo_record = next(dynamo_records, None)
+        elif dynamo_record is None or athena_record[0] < dynamo_record[0]:
+            yield "extra", athena_record[0], None, athena_record[1]
+            athena_record = next(athena_records, None)
+        else:
+            if list(dynamo_record[1]) != list(athena_record[1]):
+                yield "stale", dynamo_record[0], dynamo_record[1], athena_record[1]
+            dynamo_record = next(dynamo_records, None)
+            athena_record = next(athena_records, None)
+
+
+def _values_json(columns: List[str], values: Optional[list]) -> Optional[str]:
+    if values is None:
+        return None
+    return json.dumps(dict(zip(columns, values)))
+
+
+def write_key_diff(
+    diffs: Iterator[tuple],
+    recon_table: str,
+    compare_columns: List[str],
+    s3_bucket: str = None,
+    write_rows: int = None,
+    athena_table: str = KEY_DIFF_TABLE,
+    replace_partition: bool = True,
+    run_id: str = None,
+) -> dict:
+    """
+    Writes a key diff to datalake_reconciliation.dynamo_recon_key_diff (or
+    athena_table), replacing the partition of the table for today unless
+    replace_partition is False. run_id, when given, is written to a run_id column
+    to tell apart the rows appended by several runs.
+    :return: Number of missing, extra and stale keys
+    :rtype: dict
+    """
+    if s3_bucket is None:
+        s3_bucket = os.environ["S3_RECON"]
+    write_rows = write_rows or KEY_DIFF_WRITE_ROWS
+
+    today = date.today().isoformat()
+    path = f"s3://{s3_bucket}/{athena_table}/"
+    if replace_partition:
+        stale_files = wr.s3.list_objects(
+            f"{path}recon_table={recon_table}/date={today}/"
+        )
+        if stale_files:
+            wr.s3.delete_objects(stale_files)
+
+    counts = {"missing": 0, "extra": 0, "stale": 0}
+    rows = []
+
+    def flush():
+        df = pd.DataFrame(
+            rows, columns=["status", "key", "dynamo_values", "athena_values"]
+        )
+        if run_id is not None:
+            df["run_id"] = run_id
+        df["recon_table"] = recon_table
+        df["date"] = today
+        df["timestamp_extract"] = datetime.utcnow()
+        wr.s3.to_parquet(
+            df=df,
+            path=path,
+            index=False,
+            dataset=True,
+            database="datalake_reconciliation",
+            table=athena_table,
+            partition_cols=["recon_table", "date"],
+            mode="append",
+            dtype=data_types[athena_table],
+        )
+        rows.clear()
+
+    for status, key, dynamo_values, athena_values in diffs:
+        counts[status] += 1
+        rows.append(
+            (
+                status,
+                key,
+                _values_json(compare_columns, dynamo_values),
+                _values_json(compare_columns, athena_values),
+            )
+        )
+        if len(rows) >= write_rows:
+            flush()
+    if rows:
+        flush()
+
+    return counts
@@ -1,54 +1,198 @@
 import logging
 import os
+import tempfile
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 from datetime import datetime
-from typing import Dict
+from typing import Dict, Iterator, List, Union
 
 import awswrangler as wr
-import boto3
 import pandas as pd
 from data_catalog import data_types
+from dynamo_count import count_items
+from incremental_recon import (
+    INCREMENTAL_DIFF_TABLE,
+    WATERMARK_FORMAT,
+    diff_changed_keys,
+    incremental_sql,
+    initial_watermark,
+    next_watermark,
+    read_watermark,
+    write_watermark,
+)
+from key_diff import (
+    KEY_DIFF_RUN_SIZE,
+    diff_sorted,
+    merge_runs,
+    scan_dynamo_keys,
+    spill_athena_keys,
+    write_key_diff,
+)
 
 import config
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
-dynamodb = boto3.client("dynamodb")
+ATHENA_READ_MODES = ("count", "unload", "query")
+ATHENA_READ_MODE = os.environ.get("ATHENA_READ_MODE", "count")
+ATHENA_UNLOAD_PREFIX = "_athena_unload"
+RECON_MAX_WORKERS = int(os.environ.get("RECON_MAX_WORKERS", 8))
+RECON_HISTORY_TABLE = "dynamo_recon_history"
 
+_existing_databases = set()
 
-def read_athena(sql_path: str, input_database: str) -> pd.DataFrame:
+
+def read_sql_file(sql_path: str) -> str:
     """
-    Reads the total historical onboarding timeline customer -> status from Athena.
-    :return: DataFrame containing all distinct customer ids
-    :rtype: pd.DataFrame
+    Reads a reconciliation query, without its trailing semicolon so that it can be
+    nested in COUNT or UNLOAD statements.
     :param sql_path: path to the sql file containing the query
     :type sql_path: str
+    :return: The SQL query
+    :rtype: str
+    """
+    with open(sql_path, "r") as sql_file:
+        return sql_file.read().strip().rstrip(";").rstrip()
+
+
+def count_sql(sql: str) -> str:
+    """
+    Wraps a reconciliation query in an aggregate, so that Athena returns its row
+    count as a single row instead of one row per key.
+    :param sql: The reconciliation query
+    :type sql: str
+    :return: The count query, with a single column count_athena
+    :rtype: str
+    """
+    return f"SELECT COUNT(*) AS count_athena\nFROM (\n{sql}\n) recon"
+
+
+def unload_path(athena_table_name: str, s3_bucket: str = None) -> str:
+    """
+    Returns a new, empty S3 prefix to UNLOAD the rows of a reconciliation query to.
+    """
+    if s3_bucket is None:
+        s3_bucket = os.environ["S3_RECON"]
+
+    return (
+        f"s3://{s3_bucket}/{ATHENA_UNLOAD_PREFIX}/{athena_table_name}/"
+        f"{uuid.uuid4().hex}/"
+    )
+
+
+def read_athena_sql(
+    sql: str,
+    input_database: str,
+    unload_to: str = None,
+    chunksize: int = None,
+) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
+    """
+    Reads the rows of a query from Athena.
+    :param sql: The query
+    :type sql: str
     :param input_database: The input database to read from
     :type input_database: str
+    :param unload_to: Empty S3 prefix, when set the query is run as an UNLOAD to
+        Parquet and its files read back (and deleted), instead of paging the result
+        rows through the Athena API. Use it for row level diffs of big tables.
+    :type unload_to: str, optional
+    :param chunksize: Rows per DataFrame to iterate over instead of one DataFrame
+    :type chunksize: int, optional
     :return: Dataframe containing the result of the SQL query
     :rtype: pd.DataFrame
     """
+    logger.info("Reading from Athena... ")
 
-    with open(sql_path, "r") as total_onboarding_status_timeline_sql_file:
-        total_onboarding_status_timeline_sql = (
-            total_onboarding_status_timeline_sql_file.read()
+    if unload_to is None:
+        return wr.athena.read_sql_query(
+            sql=sql,
+            database=input_database,
+            workgroup="datalake_workgroup",
+            ctas_approach=False,
+            chunksize=chunksize,
         )
 
-    logger.info("Reading from Athena... ")
+    logger.info(f"Unloading Athena query to {unload_to}")
+    return wr.athena.read_sql_query(
+        sql=sql,
+        database=input_database,
+        workgroup="datalake_workgroup",
+        ctas_approach=False,
+        unload_approach=True,
+        s3_output=unload_to,
+        keep_files=False,
+        chunksize=chunksize,
+    )
+
+
+def read_athena(
+    sql_path: str,
+    input_database: str,
+    unload_to: str = None,
+    chunksize: int = None,
+) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
+    """
+    Reads the rows of a reconciliation query from Athena, see read_athena_sql.
+    :param sql_path: path to the sql file containing the query
+    :type sql_path: str
+    :return: Dataframe containing the result of the SQL query
+    :rtype: pd.DataFrame
+    """
+    return read_athena_sql(read_sql_file(sql_path), input_database, unload_to, chunksize)
+
+
+def read_athena_count(sql_path: str, input_database: str) -> int:
+    """
+    Counts the rows of a reconciliation query in Athena, fetching a single row.
+    :param sql_path: path to the sql file containing the query
+    :type sql_path: str
+    :param input_database: The input database to read from
+    :type input_database: str
+    :return: The row count of the query
+    :rtype: int
+    """
+    logger.info("Counting in Athena... ")
 
     df = wr.athena.read_sql_query(
-        sql=total_onboarding_status_timeline_sql,
+        sql=count_sql(read_sql_file(sql_path)),
         database=input_database,
         workgroup="datalake_workgroup",
         ctas_approach=False,
     )
 
-    return df
+    return int(df["count_athena"].iloc[0])
+
+
+def read_athena_row_count(
+    sql_path: str, input_database: str, athena_table_name: str, mode: str = None
+) -> int:
+    """
+    Counts the rows of a reconciliation query with one of ATHENA_READ_MODES:
+    "count" pushes the count down to Athena, "unload" and "query" fetch the rows
+    (through UNLOAD to Parquet or the Athena API) and count them in the Lambda.
+    :return: The row count of the query
+    :rtype: int
+    """
+    mode = mode or ATHENA_READ_MODE
+    if mode == "count":
+        return read_athena_count(sql_path, input_database)
+    if mode == "unload":
+        return read_athena(
+            sql_path, input_database, unload_to=unload_path(athena_table_name)
+        ).shape[0]
+    if mode == "query":
+        return read_athena(sql_path, input_database).shape[0]
+
+    raise ValueError(
+        f"Unknown Athena read mode {mode}, expected one of {ATHENA_READ_MODES}"
+    )
 
 
 def generic_construct_count_dataframe(
-    athena_df: pd.DataFrame, dynamo_count: int
+    athena_count: int, dynamo_count: int
 ) -> pd.DataFrame:
     """
     Constructs the output dataframe with structure status
@@ -56,7 +200,7 @@ def generic_construct_count_dataframe(
     """
     data = {
         "count_dynamo": [dynamo_count],
-        "count_athena": [athena_df.shape[0]],
+        "count_athena": [athena_count],
         "date": [date.today().strftime("%Y%m%d")],
         "timestamp_extract": [datetime.utcnow()],
     }
@@ -169,17 +313,22 @@ def construct_customers_count_dataframe(
 
 def create_database_if_not_exists(database_name: str) -> dict:
     """
-    Creates a database in Athena with the name provided if it doesn't already exist
+    Creates a database in Athena with the name provided if it doesn't already exist.
+    Databases known to exist are cached for the lifetime of the container, so the
+    Glue catalog is only called on the first write of a cold start.
     :param database_name: The name of the database
     :type database_name: str
     :return: The response
     :rtype: dict
     """
 
-    if database_name not in wr.catalog.databases().values:
-        res = wr.catalog.create_database(database_name)
+    if database_name in _existing_databases:
+        return None
 
-        return res
+    res = wr.catalog.create_database(database_name, exist_ok=True)
+    _existing_databases.add(database_name)
+
+    return res
 
 
 def write_to_s3(
@@ -191,7 +340,8 @@ def write_to_s3(
     mode: str = "append",
 ) -> dict:
     """
-    Writes the DataFrame to S3 and Athena using AWS Wrangler
+    Writes the DataFrame to S3 and Athena using AWS Wrangler, as Parquet partitioned
+    by its date column (ISO formatted)
     :param output_df: The Dataframe to write out to S3
     :type output_df: pd.DataFrame
     :param athena_table: The table in Athena to write to
@@ -214,16 +364,22 @@ def write_to_s3(
 
     create_database_if_not_exists(database_name)
 
+    output_df = output_df.assign(
+        date=pd.to_datetime(output_df["date"].astype(str)).dt.strftime("%Y-%m-%d")
+    )
+
     try:
-        res = wr.s3.to_csv(
+        res = wr.s3.to_parquet(
             df=output_df,
             path=path,
             index=False,
             dataset=True,
             database=database_name,
             table=athena_table,
+            partition_cols=["date"],
             mode=mode,
-            schema_evolution="true",
+            schema_evolution=True,
+            compression="snappy",
             dtype=schema,
         )
 
@@ -238,13 +394,13 @@ def write_to_s3(
 
 def write_reconcilication_to_s3(
     construct_count_dataframe,
-    athena_df,
+    athena_result,
     latest_scanned_count_dynamo_df,
     target_athena_table,
     athena_database_name,
 ):
     dynamo_athena_merged_df = construct_count_dataframe(
-        athena_df, latest_scanned_count_dynamo_df
+        athena_result, latest_scanned_count_dynamo_df
     )
 
     res = write_to_s3(
@@ -258,31 +414,66 @@ def write_reconcilication_to_s3(
     return dynamo_athena_merged_df
 
 
-def read_dynamo_aws_cli(dynamo_table_name: str = None):
+def read_dynamo_aws_cli(dynamo_table_name: str = None, count_mode: str = None):
     """
-    Accepts the name of a Dynamo table and returns the latest scanned count using the AWS CLI
+    Accepts the name of a Dynamo table and returns its item count
     :param dynamo_table_name: String representing the table name to get the count for
     :type dynamo_table_name: str
+    :param count_mode: One of dynamo_count.COUNT_MODES, defaults to DYNAMO_COUNT_MODE
+    :type count_mode: str, optional
+    """
+    return count_items(dynamo_table_name, count_mode)["count"]
+
+
+def write_recon_history(rows: List[dict]) -> pd.DataFrame:
     """
-    count_command = dynamodb.scan(
-        TableName=dynamo_table_name,
+    Writes one row per reconciled table to RECON_HISTORY_TABLE, the compact history
+    of all reconciliations (counts, difference and outcome) partitioned by date.
+    :param rows: Dicts with recon_table, count_dynamo, count_athena, all_match and
+        error (None for successful reconciliations)
+    :type rows: List[dict]
+    :return: The history rows written
+    :rtype: pd.DataFrame
+    """
+    history_df = pd.DataFrame(
+        rows,
+        columns=["recon_table", "count_dynamo", "count_athena", "all_match", "error"],
     )
+    history_df["count_dynamo"] = history_df["count_dynamo"].astype("Int64")
+    history_df["count_athena"] = history_df["count_athena"].astype("Int64")
+    history_df["count_diff"] = history_df["count_dynamo"] - history_df["count_athena"]
+    history_df["all_match"] = history_df["all_match"].astype(bool)
+    history_df["date"] = date.today().strftime("%Y-%m-%d")
+    history_df["timestamp_extract"] = datetime.utcnow()
 
-    logger.info("Dynamo count command:  %s", count_command["Count"])
+    res = write_to_s3(
+        history_df,
+        athena_table=RECON_HISTORY_TABLE,
+        database_name="datalake_reconciliation",
+        schema=data_types[RECON_HISTORY_TABLE],
+    )
+    logger.info(f"Result: {res}")
 
-    return count_command["ScannedCount"]
+    return history_df
 
 
 def generic_process_reconciliation(
-    sql_filepath: str, athena_table_name: str, dynamo_table_name: str, threshold: float
+    sql_filepath: str,
+    athena_table_name: str,
+    dynamo_table_name: str,
+    threshold: float,
+    count_mode: str = None,
+    athena_read_mode: str = None,
 ):
     logger.info("Starting {0} reconciliation. ".format(athena_table_name))
-    athena_df = read_athena(sql_filepath, "datalake_raw")
-    dynamo_count = read_dynamo_aws_cli(dynamo_table_name)
+    athena_count = read_athena_row_count(
+        sql_filepath, "datalake_raw", athena_table_name, athena_read_mode
+    )
+    dynamo_count = read_dynamo_aws_cli(dynamo_table_name, count_mode)
 
     merged_df = write_reconcilication_to_s3(
         generic_construct_count_dataframe,
-        athena_df,
+        athena_count,
         dynamo_count,
         athena_table_name,
         "datalake_reconciliation",
@@ -291,14 +482,240 @@ def generic_process_reconciliation(
     dynamo_count = merged_df["count_dynamo"].sum()
     athena_count = merged_df["count_athena"].sum()
 
-    recon_check_counts(dynamo_count, athena_count, threshold)
+    all_match = recon_check_counts(dynamo_count, athena_count, threshold)
+    write_recon_history(
+        [
+            {
+                "recon_table": athena_table_name,
+                "count_dynamo": dynamo_count,
+                "count_athena": athena_count,
+                "all_match": all_match,
+                "error": None,
+            }
+        ]
+    )
 
     logger.info("Finished {0} reconciliation. ".format(athena_table_name))
 
 
+def process_reconciliations(
+    dynamo_recon_tables: List[str],
+    count_mode: str = None,
+    athena_read_mode: str = None,
+    max_workers: int = None,
+) -> pd.DataFrame:
+    """
+    Reconciles several tables of config.dynamo_tables in one invocation.
+    The Athena queries and the DynamoDB counts of all the tables are submitted to
+    one thread pool, so up to max_workers of them run concurrently, and the counts
+    are written as one combined result set to RECON_HISTORY_TABLE.
+    A table whose Athena or DynamoDB count fails is reported with its error and
+    does not stop the others.
+    :param dynamo_recon_tables: Keys of config.dynamo_tables to reconcile
+    :type dynamo_recon_tables: List[str]
+    :param max_workers: Concurrent queries and counts, defaults to RECON_MAX_WORKERS
+    :type max_workers: int, optional
+    :return: One row per table with both counts and whether they match
+    :rtype: pd.DataFrame
+    """
+    started = time.perf_counter()
+    max_workers = max_workers or RECON_MAX_WORKERS
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {}
+        for dynamo_recon_table in dynamo_recon_tables:
+            table_config = config.dynamo_tables[dynamo_recon_table]
+            futures[dynamo_recon_table] = (
+                executor.submit(
+                    read_athena_row_count,
+                    table_config["reconcile_sql_path"],
+                    "datalake_raw",
+                    dynamo_recon_table,
+                    athena_read_mode,
+                ),
+                executor.submit(
+                    read_dynamo_aws_cli,
+                    os.environ.get(table_config["dynamo_table_env_var_name"]),
+                    count_mode,
+                ),
+            )
+
+        rows = []
+        for dynamo_recon_table, (athena_future, dynamo_future) in futures.items():
+            row = {
+                "recon_table": dynamo_recon_table,
+                "count_dynamo": None,
+                "count_athena": None,
+                "all_match": False,
+                "error": None,
+            }
+            try:
+                row["count_athena"] = athena_future.result()
+                row["count_dynamo"] = dynamo_future.result()
+                row["all_match"] = recon_check_counts(
+                    row["count_dynamo"],
+                    row["count_athena"],
+                    config.dynamo_tables[dynamo_recon_table]["threshold"],
+                )
+            except Exception as e:
+                logger.error(f"Reconciliation of {dynamo_recon_table} failed: {e}")
+                row["error"] = str(e)
+            rows.append(row)
+
+    combined_df = write_recon_history(rows)
+    logger.info(
+        f"Reconciled {len(dynamo_recon_tables)} tables in "
+        f"{time.perf_counter() - started:.1f}s, "
+        f"{int((~combined_df['all_match']).sum())} not matching"
+    )
+
+    return combined_df
+
+
+def process_key_diff(dynamo_recon_table: str) -> dict:
+    """
+    Diffs the keys of a table of config.dynamo_tables between DynamoDB and Athena,
+    see key_diff.py. The Athena rows are unloaded to Parquet and both sides are
+    spilled to sorted runs concurrently, in a temporary directory.
+    :param dynamo_recon_table: Key of config.dynamo_tables with a "key_diff" entry
+    :type dynamo_recon_table: str
+    :return: Number of missing, extra and stale keys and of keys on each side
+    :rtype: dict
+    """
+    table_config = config.dynamo_tables[dynamo_recon_table]
+    if "key_diff" not in table_config:
+        raise ValueError(f"No key_diff configuration for {dynamo_recon_table}")
+    diff_config = table_config["key_diff"]
+    compare = diff_config.get("compare", {})
+
+    logger.info("Starting {0} key diff. ".format(dynamo_recon_table))
+    create_database_if_not_exists("datalake_reconciliation")
+
+    with tempfile.TemporaryDirectory() as directory, ThreadPoolExecutor(
+        max_workers=2
+    ) as executor:
+        athena_future = executor.submit(
+            lambda: spill_athena_keys(
+                read_athena(
+                    table_config["reconcile_sql_path"],
+                    "datalake_raw",
+                    unload_to=unload_path(dynamo_recon_table),
+                    chunksize=KEY_DIFF_RUN_SIZE,
+                ),
+                diff_config["athena_key"],
+                list(compare),
+                directory,
+            )
+        )
+        dynamo_future = executor.submit(
+            scan_dynamo_keys,
+            os.environ.get(table_config["dynamo_table_env_var_name"]),
+            diff_config["dynamo_key"],
+            list(compare.values()),
+            directory,
+        )
+        athena_runs = athena_future.result()
+        dynamo_runs = dynamo_future.result()
+
+        counts = write_key_diff(
+            diff_sorted(merge_runs(dynamo_runs), iter(athena_runs)),
+            dynamo_recon_table,
+            list(compare),
+        )
+
+    counts["dynamo_keys"] = sum(runs.records for runs in dynamo_runs)
+    counts["athena_keys"] = athena_runs.records
+    logger.info(f"Key diff of {dynamo_recon_table}: {counts}")
+
+    return counts
+
+
+def process_incremental_reconciliation(dynamo_recon_table: str) -> dict:
+    """
+    Reconciles the keys of a table changed in the datalake since its watermark,
+    see incremental_recon.py.
+    :param dynamo_recon_table: Key of config.dynamo_tables with "key_diff" and
+        "incremental" entries
+    :type dynamo_recon_table: str
+    :return: Number of extra and stale keys, of keys compared and the new watermark
+    :rtype: dict
+    """
+    table_config = config.dynamo_tables[dynamo_recon_table]
+    if "incremental" not in table_config or "key_diff" not in table_config:
+        raise ValueError(f"No incremental configuration for {dynamo_recon_table}")
+    diff_config = table_config["key_diff"]
+    compare = diff_config.get("compare", {})
+
+    run_start = datetime.utcnow()
+    watermark = read_watermark(dynamo_recon_table) or initial_watermark()
+    logger.info(
+        f"Starting {dynamo_recon_table} incremental reconciliation from {watermark}"
+    )
+    create_database_if_not_exists("datalake_reconciliation")
+
+    chunks = read_athena_sql(
+        incremental_sql(
+            table_config["incremental"]["source_table"],
+            table_config["incremental"]["columns"],
+            diff_config["athena_key"],
+            watermark,
+        ),
+        "datalake_raw",
+        unload_to=unload_path(dynamo_recon_table),
+        chunksize=KEY_DIFF_RUN_SIZE,
+    )
+    state = {"watermark": watermark, "keys": 0}
+    counts = write_key_diff(
+        diff_changed_keys(
+            chunks,
+            os.environ.get(table_config["dynamo_table_env_var_name"]),
+            diff_config["dynamo_key"],
+            compare,
+            diff_config["athena_key"],
+            state,
+        ),
+        dynamo_recon_table,
+        list(compare),
+        athena_table=INCREMENTAL_DIFF_TABLE,
+        replace_partition=False,
+        run_id=run_start.strftime(WATERMARK_FORMAT),
+    )
+    state["watermark"] = next_watermark(watermark, state["watermark"], run_start)
+    write_watermark(dynamo_recon_table, state["watermark"])
+
+    counts.update(state)
+    logger.info(f"Incremental reconciliation of {dynamo_recon_table}: {counts}")
+
+    return counts
+
+
 def lambda_handler(event, context):
+    # multi table recon, {"dynamo_recon_tables": [...]} or "all" for every table
+    if "dynamo_recon_tables" in event:
+        dynamo_recon_tables = event["dynamo_recon_tables"]
+        if dynamo_recon_tables == "all":
+            dynamo_recon_tables = list(config.dynamo_tables)
+        logger.info(f"Start running for {len(dynamo_recon_tables)} tables...")
+        combined_df = process_reconciliations(
+            dynamo_recon_tables,
+            event.get("count_mode"),
+            event.get("athena_read_mode"),
+        )
+        failed = combined_df.loc[combined_df["error"].notna(), "recon_table"].tolist()
+        if failed:
+            raise RuntimeError(f"Reconciliation failed for tables: {failed}")
+        logger.info(f"Finished running for {len(dynamo_recon_tables)} tables...")
+        return
+
     # generic recon functions
     dynamo_recon_table = event["dynamo_recon_table"]
+    if event.get("key_diff"):
+        process_key_diff(dynamo_recon_table)
+        return
+    if event.get("incremental"):
+        process_incremental_reconciliation(dynamo_recon_table)
+        return
+
     logger.info(f"Start running for {dynamo_recon_table}...")
     generic_process_reconciliation(
         config.dynamo_tables[dynamo_recon_table]["reconcile_sql_path"],
@@ -307,6 +724,8 @@ def lambda_handler(event, context):
             config.dynamo_tables[dynamo_recon_table]["dynamo_table_env_var_name"]
         ),
         config.dynamo_tables[dynamo_recon_table]["threshold"],
+        event.get("count_mode"),
+        event.get("athena_read_mode"),
     )
 
     logger.info(f"Finished running for {dynamo_recon_table}...")
@@ -0,0 +1,54 @@
+import os
+import sys
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+sys.path.append(os.path.abspath("../"))
+from lambda_function import count_sql, read_athena_row_count, read_sql_file
+
+SQL_PATH = os.path.join(os.path.dirname(__file__), "..", "6518_cards.sql")
+
+
+def test_read_sql_file_strips_trailing_semicolon(tmp_path):
+    sql_path = tmp_path / "recon.sql"
+    sql_path.write_text("SELECT 1 AS athena_id\nFROM t\nORDER BY 1;\n")
+
+    assert read_sql_file(str(sql_path)) == "SELECT 1 AS athena_id\nFROM t\nORDER BY 1"
+
+
+def test_count_sql_wraps_query():
+    sql = count_sql("SELECT id AS athena_id FROM t")
+
+    assert sql.startswith("SELECT COUNT(*) AS count_athena")
+    assert "(\nSELECT id AS athena_id FROM t\n) recon" in sql
+
+
+def test_read_athena_row_count_pushes_count_down():
+    with patch(
+        "lambda_function.wr.athena.read_sql_query",
+        return_value=pd.DataFrame({"count_athena": [42]}),
+    ) as read_sql_query:
+        assert read_athena_row_count(SQL_PATH, "datalake_raw", "t", "count") == 42
+
+    sql = read_sql_query.call_args.kwargs["sql"]
+    assert sql.startswith("SELECT COUNT(*)")
+    assert "ROW_NUMBER()" in sql
+
+
+def test_read_athena_row_count_unload():
+    with patch.dict(os.environ, {"S3_RECON": "recon-bucket"}), patch(
+        "lambda_function.wr.athena.read_sql_query",
+        return_value=pd.DataFrame({"athena_id": ["a", "b", "c"]}),
+    ) as read_sql_query:
+        assert read_athena_row_count(SQL_PATH, "datalake_raw", "t", "unload") == 3
+
+    kwargs = read_sql_query.call_args.kwargs
+    assert kwargs["unload_approach"]
+    assert kwargs["s3_output"].startswith("s3://recon-bucket/_athena_unload/t/")
+
+
+def test_read_athena_row_count_unknown_mode():
+    with pytest.raises(ValueError):
+        read_athena_row_count(SQL_PATH, "datalake_raw", "t", "sample")
@@ -0,0 +1,107 @@
+import os
+import sys
+import json
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from unittest.mock import patch
+
+import boto3
+import pytest
+from moto import mock_aws
+
+sys.path.append(os.path.abspath("../"))
+import dynamo_count
+from dynamo_count import count_cached, count_describe, count_items, count_scan
+
+BUCKET = "test-recon-bucket"
+TABLE = "test_table"
+
+
+@pytest.fixture
+def aws():
+    with patch.dict(
+        os.environ,
+        {
+            "AWS_DEFAULT_REGION": "eu-west-2",
+            "AWS_ACCESS_KEY_ID": "testing",
+            "AWS_SECRET_ACCESS_KEY": "testing",
+            "S3_RECON": BUCKET,
+        },
+    ), mock_aws():
+        dynamo_count._dynamodb_client = None
+        dynamo_count._s3_client = None
+
+        dynamodb = boto3.client("dynamodb")
+        dynamodb.create_table(
+            TableName=TABLE,
+            KeySchema=[{"AttributeName": "id", "KeyType": "HASH"}],
+            AttributeDefinitions=[{"AttributeName": "id", "AttributeType": "S"}],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        for i in range(25):
+            dynamodb.put_item(
+                TableName=TABLE, Item={"id": {"S": str(i)}, "body": {"S": "x" * 100}}
+            )
+        s3 = boto3.client("s3")
+        s3.create_bucket(
+            Bucket=BUCKET,
+            CreateBucketConfiguration={"LocationConstraint": "eu-west-2"},
+        )
+
+        yield dynamodb, s3
+
+        dynamo_count._dynamodb_client = None
+        dynamo_count._s3_client = None
+
+
+def test_count_scan_sums_segments(aws):
+    result = count_scan(TABLE, total_segments=4)
+
+    assert result["count"] == 25
+    assert result["mode"] == "scan"
+    assert not result["approximate"]
+    assert result["consumed_rcu"] > 0
+
+
+def test_count_describe(aws):
+    result = count_describe(TABLE)
+
+    assert result["mode"] == "describe"
+    assert result["approximate"]
+    assert result["consumed_rcu"] == 0
+
+
+def test_count_cached_scans_then_reuses(aws):
+    dynamodb, s3 = aws
+
+    first = count_cached(TABLE, max_age_seconds=3600, total_segments=2)
+    dynamodb.put_item(TableName=TABLE, Item={"id": {"S": "new"}})
+    second = count_cached(TABLE, max_age_seconds=3600)
+
+    assert first["mode"] == "scan"
+    assert second["mode"] == "cached"
+    assert second["count"] == first["count"] == 25
+    assert second["consumed_rcu"] == 0
+
+
+def test_count_cached_rescans_when_stale(aws):
+    dynamodb, s3 = aws
+    counted_at = datetime.now(timezone.utc) - timedelta(hours=2)
+    s3.put_object(
+        Bucket=BUCKET,
+        Key=f"_dynamo_counts/{TABLE}.json",
+        Body=json.dumps(
+            {"count": 3, "approximate": False, "counted_at": counted_at.isoformat()}
+        ),
+    )
+
+    result = count_cached(TABLE, max_age_seconds=3600)
+
+    assert result["mode"] == "scan"
+    assert result["count"] == 25
+
+
+def test_count_items_unknown_mode(aws):
+    with pytest.raises(ValueError):
+        count_items(TABLE, "estimate")
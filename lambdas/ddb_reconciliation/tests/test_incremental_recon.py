@@ -0,0 +1,225 @@
+import os
+import sys
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import awswrangler as wr
+import boto3
+import pandas as pd
+import pytest
+from moto import mock_aws
+
+sys.path.append(os.path.abspath("../"))
+import incremental_recon
+from incremental_recon import (
+    batch_get_items,
+    diff_changed_keys,
+    incremental_sql,
+    next_watermark,
+    read_watermark,
+)
+from lambda_function import process_incremental_reconciliation
+
+BUCKET = "test-recon-bucket"
+TABLE = "test_cards"
+
+
+@pytest.fixture
+def aws():
+    with patch.dict(
+        os.environ,
+        {
+            "AWS_DEFAULT_REGION": "eu-west-2",
+            "AWS_ACCESS_KEY_ID": "testing",
+            "AWS_SECRET_ACCESS_KEY": "testing",
+            "S3_RECON": BUCKET,
+            "DYNAMODB_CARDS": TABLE,
+        },
+    ), mock_aws():
+        incremental_recon._dynamodb_client = None
+        incremental_recon._s3_client = None
+        boto3.client("s3").create_bucket(
+            Bucket=BUCKET,
+            CreateBucketConfiguration={"LocationConstraint": "eu-west-2"},
+        )
+        boto3.client("glue").create_database(
+            DatabaseInput={"Name": "datalake_reconciliation"}
+        )
+        dynamodb = boto3.client("dynamodb")
+        dynamodb.create_table(
+            TableName=TABLE,
+            KeySchema=[{"AttributeName": "id", "KeyType": "HASH"}],
+            AttributeDefinitions=[{"AttributeName": "id", "AttributeType": "S"}],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        for i in range(150):
+            dynamodb.put_item(
+                TableName=TABLE,
+                Item={"id": {"S": f"{i:03d}"}, "state": {"S": "ACTIVE"}},
+            )
+
+        yield
+
+        incremental_recon._dynamodb_client = None
+        incremental_recon._s3_client = None
+
+
+def changed_rows(keys, extracted="2025-01-31 10:00:00"):
+    return pd.DataFrame(
+        {
+            "athena_id": keys,
+            "athena_state": ["BLOCKED" if key == "007" else "ACTIVE" for key in keys],
+            "timestamp_extracted": pd.Timestamp(extracted),
+        }
+    )
+
+
+def test_incremental_sql_prunes_partitions():
+    sql = incremental_sql(
+        "dynamo_sls_cards",
+        {
+            "athena_id": "dynamodb_keys_id_s",
+            "athena_state": "dynamodb_new_image_state_s",
+        },
+        "athena_id",
+        "2025-01-31 01:02:03.456",
+    )
+
+    assert "WHERE date >= '2025-01-31'" in sql
+    assert "timestamp_extracted > TIMESTAMP '2025-01-31 01:02:03.456'" in sql
+    assert "PARTITION BY dynamodb_keys_id_s" in sql
+    assert sql.startswith("SELECT athena_id, athena_state, timestamp_extracted")
+
+
+def test_batch_get_items(aws):
+    items = batch_get_items(TABLE, "id", ["state"], ["001", "002", "999"])
+
+    assert items == {"001": ["ACTIVE"], "002": ["ACTIVE"]}
+
+
+def test_batch_get_items_retries_unprocessed_keys():
+    request = {"Keys": [{"id": {"S": "002"}}]}
+    client = MagicMock()
+    client.batch_get_item.side_effect = [
+        {
+            "Responses": {TABLE: [{"id": {"S": "001"}, "state": {"S": "ACTIVE"}}]},
+            "UnprocessedKeys": {TABLE: request},
+        },
+        {"Responses": {TABLE: [{"id": {"S": "002"}}]}, "UnprocessedKeys": {}},
+    ]
+
+    with patch.object(incremental_recon, "_dynamodb_client", client), patch(
+        "incremental_recon.time.sleep"
+    ):
+        items = batch_get_items(TABLE, "id", ["state"], ["001", "002"])
+
+    assert items == {"001": ["ACTIVE"], "002": [None]}
+    assert client.batch_get_item.call_args.kwargs["RequestItems"] == {TABLE: request}
+
+
+def test_batch_get_items_gives_up_after_max_attempts():
+    client = MagicMock()
+    client.batch_get_item.return_value = {
+        "Responses": {},
+        "UnprocessedKeys": {TABLE: {"Keys": [{"id": {"S": "001"}}]}},
+    }
+
+    with patch.object(incremental_recon, "_dynamodb_client", client), patch(
+        "incremental_recon.time.sleep"
+    ) as sleep, pytest.raises(RuntimeError, match="still unprocessed"):
+        batch_get_items(TABLE, "id", ["state"], ["001"])
+
+    assert client.batch_get_item.call_count == incremental_recon.BATCH_GET_MAX_ATTEMPTS
+    assert sleep.call_count == incremental_recon.BATCH_GET_MAX_ATTEMPTS - 1
+
+
+def test_next_watermark_lags_behind_the_run_start():
+    run_start = datetime(2025, 1, 31, 12, 0)
+
+    previous = "2025-01-31 00:00:00.000"
+
+    with patch.object(incremental_recon, "WATERMARK_LAG_SECONDS", 3600):
+        # Rows extracted within the lag may still be in flight
+        assert (
+            next_watermark(previous, "2025-01-31 11:59:00.000", run_start)
+            == "2025-01-31 11:00:00.000"
+        )
+        assert (
+            next_watermark(previous, "2025-01-31 10:00:00.000", run_start)
+            == "2025-01-31 10:00:00.000"
+        )
+        # Never moved back
+        later = "2025-01-31 11:30:00.000"
+        assert next_watermark(later, "2025-01-31 11:45:00.000", run_start) == later
+
+
+def test_diff_changed_keys(aws):
+    state = {"watermark": "2025-01-31 00:00:00.000", "keys": 0}
+    chunks = [
+        changed_rows([f"{i:03d}" for i in range(0, 120)]),
+        changed_rows(["007", "500"], "2025-01-31 11:30:00.250"),
+    ]
+
+    diffs = list(
+        diff_changed_keys(
+            chunks, TABLE, "id", {"athena_state": "state"}, "athena_id", state
+        )
+    )
+
+    assert diffs == [
+        ("stale", "007", ["ACTIVE"], ["BLOCKED"]),
+        ("stale", "007", ["ACTIVE"], ["BLOCKED"]),
+        ("extra", "500", None, ["ACTIVE"]),
+    ]
+    assert state == {"watermark": "2025-01-31 11:30:00.250", "keys": 122}
+
+
+def test_process_incremental_reconciliation_moves_watermark(aws):
+    with patch(
+        "lambda_function.read_athena_sql",
+        return_value=iter([changed_rows(["007", "500"])]),
+    ) as read_athena_sql, patch(
+        "lambda_function.initial_watermark", return_value="2025-01-31 00:00:00.000"
+    ):
+        counts = process_incremental_reconciliation("dynamo_cards_recon")
+
+    assert "FROM datalake_raw.dynamo_sls_cards" in read_athena_sql.call_args.args[0]
+    assert counts["extra"] == 1 and counts["stale"] == 1
+    assert read_watermark("dynamo_cards_recon") == "2025-01-31 10:00:00.000"
+
+    with patch(
+        "lambda_function.read_athena_sql", return_value=iter([])
+    ) as read_athena_sql:
+        counts = process_incremental_reconciliation("dynamo_cards_recon")
+
+    assert "TIMESTAMP '2025-01-31 10:00:00.000'" in read_athena_sql.call_args.args[0]
+    assert counts["keys"] == 0
+    assert read_watermark("dynamo_cards_recon") == "2025-01-31 10:00:00.000"
+
+    df = wr.s3.read_parquet(
+        f"s3://{BUCKET}/dynamo_recon_incremental_diff/", dataset=True
+    )
+    assert sorted(df["key"]) == ["007", "500"]
+
+
+def test_lag_window_keys_are_appended_with_their_run_id(aws):
+    with patch(
+        "lambda_function.initial_watermark", return_value="2025-01-31 00:00:00.000"
+    ):
+        for _ in range(2):
+            with patch(
+                "lambda_function.read_athena_sql",
+                return_value=iter([changed_rows(["007"])]),
+            ):
+                process_incremental_reconciliation("dynamo_cards_recon")
+
+    df = wr.s3.read_parquet(
+        f"s3://{BUCKET}/dynamo_recon_incremental_diff/", dataset=True
+    )
+    # Compared by both runs, once per run
+    assert df["key"].tolist() == ["007", "007"]
+    assert df["run_id"].nunique() == 2
+    latest = df.sort_values("run_id").drop_duplicates(
+        ["recon_table", "key", "date"], keep="last"
+    )
+    assert len(latest) == 1
@@ -0,0 +1,141 @@
+import os
+import sys
+from decimal import Decimal
+from unittest.mock import patch
+
+import awswrangler as wr
+import boto3
+import pandas as pd
+import pytest
+from moto import mock_aws
+
+sys.path.append(os.path.abspath("../"))
+import key_diff
+from key_diff import (
+    SortedRuns,
+    diff_sorted,
+    merge_runs,
+    normalize_value,
+    scan_dynamo_keys,
+    spill_athena_keys,
+    write_key_diff,
+)
+
+BUCKET = "test-recon-bucket"
+TABLE = "test_cards"
+
+
+@pytest.fixture
+def aws():
+    with patch.dict(
+        os.environ,
+        {
+            "AWS_DEFAULT_REGION": "eu-west-2",
+            "AWS_ACCESS_KEY_ID": "testing",
+            "AWS_SECRET_ACCESS_KEY": "testing",
+            "S3_RECON": BUCKET,
+        },
+    ), mock_aws():
+        key_diff._dynamodb_client = None
+        boto3.client("s3").create_bucket(
+            Bucket=BUCKET,
+            CreateBucketConfiguration={"LocationConstraint": "eu-west-2"},
+        )
+        boto3.client("glue").create_database(
+            DatabaseInput={"Name": "datalake_reconciliation"}
+        )
+
+        yield
+
+        key_diff._dynamodb_client = None
+
+
+def test_normalize_value():
+    assert normalize_value(Decimal("5")) == normalize_value(5.0) == "5"
+    assert normalize_value(5) == "5"
+    assert normalize_value(Decimal("5.5")) == "5.5"
+    assert normalize_value(float("nan")) is None
+    assert normalize_value(pd.NA) is None
+
+
+def test_sorted_runs_spill_and_merge(tmp_path):
+    runs = SortedRuns(str(tmp_path), "side", run_size=3)
+    for key in ["e", "b", "g", "a", "f", "c", "d"]:
+        runs.add(key, [])
+    runs.close()
+
+    assert len(runs.paths) == 3
+    assert [key for key, _ in runs] == list("abcdefg")
+
+
+def test_diff_sorted():
+    dynamo = iter(
+        [("a", ["ACTIVE"]), ("b", ["ACTIVE"]), ("c", ["BLOCKED"]), ("e", [None])]
+    )
+    athena = iter(
+        [("b", ["ACTIVE"]), ("c", ["ACTIVE"]), ("c", ["ACTIVE"]), ("d", [None])]
+    )
+
+    assert list(diff_sorted(dynamo, athena)) == [
+        ("missing", "a", ["ACTIVE"], None),
+        ("stale", "c", ["BLOCKED"], ["ACTIVE"]),
+        ("extra", "d", None, [None]),
+        ("missing", "e", [None], None),
+    ]
+
+
+def test_diff_dynamo_scan_against_athena_chunks(aws, tmp_path):
+    dynamodb = boto3.client("dynamodb")
+    dynamodb.create_table(
+        TableName=TABLE,
+        KeySchema=[{"AttributeName": "id", "KeyType": "HASH"}],
+        AttributeDefinitions=[{"AttributeName": "id", "AttributeType": "S"}],
+        BillingMode="PAY_PER_REQUEST",
+    )
+    for i in range(20):
+        dynamodb.put_item(
+            TableName=TABLE,
+            Item={
+                "id": {"S": f"{i:03d}"},
+                "state": {"S": "ACTIVE"},
+                "body": {"S": "x"},
+            },
+        )
+    # Keys 002 to 019 in three chunks, 004 in another state than in DynamoDB
+    chunks = [
+        pd.DataFrame(
+            {
+                "athena_id": [f"{i:03d}" for i in range(start, start + 6)],
+                "athena_state": [
+                    "BLOCKED" if i == 4 else "ACTIVE" for i in range(start, start + 6)
+                ],
+            }
+        )
+        for start in (2, 8, 14)
+    ]
+
+    dynamo_runs = scan_dynamo_keys(
+        TABLE, "id", ["state"], str(tmp_path), total_segments=3, run_size=4
+    )
+    athena_runs = spill_athena_keys(
+        chunks, "athena_id", ["athena_state"], str(tmp_path), run_size=4
+    )
+    counts = write_key_diff(
+        diff_sorted(merge_runs(dynamo_runs), iter(athena_runs)),
+        TABLE,
+        ["athena_state"],
+        write_rows=2,
+    )
+
+    assert sum(runs.records for runs in dynamo_runs) == 20
+    assert counts == {"missing": 2, "extra": 0, "stale": 1}
+
+    df = wr.s3.read_parquet(f"s3://{BUCKET}/dynamo_recon_key_diff/", dataset=True)
+    assert sorted(df["key"]) == ["000", "001", "004"]
+    stale = df[df["status"] == "stale"].iloc[0]
+    assert stale["athena_values"] == '{"athena_state": "BLOCKED"}'
+
+    # A rerun on the same day replaces the partition
+    write_key_diff(iter([("extra", "099", None, [None])]), TABLE, ["athena_state"])
+    df = wr.s3.read_parquet(f"s3://{BUCKET}/dynamo_recon_key_diff/", dataset=True)
+    assert df["key"].tolist() == ["099"]
@@ -0,0 +1,66 @@
+import os
+import sys
+import threading
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+sys.path.append(os.path.abspath("../"))
+import config
+from lambda_function import lambda_handler, process_reconciliations
+
+TABLES = ["dynamo_cards_recon", "dynamo_onfido_recon", "dynamo_customers_recon"]
+
+
+def test_process_reconciliations_runs_tables_concurrently():
+    # Every Athena query waits for all the others, so the test only passes when
+    # the queries of the three tables are in flight at the same time
+    barrier = threading.Barrier(len(TABLES), timeout=10)
+
+    def athena_count(sql_path, input_database, athena_table_name, mode=None):
+        barrier.wait()
+        return 100
+
+    with patch(
+        "lambda_function.read_athena_row_count", side_effect=athena_count
+    ), patch("lambda_function.read_dynamo_aws_cli", return_value=100), patch(
+        "lambda_function.write_to_s3"
+    ) as write_to_s3:
+        combined_df = process_reconciliations(TABLES, max_workers=2 * len(TABLES))
+
+    assert combined_df["recon_table"].tolist() == TABLES
+    assert combined_df["all_match"].all()
+    assert write_to_s3.call_count == 1
+    assert write_to_s3.call_args.kwargs["athena_table"] == "dynamo_recon_history"
+
+
+def test_process_reconciliations_reports_failed_tables():
+    def dynamo_count(dynamo_table_name, count_mode=None):
+        if dynamo_table_name == "onfido":
+            raise RuntimeError("throttled")
+        return 100
+
+    with patch.dict(
+        os.environ, {"DYNAMODB_ONFIDO": "onfido", "DYNAMODB_CARDS": "cards"}
+    ), patch("lambda_function.read_athena_row_count", return_value=90), patch(
+        "lambda_function.read_dynamo_aws_cli", side_effect=dynamo_count
+    ), patch("lambda_function.write_to_s3"):
+        combined_df = process_reconciliations(TABLES[:2])
+
+    cards, onfido = combined_df.to_dict("records")
+    assert pd.isna(cards["error"]) and not cards["all_match"]
+    assert onfido["error"] == "throttled" and pd.isna(onfido["count_dynamo"])
+
+
+def test_lambda_handler_all_tables_raises_on_failure():
+    with patch(
+        "lambda_function.read_athena_row_count", side_effect=RuntimeError("x")
+    ), patch("lambda_function.read_dynamo_aws_cli", return_value=1), patch(
+        "lambda_function.write_to_s3"
+    ) as write_to_s3:
+        with pytest.raises(RuntimeError):
+            lambda_handler({"dynamo_recon_tables": "all"}, None)
+
+    combined_df = write_to_s3.call_args.args[0]
+    assert sorted(combined_df["recon_table"]) == sorted(config.dynamo_tables)
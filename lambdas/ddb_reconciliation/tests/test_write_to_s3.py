@@ -0,0 +1,98 @@
+import os
+import sys
+from unittest.mock import patch
+
+import awswrangler as wr
+import boto3
+import pandas as pd
+import pytest
+from moto import mock_aws
+
+sys.path.append(os.path.abspath("../"))
+import lambda_function
+from lambda_function import (
+    create_database_if_not_exists,
+    generic_construct_count_dataframe,
+    write_recon_history,
+    write_to_s3,
+)
+from data_catalog import data_types
+
+BUCKET = "test-recon-bucket"
+
+
+@pytest.fixture
+def aws():
+    with patch.dict(
+        os.environ,
+        {
+            "AWS_DEFAULT_REGION": "eu-west-2",
+            "AWS_ACCESS_KEY_ID": "testing",
+            "AWS_SECRET_ACCESS_KEY": "testing",
+            "S3_RECON": BUCKET,
+        },
+    ), mock_aws():
+        lambda_function._existing_databases.clear()
+        boto3.client("s3").create_bucket(
+            Bucket=BUCKET,
+            CreateBucketConfiguration={"LocationConstraint": "eu-west-2"},
+        )
+
+        yield
+
+        lambda_function._existing_databases.clear()
+
+
+def test_create_database_if_not_exists_is_cached(aws):
+    create_database_if_not_exists("datalake_reconciliation")
+    with patch("lambda_function.wr.catalog.create_database") as create_database:
+        create_database_if_not_exists("datalake_reconciliation")
+
+    create_database.assert_not_called()
+    assert "datalake_reconciliation" in wr.catalog.databases()["Database"].values
+
+
+def test_write_to_s3_parquet_partitioned_by_date(aws):
+    write_to_s3(
+        generic_construct_count_dataframe(98, 100),
+        athena_table="dynamo_onfido_recon",
+        database_name="datalake_reconciliation",
+        schema=data_types["dynamo_onfido_recon"],
+    )
+
+    paths = wr.s3.list_objects(f"s3://{BUCKET}/dynamo_onfido_recon/")
+    assert len(paths) == 1
+    assert "/date=" in paths[0] and paths[0].endswith(".snappy.parquet")
+    assert (
+        wr.catalog.get_table_types("datalake_reconciliation", "dynamo_onfido_recon")[
+            "date"
+        ]
+        == "date"
+    )
+
+
+def test_write_recon_history(aws):
+    history_df = write_recon_history(
+        [
+            {
+                "recon_table": "dynamo_cards_recon",
+                "count_dynamo": 100,
+                "count_athena": 98,
+                "all_match": False,
+                "error": None,
+            },
+            {
+                "recon_table": "dynamo_onfido_recon",
+                "count_dynamo": None,
+                "count_athena": None,
+                "all_match": False,
+                "error": "throttled",
+            },
+        ]
+    )
+
+    assert history_df["count_diff"].tolist()[0] == 2
+    df = wr.s3.read_parquet(f"s3://{BUCKET}/dynamo_recon_history/", dataset=True)
+    assert sorted(df["recon_table"]) == ["dynamo_cards_recon", "dynamo_onfido_recon"]
+    failed = df[df["recon_table"] == "dynamo_onfido_recon"]
+    assert pd.isna(failed["count_diff"]).all()
@@ -1,15 +1,117 @@
 import boto3
+import json
 import logging
-from datetime import datetime
+import os
+import random
+import threading
+import time
+import uuid
+from botocore.config import Config
+from botocore.exceptions import ClientError
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
 from dateutil import tz
-from typing import List, Dict, Optional, Tuple, Union
+from typing import Callable, Iterable, Iterator, List, Dict, Optional, Tuple, Union
 
 # Configure logging
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
-# Initialize the S3 client
-s3_client = boto3.client("s3")
+# Restore engine settings
+RESTORE_LIST_WORKERS = int(os.environ.get("RESTORE_LIST_WORKERS", 8))
+RESTORE_COPY_WORKERS = int(os.environ.get("RESTORE_COPY_WORKERS", 32))
+RESTORE_MAX_ATTEMPTS = int(os.environ.get("RESTORE_MAX_ATTEMPTS", 5))
+RESTORE_TIME_MARGIN_MS = int(os.environ.get("RESTORE_TIME_MARGIN_MS", 60000))
+RESTORE_PARTITION_LOOKBACK_DAYS = int(
+    os.environ.get("RESTORE_PARTITION_LOOKBACK_DAYS", 1)
+)
+RESTORE_MANIFEST_PART_SIZE = int(os.environ.get("RESTORE_MANIFEST_PART_SIZE", 10000))
+# S3 Standard list prices (USD), override for other regions or storage classes
+RESTORE_COST_PER_1000_COPIES = float(
+    os.environ.get("RESTORE_COST_PER_1000_COPIES", 0.005)
+)
+RESTORE_COST_PER_GB_MONTH = float(os.environ.get("RESTORE_COST_PER_GB_MONTH", 0.023))
+MB = 1024 * 1024
+# Versions above the threshold are copied with parallel upload_part_copy calls,
+# copy_object is limited to 5 GB
+RESTORE_MULTIPART_THRESHOLD = (
+    int(os.environ.get("RESTORE_MULTIPART_THRESHOLD_MB", 256)) * MB
+)
+RESTORE_MULTIPART_PART_SIZE = (
+    int(os.environ.get("RESTORE_MULTIPART_PART_SIZE_MB", 128)) * MB
+)
+RESTORE_MULTIPART_WORKERS = int(os.environ.get("RESTORE_MULTIPART_WORKERS", 8))
+MULTIPART_MAX_PARTS = 10000
+# head_object fields set again on a multipart copy, which does not copy them itself
+MULTIPART_COPIED_HEADERS = (
+    "CacheControl",
+    "ContentDisposition",
+    "ContentEncoding",
+    "ContentLanguage",
+    "ContentType",
+    "Expires",
+    "ServerSideEncryption",
+    "SSEKMSKeyId",
+    "BucketKeyEnabled",
+)
+CHECKPOINT_PREFIX = "_restore_checkpoints"
+MANIFEST_PREFIX = "_restore_manifests"
+RETRYABLE_ERROR_CODES = {
+    "InternalError",
+    "RequestTimeout",
+    "ServiceUnavailable",
+    "SlowDown",
+    "Throttling",
+    "500",
+    "503",
+}
+
+# Initialize the S3 client, with a connection per listing and copy thread (each copy
+# thread can run RESTORE_MULTIPART_WORKERS part copies), instead of botocore's 10
+s3_client = boto3.client(
+    "s3",
+    config=Config(
+        max_pool_connections=RESTORE_LIST_WORKERS
+        + RESTORE_COPY_WORKERS * RESTORE_MULTIPART_WORKERS
+    ),
+)
+
+
+def process_object_versions_page(
+    page: Dict,
+) -> List[Dict[str, Union[str, int, bool, datetime]]]:
+    """
+    Extract the object versions and delete markers of one list_object_versions page.
+
+    Args:
+        page (Dict): A list_object_versions response page.
+
+    Returns:
+        List[Dict[str, Union[str, int, bool, datetime]]]: Object version details, versions first.
+    """
+    versions = [
+        {
+            "Key": version["Key"],
+            "VersionId": version["VersionId"],
+            "IsLatest": version["IsLatest"],
+            "LastModified": version["LastModified"],
+            "Size": version["Size"],
+            "IsDeleteMarker": False,
+        }
+        for version in page.get("Versions", [])
+    ]
+    delete_markers = [
+        {
+            "Key": delete_marker["Key"],
+            "VersionId": delete_marker["VersionId"],
+            "IsLatest": delete_marker["IsLatest"],
+            "LastModified": delete_marker["LastModified"],
+            "IsDeleteMarker": True,
+        }
+        for delete_marker in page.get("DeleteMarkers", [])
+    ]
+
+    return versions + delete_markers
 
 
 def list_object_versions(
@@ -25,48 +127,150 @@ def list_object_versions(
     Returns:
         List[Dict[str, Union[str, int, bool, datetime]]]: A list of dictionaries containing object version details.
     """
+    return list(iter_object_versions(bucket_name, prefix))
 
-    def process_versions(versions: List[Dict]) -> List[Dict]:
-        """Helper to process version entries."""
-        return [
-            {
-                "Key": version["Key"],
-                "VersionId": version["VersionId"],
-                "IsLatest": version["IsLatest"],
-                "LastModified": version["LastModified"],
-                "Size": version["Size"],
-                "IsDeleteMarker": False,
-            }
-            for version in versions
-        ]
 
-    def process_delete_markers(delete_markers: List[Dict]) -> List[Dict]:
-        """Helper to process delete marker entries."""
-        return [
-            {
-                "Key": delete_marker["Key"],
-                "VersionId": delete_marker["VersionId"],
-                "IsLatest": delete_marker["IsLatest"],
-                "LastModified": delete_marker["LastModified"],
-                "IsDeleteMarker": True,
-            }
-            for delete_marker in delete_markers
-        ]
+def iter_object_version_pages(
+    bucket_name: str,
+    prefix: Optional[str] = None,
+    direct_only: bool = False,
+    key_marker: Optional[str] = None,
+    version_id_marker: Optional[str] = None,
+) -> Iterator[Tuple[List[Dict], Optional[str], Optional[str]]]:
+    """
+    Stream the object versions of a prefix, one list_object_versions page at a time.
+
+    Args:
+        bucket_name (str): Name of the S3 bucket.
+        prefix (Optional[str]): Prefix to filter the objects. Defaults to None.
+        direct_only (bool): Only list the objects directly under the prefix.
+        key_marker, version_id_marker (Optional[str]): Start after these markers.
+
+    Yields:
+        Tuple[List[Dict], Optional[str], Optional[str]]: The object versions of a page and the
+        markers to list the next page from (None after the last page).
+    """
+    paginate_kwargs = {"Bucket": bucket_name, "PaginationConfig": {"PageSize": 1000}}
+    if prefix is not None:
+        paginate_kwargs["Prefix"] = prefix
+    if direct_only:
+        paginate_kwargs["Delimiter"] = "/"
+    if key_marker:
+        paginate_kwargs["KeyMarker"] = key_marker
+        paginate_kwargs["VersionIdMarker"] = version_id_marker
 
-    versions = []
     paginator = s3_client.get_paginator("list_object_versions")
-    pagination_config = {"PageSize": 1000}
-    pages = paginator.paginate(
-        Bucket=bucket_name, Prefix=prefix, PaginationConfig=pagination_config
+    for page in paginator.paginate(**paginate_kwargs):
+        if page.get("IsTruncated"):
+            yield (
+                process_object_versions_page(page),
+                page.get("NextKeyMarker"),
+                page.get("NextVersionIdMarker"),
+            )
+        else:
+            yield process_object_versions_page(page), None, None
+
+
+def iter_object_versions(
+    bucket_name: str, prefix: Optional[str] = None
+) -> Iterator[Dict[str, Union[str, int, bool, datetime]]]:
+    """
+    Stream all object versions in an S3 bucket for a given prefix, page by page.
+    """
+    for object_versions, _, _ in iter_object_version_pages(bucket_name, prefix):
+        yield from object_versions
+
+
+def partition_date(shard_prefix: str) -> Optional[date]:
+    """
+    Parse the date of a date=YYYY-MM-DD (or date=YYYYMMDD) partition prefix.
+
+    Returns:
+        Optional[date]: The partition date, None if the prefix is not a date partition.
+    """
+    partition = shard_prefix.rstrip("/").rsplit("/", 1)[-1]
+    if not partition.startswith("date="):
+        return None
+
+    value = partition[len("date=") :]
+    for date_format in ("%Y-%m-%d", "%Y%m%d"):
+        try:
+            return datetime.strptime(value, date_format).date()
+        except ValueError:
+            continue
+    return None
+
+
+def partition_in_window(
+    shard_prefix: str,
+    start_date: datetime,
+    end_date: datetime,
+    lookback_days: Optional[int] = None,
+) -> bool:
+    """
+    Whether a shard can hold versions last modified in [start_date, end_date].
+
+    A date partition is only written from its date onwards, so partitions after
+    end_date are skipped. Partitions before start_date are skipped too, except for
+    the lookback_days before it, whose files can still be rewritten in the window
+    (late events, compaction).
+
+    Args:
+        lookback_days (Optional[int]): Defaults to RESTORE_PARTITION_LOOKBACK_DAYS.
+    """
+    if lookback_days is None:
+        lookback_days = RESTORE_PARTITION_LOOKBACK_DAYS
+
+    shard_date = partition_date(shard_prefix)
+    if shard_date is None:
+        return True
+
+    return (
+        start_date.date() - timedelta(days=lookback_days)
+        <= shard_date
+        <= end_date.date()
     )
 
-    for page in pages:
-        if "Versions" in page:
-            versions.extend(process_versions(page["Versions"]))
-        if "DeleteMarkers" in page:
-            versions.extend(process_delete_markers(page["DeleteMarkers"]))
 
-    return versions
+def list_version_shards(
+    bucket_name: str,
+    prefix: str,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    lookback_days: Optional[int] = None,
+) -> List[Tuple[str, bool]]:
+    """
+    Split the version listing of a prefix into shards that can be listed in parallel:
+    one shard per sub-prefix (ex. the date= partitions of a table), plus the objects
+    directly under the prefix. Delete markers are included, so partitions whose
+    objects were all deleted are still found. Given a date window, date partitions
+    outside of it are left out (see partition_in_window).
+
+    Args:
+        bucket_name (str): Name of the S3 bucket.
+        prefix (str): Prefix of the table, ending with "/".
+
+    Returns:
+        List[Tuple[str, bool]]: (shard prefix, whether only the objects directly under it are listed).
+    """
+    sub_prefixes = set()
+    paginator = s3_client.get_paginator("list_object_versions")
+    for page in paginator.paginate(Bucket=bucket_name, Prefix=prefix, Delimiter="/"):
+        for common_prefix in page.get("CommonPrefixes", []):
+            sub_prefixes.add(common_prefix["Prefix"])
+
+    shards = sorted(sub_prefixes)
+    if start_date is not None and end_date is not None:
+        shards = [
+            shard
+            for shard in shards
+            if partition_in_window(shard, start_date, end_date, lookback_days)
+        ]
+        logger.info(
+            f"Skipping {len(sub_prefixes) - len(shards)} of {len(sub_prefixes)} partitions outside {start_date} - {end_date}."
+        )
+
+    return [(prefix, True)] + [(shard, False) for shard in shards]
 
 
 def convert_to_utc_components(date_string: str) -> Tuple[int, int, int, int, int, int]:
@@ -109,22 +313,169 @@ def filter_object_versions_by_date(
     Returns:
         List[Dict]: A list of filtered object versions.
     """
+    return list(iter_object_versions_by_date(object_versions, start_date, end_date))
+
+
+def iter_object_versions_by_date(
+    object_versions: Iterable[Dict[str, Union[str, bool, datetime]]],
+    start_date: datetime,
+    end_date: datetime,
+) -> Iterator[Dict]:
+    """
+    Stream the object versions within a specified date range, excluding delete markers.
+    """
+    for obj in object_versions:
+        if (
+            not obj.get("IsDeleteMarker", False)
+            and start_date <= obj["LastModified"].replace(tzinfo=None) <= end_date
+        ):
+            yield obj
+
+
+def restorable_versions(
+    object_versions: Iterable[Dict], start_date: datetime, end_date: datetime
+) -> List[Dict]:
+    """
+    Select the versions of a page to restore: last modified in [start_date, end_date],
+    neither delete markers nor latest versions (live objects, copy_object_with_new_key
+    skips them).
+    """
     return [
         obj
-        for obj in object_versions
-        if not obj.get("IsDeleteMarker", False)
-        and start_date <= obj["LastModified"].replace(tzinfo=None) <= end_date
+        for obj in iter_object_versions_by_date(object_versions, start_date, end_date)
+        if not obj["IsLatest"]
     ]
 
 
-def copy_object_with_new_key(bucket_name: str, obj: Dict, prefix: str) -> None:
+def retry_transient(
+    func: Callable[[], object], description: str, max_attempts: Optional[int] = None
+) -> object:
+    """
+    Call func, retrying throttling and transient S3 errors with exponential backoff
+    and jitter.
+
+    Args:
+        description (str): What func does, for the retry logs.
+        max_attempts (Optional[int]): Defaults to RESTORE_MAX_ATTEMPTS.
+    """
+    max_attempts = max_attempts or RESTORE_MAX_ATTEMPTS
+    for attempt in range(1, max_attempts + 1):
+        try:
+            return func()
+        except ClientError as e:
+            code = e.response["Error"]["Code"]
+            if attempt == max_attempts or code not in RETRYABLE_ERROR_CODES:
+                raise
+            delay = min(0.2 * 2**attempt, 20) * random.uniform(0.5, 1)
+            logger.warning(f"Retrying {description} in {delay:.1f}s after {code}.")
+            time.sleep(delay)
+
+
+def multipart_part_ranges(size: int, part_size: Optional[int] = None) -> List[str]:
+    """
+    Split an object into the byte ranges of its upload_part_copy parts, part_size
+    (defaults to RESTORE_MULTIPART_PART_SIZE) or larger to stay within 10000 parts.
+
+    Returns:
+        List[str]: CopySourceRange values, ex. bytes=0-134217727.
+    """
+    part_size = max(
+        part_size or RESTORE_MULTIPART_PART_SIZE, -(-size // MULTIPART_MAX_PARTS)
+    )
+    return [
+        f"bytes={start}-{min(start + part_size, size) - 1}"
+        for start in range(0, size, part_size)
+    ]
+
+
+def multipart_copy(
+    bucket_name: str, key: str, version_id: str, new_key: str, size: int
+) -> int:
+    """
+    Copy an object version with parallel upload_part_copy calls,
+    RESTORE_MULTIPART_WORKERS parts at a time, the head of the version and each part
+    retried on transient errors, as are the create, complete and abort of the upload.
+    The user metadata, content headers and server side encryption of the version are
+    kept, as copy_object does. The upload is aborted if a part fails.
+
+    Returns:
+        int: Number of parts copied.
+    """
+    head = retry_transient(
+        lambda: s3_client.head_object(
+            Bucket=bucket_name, Key=key, VersionId=version_id
+        ),
+        f"head of {key} (version {version_id})",
+    )
+    create_kwargs = {
+        "Bucket": bucket_name,
+        "Key": new_key,
+        "Metadata": head["Metadata"],
+    }
+    for header in MULTIPART_COPIED_HEADERS:
+        if head.get(header):
+            create_kwargs[header] = head[header]
+    upload_id = retry_transient(
+        lambda: s3_client.create_multipart_upload(**create_kwargs),
+        f"create of multipart upload {new_key}",
+    )["UploadId"]
+
+    def copy_part(part: Tuple[int, str]) -> Dict:
+        part_number, byte_range = part
+        response = retry_transient(
+            lambda: s3_client.upload_part_copy(
+                Bucket=bucket_name,
+                Key=new_key,
+                UploadId=upload_id,
+                PartNumber=part_number,
+                CopySource={"Bucket": bucket_name, "Key": key, "VersionId": version_id},
+                CopySourceRange=byte_range,
+            ),
+            f"part {part_number} of {key} (version {version_id})",
+        )
+        return {"PartNumber": part_number, "ETag": response["CopyPartResult"]["ETag"]}
+
+    try:
+        with ThreadPoolExecutor(max_workers=RESTORE_MULTIPART_WORKERS) as executor:
+            parts = list(
+                executor.map(copy_part, enumerate(multipart_part_ranges(size), 1))
+            )
+        retry_transient(
+            lambda: s3_client.complete_multipart_upload(
+                Bucket=bucket_name,
+                Key=new_key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
+            ),
+            f"complete of multipart upload {new_key}",
+        )
+    except Exception:
+        retry_transient(
+            lambda: s3_client.abort_multipart_upload(
+                Bucket=bucket_name, Key=new_key, UploadId=upload_id
+            ),
+            f"abort of multipart upload {new_key}",
+        )
+        raise
+
+    return len(parts)
+
+
+def copy_object_with_new_key(
+    bucket_name: str, obj: Dict, prefix: str
+) -> Optional[Dict[str, Union[str, int, float]]]:
     """
-    Copy an S3 object to a new key with a modified name.
+    Copy an S3 object to a new key with a modified name. Versions larger than
+    RESTORE_MULTIPART_THRESHOLD are copied with multipart_copy.
 
     Args:
         bucket_name (str): Name of the S3 bucket.
         obj (Dict): Object details including Key, VersionId, IsLatest, and IsDeleteMarker.
         prefix (str): Target path prefix for the object.
+
+    Returns:
+        Optional[Dict[str, Union[str, int, float]]]: The copy throughput (key, bytes,
+        parts, seconds, mb_per_second), None if the version was not copied.
     """
     # Skip delete markers
     if obj.get("IsDeleteMarker", False):
@@ -148,55 +499,516 @@ def copy_object_with_new_key(bucket_name: str, obj: Dict, prefix: str) -> None:
         base_key = key[: -(len(file_extension) + 1)]
         new_key = f"{base_key}_restored_{version_id}.{file_extension}"
 
+    size = obj.get("Size", 0)
+    started = time.perf_counter()
     try:
-        s3_client.copy_object(
-            Bucket=bucket_name,
-            CopySource={"Bucket": bucket_name, "Key": key, "VersionId": version_id},
-            Key=new_key,
-        )
+        if size > RESTORE_MULTIPART_THRESHOLD:
+            parts = multipart_copy(bucket_name, key, version_id, new_key, size)
+        else:
+            s3_client.copy_object(
+                Bucket=bucket_name,
+                CopySource={"Bucket": bucket_name, "Key": key, "VersionId": version_id},
+                Key=new_key,
+            )
+            parts = 1
+        seconds = time.perf_counter() - started
+        throughput = {
+            "key": new_key,
+            "bytes": size,
+            "parts": parts,
+            "seconds": round(seconds, 3),
+            "mb_per_second": round(size / MB / max(seconds, 1e-6), 2),
+        }
         logger.info(
-            f"Copied object {key} (version {version_id}) to {new_key} in bucket {bucket_name}/{prefix}."
+            f"Copied object {key} (version {version_id}) to {new_key} in bucket {bucket_name}/{prefix}: "
+            f"{size} bytes in {parts} parts, {throughput['seconds']}s, {throughput['mb_per_second']} MB/s."
         )
+        return throughput
     except Exception as e:
         logger.error(f"Failed to copy object {key} (version {version_id}): {str(e)}")
         raise
 
 
-def lambda_handler(event: Dict, context: Optional[object]) -> bool:
+def copy_with_retry(
+    bucket_name: str, obj: Dict, prefix: str, max_attempts: Optional[int] = None
+) -> Optional[Dict[str, Union[str, int, float]]]:
     """
-    AWS Lambda function entry point.
+    Copy an object version with copy_object_with_new_key, retrying throttling and
+    transient S3 errors with exponential backoff and jitter. Multipart copies are
+    not retried as a whole, multipart_copy retries each of their calls instead of
+    copying all the parts again.
 
     Args:
-        event (Dict): Event data containing S3 bucket name, target path, and date range.
-        context (Optional[object]): Lambda context object.
+        bucket_name (str): Name of the S3 bucket.
+        obj (Dict): Object version details.
+        prefix (str): Target path prefix for the object.
+        max_attempts (Optional[int]): Defaults to RESTORE_MAX_ATTEMPTS.
+    """
+    if obj.get("Size", 0) > RESTORE_MULTIPART_THRESHOLD:
+        return copy_object_with_new_key(bucket_name, obj, prefix)
+    return retry_transient(
+        lambda: copy_object_with_new_key(bucket_name, obj, prefix),
+        f"copy of {obj['Key']} (version {obj['VersionId']})",
+        max_attempts,
+    )
 
-    Returns:
-        bool: True if the operation completes successfully.
 
-    Raises:
-        Exception: Propagates exceptions for AWS Lambda to handle.
+class RestoreCheckpoint:
+    """
+    Progress of a restore, so that it can continue across invocations.
+
+    Stored in s3://<bucket>/_restore_checkpoints/<restore_id>.json with the restore
+    parameters and, per listing shard, the key/version markers after the last page
+    whose versions were all copied (or done once the shard is fully restored).
+    Pages are recorded after their copies, so a resumed restore copies a page at most
+    twice, onto the same restored key.
     """
-    try:
-        bucket_name = event["s3_bucket"]
-        prefix = f"{event['target_path']}/"
 
-        object_versions = list_object_versions(bucket_name, prefix)
+    def __init__(self, bucket_name: str, restore_id: str, params: Dict):
+        self.bucket_name = bucket_name
+        self.key = f"{CHECKPOINT_PREFIX}/{restore_id}.json"
+        self.params = params
+        self.state = {"params": params, "shards": {}, "copied": 0}
+        self.lock = threading.Lock()
+
+    def load(self) -> "RestoreCheckpoint":
+        """
+        Load the progress of an earlier invocation, if any.
+
+        Raises:
+            ValueError: If the checkpoint was saved for other restore parameters.
+        """
+        try:
+            response = s3_client.get_object(Bucket=self.bucket_name, Key=self.key)
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "NoSuchKey":
+                return self
+            raise
+
+        state = json.loads(response["Body"].read())
+        if state["params"] != self.params:
+            raise ValueError(
+                f"Checkpoint {self.key} belongs to a restore with other parameters: {state['params']}"
+            )
+        self.state = state
         logger.info(
-            f"Retrieved {len(object_versions)} object versions from bucket {bucket_name} with prefix {prefix}."
+            f"Resuming restore from {self.key}: {self.state['copied']} versions already copied."
         )
+        return self
+
+    def _save(self) -> None:
+        s3_client.put_object(
+            Bucket=self.bucket_name, Key=self.key, Body=json.dumps(self.state)
+        )
+
+    def shard(self, shard_prefix: str) -> Dict:
+        return self.state["shards"].get(shard_prefix, {})
+
+    def record_page(
+        self,
+        shard_prefix: str,
+        key_marker: Optional[str],
+        version_id_marker: Optional[str],
+        copied: int,
+    ) -> None:
+        with self.lock:
+            if key_marker is None:
+                self.state["shards"][shard_prefix] = {"done": True}
+            else:
+                self.state["shards"][shard_prefix] = {
+                    "key_marker": key_marker,
+                    "version_id_marker": version_id_marker,
+                }
+            self.state["copied"] += copied
+            self._save()
+
+
+def restore_id_params(
+    bucket_name: str, prefix: str, start_date: datetime, end_date: datetime
+) -> Dict:
+    return {
+        "s3_bucket": bucket_name,
+        "prefix": prefix,
+        "start_date": start_date.isoformat(),
+        "end_date": end_date.isoformat(),
+    }
+
+
+def restore_object_versions(
+    bucket_name: str,
+    prefix: str,
+    start_date: datetime,
+    end_date: datetime,
+    checkpoint: Optional[RestoreCheckpoint] = None,
+    out_of_time: Optional[Callable[[], bool]] = None,
+    lookback_days: Optional[int] = None,
+) -> bool:
+    """
+    Restore the non-current object versions of a prefix last modified in [start_date, end_date].
+
+    The listing is sharded (see list_version_shards), date partitions outside the window
+    are not listed at all, and RESTORE_LIST_WORKERS shards are listed concurrently.
+    Pages are streamed and filtered as they come, only the current page of each shard
+    is held in memory. The versions of each listed page are copied through one shared
+    pool of RESTORE_COPY_WORKERS threads, with retries, before the next page is listed,
+    which bounds the pending copies to a page per shard.
+
+    Args:
+        checkpoint (Optional[RestoreCheckpoint]): Records the progress after each page and
+            skips what earlier invocations already restored.
+        out_of_time (Optional[Callable[[], bool]]): Checked after each page, the restore
+            stops (resumable from the checkpoint) once it returns True.
+        lookback_days (Optional[int]): Partitions listed before start_date, see
+            partition_in_window.
+
+    Returns:
+        bool: True if all shards were restored, False if the restore stopped early.
+    """
+    shards = list_version_shards(
+        bucket_name, prefix, start_date, end_date, lookback_days
+    )
+    logger.info(f"Restoring {len(shards)} listing shards of {bucket_name}/{prefix}.")
+    stopped = threading.Event()
+    totals = {"listed": 0, "copied": 0, "bytes": 0}
+    totals_lock = threading.Lock()
+
+    with ThreadPoolExecutor(max_workers=RESTORE_COPY_WORKERS) as copy_executor:
+
+        def restore_shard(shard: Tuple[str, bool]) -> None:
+            shard_prefix, direct_only = shard
+            state = checkpoint.shard(shard_prefix) if checkpoint else {}
+            if state.get("done") or stopped.is_set():
+                return
+
+            pages = iter_object_version_pages(
+                bucket_name,
+                shard_prefix,
+                direct_only,
+                state.get("key_marker"),
+                state.get("version_id_marker"),
+            )
+            for object_versions, key_marker, version_id_marker in pages:
+                restorable = restorable_versions(object_versions, start_date, end_date)
+                copies = copy_executor.map(
+                    lambda obj: copy_with_retry(bucket_name, obj, prefix),
+                    restorable,
+                )
+                copied_bytes = sum(copy["bytes"] for copy in copies if copy)
+                with totals_lock:
+                    totals["listed"] += len(object_versions)
+                    totals["copied"] += len(restorable)
+                    totals["bytes"] += copied_bytes
+
+                if checkpoint:
+                    checkpoint.record_page(
+                        shard_prefix, key_marker, version_id_marker, len(restorable)
+                    )
+                if out_of_time and out_of_time():
+                    stopped.set()
+                if stopped.is_set():
+                    return
+
+        with ThreadPoolExecutor(max_workers=RESTORE_LIST_WORKERS) as list_executor:
+            list(list_executor.map(restore_shard, shards))
+
+    logger.info(
+        f"Retrieved {totals['listed']} object versions from bucket {bucket_name} with prefix {prefix}, "
+        f"restored {totals['copied']} ({totals['bytes']} bytes) between {start_date} and {end_date}."
+    )
+    return not stopped.is_set()
+
+
+def split_s3_path(path: str) -> Tuple[str, str]:
+    """
+    Split an s3://bucket/key path into its bucket and key.
+    """
+    bucket_name, _, key = path[len("s3://") :].partition("/")
+    return bucket_name, key
+
+
+def estimate_cost(objects: int, size_bytes: int) -> Dict[str, float]:
+    """
+    Estimate the cost of restoring versions: the copy requests, and the monthly storage
+    of the restored copies (non-current versions are copied into new current objects).
+    """
+    return {
+        "copy_requests_usd": round(objects / 1000 * RESTORE_COST_PER_1000_COPIES, 4),
+        "storage_per_month_usd": round(
+            size_bytes / 1024**3 * RESTORE_COST_PER_GB_MONTH, 4
+        ),
+    }
+
+
+def plan_restore(
+    bucket_name: str,
+    prefix: str,
+    start_date: datetime,
+    end_date: datetime,
+    manifest_bucket: str,
+    plan_id: str,
+    lookback_days: Optional[int] = None,
+) -> Dict:
+    """
+    Dry run of restore_object_versions: list the versions it would restore, without
+    copying anything, and save them as a manifest that execute_manifest restores later
+    without listing the bucket again.
 
-        start_date = datetime(*convert_to_utc_components(event["start_date"]))
-        end_date = datetime(*convert_to_utc_components(event["end_date"]))
+    The manifest is written to s3://<manifest_bucket>/_restore_manifests/<plan_id>/:
+    - manifest.json: the restore parameters, per partition (listing shard) the number of
+      objects, their bytes and the keys of its part files, the totals and the estimated
+      cost (see estimate_cost);
+    - parts/*.jsonl: the versions to restore (Key, VersionId, Size, LastModified), one per
+      line, at most RESTORE_MANIFEST_PART_SIZE per file.
 
-        filtered_objects = filter_object_versions_by_date(
-            object_versions, start_date, end_date
+    Returns:
+        Dict: The manifest, with its s3 path under "manifest".
+    """
+    shards = list_version_shards(
+        bucket_name, prefix, start_date, end_date, lookback_days
+    )
+    logger.info(
+        f"Planning restore of {len(shards)} listing shards of {bucket_name}/{prefix}."
+    )
+    manifest_prefix = f"{MANIFEST_PREFIX}/{plan_id}"
+
+    def plan_shard(index: int, shard: Tuple[str, bool]) -> Dict:
+        shard_prefix, direct_only = shard
+        partition = {"partition": shard_prefix, "objects": 0, "bytes": 0, "parts": []}
+        listed = 0
+        rows = []
+
+        def write_part() -> None:
+            part = len(partition["parts"])
+            key = f"{manifest_prefix}/parts/{index:05d}-{part:05d}.jsonl"
+            s3_client.put_object(
+                Bucket=manifest_bucket, Key=key, Body="\n".join(rows) + "\n"
+            )
+            partition["parts"].append(key)
+            rows.clear()
+
+        for object_versions, _, _ in iter_object_version_pages(
+            bucket_name, shard_prefix, direct_only
+        ):
+            listed += len(object_versions)
+            for obj in restorable_versions(object_versions, start_date, end_date):
+                partition["objects"] += 1
+                partition["bytes"] += obj["Size"]
+                rows.append(
+                    json.dumps(
+                        {
+                            "Key": obj["Key"],
+                            "VersionId": obj["VersionId"],
+                            "Size": obj["Size"],
+                            "LastModified": obj["LastModified"].isoformat(),
+                        }
+                    )
+                )
+                if len(rows) >= RESTORE_MANIFEST_PART_SIZE:
+                    write_part()
+        if rows:
+            write_part()
+
+        partition["versions_listed"] = listed
+        return partition
+
+    with ThreadPoolExecutor(max_workers=RESTORE_LIST_WORKERS) as list_executor:
+        partitions = list(
+            list_executor.map(lambda args: plan_shard(*args), enumerate(shards))
         )
+
+    versions_listed = sum(partition.pop("versions_listed") for partition in partitions)
+    objects = sum(partition["objects"] for partition in partitions)
+    size_bytes = sum(partition["bytes"] for partition in partitions)
+    manifest = {
+        "plan_id": plan_id,
+        "params": restore_id_params(bucket_name, prefix, start_date, end_date),
+        "created_at": datetime.utcnow().isoformat(),
+        "versions_listed": versions_listed,
+        "objects": objects,
+        "bytes": size_bytes,
+        "estimated_cost": estimate_cost(objects, size_bytes),
+        "partitions": [partition for partition in partitions if partition["objects"]],
+    }
+    s3_client.put_object(
+        Bucket=manifest_bucket,
+        Key=f"{manifest_prefix}/manifest.json",
+        Body=json.dumps(manifest),
+    )
+    manifest["manifest"] = f"s3://{manifest_bucket}/{manifest_prefix}/manifest.json"
+
+    for partition in manifest["partitions"]:
         logger.info(
-            f"Filtered {len(filtered_objects)} object versions between {start_date} and {end_date}."
+            f"Plan {plan_id}: {partition['partition']} {partition['objects']} objects, {partition['bytes']} bytes."
         )
+    logger.info(
+        f"Plan {plan_id}: {objects} of {manifest['versions_listed']} versions to restore in "
+        f"{len(manifest['partitions'])} partitions, {size_bytes} bytes, "
+        f"estimated cost {json.dumps(manifest['estimated_cost'])}, manifest {manifest['manifest']}."
+    )
+    return manifest
+
+
+def read_manifest(manifest_path: str) -> Dict:
+    """
+    Read the manifest.json of a plan from its s3 path.
+    """
+    manifest_bucket, key = split_s3_path(manifest_path)
+    response = s3_client.get_object(Bucket=manifest_bucket, Key=key)
+    return json.loads(response["Body"].read())
 
-        for obj in filtered_objects:
-            copy_object_with_new_key(bucket_name, obj, prefix)
+
+def read_manifest_part(manifest_bucket: str, part_key: str) -> List[Dict]:
+    """
+    Read the versions of a manifest part file, as restorable object versions.
+    """
+    body = s3_client.get_object(Bucket=manifest_bucket, Key=part_key)["Body"].read()
+    return [
+        {**json.loads(line), "IsLatest": False, "IsDeleteMarker": False}
+        for line in body.decode("utf-8").splitlines()
+        if line
+    ]
+
+
+def execute_manifest(
+    manifest_path: str,
+    checkpoint: Optional[RestoreCheckpoint] = None,
+    out_of_time: Optional[Callable[[], bool]] = None,
+) -> bool:
+    """
+    Restore the versions of a plan manifest (see plan_restore) without listing the bucket.
+
+    RESTORE_LIST_WORKERS part files are read concurrently and their versions copied
+    through one shared pool of RESTORE_COPY_WORKERS threads, with retries.
+
+    Args:
+        checkpoint (Optional[RestoreCheckpoint]): Records each restored part file and skips
+            the parts earlier invocations already restored.
+        out_of_time (Optional[Callable[[], bool]]): Checked after each part file.
+
+    Returns:
+        bool: True if all parts were restored, False if the restore stopped early.
+    """
+    manifest = read_manifest(manifest_path)
+    manifest_bucket, _ = split_s3_path(manifest_path)
+    bucket_name = manifest["params"]["s3_bucket"]
+    prefix = manifest["params"]["prefix"]
+    parts = [
+        part for partition in manifest["partitions"] for part in partition["parts"]
+    ]
+    logger.info(
+        f"Executing plan {manifest['plan_id']}: {manifest['objects']} objects in {len(parts)} parts."
+    )
+    stopped = threading.Event()
+    totals = {"copied": 0, "bytes": 0}
+    totals_lock = threading.Lock()
+
+    with ThreadPoolExecutor(max_workers=RESTORE_COPY_WORKERS) as copy_executor:
+
+        def restore_part(part_key: str) -> None:
+            state = checkpoint.shard(part_key) if checkpoint else {}
+            if state.get("done") or stopped.is_set():
+                return
+
+            restorable = read_manifest_part(manifest_bucket, part_key)
+            copies = copy_executor.map(
+                lambda obj: copy_with_retry(bucket_name, obj, prefix), restorable
+            )
+            copied_bytes = sum(copy["bytes"] for copy in copies if copy)
+            with totals_lock:
+                totals["copied"] += len(restorable)
+                totals["bytes"] += copied_bytes
+
+            if checkpoint:
+                checkpoint.record_page(part_key, None, None, len(restorable))
+            if out_of_time and out_of_time():
+                stopped.set()
+
+        with ThreadPoolExecutor(max_workers=RESTORE_LIST_WORKERS) as list_executor:
+            list(list_executor.map(restore_part, parts))
+
+    logger.info(
+        f"Restored {totals['copied']} object versions ({totals['bytes']} bytes) of plan {manifest['plan_id']} "
+        f"in bucket {bucket_name}."
+    )
+    return not stopped.is_set()
+
+
+def lambda_handler(event: Dict, context: Optional[object]) -> Union[bool, Dict]:
+    """
+    AWS Lambda function entry point.
+
+    Args:
+        event (Dict): Event data containing S3 bucket name, target path, and date range.
+        context (Optional[object]): Lambda context object.
+
+    With "dry_run": true, nothing is copied, the versions to restore are saved as a
+    manifest (see plan_restore). With "manifest": "s3://.../manifest.json", the versions
+    of a saved manifest are restored (see execute_manifest).
+
+    Returns:
+        Union[bool, Dict]: True if the operation completes successfully, False if a
+        checkpointed restore (restore_id) stopped before the Lambda timeout and must be
+        invoked again. The manifest summary (without its partitions) for a dry run.
+
+    Raises:
+        Exception: Propagates exceptions for AWS Lambda to handle.
+    """
+    try:
+        if event.get("manifest"):
+            bucket_name, _ = split_s3_path(event["manifest"])
+            params = {"manifest": event["manifest"]}
+        else:
+            bucket_name = event["s3_bucket"]
+            prefix = f"{event['target_path']}/"
+
+            start_date = datetime(*convert_to_utc_components(event["start_date"]))
+            end_date = datetime(*convert_to_utc_components(event["end_date"]))
+            params = restore_id_params(bucket_name, prefix, start_date, end_date)
+
+            if event.get("dry_run"):
+                manifest = plan_restore(
+                    bucket_name,
+                    prefix,
+                    start_date,
+                    end_date,
+                    event.get("manifest_bucket", bucket_name),
+                    event.get("plan_id") or uuid.uuid4().hex,
+                    event.get("partition_lookback_days"),
+                )
+                manifest.pop("partitions")
+                return manifest
+
+        checkpoint = None
+        if event.get("restore_id"):
+            checkpoint = RestoreCheckpoint(
+                event.get("checkpoint_bucket", bucket_name),
+                event["restore_id"],
+                params,
+            ).load()
+
+        out_of_time = None
+        if context is not None and checkpoint is not None:
+            out_of_time = (
+                lambda: context.get_remaining_time_in_millis() < RESTORE_TIME_MARGIN_MS
+            )
+
+        if event.get("manifest"):
+            completed = execute_manifest(event["manifest"], checkpoint, out_of_time)
+        else:
+            completed = restore_object_versions(
+                bucket_name,
+                prefix,
+                start_date,
+                end_date,
+                checkpoint,
+                out_of_time,
+                event.get("partition_lookback_days"),
+            )
+        if not completed:
+            logger.info(
+                f"Stopped before the Lambda timeout, invoke again with restore_id {event['restore_id']} to continue."
+            )
+            return False
 
         logger.info("Successfully processed all objects.")
         return True
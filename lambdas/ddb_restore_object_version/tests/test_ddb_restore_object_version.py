@@ -1,16 +1,26 @@
 import sys
 import os
+import json
 import unittest
 import boto3
-from unittest.mock import MagicMock, patch
-from datetime import datetime
+from botocore.exceptions import ClientError
+from moto import mock_aws
+from unittest.mock import DEFAULT, MagicMock, patch
+from datetime import date, datetime
 
 
 sys.path.append(os.path.abspath("../"))
 from lambda_function import (
     list_object_versions,
+    list_version_shards,
+    iter_object_versions,
+    iter_object_versions_by_date,
+    partition_date,
+    partition_in_window,
     convert_to_utc_components,
     copy_object_with_new_key,
+    copy_with_retry,
+    multipart_part_ranges,
     lambda_handler,
 )
 
@@ -182,6 +192,341 @@ class TestRestoreObjectVersions(unittest.TestCase):
         self.assertTrue(result)
         mock_logger.info.assert_any_call("Successfully processed all objects.")
 
+    def test_s3_client_pool_fits_the_copy_threads(self):
+        import lambda_function
+
+        self.assertEqual(
+            lambda_function.s3_client.meta.config.max_pool_connections,
+            lambda_function.RESTORE_LIST_WORKERS
+            + lambda_function.RESTORE_COPY_WORKERS
+            * lambda_function.RESTORE_MULTIPART_WORKERS,
+        )
+
+    def test_partition_date(self):
+        self.assertEqual(partition_date("t/date=2025-01-31/"), date(2025, 1, 31))
+        self.assertEqual(partition_date("t/date=20250131/"), date(2025, 1, 31))
+        self.assertIsNone(partition_date("t/year=2025/"))
+        self.assertIsNone(partition_date("t/date=unknown/"))
+
+    def test_partition_in_window(self):
+        start, end = datetime(2025, 1, 10, 12), datetime(2025, 1, 20, 12)
+
+        self.assertTrue(partition_in_window("t/date=2025-01-10/", start, end, 0))
+        self.assertTrue(partition_in_window("t/date=2025-01-20/", start, end, 0))
+        self.assertFalse(partition_in_window("t/date=2025-01-21/", start, end, 0))
+        self.assertFalse(partition_in_window("t/date=2025-01-09/", start, end, 0))
+        self.assertTrue(partition_in_window("t/date=2025-01-09/", start, end, 1))
+        self.assertTrue(partition_in_window("t/other/", start, end, 0))
+
+    @patch("lambda_function.s3_client")
+    def test_iter_object_versions_streams_pages(self, mock_s3_client):
+        """Versions are yielded as pages arrive, later pages are not requested."""
+
+        def pages():
+            yield {
+                "Versions": [
+                    {
+                        "Key": f"file{i}",
+                        "VersionId": "v",
+                        "IsLatest": False,
+                        "LastModified": datetime(2024, 11, i + 1),
+                        "Size": 1,
+                    }
+                    for i in range(3)
+                ]
+            }
+            raise AssertionError("second page requested")
+
+        mock_s3_client.get_paginator.return_value.paginate.return_value = pages()
+        in_window = iter_object_versions_by_date(
+            iter_object_versions("test-bucket", "test-prefix"),
+            datetime(2024, 11, 2),
+            datetime(2024, 11, 30),
+        )
+
+        self.assertEqual(next(in_window)["Key"], "file1")
+        self.assertEqual(next(in_window)["Key"], "file2")
+
+
+class TestRestoreEngine(unittest.TestCase):
+    """Restore engine against a versioned moto bucket."""
+
+    bucket = "test-raw-bucket"
+    event = {
+        "s3_bucket": "test-raw-bucket",
+        "target_path": "table",
+        "start_date": "January 1, 2000, 00:00:00 (UTC+00:00)",
+        "end_date": "January 1, 2100, 00:00:00 (UTC+00:00)",
+    }
+
+    def setUp(self):
+        env = patch.dict(
+            os.environ,
+            {
+                "AWS_DEFAULT_REGION": "eu-west-2",
+                "AWS_ACCESS_KEY_ID": "testing",
+                "AWS_SECRET_ACCESS_KEY": "testing",
+            },
+        )
+        env.start()
+        self.addCleanup(env.stop)
+        mock = mock_aws()
+        mock.start()
+        self.addCleanup(mock.stop)
+
+        self.s3 = boto3.client("s3")
+        client_patch = patch("lambda_function.s3_client", self.s3)
+        client_patch.start()
+        self.addCleanup(client_patch.stop)
+
+        self.s3.create_bucket(
+            Bucket=self.bucket,
+            CreateBucketConfiguration={"LocationConstraint": "eu-west-2"},
+        )
+        self.s3.put_bucket_versioning(
+            Bucket=self.bucket, VersioningConfiguration={"Status": "Enabled"}
+        )
+        # Two versions per file, then the files of 2025-01-02 are deleted
+        for day in ("2025-01-01", "2025-01-02"):
+            for part in range(3):
+                key = f"table/date={day}/part-{part}.snappy.parquet"
+                self.s3.put_object(Bucket=self.bucket, Key=key, Body=b"old")
+                self.s3.put_object(Bucket=self.bucket, Key=key, Body=b"new")
+        for part in range(3):
+            self.s3.delete_object(
+                Bucket=self.bucket, Key=f"table/date=2025-01-02/part-{part}.snappy.parquet"
+            )
+        self.s3.put_object(Bucket=self.bucket, Key="table/_SUCCESS", Body=b"")
+
+    def restored_keys(self):
+        response = self.s3.list_objects_v2(Bucket=self.bucket, Prefix="table/")
+        return sorted(
+            obj["Key"] for obj in response.get("Contents", []) if "_restored_" in obj["Key"]
+        )
+
+    def test_list_version_shards_skips_partitions_outside_window(self):
+        shards = list_version_shards(
+            self.bucket,
+            "table/",
+            datetime(2025, 1, 2, 0, 0, 0),
+            datetime(2025, 1, 2, 23, 59, 59),
+            lookback_days=0,
+        )
+
+        self.assertEqual(shards, [("table/", True), ("table/date=2025-01-02/", False)])
+
+    def test_list_version_shards_includes_deleted_partitions(self):
+        shards = list_version_shards(self.bucket, "table/")
+
+        self.assertEqual(
+            shards,
+            [
+                ("table/", True),
+                ("table/date=2025-01-01/", False),
+                ("table/date=2025-01-02/", False),
+            ],
+        )
+
+    def test_lambda_handler_restores_all_shards(self):
+        self.assertTrue(lambda_handler(dict(self.event), None))
+
+        # 3 older versions of 2025-01-01, 6 versions of the deleted 2025-01-02 files
+        self.assertEqual(len(self.restored_keys()), 9)
+
+    def test_lambda_handler_resumes_from_checkpoint(self):
+        event = dict(self.event, restore_id="restore-1")
+        context = MagicMock()
+        context.get_remaining_time_in_millis.return_value = 0
+
+        with patch("lambda_function.RESTORE_LIST_WORKERS", 1):
+            self.assertFalse(lambda_handler(event, context))
+        first_run = self.restored_keys()
+        self.assertLess(len(first_run), 9)
+
+        checkpoint = json.loads(
+            self.s3.get_object(
+                Bucket=self.bucket, Key="_restore_checkpoints/restore-1.json"
+            )["Body"].read()
+        )
+        self.assertEqual(checkpoint["copied"], len(first_run))
+
+        context.get_remaining_time_in_millis.return_value = 900000
+        with patch("lambda_function.copy_object_with_new_key") as copy:
+            copy.side_effect = copy_object_with_new_key
+            self.assertTrue(lambda_handler(event, context))
+        self.assertEqual(len(self.restored_keys()), 9)
+        self.assertEqual(copy.call_count, 9 - len(first_run))
+
+    def test_checkpoint_of_other_parameters_is_rejected(self):
+        lambda_handler(dict(self.event, restore_id="restore-2"), None)
+
+        with self.assertRaises(ValueError):
+            lambda_handler(
+                dict(self.event, restore_id="restore-2", target_path="other"), None
+            )
+
+    def test_dry_run_writes_manifest_without_copying(self):
+        with patch("lambda_function.RESTORE_MANIFEST_PART_SIZE", 2):
+            summary = lambda_handler(
+                dict(self.event, dry_run=True, plan_id="plan-1"), None
+            )
+
+        self.assertEqual(self.restored_keys(), [])
+        self.assertEqual(summary["objects"], 9)
+        self.assertEqual(summary["bytes"], 9 * 3)
+        self.assertEqual(
+            summary["manifest"],
+            f"s3://{self.bucket}/_restore_manifests/plan-1/manifest.json",
+        )
+        manifest = json.loads(
+            self.s3.get_object(
+                Bucket=self.bucket, Key="_restore_manifests/plan-1/manifest.json"
+            )["Body"].read()
+        )
+        partitions = {
+            partition["partition"]: partition for partition in manifest["partitions"]
+        }
+        self.assertEqual(partitions["table/date=2025-01-01/"]["objects"], 3)
+        self.assertEqual(len(partitions["table/date=2025-01-01/"]["parts"]), 2)
+        self.assertEqual(partitions["table/date=2025-01-02/"]["objects"], 6)
+        self.assertNotIn("table/", partitions)
+
+    def test_execute_manifest_restores_without_listing(self):
+        summary = lambda_handler(dict(self.event, dry_run=True), None)
+
+        with patch("lambda_function.iter_object_version_pages") as list_pages:
+            self.assertTrue(
+                lambda_handler(
+                    {"manifest": summary["manifest"], "restore_id": "restore-3"}, None
+                )
+            )
+        list_pages.assert_not_called()
+        self.assertEqual(len(self.restored_keys()), 9)
+
+    def test_multipart_part_ranges(self):
+        self.assertEqual(
+            multipart_part_ranges(25, 10), ["bytes=0-9", "bytes=10-19", "bytes=20-24"]
+        )
+        self.assertEqual(multipart_part_ranges(20, 10), ["bytes=0-9", "bytes=10-19"])
+        # Parts are enlarged to stay within 10000 parts
+        self.assertEqual(len(multipart_part_ranges(100000, 1)), 10000)
+
+    def test_large_versions_are_copied_in_parts(self):
+        key = "table/date=2025-01-03/large.snappy.parquet"
+        body = os.urandom(11 * 1024 * 1024)
+        old = self.s3.put_object(
+            Bucket=self.bucket,
+            Key=key,
+            Body=body,
+            ContentType="application/octet-stream",
+            ContentEncoding="gzip",
+            CacheControl="max-age=60",
+            ServerSideEncryption="AES256",
+            Metadata={"source": "export"},
+        )
+        self.s3.put_object(Bucket=self.bucket, Key=key, Body=b"new")
+        obj = {
+            "Key": key,
+            "VersionId": old["VersionId"],
+            "IsLatest": False,
+            "Size": len(body),
+        }
+
+        head_object = self.s3.head_object
+        throttled = ClientError({"Error": {"Code": "SlowDown"}}, "HeadObject")
+        with patch("lambda_function.RESTORE_MULTIPART_THRESHOLD", 1), patch(
+            "lambda_function.RESTORE_MULTIPART_PART_SIZE", 5 * 1024 * 1024
+        ), patch("lambda_function.time.sleep"), patch.object(
+            self.s3,
+            "head_object",
+            side_effect=[
+                throttled,
+                head_object(Bucket=self.bucket, Key=key, VersionId=old["VersionId"]),
+            ],
+        ) as mock_head_object:
+            throughput = copy_with_retry(self.bucket, obj, "table/")
+
+        restored_key = (
+            f"table/date=2025-01-03/large_restored_{old['VersionId']}.snappy.parquet"
+        )
+        self.assertEqual(throughput["key"], restored_key)
+        self.assertEqual(throughput["parts"], 3)
+        self.assertEqual(throughput["bytes"], len(body))
+        restored = self.s3.get_object(Bucket=self.bucket, Key=restored_key)
+        self.assertEqual(restored["Body"].read(), body)
+        self.assertEqual(restored["Metadata"], {"source": "export"})
+        self.assertEqual(restored["ContentType"], "application/octet-stream")
+        self.assertEqual(restored["ContentEncoding"], "gzip")
+        self.assertEqual(restored["CacheControl"], "max-age=60")
+        self.assertEqual(restored["ServerSideEncryption"], "AES256")
+        self.assertEqual(mock_head_object.call_count, 2)
+
+    def test_throttled_multipart_complete_is_retried(self):
+        key = "table/date=2025-01-03/large.snappy.parquet"
+        body = os.urandom(6 * 1024 * 1024)
+        old = self.s3.put_object(Bucket=self.bucket, Key=key, Body=body)
+        self.s3.put_object(Bucket=self.bucket, Key=key, Body=b"new")
+        obj = {
+            "Key": key,
+            "VersionId": old["VersionId"],
+            "IsLatest": False,
+            "Size": len(body),
+        }
+
+        throttled = ClientError(
+            {"Error": {"Code": "SlowDown"}}, "CompleteMultipartUpload"
+        )
+        with patch("lambda_function.RESTORE_MULTIPART_THRESHOLD", 1), patch(
+            "lambda_function.RESTORE_MULTIPART_PART_SIZE", 5 * 1024 * 1024
+        ), patch("lambda_function.time.sleep"), patch.object(
+            self.s3,
+            "complete_multipart_upload",
+            side_effect=[throttled, DEFAULT],
+            wraps=self.s3.complete_multipart_upload,
+        ) as mock_complete, patch.object(
+            self.s3, "abort_multipart_upload"
+        ) as mock_abort:
+            throughput = copy_with_retry(self.bucket, obj, "table/")
+
+        self.assertEqual(throughput["parts"], 2)
+        restored = self.s3.get_object(Bucket=self.bucket, Key=throughput["key"])
+        self.assertEqual(restored["Body"].read(), body)
+        self.assertEqual(mock_complete.call_count, 2)
+        mock_abort.assert_not_called()
+
+    @patch("lambda_function.time.sleep")
+    @patch("lambda_function.copy_object_with_new_key")
+    def test_multipart_copies_are_not_retried_whole(self, mock_copy, mock_sleep):
+        mock_copy.side_effect = ClientError(
+            {"Error": {"Code": "SlowDown"}}, "UploadPartCopy"
+        )
+        obj = {"Key": "k", "VersionId": "v", "Size": 2}
+
+        with patch("lambda_function.RESTORE_MULTIPART_THRESHOLD", 1):
+            with self.assertRaises(ClientError):
+                copy_with_retry(self.bucket, obj, "table/")
+
+        self.assertEqual(mock_copy.call_count, 1)
+        mock_sleep.assert_not_called()
+
+    @patch("lambda_function.time.sleep")
+    @patch("lambda_function.copy_object_with_new_key")
+    def test_copy_with_retry(self, mock_copy, mock_sleep):
+        throttled = ClientError({"Error": {"Code": "SlowDown"}}, "CopyObject")
+        denied = ClientError({"Error": {"Code": "AccessDenied"}}, "CopyObject")
+        obj = {"Key": "k", "VersionId": "v"}
+
+        mock_copy.side_effect = [throttled, throttled, None]
+        copy_with_retry(self.bucket, obj, "table/")
+        self.assertEqual(mock_copy.call_count, 3)
+        self.assertEqual(mock_sleep.call_count, 2)
+
+        mock_copy.reset_mock(side_effect=True)
+        mock_copy.side_effect = denied
+        with self.assertRaises(ClientError):
+            copy_with_retry(self.bucket, obj, "table/")
+        self.assertEqual(mock_copy.call_count, 1)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,387 @@
+"""
+Buffered writes of stream batches to datalake_raw.
+
+Instead of one small Parquet file per invocation, each batch is staged as a single
+Parquet object under s3://<S3_RAW>/_staging/<athena_table>/batches/, keyed on its
+Kinesis shard and first/last sequence numbers so that a retried batch overwrites its
+own staged object. Once the staged batches of a table reach BUFFER_FLUSH_SIZE_BYTES,
+or the oldest one is BUFFER_FLUSH_AGE_SECONDS old, they are merged and written to the
+table with write_processed_to_s3, as one file per date partition. A flush reads at
+most BUFFER_FLUSH_MAX_BYTES of staged Parquet (oldest batches first), which bounds
+its memory; the rest is left for the next flush.
+
+Flushes are idempotent:
+1. the flusher takes the table lock by creating _staging/<athena_table>/_flush.json
+   (conditional put), then lists the staged batches and records the keys the flush
+   covers in the lock, with its flush id;
+2. output files are prefixed with the flush id, and files left over by an earlier
+   attempt of the same flush are deleted before writing;
+3. the manifest is marked as written, then the staged keys and the lock are deleted.
+A lock older than BUFFER_LOCK_TIMEOUT_SECONDS belongs to a crashed flush: it is taken
+over (conditional on its ETag) and the flush is resumed from its manifest, skipping
+staged keys that no longer exist.
+
+Staging is what makes a record durable: once a batch is staged, a failed flush is
+logged and left to the next flush instead of failing the invocation.
+"""
+import json
+import os
+import uuid
+from datetime import datetime
+from datetime import timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+import awswrangler as wr
+import boto3
+import pandas as pd
+from botocore.exceptions import ClientError
+
+from utils import log_event, log_function, write_processed_to_s3
+
+STAGING_PREFIX = "_staging"
+FLUSH_SIZE_BYTES = int(os.environ.get("BUFFER_FLUSH_SIZE_BYTES", 32 * 1024 * 1024))
+# Compressed Parquet, a flush holds several times this size in memory
+FLUSH_MAX_BYTES = int(os.environ.get("BUFFER_FLUSH_MAX_BYTES", 64 * 1024 * 1024))
+FLUSH_AGE_SECONDS = int(os.environ.get("BUFFER_FLUSH_AGE_SECONDS", 15 * 60))
+LOCK_TIMEOUT_SECONDS = int(os.environ.get("BUFFER_LOCK_TIMEOUT_SECONDS", 15 * 60))
+
+_s3_client = None
+
+
+def _s3():
+    global _s3_client
+    if _s3_client is None:
+        _s3_client = boto3.client("s3")
+    return _s3_client
+
+
+def _is_precondition_failure(error: ClientError) -> bool:
+    return error.response["Error"]["Code"] in (
+        "PreconditionFailed",
+        "ConditionalRequestConflict",
+    )
+
+
+def _batches_prefix(athena_table: str) -> str:
+    return f"{STAGING_PREFIX}/{athena_table}/batches/"
+
+
+def _lock_key(athena_table: str) -> str:
+    return f"{STAGING_PREFIX}/{athena_table}/_flush.json"
+
+
+def _delete_keys(s3_bucket: str, keys: List[str]) -> None:
+    for start in range(0, len(keys), 1000):
+        _s3().delete_objects(
+            Bucket=s3_bucket,
+            Delete={"Objects": [{"Key": key} for key in keys[start : start + 1000]]},
+        )
+
+
+def batch_id(records: List[Dict[str, Any]]) -> Optional[str]:
+    """
+    Identifies a Kinesis batch by its shard and first and last sequence numbers, the
+    same for every delivery of the batch.
+    :return: <shard id>-<first sequence number>-<last sequence number>, None if the
+             records carry no sequence numbers
+    """
+    try:
+        shard_id = records[0]["eventID"].split(":", 1)[0]
+        first = records[0]["kinesis"]["sequenceNumber"]
+        last = records[-1]["kinesis"]["sequenceNumber"]
+    except (IndexError, KeyError):
+        return None
+
+    return f"{shard_id}-{first}-{last}"
+
+
+@log_function
+def stage_batch(
+    df: pd.DataFrame,
+    athena_table: str,
+    s3_bucket: str,
+    staged_batch_id: Optional[str] = None,
+) -> str:
+    """
+    Writes a processed batch to the staging area of its Athena table.
+    :param staged_batch_id: See batch_id, a retried batch is staged under the same key.
+                            A unique key is used when it is None.
+    :return: The staged object key
+    """
+    if staged_batch_id is None:
+        now = datetime.now(timezone.utc)
+        staged_batch_id = f"{now.strftime('%Y%m%dT%H%M%S%f')}-{uuid.uuid4().hex}"
+    key = f"{_batches_prefix(athena_table)}{staged_batch_id}.snappy.parquet"
+    wr.s3.to_parquet(
+        df=df, path=f"s3://{s3_bucket}/{key}", index=False, compression="snappy"
+    )
+
+    return key
+
+
+def list_staged_batches(athena_table: str, s3_bucket: str) -> List[Dict[str, Any]]:
+    """
+    Lists the staged batches of an Athena table (Key, Size, LastModified).
+    """
+    batches = []
+    paginator = _s3().get_paginator("list_objects_v2")
+    for page in paginator.paginate(
+        Bucket=s3_bucket, Prefix=_batches_prefix(athena_table)
+    ):
+        batches.extend(page.get("Contents", []))
+
+    return batches
+
+
+def flush_due(batches: List[Dict[str, Any]], now: Optional[datetime] = None) -> bool:
+    """
+    Whether the staged batches are big or old enough to be flushed.
+    """
+    if not batches:
+        return False
+
+    now = now or datetime.now(timezone.utc)
+    staged_bytes = sum(batch["Size"] for batch in batches)
+    oldest = min(batch["LastModified"] for batch in batches)
+
+    return (
+        staged_bytes >= FLUSH_SIZE_BYTES
+        or (now - oldest).total_seconds() >= FLUSH_AGE_SECONDS
+    )
+
+
+def select_flush_batches(batches: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Selects the oldest staged batches up to FLUSH_MAX_BYTES, at least one.
+    """
+    selected = []
+    selected_bytes = 0
+    oldest_first = sorted(
+        batches, key=lambda batch: (batch["LastModified"], batch["Key"])
+    )
+    for batch in oldest_first:
+        if selected and selected_bytes + batch["Size"] > FLUSH_MAX_BYTES:
+            break
+        selected.append(batch)
+        selected_bytes += batch["Size"]
+
+    return selected
+
+
+def _acquire_flush_lock(
+    athena_table: str, s3_bucket: str
+) -> Optional[Tuple[dict, str]]:
+    """
+    Takes the flush lock of a table, or takes over a stale one. A new lock records
+    the batches staged once it is held, so none of them can belong to another flush.
+    :return: The manifest to flush and the lock ETag, None if another flush is running
+             or nothing is staged
+    """
+    lock_key = _lock_key(athena_table)
+    manifest = {"flush_id": uuid.uuid4().hex, "keys": [], "status": "pending"}
+
+    try:
+        response = _s3().put_object(
+            Bucket=s3_bucket, Key=lock_key, Body=json.dumps(manifest), IfNoneMatch="*"
+        )
+    except ClientError as e:
+        if not _is_precondition_failure(e):
+            raise
+    else:
+        batches = select_flush_batches(list_staged_batches(athena_table, s3_bucket))
+        if not batches:
+            _s3().delete_object(Bucket=s3_bucket, Key=lock_key)
+            return None
+        manifest["keys"] = [batch["Key"] for batch in batches]
+        response = _s3().put_object(
+            Bucket=s3_bucket,
+            Key=lock_key,
+            Body=json.dumps(manifest),
+            IfMatch=response["ETag"],
+        )
+        return manifest, response["ETag"]
+
+    try:
+        lock = _s3().get_object(Bucket=s3_bucket, Key=lock_key)
+    except ClientError as e:
+        if e.response["Error"]["Code"] == "NoSuchKey":
+            return None
+        raise
+
+    lock_age = (datetime.now(timezone.utc) - lock["LastModified"]).total_seconds()
+    if lock_age < LOCK_TIMEOUT_SECONDS:
+        log_event(
+            "info",
+            "buffer_flush_in_progress",
+            f"Flush of {athena_table} already in progress, skipping.",
+        )
+        return None
+
+    stale_manifest = json.loads(lock["Body"].read())
+    try:
+        response = _s3().put_object(
+            Bucket=s3_bucket,
+            Key=lock_key,
+            Body=json.dumps(stale_manifest),
+            IfMatch=lock["ETag"],
+        )
+    except ClientError as e:
+        if _is_precondition_failure(e):
+            return None
+        raise
+
+    log_event(
+        "warning",
+        "buffer_flush_resumed",
+        f"Resuming stale flush {stale_manifest['flush_id']} of {athena_table}.",
+    )
+    return stale_manifest, response["ETag"]
+
+
+def _delete_partial_outputs(
+    df: pd.DataFrame, athena_table: str, s3_bucket: str, flush_id: str
+) -> None:
+    """
+    Deletes files written by an earlier, interrupted attempt of the same flush.
+    """
+    for partition_date in df["date"].astype(str).unique():
+        paths = wr.s3.list_objects(
+            f"s3://{s3_bucket}/{athena_table}/date={partition_date}/{flush_id}_"
+        )
+        if paths:
+            log_event(
+                "warning",
+                "buffer_flush_cleanup",
+                f"Deleting {len(paths)} partial files of flush {flush_id}.",
+            )
+            wr.s3.delete_objects(paths)
+
+
+@log_function
+def flush_table(
+    athena_table: str,
+    s3_bucket: str,
+    batches: Optional[List[Dict[str, Any]]] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    Merges the staged batches of an Athena table and writes them to datalake_raw.
+    :return: The write result, None if nothing was written by this call
+    """
+    if batches is None:
+        batches = list_staged_batches(athena_table, s3_bucket)
+    if not batches:
+        return None
+
+    lock = _acquire_flush_lock(athena_table, s3_bucket)
+    if lock is None:
+        return None
+    manifest, etag = lock
+    flush_id = manifest["flush_id"]
+
+    res = None
+    if manifest["status"] == "pending":
+        # Keys of a resumed manifest may have been flushed and deleted since
+        staged = {
+            batch["Key"] for batch in list_staged_batches(athena_table, s3_bucket)
+        }
+        keys = [key for key in manifest["keys"] if key in staged]
+        if not keys:
+            _s3().delete_object(Bucket=s3_bucket, Key=_lock_key(athena_table))
+            return None
+        df = pd.concat(
+            [wr.s3.read_parquet(f"s3://{s3_bucket}/{key}") for key in keys],
+            ignore_index=True,
+        )
+        _delete_partial_outputs(df, athena_table, s3_bucket, flush_id)
+
+        log_event(
+            "info",
+            "buffer_flush",
+            f"Flushing {len(manifest['keys'])} staged batches ({df.shape[0]} rows) "
+            f"of {athena_table}.",
+        )
+        res = write_processed_to_s3(
+            df, athena_table, s3_bucket, filename_prefix=f"{flush_id}_"
+        )
+
+        manifest["status"] = "written"
+        try:
+            _s3().put_object(
+                Bucket=s3_bucket,
+                Key=_lock_key(athena_table),
+                Body=json.dumps(manifest),
+                IfMatch=etag,
+            )
+        except ClientError as e:
+            if _is_precondition_failure(e):
+                # Lock taken over as stale, the new owner completes the flush
+                log_event(
+                    "error",
+                    "buffer_flush_lock_lost",
+                    f"Lost the flush lock of {athena_table} during flush {flush_id}.",
+                )
+                return res
+            raise
+
+    _delete_keys(s3_bucket, manifest["keys"])
+    _s3().delete_object(Bucket=s3_bucket, Key=_lock_key(athena_table))
+
+    return res
+
+
+@log_function
+def write_buffered_to_s3(
+    df: pd.DataFrame,
+    athena_table: str,
+    s3_bucket: Optional[str] = None,
+    staged_batch_id: Optional[str] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    Stages a processed batch and flushes the staged batches of the table if due.
+    A failed flush is logged, not raised: the batch is staged and the next flush
+    picks it up, whereas failing would make Kinesis deliver the batch again.
+    :param staged_batch_id: See batch_id
+    :return: The write result when a flush happened, else None
+    """
+    if s3_bucket is None:
+        s3_bucket = os.environ["S3_RAW"]
+
+    stage_batch(df, athena_table, s3_bucket, staged_batch_id)
+
+    try:
+        batches = list_staged_batches(athena_table, s3_bucket)
+        if flush_due(batches):
+            return flush_table(athena_table, s3_bucket, batches)
+    except Exception as e:
+        log_event(
+            "error",
+            "buffer_flush_failed",
+            f"Flush of {athena_table} failed, left to the next flush: {e}",
+        )
+
+    return None
+
+
+@log_function
+def flush_due_tables(s3_bucket: Optional[str] = None) -> List[str]:
+    """
+    Flushes every Athena table whose staged batches are due, used by the scheduled
+    flush so that tables of idle streams are not left in staging.
+    :return: The flushed Athena tables
+    """
+    if s3_bucket is None:
+        s3_bucket = os.environ["S3_RAW"]
+
+    flushed = []
+    paginator = _s3().get_paginator("list_objects_v2")
+    for page in paginator.paginate(
+        Bucket=s3_bucket, Prefix=f"{STAGING_PREFIX}/", Delimiter="/"
+    ):
+        for prefix in page.get("CommonPrefixes", []):
+            athena_table = prefix["Prefix"][len(STAGING_PREFIX) + 1 :].rstrip("/")
+            batches = list_staged_batches(athena_table, s3_bucket)
+            if flush_due(batches):
+                flush_table(athena_table, s3_bucket, batches)
+                flushed.append(athena_table)
+
+    return flushed
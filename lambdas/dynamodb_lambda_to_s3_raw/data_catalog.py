@@ -1,7678 +1,128 @@
-column_comments = {
-    "dynamo_sls_referral": {},
-    "dynamo_sls_referral_code": {},
-    "dynamo_sls_ddb_customer_credentials_change_history": {},
-    "dynamo_sls_ddb_customer_verification_attempt": {},
-    "dynamo_sls_ddb_customer_block_list": {},
-    "dynamo_sls_riskscore": {},
-    "dynamo_sls_risk_crm_case": {},
-    "dynamo_default_payment_products": {},
-    "dynamo_sls_home_financing_mortgage_in_principle": {},
-    "dynamo_default_investment_user": {},
-    "dynamo_default_investment_sell": {},
-    "dynamo_default_investment_fund": {},
-    "dynamo_sls_home_financing_mortgage": {},
-    "dynamo_sls_exchange_rates": {},
-    "dynamo_sls_customer_risk_us_person": {},
-    "dynamo_sls_ddb_users_customer_passport_number": {},
-    "dynamo_scv_sls_customers": {},
-    "dynamo_sls_customer_identity": {},
-    "dynamo_sls_passcoderesetcodechallenges": {},
-    "dynamo_sls_ddb_customer_address_verification_code": {},
-    "dynamo_sls_payees_v2": {},
-    "dynamo_sls_cardorders": {},
-    "dynamo_sls_document_verification": {},
-    "dynamo_sls_ias_recurring": {},
-    "dynamo_sls_customer_risk_country_score": {},
-    "dynamo_sls_customer_address_address": {},
-    "dynamo_sls_customer_finances": {},
-    "dynamo_sls_investments_order": {},
-    "dynamo_onfido": {},
-    "dynamo_sls_customer_risk_form": {},
-    "dynamo_sls_passcoderesettiershistory": {},
-    "dynamo_sls_cards": {},
-    "dynamo_sls_clearbank_transactions": {},
-    "dynamo_sls_confirmation_of_payee": {},
-    "dynamo_sls_cards_status_history": {},
-    "dynamo_sls_home_financing_mortgage_application": {},
-    "dynamo_card_fast_messages_default": {},
-    "dynamo_sls_riskscore_history": {},
-    "dynamo_sls_cards_rules": {},
-    "dynamo_sls_cards_disabled_rules_history": {},
-    "dynamo_sls_investments_model_portfolio": {},
-    "dynamo_sls_investments_model_portfolio_rebalance": {},
-    "dynamo_sls_investments_instrument": {},
-    "dynamo_sls_investments_dividend": {},
-    "dynamo_sls_investments_daily_fees": {},
-    "dynamo_sls_investments_monthly_fees": {},
-    "dynamo_sls_instant_savings_accounts_products": {},
-}
+"""
+Athena data catalog of the generic DynamoDB to S3 raw pipeline.
 
-schemas = {
-    "dynamo_sls_referral": {
-        "dynamodb_new_image_created_at_n": "timestamp",
-        "dynamodb_new_image_app_installed_at_s": "timestamp",
-        "dynamodb_new_image_lead_claimed_at_s": "timestamp",
-        "dynamodb_new_image_referral_code_s": "string",
-        "dynamodb_new_image_updated_at_n": "timestamp",
-        "dynamodb_new_image_customer_id_s": "string",
-        "dynamodb_keys_customer_id_s": "string",
-        "event_source": "string",
-        "timestamp_extracted": "timestamp",
-        "aws_region": "string",
-        "event_id": "string",
-        "event_name": "string",
-        "record_format": "string",
-        "table_name": "string",
-        "dynamodb_approximate_creation_date_time": "bigint",
-        "dynamodb_size_bytes": "bigint",
-        "date": "string",
-    },
-    "dynamo_sls_referral_code": {
-        "dynamodb_new_image_created_at_n": "timestamp",
-        "dynamodb_new_image_referral_code_s": "string",
-        "dynamodb_new_image_campaign_id_s": "string",
-        "dynamodb_new_image_updated_at_n": "timestamp",
-        "dynamodb_new_image_status_s": "string",
-        "dynamodb_new_image_referrer_id_s": "string",
-        "dynamodb_keys_referrer_id_s": "string",
-        "event_source": "string",
-        "timestamp_extracted": "timestamp",
-        "aws_region": "string",
-        "event_id": "string",
-        "event_name": "string",
-        "record_format": "string",
-        "table_name": "string",
-        "dynamodb_approximate_creation_date_time": "bigint",
-        "dynamodb_keys_campaign_id_s": "string",
-        "dynamodb_size_bytes": "bigint",
-        "date": "string",
-    },
-    "dynamo_sls_ddb_customer_credentials_change_history": {
-        "awsregion": "string",
-        "eventid": "string",
-        "eventname": "string",
-        "useridentity": "string",
-        "recordformat": "string",
-        "tablename": "string",
-        "dynamodb_approximatecreationdatetime": "string",
-        "dynamodb_keys_customerid_s": "string",
-        "dynamodb_newimage_lastpasscodeupdatedate_s": "string",
-        "dynamodb_newimage_totalsuccessfulpasscodeupdates_n": "string",
-        "dynamodb_newimage_customerid_s": "string",
-        "dynamodb_sizebytes": "string",
-        "eventsource": "string",
-        "timestamp_extracted": "timestamp",
-        "dynamodb_newimage_lastemailupdatedate_s": "timestamp",
-        "dynamodb_newimage_totalsuccessfulemailupdates_n": "string",
-        "dynamodb_newimage_lastdeviceupdatedate_s": "string",
-        "dynamodb_newimage_totalsuccessfuldeviceupdates_n": "string",
-        "aws_region": "string",
-        "event_id": "string",
-        "event_name": "string",
-        "record_format": "string",
-        "table_name": "string",
-        "dynamodb_approximate_creation_date_time": "bigint",
-        "dynamodb_keys_customer_id_s": "string",
-        "dynamodb_new_image_last_device_update_date_s": "string",
-        "dynamodb_new_image_total_successful_device_updates_n": "string",
-        "dynamodb_new_image_customer_id_s": "string",
-        "dynamodb_size_bytes": "bigint",
-        "event_source": "string",
-        "dynamodb_new_image_last_email_update_date_s": "timestamp",
-        "dynamodb_new_image_total_successful_email_updates_n": "string",
-        "dynamodb_new_image_last_passcode_update_date_s": "string",
-        "dynamodb_new_image_total_successful_passcode_updates_n": "string",
-        "dynamodb_new_image_total_successful_phone_updates_n": "string",
-        "dynamodb_new_image_last_phone_update_date_s": "string",
-        "date": "string",
-    },
-    "dynamo_sls_ddb_customer_verification_attempt": {
-        "awsregion": "string",
-        "eventid": "string",
-        "eventname": "string",
-        "useridentity": "string",
-        "recordformat": "string",
-        "tablename": "string",
-        "dynamodb_approximatecreationdatetime": "timestamp",
-        "dynamodb_keys_createdat_n": "timestamp",
-        "dynamodb_keys_customerid_s": "string",
-        "dynamodb_newimage_origin_s": "string",
-        "dynamodb_newimage_value_s": "string",
-        "dynamodb_newimage_ttl_n": "timestamp",
-        "dynamodb_newimage_createdat_n": "timestamp",
-        "dynamodb_newimage_issuccessfulattempt_bool": "boolean",
-        "dynamodb_newimage_type_s": "string",
-        "dynamodb_newimage_customerid_s": "string",
-        "dynamodb_sizebytes": "string",
-        "eventsource": "string",
-        "timestamp_extracted": "timestamp",
-        "aws_region": "string",
-        "event_id": "string",
-        "event_name": "string",
-        "record_format": "string",
-        "table_name": "string",
-        "dynamodb_approximate_creation_date_time": "timestamp",
-        "dynamodb_keys_created_at_n": "timestamp",
-        "dynamodb_keys_customer_id_s": "string",
-        "dynamodb_new_image_origin_s": "string",
-        "dynamodb_new_image_value_s": "string",
-        "dynamodb_new_image_ttl_n": "timestamp",
-        "dynamodb_new_image_created_at_n": "timestamp",
-        "dynamodb_new_image_is_successful_attempt_bool": "boolean",
-        "dynamodb_new_image_type_s": "string",
-        "dynamodb_new_image_customer_id_s": "string",
-        "dynamodb_size_bytes": "bigint",
-        "event_source": "string",
-        "date": "string",
-    },
-    "dynamo_sls_ddb_customer_block_list": {
-        "aws_region": "string",
-        "event_id": "string",
-        "event_name": "string",
-        "record_format": "string",
-        "table_name": "string",
-        "dynamodb_approximate_creation_date_time": "bigint",
-        "dynamodb_keys_block_until_n": "timestamp",
-        "dynamodb_keys_customer_id_s": "string",
-        "dynamodb_new_image_block_from_n": "string",
-        "dynamodb_new_image_block_until_n": "timestamp",
-        "dynamodb_new_image_type_s": "string",
-        "dynamodb_new_image_customer_id_s": "string",
-        "dynamodb_size_bytes": "bigint",
-        "event_source": "string",
-        "timestamp_extracted": "timestamp",
-        "date": "string",
-    },
-    "dynamo_sls_riskscore": {
-        "aws_region": "string",
-        "event_id": "string",
-        "event_name": "string",
-        "user_identity": "string",
-        "record_format": "string",
-        "table_name": "string",
-        "dynamodb_approximate_creation_date_time": "timestamp",
-        "dynamodb_keys_customer_id_s": "string",
-        "dynamodb_new_image_documents_m_additional_info_doc_m_status_s": "string",
-        "dynamodb_new_image_documents_m_supporting_doc_m_status_s": "string",
-        "dynamodb_new_image_risk_m_rating_s": "string",
-        "dynamodb_new_image_risk_m_initial_overall_score_m_rating_s": "string",
-        "dynamodb_new_image_risk_m_initial_overall_score_m_score_n": "string",
-        "dynamodb_new_image_risk_m_initial_overall_score_m_factors_m_delivery_channel_score_m_rating_s": "string",
-        "dynamodb_new_image_risk_m_initial_overall_score_m_factors_m_delivery_channel_score_m_score_n": "string",
-        "dynamodb_new_image_risk_m_initial_overall_score_m_factors_m_customer_risk_score_m_rating_s": "string",
-        "dynamodb_new_image_risk_m_initial_overall_score_m_factors_m_customer_risk_score_m_score_n": "string",
-        "dynamodb_new_image_risk_m_initial_overall_score_m_factors_m_account_purpose_and_expected_activity_score_m_rating_s": "string",
-        "dynamodb_new_image_risk_m_initial_overall_score_m_factors_m_account_purpose_and_expected_activity_score_m_score_n": "string",
-        "dynamodb_new_image_risk_m_initial_overall_score_m_factors_m_jurisdiction_risk_score_m_rating_s": "string",
-        "dynamodb_new_image_risk_m_initial_overall_score_m_factors_m_jurisdiction_risk_score_m_score_n": "string",
-        "dynamodb_new_image_risk_m_initial_overall_score_m_factors_m_product_type_score_m_rating_s": "string",
-        "dynamodb_new_image_risk_m_initial_overall_score_m_factors_m_product_type_score_m_score_n": "string",
-        "dynamodb_new_image_risk_m_final_overall_score_m_rating_s": "string",
-        "dynamodb_new_image_risk_m_final_overall_score_m_score_n": "string",
-        "dynamodb_new_image_risk_m_final_overall_score_m_factors_m_additional_risk_score_m_rating_s": "string",
-        "dynamodb_new_image_risk_m_final_overall_score_m_factors_m_additional_risk_score_m_score_n": "string",
-        "dynamodb_new_image_additional_info_push_notification_m_sended_bool": "boolean",
-        "dynamodb_new_image_updated_at_n": "timestamp",
-        "dynamodb_new_image_status_s": "string",
-        "dynamodb_new_image_customer_m_country_of_residence_code_s": "string",
-        "dynamodb_new_image_customer_m_primary_account_purpose_l_0_s": "string",
-        "dynamodb_new_image_customer_m_delivery_channel_l_0_s": "string",
-        "dynamodb_new_image_customer_m_adverse_media_check_passed_bool": "boolean",
-        "dynamodb_new_image_customer_m_expected_monthly_value_of_transactions_outbound_m_local_currency_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_expected_monthly_value_of_transactions_outbound_m_local_currency_m_from_n": "string",
-        "dynamodb_new_image_customer_m_expected_monthly_value_of_transactions_outbound_m_local_currency_m_to_n": "string",
-        "dynamodb_new_image_customer_m_expected_monthly_value_of_transactions_outbound_m_converted_currency_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_expected_monthly_value_of_transactions_outbound_m_converted_currency_m_from_n": "string",
-        "dynamodb_new_image_customer_m_expected_monthly_value_of_transactions_outbound_m_converted_currency_m_to_n": "string",
-        "dynamodb_new_image_customer_m_pep_positions_l_0_m_pep_position_s": "string",
-        "dynamodb_new_image_customer_m_pep_positions_l_0_m_country_code_s": "string",
-        "dynamodb_new_image_customer_m_sanction_check_passed_bool": "boolean",
-        "dynamodb_new_image_customer_m_customer_occupations_l_0_s": "string",
-        "dynamodb_new_image_customer_m_customer_type_s": "string",
-        "dynamodb_new_image_customer_m_expected_monthly_value_of_transactions_inbound_m_local_currency_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_expected_monthly_value_of_transactions_inbound_m_local_currency_m_from_n": "string",
-        "dynamodb_new_image_customer_m_expected_monthly_value_of_transactions_inbound_m_local_currency_m_to_n": "string",
-        "dynamodb_new_image_customer_m_expected_monthly_value_of_transactions_inbound_m_converted_currency_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_expected_monthly_value_of_transactions_inbound_m_converted_currency_m_from_n": "string",
-        "dynamodb_new_image_customer_m_expected_monthly_value_of_transactions_inbound_m_converted_currency_m_to_n": "string",
-        "dynamodb_new_image_customer_m_customer_circumstances_l_0_s": "string",
-        "dynamodb_new_image_customer_m_address_status_s": "string",
-        "dynamodb_new_image_customer_m_screening_status_s": "string",
-        "dynamodb_new_image_customer_m_product_type_l_0_s": "string",
-        "dynamodb_new_image_customer_m_countries_of_personal_links_l_0_m_type_s": "string",
-        "dynamodb_new_image_customer_m_countries_of_personal_links_l_0_m_country_code_s": "string",
-        "dynamodb_new_image_customer_m_pep_check_passed_bool": "boolean",
-        "dynamodb_new_image_customer_id_s": "string",
-        "dynamodb_size_bytes": "string",
-        "event_source": "string",
-        "timestamp_extracted": "timestamp",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_0_m_type_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_0_m_total_value_m_local_currency_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_0_m_total_value_m_local_currency_m_from_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_0_m_total_value_m_local_currency_m_to_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_0_m_total_value_m_converted_currency_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_0_m_total_value_m_converted_currency_m_from_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_0_m_total_value_m_converted_currency_m_to_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_0_m_country_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_1_m_type_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_1_m_total_value_m_local_currency_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_1_m_total_value_m_local_currency_m_from_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_1_m_total_value_m_local_currency_m_to_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_1_m_total_value_m_converted_currency_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_1_m_total_value_m_converted_currency_m_from_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_1_m_total_value_m_converted_currency_m_to_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_1_m_country_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_2_m_type_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_2_m_total_value_m_local_currency_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_2_m_total_value_m_local_currency_m_from_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_2_m_total_value_m_local_currency_m_to_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_2_m_total_value_m_converted_currency_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_2_m_total_value_m_converted_currency_m_from_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_2_m_total_value_m_converted_currency_m_to_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_2_m_country_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_3_m_type_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_3_m_total_value_m_local_currency_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_3_m_total_value_m_local_currency_m_from_n": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_3_m_total_value_m_local_currency_m_to_n": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_3_m_total_value_m_converted_currency_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_3_m_total_value_m_converted_currency_m_from_n": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_3_m_total_value_m_converted_currency_m_to_n": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_3_m_country_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_2_m_other_value_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_3_m_other_value_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_4_m_type_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_4_m_total_value_m_local_currency_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_4_m_total_value_m_local_currency_m_from_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_4_m_total_value_m_local_currency_m_to_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_4_m_total_value_m_converted_currency_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_4_m_total_value_m_converted_currency_m_from_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_4_m_total_value_m_converted_currency_m_to_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_4_m_country_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_5_m_type_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_5_m_total_value_m_local_currency_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_5_m_total_value_m_local_currency_m_from_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_5_m_total_value_m_local_currency_m_to_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_5_m_total_value_m_converted_currency_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_5_m_total_value_m_converted_currency_m_from_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_5_m_total_value_m_converted_currency_m_to_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_5_m_country_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_6_m_type_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_6_m_total_value_m_local_currency_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_6_m_total_value_m_local_currency_m_from_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_6_m_total_value_m_local_currency_m_to_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_6_m_total_value_m_converted_currency_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_6_m_total_value_m_converted_currency_m_from_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_6_m_total_value_m_converted_currency_m_to_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_6_m_country_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_7_m_total_value_m_local_currency_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_7_m_total_value_m_local_currency_m_from_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_7_m_total_value_m_local_currency_m_to_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_7_m_total_value_m_converted_currency_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_7_m_total_value_m_converted_currency_m_from_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_7_m_total_value_m_converted_currency_m_to_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_7_m_type_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_7_m_other_value_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_7_m_country_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_8_m_type_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_8_m_total_value_m_local_currency_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_8_m_total_value_m_local_currency_m_from_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_8_m_total_value_m_local_currency_m_to_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_8_m_total_value_m_converted_currency_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_8_m_total_value_m_converted_currency_m_from_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_8_m_total_value_m_converted_currency_m_to_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_8_m_country_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_9_m_type_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_9_m_total_value_m_local_currency_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_9_m_total_value_m_local_currency_m_from_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_9_m_total_value_m_local_currency_m_to_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_9_m_total_value_m_converted_currency_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_9_m_total_value_m_converted_currency_m_from_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_9_m_total_value_m_converted_currency_m_to_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_9_m_country_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_10_m_type_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_10_m_total_value_m_local_currency_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_10_m_total_value_m_local_currency_m_from_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_10_m_total_value_m_local_currency_m_to_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_10_m_total_value_m_converted_currency_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_10_m_total_value_m_converted_currency_m_from_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_10_m_total_value_m_converted_currency_m_to_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_10_m_country_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_11_m_type_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_11_m_total_value_m_local_currency_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_11_m_total_value_m_local_currency_m_from_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_11_m_total_value_m_local_currency_m_to_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_11_m_total_value_m_converted_currency_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_11_m_total_value_m_converted_currency_m_from_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_11_m_total_value_m_converted_currency_m_to_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_11_m_country_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_12_m_type_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_12_m_total_value_m_local_currency_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_12_m_total_value_m_local_currency_m_from_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_12_m_total_value_m_local_currency_m_to_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_12_m_total_value_m_converted_currency_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_12_m_total_value_m_converted_currency_m_from_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_12_m_total_value_m_converted_currency_m_to_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_12_m_country_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_13_m_type_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_13_m_total_value_m_local_currency_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_13_m_total_value_m_local_currency_m_from_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_13_m_total_value_m_local_currency_m_to_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_13_m_total_value_m_converted_currency_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_13_m_total_value_m_converted_currency_m_from_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_13_m_total_value_m_converted_currency_m_to_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_13_m_country_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_14_m_type_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_14_m_total_value_m_local_currency_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_14_m_total_value_m_local_currency_m_from_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_14_m_total_value_m_local_currency_m_to_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_14_m_total_value_m_converted_currency_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_14_m_total_value_m_converted_currency_m_from_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_14_m_total_value_m_converted_currency_m_to_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_14_m_country_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_15_m_type_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_15_m_total_value_m_local_currency_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_15_m_total_value_m_local_currency_m_from_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_15_m_total_value_m_local_currency_m_to_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_15_m_total_value_m_converted_currency_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_15_m_total_value_m_converted_currency_m_from_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_15_m_total_value_m_converted_currency_m_to_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_15_m_country_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_16_m_type_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_16_m_total_value_m_local_currency_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_16_m_total_value_m_local_currency_m_from_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_16_m_total_value_m_local_currency_m_to_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_16_m_total_value_m_converted_currency_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_16_m_total_value_m_converted_currency_m_from_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_16_m_total_value_m_converted_currency_m_to_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_16_m_country_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_17_m_type_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_17_m_total_value_m_local_currency_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_17_m_total_value_m_local_currency_m_from_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_17_m_total_value_m_local_currency_m_to_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_17_m_total_value_m_converted_currency_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_17_m_total_value_m_converted_currency_m_from_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_17_m_total_value_m_converted_currency_m_to_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_17_m_country_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_18_m_type_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_18_m_total_value_m_local_currency_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_18_m_total_value_m_local_currency_m_from_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_18_m_total_value_m_local_currency_m_to_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_18_m_total_value_m_converted_currency_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_18_m_total_value_m_converted_currency_m_from_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_18_m_total_value_m_converted_currency_m_to_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_18_m_country_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_19_m_type_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_19_m_total_value_m_local_currency_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_19_m_total_value_m_local_currency_m_from_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_19_m_total_value_m_local_currency_m_to_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_19_m_total_value_m_converted_currency_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_19_m_total_value_m_converted_currency_m_from_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_19_m_total_value_m_converted_currency_m_to_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_19_m_country_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_20_m_type_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_20_m_total_value_m_local_currency_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_20_m_total_value_m_local_currency_m_from_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_20_m_total_value_m_local_currency_m_to_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_20_m_total_value_m_converted_currency_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_20_m_total_value_m_converted_currency_m_from_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_20_m_total_value_m_converted_currency_m_to_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_20_m_country_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_21_m_type_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_21_m_total_value_m_local_currency_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_21_m_total_value_m_local_currency_m_from_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_21_m_total_value_m_local_currency_m_to_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_21_m_total_value_m_converted_currency_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_21_m_total_value_m_converted_currency_m_from_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_21_m_total_value_m_converted_currency_m_to_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_21_m_country_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_22_m_type_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_22_m_total_value_m_local_currency_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_22_m_total_value_m_local_currency_m_from_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_22_m_total_value_m_local_currency_m_to_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_22_m_total_value_m_converted_currency_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_22_m_total_value_m_converted_currency_m_from_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_22_m_total_value_m_converted_currency_m_to_n": "bigint",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_22_m_country_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_23_m_type_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_23_m_total_value_m_local_currency_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_23_m_total_value_m_local_currency_m_from_n": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_23_m_total_value_m_local_currency_m_to_n": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_23_m_total_value_m_converted_currency_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_23_m_total_value_m_converted_currency_m_from_n": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_23_m_total_value_m_converted_currency_m_to_n": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_23_m_country_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_24_m_type_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_24_m_total_value_m_local_currency_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_24_m_total_value_m_local_currency_m_from_n": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_24_m_total_value_m_local_currency_m_to_n": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_24_m_total_value_m_converted_currency_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_24_m_total_value_m_converted_currency_m_from_n": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_24_m_total_value_m_converted_currency_m_to_n": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_24_m_country_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_25_m_type_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_25_m_total_value_m_local_currency_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_25_m_total_value_m_local_currency_m_from_n": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_25_m_total_value_m_local_currency_m_to_n": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_25_m_total_value_m_converted_currency_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_25_m_total_value_m_converted_currency_m_from_n": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_25_m_total_value_m_converted_currency_m_to_n": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_25_m_country_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_26_m_type_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_26_m_total_value_m_local_currency_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_26_m_total_value_m_local_currency_m_from_n": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_26_m_total_value_m_local_currency_m_to_n": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_26_m_total_value_m_converted_currency_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_26_m_total_value_m_converted_currency_m_from_n": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_26_m_total_value_m_converted_currency_m_to_n": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_26_m_country_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_27_m_type_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_27_m_total_value_m_local_currency_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_27_m_total_value_m_local_currency_m_from_n": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_27_m_total_value_m_local_currency_m_to_n": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_27_m_total_value_m_converted_currency_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_27_m_total_value_m_converted_currency_m_from_n": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_27_m_total_value_m_converted_currency_m_to_n": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_27_m_country_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_28_m_type_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_28_m_total_value_m_local_currency_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_28_m_total_value_m_local_currency_m_from_n": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_28_m_total_value_m_local_currency_m_to_n": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_28_m_total_value_m_converted_currency_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_28_m_total_value_m_converted_currency_m_from_n": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_28_m_total_value_m_converted_currency_m_to_n": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_28_m_country_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_29_m_type_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_29_m_total_value_m_local_currency_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_29_m_total_value_m_local_currency_m_from_n": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_29_m_total_value_m_local_currency_m_to_n": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_29_m_total_value_m_converted_currency_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_29_m_total_value_m_converted_currency_m_from_n": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_29_m_total_value_m_converted_currency_m_to_n": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_items_l_29_m_country_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_total_estimated_net_worth_m_converted_currency_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_total_estimated_net_worth_m_converted_currency_m_from_n": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_total_estimated_net_worth_m_converted_currency_m_to_n": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_total_estimated_net_worth_m_local_currency_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_total_estimated_net_worth_m_local_currency_m_from_n": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_total_estimated_net_worth_m_local_currency_m_to_n": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_total_estimated_net_worth_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_total_estimated_net_worth_m_from_n": "string",
-        "dynamodb_new_image_customer_m_source_of_wealth_assets_m_total_estimated_net_worth_m_to_n": "string",
-        "date": "string",
-    },
-    "dynamo_sls_risk_crm_case": {
-        "aws_region": "string",
-        "dynamodb_approximate_creation_date_time": "timestamp",
-        "dynamodb_keys_case_id_s": "string",
-        "dynamodb_new_image_case_id_s": "string",
-        "dynamodb_new_image_created_at_n": "timestamp",
-        "dynamodb_new_image_customer_id_type_status_index_s": "string",
-        "dynamodb_new_image_customer_id_s": "string",
-        "dynamodb_new_image_status_s": "string",
-        "dynamodb_new_image_updated_at_n": "timestamp",
-        "dynamodb_size_bytes": "string",
-        "event_id": "string",
-        "event_name": "string",
-        "event_source": "string",
-        "record_format": "string",
-        "table_name": "string",
-        "user_identity": "string",
-        "timestamp_extracted": "timestamp",
-        "source": "string",
-        "awsregion": "string",
-        "eventid": "string",
-        "eventname": "string",
-        "useridentity": "string",
-        "recordformat": "string",
-        "tablename": "string",
-        "dynamodb_approximatecreationdatetime": "timestamp",
-        "dynamodb_keys_caseid_s": "string",
-        "dynamodb_newimage_updatedat_n": "timestamp",
-        "dynamodb_newimage_status_s": "string",
-        "dynamodb_newimage_createdat_n": "timestamp",
-        "dynamodb_newimage_customeridtypestatusindex_s": "string",
-        "dynamodb_newimage_caseid_s": "string",
-        "dynamodb_newimage_customerid_s": "string",
-        "dynamodb_sizebytes": "string",
-        "eventsource": "string",
-        "date": "string",
-    },
-    "dynamo_default_payment_products": {
-        "dynamodb_new_image_interest_rate_n": "double",
-        "dynamodb_new_image_customer_tier_s": "string",
-        "dynamodb_new_image_name_s": "string",
-        "dynamodb_new_image_product_encoded_key_s": "string",
-        "dynamodb_new_image_max_amount_n": "int",
-        "dynamodb_new_image_length_months_n": "int",
-        "dynamodb_new_image_updated_at_n": "string",
-        "dynamodb_new_image_currency_code_s": "string",
-        "dynamodb_new_image_sk_s": "string",
-        "dynamodb_new_image_rates_l_0_m_min_amount_n": "int",
-        "dynamodb_new_image_rates_l_0_m_rate_n": "double",
-        "dynamodb_new_image_rates_l_1_m_min_amount_n": "int",
-        "dynamodb_new_image_rates_l_1_m_rate_n": "double",
-        "dynamodb_new_image_term_rate_id_s": "string",
-        "dynamodb_new_image_pk_s": "string",
-        "dynamodb_new_image_min_amount_n": "int",
-        "dynamodb_new_image_type_s": "string",
-        "dynamodb_new_image_rates_l_0_m_bonus_rate_n": "double",
-        "dynamodb_new_image_rates_l_1_m_bonus_rate_n": "double",
-        "dynamodb_new_image_product_type_s": "string",
-        "dynamodb_new_image_available_days_after_maturity_n": "int",
-        "dynamodb_new_image_domestic_withdrawal_daily_limit_m_channels_ss_0": "string",
-        "dynamodb_new_image_domestic_withdrawal_daily_limit_m_channels_ss_1": "string",
-        "dynamodb_new_image_domestic_withdrawal_daily_limit_m_channels_ss_2": "string",
-        "dynamodb_new_image_domestic_withdrawal_daily_limit_m_max_amount_n": "int",
-        "dynamodb_new_image_international_withdrawal_daily_limit_m_channels_ss_0": "string",
-        "dynamodb_new_image_international_withdrawal_daily_limit_m_max_amount_n": "int",
-        "dynamodb_new_image_product_id_s": "string",
-        "dynamodb_keys_pk_s": "string",
-        "event_source": "string",
-        "timestamp_extracted": "timestamp",
-        "aws_region": "string",
-        "event_id": "string",
-        "event_name": "string",
-        "user_identity": "string",
-        "record_format": "string",
-        "table_name": "string",
-        "dynamodb_approximate_creation_date_time": "string",
-        "dynamodb_keys_sk_s": "string",
-        "dynamodb_size_bytes": "int",
-        "dynamodb_new_image_domestic_withdrawal_daily_limit_m_channels_ss_3": "string",
-        "dynamodb_new_image_rates_l_0_m_profit_margin_n": "double",
-        "dynamodb_new_image_rates_l_1_m_profit_margin_n": "double",
-        "date": "string",
-    },
-    "dynamo_sls_home_financing_mortgage_in_principle": {
-        "dynamodb_new_image_committed_expenditure_m_monthly_m_credit_commitments_s": "string",
-        "dynamodb_new_image_committed_expenditure_m_monthly_m_financial_commitments_s": "string",
-        "dynamodb_new_image_created_at_n": "timestamp",
-        "dynamodb_new_image_document_id_s": "string",
-        "dynamodb_new_image_employment_details_m_annual_bonus_s": "string",
-        "dynamodb_new_image_employment_details_m_gross_salary_s": "string",
-        "dynamodb_new_image_employment_details_m_other_income_s": "string",
-        "dynamodb_new_image_employment_details_m_rental_income_s": "string",
-        "dynamodb_new_image_employment_details_m_type_s": "string",
-        "dynamodb_new_image_financing_m_deposit_s": "string",
-        "dynamodb_new_image_financing_m_estimated_monthly_rental_income_s": "string",
-        "dynamodb_new_image_financing_m_value_s": "string",
-        "dynamodb_new_image_household_expenditure_m_monthly_m_essential_expenditure_s": "string",
-        "dynamodb_new_image_household_expenditure_m_monthly_m_living_costs_s": "string",
-        "dynamodb_keys_id_s": "string",
-        "dynamodb_new_image_outcome_m_date_issued_s": "string",
-        "dynamodb_new_image_outcome_m_expiry_date_s": "string",
-        "dynamodb_new_image_outcome_m_ftv_s": "string",
-        "dynamodb_new_image_outcome_m_maximum_finance_amount_s": "string",
-        "dynamodb_new_image_outcome_m_meets_eligibility_bool": "boolean",
-        "dynamodb_new_image_outcome_m_property_budget_s": "string",
-        "dynamodb_new_image_outcome_m_term_rates_l_0_m_initial_profit_rate_s": "string",
-        "dynamodb_new_image_outcome_m_term_rates_l_0_m_monthly_payments_s": "string",
-        "dynamodb_new_image_outcome_m_term_rates_l_0_m_product_s": "string",
-        "dynamodb_new_image_outcome_m_term_rates_l_1_m_initial_profit_rate_s": "string",
-        "dynamodb_new_image_outcome_m_term_rates_l_1_m_monthly_payments_s": "string",
-        "dynamodb_new_image_outcome_m_term_rates_l_1_m_product_s": "string",
-        "dynamodb_new_image_status_s": "string",
-        "dynamodb_new_image_updated_at_n": "timestamp",
-        "dynamodb_new_image_user_id_s": "string",
-        "dynamodb_new_image_user_m_address_m_city_s": "string",
-        "dynamodb_new_image_user_m_address_m_country_code_s": "string",
-        "dynamodb_new_image_user_m_address_m_line1_s": "string",
-        "dynamodb_new_image_user_m_address_m_line2_s": "string",
-        "dynamodb_new_image_user_m_address_m_postal_code_s": "string",
-        "dynamodb_new_image_user_m_dob_s": "string",
-        "dynamodb_new_image_user_m_email_s": "string",
-        "dynamodb_new_image_user_m_first_name_s": "string",
-        "dynamodb_new_image_user_m_last_name_s": "string",
-        "dynamodb_new_image_user_m_phone_number_s": "string",
-        "dynamodb_new_image_user_m_status_s": "string",
-        "dynamodb_new_image_user_m_type_s": "string",
-        "source": "string",
-        "timestamp_extracted": "timestamp",
-        "aws_region": "string",
-        "dynamodb_approximate_creation_date_time": "timestamp",
-        "dynamodb_keys_user_id_s": "string",
-        "dynamodb_new_image_id_s": "string",
-        "dynamodb_size_bytes": "string",
-        "event_id": "string",
-        "event_name": "string",
-        "event_source": "string",
-        "record_format": "string",
-        "table_name": "string",
-        "user_identity": "string",
-        "dynamodb_new_image_employment_details_m_length_of_service_m_months_n": "int",
-        "dynamodb_new_image_employment_details_m_length_of_service_m_years_n": "int",
-        "awsregion": "string",
-        "eventid": "string",
-        "eventname": "string",
-        "useridentity": "string",
-        "recordformat": "string",
-        "tablename": "string",
-        "dynamodb_approximatecreationdatetime": "timestamp",
-        "dynamodb_keys_userid_s": "string",
-        "dynamodb_newimage_createdat_n": "timestamp",
-        "dynamodb_newimage_user_m_firstname_s": "string",
-        "dynamodb_newimage_user_m_lastname_s": "string",
-        "dynamodb_newimage_user_m_phonenumber_s": "string",
-        "dynamodb_newimage_user_m_address_m_line2_s": "string",
-        "dynamodb_newimage_user_m_address_m_city_s": "string",
-        "dynamodb_newimage_user_m_address_m_line1_s": "string",
-        "dynamodb_newimage_user_m_address_m_countrycode_s": "string",
-        "dynamodb_newimage_user_m_address_m_postalcode_s": "string",
-        "dynamodb_newimage_user_m_dob_s": "string",
-        "dynamodb_newimage_user_m_type_s": "string",
-        "dynamodb_newimage_user_m_email_s": "string",
-        "dynamodb_newimage_user_m_status_s": "string",
-        "dynamodb_newimage_id_s": "string",
-        "dynamodb_newimage_updatedat_n": "timestamp",
-        "dynamodb_newimage_userid_s": "string",
-        "dynamodb_newimage_status_s": "string",
-        "dynamodb_sizebytes": "string",
-        "eventsource": "string",
-        "dynamodb_newimage_employmentdetails_m_type_s": "string",
-        "dynamodb_newimage_employmentdetails_m_grosssalary_s": "string",
-        "dynamodb_newimage_employmentdetails_m_annualbonus_s": "string",
-        "dynamodb_newimage_employmentdetails_m_rentalincome_s": "string",
-        "dynamodb_newimage_financing_m_estimatedmonthlyrentalincome_s": "string",
-        "dynamodb_newimage_financing_m_deposit_s": "string",
-        "dynamodb_newimage_financing_m_value_s": "string",
-        "dynamodb_newimage_committedexpenditure_m_monthly_m_creditcommitments_s": "string",
-        "dynamodb_newimage_committedexpenditure_m_monthly_m_financialcommitments_s": "string",
-        "dynamodb_newimage_householdexpenditure_m_monthly_m_essentialexpenditure_s": "string",
-        "dynamodb_newimage_householdexpenditure_m_monthly_m_livingcosts_s": "string",
-        "dynamodb_newimage_outcome_m_expirydate_s": "string",
-        "dynamodb_newimage_outcome_m_dateissued_s": "string",
-        "dynamodb_newimage_outcome_m_maximumfinanceamount_s": "string",
-        "dynamodb_newimage_outcome_m_meetseligibility_bool": "boolean",
-        "dynamodb_newimage_outcome_m_termrates_l_0_m_initialprofitrate_s": "string",
-        "dynamodb_newimage_outcome_m_termrates_l_0_m_monthlypayments_s": "string",
-        "dynamodb_newimage_outcome_m_termrates_l_0_m_product_s": "string",
-        "dynamodb_newimage_outcome_m_termrates_l_1_m_initialprofitrate_s": "string",
-        "dynamodb_newimage_outcome_m_termrates_l_1_m_monthlypayments_s": "string",
-        "dynamodb_newimage_outcome_m_termrates_l_1_m_product_s": "string",
-        "dynamodb_newimage_outcome_m_ftv_s": "string",
-        "dynamodb_newimage_outcome_m_propertybudget_s": "string",
-        "dynamodb_newimage_documentid_s": "string",
-        "date": "string",
-    },
-    "dynamo_default_investment_user": {
-        "dynamodb_new_image_policy_accepted_bool": "boolean",
-        "dynamodb_new_image_confirmed_kuwaiti_marketing_disclaimer_bool": "boolean",
-        "dynamodb_new_image_all_funds_external_client_id_s": "string",
-        "dynamodb_new_image_created_at_n": "bigint",
-        "dynamodb_new_image_order_execution_policy_reviewed_bool": "boolean",
-        "dynamodb_new_image_terms_reviewed_bool": "boolean",
-        "dynamodb_new_image_appropriateness_score_n": "double",
-        "dynamodb_new_image_all_funds_contract_creation_date_s": "string",
-        "dynamodb_new_image_all_funds_contract_id_n": "int",
-        "dynamodb_new_image_confirmed_non_usacitizenship_bool": "boolean",
-        "dynamodb_new_image_risk_profile_s": "string",
-        "dynamodb_new_image_all_funds_client_id_s": "string",
-        "dynamodb_new_image_risk_warning_notice_reviewed_bool": "boolean",
-        "dynamodb_new_image_user_id_s": "string",
-        "dynamodb_new_image_updated_at_n": "bigint",
-        "dynamodb_new_image_id_s": "string",
-        "dynamodb_new_image_all_funds_external_contract_id_s": "string",
-        "dynamodb_new_image_confirmed_interest_in_product_offering_bool": "boolean",
-        "dynamodb_new_image_onboarded_with_all_funds_bool": "boolean",
-        "dynamodb_new_image_agreed_to_investments_documents_bool": "boolean",
-        "dynamodb_new_image_risk_assessment_data_m_assessments_taken_n": "int",
-        "dynamodb_new_image_risk_assessment_data_m_score_n": "double",
-        "dynamodb_new_image_risk_assessment_data_m_assessment_date_s": "string",
-        "dynamodb_new_image_risk_assessment_data_m_answers_l_0_m_question_ref_s": "string",
-        "dynamodb_new_image_risk_assessment_data_m_answers_l_0_m_answer_ref_s": "string",
-        "dynamodb_new_image_risk_assessment_data_m_category_text_s": "string",
-        "dynamodb_new_image_risk_assessment_data_m_category_n": "int",
-        "dynamodb_new_image_risk_assessment_data_m_provider_user_id_s": "string",
-        "dynamodb_new_image_risk_assessment_data_m_provider_name_s": "string",
-        "dynamodb_new_image_risk_assessment_data_m_provider_registration_date_s": "string",
-        "dynamodb_new_image_provider_model_portfolio_id_s": "string",
-        "dynamodb_new_image_residence_country_s": "string",
-        "dynamodb_new_image_appropriateness_profile_m_past_performance_n": "double",
-        "dynamodb_new_image_appropriateness_profile_m_investment_frequency_s": "string",
-        "dynamodb_new_image_appropriateness_profile_m_investment_experience_s": "string",
-        "dynamodb_new_image_appropriateness_profile_m_information_sources_l_0_s": "string",
-        "dynamodb_new_image_appropriateness_profile_m_diversion_n": "double",
-        "dynamodb_new_image_appropriateness_profile_m_risk_n": "double",
-        "dynamodb_new_image_appropriateness_profile_m_investment_experience_amount_s": "string",
-        "dynamodb_new_image_capital_risk_accepted_bool": "boolean",
-        "dynamodb_new_image_appropriateness_profile_m_information_sources_l_1_s": "string",
-        "dynamodb_new_image_appropriateness_profile_m_information_sources_l_2_s": "string",
-        "dynamodb_new_image_appropriateness_profile_m_information_sources_l_3_s": "string",
-        "dynamodb_keys_id_s": "string",
-        "event_source": "string",
-        "timestamp_extracted": "timestamp",
-        "aws_region": "string",
-        "event_id": "string",
-        "event_name": "string",
-        "record_format": "string",
-        "table_name": "string",
-        "dynamodb_approximate_creation_date_time": "bigint",
-        "dynamodb_size_bytes": "bigint",
-        "date": "string",
-    },
-    "dynamo_default_investment_sell": {
-        "dynamodb_new_image_encoded_key_s": "string",
-        "dynamodb_new_image_provider_account_id_s": "string",
-        "dynamodb_new_image_expected_settlement_date_s": "string",
-        "dynamodb_new_image_ordered_at_s": "string",
-        "dynamodb_new_image_order_id_s": "string",
-        "dynamodb_new_image_status_s": "string",
-        "dynamodb_new_image_tenant_id_s": "string",
-        "dynamodb_new_image_trace_l_0_s": "string",
-        "dynamodb_new_image_trace_l_1_s": "string",
-        "dynamodb_new_image_trace_l_2_s": "string",
-        "dynamodb_new_image_trace_l_3_s": "string",
-        "dynamodb_new_image_created_at_n": "timestamp",
-        "dynamodb_new_image_price_per_share_on_sell_m_value_n": "double",
-        "dynamodb_new_image_price_per_share_on_sell_m_currency_s": "string",
-        "dynamodb_new_image_provider_sell_id_s": "string",
-        "dynamodb_new_image_updated_at_n": "timestamp",
-        "dynamodb_new_image_user_id_s": "string",
-        "dynamodb_new_image_amount_m_value_n": "double",
-        "dynamodb_new_image_amount_m_currency_s": "string",
-        "dynamodb_new_image_provider_s": "string",
-        "dynamodb_new_image_provider_investment_id_s": "string",
-        "dynamodb_keys_id_s": "string",
-        "dynamodb_new_image_trace_id_s": "string",
-        "dynamodb_new_image_shares_n": "double",
-        "dynamodb_new_image_settlement_date_s": "string",
-        "dynamodb_new_image_settlement_shares_n": "double",
-        "dynamodb_new_image_settlement_currency_s": "string",
-        "dynamodb_new_image_confirmed_at_s": "string",
-        "dynamodb_new_image_investment_name_s": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_confirmation_date_s": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_ccc_s": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_calculated_cross_amount_n": "double",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_secondary_key_s": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_all_funds_house_commission_n": "double",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_portfolio_indicator_s": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_performance_fee_n": "double",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_fund_code_s": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_cut_off_date_s": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_price_n": "double",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_ccv_s": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_all_funds_fund_code_s": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_source_contract_s": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_fund_identification_type_s": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_subdistributor_s": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_settlement_date_s": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_operation_number2_s": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_fund_manager_settlement_date_s": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_sequence_s": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_data_time_s": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_distributor_commission2_n": "double",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_amount_to_be_settled_n": "double",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_deposit_n": "double",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_operation_type_s": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_fund_name_s": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_payment_currency_s": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_confirmed_shares_n": "double",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_operation_date_s": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_distributor_code_s": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_distributor_commission1_n": "double",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_switch_fixing_n": "double",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_operation_number_s": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_currency_s": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_corporate_action_id_s": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_all_funds_operation_number2_s": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_product_s": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_entity_code_s": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_data_date_s": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_nav_date_s": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_all_funds_operation_number_s": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_record_type_s": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_record_subtype_s": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_agreed_fixing_currency_s": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_calculated_net_amount_n": "double",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_counter_value_n": "double",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_all_funds_contract_s": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_fund_house_commission_n": "double",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_total_exchange_rate_n": "double",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_fund_commission_n": "double",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_exchange_indicator_s": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_primary_key_s": "string",
-        "dynamodb_new_image_settlement_amount_n": "double",
-        "dynamodb_new_image_trace_l_4_s": "string",
-        "dynamodb_new_image_trace_l_5_s": "string",
-        "dynamodb_new_image_trace_l_0_m_created_at_s": "string",
-        "dynamodb_new_image_trace_l_0_m_status_s": "string",
-        "dynamodb_new_image_trace_l_1_m_created_at_s": "string",
-        "dynamodb_new_image_trace_l_1_m_status_s": "string",
-        "dynamodb_new_image_trace_l_2_m_created_at_s": "string",
-        "dynamodb_new_image_trace_l_2_m_status_s": "string",
-        "dynamodb_new_image_trace_l_3_m_created_at_s": "string",
-        "dynamodb_new_image_trace_l_3_m_status_s": "string",
-        "dynamodb_new_image_trace_l_4_m_created_at_s": "string",
-        "dynamodb_new_image_trace_l_4_m_status_s": "string",
-        "dynamodb_new_image_trace_l_5_m_created_at_s": "string",
-        "dynamodb_new_image_trace_l_5_m_status_s": "string",
-        "source": "string",
-        "timestamp_extracted": "timestamp",
-        "aws_region": "string",
-        "event_id": "string",
-        "event_name": "string",
-        "record_format": "string",
-        "table_name": "string",
-        "dynamodb_approximate_creation_date_time": "bigint",
-        "dynamodb_new_image_rebalance_id_s": "string",
-        "dynamodb_new_image_id_s": "string",
-        "dynamodb_size_bytes": "bigint",
-        "event_source": "string",
-        "date": "string",
-    },
-    "dynamo_default_investment_fund": {
-        "dynamodb_new_image_fund_house_name_s": "string",
-        "dynamodb_new_image_price_updated_at_s": "date",
-        "dynamodb_new_image_currency_s": "string",
-        "dynamodb_new_image_average_return_n": "double",
-        "dynamodb_new_image_created_at_n": "bigint",
-        "dynamodb_new_image_logo_s": "string",
-        "dynamodb_new_image_name_s": "string",
-        "dynamodb_new_image_all_fund_id_s": "int",
-        "dynamodb_new_image_asset_class_s": "string",
-        "dynamodb_new_image_fund_provider_s": "string",
-        "dynamodb_new_image_isin_s": "string",
-        "dynamodb_new_image_risk_category_s": "string",
-        "dynamodb_new_image_updated_at_n": "string",
-        "dynamodb_new_image_id_s": "string",
-        "dynamodb_new_image_price_n": "double",
-        "dynamodb_new_image_isin_whitelisted_bool": "boolean",
-        "dynamodb_keys_id_s": "string",
-        "event_source": "string",
-        "timestamp_extracted": "timestamp",
-        "aws_region": "string",
-        "event_id": "string",
-        "event_name": "string",
-        "user_identity": "string",
-        "record_format": "string",
-        "table_name": "string",
-        "dynamodb_approximate_creation_date_time": "string",
-        "dynamodb_size_bytes": "int",
-        "date": "string",
-    },
-    "dynamo_sls_home_financing_mortgage": {
-        "dynamodb_new_image_currency_s": "string",
-        "dynamodb_new_image_balance_m_initial_n": "double",
-        "dynamodb_new_image_balance_m_outstanding_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_current_profit_rate_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_product_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_0_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_0_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_0_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_0_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_0_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_0_m_paid_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_0_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_0_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_0_m_repaid_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_1_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_1_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_1_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_1_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_1_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_1_m_paid_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_1_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_1_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_1_m_repaid_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_2_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_2_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_2_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_2_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_2_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_2_m_paid_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_2_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_2_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_2_m_repaid_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_3_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_3_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_3_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_3_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_3_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_3_m_paid_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_3_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_3_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_3_m_repaid_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_4_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_4_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_4_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_4_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_4_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_4_m_paid_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_4_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_4_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_5_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_5_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_5_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_5_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_5_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_5_m_paid_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_5_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_5_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_6_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_6_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_6_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_6_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_6_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_6_m_paid_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_6_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_6_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_7_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_7_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_7_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_7_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_7_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_7_m_paid_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_7_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_7_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_8_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_8_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_8_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_8_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_8_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_8_m_paid_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_8_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_8_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_9_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_9_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_9_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_9_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_9_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_9_m_paid_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_9_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_9_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_10_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_10_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_10_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_10_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_10_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_10_m_paid_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_10_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_10_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_11_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_11_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_11_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_11_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_11_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_11_m_paid_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_11_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_11_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_12_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_12_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_12_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_12_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_12_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_12_m_paid_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_12_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_12_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_13_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_13_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_13_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_13_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_13_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_13_m_paid_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_13_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_13_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_14_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_14_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_14_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_14_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_14_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_14_m_paid_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_14_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_14_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_15_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_15_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_15_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_15_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_15_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_15_m_paid_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_15_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_15_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_16_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_16_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_16_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_16_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_16_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_16_m_paid_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_16_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_16_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_17_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_17_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_17_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_17_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_17_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_17_m_paid_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_17_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_17_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_18_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_18_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_18_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_18_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_18_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_18_m_paid_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_18_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_18_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_19_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_19_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_19_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_19_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_19_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_19_m_paid_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_19_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_19_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_20_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_20_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_20_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_20_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_20_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_20_m_paid_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_20_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_20_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_21_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_21_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_21_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_21_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_21_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_21_m_paid_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_21_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_21_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_22_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_22_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_22_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_22_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_22_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_22_m_paid_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_22_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_22_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_23_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_23_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_23_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_23_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_23_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_23_m_paid_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_23_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_23_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_24_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_24_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_24_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_24_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_24_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_24_m_paid_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_24_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_24_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_25_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_25_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_25_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_25_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_25_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_25_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_25_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_25_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_26_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_26_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_26_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_26_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_26_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_26_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_26_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_26_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_27_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_27_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_27_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_27_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_27_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_27_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_27_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_27_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_28_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_28_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_28_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_28_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_28_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_28_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_28_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_28_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_29_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_29_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_29_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_29_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_29_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_29_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_29_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_29_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_30_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_30_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_30_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_30_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_30_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_30_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_30_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_30_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_31_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_31_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_31_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_31_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_31_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_31_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_31_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_31_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_32_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_32_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_32_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_32_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_32_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_32_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_32_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_32_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_33_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_33_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_33_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_33_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_33_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_33_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_33_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_33_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_34_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_34_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_34_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_34_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_34_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_34_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_34_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_34_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_35_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_35_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_35_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_35_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_35_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_35_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_35_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_35_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_36_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_36_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_36_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_36_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_36_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_36_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_36_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_36_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_37_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_37_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_37_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_37_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_37_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_37_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_37_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_37_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_38_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_38_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_38_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_38_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_38_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_38_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_38_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_38_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_39_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_39_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_39_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_39_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_39_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_39_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_39_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_39_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_40_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_40_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_40_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_40_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_40_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_40_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_40_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_40_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_41_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_41_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_41_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_41_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_41_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_41_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_41_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_41_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_42_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_42_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_42_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_42_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_42_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_42_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_42_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_42_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_43_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_43_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_43_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_43_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_43_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_43_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_43_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_43_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_44_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_44_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_44_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_44_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_44_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_44_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_44_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_44_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_45_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_45_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_45_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_45_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_45_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_45_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_45_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_45_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_46_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_46_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_46_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_46_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_46_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_46_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_46_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_46_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_47_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_47_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_47_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_47_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_47_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_47_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_47_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_47_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_48_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_48_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_48_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_48_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_48_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_48_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_48_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_48_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_49_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_49_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_49_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_49_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_49_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_49_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_49_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_49_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_50_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_50_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_50_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_50_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_50_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_50_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_50_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_50_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_51_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_51_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_51_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_51_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_51_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_51_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_51_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_51_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_52_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_52_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_52_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_52_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_52_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_52_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_52_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_52_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_53_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_53_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_53_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_53_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_53_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_53_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_53_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_53_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_54_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_54_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_54_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_54_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_54_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_54_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_54_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_54_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_55_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_55_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_55_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_55_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_55_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_55_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_55_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_55_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_56_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_56_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_56_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_56_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_56_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_56_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_56_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_56_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_57_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_57_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_57_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_57_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_57_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_57_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_57_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_57_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_58_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_58_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_58_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_58_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_58_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_58_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_58_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_58_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_59_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_59_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_59_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_59_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_59_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_59_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_59_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_59_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_60_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_60_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_60_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_60_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_60_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_60_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_60_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_60_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_61_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_61_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_61_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_61_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_61_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_61_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_61_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_61_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_62_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_62_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_62_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_62_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_62_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_62_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_62_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_62_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_63_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_63_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_63_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_63_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_63_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_63_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_63_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_63_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_64_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_64_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_64_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_64_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_64_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_64_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_64_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_64_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_65_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_65_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_65_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_65_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_65_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_65_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_65_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_65_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_66_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_66_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_66_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_66_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_66_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_66_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_66_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_66_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_67_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_67_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_67_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_67_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_67_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_67_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_67_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_67_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_68_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_68_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_68_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_68_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_68_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_68_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_68_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_68_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_69_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_69_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_69_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_69_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_69_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_69_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_69_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_69_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_70_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_70_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_70_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_70_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_70_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_70_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_70_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_70_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_71_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_71_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_71_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_71_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_71_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_71_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_71_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_71_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_72_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_72_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_72_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_72_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_72_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_72_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_72_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_72_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_73_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_73_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_73_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_73_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_73_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_73_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_73_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_73_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_74_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_74_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_74_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_74_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_74_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_74_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_74_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_74_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_75_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_75_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_75_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_75_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_75_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_75_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_75_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_75_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_76_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_76_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_76_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_76_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_76_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_76_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_76_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_76_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_77_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_77_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_77_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_77_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_77_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_77_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_77_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_77_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_78_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_78_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_78_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_78_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_78_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_78_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_78_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_78_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_79_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_79_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_79_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_79_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_79_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_79_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_79_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_79_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_80_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_80_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_80_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_80_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_80_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_80_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_80_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_80_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_81_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_81_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_81_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_81_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_81_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_81_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_81_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_81_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_82_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_82_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_82_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_82_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_82_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_82_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_82_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_82_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_83_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_83_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_83_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_83_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_83_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_83_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_83_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_83_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_84_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_84_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_84_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_84_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_84_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_84_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_84_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_84_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_85_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_85_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_85_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_85_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_85_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_85_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_85_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_85_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_86_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_86_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_86_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_86_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_86_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_86_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_86_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_86_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_87_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_87_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_87_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_87_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_87_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_87_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_87_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_87_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_88_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_88_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_88_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_88_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_88_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_88_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_88_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_88_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_89_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_89_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_89_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_89_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_89_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_89_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_89_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_89_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_90_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_90_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_90_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_90_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_90_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_90_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_90_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_90_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_91_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_91_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_91_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_91_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_91_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_91_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_91_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_91_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_92_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_92_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_92_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_92_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_92_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_92_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_92_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_92_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_93_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_93_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_93_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_93_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_93_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_93_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_93_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_93_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_94_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_94_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_94_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_94_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_94_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_94_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_94_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_94_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_95_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_95_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_95_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_95_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_95_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_95_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_95_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_95_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_96_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_96_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_96_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_96_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_96_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_96_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_96_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_96_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_97_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_97_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_97_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_97_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_97_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_97_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_97_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_97_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_98_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_98_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_98_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_98_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_98_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_98_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_98_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_98_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_99_m_principal_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_99_m_number_s": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_99_m_penalty_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_99_m_due_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_99_m_fee_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_99_m_paid_n": "int",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_99_m_state_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_99_m_profit_n": "double",
-        "dynamodb_new_image_loan_accounts_l_0_m_external_id_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_active_bool": "boolean",
-        "dynamodb_new_image_loan_accounts_l_0_m_encoded_key_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_start_date_s": "string",
-        "dynamodb_new_image_updated_at_n": "string",
-        "dynamodb_new_image_user_id_s": "string",
-        "dynamodb_new_image_mortgage_application_id_s": "string",
-        "dynamodb_new_image_status_s": "string",
-        "dynamodb_new_image_created_at_n": "bigint",
-        "dynamodb_new_image_term_n": "int",
-        "dynamodb_new_image_address_m_line2_s": "string",
-        "dynamodb_new_image_address_m_city_s": "string",
-        "dynamodb_new_image_address_m_line1_s": "string",
-        "dynamodb_new_image_address_m_country_code_s": "string",
-        "dynamodb_new_image_address_m_postal_code_s": "string",
-        "dynamodb_new_image_id_s": "string",
-        "dynamodb_new_image_current_account_m_balance_m_available_n": "double",
-        "dynamodb_new_image_current_account_m_balance_m_total_n": "double",
-        "dynamodb_new_image_current_account_m_currency_s": "string",
-        "dynamodb_new_image_current_account_m_id_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_4_m_repaid_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_5_m_repaid_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_6_m_repaid_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_7_m_repaid_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_8_m_repaid_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_9_m_repaid_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_10_m_repaid_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_11_m_repaid_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_12_m_repaid_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_13_m_repaid_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_14_m_repaid_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_15_m_repaid_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_16_m_repaid_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_17_m_repaid_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_18_m_repaid_date_s": "timestamp",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_19_m_repaid_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_20_m_repaid_date_s": "timestamp",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_21_m_repaid_date_s": "timestamp",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_22_m_repaid_date_s": "timestamp",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_23_m_repaid_date_s": "string",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_24_m_repaid_date_s": "timestamp",
-        "dynamodb_keys_id_s": "string",
-        "event_source": "string",
-        "timestamp_extracted": "timestamp",
-        "aws_region": "string",
-        "event_id": "string",
-        "event_name": "string",
-        "user_identity": "string",
-        "record_format": "string",
-        "table_name": "string",
-        "dynamodb_approximate_creation_date_time": "string",
-        "dynamodb_size_bytes": "string",
-        "dynamodb_new_image_loan_accounts_l": "string",
-        "dynamodb_new_image_salesforce_case_id_s": "string",
-        "dynamodb_new_image_loan_account_m_id_s": "string",
-        "dynamodb_new_image_financing_m_remaining_financing_m_value_s": "string",
-        "dynamodb_new_image_financing_m_required_financing_m_value_s": "string",
-        "dynamodb_new_image_salesforce_data_m_fixed_profit_rate_n": "string",
-        "dynamodb_newimage_customer_m_dob_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_1_m_certified_income_from_all_sources_s": "string",
-        "dynamodb_new_image_is_migrated_bool": "boolean",
-        "dynamodb_new_image_loan_accounts_l_0_m_installments_l_59_m_repaid_date_s": "timestamp",
-        "date": "string",
-    },
-    "dynamo_sls_exchange_rates": {
-        "dynamodb_new_image_sk_s": "string",
-        "dynamodb_new_image_date_s": "date",
-        "dynamodb_new_image_rate_n": "double",
-        "dynamodb_new_image_pk_s": "string",
-        "dynamodb_keys_pk_s": "string",
-        "event_source": "string",
-        "timestamp_extracted": "timestamp",
-        "aws_region": "string",
-        "event_id": "string",
-        "event_name": "string",
-        "user_identity": "string",
-        "record_format": "string",
-        "table_name": "string",
-        "dynamodb_approximate_creation_date_time": "timestamp",
-        "dynamodb_keys_sk_s": "string",
-        "dynamodb_size_bytes": "string",
-        "date": "string",
-    },
-    "dynamo_sls_customer_risk_us_person": {
-        "dynamodb_new_image_version_n": "bigint",
-        "dynamodb_new_image_updated_at_n": "timestamp",
-        "dynamodb_new_image_status_s": "string",
-        "dynamodb_new_image_created_at_n": "timestamp",
-        "dynamodb_new_image_is_usperson_bool": "boolean",
-        "dynamodb_new_image_customer_id_s": "string",
-        "dynamodb_new_image_is_suspected_usperson_bool": "boolean",
-        "dynamodb_new_image_suspected_reasons_l": "string",
-        "dynamodb_new_image_suspected_reasons_l_0_m_reason_s": "string",
-        "dynamodb_new_image_suspected_reasons_l_0_m_updated_at_s": "string",
-        "source": "string",
-        "timestamp_extracted": "string",
-        "aws_region": "string",
-        "event_id": "string",
-        "event_name": "string",
-        "user_identity": "string",
-        "record_format": "string",
-        "table_name": "string",
-        "dynamodb_approximate_creation_date_time": "timestamp",
-        "dynamodb_keys_customer_id_s": "string",
-        "dynamodb_size_bytes": "string",
-        "event_source": "string",
-        "dynamodb_new_image_suspected_reasons_l_1_m_reason_s": "string",
-        "dynamodb_new_image_suspected_reasons_l_1_m_updated_at_s": "string",
-        "dynamodb_new_image_suspected_reasons_l_2_m_reason_s": "string",
-        "dynamodb_new_image_suspected_reasons_l_2_m_updated_at_s": "string",
-        "dynamodb_new_image_suspected_reasons_l_3_m_reason_s": "string",
-        "dynamodb_new_image_suspected_reasons_l_3_m_updated_at_s": "string",
-        "dynamodb_new_image_suspected_reasons_l_4_m_reason_s": "string",
-        "dynamodb_new_image_suspected_reasons_l_4_m_updated_at_s": "string",
-        "date": "string",
-    },
-    "dynamo_sls_ddb_users_customer_passport_number": {
-        "dynamodb_new_image_created_at_n": "timestamp",
-        "dynamodb_new_image_customer_id_s": "string",
-        "dynamodb_new_image_passport_hash_s": "string",
-        "dynamodb_new_image_updated_at_n": "timestamp",
-        "source": "string",
-        "timestamp_extracted": "timestamp",
-        "aws_region": "string",
-        "dynamodb_approximate_creation_date_time": "timestamp",
-        "dynamodb_keys_passport_hash_s": "string",
-        "dynamodb_size_bytes": "string",
-        "event_id": "string",
-        "event_name": "string",
-        "event_source": "string",
-        "record_format": "string",
-        "table_name": "string",
-        "user_identity": "string",
-        "awsregion": "string",
-        "eventid": "string",
-        "eventname": "string",
-        "useridentity": "string",
-        "recordformat": "string",
-        "tablename": "string",
-        "dynamodb_approximatecreationdatetime": "timestamp",
-        "dynamodb_keys_passporthash_s": "string",
-        "dynamodb_newimage_createdat_n": "timestamp",
-        "dynamodb_newimage_passporthash_s": "string",
-        "dynamodb_newimage_updatedat_n": "timestamp",
-        "dynamodb_newimage_customerid_s": "string",
-        "dynamodb_sizebytes": "string",
-        "eventsource": "string",
-        "date": "string",
-    },
-    "dynamo_scv_sls_customers": {
-        "aws_region": "string",
-        "dynamodb_approximate_creation_date_time": "timestamp",
-        "dynamodb_keys_id_s": "string",
-        "dynamodb_new_image_card_ordered_bool": "boolean",
-        "dynamodb_new_image_created_at_n": "timestamp",
-        "dynamodb_new_image_email_s": "string",
-        "dynamodb_new_image_external_onfido_applicant_id_s": "string",
-        "dynamodb_new_image_external_refinitiv_system_case_id_s": "string",
-        "dynamodb_new_image_financial_crime_memos_l": "string",
-        "dynamodb_new_image_id_s": "string",
-        "dynamodb_new_image_individual_m_additional_document_types_l_0_s": "string",
-        "dynamodb_new_image_individual_m_address_m_cifas_check_passed_bool": "boolean",
-        "dynamodb_new_image_individual_m_address_m_city_s": "string",
-        "dynamodb_new_image_individual_m_address_m_civil_id_document_ids_l_0_s": "string",
-        "dynamodb_new_image_individual_m_address_m_civil_id_document_ids_l_1_s": "string",
-        "dynamodb_new_image_individual_m_address_m_country_code_s": "string",
-        "dynamodb_new_image_individual_m_address_m_line1_s": "string",
-        "dynamodb_new_image_individual_m_address_m_line2_s": "string",
-        "dynamodb_new_image_individual_m_address_m_postal_code_s": "string",
-        "dynamodb_new_image_individual_m_address_m_provider_s": "string",
-        "dynamodb_new_image_individual_m_address_m_status_s": "string",
-        "dynamodb_new_image_individual_m_date_of_birth_s": "string",
-        "dynamodb_new_image_individual_m_financial_details_m_asset_location_country_codes_l_0_s": "string",
-        "dynamodb_new_image_individual_m_financial_details_m_asset_types_l_0_s": "string",
-        "dynamodb_new_image_individual_m_financial_details_m_bank_account_location_country_codes_l_0_s": "string",
-        "dynamodb_new_image_individual_m_financial_details_m_estimated_assets_value_s": "string",
-        "dynamodb_new_image_individual_m_financial_details_m_income_sources_l_0_s": "string",
-        "dynamodb_new_image_individual_m_financial_details_m_monthly_income_s": "string",
-        "dynamodb_new_image_individual_m_financial_details_m_reason_for_opening_account_l_0_s": "string",
-        "dynamodb_new_image_individual_m_first_name_s": "string",
-        "dynamodb_new_image_individual_m_gender_s": "string",
-        "dynamodb_new_image_individual_m_government_id_number_s": "string",
-        "dynamodb_new_image_individual_m_identity_verification_m_document_expiry_date_s": "string",
-        "dynamodb_new_image_individual_m_identity_verification_m_document_number_s": "string",
-        "dynamodb_new_image_individual_m_identity_verification_m_document_type_s": "string",
-        "dynamodb_new_image_individual_m_identity_verification_m_issuing_country_s": "string",
-        "dynamodb_new_image_individual_m_identity_verification_m_issuing_date_s": "string",
-        "dynamodb_new_image_individual_m_identity_verification_m_mrz_line1_s": "string",
-        "dynamodb_new_image_individual_m_identity_verification_m_mrz_line2_s": "string",
-        "dynamodb_new_image_individual_m_identity_verification_m_place_of_birth_s": "string",
-        "dynamodb_new_image_individual_m_identity_verification_m_report_link_s": "string",
-        "dynamodb_new_image_individual_m_identity_verification_m_status_s": "string",
-        "dynamodb_new_image_individual_m_individual_screening_m_result_m_adverse_media_check_passed_bool": "boolean",
-        "dynamodb_new_image_individual_m_individual_screening_m_result_m_pep_check_passed_bool": "boolean",
-        "dynamodb_new_image_individual_m_individual_screening_m_result_m_sanction_check_passed_bool": "boolean",
-        "dynamodb_new_image_individual_m_individual_screening_m_status_s": "string",
-        "dynamodb_new_image_individual_m_last_name_s": "string",
-        "dynamodb_new_image_individual_m_nationality_country_code_s": "string",
-        "dynamodb_new_image_individual_m_nickname_s": "string",
-        "dynamodb_new_image_individual_m_tax_ids_l_0_m_country_code_s": "string",
-        "dynamodb_new_image_individual_m_tax_ids_l_0_m_skip_reason_s": "string",
-        "dynamodb_new_image_individual_m_tax_ids_l_0_m_value_s": "string",
-        "dynamodb_new_image_internal_one_signal_user_id_s": "string",
-        "dynamodb_new_image_onboarding_completed_at_s": "string",
-        "dynamodb_new_image_onfido_retry_reason_memos_l": "string",
-        "dynamodb_new_image_phone_number_s": "string",
-        "dynamodb_new_image_preferences_m_email_notifications_m_marketing_bool": "boolean",
-        "dynamodb_new_image_preferences_m_sms_notifications_m_marketing_bool": "boolean",
-        "dynamodb_new_image_public_encryption_key_s": "string",
-        "dynamodb_new_image_risk_m_factors_m_channel_risk_score_n": "int",
-        "dynamodb_new_image_risk_m_factors_m_country_risk_score_n": "int",
-        "dynamodb_new_image_risk_m_factors_m_customer_risk_score_n": "int",
-        "dynamodb_new_image_risk_m_factors_m_product_risk_score_n": "int",
-        "dynamodb_new_image_risk_m_rating_s": "string",
-        "dynamodb_new_image_risk_m_score_n": "int",
-        "dynamodb_new_image_risk_m_updated_at_s": "string",
-        "dynamodb_new_image_status_s": "string",
-        "dynamodb_new_image_tags_l": "string",
-        "dynamodb_new_image_tos_acceptance_m_agreed_at_s": "string",
-        "dynamodb_new_image_tos_acceptance_m_app_version_s": "string",
-        "dynamodb_new_image_tos_acceptance_m_ip_address_s": "string",
-        "dynamodb_new_image_tos_acceptance_m_user_agent_s": "string",
-        "dynamodb_new_image_type_s": "string",
-        "dynamodb_new_image_updated_at_n": "timestamp",
-        "dynamodb_size_bytes": "string",
-        "event_id": "string",
-        "event_name": "string",
-        "event_source": "string",
-        "record_format": "string",
-        "table_name": "string",
-        "user_identity": "string",
-        "timestamp_extracted": "timestamp",
-        "dynamodb_new_image_individual_m_additional_document_types_l": "string",
-        "dynamodb_new_image_individual_m_address_m_civil_id_document_ids_l": "string",
-        "dynamodb_new_image_individual_m_financial_details_m_asset_types_l_1_s": "string",
-        "dynamodb_new_image_individual_m_financial_details_m_reason_for_opening_account_l_1_s": "string",
-        "dynamodb_new_image_individual_m_financial_details_m": "string",
-        "dynamodb_new_image_individual_m_financial_details_m_reason_for_opening_account_l_2_s": "string",
-        "dynamodb_new_image_individual_m_individual_screening_m_result_m": "string",
-        "dynamodb_new_image_individual_m_financial_details_m_bank_account_location_country_codes_l_1_s": "string",
-        "dynamodb_new_image_individual_m_financial_details_m_asset_types_l_2_s": "string",
-        "dynamodb_new_image_individual_m_financial_details_m_asset_types_l_3_s": "string",
-        "dynamodb_new_image_individual_m_financial_details_m_income_sources_l_1_s": "string",
-        "dynamodb_new_image_individual_m_financial_details_m_asset_location_country_codes_l_1_s": "string",
-        "dynamodb_new_image_individual_m_tax_ids_l_1_m_country_code_s": "string",
-        "dynamodb_new_image_individual_m_tax_ids_l_1_m_skip_reason_s": "string",
-        "dynamodb_new_image_individual_m_tax_ids_l_1_m_value_s": "string",
-        "dynamodb_new_image_individual_m_financial_details_m_bank_account_location_country_codes_l_2_s": "string",
-        "dynamodb_new_image_individual_m_financial_details_m_income_sources_l_2_s": "string",
-        "dynamodb_new_image_individual_m_financial_details_m_asset_location_country_codes_l_2_s": "string",
-        "dynamodb_new_image_individual_m_financial_details_m_asset_location_country_codes_l_3_s": "string",
-        "dynamodb_new_image_individual_m_financial_details_m_asset_location_country_codes_l_4_s": "string",
-        "dynamodb_new_image_individual_m_financial_details_m_bank_account_location_country_codes_l_3_s": "string",
-        "dynamodb_new_image_individual_m_financial_details_m_bank_account_location_country_codes_l_4_s": "string",
-        "dynamodb_new_image_individual_m_financial_details_m_asset_location_country_codes_l_5_s": "string",
-        "dynamodb_new_image_individual_m_financial_details_m_asset_location_country_codes_l_6_s": "string",
-        "source": "string",
-        "dynamodb_new_image_individual_m_financial_details_m_income_sources_l_3_s": "string",
-        "dynamodb_new_image_individual_m_financial_details_m_asset_location_country_codes_l_10_s": "string",
-        "dynamodb_new_image_individual_m_financial_details_m_asset_location_country_codes_l_7_s": "string",
-        "dynamodb_new_image_individual_m_financial_details_m_asset_location_country_codes_l_8_s": "string",
-        "dynamodb_new_image_individual_m_financial_details_m_asset_location_country_codes_l_9_s": "string",
-        "dynamodb_new_image_individual_m_tax_ids_l_2_m_country_code_s": "string",
-        "dynamodb_new_image_individual_m_tax_ids_l_2_m_skip_reason_s": "string",
-        "dynamodb_new_image_individual_m_tax_ids_l_2_m_value_s": "string",
-        "dynamodb_new_image_individual_m_financial_details_m_bank_account_location_country_codes_l_5_s": "string",
-        "dynamodb_new_image_individual_m_tax_ids_l_3_m_country_code_s": "string",
-        "dynamodb_new_image_individual_m_tax_ids_l_3_m_skip_reason_s": "string",
-        "dynamodb_new_image_individual_m_tax_ids_l_3_m_value_s": "string",
-        "dynamodb_new_image_onfido_retry_reason_memos_l_0_m_created_at_s": "string",
-        "dynamodb_new_image_onfido_retry_reason_memos_l_0_m_owner_s": "string",
-        "dynamodb_new_image_onfido_retry_reason_memos_l_0_m_text_s": "string",
-        "dynamodb_new_image_onfido_retry_reason_memos_l_1_m_created_at_s": "string",
-        "dynamodb_new_image_onfido_retry_reason_memos_l_1_m_owner_s": "string",
-        "dynamodb_new_image_onfido_retry_reason_memos_l_1_m_text_s": "string",
-        "dynamodb_new_image_individual_m_tax_ids_l_4_m_country_code_s": "string",
-        "dynamodb_new_image_individual_m_tax_ids_l_4_m_skip_reason_s": "string",
-        "dynamodb_new_image_individual_m_tax_ids_l_4_m_value_s": "string",
-        "dynamodb_new_image_individual_m_tax_ids_l": "string",
-        "dynamodb_new_image_tags_l_0_s": "string",
-        "dynamodb_new_image_individual_m_financial_details_m_bank_account_location_country_codes_l_6_s": "string",
-        "dynamodb_new_image_individual_m_financial_details_m_bank_account_location_country_codes_l_7_s": "string",
-        "dynamodb_new_image__version_s": "string",
-        "dynamodb_new_image_onfido_retry_reason_memos_l_2_m_created_at_s": "string",
-        "dynamodb_new_image_onfido_retry_reason_memos_l_2_m_owner_s": "string",
-        "dynamodb_new_image_onfido_retry_reason_memos_l_2_m_text_s": "string",
-        "dynamodb_new_image_tags_l_1_s": "string",
-        "dynamodb_new_image_tags_l_2_s": "string",
-        "dynamodb_new_image_tags_l_3_s": "string",
-        "dynamodb_new_image_financial_crime_memos_l_0_m_created_at_s": "string",
-        "dynamodb_new_image_financial_crime_memos_l_0_m_owner_s": "string",
-        "dynamodb_new_image_financial_crime_memos_l_0_m_text_s": "string",
-        "dynamodb_new_image_financial_crime_memos_l_1_m_created_at_s": "string",
-        "dynamodb_new_image_financial_crime_memos_l_1_m_owner_s": "string",
-        "dynamodb_new_image_financial_crime_memos_l_1_m_text_s": "string",
-        "dynamodb_new_image_individual_m_identity_verification_m_report_result_s": "string",
-        "dynamodb_new_image_individual_m_address_m_report_link_s": "string",
-        "dynamodb_new_image_preferences_m_email_notifications_m_account_bool": "boolean",
-        "dynamodb_new_image_preferences_m_push_notifications_m_account_bool": "boolean",
-        "dynamodb_new_image_preferences_m_push_notifications_m_marketing_bool": "boolean",
-        "dynamodb_new_image_preferences_m_sms_notifications_m_account_bool": "boolean",
-        "dynamodb_new_image_preferences_m_push_notifications_m": "string",
-        "dynamodb_new_image_individual_m_financial_details_m_reason_for_opening_account_l_3_s": "string",
-        "dynamodb_new_image_individual_m_financial_details_m_reason_for_opening_account_l_4_s": "string",
-        "dynamodb_new_image_individual_m_financial_details_m_reason_for_opening_account_l_5_s": "string",
-        "dynamodb_new_image_individual_m_financial_details_m_reason_for_opening_account_l_6_s": "string",
-        "dynamodb_new_image_individual_m_financial_details_m_reason_for_opening_account_l_7_s": "string",
-        "dynamodb_new_image_individual_m_tax_ids_l_5_m_country_code_s": "string",
-        "dynamodb_new_image_individual_m_tax_ids_l_5_m_skip_reason_s": "string",
-        "dynamodb_new_image_individual_m_tax_ids_l_5_m_value_s": "string",
-        "dynamodb_new_image_onfido_retry_reason_memos_l_3_m_created_at_s": "string",
-        "dynamodb_new_image_onfido_retry_reason_memos_l_3_m_owner_s": "string",
-        "dynamodb_new_image_onfido_retry_reason_memos_l_3_m_text_s": "string",
-        "dynamodb_new_image_individual_m_financial_details_m_asset_location_country_codes_l": "string",
-        "dynamodb_new_image_individual_m_tax_ids_l_6_m_country_code_s": "string",
-        "dynamodb_new_image_individual_m_tax_ids_l_6_m_skip_reason_s": "string",
-        "dynamodb_new_image_individual_m_tax_ids_l_6_m_value_s": "string",
-        "dynamodb_new_image_individual_m_tax_ids_l_7_m_country_code_s": "string",
-        "dynamodb_new_image_individual_m_tax_ids_l_7_m_skip_reason_s": "string",
-        "dynamodb_new_image_individual_m_tax_ids_l_7_m_value_s": "string",
-        "dynamodb_new_image_onfido_retry_reason_memos_l_4_m_created_at_s": "string",
-        "dynamodb_new_image_onfido_retry_reason_memos_l_4_m_owner_s": "string",
-        "dynamodb_new_image_onfido_retry_reason_memos_l_4_m_text_s": "string",
-        "dynamodb_new_image_onfido_retry_reason_memos_l_5_m_created_at_s": "string",
-        "dynamodb_new_image_onfido_retry_reason_memos_l_5_m_owner_s": "string",
-        "dynamodb_new_image_onfido_retry_reason_memos_l_5_m_text_s": "string",
-        "dynamodb_new_image_individual_m_financial_details_m_bank_location_country_codes_l_0_s": "string",
-        "dynamodb_new_image_individual_m_financial_details_m_bank_location_country_codes_l_1_s": "string",
-        "dynamodb_new_image_individual_m_financial_details_m_bank_account_location_country_codes_l": "string",
-        "dynamodb_new_image_individual_m_financial_details_m_status_s": "string",
-        "dynamodb_new_image_individual_m_tax_ids_l_10_m_country_code_s": "string",
-        "dynamodb_new_image_individual_m_tax_ids_l_10_m_skip_reason_s": "string",
-        "dynamodb_new_image_individual_m_tax_ids_l_10_m_value_s": "string",
-        "dynamodb_new_image_individual_m_tax_ids_l_11_m_country_code_s": "string",
-        "dynamodb_new_image_individual_m_tax_ids_l_11_m_skip_reason_s": "string",
-        "dynamodb_new_image_individual_m_tax_ids_l_11_m_value_s": "string",
-        "dynamodb_new_image_individual_m_tax_ids_l_8_m_country_code_s": "string",
-        "dynamodb_new_image_individual_m_tax_ids_l_8_m_skip_reason_s": "string",
-        "dynamodb_new_image_individual_m_tax_ids_l_8_m_value_s": "string",
-        "dynamodb_new_image_individual_m_tax_ids_l_9_m_country_code_s": "string",
-        "dynamodb_new_image_individual_m_tax_ids_l_9_m_skip_reason_s": "string",
-        "dynamodb_new_image_individual_m_tax_ids_l_9_m_value_s": "string",
-        "dynamodb_new_image_individual_m_financial_details_m_income_m_currency_s": "string",
-        "dynamodb_new_image_individual_m_financial_details_m_income_m_frequency_s": "string",
-        "dynamodb_new_image_individual_m_financial_details_m_income_m_max_n": "string",
-        "dynamodb_new_image_individual_m_financial_details_m_income_m_min_n": "string",
-        "dynamodb_new_image_individual_m_financial_details_m_assets_value_m_currency_s": "string",
-        "dynamodb_new_image_individual_m_financial_details_m_assets_value_m_max_n": "string",
-        "dynamodb_new_image_individual_m_financial_details_m_assets_value_m_min_n": "string",
-        "dynamodb_new_image_email_verified_bool": "boolean",
-        "dynamodb_new_image_tags_s": "string",
-        "dynamodb_new_image_is_usperson_bool": "boolean",
-        "dynamodb_new_image_is_under_age_bool": "boolean",
-        "dynamodb_new_image_brand_id_s": "string",
-        "dynamodb_new_image_risk_m": "string",
-        "dynamodb_key_id_s": "string",
-        "dynamodb_new_image_conform_to_schema_m": "string",
-        "dynamodb_new_image_created_at_m": "string",
-        "dynamodb_new_image_to_dynamo_m": "string",
-        "dynamodb_new_image_updated_at_m": "string",
-        "dynamodb_new_image_onfido_retry_reason_memos_l_6_m_created_at_s": "string",
-        "dynamodb_new_image_onfido_retry_reason_memos_l_6_m_owner_s": "string",
-        "dynamodb_new_image_onfido_retry_reason_memos_l_6_m_text_s": "string",
-        "dynamodb_new_image_onfido_retry_reason_memos_l_7_m_created_at_s": "string",
-        "dynamodb_new_image_onfido_retry_reason_memos_l_7_m_owner_s": "string",
-        "dynamodb_new_image_onfido_retry_reason_memos_l_7_m_text_s": "string",
-        "dynamodb_new_image_financial_crime_memos_l_2_m_created_at_s": "string",
-        "dynamodb_new_image_financial_crime_memos_l_2_m_owner_s": "string",
-        "dynamodb_new_image_financial_crime_memos_l_2_m_text_s": "string",
-        "dynamodb_new_image_financial_crime_memos_l_3_m_created_at_s": "string",
-        "dynamodb_new_image_financial_crime_memos_l_3_m_owner_s": "string",
-        "dynamodb_new_image_financial_crime_memos_l_3_m_text_s": "string",
-        "dynamodb_new_image_cifas_check_passed_bool": "boolean",
-        "dynamodb_new_image_city_s": "string",
-        "dynamodb_new_image_country_code_s": "string",
-        "dynamodb_new_image_customer_id_s": "string",
-        "dynamodb_new_image_document_ids_l": "string",
-        "dynamodb_new_image_line1_s": "string",
-        "dynamodb_new_image_line2_s": "string",
-        "dynamodb_new_image_postal_code_s": "string",
-        "dynamodb_new_image_version_n": "int",
-        "dynamodb_new_image_financial_crime_memos_l_4_m_created_at_s": "string",
-        "dynamodb_new_image_financial_crime_memos_l_4_m_owner_s": "string",
-        "dynamodb_new_image_financial_crime_memos_l_4_m_text_s": "string",
-        "dynamodb_new_image_individual_m_financial_details_m_bank_account_location_country_codes_l_10_s": "string",
-        "dynamodb_new_image_individual_m_financial_details_m_bank_account_location_country_codes_l_8_s": "string",
-        "dynamodb_new_image_individual_m_financial_details_m_bank_account_location_country_codes_l_9_s": "string",
-        "index": "bigint",
-        "dynamodb_new_image_financial_crime_memos_l_5_m_created_at_s": "string",
-        "dynamodb_new_image_financial_crime_memos_l_5_m_owner_s": "string",
-        "dynamodb_new_image_financial_crime_memos_l_5_m_text_s": "string",
-        "awsregion": "string",
-        "eventid": "string",
-        "eventname": "string",
-        "useridentity": "string",
-        "recordformat": "string",
-        "tablename": "string",
-        "dynamodb_approximatecreationdatetime": "timestamp",
-        "dynamodb_newimage_phonenumber_s": "string",
-        "dynamodb_newimage_financialcrimememos_l": "string",
-        "dynamodb_newimage_status_s": "string",
-        "dynamodb_newimage_createdat_n": "timestamp",
-        "dynamodb_newimage_internalonesignaluserid_s": "string",
-        "dynamodb_newimage_email_s": "string",
-        "dynamodb_newimage_isusperson_bool": "boolean",
-        "dynamodb_newimage_isunderage_bool": "boolean",
-        "dynamodb_newimage_emailverified_bool": "boolean",
-        "dynamodb_newimage_publicencryptionkey_s": "string",
-        "dynamodb_newimage__version_s": "string",
-        "dynamodb_newimage_risk_m_rating_s": "string",
-        "dynamodb_newimage_updatedat_n": "timestamp",
-        "dynamodb_newimage_brandid_s": "string",
-        "dynamodb_newimage_cardordered_bool": "boolean",
-        "dynamodb_newimage_individual_m_nickname_s": "string",
-        "dynamodb_newimage_individual_m_identityverification_m_placeofbirth_s": "string",
-        "dynamodb_newimage_individual_m_identityverification_m_reportlink_s": "string",
-        "dynamodb_newimage_individual_m_identityverification_m_documenttype_s": "string",
-        "dynamodb_newimage_individual_m_identityverification_m_issuingcountry_s": "string",
-        "dynamodb_newimage_individual_m_identityverification_m_documentnumber_s": "string",
-        "dynamodb_newimage_individual_m_identityverification_m_mrzline1_s": "string",
-        "dynamodb_newimage_individual_m_identityverification_m_status_s": "string",
-        "dynamodb_newimage_individual_m_identityverification_m_mrzline2_s": "string",
-        "dynamodb_newimage_individual_m_individualscreening_m_result_m": "string",
-        "dynamodb_newimage_individual_m_individualscreening_m_status_s": "string",
-        "dynamodb_newimage_individual_m_financialdetails_m_status_s": "string",
-        "dynamodb_newimage_individual_m_address_m_countrycode_s": "string",
-        "dynamodb_newimage_individual_m_address_m_status_s": "string",
-        "dynamodb_newimage_individual_m_address_m_civiliddocumentids_l": "string",
-        "dynamodb_newimage_individual_m_additionaldocumenttypes_l": "string",
-        "dynamodb_newimage_externalonfidoapplicantid_s": "string",
-        "dynamodb_newimage_preferences_m_emailnotifications_m_marketing_bool": "boolean",
-        "dynamodb_newimage_preferences_m_emailnotifications_m_account_bool": "boolean",
-        "dynamodb_newimage_preferences_m_smsnotifications_m_marketing_bool": "boolean",
-        "dynamodb_newimage_preferences_m_smsnotifications_m_account_bool": "boolean",
-        "dynamodb_newimage_preferences_m_pushnotifications_m_marketing_bool": "boolean",
-        "dynamodb_newimage_preferences_m_pushnotifications_m_account_bool": "boolean",
-        "dynamodb_newimage_tosacceptance_m_ipaddress_s": "string",
-        "dynamodb_newimage_tosacceptance_m_agreedat_s": "string",
-        "dynamodb_newimage_tosacceptance_m_appversion_s": "string",
-        "dynamodb_newimage_tosacceptance_m_useragent_s": "string",
-        "dynamodb_newimage_onfidoretryreasonmemos_l_0_m_owner_s": "string",
-        "dynamodb_newimage_onfidoretryreasonmemos_l_0_m_createdat_s": "string",
-        "dynamodb_newimage_onfidoretryreasonmemos_l_0_m_text_s": "string",
-        "dynamodb_newimage_id_s": "string",
-        "dynamodb_newimage_tags_l": "string",
-        "dynamodb_newimage_type_s": "string",
-        "dynamodb_sizebytes": "string",
-        "eventsource": "string",
-        "dynamodb_newimage_onfidoretryreasonmemos_l": "string",
-        "dynamodb_newimage_individual_m_address_m_provider_s": "string",
-        "dynamodb_newimage_individual_m_address_m_city_s": "string",
-        "dynamodb_newimage_individual_m_address_m_line2_s": "string",
-        "dynamodb_newimage_individual_m_address_m_line1_s": "string",
-        "dynamodb_newimage_individual_m_taxids_l_0_m_value_s": "string",
-        "dynamodb_newimage_individual_m_taxids_l_0_m_countrycode_s": "string",
-        "dynamodb_newimage_individual_m_taxids_l_0_m_skipreason_s": "string",
-        "dynamodb_newimage_risk_m_score_n": "string",
-        "dynamodb_newimage_risk_m_factors_m_countryriskscore_n": "string",
-        "dynamodb_newimage_risk_m_factors_m_customerriskscore_n": "string",
-        "dynamodb_newimage_risk_m_factors_m_productriskscore_n": "string",
-        "dynamodb_newimage_risk_m_factors_m_channelriskscore_n": "string",
-        "dynamodb_newimage_risk_m_updatedat_s": "string",
-        "dynamodb_newimage_individual_m_firstname_s": "string",
-        "dynamodb_newimage_individual_m_lastname_s": "string",
-        "dynamodb_newimage_individual_m_gender_s": "string",
-        "dynamodb_newimage_individual_m_nationalitycountrycode_s": "string",
-        "dynamodb_newimage_individual_m_identityverification_m_documentexpirydate_s": "string",
-        "dynamodb_newimage_individual_m_individualscreening_m_result_m_sanctioncheckpassed_bool": "boolean",
-        "dynamodb_newimage_individual_m_individualscreening_m_result_m_adversemediacheckpassed_bool": "boolean",
-        "dynamodb_newimage_individual_m_individualscreening_m_result_m_pepcheckpassed_bool": "boolean",
-        "dynamodb_newimage_individual_m_dateofbirth_s": "string",
-        "dynamodb_newimage_externalrefinitivsystemcaseid_s": "string",
-        "dynamodb_newimage_individual_m_address_m_postalcode_s": "string",
-        "dynamodb_newimage_individual_m_financialdetails_m_income_m_currency_s": "string",
-        "dynamodb_newimage_individual_m_financialdetails_m_income_m_min_n": "string",
-        "dynamodb_newimage_individual_m_financialdetails_m_income_m_max_n": "string",
-        "dynamodb_newimage_individual_m_financialdetails_m_income_m_frequency_s": "string",
-        "dynamodb_newimage_individual_m_financialdetails_m_assettypes_l_0_s": "string",
-        "dynamodb_newimage_individual_m_financialdetails_m_assettypes_l_1_s": "string",
-        "dynamodb_newimage_individual_m_financialdetails_m_incomesources_l_0_s": "string",
-        "dynamodb_newimage_individual_m_financialdetails_m_estimatedassetsvalue_s": "string",
-        "dynamodb_newimage_individual_m_financialdetails_m_reasonforopeningaccount_l_0_s": "string",
-        "dynamodb_newimage_individual_m_financialdetails_m_reasonforopeningaccount_l_1_s": "string",
-        "dynamodb_newimage_individual_m_financialdetails_m_reasonforopeningaccount_l_2_s": "string",
-        "dynamodb_newimage_individual_m_financialdetails_m_reasonforopeningaccount_l_3_s": "string",
-        "dynamodb_newimage_individual_m_financialdetails_m_reasonforopeningaccount_l_4_s": "string",
-        "dynamodb_newimage_individual_m_financialdetails_m_reasonforopeningaccount_l_5_s": "string",
-        "dynamodb_newimage_individual_m_financialdetails_m_reasonforopeningaccount_l_6_s": "string",
-        "dynamodb_newimage_individual_m_financialdetails_m_assetsvalue_m_max_n": "string",
-        "dynamodb_newimage_individual_m_financialdetails_m_assetsvalue_m_currency_s": "string",
-        "dynamodb_newimage_individual_m_financialdetails_m_assetsvalue_m_min_n": "string",
-        "dynamodb_newimage_individual_m_financialdetails_m_monthlyincome_s": "string",
-        "dynamodb_newimage_onboardingcompletedat_s": "string",
-        "dynamodb_newimage_individual_m_address_m_cifascheckpassed_bool": "boolean",
-        "dynamodb_newimage_individual_m_governmentidnumber_s": "string",
-        "dynamodb_newimage_individual_m_address_m_reportlink_s": "string",
-        "dynamodb_newimage_individual_m_address_m_civiliddocumentids_l_0_s": "string",
-        "dynamodb_newimage_individual_m_address_m_civiliddocumentids_l_1_s": "string",
-        "dynamodb_newimage_individual_m_identityverification_m_issuingdate_s": "string",
-        "dynamodb_newimage_individual_m_identityverification_m_reportresult_s": "string",
-        "dynamodb_newimage_individual_m_financialdetails_m_bankaccountlocationcountrycodes_l_0_s": "string",
-        "dynamodb_newimage_individual_m_financialdetails_m_incomesources_l_1_s": "string",
-        "dynamodb_newimage_individual_m_financialdetails_m_assetlocationcountrycodes_l_0_s": "string",
-        "dynamodb_newimage_individual_m_financialdetails_m_assetlocationcountrycodes_l_1_s": "string",
-        "dynamodb_newimage_individual_m_financialdetails_m_assettypes_l_2_s": "string",
-        "dynamodb_newimage_individual_m_financialdetails_m_incomesources_l_2_s": "string",
-        "dynamodb_newimage_individual_m_financialdetails_m_reasonforopeningaccount_l_7_s": "string",
-        "dynamodb_newimage_individual_m_taxids_l_1_m_value_s": "string",
-        "dynamodb_newimage_individual_m_taxids_l_1_m_countrycode_s": "string",
-        "dynamodb_newimage_individual_m_taxids_l_1_m_skipreason_s": "string",
-        "dynamodb_newimage_individual_m_taxids_l_2_m_value_s": "string",
-        "dynamodb_newimage_individual_m_taxids_l_2_m_countrycode_s": "string",
-        "dynamodb_newimage_individual_m_taxids_l_2_m_skipreason_s": "string",
-        "dynamodb_newimage_individual_m_financialdetails_m_bankaccountlocationcountrycodes_l_1_s": "string",
-        "dynamodb_newimage_tags_l_0_s": "string",
-        "dynamodb_newimage_individual_m_taxids_l_3_m_value_s": "string",
-        "dynamodb_newimage_individual_m_taxids_l_3_m_countrycode_s": "string",
-        "dynamodb_newimage_individual_m_taxids_l_3_m_skipreason_s": "string",
-        "dynamodb_newimage_individual_m_taxids_l_4_m_value_s": "string",
-        "dynamodb_newimage_individual_m_taxids_l_4_m_countrycode_s": "string",
-        "dynamodb_newimage_individual_m_taxids_l_4_m_skipreason_s": "string",
-        "dynamodb_newimage_individual_m_financialdetails_m_bankaccountlocationcountrycodes_l_2_s": "string",
-        "dynamodb_newimage_individual_m_financialdetails_m_assetlocationcountrycodes_l_2_s": "string",
-        "dynamodb_newimage_individual_m_additionaldocumenttypes_l_0_s": "string",
-        "dynamodb_newimage_individual_m_financialdetails_m_assettypes_l_3_s": "string",
-        "dynamodb_newimage_onfidoretryreasonmemos_l_1_m_owner_s": "string",
-        "dynamodb_newimage_onfidoretryreasonmemos_l_1_m_createdat_s": "string",
-        "dynamodb_newimage_onfidoretryreasonmemos_l_1_m_text_s": "string",
-        "dynamodb_newimage_individual_m_financialdetails_m_incomesources_l_3_s": "string",
-        "dynamodb_newimage_financialcrimememos_l_0_m_owner_s": "string",
-        "dynamodb_newimage_financialcrimememos_l_0_m_createdat_s": "string",
-        "dynamodb_newimage_financialcrimememos_l_0_m_text_s": "string",
-        "dynamodb_newimage_onfidoretryreasonmemos_l_2_m_owner_s": "string",
-        "dynamodb_newimage_onfidoretryreasonmemos_l_2_m_createdat_s": "string",
-        "dynamodb_newimage_onfidoretryreasonmemos_l_2_m_text_s": "string",
-        "dynamodb_newimage_individual_m_financialdetails_m_bankaccountlocationcountrycodes_l_3_s": "string",
-        "dynamodb_newimage_tags_l_1_s": "string",
-        "dynamodb_newimage_individual_m_taxids_l": "string",
-        "dynamodb_newimage_individual_m_financialdetails_m_assetlocationcountrycodes_l_3_s": "string",
-        "dynamodb_new_image_accounts_m_current_account_m": "string",
-        "dynamodb_new_image_accounts_m_ftd_account_m": "string",
-        "dynamodb_new_image_onfido_retry_reason_memos_l_8_m_created_at_s": "string",
-        "dynamodb_new_image_onfido_retry_reason_memos_l_8_m_owner_s": "string",
-        "dynamodb_new_image_onfido_retry_reason_memos_l_8_m_text_s": "string",
-        "dynamodb_new_image_tags_l_0_l_0_s": "string",
-        "dynamodb_new_image_onfido_retry_reason_memos_l_9_m_owner_s": "string",
-        "dynamodb_new_image_onfido_retry_reason_memos_l_9_m_created_at_s": "string",
-        "dynamodb_new_image_onfido_retry_reason_memos_l_9_m_text_s": "string",
-        "dynamodb_new_image_onfido_retry_reason_memos_l_10_m_owner_s": "string",
-        "dynamodb_new_image_onfido_retry_reason_memos_l_10_m_created_at_s": "string",
-        "dynamodb_new_image_onfido_retry_reason_memos_l_10_m_text_s": "string",
-        "dynamodb_new_image_onfido_retry_reason_memos_l_11_m_owner_s": "string",
-        "dynamodb_new_image_onfido_retry_reason_memos_l_11_m_created_at_s": "string",
-        "dynamodb_new_image_onfido_retry_reason_memos_l_11_m_text_s": "string",
-        "dynamodb_new_image_updated_at_n_1": "bigint",
-        "year": "bigint",
-        "month": "bigint",
-        "day": "bigint",
-        "dynamodb_new_image_version_s": "string",
-        "dynamodb_new_image_onfido_retry_reason_memos_l_12_m_owner_s": "string",
-        "dynamodb_new_image_onfido_retry_reason_memos_l_12_m_created_at_s": "string",
-        "dynamodb_new_image_onfido_retry_reason_memos_l_12_m_text_s": "string",
-        "dynamodb_new_image_onfido_retry_reason_memos_l_13_m_owner_s": "string",
-        "dynamodb_new_image_onfido_retry_reason_memos_l_13_m_created_at_s": "string",
-        "dynamodb_new_image_onfido_retry_reason_memos_l_13_m_text_s": "string",
-        "dynamodb_new_image_customer_approved_at_s": "string",
-        "dynamodb_new_image_risk_m_received_resulting_status_s": "string",
-        "dynamodb_new_image_financial_crime_memos_l_6_m_owner_s": "string",
-        "dynamodb_new_image_financial_crime_memos_l_6_m_created_at_s": "string",
-        "dynamodb_new_image_financial_crime_memos_l_6_m_text_s": "string",
-        "dynamodb_new_image_financial_crime_memos_l_7_m_owner_s": "string",
-        "dynamodb_new_image_financial_crime_memos_l_7_m_created_at_s": "string",
-        "dynamodb_new_image_financial_crime_memos_l_7_m_text_s": "string",
-        "dynamodb_new_image_financial_crime_memos_l_8_m_owner_s": "string",
-        "dynamodb_new_image_financial_crime_memos_l_8_m_created_at_s": "string",
-        "dynamodb_new_image_financial_crime_memos_l_8_m_text_s": "string",
-        "dynamodb_new_image_financial_crime_memos_l_9_m_owner_s": "string",
-        "dynamodb_new_image_financial_crime_memos_l_9_m_created_at_s": "string",
-        "dynamodb_new_image_financial_crime_memos_l_9_m_text_s": "string",
-        "dynamodb_new_image_financial_crime_memos_l_10_m_owner_s": "string",
-        "dynamodb_new_image_financial_crime_memos_l_10_m_created_at_s": "string",
-        "dynamodb_new_image_financial_crime_memos_l_10_m_text_s": "string",
-        "dynamodb_new_image_financial_crime_memos_l_11_m_owner_s": "string",
-        "dynamodb_new_image_financial_crime_memos_l_11_m_created_at_s": "string",
-        "dynamodb_new_image_financial_crime_memos_l_11_m_text_s": "string",
-        "dynamodb_new_image_tags_l_4_s": "string",
-        "dynamodb_new_image_created_at_s": "string",
-        "dynamodb_new_image_onfido_retry_reason_memos_l_14_m_owner_s": "string",
-        "dynamodb_new_image_onfido_retry_reason_memos_l_14_m_created_at_s": "string",
-        "dynamodb_new_image_onfido_retry_reason_memos_l_14_m_text_s": "string",
-        "dynamodb_new_image_onfido_retry_reason_memos_l_15_m_owner_s": "string",
-        "dynamodb_new_image_onfido_retry_reason_memos_l_15_m_created_at_s": "string",
-        "dynamodb_new_image_onfido_retry_reason_memos_l_15_m_text_s": "string",
-        "dynamodb_new_image_onfido_retry_reason_memos_l_16_m_owner_s": "string",
-        "dynamodb_new_image_onfido_retry_reason_memos_l_16_m_created_at_s": "string",
-        "dynamodb_new_image_onfido_retry_reason_memos_l_16_m_text_s": "string",
-        "dynamodb_new_image_onfido_retry_reason_memos_l_17_m_owner_s": "string",
-        "dynamodb_new_image_onfido_retry_reason_memos_l_17_m_created_at_s": "string",
-        "dynamodb_new_image_onfido_retry_reason_memos_l_17_m_text_s": "string",
-        "dynamodb_new_image_individual_m_tax_ids_l_0_m_status_s": "string",
-        "dynamodb_new_image_onfido_retry_reason_memos_l_18_m_owner_s": "string",
-        "dynamodb_new_image_onfido_retry_reason_memos_l_18_m_created_at_s": "string",
-        "dynamodb_new_image_onfido_retry_reason_memos_l_18_m_text_s": "string",
-        "dynamodb_new_image_managed_onboarding_bool": "boolean",
-        "date": "string",
-    },
-    "dynamo_sls_customer_identity": {
-        "aws_region": "string",
-        "dynamodb_approximate_creation_date_time": "timestamp",
-        "dynamodb_keys_customer_id_s": "string",
-        "dynamodb_new_image_created_at_n": "timestamp",
-        "dynamodb_new_image_customer_id_s": "string",
-        "dynamodb_new_image_document_ids_l": "string",
-        "dynamodb_new_image_document_verification_checks_l_0_s": "string",
-        "dynamodb_new_image_document_verification_checks_l_1_s": "string",
-        "dynamodb_new_image_document_verification_checks_l_2_s": "string",
-        "dynamodb_new_image_document_verification_id_s": "string",
-        "dynamodb_new_image_individual_m_accepted_at_s": "string",
-        "dynamodb_new_image_individual_m_date_of_birth_s": "string",
-        "dynamodb_new_image_individual_m_expiry_date_s": "string",
-        "dynamodb_new_image_individual_m_first_name_s": "string",
-        "dynamodb_new_image_individual_m_gender_s": "string",
-        "dynamodb_new_image_individual_m_government_id_number_s": "string",
-        "dynamodb_new_image_individual_m_last_name_s": "string",
-        "dynamodb_new_image_individual_m_nationality_s": "string",
-        "dynamodb_new_image_status_s": "string",
-        "dynamodb_new_image_updated_at_n": "timestamp",
-        "dynamodb_new_image_version_n": "int",
-        "dynamodb_size_bytes": "string",
-        "event_id": "string",
-        "event_name": "string",
-        "event_source": "string",
-        "record_format": "string",
-        "table_name": "string",
-        "user_identity": "string",
-        "timestamp_extracted": "timestamp",
-        "dynamodb_new_image_document_verification_checks_l": "string",
-        "dynamodb_new_image_document_verification_checks_l_3_s": "string",
-        "dynamodb_new_image_document_verification_checks_l_4_s": "string",
-        "dynamodb_new_image_document_verification_checks_l_5_s": "string",
-        "dynamodb_new_image_individual_m_place_of_birth_s": "string",
-        "awsregion": "string",
-        "eventid": "string",
-        "eventname": "string",
-        "useridentity": "string",
-        "recordformat": "string",
-        "tablename": "string",
-        "dynamodb_approximatecreationdatetime": "timestamp",
-        "dynamodb_keys_customerid_s": "string",
-        "dynamodb_newimage_version_n": "int",
-        "dynamodb_newimage_updatedat_n": "timestamp",
-        "dynamodb_newimage_status_s": "string",
-        "dynamodb_newimage_documentverificationchecks_l_0_s": "string",
-        "dynamodb_newimage_documentverificationchecks_l_1_s": "string",
-        "dynamodb_newimage_documentids_l": "string",
-        "dynamodb_newimage_createdat_n": "timestamp",
-        "dynamodb_newimage_customerid_s": "string",
-        "dynamodb_sizebytes": "string",
-        "eventsource": "string",
-        "dynamodb_newimage_documentverificationid_s": "string",
-        "dynamodb_newimage_documentverificationchecks_l_2_s": "string",
-        "dynamodb_newimage_documentverificationchecks_l": "string",
-        "dynamodb_newimage_individual_m_expirydate_s": "string",
-        "dynamodb_newimage_individual_m_firstname_s": "string",
-        "dynamodb_newimage_individual_m_lastname_s": "string",
-        "dynamodb_newimage_individual_m_gender_s": "string",
-        "dynamodb_newimage_individual_m_nationality_s": "string",
-        "dynamodb_newimage_individual_m_dateofbirth_s": "string",
-        "dynamodb_newimage_individual_m_governmentidnumber_s": "string",
-        "dynamodb_newimage_individual_m_acceptedat_s": "string",
-        "dynamodb_newimage_documentverificationchecks_l_3_s": "string",
-        "dynamodb_newimage_documentverificationchecks_l_4_s": "string",
-        "dynamodb_newimage_documentverificationchecks_l_5_s": "string",
-        "dynamodb_new_image_document_verification_checks_l_6_s": "string",
-        "dynamodb_new_image_document_verification_checks_l_7_s": "string",
-        "dynamodb_new_image_document_verification_checks_l_8_s": "string",
-        "dynamodb_new_image_document_verification_checks_l_9_s": "string",
-        "dynamodb_new_image_document_verification_checks_l_10_s": "string",
-        "dynamodb_new_image_document_verification_checks_l_11_s": "string",
-        "dynamodb_new_image_document_verification_checks_l_12_s": "string",
-        "dynamodb_new_image_document_verification_checks_l_13_s": "string",
-        "dynamodb_new_image_document_verification_checks_l_14_s": "string",
-        "dynamodb_new_image_document_verification_checks_l_15_s": "string",
-        "dynamodb_new_image_document_verification_checks_l_16_s": "string",
-        "dynamodb_new_image_document_verification_checks_l_17_s": "string",
-        "dynamodb_new_image_document_verification_checks_l_18_s": "string",
-        "dynamodb_new_image_document_verification_checks_l_19_s": "string",
-        "dynamodb_new_image_document_verification_checks_l_20_s": "string",
-        "dynamodb_new_image_document_verification_checks_l_21_s": "string",
-        "dynamodb_new_image_document_verification_checks_l_22_s": "string",
-        "dynamodb_new_image_document_verification_checks_l_23_s": "string",
-        "dynamodb_new_image_document_verification_checks_l_24_s": "string",
-        "dynamodb_new_image_document_verification_checks_l_25_s": "string",
-        "dynamodb_new_image_document_verification_checks_l_26_s": "string",
-        "dynamodb_new_image_document_verification_checks_l_27_s": "string",
-        "dynamodb_new_image_document_verification_checks_l_28_s": "string",
-        "dynamodb_new_image_document_verification_checks_l_29_s": "string",
-        "dynamodb_new_image_document_ids_l_0_s": "string",
-        "dynamodb_new_image_document_ids_l_1_s": "string",
-        "dynamodb_new_image_document_ids_l_2_s": "string",
-        "dynamodb_new_image_document_ids_l_3_s": "string",
-        "dynamodb_new_image_document_ids_l_4_s": "string",
-        "dynamodb_new_image_document_ids_l_5_s": "string",
-        "dynamodb_new_image_document_verification_checks_l_30_s": "string",
-        "dynamodb_new_image_document_verification_checks_l_31_s": "string",
-        "dynamodb_new_image_document_ids_l_6_s": "string",
-        "dynamodb_new_image_document_ids_l_7_s": "string",
-        "dynamodb_new_image_document_ids_l_8_s": "string",
-        "dynamodb_new_image_document_ids_l_9_s": "string",
-        "dynamodb_new_image_document_ids_l_10_s": "string",
-        "dynamodb_new_image_document_verification_checks_l_32_s": "string",
-        "dynamodb_new_image_document_ids_l_11_s": "string",
-        "dynamodb_new_image_document_errors_l": "string",
-        "dynamodb_new_image_document_errors_l_0_s": "string",
-        "dynamodb_new_image_document_errors_l_1_s": "string",
-        "dynamodb_new_image_document_errors_l_2_s": "string",
-        "dynamodb_new_image_document_ids_l_12_s": "string",
-        "dynamodb_new_image_document_ids_l_13_s": "string",
-        "dynamodb_new_image_document_ids_l_14_s": "string",
-        "dynamodb_new_image_document_ids_l_15_s": "string",
-        "dynamodb_new_image_document_details_m_issuing_date_s": "string",
-        "dynamodb_new_image_document_details_m_issuing_country_s": "string",
-        "dynamodb_new_image_document_details_m_document_number_s": "string",
-        "dynamodb_new_image_document_ids_l_16_s": "string",
-        "dynamodb_new_image_document_ids_l_17_s": "string",
-        "dynamodb_new_image_document_ids_l_18_s": "string",
-        "dynamodb_new_image_document_ids_l_19_s": "string",
-        "dynamodb_new_image_updated_at_s": "string",
-        "dynamodb_new_image_managed_onboarding_bool": "boolean",
-        "date": "string",
-    },
-    "dynamo_sls_passcoderesetcodechallenges": {
-        "aws_region": "string",
-        "dynamodb_approximate_creation_date_time": "timestamp",
-        "dynamodb_keys_id_s": "string",
-        "dynamodb_size_bytes": "string",
-        "event_id": "string",
-        "event_name": "string",
-        "event_source": "string",
-        "record_format": "string",
-        "source": "string",
-        "table_name": "string",
-        "user_identity": "string",
-        "dynamodb_keys_challenge_key_s": "string",
-        "dynamodb_keys_ttl_n": "bigint",
-        "dynamodb_new_image_otp_s": "string",
-        "dynamodb_new_image_challenge_key_s": "string",
-        "dynamodb_new_image_ttl_n": "bigint",
-        "user_identity_principal_id": "string",
-        "user_identity_type": "string",
-        "timestamp_extracted": "timestamp",
-        "date": "string",
-        "dynamodb_new_image_metadata_m_email_s": "string",
-    },
-    "dynamo_sls_ddb_customer_address_verification_code": {
-        "dynamodb_new_image_attempts_n": "int",
-        "dynamodb_new_image_code_s": "string",
-        "dynamodb_new_image_created_at_n": "timestamp",
-        "dynamodb_new_image_customer_id_s": "string",
-        "dynamodb_new_image_id_s": "string",
-        "dynamodb_new_image_status_s": "string",
-        "dynamodb_new_image_updated_at_n": "timestamp",
-        "dynamodb_new_image_version_n": "int",
-        "source": "string",
-        "timestamp_extracted": "timestamp",
-        "aws_region": "string",
-        "dynamodb_approximate_creation_date_time": "timestamp",
-        "dynamodb_keys_id_s": "string",
-        "dynamodb_size_bytes": "string",
-        "event_id": "string",
-        "event_name": "string",
-        "event_source": "string",
-        "record_format": "string",
-        "table_name": "string",
-        "user_identity": "string",
-        "awsregion": "string",
-        "eventid": "string",
-        "eventname": "string",
-        "useridentity": "string",
-        "recordformat": "string",
-        "tablename": "string",
-        "dynamodb_approximatecreationdatetime": "timestamp",
-        "dynamodb_newimage_version_n": "int",
-        "dynamodb_newimage_code_s": "string",
-        "dynamodb_newimage_updatedat_n": "timestamp",
-        "dynamodb_newimage_status_s": "string",
-        "dynamodb_newimage_createdat_n": "timestamp",
-        "dynamodb_newimage_attempts_n": "int",
-        "dynamodb_newimage_id_s": "string",
-        "dynamodb_newimage_customerid_s": "string",
-        "dynamodb_sizebytes": "string",
-        "eventsource": "string",
-        "dynamodb_new_image_country_code_s": "string",
-        "dynamodb_new_image_document_verification_checks_l": "string",
-        "dynamodb_new_image_document_ids_l": "string",
-        "dynamodb_new_image_line1_s": "string",
-        "dynamodb_new_image_line2_s": "string",
-        "dynamodb_new_image_document_verification_checks_l_0_s": "string",
-        "dynamodb_new_image_city_s": "string",
-        "dynamodb_new_image_document_verification_id_s": "string",
-        "dynamodb_new_image_document_ids_l_0_s": "string",
-        "dynamodb_new_image_document_ids_l_1_s": "string",
-        "dynamodb_new_image_provider_s": "string",
-        "dynamodb_new_image_postal_code_s": "string",
-        "dynamodb_new_image_document_verification_checks_l_1_s": "string",
-        "dynamodb_new_image_cifas_check_passed_bool": "boolean",
-        "dynamodb_new_image_verification_code_id_s": "string",
-        "dynamodb_new_image_document_ids_l_2_s": "string",
-        "dynamodb_new_image_document_verification_checks_l_2_s": "string",
-        "dynamodb_new_image_document_verification_checks_l_3_s": "string",
-        "dynamodb_new_image_document_verification_checks_l_4_s": "string",
-        "dynamodb_new_image_document_ids_l_3_s": "string",
-        "dynamodb_new_image_document_ids_l_4_s": "string",
-        "dynamodb_new_image_document_ids_l_5_s": "string",
-        "dynamodb_new_image_document_ids_l_6_s": "string",
-        "dynamodb_new_image_document_ids_l_7_s": "string",
-        "dynamodb_new_image_document_ids_l_8_s": "string",
-        "dynamodb_new_image_document_ids_l_9_s": "string",
-        "dynamodb_new_image_document_ids_l_10_s": "string",
-        "dynamodb_new_image_document_ids_l_11_s": "string",
-        "dynamodb_new_image_document_verification_checks_l_5_s": "string",
-        "dynamodb_new_image_document_errors_l": "string",
-        "dynamodb_new_image_document_errors_l_0_s": "string",
-        "dynamodb_new_image_document_errors_l_1_s": "string",
-        "dynamodb_new_image_document_errors_l_2_s": "string",
-        "dynamodb_new_image_document_verification_checks_l_6_s": "string",
-        "dynamodb_new_image_document_ids_l_12_s": "string",
-        "dynamodb_new_image_document_verification_checks_l_7_s": "string",
-        "date": "string",
-    },
-    "dynamo_sls_payees_v2": {
-        "dynamodb_new_image_created_at_n": "timestamp",
-        "dynamodb_new_image_sk_s": "string",
-        "dynamodb_new_image_account_number_s": "string",
-        "dynamodb_new_image_name_s": "string",
-        "dynamodb_new_image_customer_id_s": "string",
-        "dynamodb_new_image_id_s": "string",
-        "dynamodb_new_image_sort_code_s": "string",
-        "dynamodb_new_image_updated_at_n": "timestamp",
-        "timestamp_extracted": "timestamp",
-        "aws_region": "string",
-        "event_id": "string",
-        "event_name": "string",
-        "record_format": "string",
-        "table_name": "string",
-        "dynamodb_approximate_creation_date_time": "bigint",
-        "dynamodb_keys_sk_s": "string",
-        "dynamodb_keys_customer_id_s": "string",
-        "dynamodb_new_image_entity_type_s": "string",
-        "dynamodb_new_image_updated_at_s": "string",
-        "dynamodb_new_image_company_name_s": "string",
-        "dynamodb_new_image_created_at_s": "string",
-        "dynamodb_new_image_currency_code_s": "string",
-        "dynamodb_new_image_cop_completed_bool": "boolean",
-        "dynamodb_new_image_payment_type_s": "string",
-        "dynamodb_size_bytes": "bigint",
-        "event_source": "string",
-        "dynamodb_new_image_client_id_s": "string",
-        "date": "string",
-    },
-    "dynamo_sls_cardorders": {
-        "aws_region": "string",
-        "dynamodb_approximate_creation_date_time": "timestamp",
-        "dynamodb_keys_id_s": "string",
-        "dynamodb_new_image_created_at_n": "timestamp",
-        "dynamodb_new_image_id_s": "string",
-        "dynamodb_new_image_options_s": "string",
-        "dynamodb_new_image_updated_at_n": "timestamp",
-        "dynamodb_new_image_user_id_s": "string",
-        "dynamodb_size_bytes": "string",
-        "event_id": "string",
-        "event_name": "string",
-        "event_source": "string",
-        "record_format": "string",
-        "table_name": "string",
-        "user_identity": "string",
-        "timestamp_extracted": "timestamp",
-        "dynamodb_keys_user_id_s": "string",
-        "source": "string",
-        "awsregion": "string",
-        "eventid": "string",
-        "eventname": "string",
-        "useridentity": "string",
-        "recordformat": "string",
-        "tablename": "string",
-        "dynamodb_approximatecreationdatetime": "timestamp",
-        "dynamodb_newimage_createdat_n": "timestamp",
-        "dynamodb_newimage_options_s": "string",
-        "dynamodb_newimage_id_s": "string",
-        "dynamodb_newimage_userid_s": "string",
-        "dynamodb_newimage_updatedat_n": "timestamp",
-        "dynamodb_sizebytes": "string",
-        "eventsource": "string",
-        "dynamodb_new_image_delivery_options_s": "string",
-        "dynamodb_new_image_item_type_s": "string",
-        "date": "string",
-    },
-    "dynamo_sls_document_verification": {
-        "dynamodb_new_image_document_report_m_passed_bool": "boolean",
-        "dynamodb_new_image_version_n": "int",
-        "dynamodb_new_image_status_s": "string",
-        "dynamodb_new_image_created_at_n": "timestamp",
-        "dynamodb_new_image_result_s": "string",
-        "dynamodb_new_image_vendor_id_s": "string",
-        "dynamodb_new_image_vendor_s": "string",
-        "dynamodb_new_image_document_contents_m_last_name_s": "string",
-        "dynamodb_new_image_document_contents_m_place_of_birth_s": "string",
-        "dynamodb_new_image_document_contents_m_gender_s": "string",
-        "dynamodb_new_image_document_contents_m_nationality_country_code_s": "string",
-        "dynamodb_new_image_document_contents_m_document_type_s": "string",
-        "dynamodb_new_image_document_contents_m_issuing_date_s": "string",
-        "dynamodb_new_image_document_contents_m_document_number_s": "string",
-        "dynamodb_new_image_document_contents_m_date_of_birth_s": "string",
-        "dynamodb_new_image_document_contents_m_document_expiry_date_s": "string",
-        "dynamodb_new_image_document_contents_m_first_name_s": "string",
-        "dynamodb_new_image_document_contents_m_issuing_country_s": "string",
-        "dynamodb_new_image_document_contents_m_government_id_number_s": "string",
-        "dynamodb_new_image_document_contents_m_mrz_line1_s": "string",
-        "dynamodb_new_image_document_contents_m_mrz_line2_s": "string",
-        "dynamodb_new_image_updated_at_n": "timestamp",
-        "dynamodb_new_image_document_ids_l": "string",
-        "dynamodb_new_image_facial_similarity_report_m_passed_bool": "boolean",
-        "dynamodb_new_image_id_s": "string",
-        "dynamodb_new_image_customer_id_s": "string",
-        "dynamodb_new_image_type_s": "string",
-        "dynamodb_new_image_document_ids_l_0_s": "string",
-        "dynamodb_new_image_document_contents_m_city_s": "string",
-        "dynamodb_new_image_document_contents_m_country_code_s": "string",
-        "dynamodb_new_image_document_contents_m_postal_code_s": "string",
-        "dynamodb_new_image_document_contents_m_line2_s": "string",
-        "dynamodb_new_image_document_contents_m_line1_s": "string",
-        "dynamodb_new_image_document_contents_m_cifas_check_passed_bool": "boolean",
-        "dynamodb_new_image_document_contents_m_status_s": "string",
-        "dynamodb_new_image_document_contents_m": "string",
-        "dynamodb_new_image_document_ids_l_1_s": "string",
-        "dynamodb_new_image_testing_report_result_s": "string",
-        "dynamodb_new_image_document_ids_l_2_s": "string",
-        "dynamodb_new_image_document_ids_l_3_s": "string",
-        "dynamodb_keys_id_s": "string",
-        "event_source": "string",
-        "timestamp_extracted": "timestamp",
-        "dynamodb_new_image_document_ids_l_4_s": "string",
-        "dynamodb_new_image_document_ids_l_5_s": "string",
-        "aws_region": "string",
-        "event_id": "string",
-        "event_name": "string",
-        "user_identity": "string",
-        "record_format": "string",
-        "table_name": "string",
-        "dynamodb_newimage_createdat_n": "timestamp",
-        "dynamodb_newimage_updatedat_n": "timestamp",
-        "dynamodb_approximate_creation_date_time": "timestamp",
-        "dynamodb_size_bytes": "string",
-        "date": "string",
-    },
-    "dynamo_sls_ias_recurring": {
-        "source": "string",
-        "timestamp_extracted": "string",
-        "aws_region": "string",
-        "event_id": "string",
-        "event_name": "string",
-        "user_identity": "string",
-        "record_format": "string",
-        "table_name": "string",
-        "dynamodb_approximate_creation_date_time": "string",
-        "dynamodb_keys_id_s": "string",
-        "dynamodb_new_image_currency_s": "string",
-        "dynamodb_new_image_end_date_n": "string",
-        "dynamodb_new_image_frequency_s": "string",
-        "dynamodb_new_image_created_at_n": "bigint",
-        "dynamodb_new_image_source_account_id_s": "int",
-        "dynamodb_new_image_target_account_id_s": "int",
-        "dynamodb_new_image_is_active_bool": "boolean",
-        "dynamodb_new_image_number_of_failures_to_cancel_n": "int",
-        "dynamodb_new_image_user_id_s": "string",
-        "dynamodb_new_image_updated_at_n": "string",
-        "dynamodb_new_image_payment_strategy_s": "string",
-        "dynamodb_new_image_start_date_n": "string",
-        "dynamodb_new_image_amount_n": "double",
-        "dynamodb_new_image_configured_by_s": "string",
-        "dynamodb_new_image_number_of_failures_n": "int",
-        "dynamodb_new_image_id_s": "string",
-        "dynamodb_new_image_next_schedule_execution_timestamp_n": "bigint",
-        "dynamodb_new_image_is_test_timer_bool": "boolean",
-        "dynamodb_size_bytes": "int",
-        "event_source": "string",
-        "dynamodb_new_image_deactivation_time_n": "bigint",
-        "dynamodb_new_image_is_automatically_deactivated_bool": "boolean",
-        "dynamodb_new_image_last_failure_timestamp_n": "bigint",
-        "date": "string",
-    },
-    "dynamo_sls_customer_risk_country_score": {
-        "aws_region": "string",
-        "dynamodb_approximate_creation_date_time": "timestamp",
-        "dynamodb_keys_code_s": "string",
-        "dynamodb_new_image_code_s": "string",
-        "dynamodb_new_image_country_s": "string",
-        "dynamodb_new_image_risk_rating_s": "string",
-        "dynamodb_new_image_risk_score_n": "int",
-        "dynamodb_size_bytes": "string",
-        "event_id": "string",
-        "event_name": "string",
-        "event_source": "string",
-        "record_format": "string",
-        "table_name": "string",
-        "user_identity": "string",
-        "timestamp_extracted": "timestamp",
-        "date": "string",
-    },
-    "dynamo_sls_customer_address_address": {
-        "aws_region": "string",
-        "event_id": "string",
-        "event_name": "string",
-        "user_identity": "string",
-        "record_format": "string",
-        "table_name": "string",
-        "dynamodb_approximate_creation_date_time": "timestamp",
-        "dynamodb_keys_id_s": "string",
-        "dynamodb_new_image_version_n": "bigint",
-        "dynamodb_new_image_country_code_s": "string",
-        "dynamodb_new_image_updated_at_n": "timestamp",
-        "dynamodb_new_image_status_s": "string",
-        "dynamodb_new_image_document_verification_checks_l": "string",
-        "dynamodb_new_image_document_ids_l": "string",
-        "dynamodb_new_image_created_at_n": "timestamp",
-        "dynamodb_new_image_id_s": "string",
-        "dynamodb_new_image_customer_id_s": "string",
-        "dynamodb_size_bytes": "string",
-        "event_source": "string",
-        "timestamp_extracted": "string",
-        "dynamodb_new_image_line1_s": "string",
-        "dynamodb_new_image_line2_s": "string",
-        "dynamodb_new_image_city_s": "string",
-        "dynamodb_new_image_document_ids_l_0_s": "string",
-        "dynamodb_new_image_document_ids_l_1_s": "string",
-        "dynamodb_new_image_provider_s": "string",
-        "dynamodb_new_image_postal_code_s": "string",
-        "dynamodb_new_image_document_verification_id_s": "string",
-        "dynamodb_new_image_document_verification_checks_l_0_s": "string",
-        "dynamodb_new_image_document_ids_l_2_s": "string",
-        "dynamodb_new_image_cifas_check_passed_bool": "boolean",
-        "dynamodb_new_image_verification_code_id_s": "string",
-        "dynamodb_new_image_document_ids_l_3_s": "string",
-        "dynamodb_new_image_document_ids_l_4_s": "string",
-        "dynamodb_new_image_document_ids_l_5_s": "string",
-        "dynamodb_new_image_document_ids_l_6_s": "string",
-        "dynamodb_new_image_document_ids_l_7_s": "string",
-        "dynamodb_new_image_document_ids_l_8_s": "string",
-        "dynamodb_new_image_document_verification_checks_l_1_s": "string",
-        "dynamodb_new_image_document_verification_checks_l_2_s": "string",
-        "dynamodb_new_image_document_verification_checks_l_3_s": "string",
-        "dynamodb_new_image_document_verification_checks_l_4_s": "string",
-        "dynamodb_new_image_document_verification_checks_l_5_s": "string",
-        "dynamodb_new_image_document_verification_checks_l_6_s": "string",
-        "dynamodb_new_image_document_verification_checks_l_7_s": "string",
-        "dynamodb_new_image_document_verification_checks_l_8_s": "string",
-        "dynamodb_new_image_document_verification_checks_l_9_s": "string",
-        "dynamodb_new_image_document_verification_checks_l_10_s": "string",
-        "dynamodb_new_image_document_verification_checks_l_11_s": "string",
-        "dynamodb_new_image_document_verification_checks_l_12_s": "string",
-        "dynamodb_new_image_document_verification_checks_l_13_s": "string",
-        "dynamodb_new_image_document_verification_checks_l_14_s": "string",
-        "dynamodb_new_image_document_ids_l_9_s": "string",
-        "dynamodb_new_image_document_ids_l_10_s": "string",
-        "dynamodb_new_image_document_ids_l_11_s": "string",
-        "dynamodb_new_image_document_ids_l_12_s": "string",
-        "dynamodb_new_image_document_ids_l_13_s": "string",
-        "dynamodb_new_image_user_id_s": "string",
-        "dynamodb_new_image_options_s": "string",
-        "dynamodb_new_image_item_type_s": "string",
-        "dynamodb_new_image_delivery_options_s": "string",
-        "dynamodb_new_image_document_errors_l": "string",
-        "dynamodb_new_image_document_errors_l_0_s": "string",
-        "dynamodb_new_image_document_errors_l_1_s": "string",
-        "dynamodb_new_image_document_errors_l_2_s": "string",
-        "date": "string",
-    },
-    "dynamo_sls_customer_finances": {
-        "dynamodb_new_image_about_m_defaulted_on_payments_bool": "boolean",
-        "dynamodb_new_image_about_m_dependent_people_n": "int",
-        "dynamodb_new_image_about_m_residential_status_s": "string",
-        "dynamodb_new_image_income_m_annual_bonus_m_currency_s": "string",
-        "dynamodb_new_image_income_m_annual_bonus_m_value_s": "string",
-        "dynamodb_new_image_income_m_annual_income_other_properties_m_currency_s": "string",
-        "dynamodb_new_image_income_m_annual_income_other_properties_m_value_s": "string",
-        "dynamodb_new_image_income_m_annual_salary_m_currency_s": "string",
-        "dynamodb_new_image_income_m_annual_salary_m_value_s": "string",
-        "dynamodb_new_image_income_m_annual_state_pension_m_currency_s": "string",
-        "dynamodb_new_image_income_m_annual_state_pension_m_value_s": "string",
-        "dynamodb_new_image_income_m_current_employer_s": "string",
-        "dynamodb_new_image_income_m_employment_type_s": "string",
-        "dynamodb_new_image_income_m_job_title_s": "string",
-        "dynamodb_new_image_income_m_length_of_service_m_months_n": "int",
-        "dynamodb_new_image_income_m_length_of_service_m_years_n": "int",
-        "dynamodb_new_image_income_m_net_drawings_m_year1_m_currency_s": "string",
-        "dynamodb_new_image_income_m_net_drawings_m_year1_m_value_s": "string",
-        "dynamodb_new_image_income_m_net_drawings_m_year2_m_currency_s": "string",
-        "dynamodb_new_image_income_m_net_drawings_m_year2_m_value_s": "string",
-        "dynamodb_new_image_income_m_net_drawings_m_year3_m_currency_s": "string",
-        "dynamodb_new_image_income_m_net_drawings_m_year3_m_value_s": "string",
-        "dynamodb_new_image_income_m_net_profits_m_year1_m_currency_s": "string",
-        "dynamodb_new_image_income_m_net_profits_m_year1_m_value_s": "string",
-        "dynamodb_new_image_income_m_net_profits_m_year2_m_currency_s": "string",
-        "dynamodb_new_image_income_m_net_profits_m_year2_m_value_s": "string",
-        "dynamodb_new_image_income_m_net_profits_m_year3_m_currency_s": "string",
-        "dynamodb_new_image_income_m_net_profits_m_year3_m_value_s": "string",
-        "dynamodb_new_image_income_m_other_annual_income_m_currency_s": "string",
-        "dynamodb_new_image_income_m_other_annual_income_m_value_s": "string",
-        "dynamodb_new_image_income_m_retirement_age_plan_n": "int",
-        "dynamodb_new_image_outgoing_m_credits_l": "string",
-        "dynamodb_new_image_outgoing_m_non_credit_m_monthly_m_essential_costs_m_currency_s": "string",
-        "dynamodb_new_image_outgoing_m_non_credit_m_monthly_m_essential_costs_m_value_s": "string",
-        "dynamodb_new_image_outgoing_m_non_credit_m_monthly_m_financial_commitments_m_currency_s": "string",
-        "dynamodb_new_image_outgoing_m_non_credit_m_monthly_m_financial_commitments_m_value_s": "string",
-        "dynamodb_new_image_outgoing_m_non_credit_m_monthly_m_non_essential_costs_m_currency_s": "string",
-        "dynamodb_new_image_outgoing_m_non_credit_m_monthly_m_non_essential_costs_m_value_s": "string",
-        "dynamodb_new_image_outgoing_m_non_credit_m_monthly_m_rent_m_currency_s": "string",
-        "dynamodb_new_image_outgoing_m_non_credit_m_monthly_m_rent_m_value_s": "string",
-        "dynamodb_keys_user_id_s": "string",
-        "source": "string",
-        "timestamp_extracted": "timestamp",
-        "aws_region": "string",
-        "dynamodb_approximate_creation_date_time": "timestamp",
-        "dynamodb_new_image_user_id_s": "string",
-        "dynamodb_size_bytes": "string",
-        "event_id": "string",
-        "event_name": "string",
-        "event_source": "string",
-        "record_format": "string",
-        "table_name": "string",
-        "user_identity": "string",
-        "dynamodb_new_image_outgoing_m_credits_l_0_m_outstanding_balance_m_currency_s": "string",
-        "dynamodb_new_image_outgoing_m_credits_l_0_m_outstanding_balance_m_value_s": "string",
-        "dynamodb_new_image_outgoing_m_credits_l_0_m_repayment_m_currency_s": "string",
-        "dynamodb_new_image_outgoing_m_credits_l_0_m_repayment_m_value_s": "string",
-        "dynamodb_new_image_outgoing_m_credits_l_0_m_type_s": "string",
-        "dynamodb_new_image_outgoing_m_credits_l_1_m_outstanding_balance_m_currency_s": "string",
-        "dynamodb_new_image_outgoing_m_credits_l_1_m_outstanding_balance_m_value_s": "string",
-        "dynamodb_new_image_outgoing_m_credits_l_1_m_repayment_m_currency_s": "string",
-        "dynamodb_new_image_outgoing_m_credits_l_1_m_repayment_m_value_s": "string",
-        "dynamodb_new_image_outgoing_m_credits_l_1_m_type_s": "string",
-        "dynamodb_new_image_outgoing_m_credits_l_2_m_outstanding_balance_m_currency_s": "string",
-        "dynamodb_new_image_outgoing_m_credits_l_2_m_outstanding_balance_m_value_s": "string",
-        "dynamodb_new_image_outgoing_m_credits_l_2_m_repayment_m_currency_s": "string",
-        "dynamodb_new_image_outgoing_m_credits_l_2_m_repayment_m_value_s": "string",
-        "dynamodb_new_image_outgoing_m_credits_l_2_m_type_s": "string",
-        "awsregion": "string",
-        "eventid": "string",
-        "eventname": "string",
-        "useridentity": "string",
-        "recordformat": "string",
-        "tablename": "string",
-        "dynamodb_approximatecreationdatetime": "timestamp",
-        "dynamodb_keys_userid_s": "string",
-        "dynamodb_newimage_outgoing_m_noncredit_m_monthly_m_nonessentialcosts_m_value_s": "string",
-        "dynamodb_newimage_outgoing_m_noncredit_m_monthly_m_nonessentialcosts_m_currency_s": "string",
-        "dynamodb_newimage_outgoing_m_noncredit_m_monthly_m_financialcommitments_m_value_s": "string",
-        "dynamodb_newimage_outgoing_m_noncredit_m_monthly_m_financialcommitments_m_currency_s": "string",
-        "dynamodb_newimage_outgoing_m_noncredit_m_monthly_m_rent_m_value_s": "string",
-        "dynamodb_newimage_outgoing_m_noncredit_m_monthly_m_rent_m_currency_s": "string",
-        "dynamodb_newimage_outgoing_m_noncredit_m_monthly_m_essentialcosts_m_value_s": "string",
-        "dynamodb_newimage_outgoing_m_noncredit_m_monthly_m_essentialcosts_m_currency_s": "string",
-        "dynamodb_newimage_outgoing_m_credits_l_0_m_type_s": "string",
-        "dynamodb_newimage_outgoing_m_credits_l_0_m_repayment_m_value_s": "string",
-        "dynamodb_newimage_outgoing_m_credits_l_0_m_repayment_m_currency_s": "string",
-        "dynamodb_newimage_outgoing_m_credits_l_0_m_outstandingbalance_m_value_s": "string",
-        "dynamodb_newimage_outgoing_m_credits_l_0_m_outstandingbalance_m_currency_s": "string",
-        "dynamodb_newimage_about_m_dependentpeople_n": "int",
-        "dynamodb_newimage_about_m_defaultedonpayments_bool": "boolean",
-        "dynamodb_newimage_about_m_residentialstatus_s": "string",
-        "dynamodb_newimage_income_m_currentemployer_s": "string",
-        "dynamodb_newimage_income_m_annualsalary_m_value_s": "string",
-        "dynamodb_newimage_income_m_annualsalary_m_currency_s": "string",
-        "dynamodb_newimage_income_m_annualstatepension_m_value_s": "string",
-        "dynamodb_newimage_income_m_annualstatepension_m_currency_s": "string",
-        "dynamodb_newimage_income_m_retirementageplan_n": "int",
-        "dynamodb_newimage_income_m_employmenttype_s": "string",
-        "dynamodb_newimage_income_m_annualbonus_m_value_s": "string",
-        "dynamodb_newimage_income_m_annualbonus_m_currency_s": "string",
-        "dynamodb_newimage_income_m_jobtitle_s": "string",
-        "dynamodb_newimage_income_m_lengthofservice_m_years_n": "int",
-        "dynamodb_newimage_income_m_lengthofservice_m_months_n": "int",
-        "dynamodb_newimage_income_m_netdrawings_m_year1_m_value_s": "string",
-        "dynamodb_newimage_income_m_netdrawings_m_year1_m_currency_s": "string",
-        "dynamodb_newimage_income_m_netdrawings_m_year2_m_value_s": "string",
-        "dynamodb_newimage_income_m_netdrawings_m_year2_m_currency_s": "string",
-        "dynamodb_newimage_income_m_netdrawings_m_year3_m_value_s": "string",
-        "dynamodb_newimage_income_m_netdrawings_m_year3_m_currency_s": "string",
-        "dynamodb_newimage_income_m_annualincomeotherproperties_m_value_s": "string",
-        "dynamodb_newimage_income_m_annualincomeotherproperties_m_currency_s": "string",
-        "dynamodb_newimage_income_m_otherannualincome_m_value_s": "string",
-        "dynamodb_newimage_income_m_otherannualincome_m_currency_s": "string",
-        "dynamodb_newimage_income_m_netprofits_m_year1_m_value_s": "string",
-        "dynamodb_newimage_income_m_netprofits_m_year1_m_currency_s": "string",
-        "dynamodb_newimage_income_m_netprofits_m_year2_m_value_s": "string",
-        "dynamodb_newimage_income_m_netprofits_m_year2_m_currency_s": "string",
-        "dynamodb_newimage_income_m_netprofits_m_year3_m_value_s": "string",
-        "dynamodb_newimage_income_m_netprofits_m_year3_m_currency_s": "string",
-        "dynamodb_newimage_userid_s": "string",
-        "dynamodb_sizebytes": "string",
-        "eventsource": "string",
-        "dynamodb_newimage_outgoing_m_credits_l": "string",
-        "dynamodb_new_image_outgoing_m_credits_l_3_m_type_s": "string",
-        "dynamodb_new_image_outgoing_m_credits_l_3_m_repayment_m_value_s": "string",
-        "dynamodb_new_image_outgoing_m_credits_l_3_m_repayment_m_currency_s": "string",
-        "dynamodb_new_image_outgoing_m_credits_l_3_m_outstanding_balance_m_value_s": "string",
-        "dynamodb_new_image_outgoing_m_credits_l_3_m_outstanding_balance_m_currency_s": "string",
-        "dynamodb_new_image_outgoing_m_credits_l_4_m_type_s": "string",
-        "dynamodb_new_image_outgoing_m_credits_l_4_m_repayment_m_value_s": "string",
-        "dynamodb_new_image_outgoing_m_credits_l_4_m_repayment_m_currency_s": "string",
-        "dynamodb_new_image_outgoing_m_credits_l_4_m_outstanding_balance_m_value_s": "string",
-        "dynamodb_new_image_outgoing_m_credits_l_4_m_outstanding_balance_m_currency_s": "string",
-        "dynamodb_new_image_outgoing_m_credits_l_5_m_type_s": "string",
-        "dynamodb_new_image_outgoing_m_credits_l_5_m_repayment_m_value_s": "string",
-        "dynamodb_new_image_outgoing_m_credits_l_5_m_repayment_m_currency_s": "string",
-        "dynamodb_new_image_outgoing_m_credits_l_5_m_outstanding_balance_m_value_s": "string",
-        "dynamodb_new_image_outgoing_m_credits_l_5_m_outstanding_balance_m_currency_s": "string",
-        "dynamodb_new_image_outgoing_m_credits_l_6_m_type_s": "string",
-        "dynamodb_new_image_outgoing_m_credits_l_6_m_repayment_m_value_s": "string",
-        "dynamodb_new_image_outgoing_m_credits_l_6_m_repayment_m_currency_s": "string",
-        "dynamodb_new_image_outgoing_m_credits_l_6_m_outstanding_balance_m_value_s": "string",
-        "dynamodb_new_image_outgoing_m_credits_l_6_m_outstanding_balance_m_currency_s": "string",
-        "dynamodb_new_image_outgoing_m_credits_l_7_m_type_s": "string",
-        "dynamodb_new_image_outgoing_m_credits_l_7_m_repayment_m_value_s": "string",
-        "dynamodb_new_image_outgoing_m_credits_l_7_m_repayment_m_currency_s": "string",
-        "dynamodb_new_image_outgoing_m_credits_l_7_m_outstanding_balance_m_value_s": "string",
-        "dynamodb_new_image_outgoing_m_credits_l_7_m_outstanding_balance_m_currency_s": "string",
-        "dynamodb_new_image_income_m_has_no_additional_income_bool": "boolean",
-        "dynamodb_new_image_outgoing_m_monthly_non_essential_costs_l": "string",
-        "dynamodb_new_image_outgoing_m_monthly_rents_l": "string",
-        "dynamodb_new_image_outgoing_m_monthly_essential_costs_l": "string",
-        "dynamodb_new_image_about_m_payments_in_past_m_missed_credit_payment6_months_bool": "boolean",
-        "dynamodb_new_image_about_m_payments_in_past_m_iva_bool": "boolean",
-        "dynamodb_new_image_about_m_payments_in_past_m_missed_secured_loan12_months_bool": "boolean",
-        "dynamodb_new_image_about_m_payments_in_past_m_defaulted12_months_bool": "boolean",
-        "dynamodb_new_image_about_m_payments_in_past_m_ccj_bool": "boolean",
-        "dynamodb_new_image_about_m_payments_in_past_m_bankruptcy_bool": "boolean",
-        "dynamodb_new_image_about_m_payments_in_past_m_debt_relief_order_bool": "boolean",
-        "dynamodb_new_image_about_m_payments_in_past_m_repossession_bool": "boolean",
-        "dynamodb_new_image_about_m_payments_in_past_m_missed_credit_payment24_months_bool": "boolean",
-        "dynamodb_new_image_about_m_dependent_people_age_l_0_m_index_n": "bigint",
-        "dynamodb_new_image_about_m_dependent_people_age_l_0_m_age_n": "bigint",
-        "dynamodb_new_image_about_m_dependent_people_age_l_1_m_index_n": "bigint",
-        "dynamodb_new_image_about_m_dependent_people_age_l_1_m_age_n": "bigint",
-        "dynamodb_new_image_about_m_residential_addresses_l": "string",
-        "dynamodb_new_image_about_m_residential_addresses_l_0_m_index_n": "bigint",
-        "dynamodb_new_image_about_m_residential_addresses_l_0_m_years_n": "bigint",
-        "dynamodb_new_image_about_m_residential_addresses_l_0_m_address_m_line2_s": "string",
-        "dynamodb_new_image_about_m_residential_addresses_l_0_m_address_m_city_s": "string",
-        "dynamodb_new_image_about_m_residential_addresses_l_0_m_address_m_line1_s": "string",
-        "dynamodb_new_image_about_m_residential_addresses_l_0_m_address_m_country_code_s": "string",
-        "dynamodb_new_image_about_m_residential_addresses_l_0_m_address_m_postal_code_s": "string",
-        "dynamodb_new_image_income_m_business_m_name_s": "string",
-        "dynamodb_new_image_income_m_business_m_is_family_company_bool": "boolean",
-        "dynamodb_new_image_income_m_business_m_countries_l_0_s": "string",
-        "dynamodb_new_image_income_m_business_m_ownership_m_max_n": "bigint",
-        "dynamodb_new_image_income_m_business_m_ownership_m_min_n": "bigint",
-        "dynamodb_new_image_income_m_business_m_turnover_m_currency_code_s": "string",
-        "dynamodb_new_image_income_m_business_m_turnover_m_from_n": "bigint",
-        "dynamodb_new_image_income_m_business_m_turnover_m_to_n": "bigint",
-        "dynamodb_new_image_income_m_business_m_activities_l_0_s": "string",
-        "dynamodb_new_image_income_m_sources_l_0_m_monthly_amount_m_value_s": "string",
-        "dynamodb_new_image_income_m_sources_l_0_m_monthly_amount_m_currency_s": "string",
-        "dynamodb_new_image_income_m_sources_l_0_m_source_type_s": "string",
-        "dynamodb_new_image_outgoing_m_monthly_non_essential_costs_l_0_m_type_s": "string",
-        "dynamodb_new_image_outgoing_m_monthly_non_essential_costs_l_0_m_monthly_amount_m_value_s": "string",
-        "dynamodb_new_image_outgoing_m_monthly_non_essential_costs_l_0_m_monthly_amount_m_currency_s": "string",
-        "dynamodb_new_image_outgoing_m_non_credit_m_monthly_m": "string",
-        "dynamodb_new_image_outgoing_m_monthly_essential_costs_l_0_m_type_s": "string",
-        "dynamodb_new_image_outgoing_m_monthly_essential_costs_l_0_m_monthly_amount_m_value_s": "string",
-        "dynamodb_new_image_outgoing_m_monthly_essential_costs_l_0_m_monthly_amount_m_currency_s": "string",
-        "dynamodb_new_image_outgoing_m_credits_l_0_m_finance_provider_s": "string",
-        "dynamodb_new_image_about_m_residential_addresses_l_1_m_index_n": "bigint",
-        "dynamodb_new_image_about_m_residential_addresses_l_1_m_country_specific_address_data_m_building_apartment_number_s": "string",
-        "dynamodb_new_image_about_m_residential_addresses_l_1_m_country_specific_address_data_m_zip_code_s": "string",
-        "dynamodb_new_image_about_m_residential_addresses_l_1_m_country_specific_address_data_m_street_s": "string",
-        "dynamodb_new_image_about_m_residential_addresses_l_1_m_country_specific_address_data_m_district_s": "string",
-        "dynamodb_new_image_about_m_residential_addresses_l_1_m_address_m_line2_s": "string",
-        "dynamodb_new_image_about_m_residential_addresses_l_1_m_address_m_city_s": "string",
-        "dynamodb_new_image_about_m_residential_addresses_l_1_m_address_m_line1_s": "string",
-        "dynamodb_new_image_about_m_residential_addresses_l_1_m_address_m_country_code_s": "string",
-        "dynamodb_new_image_about_m_residential_addresses_l_1_m_address_m_postal_code_s": "string",
-        "dynamodb_new_image_about_m_residential_addresses_l_1_m_years_n": "bigint",
-        "dynamodb_new_image_income_m_sources_l_0_m_property_m_monthly_repayment_m_value_s": "string",
-        "dynamodb_new_image_income_m_sources_l_0_m_property_m_monthly_repayment_m_currency_s": "string",
-        "dynamodb_new_image_income_m_sources_l_0_m_property_m_outstanding_m_value_s": "string",
-        "dynamodb_new_image_income_m_sources_l_0_m_property_m_outstanding_m_currency_s": "string",
-        "dynamodb_new_image_income_m_sources_l_0_m_property_m_country_code_s": "string",
-        "dynamodb_new_image_income_m_sources_l_0_m_property_m_owning_term_n": "bigint",
-        "dynamodb_new_image_income_m_bonus_m_year1_m_value_s": "string",
-        "dynamodb_new_image_income_m_bonus_m_year1_m_currency_s": "string",
-        "dynamodb_new_image_income_m_bonus_m_year2_m_value_s": "string",
-        "dynamodb_new_image_income_m_bonus_m_year2_m_currency_s": "string",
-        "dynamodb_new_image_income_m_bonus_m_year3_m_value_s": "string",
-        "dynamodb_new_image_income_m_bonus_m_year3_m_currency_s": "string",
-        "dynamodb_new_image_income_m_customer_occupations_l_0_s": "string",
-        "dynamodb_new_image_outgoing_m_monthly_essential_costs_l_1_m_type_s": "string",
-        "dynamodb_new_image_outgoing_m_monthly_essential_costs_l_1_m_monthly_amount_m_value_s": "string",
-        "dynamodb_new_image_outgoing_m_monthly_essential_costs_l_1_m_monthly_amount_m_currency_s": "string",
-        "dynamodb_new_image_outgoing_m_monthly_essential_costs_l_2_m_type_s": "string",
-        "dynamodb_new_image_outgoing_m_monthly_essential_costs_l_2_m_monthly_amount_m_value_s": "string",
-        "dynamodb_new_image_outgoing_m_monthly_essential_costs_l_2_m_monthly_amount_m_currency_s": "string",
-        "dynamodb_new_image_income_m_sources_l_0_m_reason_s": "string",
-        "dynamodb_new_image_outgoing_m_monthly_non_essential_costs_l_1_m_type_s": "string",
-        "dynamodb_new_image_outgoing_m_monthly_non_essential_costs_l_1_m_monthly_amount_m_value_s": "string",
-        "dynamodb_new_image_outgoing_m_monthly_non_essential_costs_l_1_m_monthly_amount_m_currency_s": "string",
-        "dynamodb_new_image_about_m_residential_addresses_l_1_m_country_specific_address_data_m_neighborhood_s": "string",
-        "dynamodb_new_image_outgoing_m_monthly_rents_l_0_m_value_s": "string",
-        "dynamodb_new_image_outgoing_m_monthly_rents_l_0_m_currency_s": "string",
-        "dynamodb_new_image_outgoing_m_monthly_essential_costs_l_3_m_type_s": "string",
-        "dynamodb_new_image_outgoing_m_monthly_essential_costs_l_3_m_monthly_amount_m_value_s": "string",
-        "dynamodb_new_image_outgoing_m_monthly_essential_costs_l_3_m_monthly_amount_m_currency_s": "string",
-        "dynamodb_new_image_outgoing_m_monthly_essential_costs_l_4_m_type_s": "string",
-        "dynamodb_new_image_outgoing_m_monthly_essential_costs_l_4_m_monthly_amount_m_value_s": "string",
-        "dynamodb_new_image_outgoing_m_monthly_essential_costs_l_4_m_monthly_amount_m_currency_s": "string",
-        "dynamodb_new_image_outgoing_m_credits_l_1_m_finance_provider_s": "string",
-        "dynamodb_new_image_outgoing_m_credits_l_1_m_remaining_term_m_years_n": "bigint",
-        "dynamodb_new_image_outgoing_m_credits_l_1_m_remaining_term_m_months_n": "bigint",
-        "dynamodb_new_image_outgoing_m_credits_l_2_m_finance_provider_s": "string",
-        "dynamodb_new_image_about_m_dependent_people_age_l_2_m_index_n": "bigint",
-        "dynamodb_new_image_about_m_dependent_people_age_l_2_m_age_n": "bigint",
-        "dynamodb_new_image_outgoing_m_monthly_non_essential_costs_l_0_m_explanation_s": "string",
-        "dynamodb_new_image_about_m_dependent_people_age_l_3_m_index_n": "bigint",
-        "dynamodb_new_image_about_m_dependent_people_age_l_3_m_age_n": "bigint",
-        "dynamodb_new_image_about_m_residential_addresses_l_1_m_country_specific_address_data_m_area_s": "string",
-        "dynamodb_new_image_about_m_residential_addresses_l_1_m_country_specific_address_data_m_emirate_s": "string",
-        "dynamodb_new_image_about_m_residential_addresses_l_2_m_index_n": "bigint",
-        "dynamodb_new_image_about_m_residential_addresses_l_2_m_country_specific_address_data_m_area_s": "string",
-        "dynamodb_new_image_about_m_residential_addresses_l_2_m_country_specific_address_data_m_building_apartment_number_s": "string",
-        "dynamodb_new_image_about_m_residential_addresses_l_2_m_country_specific_address_data_m_emirate_s": "string",
-        "dynamodb_new_image_about_m_residential_addresses_l_2_m_country_specific_address_data_m_street_s": "string",
-        "dynamodb_new_image_about_m_residential_addresses_l_2_m_address_m_line2_s": "string",
-        "dynamodb_new_image_about_m_residential_addresses_l_2_m_address_m_city_s": "string",
-        "dynamodb_new_image_about_m_residential_addresses_l_2_m_address_m_line1_s": "string",
-        "dynamodb_new_image_about_m_residential_addresses_l_2_m_address_m_country_code_s": "string",
-        "dynamodb_new_image_about_m_residential_addresses_l_2_m_address_m_postal_code_s": "string",
-        "dynamodb_new_image_about_m_residential_addresses_l_2_m_years_n": "bigint",
-        "dynamodb_new_image_about_m_residential_addresses_l_3_m_index_n": "bigint",
-        "dynamodb_new_image_about_m_residential_addresses_l_3_m_country_specific_address_data_m_area_s": "string",
-        "dynamodb_new_image_about_m_residential_addresses_l_3_m_country_specific_address_data_m_building_apartment_number_s": "string",
-        "dynamodb_new_image_about_m_residential_addresses_l_3_m_country_specific_address_data_m_emirate_s": "string",
-        "dynamodb_new_image_about_m_residential_addresses_l_3_m_country_specific_address_data_m_street_s": "string",
-        "dynamodb_new_image_about_m_residential_addresses_l_3_m_address_m_line2_s": "string",
-        "dynamodb_new_image_about_m_residential_addresses_l_3_m_address_m_city_s": "string",
-        "dynamodb_new_image_about_m_residential_addresses_l_3_m_address_m_line1_s": "string",
-        "dynamodb_new_image_about_m_residential_addresses_l_3_m_address_m_country_code_s": "string",
-        "dynamodb_new_image_about_m_residential_addresses_l_3_m_address_m_postal_code_s": "string",
-        "dynamodb_new_image_about_m_residential_addresses_l_3_m_years_n": "bigint",
-        "dynamodb_new_image_outgoing_m_credits_l_0_m_remaining_term_m_years_n": "bigint",
-        "dynamodb_new_image_outgoing_m_credits_l_0_m_remaining_term_m_months_n": "bigint",
-        "dynamodb_new_image_income_m_sources_l_0_m_property_m_country_specific_address_m_district_s": "string",
-        "dynamodb_new_image_income_m_sources_l_0_m_property_m_address_m_line2_s": "string",
-        "dynamodb_new_image_income_m_sources_l_0_m_property_m_address_m_city_s": "string",
-        "dynamodb_new_image_income_m_sources_l_0_m_property_m_address_m_line1_s": "string",
-        "dynamodb_new_image_income_m_sources_l_0_m_property_m_address_m_country_code_s": "string",
-        "dynamodb_new_image_income_m_sources_l_0_m_property_m_address_m_postal_code_s": "string",
-        "dynamodb_new_image_income_m_sources_l_0_m_property_m_lender_type_s": "string",
-        "dynamodb_new_image_about_m_residential_addresses_l_2_m_country_specific_address_data_m_zip_code_s": "string",
-        "dynamodb_new_image_about_m_residential_addresses_l_2_m_country_specific_address_data_m_district_s": "string",
-        "dynamodb_new_image_income_m_customer_occupations_l_1_s": "string",
-        "dynamodb_new_image_outgoing_m_monthly_non_essential_costs_l_2_m_type_s": "string",
-        "dynamodb_new_image_outgoing_m_monthly_non_essential_costs_l_2_m_monthly_amount_m_value_s": "string",
-        "dynamodb_new_image_outgoing_m_monthly_non_essential_costs_l_2_m_monthly_amount_m_currency_s": "string",
-        "dynamodb_new_image_about_m_residential_addresses_l_1_m_country_specific_address_data_m_extended_code_s": "string",
-        "dynamodb_new_image_about_m_residential_addresses_l_1_m_country_specific_address_data_m_extended_co_unit_number_s": "string",
-        "dynamodb_new_image_about_m_residential_addresses_l_2_m_country_specific_address_data_m_neighborhood_s": "string",
-        "dynamodb_new_image_income_m_commissions_m_year1_m_value_s": "string",
-        "dynamodb_new_image_income_m_commissions_m_year1_m_currency_s": "string",
-        "dynamodb_new_image_income_m_commissions_m_year2_m_value_s": "string",
-        "dynamodb_new_image_income_m_commissions_m_year2_m_currency_s": "string",
-        "dynamodb_new_image_income_m_commissions_m_year3_m_value_s": "string",
-        "dynamodb_new_image_income_m_commissions_m_year3_m_currency_s": "string",
-        "dynamodb_new_image_outgoing_m_monthly_essential_costs_l_0_m_explanation_s": "string",
-        "dynamodb_new_image_about_m_dependent_people_age_l_4_m_index_n": "bigint",
-        "dynamodb_new_image_about_m_dependent_people_age_l_4_m_age_n": "bigint",
-        "dynamodb_new_image_outgoing_m_monthly_essential_costs_l_1_m_explanation_s": "string",
-        "dynamodb_new_image_income_m_overtime_m_year1_m_value_s": "string",
-        "dynamodb_new_image_income_m_overtime_m_year1_m_currency_s": "string",
-        "dynamodb_new_image_income_m_overtime_m_year2_m_value_s": "string",
-        "dynamodb_new_image_income_m_overtime_m_year2_m_currency_s": "string",
-        "dynamodb_new_image_income_m_overtime_m_year3_m_value_s": "string",
-        "dynamodb_new_image_income_m_overtime_m_year3_m_currency_s": "string",
-        "dynamodb_new_image_outgoing_m_monthly_essential_costs_l_5_m_type_s": "string",
-        "dynamodb_new_image_outgoing_m_monthly_essential_costs_l_5_m_monthly_amount_m_value_s": "string",
-        "dynamodb_new_image_outgoing_m_monthly_essential_costs_l_5_m_monthly_amount_m_currency_s": "string",
-        "dynamodb_new_image_income_m_sources_l_1_m_monthly_amount_m_value_s": "string",
-        "dynamodb_new_image_income_m_sources_l_1_m_monthly_amount_m_currency_s": "string",
-        "dynamodb_new_image_income_m_sources_l_1_m_source_type_s": "string",
-        "dynamodb_new_image_income_m_sources_l_1_m_reason_s": "string",
-        "dynamodb_new_image_income_m_sources_l_1_m_property_m_monthly_repayment_m_value_s": "string",
-        "dynamodb_new_image_income_m_sources_l_1_m_property_m_monthly_repayment_m_currency_s": "string",
-        "dynamodb_new_image_income_m_sources_l_1_m_property_m_outstanding_m_value_s": "string",
-        "dynamodb_new_image_income_m_sources_l_1_m_property_m_outstanding_m_currency_s": "string",
-        "dynamodb_new_image_income_m_sources_l_1_m_property_m_country_code_s": "string",
-        "dynamodb_new_image_income_m_sources_l_1_m_property_m_owning_term_n": "bigint",
-        "dynamodb_new_image_income_m_sources_l_1_m_property_m_country_specific_address_m_district_s": "string",
-        "dynamodb_new_image_income_m_sources_l_1_m_property_m_address_m_line2_s": "string",
-        "dynamodb_new_image_income_m_sources_l_1_m_property_m_address_m_city_s": "string",
-        "dynamodb_new_image_income_m_sources_l_1_m_property_m_address_m_line1_s": "string",
-        "dynamodb_new_image_income_m_sources_l_1_m_property_m_address_m_country_code_s": "string",
-        "dynamodb_new_image_income_m_sources_l_1_m_property_m_address_m_postal_code_s": "string",
-        "dynamodb_new_image_income_m_sources_l_1_m_property_m_lender_type_s": "string",
-        "dynamodb_new_image_income_m_sources_l_2_m_monthly_amount_m_value_s": "string",
-        "dynamodb_new_image_income_m_sources_l_2_m_monthly_amount_m_currency_s": "string",
-        "dynamodb_new_image_income_m_sources_l_2_m_source_type_s": "string",
-        "dynamodb_new_image_income_m_sources_l_2_m_reason_s": "string",
-        "dynamodb_new_image_income_m_sources_l_3_m_monthly_amount_m_value_s": "string",
-        "dynamodb_new_image_income_m_sources_l_3_m_monthly_amount_m_currency_s": "string",
-        "dynamodb_new_image_income_m_sources_l_3_m_property_m_country_specific_address_m_district_s": "string",
-        "dynamodb_new_image_income_m_sources_l_3_m_property_m_address_m_line2_s": "string",
-        "dynamodb_new_image_income_m_sources_l_3_m_property_m_address_m_city_s": "string",
-        "dynamodb_new_image_income_m_sources_l_3_m_property_m_address_m_line1_s": "string",
-        "dynamodb_new_image_income_m_sources_l_3_m_property_m_address_m_country_code_s": "string",
-        "dynamodb_new_image_income_m_sources_l_3_m_property_m_address_m_postal_code_s": "string",
-        "dynamodb_new_image_income_m_sources_l_3_m_property_m_lender_type_s": "string",
-        "dynamodb_new_image_income_m_sources_l_3_m_property_m_country_code_s": "string",
-        "dynamodb_new_image_income_m_sources_l_3_m_property_m_owning_term_n": "bigint",
-        "dynamodb_new_image_income_m_sources_l_3_m_source_type_s": "string",
-        "dynamodb_new_image_income_m_sources_l_2_m_property_m_country_specific_address_m_district_s": "string",
-        "dynamodb_new_image_income_m_sources_l_2_m_property_m_address_m_line2_s": "string",
-        "dynamodb_new_image_income_m_sources_l_2_m_property_m_address_m_city_s": "string",
-        "dynamodb_new_image_income_m_sources_l_2_m_property_m_address_m_line1_s": "string",
-        "dynamodb_new_image_income_m_sources_l_2_m_property_m_address_m_country_code_s": "string",
-        "dynamodb_new_image_income_m_sources_l_2_m_property_m_address_m_postal_code_s": "string",
-        "dynamodb_new_image_income_m_sources_l_2_m_property_m_lender_type_s": "string",
-        "dynamodb_new_image_income_m_sources_l_2_m_property_m_country_code_s": "string",
-        "dynamodb_new_image_income_m_sources_l_2_m_property_m_owning_term_n": "bigint",
-        "dynamodb_new_image_income_m_sources_l_2_m_property_m_outstanding_m_value_s": "string",
-        "dynamodb_new_image_income_m_sources_l_2_m_property_m_outstanding_m_currency_s": "string",
-        "dynamodb_new_image_income_m_sources_l_2_m_property_m_monthly_repayment_m_value_s": "string",
-        "dynamodb_new_image_income_m_sources_l_2_m_property_m_monthly_repayment_m_currency_s": "string",
-        "dynamodb_new_image_income_m_sources_l_2_m_property_m_lender_name_s": "string",
-        "dynamodb_new_image_income_m_sources_l_3_m_reason_s": "string",
-        "dynamodb_new_image_outgoing_m_monthly_non_essential_costs_l_3_m_type_s": "string",
-        "dynamodb_new_image_outgoing_m_monthly_non_essential_costs_l_3_m_monthly_amount_m_value_s": "string",
-        "dynamodb_new_image_outgoing_m_monthly_non_essential_costs_l_3_m_monthly_amount_m_currency_s": "string",
-        "dynamodb_new_image_income_m_sources_l_0_m_property_m_lender_name_s": "string",
-        "dynamodb_new_image_about_m_dependent_people_age_l_5_m_index_n": "bigint",
-        "dynamodb_new_image_about_m_dependent_people_age_l_5_m_age_n": "bigint",
-        "dynamodb_new_image_about_m_residential_addresses_l_3_m_country_specific_address_data_m_zip_code_s": "string",
-        "dynamodb_new_image_about_m_residential_addresses_l_3_m_country_specific_address_data_m_district_s": "string",
-        "dynamodb_new_image_about_m_residential_addresses_l_4_m_index_n": "bigint",
-        "dynamodb_new_image_about_m_residential_addresses_l_4_m_country_specific_address_data_m_building_apartment_number_s": "string",
-        "dynamodb_new_image_about_m_residential_addresses_l_4_m_country_specific_address_data_m_zip_code_s": "string",
-        "dynamodb_new_image_about_m_residential_addresses_l_4_m_country_specific_address_data_m_street_s": "string",
-        "dynamodb_new_image_about_m_residential_addresses_l_4_m_country_specific_address_data_m_district_s": "string",
-        "dynamodb_new_image_about_m_residential_addresses_l_4_m_address_m_line2_s": "string",
-        "dynamodb_new_image_about_m_residential_addresses_l_4_m_address_m_city_s": "string",
-        "dynamodb_new_image_about_m_residential_addresses_l_4_m_address_m_line1_s": "string",
-        "dynamodb_new_image_about_m_residential_addresses_l_4_m_address_m_country_code_s": "string",
-        "dynamodb_new_image_about_m_residential_addresses_l_4_m_address_m_postal_code_s": "string",
-        "dynamodb_new_image_about_m_residential_addresses_l_4_m_years_n": "bigint",
-        "dynamodb_new_image_about_m_residential_addresses_l_3_m_country_specific_address_data_m_neighborhood_s": "string",
-        "dynamodb_new_image_income_m_sources_l_1_m_property_m_lender_name_s": "string",
-        "dynamodb_new_image_income_m_business_m_activities_l_1_s": "string",
-        "dynamodb_new_image_income_m_sources_l_4_m_property_m_country_specific_address_m_district_s": "string",
-        "dynamodb_new_image_income_m_sources_l_4_m_property_m_address_m_city_s": "string",
-        "dynamodb_new_image_income_m_sources_l_4_m_property_m_address_m_line2_s": "string",
-        "dynamodb_new_image_income_m_sources_l_4_m_property_m_address_m_country_code_s": "string",
-        "dynamodb_new_image_income_m_sources_l_4_m_property_m_address_m_line1_s": "string",
-        "dynamodb_new_image_income_m_sources_l_4_m_property_m_address_m_postal_code_s": "string",
-        "dynamodb_new_image_income_m_sources_l_4_m_property_m_lender_type_s": "string",
-        "dynamodb_new_image_income_m_sources_l_4_m_property_m_country_code_s": "string",
-        "dynamodb_new_image_income_m_sources_l_4_m_property_m_owning_term_n": "bigint",
-        "dynamodb_new_image_income_m_sources_l_4_m_monthly_amount_m_value_s": "string",
-        "dynamodb_new_image_income_m_sources_l_4_m_monthly_amount_m_currency_s": "string",
-        "dynamodb_new_image_income_m_sources_l_4_m_source_type_s": "string",
-        "dynamodb_new_image_income_m_sources_l_5_m_property_m_country_specific_address_m_district_s": "string",
-        "dynamodb_new_image_income_m_sources_l_5_m_property_m_address_m_city_s": "string",
-        "dynamodb_new_image_income_m_sources_l_5_m_property_m_address_m_line2_s": "string",
-        "dynamodb_new_image_income_m_sources_l_5_m_property_m_address_m_country_code_s": "string",
-        "dynamodb_new_image_income_m_sources_l_5_m_property_m_address_m_line1_s": "string",
-        "dynamodb_new_image_income_m_sources_l_5_m_property_m_address_m_postal_code_s": "string",
-        "dynamodb_new_image_income_m_sources_l_5_m_property_m_lender_type_s": "string",
-        "dynamodb_new_image_income_m_sources_l_5_m_property_m_country_code_s": "string",
-        "dynamodb_new_image_income_m_sources_l_5_m_property_m_owning_term_n": "bigint",
-        "dynamodb_new_image_income_m_sources_l_5_m_monthly_amount_m_value_s": "string",
-        "dynamodb_new_image_income_m_sources_l_5_m_monthly_amount_m_currency_s": "string",
-        "dynamodb_new_image_income_m_sources_l_5_m_source_type_s": "string",
-        "dynamodb_new_image_outgoing_m_credits_l_3_m_finance_provider_s": "string",
-        "dynamodb_new_image_outgoing_m_credits_l_3_m_remaining_term_m_years_n": "bigint",
-        "dynamodb_new_image_outgoing_m_credits_l_3_m_remaining_term_m_months_n": "bigint",
-        "dynamodb_new_image_outgoing_m_monthly_non_essential_costs_l_1_m_explanation_s": "string",
-        "dynamodb_new_image_income_m_business_m_activities_l_2_s": "string",
-        "dynamodb_new_image_income_m_sources_l_3_m_property_m_monthly_repayment_m_value_s": "string",
-        "dynamodb_new_image_income_m_sources_l_3_m_property_m_monthly_repayment_m_currency_s": "string",
-        "dynamodb_new_image_income_m_sources_l_3_m_property_m_outstanding_m_value_s": "string",
-        "dynamodb_new_image_income_m_sources_l_3_m_property_m_outstanding_m_currency_s": "string",
-        "dynamodb_new_image_income_m_sources_l_4_m_property_m_monthly_repayment_m_value_s": "string",
-        "dynamodb_new_image_income_m_sources_l_4_m_property_m_monthly_repayment_m_currency_s": "string",
-        "dynamodb_new_image_income_m_sources_l_4_m_property_m_outstanding_m_value_s": "string",
-        "dynamodb_new_image_income_m_sources_l_4_m_property_m_outstanding_m_currency_s": "string",
-        "dynamodb_new_image_income_m_sources_l_6_m_monthly_amount_m_value_s": "string",
-        "dynamodb_new_image_income_m_sources_l_6_m_monthly_amount_m_currency_s": "string",
-        "dynamodb_new_image_income_m_sources_l_6_m_source_type_s": "string",
-        "dynamodb_new_image_income_m_sources_l_6_m_reason_s": "string",
-        "dynamodb_new_image_income_m_customer_occupations_l_2_s": "string",
-        "dynamodb_new_image_income_m_customer_occupations_l_3_s": "string",
-        "dynamodb_new_image_income_m_customer_occupations_l_4_s": "string",
-        "dynamodb_new_image_outgoing_m_monthly_essential_costs_l_2_m_explanation_s": "string",
-        "dynamodb_new_image_outgoing_m_credits_l_2_m_remaining_term_m_years_n": "bigint",
-        "dynamodb_new_image_outgoing_m_credits_l_2_m_remaining_term_m_months_n": "bigint",
-        "dynamodb_new_image_about_m_residential_addresses_l_4_m_country_specific_address_data_m_neighborhood_s": "string",
-        "dynamodb_new_image_about_m_dependent_people_age_l": "string",
-        "dynamodb_new_image_income_m_business_m_countries_l_1_s": "string",
-        "dynamodb_new_image_income_m_business_m_countries_l_2_s": "string",
-        "dynamodb_new_image_income_m_business_m_activities_l_3_s": "string",
-        "dynamodb_new_image_income_m_sources_l_3_m_property_m_lender_name_s": "string",
-        "dynamodb_new_image_outgoing_m_monthly_essential_costs_l_4_m_explanation_s": "string",
-        "dynamodb_new_image_outgoing_m_monthly_essential_costs_l_3_m_explanation_s": "string",
-        "dynamodb_new_image_outgoing_m_monthly_essential_costs_l_5_m_explanation_s": "string",
-        "dynamodb_new_image_outgoing_m_monthly_non_essential_costs_l_2_m_explanation_s": "string",
-        "dynamodb_new_image_outgoing_m_credits_l_4_m_finance_provider_s": "string",
-        "dynamodb_new_image_outgoing_m_credits_l_5_m_finance_provider_s": "string",
-        "date": "string",
-    },
-    "dynamo_sls_investments_order": {
-        "dynamodb_new_image_provider_account_id_s": "string",
-        "dynamodb_new_image_order_id_s": "string",
-        "dynamodb_new_image_status_s": "string",
-        "dynamodb_new_image_tenant_id_s": "string",
-        "dynamodb_new_image_rebalance_id_s": "string",
-        "dynamodb_new_image_settlement_currency_s": "string",
-        "dynamodb_new_image_settlement_date_s": "string",
-        "dynamodb_new_image_confirmed_at_s": "string",
-        "dynamodb_new_image_investment_name_s": "string",
-        "dynamodb_new_image_user_id_s": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_confirmation_date_s": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_ccc_s": "double",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_calculated_cross_amount_n": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_secondary_key_s": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_all_funds_house_commission_n": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_portfolio_indicator_s": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_performance_fee_n": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_fund_code_s": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_cut_off_date_s": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_price_n": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_ccv_s": "double",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_all_funds_fund_code_s": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_source_contract_s": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_fund_identification_type_s": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_subdistributor_s": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_settlement_date_s": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_operation_number2_s": "double",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_fund_manager_settlement_date_s": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_sequence_s": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_data_time_s": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_distributor_commission2_n": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_amount_to_be_settled_n": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_deposit_n": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_operation_type_s": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_fund_name_s": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_payment_currency_s": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_confirmed_shares_n": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_operation_date_s": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_distributor_code_s": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_distributor_commission1_n": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_switch_fixing_n": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_operation_number_s": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_currency_s": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_corporate_action_id_s": "double",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_all_funds_operation_number2_s": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_product_s": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_entity_code_s": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_data_date_s": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_nav_date_s": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_all_funds_operation_number_s": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_record_type_s": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_record_subtype_s": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_agreed_fixing_currency_s": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_calculated_net_amount_n": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_counter_value_n": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_all_funds_contract_s": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_fund_house_commission_n": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_total_exchange_rate_n": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_fund_commission_n": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_exchange_indicator_s": "string",
-        "dynamodb_new_image_confirmation_m_general_operation_data_m_primary_key_s": "string",
-        "dynamodb_new_image_provider_s": "string",
-        "dynamodb_new_image_provider_investment_id_s": "string",
-        "dynamodb_new_image_id_s": "string",
-        "dynamodb_new_image_encoded_key_s": "string",
-        "dynamodb_new_image_transaction_payload_m_transaction_date_data_m_confirmation_date_s": "string",
-        "dynamodb_new_image_transaction_payload_m_transaction_date_data_m_ordered_date_s": "string",
-        "dynamodb_new_image_transaction_payload_m_transaction_date_data_m_settlement_date_s": "string",
-        "dynamodb_new_image_transaction_payload_m_transaction_date_data_m_payment_date_s": "string",
-        "dynamodb_new_image_transaction_payload_m_transaction_date_data_m_cutoff_date_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_date_data_m_cancellation_date_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_depositary_id_n": "string",
-        "dynamodb_new_image_transaction_payload_m_transaction_commission_data_m_commission_currency_code_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_commission_data_m_commission_n": "string",
-        "dynamodb_new_image_transaction_payload_m_transaction_commission_data_m_commission_amount_n": "string",
-        "dynamodb_new_image_transaction_payload_m_transaction_comments_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_dealing_instrument_m_url_s": "string",
-        "dynamodb_new_image_transaction_payload_m_dealing_instrument_m_id_s": "string",
-        "dynamodb_new_image_transaction_payload_m_dealing_instrument_m_label_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_type_code_s": "string",
-        "dynamodb_new_image_transaction_payload_m_transaction_french_market_data_m_centralization_date_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_french_market_data_m_country_of_deposit_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_french_market_data_m_reception_date_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_french_market_data_m_french_market_fees_data_m_commission_percentage_n": "string",
-        "dynamodb_new_image_transaction_payload_m_transaction_french_market_data_m_french_market_fees_data_m_placement_fee_percentage_n": "string",
-        "dynamodb_new_image_transaction_payload_m_transaction_french_market_data_m_french_market_fees_data_m_placement_fee_amount_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_french_market_data_m_french_market_fees_data_m_adquis_fee_amount_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_french_market_data_m_french_market_fees_data_m_adquis_fee_percentage_n": "string",
-        "dynamodb_new_image_transaction_payload_m_transaction_french_market_data_m_french_market_fees_data_m_ucit_fee_percentage_n": "string",
-        "dynamodb_new_image_transaction_payload_m_transaction_french_market_data_m_french_market_fees_data_m_ucit_fee_amount_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_french_market_data_m_french_market_fees_data_m_commission_amount_n": "string",
-        "dynamodb_new_image_transaction_payload_m_transaction_french_market_data_m_earmarking_data_m_earmark_inversor_identifier_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_french_market_data_m_earmarking_data_m_earmark_name_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_french_market_data_m_earmarking_data_m_earmark_contract_reference_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_french_market_data_m_earmarking_data_m_earmark_type_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_french_market_data_m_french_market_settings_data_m_straing_through_processing_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_french_market_data_m_french_market_settings_data_m_bed_and_breakfast_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_french_market_data_m_french_market_settings_data_m_dividend_reinvestment_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_french_market_data_m_french_market_settings_data_m_tropic_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_french_market_data_m_french_market_settings_data_m_pre_advise_order_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_french_market_data_m_french_market_settings_data_m_bed_and_breakfast_reference_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_french_market_data_m_french_market_settings_data_m_settled_order_bool": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_french_market_data_m_french_market_settings_data_m_operating_system_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_switch_data_m_associated_transaction_external_reference_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_switch_data_m_associated_transaction_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_switch_data_m_associated_dealing_instrument_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_switch_data_m_associated_dealing_instrument_type_s": "string",
-        "dynamodb_new_image_transaction_payload_m_transaction_switch_data_m_associated_currency_code_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_switch_data_m_switch_exchange_rate_n": "string",
-        "dynamodb_new_image_transaction_payload_m_dealing_instrument_family_id_n": "string",
-        "dynamodb_new_image_transaction_payload_m_transaction_amount_data_m_awarded_gross_amount_n": "string",
-        "dynamodb_new_image_transaction_payload_m_transaction_amount_data_m_requested_net_amount_n": "string",
-        "dynamodb_new_image_transaction_payload_m_transaction_amount_data_m_requested_gross_amount_n": "string",
-        "dynamodb_new_image_transaction_payload_m_transaction_amount_data_m_awarded_net_amount_n": "string",
-        "dynamodb_new_image_transaction_payload_m_transaction_amount_data_m_settled_amount_n": "string",
-        "dynamodb_new_image_transaction_payload_m_transaction_etf_data_m_broker_id_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_etf_data_m_estimated_exchange_rate_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_etf_data_m_exchange_rate_date_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_etf_data_m_etf_dealing_data_m_dealing_type_code_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_etf_data_m_etf_dealing_data_m_launch_price_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_etf_data_m_etf_dealing_data_m_validity_period_code_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_etf_data_m_etf_dealing_data_m_expiration_date_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_etf_data_m_etf_dealing_data_m_execute_shares_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_etf_data_m_etf_dealing_data_m_pending_shares_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_etf_data_m_per_share_net_amount_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_etf_data_m_stock_exchange_id_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_etf_data_m_estimateded_exchange_rate_to_local_currency_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_ordered_by_s": "string",
-        "dynamodb_new_image_transaction_payload_m_transaction_spanish_market_data_m_basque_spanish_region_s": "string",
-        "dynamodb_new_image_transaction_payload_m_transaction_spanish_market_data_m_capital_gained_until2005_n": "string",
-        "dynamodb_new_image_transaction_payload_m_transaction_spanish_market_data_m_valuation_until2006_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_spanish_market_data_m_spanish_transfer_id_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_spanish_market_data_m_valuation_until2005_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_spanish_market_data_m_spanish_transfer_external_reference_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_mean_of_payment_m_zip_code_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_mean_of_payment_m_iban_code_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_mean_of_payment_m_address_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_mean_of_payment_m_city_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_mean_of_payment_m_cab_code_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_mean_of_payment_m_description_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_mean_of_payment_m_abi_code_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_mean_of_payment_m_bic_code_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_mean_of_payment_m_mean_of_payment_type_code_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_mean_of_payment_m_is_default_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_mean_of_payment_m_fiscal_code_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_mean_of_payment_m_name_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_mean_of_payment_m_cheque_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_mean_of_payment_m_cash_account_number_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_mean_of_payment_m_region_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_mean_of_payment_m_currency_code_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_price_m_date_s": "string",
-        "dynamodb_new_image_transaction_payload_m_price_m_price_type_code_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_price_m_currency_code_s": "string",
-        "dynamodb_new_image_transaction_payload_m_price_m_value_n": "string",
-        "dynamodb_new_image_transaction_payload_m_transaction_settings_data_m_kiid_accessible_bool": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_settings_data_m_grouped_bool": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_settings_data_m_cancelable_bool": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_settings_data_m_number_grouped_transactions_n": "string",
-        "dynamodb_new_image_transaction_payload_m_transaction_settings_data_m_originated_from_spanish_transfer_bool": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_settings_data_m_dealing_currency_policy_s": "string",
-        "dynamodb_new_image_transaction_payload_m_transaction_settings_data_m_report_accessible_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_settings_data_m_itemise_bool": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_settings_data_m_originated_from_operation_bool": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_settings_data_m_tax_transaction_history_bool": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_settings_data_m_grouped_reference_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_settings_data_m_pac_bool": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_settings_data_m_omnibus_s": "string",
-        "dynamodb_new_image_transaction_payload_m_transaction_settings_data_m_history_accessible_bool": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_settings_data_m_operation_id_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_settings_data_m_grouped_transactions_confirmed_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_settings_data_m_transferable_snce_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_settings_data_m_ex_dividend_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_contract_data_m_contract_account_m_current_account_code_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_contract_data_m_contract_account_m_asset_account_code_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_contract_data_m_sub_contract_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_contract_data_m_contract_external_reference_s": "string",
-        "dynamodb_new_image_transaction_payload_m_transaction_status_code_s": "string",
-        "dynamodb_new_image_transaction_payload_m_id_n": "string",
-        "dynamodb_new_image_transaction_payload_m_subdistributor_id_n": "string",
-        "dynamodb_new_image_transaction_payload_m_dealing_fund_house_id_n": "string",
-        "dynamodb_new_image_transaction_payload_m_average_price_applied_n": "string",
-        "dynamodb_new_image_transaction_payload_m_transaction_account_data_m_settled_account_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_account_data_m_awarded_account_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_semiliquid_data_m_force_sending_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_semiliquid_data_m_lot_id_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_semiliquid_data_m_is_lot_bool": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_semiliquid_data_m_fee_acceptance_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_fee_data_m_exit_charge_n": "string",
-        "dynamodb_new_image_transaction_payload_m_transaction_fee_data_m_expenses_applied_by_afb_n": "string",
-        "dynamodb_new_image_transaction_payload_m_transaction_fee_data_m_exchange_fee_n": "string",
-        "dynamodb_new_image_transaction_payload_m_transaction_fee_data_m_discount_n": "string",
-        "dynamodb_new_image_transaction_payload_m_transaction_fee_data_m_applied_dealing_fund_house_fee_n": "string",
-        "dynamodb_new_image_transaction_payload_m_transaction_fee_data_m_deposit_fee_n": "string",
-        "dynamodb_new_image_transaction_payload_m_transaction_fee_data_m_first_transaction_fee_percentage_n": "string",
-        "dynamodb_new_image_transaction_payload_m_transaction_fee_data_m_second_transaction_fee_percentage_n": "string",
-        "dynamodb_new_image_transaction_payload_m_transaction_fee_data_m_first_transaction_fee_amount_n": "string",
-        "dynamodb_new_image_transaction_payload_m_transaction_fee_data_m_applied_distributor_fee_n": "string",
-        "dynamodb_new_image_transaction_payload_m_transaction_fee_data_m_performance_fee_n": "string",
-        "dynamodb_new_image_transaction_payload_m_transaction_fee_data_m_fee_per_dealing_instrument_n": "string",
-        "dynamodb_new_image_transaction_payload_m_transaction_fee_data_m_total_fee_n": "string",
-        "dynamodb_new_image_transaction_payload_m_transaction_fee_data_m_second_transaction_fee_amount_n": "string",
-        "dynamodb_new_image_transaction_payload_m_transaction_fee_data_m_dilution_levy_n": "string",
-        "dynamodb_new_image_transaction_payload_m_transaction_fee_data_m_initial_charge_n": "string",
-        "dynamodb_new_image_transaction_payload_m_product_id_n": "string",
-        "dynamodb_new_image_transaction_payload_m_transaction_shares_data_m_awarded_shares_n": "string",
-        "dynamodb_new_image_transaction_payload_m_transaction_shares_data_m_confirmed_shares_before_distribution_n": "string",
-        "dynamodb_new_image_transaction_payload_m_transaction_shares_data_m_requested_shares_n": "string",
-        "dynamodb_new_image_transaction_payload_m_transaction_shares_data_m_shares_at_cutoff_date_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_shares_data_m_confirmed_shared_after_distribution_n": "string",
-        "dynamodb_new_image_transaction_payload_m_distributor_id_n": "string",
-        "dynamodb_new_image_transaction_payload_m_payment_currency_code_s": "string",
-        "dynamodb_new_image_transaction_payload_m_transaction_dividend_data_m_distribution_category_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_dividend_data_m_dividend_payout_frequency_code_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_dividend_data_m_per_dealing_instrument_corporation_tax_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_dividend_data_m_interest_percentage_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_dividend_data_m_net_income_amount_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_dividend_data_m_distribution_number_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_dividend_data_m_distribution_policy_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_dividend_data_m_dividend_rate_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_dividend_data_m_transaction_reinvestment_data_m_reinvestment_price_m_date_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_dividend_data_m_transaction_reinvestment_data_m_reinvestment_price_m_price_type_code_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_dividend_data_m_transaction_reinvestment_data_m_reinvestment_price_m_currency_code_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_dividend_data_m_transaction_reinvestment_data_m_reinvestment_price_m_value_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_dividend_data_m_transaction_reinvestment_data_m_reinvested_amount_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_dividend_data_m_transaction_reinvestment_data_m_reinvestment_withheld_percentage_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_dividend_data_m_transaction_reinvestment_data_m_reinvestment_transaction_external_reference_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_dividend_data_m_transaction_reinvestment_data_m_reinvestment_withheld_amount_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_dividend_data_m_transaction_reinvestment_data_m_reinvested_shares_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_dividend_data_m_transaction_reinvestment_data_m_reinvestment_withheld_amount_in_local_currency_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_dividend_data_m_withholding_policy_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_dividend_data_m_shares_rate_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_dividend_data_m_net_equalization_amount_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_dividend_data_m_per_share_corporation_tax_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_dividend_data_m_dividend_type_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_dividend_data_m_gross_dividend_amount_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_dividend_data_m_franked_income_percentage_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_dividend_data_m_income_tax_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_dividend_data_m_capital_percentage_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_dividend_data_m_local_account_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_dividend_data_m_unfranked_income_percentage_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_dividend_data_m_equalization_rate_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_dividend_data_m_gross_amount_rate_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_dividend_data_m_payment_date_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_dividend_data_m_start_date_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_dealing_instrument_type_s": "string",
-        "dynamodb_new_image_transaction_payload_m_local_currency_code_s": "string",
-        "dynamodb_new_image_transaction_payload_m_external_reference_s": "string",
-        "dynamodb_new_image_transaction_payload_m_exchange_rate_applied_n": "string",
-        "dynamodb_new_image_transaction_payload_m_exchange_rate_to_local_currency_n": "string",
-        "dynamodb_new_image_transaction_payload_m_transaction_prepaid_data_m_prepaid_amount_n": "string",
-        "dynamodb_new_image_transaction_payload_m_transaction_prepaid_data_m_estimated_price_applied_m_date_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_prepaid_data_m_estimated_price_applied_m_price_type_code_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_prepaid_data_m_estimated_price_applied_m_currency_code_s": "string",
-        "dynamodb_new_image_transaction_payload_m_transaction_prepaid_data_m_estimated_price_applied_m_value_n": "string",
-        "dynamodb_new_image_transaction_payload_m_contract_id_n": "string",
-        "dynamodb_new_image_transaction_payload_m_transaction_capital_gained_data_m_capital_gained_n": "string",
-        "dynamodb_new_image_transaction_payload_m_transaction_capital_gained_data_m_capital_gained_in_local_currency_n": "string",
-        "dynamodb_new_image_transaction_payload_m_cash_flow_sub_type_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_charity_reference_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_currency_code_s": "string",
-        "dynamodb_new_image_transaction_payload_m_has_partials_bool": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_italian_retail_market_data_m_weighted_average_price_n": "string",
-        "dynamodb_new_image_transaction_payload_m_transaction_italian_retail_market_data_m_weighted_average_cost_n": "string",
-        "dynamodb_new_image_transaction_payload_m_transaction_italian_retail_market_data_m_reduction_fee_percentage_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_italian_retail_market_data_m_cmu_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_italian_retail_market_data_m_capital_loss_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_italian_retail_market_data_m_trade_date_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_italian_retail_market_data_m_nav_weighted_average_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_italian_retail_market_data_m_transferability_reference_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_italian_retail_market_data_m_fiscal_accrued_income_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_italian_retail_market_data_m_dividend_reinvestment_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_italian_retail_market_data_m_fiscal_shares_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_italian_retail_market_data_m_capital_loss_fee_part_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_italian_retail_market_data_m_confirmation_letter_bool": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_italian_retail_market_data_m_fee_charge_option_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_italian_retail_market_data_m_withdraw_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_foreign_exchange_data_m_fx_service_fee_currency_code_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_foreign_exchange_data_m_fx_rate_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_foreign_exchange_data_m_fx_rate_applied_by_afb_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_foreign_exchange_data_m_fx_service_fee_amount_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_foreign_exchange_data_m_fx_service_fee_percentage_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_taxable_income_data_m_taxable_income_bool": "boolean",
-        "dynamodb_new_image_transaction_payload_m_taxable_income_data_m_taxable_income_amount_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_withholding_data_m_withheld_amount_in_local_currency_n": "string",
-        "dynamodb_new_image_transaction_payload_m_transaction_withholding_data_m_withholding_percentage_n": "string",
-        "dynamodb_new_image_transaction_payload_m_transaction_withholding_data_m_withheld_amount_n": "string",
-        "dynamodb_new_image_expected_settlement_date_s": "string",
-        "dynamodb_new_image_ordered_at_s": "string",
-        "dynamodb_new_image_settlement_amount_n": "string",
-        "dynamodb_new_image_trace_l_0_m_created_at_s": "string",
-        "dynamodb_new_image_trace_l_0_m_status_s": "string",
-        "dynamodb_new_image_trace_l_1_m_created_at_s": "string",
-        "dynamodb_new_image_trace_l_1_m_status_s": "string",
-        "dynamodb_new_image_trace_l_2_m_created_at_s": "string",
-        "dynamodb_new_image_trace_l_2_m_status_s": "string",
-        "dynamodb_new_image_trace_l_3_m_created_at_s": "string",
-        "dynamodb_new_image_trace_l_3_m_status_s": "string",
-        "dynamodb_new_image_trace_l_4_m_created_at_s": "string",
-        "dynamodb_new_image_trace_l_4_m_status_s": "string",
-        "dynamodb_new_image_trace_l_5_m_created_at_s": "string",
-        "dynamodb_new_image_trace_l_5_m_status_s": "string",
-        "dynamodb_new_image_trace_l_6_m_created_at_s": "string",
-        "dynamodb_new_image_trace_l_6_m_status_s": "string",
-        "dynamodb_new_image_created_at_n": "string",
-        "dynamodb_new_image_updated_at_n": "string",
-        "dynamodb_new_image_provider_order_id_s": "string",
-        "dynamodb_new_image_amount_m_value_n": "double",
-        "dynamodb_new_image_amount_m_currency_s": "string",
-        "dynamodb_new_image_price_per_share_on_order_m_value_n": "string",
-        "dynamodb_new_image_price_per_share_on_order_m_currency_s": "string",
-        "dynamodb_new_image_shares_n": "double",
-        "dynamodb_new_image_transaction_payload_m_transaction_etf_data_m_ticker_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_etf_data_m_cancellation_reason_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_etf_data_m_etf_dealing_data_m_limit_price_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_etf_data_m_etf_dealing_data_m_rfq_platform_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_etf_data_m_transaction_execution_time_null": "boolean",
-        "dynamodb_new_image_transaction_payload_m_transaction_fee_data_m_spread_broker_null": "boolean",
-        "dynamodb_new_image_trace_l_0_s": "string",
-        "dynamodb_new_image_trace_l_1_s": "string",
-        "dynamodb_new_image_trace_id_s": "string",
-        "dynamodb_new_image_trace_l_2_s": "string",
-        "dynamodb_new_image_trace_l_3_s": "string",
-        "dynamodb_new_image_trace_l_4_s": "string",
-        "dynamodb_new_image_trace_l_5_s": "string",
-        "dynamodb_new_image_trace_l_6_s": "string",
-        "dynamodb_new_image_trace_l_7_s": "string",
-        "dynamodb_new_image_trace_l_8_s": "string",
-        "dynamodb_new_image_trace_l_9_s": "string",
-        "dynamodb_new_image_trace_l_10_s": "string",
-        "dynamodb_new_image_trace_l_11_s": "string",
-        "dynamodb_new_image_trace_l_12_s": "string",
-        "dynamodb_new_image_trace_l_13_s": "string",
-        "dynamodb_new_image_trace_l_14_s": "string",
-        "dynamodb_new_image_trace_l_15_s": "string",
-        "dynamodb_new_image_trace_l_16_s": "string",
-        "dynamodb_new_image_trace_l_17_s": "string",
-        "dynamodb_new_image_trace_l_7_m_created_at_s": "string",
-        "dynamodb_new_image_trace_l_7_m_status_s": "string",
-        "dynamodb_new_image_trace_l_8_m_created_at_s": "string",
-        "dynamodb_new_image_trace_l_8_m_status_s": "string",
-        "dynamodb_new_image_trace_l_9_m_created_at_s": "string",
-        "dynamodb_new_image_trace_l_9_m_status_s": "string",
-        "dynamodb_new_image_trace_l_10_m_created_at_s": "string",
-        "dynamodb_new_image_trace_l_10_m_status_s": "string",
-        "dynamodb_new_image_trace_l_18_s": "string",
-        "dynamodb_new_image_trace_l_19_s": "string",
-        "dynamodb_keys_id_s": "string",
-        "event_source": "string",
-        "timestamp_extracted": "timestamp",
-        "date": "string",
-    },
-    "dynamo_onfido": {
-        "aws_region": "string",
-        "dynamodb_approximate_creation_date_time": "timestamp",
-        "dynamodb_keys_pk_s": "string",
-        "dynamodb_new_image_created_at_n": "timestamp",
-        "dynamodb_new_image_data_m_applicant_id_s": "string",
-        "dynamodb_new_image_data_m_applicant_provides_data_bool": "boolean",
-        "dynamodb_new_image_data_m_created_at_s": "string",
-        "dynamodb_new_image_data_m_form_uri_s": "string",
-        "dynamodb_new_image_data_m_href_s": "string",
-        "dynamodb_new_image_data_m_id_s": "string",
-        "dynamodb_new_image_data_m_redirect_uri_s": "string",
-        "dynamodb_new_image_data_m_report_ids_l_0_s": "string",
-        "dynamodb_new_image_data_m_report_ids_l_1_s": "string",
-        "dynamodb_new_image_data_m_result_s": "string",
-        "dynamodb_new_image_data_m_results_uri_s": "string",
-        "dynamodb_new_image_data_m_status_s": "string",
-        "dynamodb_new_image_data_m_tags_l": "string",
-        "dynamodb_new_image_id_check_reason_s": "string",
-        "dynamodb_new_image_id_s": "string",
-        "dynamodb_new_image_onfido_applicant_id_s": "string",
-        "dynamodb_new_image_pk_s": "string",
-        "dynamodb_new_image_updated_at_n": "timestamp",
-        "dynamodb_new_image_user_id_s": "string",
-        "dynamodb_size_bytes": "string",
-        "event_id": "string",
-        "event_name": "string",
-        "event_source": "string",
-        "record_format": "string",
-        "table_name": "string",
-        "user_identity": "string",
-        "timestamp_extracted": "timestamp",
-        "dynamodb_new_image_check_id_s": "string",
-        "dynamodb_new_image_data_m_breakdown_m_face_comparison_m_breakdown_m_face_match_m_properties_m_score_n": "string",
-        "dynamodb_new_image_data_m_breakdown_m_face_comparison_m_breakdown_m_face_match_m_result_s": "string",
-        "dynamodb_new_image_data_m_breakdown_m_face_comparison_m_result_s": "string",
-        "dynamodb_new_image_data_m_breakdown_m_image_integrity_m_breakdown_m_face_detected_m_properties_m": "string",
-        "dynamodb_new_image_data_m_breakdown_m_image_integrity_m_breakdown_m_face_detected_m_result_s": "string",
-        "dynamodb_new_image_data_m_breakdown_m_image_integrity_m_breakdown_m_source_integrity_m_properties_m": "string",
-        "dynamodb_new_image_data_m_breakdown_m_image_integrity_m_breakdown_m_source_integrity_m_result_s": "string",
-        "dynamodb_new_image_data_m_breakdown_m_image_integrity_m_result_s": "string",
-        "dynamodb_new_image_data_m_breakdown_m_visual_authenticity_m_breakdown_m_liveness_detected_m_properties_m": "string",
-        "dynamodb_new_image_data_m_breakdown_m_visual_authenticity_m_breakdown_m_liveness_detected_m_result_s": "string",
-        "dynamodb_new_image_data_m_breakdown_m_visual_authenticity_m_breakdown_m_spoofing_detection_m_properties_m": "string",
-        "dynamodb_new_image_data_m_breakdown_m_visual_authenticity_m_breakdown_m_spoofing_detection_m_result_s": "string",
-        "dynamodb_new_image_data_m_breakdown_m_visual_authenticity_m_result_s": "string",
-        "dynamodb_new_image_data_m_check_id_s": "string",
-        "dynamodb_new_image_data_m_documents_l": "string",
-        "dynamodb_new_image_data_m_name_s": "string",
-        "dynamodb_new_image_data_m_properties_m": "string",
-        "dynamodb_new_image_data_m_breakdown_m_age_validation_m_breakdown_m_minimum_accepted_age_m_properties_m": "string",
-        "dynamodb_new_image_data_m_breakdown_m_age_validation_m_breakdown_m_minimum_accepted_age_m_result_s": "string",
-        "dynamodb_new_image_data_m_breakdown_m_age_validation_m_result_s": "string",
-        "dynamodb_new_image_data_m_breakdown_m_compromised_document_m_result_s": "string",
-        "dynamodb_new_image_data_m_breakdown_m_data_comparison_m_breakdown_m_date_of_birth_m_properties_m": "string",
-        "dynamodb_new_image_data_m_breakdown_m_data_comparison_m_breakdown_m_date_of_birth_m_result_null": "string",
-        "dynamodb_new_image_data_m_breakdown_m_data_comparison_m_breakdown_m_date_of_expiry_m_properties_m": "string",
-        "dynamodb_new_image_data_m_breakdown_m_data_comparison_m_breakdown_m_date_of_expiry_m_result_null": "string",
-        "dynamodb_new_image_data_m_breakdown_m_data_comparison_m_breakdown_m_document_numbers_m_properties_m": "string",
-        "dynamodb_new_image_data_m_breakdown_m_data_comparison_m_breakdown_m_document_numbers_m_result_null": "string",
-        "dynamodb_new_image_data_m_breakdown_m_data_comparison_m_breakdown_m_document_type_m_properties_m": "string",
-        "dynamodb_new_image_data_m_breakdown_m_data_comparison_m_breakdown_m_document_type_m_result_null": "string",
-        "dynamodb_new_image_data_m_breakdown_m_data_comparison_m_breakdown_m_first_name_m_properties_m": "string",
-        "dynamodb_new_image_data_m_breakdown_m_data_comparison_m_breakdown_m_first_name_m_result_null": "string",
-        "dynamodb_new_image_data_m_breakdown_m_data_comparison_m_breakdown_m_gender_m_properties_m": "string",
-        "dynamodb_new_image_data_m_breakdown_m_data_comparison_m_breakdown_m_gender_m_result_null": "string",
-        "dynamodb_new_image_data_m_breakdown_m_data_comparison_m_breakdown_m_issuing_country_m_properties_m": "string",
-        "dynamodb_new_image_data_m_breakdown_m_data_comparison_m_breakdown_m_issuing_country_m_result_null": "string",
-        "dynamodb_new_image_data_m_breakdown_m_data_comparison_m_breakdown_m_last_name_m_properties_m": "string",
-        "dynamodb_new_image_data_m_breakdown_m_data_comparison_m_breakdown_m_last_name_m_result_null": "string",
-        "dynamodb_new_image_data_m_breakdown_m_data_comparison_m_result_null": "string",
-        "dynamodb_new_image_data_m_breakdown_m_data_consistency_m_breakdown_m_date_of_birth_m_properties_m": "string",
-        "dynamodb_new_image_data_m_breakdown_m_data_consistency_m_breakdown_m_date_of_birth_m_result_s": "string",
-        "dynamodb_new_image_data_m_breakdown_m_data_consistency_m_breakdown_m_date_of_expiry_m_properties_m": "string",
-        "dynamodb_new_image_data_m_breakdown_m_data_consistency_m_breakdown_m_date_of_expiry_m_result_s": "string",
-        "dynamodb_new_image_data_m_breakdown_m_data_consistency_m_breakdown_m_document_numbers_m_properties_m": "string",
-        "dynamodb_new_image_data_m_breakdown_m_data_consistency_m_breakdown_m_document_numbers_m_result_s": "string",
-        "dynamodb_new_image_data_m_breakdown_m_data_consistency_m_breakdown_m_document_type_m_properties_m": "string",
-        "dynamodb_new_image_data_m_breakdown_m_data_consistency_m_breakdown_m_document_type_m_result_s": "string",
-        "dynamodb_new_image_data_m_breakdown_m_data_consistency_m_breakdown_m_first_name_m_properties_m": "string",
-        "dynamodb_new_image_data_m_breakdown_m_data_consistency_m_breakdown_m_first_name_m_result_s": "string",
-        "dynamodb_new_image_data_m_breakdown_m_data_consistency_m_breakdown_m_gender_m_properties_m": "string",
-        "dynamodb_new_image_data_m_breakdown_m_data_consistency_m_breakdown_m_gender_m_result_s": "string",
-        "dynamodb_new_image_data_m_breakdown_m_data_consistency_m_breakdown_m_issuing_country_m_properties_m": "string",
-        "dynamodb_new_image_data_m_breakdown_m_data_consistency_m_breakdown_m_issuing_country_m_result_s": "string",
-        "dynamodb_new_image_data_m_breakdown_m_data_consistency_m_breakdown_m_last_name_m_properties_m": "string",
-        "dynamodb_new_image_data_m_breakdown_m_data_consistency_m_breakdown_m_last_name_m_result_s": "string",
-        "dynamodb_new_image_data_m_breakdown_m_data_consistency_m_breakdown_m_nationality_m_properties_m": "string",
-        "dynamodb_new_image_data_m_breakdown_m_data_consistency_m_breakdown_m_nationality_m_result_null": "string",
-        "dynamodb_new_image_data_m_breakdown_m_data_consistency_m_result_s": "string",
-        "dynamodb_new_image_data_m_breakdown_m_data_validation_m_breakdown_m_date_of_birth_m_properties_m": "string",
-        "dynamodb_new_image_data_m_breakdown_m_data_validation_m_breakdown_m_date_of_birth_m_result_s": "string",
-        "dynamodb_new_image_data_m_breakdown_m_data_validation_m_breakdown_m_document_expiration_m_properties_m": "string",
-        "dynamodb_new_image_data_m_breakdown_m_data_validation_m_breakdown_m_document_expiration_m_result_s": "string",
-        "dynamodb_new_image_data_m_breakdown_m_data_validation_m_breakdown_m_document_numbers_m_properties_m_document_number_s": "string",
-        "dynamodb_new_image_data_m_breakdown_m_data_validation_m_breakdown_m_document_numbers_m_result_s": "string",
-        "dynamodb_new_image_data_m_breakdown_m_data_validation_m_breakdown_m_expiry_date_m_properties_m": "string",
-        "dynamodb_new_image_data_m_breakdown_m_data_validation_m_breakdown_m_expiry_date_m_result_s": "string",
-        "dynamodb_new_image_data_m_breakdown_m_data_validation_m_breakdown_m_gender_m_properties_m": "string",
-        "dynamodb_new_image_data_m_breakdown_m_data_validation_m_breakdown_m_gender_m_result_s": "string",
-        "dynamodb_new_image_data_m_breakdown_m_data_validation_m_breakdown_m_mrz_m_properties_m": "string",
-        "dynamodb_new_image_data_m_breakdown_m_data_validation_m_breakdown_m_mrz_m_result_s": "string",
-        "dynamodb_new_image_data_m_breakdown_m_data_validation_m_result_s": "string",
-        "dynamodb_new_image_data_m_breakdown_m_image_integrity_m_breakdown_m_colour_picture_m_properties_m": "string",
-        "dynamodb_new_image_data_m_breakdown_m_image_integrity_m_breakdown_m_colour_picture_m_result_s": "string",
-        "dynamodb_new_image_data_m_breakdown_m_image_integrity_m_breakdown_m_conclusive_document_quality_m_properties_m_abnormal_document_features_s": "string",
-        "dynamodb_new_image_data_m_breakdown_m_image_integrity_m_breakdown_m_conclusive_document_quality_m_properties_m_corner_removed_s": "string",
-        "dynamodb_new_image_data_m_breakdown_m_image_integrity_m_breakdown_m_conclusive_document_quality_m_properties_m_digital_document_s": "string",
-        "dynamodb_new_image_data_m_breakdown_m_image_integrity_m_breakdown_m_conclusive_document_quality_m_properties_m_missing_back_s": "string",
-        "dynamodb_new_image_data_m_breakdown_m_image_integrity_m_breakdown_m_conclusive_document_quality_m_properties_m_obscured_data_points_s": "string",
-        "dynamodb_new_image_data_m_breakdown_m_image_integrity_m_breakdown_m_conclusive_document_quality_m_properties_m_obscured_security_features_s": "string",
-        "dynamodb_new_image_data_m_breakdown_m_image_integrity_m_breakdown_m_conclusive_document_quality_m_properties_m_punctured_document_s": "string",
-        "dynamodb_new_image_data_m_breakdown_m_image_integrity_m_breakdown_m_conclusive_document_quality_m_properties_m_watermarks_digital_text_overlay_s": "string",
-        "dynamodb_new_image_data_m_breakdown_m_image_integrity_m_breakdown_m_conclusive_document_quality_m_result_s": "string",
-        "dynamodb_new_image_data_m_breakdown_m_image_integrity_m_breakdown_m_image_quality_m_properties_m": "string",
-        "dynamodb_new_image_data_m_breakdown_m_image_integrity_m_breakdown_m_image_quality_m_result_s": "string",
-        "dynamodb_new_image_data_m_breakdown_m_image_integrity_m_breakdown_m_supported_document_m_properties_m": "string",
-        "dynamodb_new_image_data_m_breakdown_m_image_integrity_m_breakdown_m_supported_document_m_result_s": "string",
-        "dynamodb_new_image_data_m_breakdown_m_police_record_m_result_null": "string",
-        "dynamodb_new_image_data_m_breakdown_m_visual_authenticity_m_breakdown_m_digital_tampering_m_properties_m": "string",
-        "dynamodb_new_image_data_m_breakdown_m_visual_authenticity_m_breakdown_m_digital_tampering_m_result_s": "string",
-        "dynamodb_new_image_data_m_breakdown_m_visual_authenticity_m_breakdown_m_face_detection_m_properties_m": "string",
-        "dynamodb_new_image_data_m_breakdown_m_visual_authenticity_m_breakdown_m_face_detection_m_result_s": "string",
-        "dynamodb_new_image_data_m_breakdown_m_visual_authenticity_m_breakdown_m_fonts_m_properties_m": "string",
-        "dynamodb_new_image_data_m_breakdown_m_visual_authenticity_m_breakdown_m_fonts_m_result_s": "string",
-        "dynamodb_new_image_data_m_breakdown_m_visual_authenticity_m_breakdown_m_original_document_present_m_properties_m_document_on_printed_paper_s": "string",
-        "dynamodb_new_image_data_m_breakdown_m_visual_authenticity_m_breakdown_m_original_document_present_m_properties_m_photo_of_screen_s": "string",
-        "dynamodb_new_image_data_m_breakdown_m_visual_authenticity_m_breakdown_m_original_document_present_m_properties_m_scan_s": "string",
-        "dynamodb_new_image_data_m_breakdown_m_visual_authenticity_m_breakdown_m_original_document_present_m_properties_m_screenshot_s": "string",
-        "dynamodb_new_image_data_m_breakdown_m_visual_authenticity_m_breakdown_m_original_document_present_m_result_s": "string",
-        "dynamodb_new_image_data_m_breakdown_m_visual_authenticity_m_breakdown_m_other_m_properties_m": "string",
-        "dynamodb_new_image_data_m_breakdown_m_visual_authenticity_m_breakdown_m_other_m_result_s": "string",
-        "dynamodb_new_image_data_m_breakdown_m_visual_authenticity_m_breakdown_m_picture_face_integrity_m_properties_m": "string",
-        "dynamodb_new_image_data_m_breakdown_m_visual_authenticity_m_breakdown_m_picture_face_integrity_m_result_s": "string",
-        "dynamodb_new_image_data_m_breakdown_m_visual_authenticity_m_breakdown_m_security_features_m_properties_m": "string",
-        "dynamodb_new_image_data_m_breakdown_m_visual_authenticity_m_breakdown_m_security_features_m_result_s": "string",
-        "dynamodb_new_image_data_m_breakdown_m_visual_authenticity_m_breakdown_m_template_m_properties_m": "string",
-        "dynamodb_new_image_data_m_breakdown_m_visual_authenticity_m_breakdown_m_template_m_result_s": "string",
-        "dynamodb_new_image_data_m_properties_m_date_of_birth_s": "string",
-        "dynamodb_new_image_data_m_properties_m_date_of_expiry_s": "string",
-        "dynamodb_new_image_data_m_properties_m_document_numbers_l_0_m_type_s": "string",
-        "dynamodb_new_image_data_m_properties_m_document_numbers_l_0_m_value_s": "string",
-        "dynamodb_new_image_data_m_properties_m_document_type_s": "string",
-        "dynamodb_new_image_data_m_properties_m_first_name_s": "string",
-        "dynamodb_new_image_data_m_properties_m_gender_s": "string",
-        "dynamodb_new_image_data_m_properties_m_issuing_country_s": "string",
-        "dynamodb_new_image_data_m_properties_m_issuing_date_s": "string",
-        "dynamodb_new_image_data_m_properties_m_last_name_s": "string",
-        "dynamodb_new_image_data_m_properties_m_mrz_line1_s": "string",
-        "dynamodb_new_image_data_m_properties_m_mrz_line2_s": "string",
-        "dynamodb_new_image_data_m_properties_m_nationality_s": "string",
-        "dynamodb_new_image_data_m_properties_m_place_of_birth_s": "string",
-        "dynamodb_new_image_data_m_sub_result_s": "string",
-        "dynamodb_new_image_data_m_document_classification_m_document_type_s": "string",
-        "dynamodb_new_image_data_m_document_classification_m_issuing_country_s": "string",
-        "dynamodb_new_image_data_m_document_id_s": "string",
-        "dynamodb_new_image_data_m_extracted_data_m_date_of_birth_s": "string",
-        "dynamodb_new_image_data_m_extracted_data_m_date_of_expiry_s": "string",
-        "dynamodb_new_image_data_m_extracted_data_m_document_number_s": "string",
-        "dynamodb_new_image_data_m_extracted_data_m_first_name_s": "string",
-        "dynamodb_new_image_data_m_extracted_data_m_full_name_s": "string",
-        "dynamodb_new_image_data_m_extracted_data_m_gender_s": "string",
-        "dynamodb_new_image_data_m_extracted_data_m_last_name_s": "string",
-        "dynamodb_new_image_data_m_extracted_data_m_mrz_line1_s": "string",
-        "dynamodb_new_image_data_m_extracted_data_m_mrz_line2_s": "string",
-        "dynamodb_new_image_data_m_extracted_data_m_mrz_line3_s": "string",
-        "dynamodb_new_image_data_m_extracted_data_m_nationality_s": "string",
-        "dynamodb_new_image_data_m_properties_m_mrz_line3_s": "string",
-        "dynamodb_new_image_data_m_breakdown_m_data_validation_m_breakdown_m_document_numbers_m_properties_m_personal_number_s": "string",
-        "dynamodb_new_image_data_m_properties_m_document_numbers_l_1_m_type_s": "string",
-        "dynamodb_new_image_data_m_properties_m_document_numbers_l_1_m_value_s": "string",
-        "dynamodb_new_image_data_m_breakdown_m_visual_authenticity_m_breakdown_m_digital_tampering_m_result_null": "string",
-        "dynamodb_new_image_data_m_breakdown_m_visual_authenticity_m_breakdown_m_fonts_m_result_null": "string",
-        "dynamodb_new_image_data_m_breakdown_m_visual_authenticity_m_breakdown_m_picture_face_integrity_m_result_null": "string",
-        "dynamodb_new_image_data_m_breakdown_m_visual_authenticity_m_breakdown_m_security_features_m_result_null": "string",
-        "dynamodb_new_image_data_m_breakdown_m_visual_authenticity_m_breakdown_m_template_m_result_null": "string",
-        "dynamodb_new_image_data_m_breakdown_m_image_integrity_m_breakdown_m_image_quality_m_properties_m_glare_on_photo_s": "string",
-        "dynamodb_new_image_data_m_breakdown_m_image_integrity_m_breakdown_m_conclusive_document_quality_m_properties_m": "string",
-        "dynamodb_new_image_data_m_breakdown_m_visual_authenticity_m_breakdown_m_original_document_present_m_properties_m": "string",
-        "dynamodb_new_image_data_m_breakdown_m_image_integrity_m_breakdown_m_image_quality_m_properties_m_two_documents_uploaded_s": "string",
-        "dynamodb_new_image_data_m_breakdown_m_data_validation_m_breakdown_m_document_numbers_m_properties_m": "string",
-        "dynamodb_new_image_data_m_breakdown_m_data_consistency_m_breakdown_m_date_of_birth_m_result_null": "string",
-        "dynamodb_new_image_data_m_breakdown_m_data_consistency_m_breakdown_m_date_of_expiry_m_result_null": "string",
-        "dynamodb_new_image_data_m_breakdown_m_data_consistency_m_breakdown_m_document_numbers_m_result_null": "string",
-        "dynamodb_new_image_data_m_breakdown_m_data_consistency_m_breakdown_m_document_type_m_result_null": "string",
-        "dynamodb_new_image_data_m_breakdown_m_data_consistency_m_breakdown_m_first_name_m_result_null": "string",
-        "dynamodb_new_image_data_m_breakdown_m_data_consistency_m_breakdown_m_gender_m_result_null": "string",
-        "dynamodb_new_image_data_m_breakdown_m_data_consistency_m_breakdown_m_issuing_country_m_result_null": "string",
-        "dynamodb_new_image_data_m_breakdown_m_data_consistency_m_breakdown_m_last_name_m_result_null": "string",
-        "dynamodb_new_image_data_m_breakdown_m_data_consistency_m_result_null": "string",
-        "dynamodb_new_image_data_m_breakdown_m_data_validation_m_breakdown_m_mrz_m_result_null": "string",
-        "dynamodb_new_image_data_m_properties_m_categorisation_s": "string",
-        "dynamodb_new_image_data_m_properties_m_issuing_authority_s": "string",
-        "dynamodb_new_image_data_m_breakdown_m_data_validation_m_breakdown_m_document_numbers_m_result_null": "string",
-        "dynamodb_new_image_data_m_document_classification_m": "string",
-        "dynamodb_new_image_data_m_breakdown_m_image_integrity_m_breakdown_m_image_quality_m_properties_m_covered_photo_s": "string",
-        "dynamodb_new_image_data_m_breakdown_m_image_integrity_m_breakdown_m_image_quality_m_properties_m_other_photo_issue_s": "string",
-        "dynamodb_new_image_data_m_breakdown_m_age_validation_m_breakdown_m_minimum_accepted_age_m_result_null": "string",
-        "dynamodb_new_image_data_m_breakdown_m_age_validation_m_result_null": "string",
-        "dynamodb_new_image_data_m_breakdown_m_data_validation_m_breakdown_m_date_of_birth_m_result_null": "string",
-        "dynamodb_new_image_data_m_breakdown_m_data_validation_m_breakdown_m_gender_m_result_null": "string",
-        "dynamodb_new_image_data_m_breakdown_m_face_comparison_m_breakdown_m_face_match_m_properties_m": "string",
-        "dynamodb_new_image_data_m_breakdown_m_face_comparison_m_breakdown_m_face_match_m_result_null": "string",
-        "dynamodb_new_image_data_m_breakdown_m_face_comparison_m_result_null": "string",
-        "dynamodb_new_image_data_m_breakdown_m_image_integrity_m_breakdown_m_image_quality_m_properties_m_no_document_in_image_s": "string",
-        "dynamodb_new_image_data_m_breakdown_m_image_integrity_m_breakdown_m_image_quality_m_properties_m_blurred_photo_s": "string",
-        "dynamodb_new_image_data_m_breakdown_m_image_integrity_m_breakdown_m_image_quality_m_properties_m_cut_off_document_s": "string",
-        "dynamodb_new_image_data_m_breakdown_m_visual_authenticity_m_breakdown_m_liveness_detected_m_result_null": "string",
-        "dynamodb_new_image_data_m_breakdown_m_visual_authenticity_m_breakdown_m_spoofing_detection_m_result_null": "string",
-        "dynamodb_new_image_data_m_breakdown_m_visual_authenticity_m_result_null": "string",
-        "dynamodb_new_image_data_m_properties_m_document_version_s": "string",
-        "dynamodb_new_image_data_m_properties_m_document_numbers_l_1_m_value_null": "string",
-        "dynamodb_new_image_data_m_breakdown_m_image_integrity_m_breakdown_m_image_quality_m_properties_m_dark_photo_s": "string",
-        "dynamodb_new_image_data_m_breakdown_m_data_validation_m_breakdown_m_document_expiration_m_result_null": "string",
-        "dynamodb_new_image_data_m_breakdown_m_data_validation_m_breakdown_m_expiry_date_m_result_null": "string",
-        "dynamodb_new_image_data_m_breakdown_m_data_validation_m_result_null": "string",
-        "dynamodb_keys_id_s": "string",
-        "dynamodb_new_image_data_m_breakdown_m_image_integrity_m_breakdown_m_image_quality_m_properties_m_incorrect_side_s": "string",
-        "source": "string",
-        "dynamodb_new_image_data_m_breakdown_m_data_validation_m_breakdown_m_document_numbers_m_properties_m_tc_kimlik_s": "string",
-        "dynamodb_new_image_data_m_properties_m_issuing_state_s": "string",
-        "dynamodb_new_image_data_m_properties_m_real_id_compliance_bool": "boolean",
-        "dynamodb_new_image_data_m_breakdown_m": "string",
-        "dynamodb_new_image_data_m_breakdown_m_face_comparison_m_breakdown_m_face_match_m_properties_m_document_id_s": "string",
-        "dynamodb_new_image_data_m_document_classification_m_issuing_state_s": "string",
-        "dynamodb_new_image_data_m_extracted_data_m": "string",
-        "dynamodb_new_image_data_m_breakdown_m_image_integrity_m_breakdown_m_image_quality_m_properties_m_damaged_document_s": "string",
-        "dynamodb_new_image_data_m_properties_m_document_numbers_l_0_m_value_null": "string",
-        "dynamodb_new_image_data_m_breakdown_m_visual_authenticity_m_breakdown_m_original_document_present_m_result_null": "string",
-        "dynamodb_new_image_data_m_properties_m_alias_name_s": "string",
-        "dynamodb_new_image_data_m_properties_m_document_type_null": "string",
-        "dynamodb_new_image_data_m_properties_m_first_name_null": "string",
-        "dynamodb_new_image_data_m_properties_m_issuing_country_null": "string",
-        "dynamodb_new_image_data_m_properties_m_last_name_null": "string",
-        "dynamodb_new_image_data_m_properties_m_address_s": "string",
-        "dynamodb_new_image_data_m_breakdown_m_data_validation_m_breakdown_m_document_numbers_m_properties_m_cpf_s": "string",
-        "dynamodb_new_image_data_m_breakdown_m_data_validation_m_breakdown_m_document_numbers_m_properties_m_driving_licence_s": "string",
-        "dynamodb_new_image_data_m_breakdown_m_data_validation_m_breakdown_m_document_numbers_m_properties_m_registration_s": "string",
-        "dynamodb_new_image_data_m_breakdown_m_data_validation_m_breakdown_m_document_numbers_m_properties_m_rg_s": "string",
-        "dynamodb_new_image_data_m_properties_m_document_numbers_l_2_m_type_s": "string",
-        "dynamodb_new_image_data_m_properties_m_document_numbers_l_2_m_value_s": "string",
-        "dynamodb_new_image_data_m_properties_m_document_numbers_l_3_m_type_s": "string",
-        "dynamodb_new_image_data_m_properties_m_document_numbers_l_3_m_value_s": "string",
-        "dynamodb_new_image_data_m_properties_m_remarks_s": "string",
-        "dynamodb_new_image_data_m_properties_m_type_of_permit_s": "string",
-        "dynamodb_new_image_data_m_breakdown_m_compromised_document_m_result_null": "string",
-        "dynamodb_new_image_data_m_breakdown_m_image_integrity_m_breakdown_m_face_detected_m_result_null": "string",
-        "dynamodb_new_image_data_m_breakdown_m_image_integrity_m_breakdown_m_source_integrity_m_properties_m_challenge_reuse_s": "string",
-        "dynamodb_new_image_data_m_breakdown_m_image_integrity_m_breakdown_m_source_integrity_m_properties_m_reasons_s": "string",
-        "dynamodb_new_image_data_m_breakdown_m_visual_authenticity_m_breakdown_m_spoofing_detection_m_properties_m_score_n": "string",
-        "date": "string",
-    },
-    "dynamo_sls_customer_risk_form": {
-        "dynamodb_new_image_created_at_n": "timestamp",
-        "dynamodb_new_image_customer_id_s": "string",
-        "dynamodb_new_image_form_data_m_countries_of_personal_links_l_0_s": "string",
-        "dynamodb_new_image_form_data_m_customer_circumstances_l_0_s": "string",
-        "dynamodb_new_image_form_data_m_customer_occupations_l_0_s": "string",
-        "dynamodb_new_image_form_data_m_expected_monthly_value_of_transactions_inbound_m_currency_code_s": "string",
-        "dynamodb_new_image_form_data_m_expected_monthly_value_of_transactions_inbound_m_from_n": "int",
-        "dynamodb_new_image_form_data_m_expected_monthly_value_of_transactions_inbound_m_to_n": "int",
-        "dynamodb_new_image_form_data_m_expected_monthly_value_of_transactions_outbound_m_currency_code_s": "string",
-        "dynamodb_new_image_form_data_m_expected_monthly_value_of_transactions_outbound_m_from_n": "int",
-        "dynamodb_new_image_form_data_m_expected_monthly_value_of_transactions_outbound_m_to_n": "int",
-        "dynamodb_new_image_form_data_m_pep_positions_l_0_m_pep_position_s": "string",
-        "dynamodb_new_image_updated_at_n": "timestamp",
-        "dynamodb_new_image_form_data_m_countries_of_personal_links_l_1_s": "string",
-        "dynamodb_new_image_form_data_m_countries_of_material_assets_l_0_m_country_code_s": "string",
-        "dynamodb_new_image_form_data_m_countries_of_material_assets_l_0_m_frequency_s": "string",
-        "dynamodb_new_image_form_data_m_countries_of_material_assets_l_0_m_total_income_m_currency_code_s": "string",
-        "dynamodb_new_image_form_data_m_countries_of_material_assets_l_0_m_total_income_m_from_n": "int",
-        "dynamodb_new_image_form_data_m_countries_of_material_assets_l_0_m_total_income_m_to_n": "int",
-        "dynamodb_new_image_form_data_m_countries_of_material_assets_l_0_m_type_s": "string",
-        "dynamodb_new_image_form_data_m_countries_of_material_assets_l_1_m_frequency_s": "string",
-        "dynamodb_new_image_form_data_m_countries_of_material_assets_l_1_m_total_income_m_currency_code_s": "string",
-        "dynamodb_new_image_form_data_m_countries_of_material_assets_l_1_m_total_income_m_from_n": "int",
-        "dynamodb_new_image_form_data_m_countries_of_material_assets_l_1_m_total_income_m_to_n": "int",
-        "dynamodb_new_image_form_data_m_countries_of_material_assets_l_1_m_type_s": "string",
-        "dynamodb_new_image_form_data_m_countries_of_material_assets_l_2_m_country_code_s": "string",
-        "dynamodb_new_image_form_data_m_countries_of_material_assets_l_2_m_frequency_s": "string",
-        "dynamodb_new_image_form_data_m_countries_of_material_assets_l_2_m_total_income_m_currency_code_s": "string",
-        "dynamodb_new_image_form_data_m_countries_of_material_assets_l_2_m_total_income_m_from_n": "int",
-        "dynamodb_new_image_form_data_m_countries_of_material_assets_l_2_m_total_income_m_to_n": "int",
-        "dynamodb_new_image_form_data_m_countries_of_material_assets_l_2_m_type_s": "string",
-        "dynamodb_new_image_form_data_m_countries_of_material_assets_l_3_m_country_code_s": "string",
-        "dynamodb_new_image_form_data_m_countries_of_material_assets_l_3_m_frequency_s": "string",
-        "dynamodb_new_image_form_data_m_countries_of_material_assets_l_3_m_total_income_m_currency_code_s": "string",
-        "dynamodb_new_image_form_data_m_countries_of_material_assets_l_3_m_total_income_m_from_n": "int",
-        "dynamodb_new_image_form_data_m_countries_of_material_assets_l_3_m_total_income_m_to_n": "int",
-        "dynamodb_new_image_form_data_m_countries_of_material_assets_l_3_m_type_s": "string",
-        "dynamodb_new_image_form_data_m_countries_of_material_assets_l_4_m_country_code_s": "string",
-        "dynamodb_new_image_form_data_m_countries_of_material_assets_l_4_m_frequency_s": "string",
-        "dynamodb_new_image_form_data_m_countries_of_material_assets_l_4_m_total_income_m_currency_code_s": "string",
-        "dynamodb_new_image_form_data_m_countries_of_material_assets_l_4_m_total_income_m_from_n": "int",
-        "dynamodb_new_image_form_data_m_countries_of_material_assets_l_4_m_total_income_m_to_n": "int",
-        "dynamodb_new_image_form_data_m_countries_of_material_assets_l_4_m_type_s": "string",
-        "dynamodb_new_image_form_data_m_countries_of_material_assets_l_5_m_country_code_s": "string",
-        "dynamodb_new_image_form_data_m_countries_of_material_assets_l_5_m_frequency_s": "string",
-        "dynamodb_new_image_form_data_m_countries_of_material_assets_l_5_m_total_income_m_currency_code_s": "string",
-        "dynamodb_new_image_form_data_m_countries_of_material_assets_l_5_m_total_income_m_from_n": "int",
-        "dynamodb_new_image_form_data_m_countries_of_material_assets_l_5_m_total_income_m_to_n": "int",
-        "dynamodb_new_image_form_data_m_countries_of_material_assets_l_5_m_type_s": "string",
-        "dynamodb_new_image_form_data_m_customer_circumstances_l_1_s": "string",
-        "dynamodb_new_image_form_data_m_customer_occupations_l_1_s": "string",
-        "dynamodb_new_image_form_data_m_customer_occupations_l_2_s": "string",
-        "dynamodb_new_image_form_data_m_expected_transaction_from_m_expected_m_amount_m_currency_code_s": "string",
-        "dynamodb_new_image_form_data_m_expected_transaction_from_m_expected_m_amount_m_from_n": "int",
-        "dynamodb_new_image_form_data_m_expected_transaction_from_m_expected_m_amount_m_to_n": "int",
-        "dynamodb_new_image_form_data_m_expected_transaction_from_m_expected_m_frequency_s": "string",
-        "dynamodb_new_image_form_data_m_expected_transaction_from_m_my_bank_acc_l_0_m_amount_m_currency_code_s": "string",
-        "dynamodb_new_image_form_data_m_expected_transaction_from_m_my_bank_acc_l_0_m_amount_m_from_n": "int",
-        "dynamodb_new_image_form_data_m_expected_transaction_from_m_my_bank_acc_l_0_m_amount_m_to_n": "int",
-        "dynamodb_new_image_form_data_m_expected_transaction_from_m_my_bank_acc_l_0_m_country_code_s": "string",
-        "dynamodb_new_image_form_data_m_expected_transaction_from_m_my_bank_acc_l_0_m_frequency_s": "string",
-        "dynamodb_new_image_form_data_m_expected_transaction_from_m_my_bank_acc_l_1_m_amount_m_currency_code_s": "string",
-        "dynamodb_new_image_form_data_m_expected_transaction_from_m_my_bank_acc_l_1_m_amount_m_from_n": "int",
-        "dynamodb_new_image_form_data_m_expected_transaction_from_m_my_bank_acc_l_1_m_amount_m_to_n": "int",
-        "dynamodb_new_image_form_data_m_expected_transaction_from_m_my_bank_acc_l_1_m_country_code_s": "string",
-        "dynamodb_new_image_form_data_m_expected_transaction_from_m_my_bank_acc_l_1_m_frequency_s": "string",
-        "dynamodb_new_image_form_data_m_expected_transaction_to_m_amount_m_currency_code_s": "string",
-        "dynamodb_new_image_form_data_m_expected_transaction_to_m_amount_m_from_n": "int",
-        "dynamodb_new_image_form_data_m_expected_transaction_to_m_amount_m_to_n": "int",
-        "dynamodb_new_image_form_data_m_expected_transaction_to_m_frequency_s": "string",
-        "dynamodb_new_image_form_data_m_expected_transaction_to_m_use_reasons_l_0_s": "string",
-        "dynamodb_new_image_form_data_m_expected_transaction_to_m_use_reasons_l_1_s": "string",
-        "dynamodb_new_image_form_data_m_expected_transaction_to_m_use_reasons_l_2_s": "string",
-        "dynamodb_new_image_form_data_m_expected_transaction_to_m_use_reasons_l_3_s": "string",
-        "dynamodb_new_image_form_data_m_expected_transaction_to_m_use_reasons_l_4_s": "string",
-        "dynamodb_new_image_form_data_m_expected_transaction_to_m_use_reasons_l_5_s": "string",
-        "dynamodb_new_image_form_data_m_supporting_documents_m_send_bool": "boolean",
-        "dynamodb_new_image_form_data_m_countries_of_material_assets_l_1_m_country_code_s": "string",
-        "dynamodb_new_image_form_data_m_countries_of_material_assets_l_1_m_total_value_of_properties_m_currency_code_s": "string",
-        "dynamodb_new_image_form_data_m_countries_of_material_assets_l_1_m_total_value_of_properties_m_from_n": "int",
-        "dynamodb_new_image_form_data_m_countries_of_material_assets_l_1_m_total_value_of_properties_m_to_n": "int",
-        "dynamodb_new_image_form_data_m_countries_of_personal_links_l_2_s": "string",
-        "dynamodb_new_image_form_data_m_expected_transaction_from_m_other_bank_acc_l_0_m_amount_m_currency_code_s": "string",
-        "dynamodb_new_image_form_data_m_expected_transaction_from_m_other_bank_acc_l_0_m_amount_m_from_n": "int",
-        "dynamodb_new_image_form_data_m_expected_transaction_from_m_other_bank_acc_l_0_m_amount_m_to_n": "int",
-        "dynamodb_new_image_form_data_m_expected_transaction_from_m_other_bank_acc_l_0_m_country_code_s": "string",
-        "dynamodb_new_image_form_data_m_expected_transaction_from_m_other_bank_acc_l_0_m_frequency_s": "string",
-        "dynamodb_new_image_form_data_m_expected_transaction_from_m_other_bank_acc_l_0_m_source_name_s": "string",
-        "dynamodb_new_image_form_data_m_expected_transaction_from_m_other_bank_acc_l_0_m_type_s": "string",
-        "dynamodb_new_image_form_data_m_pep_positions_l_0_m_state_corporation_name_s": "string",
-        "dynamodb_new_image_form_data_m_supporting_documents_m_certified_assets_l_0_s": "string",
-        "dynamodb_new_image_form_data_m_supporting_documents_m_three_month_bank_statement_l_0_s": "string",
-        "dynamodb_new_image_form_data_m_countries_of_material_assets_l_0_m_other_value_s": "string",
-        "dynamodb_new_image_form_data_m_expected_transaction_to_m_other_reason_s": "string",
-        "dynamodb_new_image_form_data_m_expected_transaction_to_m_use_reasons_l_6_s": "string",
-        "dynamodb_new_image_form_data_m_countries_of_personal_links_l_3_s": "string",
-        "dynamodb_new_image_form_data_m_countries_of_material_assets_l_2_m_other_value_s": "string",
-        "dynamodb_new_image_form_data_m_expected_transaction_from_m_other_bank_acc_l_1_m_amount_m_currency_code_s": "string",
-        "dynamodb_new_image_form_data_m_expected_transaction_from_m_other_bank_acc_l_1_m_amount_m_from_n": "int",
-        "dynamodb_new_image_form_data_m_expected_transaction_from_m_other_bank_acc_l_1_m_amount_m_to_n": "int",
-        "dynamodb_new_image_form_data_m_expected_transaction_from_m_other_bank_acc_l_1_m_country_code_s": "string",
-        "dynamodb_new_image_form_data_m_expected_transaction_from_m_other_bank_acc_l_1_m_frequency_s": "string",
-        "dynamodb_new_image_form_data_m_expected_transaction_from_m_other_bank_acc_l_1_m_source_name_s": "string",
-        "dynamodb_new_image_form_data_m_expected_transaction_from_m_other_bank_acc_l_1_m_type_s": "string",
-        "dynamodb_new_image_form_data_m_customer_circumstances_l_2_s": "string",
-        "dynamodb_new_image_form_data_m_customer_occupations_l_3_s": "string",
-        "dynamodb_new_image_form_data_m_countries_of_material_assets_l_1_m_other_value_s": "string",
-        "dynamodb_new_image_form_data_m_expected_transaction_to_m_use_reasons_l_7_s": "string",
-        "dynamodb_new_image_form_data_m_supporting_documents_m": "string",
-        "dynamodb_new_image_form_data_m_supporting_documents_m_three_month_bank_statement_l_1_s": "string",
-        "dynamodb_new_image_form_data_m_customer_occupations_l_4_s": "string",
-        "source": "string",
-        "timestamp_extracted": "timestamp",
-        "dynamodb_new_image_form_data_m_countries_of_material_assets_l_2_m_total_value_of_properties_m_currency_code_s": "string",
-        "dynamodb_new_image_form_data_m_countries_of_material_assets_l_2_m_total_value_of_properties_m_from_n": "int",
-        "dynamodb_new_image_form_data_m_countries_of_material_assets_l_2_m_total_value_of_properties_m_to_n": "int",
-        "dynamodb_new_image_form_data_m_customer_circumstances_l_3_s": "string",
-        "dynamodb_new_image_form_data_m_customer_circumstances_l_4_s": "string",
-        "dynamodb_new_image_form_data_m_customer_circumstances_l_5_s": "string",
-        "dynamodb_new_image_form_data_m_countries_of_material_assets_l_3_m_total_value_of_properties_m_currency_code_s": "string",
-        "dynamodb_new_image_form_data_m_countries_of_material_assets_l_3_m_total_value_of_properties_m_from_n": "int",
-        "dynamodb_new_image_form_data_m_countries_of_material_assets_l_3_m_total_value_of_properties_m_to_n": "int",
-        "dynamodb_new_image_form_data_m_source_of_wealth_assets_m_total_estimated_net_worth_m_currency_code_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_wealth_assets_m_total_estimated_net_worth_m_from_n": "int",
-        "dynamodb_new_image_form_data_m_source_of_wealth_assets_m_total_estimated_net_worth_m_to_n": "int",
-        "dynamodb_new_image_form_data_m_countries_of_material_assets_l_0_m_total_value_of_properties_m_currency_code_s": "string",
-        "dynamodb_new_image_form_data_m_countries_of_material_assets_l_0_m_total_value_of_properties_m_from_n": "int",
-        "dynamodb_new_image_form_data_m_countries_of_material_assets_l_0_m_total_value_of_properties_m_to_n": "int",
-        "dynamodb_newimage_formdata_m_sourceofwealthassets_m_totalestimatednetworth_m_currencycode_s": "string",
-        "dynamodb_newimage_formdata_m_sourceofwealthassets_m_totalestimatednetworth_m_from_n": "int",
-        "dynamodb_newimage_formdata_m_sourceofwealthassets_m_totalestimatednetworth_m_to_n": "int",
-        "dynamodb_oldimage_formdata_m_sourceofwealthassets_m_totalestimatednetworth_m_currencycode_s": "string",
-        "dynamodb_oldimage_formdata_m_sourceofwealthassets_m_totalestimatednetworth_m_from_n": "string",
-        "dynamodb_oldimage_formdata_m_sourceofwealthassets_m_totalestimatednetworth_m_to_n": "string",
-        "aws_region": "string",
-        "dynamodb_approximate_creation_date_time": "timestamp",
-        "dynamodb_keys_customer_id_s": "string",
-        "dynamodb_size_bytes": "string",
-        "event_id": "string",
-        "event_name": "string",
-        "event_source": "string",
-        "record_format": "string",
-        "table_name": "string",
-        "user_identity": "string",
-        "dynamodb_oldimage_createdat_n": "timestamp",
-        "dynamodb_oldimage_updatedat_n": "timestamp",
-        "dynamodb_newimage_createdat_n": "timestamp",
-        "dynamodb_newimage_updatedat_n": "timestamp",
-        "dynamodb_old_image_created_at_n": "timestamp",
-        "dynamodb_old_image_customer_id_s": "string",
-        "dynamodb_old_image_updated_at_n": "timestamp",
-        "dynamodb_approximatecreationdatetime": "timestamp",
-        "dynamodb_keys_customerid_s": "string",
-        "dynamodb_newimage_customerid_s": "string",
-        "dynamodb_new_image_form_data_m_total_monthly_income_range_m_currency_s": "string",
-        "dynamodb_new_image_form_data_m_total_monthly_income_range_m_min_n": "int",
-        "dynamodb_new_image_form_data_m_total_monthly_income_range_m_label_s": "string",
-        "dynamodb_new_image_form_data_m_total_monthly_income_range_m_event_s": "string",
-        "dynamodb_new_image_form_data_m_total_monthly_income_range_m_max_n": "int",
-        "dynamodb_old_image_form_data_m_total_monthly_income_range_m_currency_s": "string",
-        "dynamodb_old_image_form_data_m_total_monthly_income_range_m_min_n": "int",
-        "dynamodb_old_image_form_data_m_total_monthly_income_range_m_label_s": "string",
-        "dynamodb_old_image_form_data_m_total_monthly_income_range_m_event_s": "string",
-        "dynamodb_old_image_form_data_m_total_monthly_income_range_m_max_n": "int",
-        "dynamodb_new_image_form_data_m_total_estimated_net_worth_m_currency_s": "string",
-        "dynamodb_new_image_form_data_m_total_estimated_net_worth_m_min_n": "int",
-        "dynamodb_new_image_form_data_m_total_estimated_net_worth_m_label_s": "string",
-        "dynamodb_new_image_form_data_m_total_estimated_net_worth_m_event_s": "string",
-        "dynamodb_new_image_form_data_m_total_estimated_net_worth_m_max_n": "int",
-        "dynamodb_old_image_form_data_m_total_estimated_net_worth_m_currency_s": "string",
-        "dynamodb_old_image_form_data_m_total_estimated_net_worth_m_min_n": "int",
-        "dynamodb_old_image_form_data_m_total_estimated_net_worth_m_label_s": "string",
-        "dynamodb_old_image_form_data_m_total_estimated_net_worth_m_event_s": "string",
-        "dynamodb_old_image_form_data_m_total_estimated_net_worth_m_max_n": "int",
-        "dynamodb_oldimage_customerid_s": "string",
-        "dynamodb_new_image_form_data_m_total_monthly_income_range_m_frequency_s": "string",
-        "dynamodb_new_image_form_data_m_total_estimated_net_worth_m_frequency_s": "string",
-        "dynamodb_new_image_form_data_m_supporting_documents_m_allowance_letter_l_0_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_wealth_assets_m_items_l_0_m_total_value_m_currency_code_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_wealth_assets_m_items_l_0_m_total_value_m_from_n": "string",
-        "dynamodb_new_image_form_data_m_source_of_wealth_assets_m_items_l_0_m_total_value_m_to_n": "string",
-        "dynamodb_new_image_form_data_m_source_of_wealth_assets_m_items_l_0_m_type_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_wealth_assets_m_items_l_0_m_country_code_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_wealth_assets_m_items_l_1_m_total_value_m_currency_code_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_wealth_assets_m_items_l_1_m_total_value_m_from_n": "string",
-        "dynamodb_new_image_form_data_m_source_of_wealth_assets_m_items_l_1_m_total_value_m_to_n": "string",
-        "dynamodb_new_image_form_data_m_source_of_wealth_assets_m_items_l_1_m_type_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_wealth_assets_m_items_l_1_m_country_code_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_wealth_assets_m_items_l_2_m_total_value_m_currency_code_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_wealth_assets_m_items_l_2_m_total_value_m_from_n": "string",
-        "dynamodb_new_image_form_data_m_source_of_wealth_assets_m_items_l_2_m_total_value_m_to_n": "string",
-        "dynamodb_new_image_form_data_m_source_of_wealth_assets_m_items_l_2_m_type_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_wealth_assets_m_items_l_2_m_country_code_s": "string",
-        "dynamodb_new_image_form_data_m_expected_activity_m_use_reasons_l_0_s": "string",
-        "dynamodb_new_image_form_data_m_expected_activity_m_use_reasons_l_1_s": "string",
-        "dynamodb_new_image_form_data_m_expected_activity_m_transactions_inbound_m_amount_m_currency_code_s": "string",
-        "dynamodb_new_image_form_data_m_expected_activity_m_transactions_inbound_m_amount_m_from_n": "string",
-        "dynamodb_new_image_form_data_m_expected_activity_m_transactions_inbound_m_amount_m_to_n": "string",
-        "dynamodb_new_image_form_data_m_expected_activity_m_transactions_inbound_m_frequency_s": "string",
-        "dynamodb_new_image_form_data_m_expected_activity_m_transactions_outbound_m_amount_m_currency_code_s": "string",
-        "dynamodb_new_image_form_data_m_expected_activity_m_transactions_outbound_m_amount_m_from_n": "string",
-        "dynamodb_new_image_form_data_m_expected_activity_m_transactions_outbound_m_amount_m_to_n": "string",
-        "dynamodb_new_image_form_data_m_expected_activity_m_transactions_outbound_m_frequency_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_funds_assets_l_0_m_type_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_funds_assets_l_0_m_country_code_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_funds_assets_l_1_m_type_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_funds_assets_l_1_m_other_value_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_funds_assets_l_1_m_country_code_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_transfers_assets_m_transfers_from_others_l_0_m_source_type_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_transfers_assets_m_transfers_from_others_l_0_m_country_code_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_transfers_assets_m_transfers_from_others_l_0_m_source_name_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_transfers_assets_m_transfers_from_bank_account_l_0_m_country_code_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_funds_assets_l_2_m_type_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_funds_assets_l_2_m_country_code_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_funds_assets_l_3_m_type_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_funds_assets_l_3_m_other_value_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_funds_assets_l_3_m_country_code_s": "string",
-        "dynamodb_new_image_form_data_m_expected_activity_m_use_reasons_l_2_s": "string",
-        "dynamodb_new_image_form_data_m_expected_activity_m_use_reasons_l_3_s": "string",
-        "dynamodb_new_image_form_data_m_expected_activity_m_use_reasons_l_4_s": "string",
-        "dynamodb_new_image_form_data_m_expected_activity_m_use_reasons_l_5_s": "string",
-        "dynamodb_new_image_form_data_m_supporting_documents_m_three_month_bank_statement_l_2_s": "string",
-        "dynamodb_new_image_form_data_m_supporting_documents_m_three_month_bank_statement_l_3_s": "string",
-        "dynamodb_new_image_form_data_m_supporting_documents_m_three_month_bank_statement_l_4_s": "string",
-        "dynamodb_new_image_form_data_m_supporting_documents_m_three_month_bank_statement_l_5_s": "string",
-        "dynamodb_new_image_form_data_m_supporting_documents_m_three_month_bank_statement_l_6_s": "string",
-        "dynamodb_new_image_form_data_m_supporting_documents_m_three_month_bank_statement_l_7_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_wealth_assets_m_items_l_0_m_other_value_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_wealth_assets_m_items_l_3_m_total_value_m_currency_code_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_wealth_assets_m_items_l_3_m_total_value_m_from_n": "string",
-        "dynamodb_new_image_form_data_m_source_of_wealth_assets_m_items_l_3_m_total_value_m_to_n": "string",
-        "dynamodb_new_image_form_data_m_source_of_wealth_assets_m_items_l_3_m_type_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_wealth_assets_m_items_l_3_m_country_code_s": "string",
-        "dynamodb_new_image_form_data_m_businesses_l_0_m_name_s": "string",
-        "dynamodb_new_image_form_data_m_businesses_l_0_m_countries_l_0_s": "string",
-        "dynamodb_new_image_form_data_m_businesses_l_0_m_ownership_m_max_n": "string",
-        "dynamodb_new_image_form_data_m_businesses_l_0_m_ownership_m_min_n": "string",
-        "dynamodb_new_image_form_data_m_businesses_l_0_m_turnover_m_currency_code_s": "string",
-        "dynamodb_new_image_form_data_m_businesses_l_0_m_turnover_m_from_n": "string",
-        "dynamodb_new_image_form_data_m_businesses_l_0_m_turnover_m_to_n": "string",
-        "dynamodb_new_image_form_data_m_businesses_l_0_m_activities_l_0_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_transfers_assets_m_transfers_from_family_l_0_m_relationship_type_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_transfers_assets_m_transfers_from_family_l_0_m_country_code_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_transfers_assets_m_transfers_from_family_l_0_m_source_name_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_transfers_assets_m_transfers_from_bank_account_l_1_m_country_code_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_transfers_assets_m_transfers_from_family_l_1_m_relationship_type_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_transfers_assets_m_transfers_from_family_l_1_m_country_code_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_transfers_assets_m_transfers_from_family_l_1_m_source_name_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_transfers_assets_m_transfers_from_family_l_2_m_relationship_type_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_transfers_assets_m_transfers_from_family_l_2_m_country_code_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_transfers_assets_m_transfers_from_family_l_2_m_source_name_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_wealth_assets_m_items_l_4_m_total_value_m_currency_code_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_wealth_assets_m_items_l_4_m_total_value_m_from_n": "string",
-        "dynamodb_new_image_form_data_m_source_of_wealth_assets_m_items_l_4_m_total_value_m_to_n": "string",
-        "dynamodb_new_image_form_data_m_source_of_wealth_assets_m_items_l_4_m_type_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_wealth_assets_m_items_l_4_m_country_code_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_wealth_assets_m_items_l_5_m_total_value_m_currency_code_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_wealth_assets_m_items_l_5_m_total_value_m_from_n": "string",
-        "dynamodb_new_image_form_data_m_source_of_wealth_assets_m_items_l_5_m_total_value_m_to_n": "string",
-        "dynamodb_new_image_form_data_m_source_of_wealth_assets_m_items_l_5_m_type_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_wealth_assets_m_items_l_5_m_country_code_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_wealth_assets_m_items_l_6_m_total_value_m_currency_code_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_wealth_assets_m_items_l_6_m_total_value_m_from_n": "string",
-        "dynamodb_new_image_form_data_m_source_of_wealth_assets_m_items_l_6_m_total_value_m_to_n": "string",
-        "dynamodb_new_image_form_data_m_source_of_wealth_assets_m_items_l_6_m_type_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_wealth_assets_m_items_l_6_m_country_code_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_wealth_assets_m_items_l_7_m_total_value_m_currency_code_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_wealth_assets_m_items_l_7_m_total_value_m_from_n": "string",
-        "dynamodb_new_image_form_data_m_source_of_wealth_assets_m_items_l_7_m_total_value_m_to_n": "string",
-        "dynamodb_new_image_form_data_m_source_of_wealth_assets_m_items_l_7_m_type_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_wealth_assets_m_items_l_7_m_country_code_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_wealth_assets_m_items_l_8_m_total_value_m_currency_code_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_wealth_assets_m_items_l_8_m_total_value_m_from_n": "string",
-        "dynamodb_new_image_form_data_m_source_of_wealth_assets_m_items_l_8_m_total_value_m_to_n": "string",
-        "dynamodb_new_image_form_data_m_source_of_wealth_assets_m_items_l_8_m_type_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_wealth_assets_m_items_l_8_m_other_value_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_wealth_assets_m_items_l_8_m_country_code_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_funds_assets_l_0_m_other_value_s": "string",
-        "dynamodb_new_image_form_data_m_supporting_documents_m_proof_of_employment_l_0_s": "string",
-        "dynamodb_new_image_form_data_m_expected_activity_m_use_reasons_l_6_s": "string",
-        "dynamodb_new_image_form_data_m_expected_activity_m_use_reasons_l_7_s": "string",
-        "dynamodb_new_image_form_data_m_expected_activity_m_use_reasons_l_8_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_funds_assets_l_4_m_type_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_funds_assets_l_4_m_country_code_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_funds_assets_l_5_m_type_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_funds_assets_l_5_m_other_value_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_funds_assets_l_5_m_country_code_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_wealth_assets_m_items_l_3_m_other_value_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_funds_assets_l_6_m_type_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_funds_assets_l_6_m_country_code_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_funds_assets_l_7_m_type_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_funds_assets_l_7_m_country_code_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_funds_assets_l_8_m_type_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_funds_assets_l_8_m_country_code_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_funds_assets_l_9_m_type_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_funds_assets_l_9_m_country_code_s": "string",
-        "dynamodb_new_image_form_data_m_customer_occupations_l_5_s": "string",
-        "dynamodb_new_image_form_data_m_customer_occupations_l_6_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_wealth_assets_m_items_l_2_m_other_value_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_funds_assets_l_2_m_other_value_s": "string",
-        "dynamodb_new_image_form_data_m_supporting_documents_m_any_other_proof_of_income_l_0_s": "string",
-        "dynamodb_new_image_form_data_m_countries_of_personal_links_l_4_s": "string",
-        "dynamodb_new_image_form_data_m_supporting_documents_m_letter_from_accountant_or_lawyer_l_0_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_funds_assets_l_10_m_type_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_funds_assets_l_10_m_country_code_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_funds_assets_l_11_m_type_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_funds_assets_l_11_m_country_code_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_funds_assets_l_12_m_type_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_funds_assets_l_12_m_country_code_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_funds_assets_l_13_m_type_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_funds_assets_l_13_m_country_code_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_funds_assets_l_14_m_type_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_funds_assets_l_14_m_country_code_s": "string",
-        "dynamodb_new_image_form_data_m_customer_occupations_l_7_s": "string",
-        "dynamodb_new_image_form_data_m_customer_occupations_l_8_s": "string",
-        "dynamodb_new_image_form_data_m_customer_occupations_l_9_s": "string",
-        "dynamodb_new_image_form_data_m_pep_positions_l_1_m_pep_position_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_wealth_assets_m_items_l_1_m_other_value_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_wealth_assets_m_items_l_9_m_total_value_m_currency_code_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_wealth_assets_m_items_l_9_m_total_value_m_from_n": "string",
-        "dynamodb_new_image_form_data_m_source_of_wealth_assets_m_items_l_9_m_total_value_m_to_n": "string",
-        "dynamodb_new_image_form_data_m_source_of_wealth_assets_m_items_l_9_m_type_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_wealth_assets_m_items_l_9_m_country_code_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_wealth_assets_m_items_l_10_m_total_value_m_currency_code_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_wealth_assets_m_items_l_10_m_total_value_m_from_n": "string",
-        "dynamodb_new_image_form_data_m_source_of_wealth_assets_m_items_l_10_m_total_value_m_to_n": "string",
-        "dynamodb_new_image_form_data_m_source_of_wealth_assets_m_items_l_10_m_type_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_wealth_assets_m_items_l_10_m_other_value_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_wealth_assets_m_items_l_10_m_country_code_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_wealth_assets_m_items_l_11_m_total_value_m_currency_code_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_wealth_assets_m_items_l_11_m_total_value_m_from_n": "string",
-        "dynamodb_new_image_form_data_m_source_of_wealth_assets_m_items_l_11_m_total_value_m_to_n": "string",
-        "dynamodb_new_image_form_data_m_source_of_wealth_assets_m_items_l_11_m_type_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_wealth_assets_m_items_l_11_m_other_value_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_wealth_assets_m_items_l_11_m_country_code_s": "string",
-        "dynamodb_new_image_form_data_m_businesses_l_0_m_activities_l_1_s": "string",
-        "dynamodb_new_image_form_data_m_businesses_l_0_m_activities_l_2_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_funds_assets_l_6_m_other_value_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_funds_assets_l_8_m_other_value_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_funds_assets_l_9_m_other_value_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_funds_assets_l_10_m_other_value_s": "string",
-        "dynamodb_new_image_form_data_m_countries_of_personal_links_l_5_s": "string",
-        "dynamodb_new_image_form_data_m_countries_of_personal_links_l_6_s": "string",
-        "dynamodb_new_image_form_data_m_countries_of_personal_links_l_7_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_transfers_assets_m_transfers_from_bank_account_l_2_m_country_code_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_transfers_assets_m_transfers_from_bank_account_l_3_m_country_code_s": "string",
-        "dynamodb_new_image_form_data_m_supporting_documents_m_business_audited_accounts_l_0_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_funds_assets_l_15_m_type_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_funds_assets_l_15_m_country_code_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_funds_assets_l_16_m_type_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_funds_assets_l_16_m_country_code_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_funds_assets_l_17_m_type_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_funds_assets_l_17_m_country_code_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_funds_assets_l_18_m_type_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_funds_assets_l_18_m_country_code_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_funds_assets_l_19_m_type_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_funds_assets_l_19_m_country_code_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_funds_assets_l_20_m_type_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_funds_assets_l_20_m_other_value_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_funds_assets_l_20_m_country_code_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_transfers_assets_m_transfers_from_others_l_1_m_source_type_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_transfers_assets_m_transfers_from_others_l_1_m_country_code_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_transfers_assets_m_transfers_from_others_l_1_m_source_name_s": "string",
-        "dynamodb_new_image_form_data_m_source_of_wealth_assets_m_items_l_4_m_other_value_s": "string",
-    },
-    "dynamo_sls_passcoderesettiershistory": {
-        "aws_region": "string",
-        "event_id": "string",
-        "event_name": "string",
-        "user_identity": "string",
-        "record_format": "string",
-        "table_name": "string",
-        "dynamodb_approximate_creation_date_time": "timestamp",
-        "dynamodb_keys_created_at_s": "string",
-        "dynamodb_keys_workflow_id_s": "string",
-        "dynamodb_new_image_metadata_m": "string",
-        "dynamodb_new_image_ip_address_s": "string",
-        "dynamodb_new_image_operation_s": "string",
-        "dynamodb_new_image_workflow_id_s": "string",
-        "dynamodb_new_image_device_platform_s": "string",
-        "dynamodb_new_image_status_s": "string",
-        "dynamodb_new_image_created_at_s": "string",
-        "dynamodb_new_image_actor_s": "string",
-        "dynamodb_size_bytes": "string",
-        "event_source": "string",
-        "timestamp_extracted": "string",
-        "dynamodb_new_image_customer_id_s": "string",
-        "dynamodb_new_image_metadata_m_error_s": "string",
-        "dynamodb_new_image_metadata_m_rate_limiting_error_bool": "boolean",
-        "dynamodb_new_image_metadata_m_allowed_bool": "boolean",
-        "dynamodb_new_image_metadata_m_expected_s": "string",
-        "dynamodb_new_image_metadata_m_next_challenge_s": "string",
-        "dynamodb_new_image_metadata_m_remaining_attempts_m_email_n": "bigint",
-        "dynamodb_new_image_metadata_m_remaining_attempts_m_password_n": "bigint",
-        "dynamodb_new_image_metadata_m_remaining_attempts_m_failed_n": "bigint",
-        "dynamodb_new_image_metadata_m_remaining_attempts_m_card_pin_n": "bigint",
-        "dynamodb_new_image_metadata_m_remaining_attempts_m_phone_n": "bigint",
-        "dynamodb_new_image_metadata_m_remaining_attempts_m_succeeded_n": "bigint",
-        "dynamodb_new_image_metadata_m_total_attempts_m_email_n": "bigint",
-        "dynamodb_new_image_metadata_m_total_attempts_m_password_n": "bigint",
-        "dynamodb_new_image_metadata_m_total_attempts_m_failed_n": "bigint",
-        "dynamodb_new_image_metadata_m_total_attempts_m_card_pin_n": "bigint",
-        "dynamodb_new_image_metadata_m_total_attempts_m_phone_n": "bigint",
-        "dynamodb_new_image_metadata_m_total_attempts_m_succeeded_n": "bigint",
-        "dynamodb_new_image_metadata_m_tier_timeout_s": "string",
-        "dynamodb_new_image_action_s": "string",
-        "dynamodb_new_image_metadata_m_phone_number_s": "string",
-        "dynamodb_new_image_metadata_m_remaining_attempts_m_none_n": "bigint",
-        "dynamodb_new_image_metadata_m_total_attempts_m_none_n": "bigint",
-        "dynamodb_new_image_metadata_m_unverified_input_s": "string",
-        "dynamodb_new_image_metadata_m_reason_s": "string",
-        "dynamodb_new_image_metadata_m_signature_s": "string",
-        "dynamodb_new_image_metadata_m_key_s": "string",
-        "dynamodb_new_image_metadata_m_rate_limit_n": "bigint",
-        "dynamodb_new_image_metadata_m_chosen_challenge_s": "string",
-        "dynamodb_new_image_metadata_m_remaining_attempts_m_onfido_n": "bigint",
-        "dynamodb_new_image_metadata_m_remaining_attempts_m_choose_challenge_n": "bigint",
-        "dynamodb_new_image_metadata_m_total_attempts_m_onfido_n": "bigint",
-        "dynamodb_new_image_metadata_m_total_attempts_m_choose_challenge_n": "bigint",
-        "dynamodb_new_image_metadata_m_remaining_attempts_m_activation_code_n": "bigint",
-        "dynamodb_new_image_metadata_m_remaining_attempts_m_passport_expiry_date_n": "bigint",
-        "dynamodb_new_image_metadata_m_total_attempts_m_activation_code_n": "bigint",
-        "dynamodb_new_image_metadata_m_total_attempts_m_passport_expiry_date_n": "bigint",
-        "date": "string",
-    },
-    "dynamo_sls_cards": {
-        "aws_region": "string",
-        "dynamodb_approximate_creation_date_time": "timestamp",
-        "dynamodb_keys_id_s": "string",
-        "dynamodb_new_image_account_id_n": "int",
-        "dynamodb_new_image_created_at_n": "timestamp",
-        "dynamodb_new_image_encoded_key_s": "string",
-        "dynamodb_new_image_enroll3ds_token_s": "string",
-        "dynamodb_new_image_id_s": "string",
-        "dynamodb_new_image_is3ds_enrolled_bool": "boolean",
-        "dynamodb_new_image_is_card_linked_bool": "boolean",
-        "dynamodb_new_image_is_frozen_bool": "boolean",
-        "dynamodb_new_image_is_pin_blocked_bool": "boolean",
-        "dynamodb_new_image_state_s": "string",
-        "dynamodb_new_image_token_n": "int",
-        "dynamodb_new_image_updated_at_n": "timestamp",
-        "dynamodb_new_image_user_id_s": "string",
-        "dynamodb_size_bytes": "string",
-        "event_id": "string",
-        "event_name": "string",
-        "event_source": "string",
-        "record_format": "string",
-        "table_name": "string",
-        "user_identity": "string",
-        "timestamp_extracted": "timestamp",
-        "source": "string",
-        "dynamodb_new_image_is_replace_fee_applied_bool": "boolean",
-        "dynamodb_new_image_replaced_card_id_s": "string",
-        "dynamodb_new_image_replacement_reason_s": "string",
-        "dynamodb_new_image_product_id_n": "int",
-        "dynamodb_new_image_is_migrated_bool": "boolean",
-        "dynamodb_new_image_is_token_automated_link_bool": "boolean",
-        "awsregion": "string",
-        "eventid": "string",
-        "eventname": "string",
-        "useridentity": "string",
-        "recordformat": "string",
-        "tablename": "string",
-        "dynamodb_approximatecreationdatetime": "timestamp",
-        "dynamodb_newimage_is3dsenrolled_bool": "boolean",
-        "dynamodb_newimage_isreplacefeeapplied_bool": "boolean",
-        "dynamodb_newimage_encodedkey_s": "string",
-        "dynamodb_newimage_accountid_n": "int",
-        "dynamodb_newimage_ismigrated_bool": "boolean",
-        "dynamodb_newimage_createdat_n": "timestamp",
-        "dynamodb_newimage_replacedcardid_s": "string",
-        "dynamodb_newimage_istokenautomatedlink_bool": "boolean",
-        "dynamodb_newimage_state_s": "string",
-        "dynamodb_newimage_isfrozen_bool": "boolean",
-        "dynamodb_newimage_ispinblocked_bool": "boolean",
-        "dynamodb_newimage_token_n": "int",
-        "dynamodb_newimage_updatedat_n": "timestamp",
-        "dynamodb_newimage_userid_s": "string",
-        "dynamodb_newimage_iscardlinked_bool": "boolean",
-        "dynamodb_newimage_enroll3dstoken_s": "string",
-        "dynamodb_newimage_replacementreason_s": "string",
-        "dynamodb_newimage_id_s": "string",
-        "dynamodb_sizebytes": "string",
-        "eventsource": "string",
-        "dynamodb_newimage_productid_n": "int",
-        "dynamodb_new_image_is_offline_payments_enabled_bool": "boolean",
-        "dynamodb_new_image_is_online_payments_enabled_bool": "boolean",
-        "dynamodb_new_image_truncated_suffix_pan_s": "string",
-        "dynamodb_new_image_type_n": "bigint",
-        "dynamodb_new_image_physical_card_request_date_n": "bigint",
-        "dynamodb_new_image_physical_card_expected_delivery_date_n": "bigint",
-        "date": "string",
-    },
-    "dynamo_sls_clearbank_transactions": {
-        "aws_region": "string",
-        "dynamodb_new_image_transaction_id_s": "string",
-        "dynamodb_new_image_transaction_m_status_s": "string",
-        "dynamodb_new_image_transaction_m_supplementary_data_l_0_m_value_s": "string",
-        "dynamodb_new_image_transaction_m_supplementary_data_l_0_m_name_s": "string",
-        "dynamodb_new_image_transaction_m_supplementary_data_l_1_m_value_s": "string",
-        "dynamodb_new_image_transaction_m_supplementary_data_l_1_m_name_s": "string",
-        "dynamodb_new_image_transaction_m_supplementary_data_l_2_m_value_s": "string",
-        "dynamodb_new_image_transaction_m_supplementary_data_l_2_m_name_s": "string",
-        "dynamodb_new_image_transaction_m_supplementary_data_l_3_m_value_s": "string",
-        "dynamodb_new_image_transaction_m_supplementary_data_l_3_m_name_s": "string",
-        "dynamodb_new_image_transaction_m_supplementary_data_l_4_m_value_s": "string",
-        "dynamodb_new_image_transaction_m_supplementary_data_l_4_m_name_s": "string",
-        "dynamodb_new_image_transaction_m_supplementary_data_l_5_m_value_s": "string",
-        "dynamodb_new_image_transaction_m_supplementary_data_l_5_m_name_s": "string",
-        "dynamodb_new_image_transaction_m_supplementary_data_l_6_m_value_s": "string",
-        "dynamodb_new_image_transaction_m_supplementary_data_l_6_m_name_s": "string",
-        "dynamodb_new_image_transaction_m_supplementary_data_l_7_m_value_s": "string",
-        "dynamodb_new_image_transaction_m_supplementary_data_l_7_m_name_s": "string",
-        "dynamodb_new_image_transaction_m_supplementary_data_l_8_m_value_s": "string",
-        "dynamodb_new_image_transaction_m_supplementary_data_l_8_m_name_s": "string",
-        "dynamodb_new_image_transaction_m_supplementary_data_l_9_m_value_s": "string",
-        "dynamodb_new_image_transaction_m_supplementary_data_l_9_m_name_s": "string",
-        "dynamodb_new_image_transaction_m_supplementary_data_l_10_m_value_s": "string",
-        "dynamodb_new_image_transaction_m_supplementary_data_l_10_m_name_s": "string",
-        "dynamodb_new_image_transaction_m_supplementary_data_l_11_m_value_s": "string",
-        "dynamodb_new_image_transaction_m_supplementary_data_l_11_m_name_s": "string",
-        "dynamodb_new_image_transaction_m_supplementary_data_l_12_m_value_s": "string",
-        "dynamodb_new_image_transaction_m_supplementary_data_l_12_m_name_s": "string",
-        "dynamodb_new_image_transaction_m_supplementary_data_l_13_m_value_s": "string",
-        "dynamodb_new_image_transaction_m_supplementary_data_l_13_m_name_s": "string",
-        "dynamodb_new_image_transaction_m_supplementary_data_l_14_m_value_s": "string",
-        "dynamodb_new_image_transaction_m_supplementary_data_l_14_m_name_s": "string",
-        "dynamodb_new_image_transaction_m_supplementary_data_l_15_m_value_s": "string",
-        "dynamodb_new_image_transaction_m_supplementary_data_l_15_m_name_s": "string",
-        "dynamodb_new_image_transaction_m_supplementary_data_l_16_m_value_s": "string",
-        "dynamodb_new_image_transaction_m_supplementary_data_l_16_m_name_s": "string",
-        "dynamodb_new_image_transaction_m_supplementary_data_l_17_m_value_s": "string",
-        "dynamodb_new_image_transaction_m_supplementary_data_l_17_m_name_s": "string",
-        "dynamodb_new_image_transaction_m_supplementary_data_l_18_m_value_s": "string",
-        "dynamodb_new_image_transaction_m_supplementary_data_l_18_m_name_s": "string",
-        "dynamodb_new_image_transaction_m_account_m_bban_s": "string",
-        "dynamodb_new_image_transaction_m_account_m_owner_name_s": "string",
-        "dynamodb_new_image_transaction_m_account_m_iban_s": "string",
-        "dynamodb_new_image_transaction_m_account_m_institution_name_s": "string",
-        "dynamodb_new_image_transaction_m_account_m_transaction_owner_name_s": "string",
-        "dynamodb_new_image_transaction_m_scheme_s": "string",
-        "dynamodb_new_image_transaction_m_debit_credit_code_s": "string",
-        "dynamodb_new_image_transaction_m_transaction_source_s": "string",
-        "dynamodb_new_image_transaction_m_reference_s": "string",
-        "dynamodb_new_image_transaction_m_amount_n": "int",
-        "dynamodb_new_image_transaction_m_transaction_id_s": "string",
-        "dynamodb_new_image_transaction_m_is_return_bool": "boolean",
-        "dynamodb_new_image_transaction_m_currency_code_s": "string",
-        "dynamodb_new_image_transaction_m_timestamp_created_s": "string",
-        "dynamodb_new_image_transaction_m_counterpart_account_m_owner_name_s": "string",
-        "dynamodb_new_image_transaction_m_counterpart_account_m_iban_s": "string",
-        "dynamodb_new_image_transaction_m_counterpart_account_m_institution_name_s": "string",
-        "dynamodb_new_image_transaction_m_counterpart_account_m_transaction_owner_name_s": "string",
-        "dynamodb_new_image_transaction_m_end_to_end_transaction_id_s": "string",
-        "dynamodb_new_image_transaction_m_timestamp_settled_s": "string",
-        "dynamodb_new_image_transaction_m_actual_end_to_end_transaction_id_s": "string",
-        "dynamodb_new_image_transaction_m_counterpart_account_m_bban_s": "string",
-        "dynamodb_new_image_transaction_m_transaction_type_s": "string",
-        "dynamodb_new_image_transaction_m_bacs_transaction_id_s": "string",
-        "dynamodb_new_image_transaction_m_transaction_code_s": "string",
-        "dynamodb_new_image_transaction_m_bacs_transaction_description_s": "string",
-        "dynamodb_new_image_transaction_m_service_user_number_s": "string",
-        "dynamodb_new_image_transaction_m_direct_debit_mandate_id_s": "string",
-        "dynamodb_new_image_transaction_m_supplementary_data_l_19_m_value_s": "string",
-        "dynamodb_new_image_transaction_m_supplementary_data_l_19_m_name_s": "string",
-        "dynamodb_new_image_transaction_m_supplementary_data_l_20_m_value_s": "string",
-        "dynamodb_new_image_transaction_m_supplementary_data_l_20_m_name_s": "string",
-        "dynamodb_new_image_transaction_m_supplementary_data_l": "string",
-        "dynamodb_new_image_transaction_m_supplementary_data_l_21_m_value_s": "string",
-        "dynamodb_new_image_transaction_m_supplementary_data_l_21_m_name_s": "string",
-        "dynamodb_new_image_transaction_m_supplementary_data_l_22_m_value_s": "string",
-        "dynamodb_new_image_transaction_m_supplementary_data_l_22_m_name_s": "string",
-        "dynamodb_new_image_transaction_m_supplementary_data_l_23_m_value_s": "string",
-        "dynamodb_new_image_transaction_m_supplementary_data_l_23_m_name_s": "string",
-        "dynamodb_new_image_transaction_m_iso20022_xml_document_s": "string",
-        "dynamodb_size_bytes": "string",
-        "event_id": "string",
-        "event_name": "string",
-        "event_source": "string",
-        "record_format": "string",
-        "table_name": "string",
-        "user_identity": "string",
-        "source": "string",
-        "dynamodb_new_image_created_at_n": "timestamp",
-        "dynamodb_new_image_updated_at_n": "timestamp",
-        "dynamodb_approximate_creation_date_time": "string",
-        "dynamodb_keys_transaction_id_s": "string",
-        "timestamp_extracted": "timestamp",
-        "date": "string",
-    },
-    "dynamo_sls_confirmation_of_payee": {
-        "aws_region": "string",
-        "event_id": "string",
-        "event_name": "string",
-        "user_identity": "string",
-        "record_format": "string",
-        "table_name": "string",
-        "dynamodb_approximate_creation_date_time": "string",
-        "dynamodb_keys_id_s": "string",
-        "dynamodb_new_image_updated_at_s": "timestamp",
-        "dynamodb_new_image_created_at_s": "timestamp",
-        "dynamodb_new_image_recipient_type_s": "string",
-        "dynamodb_new_image_matched_bool": "boolean",
-        "dynamodb_new_image_id_s": "string",
-        "dynamodb_new_image_reason_code_s": "string",
-        "dynamodb_new_image_reason_code_description_s": "string",
-        "dynamodb_new_image_customer_id_s": "string",
-        "dynamodb_size_bytes": "int",
-        "event_source": "string",
-        "timestamp_extracted": "timestamp",
-        "dynamodb_new_image_recipient_name_s": "string",
-        "date": "string",
-    },
-    "dynamo_sls_cards_status_history": {
-        "aws_region": "string",
-        "dynamodb_approximate_creation_date_time": "timestamp",
-        "dynamodb_keys_id_s": "string",
-        "dynamodb_new_image_created_at_n": "timestamp",
-        "dynamodb_new_image_id_s": "string",
-        "dynamodb_new_image_status_s": "string",
-        "dynamodb_new_image_token_n": "int",
-        "dynamodb_new_image_updated_at_n": "timestamp",
-        "dynamodb_new_image_user_id_s": "string",
-        "dynamodb_size_bytes": "string",
-        "event_id": "string",
-        "event_name": "string",
-        "event_source": "string",
-        "record_format": "string",
-        "table_name": "string",
-        "user_identity": "string",
-        "timestamp_extracted": "timestamp",
-        "dynamodb_keys_user_id_s": "string",
-        "source": "string",
-        "awsregion": "string",
-        "eventid": "string",
-        "eventname": "string",
-        "useridentity": "string",
-        "recordformat": "string",
-        "tablename": "string",
-        "dynamodb_approximatecreationdatetime": "timestamp",
-        "dynamodb_newimage_token_n": "int",
-        "dynamodb_newimage_userid_s": "string",
-        "dynamodb_newimage_updatedat_n": "timestamp",
-        "dynamodb_newimage_status_s": "string",
-        "dynamodb_newimage_createdat_n": "timestamp",
-        "dynamodb_newimage_id_s": "string",
-        "dynamodb_sizebytes": "string",
-        "eventsource": "string",
-        "dynamodb_keys_userid_s": "string",
-        "date": "string",
-    },
-    "dynamo_sls_home_financing_mortgage_application": {
-        "dynamodb_new_image_created_at_n": "timestamp",
-        "dynamodb_new_image_financing_m_agreed_purchase_price_m_currency_s": "string",
-        "dynamodb_new_image_financing_m_agreed_purchase_price_m_value_s": "string",
-        "dynamodb_new_image_financing_m_duration_n": "int",
-        "dynamodb_new_image_financing_m_expected_monthly_rental_m_currency_s": "string",
-        "dynamodb_new_image_financing_m_expected_monthly_rental_m_value_s": "string",
-        "dynamodb_new_image_financing_m_funding_other_description_s": "string",
-        "dynamodb_new_image_financing_m_funding_m_savings_bool": "boolean",
-        "dynamodb_new_image_financing_m_product_s": "string",
-        "dynamodb_new_image_financing_m_repayment_other_description_s": "string",
-        "dynamodb_new_image_financing_m_repayment_s": "string",
-        "dynamodb_new_image_financing_m_required_financing_m_currency_s": "string",
-        "dynamodb_new_image_financing_m_required_financing_m_value_s": "string",
-        "dynamodb_keys_id_s": "string",
-        "dynamodb_new_image_property_m_address_m_city_s": "string",
-        "dynamodb_new_image_property_m_address_m_country_code_s": "string",
-        "dynamodb_new_image_property_m_address_m_line1_s": "string",
-        "dynamodb_new_image_property_m_address_m_line2_s": "string",
-        "dynamodb_new_image_property_m_address_m_postal_code_s": "string",
-        "dynamodb_new_image_property_m_age_s": "string",
-        "dynamodb_new_image_property_m_bedroom_count_n": "int",
-        "dynamodb_new_image_property_m_contact_details_m_email_s": "string",
-        "dynamodb_new_image_property_m_contact_details_m_full_name_s": "string",
-        "dynamodb_new_image_property_m_contact_details_m_phone_number_s": "string",
-        "dynamodb_new_image_property_m_is_business_bool": "boolean",
-        "dynamodb_new_image_property_m_is_ex_local_authority_property_bool": "boolean",
-        "dynamodb_new_image_property_m_ownership_type_s": "string",
-        "dynamodb_new_image_property_m_property_type_s": "string",
-        "dynamodb_new_image_property_m_remaining_lease_years_n": "string",
-        "dynamodb_new_image_sections_l_0_m_hidden_bool": "boolean",
-        "dynamodb_new_image_sections_l_0_m_id_s": "string",
-        "dynamodb_new_image_sections_l_0_m_order_n": "int",
-        "dynamodb_new_image_sections_l_0_m_stages_l_0_m_hidden_bool": "boolean",
-        "dynamodb_new_image_sections_l_0_m_stages_l_0_m_id_s": "string",
-        "dynamodb_new_image_sections_l_0_m_stages_l_0_m_order_n": "int",
-        "dynamodb_new_image_sections_l_0_m_stages_l_0_m_status_s": "string",
-        "dynamodb_new_image_sections_l_0_m_stages_l_1_m_hidden_bool": "boolean",
-        "dynamodb_new_image_sections_l_0_m_stages_l_1_m_id_s": "string",
-        "dynamodb_new_image_sections_l_0_m_stages_l_1_m_order_n": "int",
-        "dynamodb_new_image_sections_l_0_m_stages_l_1_m_status_s": "string",
-        "dynamodb_new_image_sections_l_0_m_stages_l_2_m_hidden_bool": "boolean",
-        "dynamodb_new_image_sections_l_0_m_stages_l_2_m_id_s": "string",
-        "dynamodb_new_image_sections_l_0_m_stages_l_2_m_order_n": "int",
-        "dynamodb_new_image_sections_l_0_m_stages_l_2_m_status_s": "string",
-        "dynamodb_new_image_sections_l_0_m_stages_l_3_m_hidden_bool": "boolean",
-        "dynamodb_new_image_sections_l_0_m_stages_l_3_m_id_s": "string",
-        "dynamodb_new_image_sections_l_0_m_stages_l_3_m_order_n": "int",
-        "dynamodb_new_image_sections_l_0_m_stages_l_3_m_status_s": "string",
-        "dynamodb_new_image_sections_l_1_m_hidden_bool": "boolean",
-        "dynamodb_new_image_sections_l_1_m_id_s": "string",
-        "dynamodb_new_image_sections_l_1_m_order_n": "int",
-        "dynamodb_new_image_sections_l_1_m_stages_l_0_m_hidden_bool": "boolean",
-        "dynamodb_new_image_sections_l_1_m_stages_l_0_m_id_s": "string",
-        "dynamodb_new_image_sections_l_1_m_stages_l_0_m_order_n": "int",
-        "dynamodb_new_image_sections_l_1_m_stages_l_0_m_status_s": "string",
-        "dynamodb_new_image_sections_l_1_m_stages_l_1_m_hidden_bool": "boolean",
-        "dynamodb_new_image_sections_l_1_m_stages_l_1_m_id_s": "string",
-        "dynamodb_new_image_sections_l_1_m_stages_l_1_m_order_n": "int",
-        "dynamodb_new_image_sections_l_1_m_stages_l_1_m_status_s": "string",
-        "dynamodb_new_image_sections_l_1_m_stages_l_2_m_hidden_bool": "boolean",
-        "dynamodb_new_image_sections_l_1_m_stages_l_2_m_id_s": "string",
-        "dynamodb_new_image_sections_l_1_m_stages_l_2_m_order_n": "int",
-        "dynamodb_new_image_sections_l_1_m_stages_l_2_m_status_s": "string",
-        "dynamodb_new_image_sections_l_1_m_stages_l_3_m_hidden_bool": "boolean",
-        "dynamodb_new_image_sections_l_1_m_stages_l_3_m_id_s": "string",
-        "dynamodb_new_image_sections_l_1_m_stages_l_3_m_order_n": "int",
-        "dynamodb_new_image_sections_l_1_m_stages_l_3_m_status_s": "string",
-        "dynamodb_new_image_sections_l_1_m_stages_l_4_m_hidden_bool": "boolean",
-        "dynamodb_new_image_sections_l_1_m_stages_l_4_m_id_s": "string",
-        "dynamodb_new_image_sections_l_1_m_stages_l_4_m_order_n": "int",
-        "dynamodb_new_image_sections_l_1_m_stages_l_4_m_status_s": "string",
-        "dynamodb_new_image_sections_l_1_m_stages_l_5_m_hidden_bool": "boolean",
-        "dynamodb_new_image_sections_l_1_m_stages_l_5_m_id_s": "string",
-        "dynamodb_new_image_sections_l_1_m_stages_l_5_m_order_n": "int",
-        "dynamodb_new_image_sections_l_1_m_stages_l_5_m_status_s": "string",
-        "dynamodb_new_image_status_s": "string",
-        "dynamodb_new_image_submitted_bool": "boolean",
-        "dynamodb_new_image_updated_at_n": "timestamp",
-        "dynamodb_new_image_user_id_s": "string",
-        "dynamodb_new_image_customer_m_about_m_defaulted_on_payments_bool": "boolean",
-        "dynamodb_new_image_customer_m_about_m_dependent_people_n": "string",
-        "dynamodb_new_image_customer_m_about_m_residential_status_s": "string",
-        "dynamodb_new_image_customer_m_address_m_city_s": "string",
-        "dynamodb_new_image_customer_m_address_m_country_code_s": "string",
-        "dynamodb_new_image_customer_m_address_m_line1_s": "string",
-        "dynamodb_new_image_customer_m_address_m_line2_s": "string",
-        "dynamodb_new_image_customer_m_address_m_postal_code_s": "string",
-        "dynamodb_new_image_customer_m_dob_s": "string",
-        "dynamodb_new_image_customer_m_email_s": "string",
-        "dynamodb_new_image_customer_m_first_name_s": "string",
-        "dynamodb_new_image_customer_m_income_m_annual_bonus_m_currency_s": "string",
-        "dynamodb_new_image_customer_m_income_m_annual_bonus_m_value_s": "string",
-        "dynamodb_new_image_customer_m_income_m_annual_income_other_properties_m_currency_s": "string",
-        "dynamodb_new_image_customer_m_income_m_annual_income_other_properties_m_value_s": "string",
-        "dynamodb_new_image_customer_m_income_m_annual_salary_m_currency_s": "string",
-        "dynamodb_new_image_customer_m_income_m_annual_salary_m_value_s": "string",
-        "dynamodb_new_image_customer_m_income_m_annual_state_pension_m_currency_s": "string",
-        "dynamodb_new_image_customer_m_income_m_annual_state_pension_m_value_s": "string",
-        "dynamodb_new_image_customer_m_income_m_current_employer_s": "string",
-        "dynamodb_new_image_customer_m_income_m_employment_type_s": "string",
-        "dynamodb_new_image_customer_m_income_m_job_title_s": "string",
-        "dynamodb_new_image_customer_m_income_m_length_of_service_m_months_n": "string",
-        "dynamodb_new_image_customer_m_income_m_length_of_service_m_years_n": "string",
-        "dynamodb_new_image_customer_m_income_m_net_drawings_m_year1_m_currency_s": "string",
-        "dynamodb_new_image_customer_m_income_m_net_drawings_m_year1_m_value_s": "string",
-        "dynamodb_new_image_customer_m_income_m_net_drawings_m_year2_m_currency_s": "string",
-        "dynamodb_new_image_customer_m_income_m_net_drawings_m_year2_m_value_s": "string",
-        "dynamodb_new_image_customer_m_income_m_net_drawings_m_year3_m_currency_s": "string",
-        "dynamodb_new_image_customer_m_income_m_net_drawings_m_year3_m_value_s": "string",
-        "dynamodb_new_image_customer_m_income_m_net_profits_m_year1_m_currency_s": "string",
-        "dynamodb_new_image_customer_m_income_m_net_profits_m_year1_m_value_s": "string",
-        "dynamodb_new_image_customer_m_income_m_net_profits_m_year2_m_currency_s": "string",
-        "dynamodb_new_image_customer_m_income_m_net_profits_m_year2_m_value_s": "string",
-        "dynamodb_new_image_customer_m_income_m_net_profits_m_year3_m_currency_s": "string",
-        "dynamodb_new_image_customer_m_income_m_net_profits_m_year3_m_value_s": "string",
-        "dynamodb_new_image_customer_m_income_m_other_annual_income_m_currency_s": "string",
-        "dynamodb_new_image_customer_m_income_m_other_annual_income_m_value_s": "string",
-        "dynamodb_new_image_customer_m_income_m_retirement_age_plan_n": "string",
-        "dynamodb_new_image_customer_m_last_name_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_credits_l": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_non_credit_m_monthly_m_essential_costs_m_currency_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_non_credit_m_monthly_m_essential_costs_m_value_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_non_credit_m_monthly_m_financial_commitments_m_currency_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_non_credit_m_monthly_m_financial_commitments_m_value_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_non_credit_m_monthly_m_non_essential_costs_m_currency_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_non_credit_m_monthly_m_non_essential_costs_m_value_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_non_credit_m_monthly_m_rent_m_currency_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_non_credit_m_monthly_m_rent_m_value_s": "string",
-        "dynamodb_new_image_customer_m_phone_number_s": "string",
-        "dynamodb_new_image_customer_m_status_s": "string",
-        "dynamodb_new_image_customer_m_type_s": "string",
-        "dynamodb_new_image_property_m_expected_completion_date_s": "string",
-        "dynamodb_new_image_salesforce_case_id_s": "string",
-        "source": "string",
-        "timestamp_extracted": "timestamp",
-        "aws_region": "string",
-        "dynamodb_approximate_creation_date_time": "timestamp",
-        "dynamodb_keys_user_id_s": "string",
-        "dynamodb_new_image_id_s": "string",
-        "dynamodb_new_image_salesforce_data_m_epc_rating_null": "string",
-        "dynamodb_new_image_salesforce_data_m_application_fee_null": "string",
-        "dynamodb_new_image_salesforce_data_m_collateral_country_null": "string",
-        "dynamodb_new_image_salesforce_data_m_collateral_value_null": "string",
-        "dynamodb_new_image_salesforce_data_m_completion_date_null": "string",
-        "dynamodb_new_image_salesforce_data_m_description_of_collateral_null": "string",
-        "dynamodb_new_image_salesforce_data_m_expiry_date_of_facility_null": "string",
-        "dynamodb_new_image_salesforce_data_m_finance_amount_s": "string",
-        "dynamodb_new_image_salesforce_data_m_fixed_profit_rate_null": "string",
-        "dynamodb_new_image_salesforce_data_m_fixed_rate_period_s": "string",
-        "dynamodb_new_image_salesforce_data_m_id_s": "string",
-        "dynamodb_new_image_salesforce_data_m_property_finance_type_s": "string",
-        "dynamodb_new_image_salesforce_data_m_reference_id_s": "string",
-        "dynamodb_new_image_salesforce_data_m_repayment_period_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_0_m_comments_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_0_m_completed_date_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_0_m_form_completness_reviewed_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_0_m_lead_source_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_0_m_partner_name_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_0_m_stage_name_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_0_m_stage_status_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_0_m_started_date_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_10_m_comments_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_10_m_completed_date_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_10_m_customer_notified_regarding_utilisation_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_10_m_powery_of_attorney_notification_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_10_m_stage_name_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_10_m_stage_status_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_10_m_started_date_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_11_m_checklist_completed_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_11_m_collateral_comments_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_11_m_collateral_information_completed_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_11_m_collateral_sign_off_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_11_m_completed_date_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_11_m_file_sign_off_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_11_m_stage_name_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_11_m_stage_status_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_11_m_started_date_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_12_m_agent_confimation_prepared_bool": "boolean",
-        "dynamodb_new_image_salesforce_data_m_stages_l_12_m_agent_confirmation_signed_ho_o_agent_bool": "boolean",
-        "dynamodb_new_image_salesforce_data_m_stages_l_12_m_buyer_offer_and_agent_confirm_document_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_12_m_buyer_offer_received_broker_b_bool": "boolean",
-        "dynamodb_new_image_salesforce_data_m_stages_l_12_m_comments_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_12_m_completed_date_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_12_m_customer_notified_bool": "boolean",
-        "dynamodb_new_image_salesforce_data_m_stages_l_12_m_customer_notified_of_trade_bool": "boolean",
-        "dynamodb_new_image_salesforce_data_m_stages_l_12_m_initiate_broker_a_bool": "boolean",
-        "dynamodb_new_image_salesforce_data_m_stages_l_12_m_initiate_broker_b_bool": "boolean",
-        "dynamodb_new_image_salesforce_data_m_stages_l_12_m_initiate_commodity_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_12_m_prepare_seller_offer_bool": "boolean",
-        "dynamodb_new_image_salesforce_data_m_stages_l_12_m_seller_offer_and_acceptance_docs_head_of_bool": "boolean",
-        "dynamodb_new_image_salesforce_data_m_stages_l_12_m_seller_offer_and_acceptance_document_poa_bool": "boolean",
-        "dynamodb_new_image_salesforce_data_m_stages_l_12_m_seller_offer_and_acceptance_documents_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_12_m_seller_offer_signed_by_ho_o_bool": "boolean",
-        "dynamodb_new_image_salesforce_data_m_stages_l_12_m_seller_offer_signed_by_poa_bool": "boolean",
-        "dynamodb_new_image_salesforce_data_m_stages_l_12_m_stage_name_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_12_m_stage_status_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_12_m_started_date_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_12_m_supplier_offer_broker_a_bool": "boolean",
-        "dynamodb_new_image_salesforce_data_m_stages_l_12_m_trade_commodity_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_13_m_comments_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_13_m_completed_date_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_13_m_customer_notified_of_final_payment_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_13_m_final_payment_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_13_m_mambu_gl_entries_updated_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_13_m_stage_name_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_13_m_stage_status_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_13_m_started_date_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_14_m_bank_solicitor_invoice_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_14_m_comments_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_14_m_completed_date_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_14_m_confirmation_of_final_payment_receipt_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_14_m_partner_referral_invoice_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_14_m_regulatory_reporting_spreadsheet_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_14_m_stage_name_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_14_m_stage_status_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_14_m_started_date_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_1_m_certified_income_from_all_sources_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_1_m_completed_date_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_1_m_employed_bank_statement_comment_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_1_m_employed_credit_report_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_1_m_employed_credit_report_comments_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_1_m_employed_other_documents_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_1_m_employed_payslips_employer_comments_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_1_m_employed_personal_bank_statement_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_1_m_payslips_or_employer_reference_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_1_m_self_emp_personal_bank_stat_comments_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_1_m_self_employed_certified_income_comments_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_1_m_self_employed_credit_report_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_1_m_self_employed_credit_report_comments_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_1_m_self_employed_personal_bank_statement_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_1_m_stage_name_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_1_m_stage_status_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_1_m_started_date_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_2_m_comments_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_2_m_completed_date_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_2_m_stage_name_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_2_m_stage_status_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_2_m_started_date_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_3_m_affordability_check_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_3_m_completed_date_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_3_m_credit_report_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_3_m_eligibility_check_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_3_m_post_valuation_credit_decision_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_3_m_pre_valuation_credit_decision_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_3_m_stage_name_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_3_m_stage_status_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_3_m_started_date_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_3_m_underwriting_comments_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_4_m_completed_date_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_4_m_date_of_valuation_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_4_m_stage_name_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_4_m_stage_status_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_4_m_started_date_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_4_m_valuation_assessment_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_4_m_valuation_comments_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_4_m_valuation_report_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_4_m_valuation_type_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_5_m_bank_solicitor_notified_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_5_m_case_details_checked_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_5_m_completed_date_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_5_m_draft_facility_offer_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_5_m_draft_facility_offer_sent_to_customer_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_5_m_draft_facility_offer_sent_to_customer_dt_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_5_m_final_facility_offer_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_5_m_final_facility_offer_approved_bool": "boolean",
-        "dynamodb_new_image_salesforce_data_m_stages_l_5_m_final_facility_offer_sent_to_customer_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_5_m_final_facility_offer_sent_to_customer_dt_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_5_m_stage_name_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_5_m_stage_status_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_5_m_started_date_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_6_m_comments_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_6_m_completed_date_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_6_m_date_of_signature_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_6_m_signed_facility_terms_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_6_m_signed_offer_letter_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_6_m_signed_power_of_attorney_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_6_m_stage_name_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_6_m_stage_status_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_6_m_started_date_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_6_m_treasury_notified_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_7_m_comments_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_7_m_completed_date_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_7_m_date_of_signature_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_7_m_fee_withdrawal_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_7_m_signed_fee_withdrawal_authorisation_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_7_m_stage_name_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_7_m_stage_status_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_7_m_started_date_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_8_m_anticipation_date_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_8_m_bank_solicitor_instruction_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_8_m_comments_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_8_m_completed_date_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_8_m_completion_statement_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_8_m_customer_solicitor_company_name_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_8_m_customer_solicitor_contact_phone_number_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_8_m_customer_solicitor_contactor_full_name_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_8_m_customer_solicitor_email_address_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_8_m_finalised_cp_checklist_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_8_m_solicitor_verification_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_8_m_stage_name_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_8_m_stage_status_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_8_m_started_date_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_8_m_undertaking_costs_received_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_9_m_comments_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_9_m_completed_date_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_9_m_document_status_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_9_m_document_type_requested_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_9_m_stage_name_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_9_m_stage_status_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_9_m_started_date_null": "string",
-        "dynamodb_new_image_salesforce_data_m_status_s": "string",
-        "dynamodb_new_image_salesforce_data_m_total_fee_null": "string",
-        "dynamodb_new_image_salesforce_data_m_value_date_of_facility_null": "string",
-        "dynamodb_size_bytes": "string",
-        "event_id": "string",
-        "event_name": "string",
-        "event_source": "string",
-        "record_format": "string",
-        "table_name": "string",
-        "user_identity": "string",
-        "dynamodb_new_image_salesforce_data_m_fixed_profit_rate_n": "string",
-        "dynamodb_new_image_salesforce_data_m_finance_amount_null": "string",
-        "dynamodb_new_image_salesforce_data_m_fixed_rate_period_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_0_m_comments_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_0_m_completed_date_s": "date",
-        "dynamodb_new_image_salesforce_data_m_stages_l_0_m_form_completness_reviewed_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_0_m_partner_name_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_0_m_started_date_s": "date",
-        "dynamodb_new_image_salesforce_data_m_stages_l_1_m_certified_income_from_all_sources_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_1_m_self_employed_credit_report_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_1_m_self_employed_personal_bank_statement_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_1_m_started_date_s": "date",
-        "dynamodb_new_image_salesforce_data_m_stages_l_2_m_completed_date_s": "date",
-        "dynamodb_new_image_salesforce_data_m_stages_l_2_m_started_date_s": "date",
-        "dynamodb_new_image_salesforce_data_m_stages_l_1_m_completed_date_s": "date",
-        "dynamodb_new_image_salesforce_data_m_stages_l_3_m_affordability_check_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_3_m_completed_date_s": "date",
-        "dynamodb_new_image_salesforce_data_m_stages_l_3_m_credit_report_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_3_m_eligibility_check_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_3_m_pre_valuation_credit_decision_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_4_m_completed_date_s": "date",
-        "dynamodb_new_image_salesforce_data_m_stages_l_4_m_valuation_assessment_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_4_m_valuation_report_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_4_m_valuation_type_s": "string",
-        "dynamodb_new_image_financing_m_funding_m_equity_bool": "boolean",
-        "dynamodb_new_image_financing_m_funding_m_existing_deposit_bool": "boolean",
-        "dynamodb_new_image_customer_m_outgoing_m_credits_l_0_m_outstanding_balance_m_currency_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_credits_l_0_m_outstanding_balance_m_value_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_credits_l_0_m_repayment_m_currency_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_credits_l_0_m_repayment_m_value_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_credits_l_0_m_type_s": "string",
-        "dynamodb_new_image_salesforce_data_m_application_fee_n": "int",
-        "dynamodb_new_image_salesforce_data_m_total_fee_n": "int",
-        "dynamodb_new_image_salesforce_data_m_stages_l_3_m_post_valuation_credit_decision_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_3_m_started_date_s": "date",
-        "dynamodb_new_image_salesforce_data_m_stages_l_3_m_underwriting_comments_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_4_m_date_of_valuation_s": "date",
-        "dynamodb_new_image_salesforce_data_m_stages_l_4_m_started_date_s": "date",
-        "dynamodb_new_image_salesforce_data_m_stages_l_4_m_valuation_comments_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_5_m_completed_date_s": "date",
-        "dynamodb_new_image_salesforce_data_m_stages_l_5_m_draft_facility_offer_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_5_m_final_facility_offer_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_5_m_final_facility_offer_sent_to_customer_dt_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_5_m_started_date_s": "date",
-        "dynamodb_new_image_salesforce_data_m_stages_l_6_m_comments_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_6_m_completed_date_s": "date",
-        "dynamodb_new_image_salesforce_data_m_stages_l_6_m_date_of_signature_s": "date",
-        "dynamodb_new_image_salesforce_data_m_stages_l_6_m_signed_facility_terms_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_6_m_signed_offer_letter_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_6_m_signed_power_of_attorney_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_6_m_started_date_s": "date",
-        "dynamodb_new_image_salesforce_data_m_stages_l_7_m_comments_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_7_m_fee_withdrawal_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_7_m_signed_fee_withdrawal_authorisation_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_7_m_started_date_s": "date",
-        "dynamodb_new_image_salesforce_data_m_collateral_country_s": "string",
-        "dynamodb_new_image_salesforce_data_m_collateral_value_n": "int",
-        "dynamodb_new_image_salesforce_data_m_description_of_collateral_s": "string",
-        "dynamodb_new_image_salesforce_data_m_repayment_period_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_7_m_completed_date_s": "date",
-        "dynamodb_new_image_salesforce_data_m_stages_l_7_m_date_of_signature_s": "date",
-        "dynamodb_new_image_loan_account_m_id_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_1_m_stage_status_null": "string",
-        "dynamodb_new_image_salesforce_data_m_completion_date_s": "date",
-        "dynamodb_new_image_salesforce_data_m_stages_l_1_m_employed_credit_report_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_1_m_employed_personal_bank_statement_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_1_m_payslips_or_employer_reference_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_8_m_anticipation_date_s": "date",
-        "dynamodb_new_image_salesforce_data_m_stages_l_8_m_bank_solicitor_instruction_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_8_m_solicitor_verification_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_8_m_started_date_s": "date",
-        "dynamodb_new_image_salesforce_data_m_stages_l_8_m_customer_solicitor_company_name_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_8_m_customer_solicitor_contact_phone_number_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_8_m_customer_solicitor_contactor_full_name_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_8_m_customer_solicitor_email_address_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_10_m_comments_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_10_m_completed_date_s": "date",
-        "dynamodb_new_image_salesforce_data_m_stages_l_10_m_started_date_s": "date",
-        "dynamodb_new_image_salesforce_data_m_broker_or_direct_null": "string",
-        "dynamodb_new_image_salesforce_data_m_customer_mis_match__c_null": "string",
-        "dynamodb_new_image_salesforce_data_m_employment_status_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_0_m_esis_attached_bool": "boolean",
-        "dynamodb_new_image_salesforce_data_m_stages_l_0_m_esis_matched_bool": "boolean",
-        "dynamodb_new_image_salesforce_data_m_stages_l_13_m_annual_schedule_attached_bool": "boolean",
-        "dynamodb_new_image_salesforce_data_m_stages_l_4_m_after_valuation_esis_null": "string",
-        "dynamodb_new_image_product_category_s": "string",
-        "dynamodb_new_image_salesforce_data_m_employment_status_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_8_m_completed_date_s": "date",
-        "dynamodb_new_image_salesforce_data_m_stages_l_8_m_completion_statement_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_8_m_finalised_cp_checklist_s": "string",
-        "dynamodb_new_image_salesforce_data_m_expiry_date_of_facility_s": "date",
-        "dynamodb_new_image_salesforce_data_m_value_date_of_facility_s": "date",
-        "dynamodb_new_image_salesforce_data_m_stages_l_9_m_completed_date_s": "date",
-        "dynamodb_new_image_salesforce_data_m_stages_l_9_m_document_status_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_9_m_document_type_requested_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_9_m_started_date_s": "date",
-        "dynamodb_new_image_salesforce_data_m_stages_l_11_m_started_date_s": "date",
-        "dynamodb_new_image_salesforce_data_m_stages_l_11_m_completed_date_s": "date",
-        "dynamodb_new_image_salesforce_data_m_stages_l_12_m_initiate_commodity_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_12_m_started_date_s": "date",
-        "dynamodb_new_image_salesforce_data_m_stages_l_12_m_trade_commodity_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_12_m_completed_date_s": "date",
-        "dynamodb_new_image_salesforce_data_m_stages_l_13_m_started_date_s": "date",
-        "dynamodb_new_image_salesforce_data_m_stages_l_13_m_completed_date_s": "date",
-        "dynamodb_new_image_salesforce_data_m_stages_l_14_m_started_date_s": "date",
-        "dynamodb_new_image_salesforce_data_m_stages_l_14_m_comments_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_14_m_regulatory_reporting_spreadsheet_s": "string",
-        "dynamodb_new_image_financing_m_funding_m_gift_bool": "boolean",
-        "dynamodb_new_image_customer_m_outgoing_m_credits_l_1_m_outstanding_balance_m_currency_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_credits_l_1_m_outstanding_balance_m_value_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_credits_l_1_m_repayment_m_currency_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_credits_l_1_m_repayment_m_value_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_credits_l_1_m_type_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_14_m_bank_solicitor_invoice_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_10_m_powery_of_attorney_notification_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_2_m_comments_s": "string",
-        "dynamodb_new_image_salesforce_data_m_epc_rating_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_14_m_partner_referral_invoice_s": "string",
-        "dynamodb_new_image_advice_accepted_bool": "boolean",
-        "dynamodb_new_image_salesforce_data_m_customer_mis_match__c_s": "string",
-        "dynamodb_new_image_salesforce_data_m_broker_or_direct_s": "string",
-        "dynamodb_new_image_property_m_business_nature_s": "string",
-        "dynamodb_new_image_notes_s": "string",
-        "dynamodb_new_image_financing_m_funding_m_other_bool": "boolean",
-        "dynamodb_new_image_customer_accepted_idd_bool": "boolean",
-        "dynamodb_new_image_financing_m_funding_m_already_paid_bool": "boolean",
-        "dynamodb_new_image_financing_m_funding_m_refinancing_bool": "boolean",
-        "dynamodb_new_image_financing_m_funding_m_sales_of_another_property_bool": "boolean",
-        "dynamodb_new_image_advice_justification_s": "string",
-        "dynamodb_new_image_suitability_letter_sent_bool": "boolean",
-        "dynamodb_new_image_advisor_ids_l_0_s": "string",
-        "dynamodb_new_image_lawyer_contact_details_m_company_name_s": "string",
-        "dynamodb_new_image_lawyer_contact_details_m_email_s": "string",
-        "dynamodb_new_image_lawyer_contact_details_m_full_name_s": "string",
-        "dynamodb_new_image_lawyer_contact_details_m_phone_number_s": "string",
-        "dynamodb_new_image_salesforce_data_m_legal_fee_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_10_m_utilisation_notice_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_14_m_generate_annual_statement_bool": "boolean",
-        "dynamodb_new_image_salesforce_data_m_stages_l_3_m_cost_funding_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_3_m_gross_rental_profit_cover_ratio_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_3_m_net_rental_profit_cover_ratio_z_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_5_m_generate_offer_bool": "boolean",
-        "dynamodb_new_image_salesforce_data_m_stages_l_5_m_offer_condition_1_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_5_m_offer_condition_2_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_5_m_offer_condition_3_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_5_m_offer_condition_4_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_5_m_offer_condition_5_null": "string",
-        "dynamodb_new_image_salesforce_data_m_legal_fee_n": "int",
-        "dynamodb_new_image_salesforce_data_m_stages_l_3_m_gross_rental_profit_cover_ratio_n": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_3_m_net_rental_profit_cover_ratio_z_n": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_10_m_stage_status_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_11_m_stage_status_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_12_m_stage_status_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_13_m_stage_status_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_14_m_stage_status_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_2_m_stage_status_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_6_m_stage_status_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_7_m_stage_status_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_8_m_stage_status_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_9_m_stage_status_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_3_m_cost_funding_n": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_5_m_offer_condition_1_s": "string",
-        "dynamodb_new_image_broker_id_s": "string",
-        "dynamodb_new_image_customer_m_income_m_other_currency_income_l_0_m_income_m_currency_s": "string",
-        "dynamodb_new_image_customer_m_income_m_other_currency_income_l_0_m_income_m_value_s": "string",
-        "dynamodb_new_image_customer_m_income_m_other_currency_income_l_0_m_source_s": "string",
-        "dynamodb_new_image_valuer_contact_details_m_email_s": "string",
-        "dynamodb_new_image_valuer_contact_details_m_full_name_s": "string",
-        "dynamodb_new_image_valuer_contact_details_m_phone_number_s": "string",
-        "dynamodb_new_image_salesforce_data_m_property_finance_type_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_1_m_employed_bank_statement_comment_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_1_m_employed_payslips_employer_comments_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_5_m_copy_of_app_form_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_5_m_copy_of_app_form_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_8_m_comments_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_other_currency_expenses_l_0_m_source_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_4_m_after_valuation_esis_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_10_m_utilisation_notice_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_1_m_employed_other_documents_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_11_m_collateral_comments_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_credits_l_2_m_outstanding_balance_m_currency_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_credits_l_2_m_outstanding_balance_m_value_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_credits_l_2_m_repayment_m_currency_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_credits_l_2_m_repayment_m_value_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_credits_l_2_m_type_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_5_m_offer_condition_2_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_5_m_offer_condition_3_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_1_m_employed_credit_report_comments_s": "string",
-        "dynamodb_new_image_accountant_contact_details_m_address_s": "string",
-        "dynamodb_new_image_accountant_contact_details_m_email_s": "string",
-        "dynamodb_new_image_accountant_contact_details_m_full_name_s": "string",
-        "dynamodb_new_image_accountant_contact_details_m_phone_number_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_1_m_self_emp_personal_bank_stat_comments_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_1_m_self_employed_certified_income_comments_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_1_m_self_employed_credit_report_comments_s": "string",
-        "dynamodb_new_image_commodity_trade_m_id_s": "string",
-        "dynamodb_new_image_commodity_trade_m_status_s": "string",
-        "awsregion": "string",
-        "eventid": "string",
-        "eventname": "string",
-        "useridentity": "string",
-        "recordformat": "string",
-        "tablename": "string",
-        "dynamodb_approximatecreationdatetime": "timestamp",
-        "dynamodb_keys_userid_s": "string",
-        "dynamodb_newimage_property_m_ownershiptype_s": "string",
-        "dynamodb_newimage_property_m_remainingleaseyears_n": "int",
-        "dynamodb_newimage_property_m_address_m_line2_s": "string",
-        "dynamodb_newimage_property_m_address_m_city_s": "string",
-        "dynamodb_newimage_property_m_address_m_line1_s": "string",
-        "dynamodb_newimage_property_m_address_m_countrycode_s": "string",
-        "dynamodb_newimage_property_m_address_m_postalcode_s": "string",
-        "dynamodb_newimage_property_m_bedroomcount_n": "int",
-        "dynamodb_newimage_property_m_isexlocalauthorityproperty_bool": "boolean",
-        "dynamodb_newimage_property_m_isbusiness_bool": "boolean",
-        "dynamodb_newimage_property_m_propertytype_s": "string",
-        "dynamodb_newimage_property_m_expectedcompletiondate_s": "string",
-        "dynamodb_newimage_property_m_contactdetails_m_fullname_s": "string",
-        "dynamodb_newimage_property_m_contactdetails_m_email_s": "string",
-        "dynamodb_newimage_property_m_contactdetails_m_phonenumber_s": "string",
-        "dynamodb_newimage_property_m_age_s": "string",
-        "dynamodb_newimage_status_s": "string",
-        "dynamodb_newimage_createdat_n": "timestamp",
-        "dynamodb_newimage_sections_l_0_m_stages_l_0_m_id_s": "string",
-        "dynamodb_newimage_sections_l_0_m_stages_l_0_m_hidden_bool": "boolean",
-        "dynamodb_newimage_sections_l_0_m_stages_l_0_m_order_n": "int",
-        "dynamodb_newimage_sections_l_0_m_stages_l_0_m_status_s": "string",
-        "dynamodb_newimage_sections_l_0_m_stages_l_1_m_id_s": "string",
-        "dynamodb_newimage_sections_l_0_m_stages_l_1_m_hidden_bool": "boolean",
-        "dynamodb_newimage_sections_l_0_m_stages_l_1_m_order_n": "int",
-        "dynamodb_newimage_sections_l_0_m_stages_l_1_m_status_s": "string",
-        "dynamodb_newimage_sections_l_0_m_stages_l_2_m_id_s": "string",
-        "dynamodb_newimage_sections_l_0_m_stages_l_2_m_hidden_bool": "boolean",
-        "dynamodb_newimage_sections_l_0_m_stages_l_2_m_order_n": "int",
-        "dynamodb_newimage_sections_l_0_m_stages_l_2_m_status_s": "string",
-        "dynamodb_newimage_sections_l_0_m_stages_l_3_m_id_s": "string",
-        "dynamodb_newimage_sections_l_0_m_stages_l_3_m_hidden_bool": "boolean",
-        "dynamodb_newimage_sections_l_0_m_stages_l_3_m_order_n": "int",
-        "dynamodb_newimage_sections_l_0_m_stages_l_3_m_status_s": "string",
-        "dynamodb_newimage_sections_l_0_m_id_s": "string",
-        "dynamodb_newimage_sections_l_0_m_hidden_bool": "boolean",
-        "dynamodb_newimage_sections_l_0_m_order_n": "int",
-        "dynamodb_newimage_sections_l_1_m_stages_l_0_m_id_s": "string",
-        "dynamodb_newimage_sections_l_1_m_stages_l_0_m_hidden_bool": "boolean",
-        "dynamodb_newimage_sections_l_1_m_stages_l_0_m_order_n": "int",
-        "dynamodb_newimage_sections_l_1_m_stages_l_0_m_status_s": "string",
-        "dynamodb_newimage_sections_l_1_m_stages_l_1_m_id_s": "string",
-        "dynamodb_newimage_sections_l_1_m_stages_l_1_m_hidden_bool": "boolean",
-        "dynamodb_newimage_sections_l_1_m_stages_l_1_m_order_n": "int",
-        "dynamodb_newimage_sections_l_1_m_stages_l_1_m_status_s": "string",
-        "dynamodb_newimage_sections_l_1_m_stages_l_2_m_id_s": "string",
-        "dynamodb_newimage_sections_l_1_m_stages_l_2_m_hidden_bool": "boolean",
-        "dynamodb_newimage_sections_l_1_m_stages_l_2_m_order_n": "int",
-        "dynamodb_newimage_sections_l_1_m_stages_l_2_m_status_s": "string",
-        "dynamodb_newimage_sections_l_1_m_stages_l_3_m_id_s": "string",
-        "dynamodb_newimage_sections_l_1_m_stages_l_3_m_hidden_bool": "boolean",
-        "dynamodb_newimage_sections_l_1_m_stages_l_3_m_order_n": "int",
-        "dynamodb_newimage_sections_l_1_m_stages_l_3_m_status_s": "string",
-        "dynamodb_newimage_sections_l_1_m_stages_l_4_m_id_s": "string",
-        "dynamodb_newimage_sections_l_1_m_stages_l_4_m_hidden_bool": "boolean",
-        "dynamodb_newimage_sections_l_1_m_stages_l_4_m_order_n": "int",
-        "dynamodb_newimage_sections_l_1_m_stages_l_4_m_status_s": "string",
-        "dynamodb_newimage_sections_l_1_m_stages_l_5_m_id_s": "string",
-        "dynamodb_newimage_sections_l_1_m_stages_l_5_m_hidden_bool": "boolean",
-        "dynamodb_newimage_sections_l_1_m_stages_l_5_m_order_n": "int",
-        "dynamodb_newimage_sections_l_1_m_stages_l_5_m_status_s": "string",
-        "dynamodb_newimage_sections_l_1_m_id_s": "string",
-        "dynamodb_newimage_sections_l_1_m_hidden_bool": "boolean",
-        "dynamodb_newimage_sections_l_1_m_order_n": "int",
-        "dynamodb_newimage_submitted_bool": "boolean",
-        "dynamodb_newimage_financing_m_duration_n": "int",
-        "dynamodb_newimage_financing_m_product_s": "string",
-        "dynamodb_newimage_financing_m_funding_m_existingdeposit_bool": "boolean",
-        "dynamodb_newimage_financing_m_funding_m_savings_bool": "boolean",
-        "dynamodb_newimage_financing_m_requiredfinancing_m_value_s": "string",
-        "dynamodb_newimage_financing_m_requiredfinancing_m_currency_s": "string",
-        "dynamodb_newimage_financing_m_repaymentotherdescription_s": "string",
-        "dynamodb_newimage_financing_m_agreedpurchaseprice_m_value_s": "string",
-        "dynamodb_newimage_financing_m_agreedpurchaseprice_m_currency_s": "string",
-        "dynamodb_newimage_financing_m_fundingotherdescription_s": "string",
-        "dynamodb_newimage_financing_m_expectedmonthlyrental_m_value_s": "string",
-        "dynamodb_newimage_financing_m_expectedmonthlyrental_m_currency_s": "string",
-        "dynamodb_newimage_financing_m_repayment_s": "string",
-        "dynamodb_newimage_adviceaccepted_bool": "boolean",
-        "dynamodb_newimage_salesforcedata_m_finance_amount_s": "string",
-        "dynamodb_newimage_salesforcedata_m_epc_rating_null": "string",
-        "dynamodb_newimage_salesforcedata_m_description_of_collateral_s": "string",
-        "dynamodb_newimage_salesforcedata_m_reference_id_s": "string",
-        "dynamodb_newimage_salesforcedata_m_value_date_of_facility_null": "string",
-        "dynamodb_newimage_salesforcedata_m_collateral_value_n": "int",
-        "dynamodb_newimage_salesforcedata_m_repayment_period_s": "string",
-        "dynamodb_newimage_salesforcedata_m_collateral_country_s": "string",
-        "dynamodb_newimage_salesforcedata_m_expiry_date_of_facility_null": "string",
-        "dynamodb_newimage_salesforcedata_m_broker_or_direct_s": "string",
-        "dynamodb_newimage_salesforcedata_m_total_fee_n": "int",
-        "dynamodb_newimage_salesforcedata_m_customer_mis_match__c_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_0_m_esis_attached_bool": "boolean",
-        "dynamodb_newimage_salesforcedata_m_stages_l_0_m_esis_matched_bool": "boolean",
-        "dynamodb_newimage_salesforcedata_m_stages_l_0_m_comments_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_0_m_partner_name_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_0_m_stage_name_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_0_m_lead_source_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_0_m_form_completness_reviewed_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_0_m_started_date_s": "date",
-        "dynamodb_newimage_salesforcedata_m_stages_l_0_m_stage_status_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_0_m_completed_date_s": "date",
-        "dynamodb_newimage_salesforcedata_m_stages_l_1_m_certified_income_from_all_sources_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_1_m_self_emp_personal_bank_stat_comments_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_1_m_employed_bank_statement_comment_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_1_m_employed_payslips_employer_comments_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_1_m_started_date_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_1_m_stage_status_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_1_m_employed_credit_report_comments_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_1_m_self_employed_credit_report_comments_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_1_m_completed_date_s": "date",
-        "dynamodb_newimage_salesforcedata_m_stages_l_1_m_self_employed_certified_income_comments_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_1_m_self_employed_personal_bank_statement_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_1_m_stage_name_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_1_m_payslips_or_employer_reference_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_1_m_employed_personal_bank_statement_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_1_m_employed_other_documents_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_1_m_employed_credit_report_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_1_m_self_employed_credit_report_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_2_m_started_date_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_2_m_comments_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_2_m_stage_status_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_2_m_stage_name_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_2_m_completed_date_s": "date",
-        "dynamodb_newimage_salesforcedata_m_stages_l_3_m_cost_funding_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_3_m_affordability_check_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_3_m_gross_rental_profit_cover_ratio_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_3_m_pre_valuation_credit_decision_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_3_m_started_date_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_3_m_post_valuation_credit_decision_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_3_m_eligibility_check_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_3_m_stage_status_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_3_m_completed_date_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_3_m_credit_report_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_3_m_stage_name_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_3_m_underwriting_comments_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_3_m_net_rental_profit_cover_ratioz_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_4_m_valuation_comments_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_4_m_valuation_assessment_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_4_m_stage_name_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_4_m_started_date_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_4_m_valuation_type_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_4_m_after_valuation_esis_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_4_m_stage_status_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_4_m_valuation_report_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_4_m_completed_date_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_4_m_date_of_valuation_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_5_m_started_date_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_5_m_stage_status_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_5_m_final_facility_offer_sent_to_customer_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_5_m_final_facility_offer_sent_to_customer_dt_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_5_m_completed_date_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_5_m_offer_condition_1_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_5_m_offer_condition_2_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_5_m_offer_condition_5_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_5_m_copy_of_app_form_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_5_m_final_facility_offer_approved_bool": "boolean",
-        "dynamodb_newimage_salesforcedata_m_stages_l_5_m_offer_condition_3_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_5_m_case_details_checked_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_5_m_offer_condition_4_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_5_m_generate_offer_bool": "boolean",
-        "dynamodb_newimage_salesforcedata_m_stages_l_5_m_stage_name_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_5_m_draft_facility_offer_sent_to_customer_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_5_m_final_facility_offer_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_5_m_draft_facility_offer_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_5_m_bank_solicitor_notified_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_5_m_draft_facility_offer_sent_to_customer_dt_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_6_m_date_of_signature_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_6_m_treasury_notified_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_6_m_comments_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_6_m_signed_offer_letter_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_6_m_signed_power_of_attorney_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_6_m_signed_facility_terms_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_6_m_stage_name_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_6_m_started_date_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_6_m_stage_status_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_6_m_completed_date_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_7_m_date_of_signature_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_7_m_comments_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_7_m_stage_name_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_7_m_started_date_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_7_m_signed_fee_withdrawal_authorisation_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_7_m_stage_status_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_7_m_fee_withdrawal_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_7_m_completed_date_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_8_m_comments_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_8_m_customer_solicitor_email_address_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_8_m_finalised_cp_checklist_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_8_m_customer_solicitor_contact_phone_number_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_8_m_anticipation_date_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_8_m_solicitor_verification_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_8_m_customer_solicitor_company_name_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_8_m_started_date_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_8_m_stage_status_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_8_m_completed_date_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_8_m_completion_statement_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_8_m_customer_solicitor_contactor_full_name_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_8_m_undertaking_costs_received_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_8_m_stage_name_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_8_m_bank_solicitor_instruction_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_9_m_comments_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_9_m_document_status_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_9_m_stage_name_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_9_m_started_date_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_9_m_stage_status_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_9_m_document_type_requested_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_9_m_completed_date_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_10_m_comments_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_10_m_stage_name_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_10_m_started_date_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_10_m_utilisation_notice_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_10_m_stage_status_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_10_m_customer_notified_regarding_utilisation_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_10_m_powery_of_attorney_notification_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_10_m_completed_date_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_11_m_collateral_information_completed_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_11_m_collateral_sign_off_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_11_m_collateral_comments_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_11_m_stage_name_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_11_m_checklist_completed_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_11_m_started_date_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_11_m_stage_status_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_11_m_file_sign_off_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_11_m_completed_date_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_12_m_comments_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_12_m_seller_offer_and_acceptance_documents_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_12_m_initiate_brokerb_bool": "boolean",
-        "dynamodb_newimage_salesforcedata_m_stages_l_12_m_initiate_brokera_bool": "boolean",
-        "dynamodb_newimage_salesforcedata_m_stages_l_12_m_customer_notified_bool": "boolean",
-        "dynamodb_newimage_salesforcedata_m_stages_l_12_m_seller_offer_and_acceptance_docs_head_of_bool": "boolean",
-        "dynamodb_newimage_salesforcedata_m_stages_l_12_m_seller_offer_and_acceptance_document_poa_bool": "boolean",
-        "dynamodb_newimage_salesforcedata_m_stages_l_12_m_started_date_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_12_m_agent_confimation_prepared_bool": "boolean",
-        "dynamodb_newimage_salesforcedata_m_stages_l_12_m_seller_offer_signed_by_poa_bool": "boolean",
-        "dynamodb_newimage_salesforcedata_m_stages_l_12_m_stage_status_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_12_m_completed_date_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_12_m_buyer_offer_and_agent_confirm_document_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_12_m_buyer_offer_received_brokerb_bool": "boolean",
-        "dynamodb_newimage_salesforcedata_m_stages_l_12_m_agent_confirmation_signedhoo_agent_bool": "boolean",
-        "dynamodb_newimage_salesforcedata_m_stages_l_12_m_initiate_commodity_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_12_m_seller_offer_signed_by_hoo_bool": "boolean",
-        "dynamodb_newimage_salesforcedata_m_stages_l_12_m_trade_commodity_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_12_m_customer_notified_of_trade_bool": "boolean",
-        "dynamodb_newimage_salesforcedata_m_stages_l_12_m_stage_name_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_12_m_prepare_seller_offer_bool": "boolean",
-        "dynamodb_newimage_salesforcedata_m_stages_l_12_m_supplier_offer_brokera_bool": "boolean",
-        "dynamodb_newimage_salesforcedata_m_stages_l_13_m_annual_schedule_attached_bool": "boolean",
-        "dynamodb_newimage_salesforcedata_m_stages_l_13_m_comments_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_13_m_stage_name_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_13_m_customer_notified_of_final_payment_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_13_m_mambu_gl_entries_updated_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_13_m_final_payment_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_13_m_started_date_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_13_m_stage_status_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_13_m_completed_date_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_14_m_generate_annual_statement_bool": "boolean",
-        "dynamodb_newimage_salesforcedata_m_stages_l_14_m_bank_solicitor_invoice_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_14_m_comments_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_14_m_stage_name_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_14_m_partner_referral_invoice_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_14_m_confirmation_of_final_payment_receipt_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_14_m_started_date_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_14_m_regulatory_reporting_spreadsheet_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_14_m_stage_status_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_14_m_completed_date_null": "string",
-        "dynamodb_newimage_salesforcedata_m_property_finance_type_s": "string",
-        "dynamodb_newimage_salesforcedata_m_application_fee_n": "int",
-        "dynamodb_newimage_salesforcedata_m_completion_date_null": "string",
-        "dynamodb_newimage_salesforcedata_m_fixed_rate_period_s": "string",
-        "dynamodb_newimage_salesforcedata_m_id_s": "string",
-        "dynamodb_newimage_salesforcedata_m_employment_status_s": "string",
-        "dynamodb_newimage_salesforcedata_m_legal_fee_n": "int",
-        "dynamodb_newimage_salesforcedata_m_fixed_profit_rate_n": "string",
-        "dynamodb_newimage_salesforcedata_m_status_s": "string",
-        "dynamodb_newimage_salesforcecaseid_s": "string",
-        "dynamodb_newimage_updatedat_n": "timestamp",
-        "dynamodb_newimage_userid_s": "string",
-        "dynamodb_newimage_productcategory_s": "string",
-        "dynamodb_newimage_customer_m_income_m_currentemployer_s": "string",
-        "dynamodb_newimage_customer_m_income_m_annualsalary_m_value_s": "string",
-        "dynamodb_newimage_customer_m_income_m_annualsalary_m_currency_s": "string",
-        "dynamodb_newimage_customer_m_income_m_annualstatepension_m_value_s": "string",
-        "dynamodb_newimage_customer_m_income_m_annualstatepension_m_currency_s": "string",
-        "dynamodb_newimage_customer_m_income_m_retirementageplan_n": "int",
-        "dynamodb_newimage_customer_m_income_m_employmenttype_s": "string",
-        "dynamodb_newimage_customer_m_income_m_annualbonus_m_value_s": "string",
-        "dynamodb_newimage_customer_m_income_m_annualbonus_m_currency_s": "string",
-        "dynamodb_newimage_customer_m_income_m_jobtitle_s": "string",
-        "dynamodb_newimage_customer_m_income_m_lengthofservice_m_years_n": "int",
-        "dynamodb_newimage_customer_m_income_m_lengthofservice_m_months_n": "int",
-        "dynamodb_newimage_customer_m_income_m_netdrawings_m_year1_m_value_s": "string",
-        "dynamodb_newimage_customer_m_income_m_netdrawings_m_year1_m_currency_s": "string",
-        "dynamodb_newimage_customer_m_income_m_netdrawings_m_year2_m_value_s": "string",
-        "dynamodb_newimage_customer_m_income_m_netdrawings_m_year2_m_currency_s": "string",
-        "dynamodb_newimage_customer_m_income_m_netdrawings_m_year3_m_value_s": "string",
-        "dynamodb_newimage_customer_m_income_m_netdrawings_m_year3_m_currency_s": "string",
-        "dynamodb_newimage_customer_m_income_m_annualincomeotherproperties_m_value_s": "string",
-        "dynamodb_newimage_customer_m_income_m_annualincomeotherproperties_m_currency_s": "string",
-        "dynamodb_newimage_customer_m_income_m_otherannualincome_m_value_s": "string",
-        "dynamodb_newimage_customer_m_income_m_otherannualincome_m_currency_s": "string",
-        "dynamodb_newimage_customer_m_income_m_netprofits_m_year1_m_value_s": "string",
-        "dynamodb_newimage_customer_m_income_m_netprofits_m_year1_m_currency_s": "string",
-        "dynamodb_newimage_customer_m_income_m_netprofits_m_year2_m_value_s": "string",
-        "dynamodb_newimage_customer_m_income_m_netprofits_m_year2_m_currency_s": "string",
-        "dynamodb_newimage_customer_m_income_m_netprofits_m_year3_m_value_s": "string",
-        "dynamodb_newimage_customer_m_income_m_netprofits_m_year3_m_currency_s": "string",
-        "dynamodb_newimage_customer_m_firstname_s": "string",
-        "dynamodb_newimage_customer_m_lastname_s": "string",
-        "dynamodb_newimage_customer_m_outgoing_m_noncredit_m_monthly_m_nonessentialcosts_m_value_s": "string",
-        "dynamodb_newimage_customer_m_outgoing_m_noncredit_m_monthly_m_nonessentialcosts_m_currency_s": "string",
-        "dynamodb_newimage_customer_m_outgoing_m_noncredit_m_monthly_m_financialcommitments_m_value_s": "string",
-        "dynamodb_newimage_customer_m_outgoing_m_noncredit_m_monthly_m_financialcommitments_m_currency_s": "string",
-        "dynamodb_newimage_customer_m_outgoing_m_noncredit_m_monthly_m_rent_m_value_s": "string",
-        "dynamodb_newimage_customer_m_outgoing_m_noncredit_m_monthly_m_rent_m_currency_s": "string",
-        "dynamodb_newimage_customer_m_outgoing_m_noncredit_m_monthly_m_essentialcosts_m_value_s": "string",
-        "dynamodb_newimage_customer_m_outgoing_m_noncredit_m_monthly_m_essentialcosts_m_currency_s": "string",
-        "dynamodb_newimage_customer_m_outgoing_m_credits_l_0_m_type_s": "string",
-        "dynamodb_newimage_customer_m_outgoing_m_credits_l_0_m_repayment_m_value_s": "string",
-        "dynamodb_newimage_customer_m_outgoing_m_credits_l_0_m_repayment_m_currency_s": "string",
-        "dynamodb_newimage_customer_m_outgoing_m_credits_l_0_m_outstandingbalance_m_value_s": "string",
-        "dynamodb_newimage_customer_m_outgoing_m_credits_l_0_m_outstandingbalance_m_currency_s": "string",
-        "dynamodb_newimage_customer_m_phonenumber_s": "string",
-        "dynamodb_newimage_customer_m_address_m_city_s": "string",
-        "dynamodb_newimage_customer_m_address_m_line2_s": "string",
-        "dynamodb_newimage_customer_m_address_m_countrycode_s": "string",
-        "dynamodb_newimage_customer_m_address_m_line1_s": "string",
-        "dynamodb_newimage_customer_m_address_m_postalcode_s": "string",
-        "dynamodb_newimage_customer_m_dob_s": "string",
-        "dynamodb_newimage_customer_m_about_m_dependentpeople_n": "int",
-        "dynamodb_newimage_customer_m_about_m_defaultedonpayments_bool": "boolean",
-        "dynamodb_newimage_customer_m_about_m_residentialstatus_s": "string",
-        "dynamodb_newimage_customer_m_type_s": "string",
-        "dynamodb_newimage_customer_m_email_s": "string",
-        "dynamodb_newimage_customer_m_status_s": "string",
-        "dynamodb_newimage_id_s": "string",
-        "dynamodb_sizebytes": "string",
-        "eventsource": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_0_m_partner_name_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_0_m_started_date_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_1_m_employed_other_documents_s": "string",
-        "dynamodb_newimage_customer_m_outgoing_m_credits_l_1_m_type_s": "string",
-        "dynamodb_newimage_customer_m_outgoing_m_credits_l_1_m_repayment_m_value_s": "string",
-        "dynamodb_newimage_customer_m_outgoing_m_credits_l_1_m_repayment_m_currency_s": "string",
-        "dynamodb_newimage_customer_m_outgoing_m_credits_l_1_m_outstandingbalance_m_value_s": "string",
-        "dynamodb_newimage_customer_m_outgoing_m_credits_l_1_m_outstandingbalance_m_currency_s": "string",
-        "dynamodb_newimage_customer_m_outgoing_m_credits_l_2_m_type_s": "string",
-        "dynamodb_newimage_customer_m_outgoing_m_credits_l_2_m_repayment_m_value_s": "string",
-        "dynamodb_newimage_customer_m_outgoing_m_credits_l_2_m_repayment_m_currency_s": "string",
-        "dynamodb_newimage_customer_m_outgoing_m_credits_l_2_m_outstandingbalance_m_value_s": "string",
-        "dynamodb_newimage_customer_m_outgoing_m_credits_l_2_m_outstandingbalance_m_currency_s": "string",
-        "dynamodb_newimage_valuercontactdetails_m_fullname_s": "string",
-        "dynamodb_newimage_valuercontactdetails_m_email_s": "string",
-        "dynamodb_newimage_valuercontactdetails_m_phonenumber_s": "string",
-        "dynamodb_newimage_accountantcontactdetails_m_fullname_s": "string",
-        "dynamodb_newimage_accountantcontactdetails_m_phonenumber_s": "string",
-        "dynamodb_newimage_accountantcontactdetails_m_address_s": "string",
-        "dynamodb_newimage_accountantcontactdetails_m_email_s": "string",
-        "dynamodb_newimage_brokerid_s": "string",
-        "dynamodb_newimage_financing_m_funding_m_gift_bool": "boolean",
-        "dynamodb_newimage_financing_m_funding_m_other_bool": "boolean",
-        "dynamodb_newimage_financing_m_funding_m_salesofanotherproperty_bool": "boolean",
-        "dynamodb_newimage_financing_m_funding_m_refinancing_bool": "boolean",
-        "dynamodb_newimage_financing_m_funding_m_alreadypaid_bool": "boolean",
-        "dynamodb_newimage_salesforcedata_m_stages_l_1_m_certified_income_from_all_sources_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_1_m_self_emp_personal_bank_stat_comments_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_1_m_employed_bank_statement_comment_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_1_m_employed_payslips_employer_comments_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_1_m_employed_credit_report_comments_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_1_m_self_employed_credit_report_comments_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_1_m_self_employed_certified_income_comments_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_1_m_self_employed_personal_bank_statement_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_1_m_payslips_or_employer_reference_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_1_m_employed_personal_bank_statement_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_1_m_employed_credit_report_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_1_m_self_employed_credit_report_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_3_m_affordability_check_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_3_m_pre_valuation_credit_decision_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_3_m_started_date_s": "date",
-        "dynamodb_newimage_salesforcedata_m_stages_l_3_m_eligibility_check_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_3_m_credit_report_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_4_m_valuation_assessment_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_4_m_valuation_type_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_4_m_valuation_report_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_4_m_completed_date_s": "date",
-        "dynamodb_newimage_salesforcedata_m_stages_l_6_m_stage_status_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_7_m_stage_status_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_8_m_stage_status_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_9_m_stage_status_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_10_m_stage_status_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_11_m_stage_status_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_12_m_stage_status_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_13_m_stage_status_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_14_m_stage_status_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_1_m_started_date_s": "date",
-        "dynamodb_newimage_salesforcedata_m_stages_l_1_m_completed_date_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_2_m_started_date_s": "date",
-        "dynamodb_newimage_salesforcedata_m_stages_l_2_m_comments_null": "string",
-        "dynamodb_newimage_customer_m_outgoing_m_credits_l": "string",
-        "dynamodb_newimage_salesforcedata_m_value_date_of_facility_s": "date",
-        "dynamodb_newimage_salesforcedata_m_expiry_date_of_facility_s": "date",
-        "dynamodb_newimage_salesforcedata_m_stages_l_3_m_cost_funding_n": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_3_m_gross_rental_profit_cover_ratio_n": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_3_m_completed_date_s": "date",
-        "dynamodb_newimage_salesforcedata_m_stages_l_3_m_underwriting_comments_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_3_m_net_rental_profit_cover_ratioz_n": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_4_m_started_date_s": "date",
-        "dynamodb_newimage_salesforcedata_m_stages_l_5_m_started_date_s": "date",
-        "dynamodb_newimage_salesforcedata_m_stages_l_5_m_completed_date_s": "date",
-        "dynamodb_newimage_salesforcedata_m_stages_l_5_m_offer_condition_1_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_5_m_offer_condition_2_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_5_m_copy_of_app_form_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_5_m_offer_condition_3_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_5_m_final_facility_offer_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_6_m_date_of_signature_s": "date",
-        "dynamodb_newimage_salesforcedata_m_stages_l_6_m_signed_offer_letter_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_6_m_signed_facility_terms_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_6_m_started_date_s": "date",
-        "dynamodb_newimage_salesforcedata_m_stages_l_6_m_completed_date_s": "date",
-        "dynamodb_newimage_salesforcedata_m_stages_l_7_m_date_of_signature_s": "date",
-        "dynamodb_newimage_salesforcedata_m_stages_l_7_m_comments_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_7_m_started_date_s": "date",
-        "dynamodb_newimage_salesforcedata_m_stages_l_7_m_signed_fee_withdrawal_authorisation_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_7_m_fee_withdrawal_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_7_m_completed_date_s": "date",
-        "dynamodb_newimage_salesforcedata_m_stages_l_8_m_customer_solicitor_email_address_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_8_m_started_date_s": "date",
-        "dynamodb_newimage_salesforcedata_m_stages_l_8_m_customer_solicitor_contactor_full_name_s": "string",
-        "dynamodb_newimage_salesforcedata_m_completion_date_s": "date",
-        "dynamodb_newimage_loanaccount_m_id_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_0_m_form_completness_reviewed_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_4_m_date_of_valuation_s": "date",
-        "dynamodb_newimage_salesforcedata_m_stages_l_6_m_signed_power_of_attorney_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_8_m_customer_solicitor_company_name_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_2_m_completed_date_null": "string",
-        "dynamodb_newimage_salesforcedata_m_collateral_country_null": "string",
-        "dynamodb_newimage_salesforcedata_m_fixed_profit_rate_null": "string",
-        "dynamodb_newimage_salesforcedata_m_description_of_collateral_null": "string",
-        "dynamodb_newimage_salesforcedata_m_total_fee_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_0_m_completed_date_null": "string",
-        "dynamodb_newimage_salesforcedata_m_application_fee_null": "string",
-        "dynamodb_newimage_salesforcedata_m_legal_fee_null": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_3_m_post_valuation_credit_decision_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_4_m_valuation_comments_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_4_m_after_valuation_esis_s": "string",
-        "dynamodb_newimage_salesforcedata_m_epc_rating_s": "string",
-        "dynamodb_newimage_notes_s": "string",
-        "dynamodb_newimage_salesforcedata_m_stages_l_5_m_final_facility_offer_sent_to_customer_dt_s": "string",
-        "dynamodb_new_image_customer_m_brand_id_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_14_m_completed_date_s": "date",
-        "dynamodb_new_image_salesforce_data_m_stages_l_5_m_offer_condition_4_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_5_m_draft_facility_offer_sent_to_customer_dt_s": "string",
-        "dynamodb_new_image_customer_m_income_m_other_currency_income_l": "string",
-        "dynamodb_new_image_financing_m_other_finance_provider_s": "string",
-        "dynamodb_new_image_financing_m_extra_expense_s": "string",
-        "dynamodb_new_image_financing_m_term_start_preference_s": "string",
-        "dynamodb_new_image_financing_m_remaining_financing_m_value_s": "string",
-        "dynamodb_new_image_financing_m_remaining_financing_m_currency_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_credits_l_3_m_type_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_credits_l_3_m_repayment_m_value_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_credits_l_3_m_repayment_m_currency_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_credits_l_3_m_outstanding_balance_m_value_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_credits_l_3_m_outstanding_balance_m_currency_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_credits_l_4_m_type_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_credits_l_4_m_repayment_m_value_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_credits_l_4_m_repayment_m_currency_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_credits_l_4_m_outstanding_balance_m_value_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_credits_l_4_m_outstanding_balance_m_currency_s": "string",
-        "dynamodb_new_image_property_m_owned_period_s": "string",
-        "dynamodb_new_image_salesforce_data_m_customer_mis_match_c_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_5_m_stage_status_null": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_credits_l_5_m_type_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_credits_l_5_m_repayment_m_value_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_credits_l_5_m_repayment_m_currency_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_credits_l_5_m_outstanding_balance_m_value_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_credits_l_5_m_outstanding_balance_m_currency_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_12_m_seller_offer_and_acceptance_documents_null": "string",
-        "dynamodb_new_image_salesforce_data_m_customer_mis_match_c_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_9_m_comments_s": "string",
-        "dynamodb_new_image_salesforce_data_m_reference_id_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_5_m_offer_condition_5_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_13_m_final_payment_null": "string",
-        "dynamodb_new_image_financing_m_extra_expense_other_description_s": "string",
-        "dynamodb_new_image_customer_m_income_m_other_currency_income_l_1_m_income_m_value_s": "string",
-        "dynamodb_new_image_customer_m_income_m_other_currency_income_l_1_m_income_m_currency_s": "string",
-        "dynamodb_new_image_customer_m_income_m_other_currency_income_l_1_m_source_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_3_m_stage_status_null": "string",
-        "dynamodb_new_image_fee_paid_at_n": "bigint",
-        "dynamodb_new_image_fee_n": "bigint",
-        "dynamodb_new_image_customer_m_outgoing_m_other_currency_expenses_l_1_m_source_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_credits_l_6_m_type_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_credits_l_6_m_repayment_m_value_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_credits_l_6_m_repayment_m_currency_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_credits_l_6_m_outstanding_balance_m_value_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_credits_l_6_m_outstanding_balance_m_currency_s": "string",
-        "dynamodb_new_image_financing_m_extra_expenses_m_transfer_funds_out_bool": "boolean",
-        "dynamodb_new_image_financing_m_extra_expenses_m_legal_fees_cover_bool": "boolean",
-        "dynamodb_new_image_financing_m_extra_expenses_m_other_bool": "boolean",
-        "dynamodb_new_image_financing_m_extra_expenses_m_business_investment_bool": "boolean",
-        "dynamodb_new_image_financing_m_extra_expenses_m_other_property_purchase_bool": "boolean",
-        "dynamodb_new_image_financing_m_extra_expenses_m_debts_pay_off_bool": "boolean",
-        "dynamodb_new_image_financing_m_extra_expenses_m_home_improvements_bool": "boolean",
-        "dynamodb_new_image_customer_m_outgoing_m_credits_l_7_m_type_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_credits_l_7_m_repayment_m_value_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_credits_l_7_m_repayment_m_currency_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_credits_l_7_m_outstanding_balance_m_value_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_credits_l_7_m_outstanding_balance_m_currency_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_credits_l_8_m_type_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_credits_l_8_m_repayment_m_value_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_credits_l_8_m_repayment_m_currency_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_credits_l_8_m_outstanding_balance_m_value_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_credits_l_8_m_outstanding_balance_m_currency_s": "string",
-        "dynamodb_new_image_property_m_inside_london_bool": "boolean",
-        "dynamodb_new_image_salesforce_data_m_stages_l_4_m_stage_status_null": "string",
-        "dynamodb_new_image_salesforce_arrears_case_id_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_3_m_exception_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_3_m_exception_reason_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_3_m_moodys_mpa_score_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_4_m_surface_water_flood_risk_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_4_m_potential_epc_rating_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_4_m_current_epc_rating_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_4_m_flood_risk_from_rivers_and_sea_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_4_m_epc_expiry_date_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_4_m_physical_risk_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_4_m_transition_risk_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_8_m_is_this_a_title_insured_case__null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_4_m_surface_water_flood_risk_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_4_m_potential_epc_rating_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_4_m_current_epc_rating_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_4_m_flood_risk_from_rivers_and_sea_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_4_m_epc_expiry_date_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_4_m_physical_risk_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_4_m_transition_risk_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_3_m_exception_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_8_m_is_this_a_title_insured_case__s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_3_m_exception_reason_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_8_m_is_this_a_title_insured_case_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_8_m_is_this_a_title_insured_case_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_8_m_is_this_a_title_insured_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_8_m_is_this_a_title_insured_s": "string",
-        "dynamodb_new_image_user_m_first_name_s": "string",
-        "dynamodb_new_image_user_m_last_name_s": "string",
-        "dynamodb_new_image_user_m_phone_number_s": "string",
-        "dynamodb_new_image_user_m_address_m_line2_s": "string",
-        "dynamodb_new_image_user_m_address_m_city_s": "string",
-        "dynamodb_new_image_user_m_address_m_line1_s": "string",
-        "dynamodb_new_image_user_m_address_m_country_code_s": "string",
-        "dynamodb_new_image_user_m_address_m_postal_code_s": "string",
-        "dynamodb_new_image_user_m_dob_s": "string",
-        "dynamodb_new_image_user_m_type_s": "string",
-        "dynamodb_new_image_user_m_email_s": "string",
-        "dynamodb_new_image_user_m_status_s": "string",
-        "dynamodb_new_image_employment_details_m_type_s": "string",
-        "dynamodb_new_image_employment_details_m_gross_salary_s": "string",
-        "dynamodb_new_image_employment_details_m_annual_bonus_s": "string",
-        "dynamodb_new_image_employment_details_m_rental_income_s": "string",
-        "dynamodb_new_image_financing_m_estimated_monthly_rental_income_s": "string",
-        "dynamodb_new_image_financing_m_deposit_s": "string",
-        "dynamodb_new_image_financing_m_value_s": "string",
-        "dynamodb_new_image_committed_expenditure_m_monthly_m_credit_commitments_s": "string",
-        "dynamodb_new_image_committed_expenditure_m_monthly_m_financial_commitments_s": "string",
-        "dynamodb_new_image_household_expenditure_m_monthly_m_essential_expenditure_s": "string",
-        "dynamodb_new_image_household_expenditure_m_monthly_m_living_costs_s": "string",
-        "dynamodb_new_image_outcome_m_expiry_date_s": "string",
-        "dynamodb_new_image_outcome_m_date_issued_s": "string",
-        "dynamodb_new_image_outcome_m_maximum_finance_amount_s": "string",
-        "dynamodb_new_image_outcome_m_meets_eligibility_bool": "boolean",
-        "dynamodb_new_image_outcome_m_term_rates_l_0_m_initial_profit_rate_s": "string",
-        "dynamodb_new_image_outcome_m_term_rates_l_0_m_monthly_payments_s": "string",
-        "dynamodb_new_image_outcome_m_term_rates_l_0_m_product_s": "string",
-        "dynamodb_new_image_outcome_m_term_rates_l_1_m_initial_profit_rate_s": "string",
-        "dynamodb_new_image_outcome_m_term_rates_l_1_m_monthly_payments_s": "string",
-        "dynamodb_new_image_outcome_m_term_rates_l_1_m_product_s": "string",
-        "dynamodb_new_image_outcome_m_ftv_s": "string",
-        "dynamodb_new_image_outcome_m_property_budget_s": "string",
-        "dynamodb_new_image_document_id_s": "string",
-        "dynamodb_new_image_employment_details_m_other_income_s": "string",
-        "dynamodb_new_image_employment_details_m_length_of_service_m_years_n": "bigint",
-        "dynamodb_new_image_employment_details_m_length_of_service_m_months_n": "bigint",
-        "dynamodb_new_image_commodity_trade_m_broker_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_3_m_moodys_mpa_score_s": "string",
-        "dynamodb_new_image_customer_m_onboarding_data_m_nationality_country_code_s": "string",
-        "dynamodb_new_image_customer_m_onboarding_data_m_country_of_residence_code_s": "string",
-        "dynamodb_new_image_customer_m_country_specific_address_data_m_area_s": "string",
-        "dynamodb_new_image_customer_m_country_specific_address_data_m_building_apartment_number_s": "string",
-        "dynamodb_new_image_customer_m_country_specific_address_data_m_zip_code_s": "string",
-        "dynamodb_new_image_customer_m_country_specific_address_data_m_emirate_s": "string",
-        "dynamodb_new_image_customer_m_country_specific_address_data_m_extended_co_unit_number_s": "string",
-        "dynamodb_new_image_customer_m_country_specific_address_data_m_street_s": "string",
-        "dynamodb_new_image_customer_m_country_specific_address_data_m_district_s": "string",
-        "dynamodb_new_image_customer_m_country_specific_address_data_m_extended_code_s": "string",
-        "dynamodb_new_image_customer_m_country_specific_address_data_m_neighborhood_s": "string",
-        "dynamodb_new_image_customer_m_onboarding_data_m_pep_positions_l_0_m_pep_position_s": "string",
-        "dynamodb_new_image_customer_m_onboarding_data_m_is_us_person_bool": "boolean",
-        "dynamodb_new_image_customer_m_onboarding_data_m_tax_ids_l_0_m_value_s": "string",
-        "dynamodb_new_image_customer_m_onboarding_data_m_tax_ids_l_0_m_country_code_s": "string",
-        "dynamodb_new_image_customer_m_onboarding_data_m_customer_occupations_l_0_s": "string",
-        "dynamodb_new_image_customer_m_onboarding_data_m_source_of_funds_assets_l": "string",
-        "dynamodb_new_image_customer_m_onboarding_data_m_source_of_transfers_assets_m": "string",
-        "dynamodb_new_image_customer_m_onboarding_data_m_source_of_wealth_assets_m_items_l_0_m_total_value_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_onboarding_data_m_source_of_wealth_assets_m_items_l_0_m_total_value_m_from_n": "bigint",
-        "dynamodb_new_image_customer_m_onboarding_data_m_source_of_wealth_assets_m_items_l_0_m_total_value_m_to_n": "bigint",
-        "dynamodb_new_image_customer_m_onboarding_data_m_source_of_wealth_assets_m_items_l_0_m_type_s": "string",
-        "dynamodb_new_image_customer_m_onboarding_data_m_source_of_wealth_assets_m_items_l_0_m_country_code_s": "string",
-        "dynamodb_new_image_customer_m_onboarding_data_m_source_of_wealth_assets_m_total_estimated_net_worth_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_onboarding_data_m_source_of_wealth_assets_m_total_estimated_net_worth_m_from_n": "bigint",
-        "dynamodb_new_image_customer_m_onboarding_data_m_source_of_wealth_assets_m_total_estimated_net_worth_m_to_n": "bigint",
-        "dynamodb_new_image_customer_m_onboarding_data_m_expected_activity_m_use_reasons_l_0_s": "string",
-        "dynamodb_new_image_customer_m_onboarding_data_m_expected_activity_m_use_reasons_l_1_s": "string",
-        "dynamodb_new_image_customer_m_onboarding_data_m_expected_activity_m_use_reasons_l_2_s": "string",
-        "dynamodb_new_image_customer_m_onboarding_data_m_expected_activity_m_use_reasons_l_3_s": "string",
-        "dynamodb_new_image_customer_m_onboarding_data_m_expected_activity_m_use_reasons_l_4_s": "string",
-        "dynamodb_new_image_customer_m_onboarding_data_m_expected_activity_m_transactions_inbound_m_amount_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_onboarding_data_m_expected_activity_m_transactions_inbound_m_amount_m_from_n": "bigint",
-        "dynamodb_new_image_customer_m_onboarding_data_m_expected_activity_m_transactions_inbound_m_amount_m_to_n": "bigint",
-        "dynamodb_new_image_customer_m_onboarding_data_m_expected_activity_m_transactions_inbound_m_frequency_s": "string",
-        "dynamodb_new_image_customer_m_onboarding_data_m_expected_activity_m_transactions_outbound_m_amount_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_onboarding_data_m_expected_activity_m_transactions_outbound_m_amount_m_from_n": "bigint",
-        "dynamodb_new_image_customer_m_onboarding_data_m_expected_activity_m_transactions_outbound_m_amount_m_to_n": "bigint",
-        "dynamodb_new_image_customer_m_onboarding_data_m_expected_activity_m_transactions_outbound_m_frequency_s": "string",
-        "dynamodb_new_image_customer_m_onboarding_data_m_countries_of_personal_links_l_0_s": "string",
-        "dynamodb_new_image_customer_m_onboarding_data_m_countries_of_personal_links_l_1_s": "string",
-        "dynamodb_new_image_customer_m_onboarding_data_m_source_of_funds_assets_l_0_m_type_s": "string",
-        "dynamodb_new_image_customer_m_onboarding_data_m_source_of_funds_assets_l_0_m_country_code_s": "string",
-        "dynamodb_new_image_customer_m_onboarding_data_m_source_of_funds_assets_l_1_m_type_s": "string",
-        "dynamodb_new_image_customer_m_onboarding_data_m_source_of_funds_assets_l_1_m_country_code_s": "string",
-        "dynamodb_new_image_customer_m_onboarding_data_m_countries_of_personal_links_l_2_s": "string",
-        "dynamodb_new_image_customer_m_onboarding_data_m_tax_ids_l_0_m_skip_reason_s": "string",
-        "dynamodb_new_image_customer_m_onboarding_data_m_source_of_wealth_assets_m_items_l_1_m_total_value_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_onboarding_data_m_source_of_wealth_assets_m_items_l_1_m_total_value_m_from_n": "bigint",
-        "dynamodb_new_image_customer_m_onboarding_data_m_source_of_wealth_assets_m_items_l_1_m_total_value_m_to_n": "bigint",
-        "dynamodb_new_image_customer_m_onboarding_data_m_source_of_wealth_assets_m_items_l_1_m_type_s": "string",
-        "dynamodb_new_image_customer_m_onboarding_data_m_source_of_wealth_assets_m_items_l_1_m_country_code_s": "string",
-        "dynamodb_new_image_customer_m_onboarding_data_m_source_of_wealth_assets_m_items_l_2_m_total_value_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_onboarding_data_m_source_of_wealth_assets_m_items_l_2_m_total_value_m_from_n": "bigint",
-        "dynamodb_new_image_customer_m_onboarding_data_m_source_of_wealth_assets_m_items_l_2_m_total_value_m_to_n": "bigint",
-        "dynamodb_new_image_customer_m_onboarding_data_m_source_of_wealth_assets_m_items_l_2_m_type_s": "string",
-        "dynamodb_new_image_customer_m_onboarding_data_m_source_of_wealth_assets_m_items_l_2_m_country_code_s": "string",
-        "dynamodb_new_image_customer_m_onboarding_data_m_source_of_wealth_assets_m_items_l_3_m_total_value_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_onboarding_data_m_source_of_wealth_assets_m_items_l_3_m_total_value_m_from_n": "bigint",
-        "dynamodb_new_image_customer_m_onboarding_data_m_source_of_wealth_assets_m_items_l_3_m_total_value_m_to_n": "bigint",
-        "dynamodb_new_image_customer_m_onboarding_data_m_source_of_wealth_assets_m_items_l_3_m_type_s": "string",
-        "dynamodb_new_image_customer_m_onboarding_data_m_source_of_wealth_assets_m_items_l_3_m_country_code_s": "string",
-        "dynamodb_new_image_customer_m_onboarding_data_m_source_of_transfers_assets_m_transfers_from_others_l_0_m_source_type_s": "string",
-        "dynamodb_new_image_customer_m_onboarding_data_m_source_of_transfers_assets_m_transfers_from_others_l_0_m_country_code_s": "string",
-        "dynamodb_new_image_customer_m_onboarding_data_m_source_of_transfers_assets_m_transfers_from_others_l_0_m_source_name_s": "string",
-        "dynamodb_new_image_customer_m_onboarding_data_m_customer_occupations_l_1_s": "string",
-        "dynamodb_new_image_customer_m_onboarding_data_m_tax_ids_l_1_m_value_s": "string",
-        "dynamodb_new_image_customer_m_onboarding_data_m_tax_ids_l_1_m_country_code_s": "string",
-        "dynamodb_new_image_customer_m_onboarding_data_m_source_of_funds_assets_l_2_m_type_s": "string",
-        "dynamodb_new_image_customer_m_onboarding_data_m_source_of_funds_assets_l_2_m_country_code_s": "string",
-        "dynamodb_new_image_customer_m_onboarding_data_m_businesses_l_0_m_name_s": "string",
-        "dynamodb_new_image_customer_m_onboarding_data_m_businesses_l_0_m_countries_l_0_s": "string",
-        "dynamodb_new_image_customer_m_onboarding_data_m_businesses_l_0_m_ownership_m_max_n": "bigint",
-        "dynamodb_new_image_customer_m_onboarding_data_m_businesses_l_0_m_ownership_m_min_n": "bigint",
-        "dynamodb_new_image_customer_m_onboarding_data_m_businesses_l_0_m_turnover_m_currency_code_s": "string",
-        "dynamodb_new_image_customer_m_onboarding_data_m_businesses_l_0_m_turnover_m_from_n": "bigint",
-        "dynamodb_new_image_customer_m_onboarding_data_m_businesses_l_0_m_turnover_m_to_n": "bigint",
-        "dynamodb_new_image_customer_m_onboarding_data_m_businesses_l_0_m_activities_l_0_s": "string",
-        "dynamodb_new_image_customer_m_onboarding_data_m_customer_occupations_l": "string",
-        "dynamodb_new_image_customer_m_onboarding_data_m_source_of_funds_assets_l_3_m_type_s": "string",
-        "dynamodb_new_image_customer_m_onboarding_data_m_source_of_funds_assets_l_3_m_country_code_s": "string",
-        "dynamodb_new_image_customer_m_onboarding_data_m_source_of_funds_assets_l_4_m_type_s": "string",
-        "dynamodb_new_image_customer_m_onboarding_data_m_source_of_funds_assets_l_4_m_country_code_s": "string",
-        "dynamodb_new_image_ftv_rag_s": "string",
-        "dynamodb_new_image_customer_m_income_m_has_no_additional_income_bool": "boolean",
-        "dynamodb_new_image_customer_m_employment_rag_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_monthly_non_essential_costs_l": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_monthly_rents_l": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_monthly_essential_costs_l": "string",
-        "dynamodb_new_image_property_m_is_standard_construction_bool": "boolean",
-        "dynamodb_new_image_financing_m_funding_sources_l_0_m_type_s": "string",
-        "dynamodb_new_image_financing_m_funding_sources_l_0_m_amount_m_value_s": "string",
-        "dynamodb_new_image_financing_m_funding_sources_l_0_m_amount_m_currency_s": "string",
-        "dynamodb_new_image_loan_type_s": "string",
-        "dynamodb_new_image_salesforce_data_m_is_the_property_standard_construction_null": "string",
-        "dynamodb_new_image_salesforce_data_m_loan_type_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_5_m_is_this_a_title_insured_null": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_5_m_is_this_a_title_insured_s": "string",
-        "dynamodb_new_image_customer_m_about_m_payments_in_past_m_missed_credit_payment6_months_bool": "boolean",
-        "dynamodb_new_image_customer_m_about_m_payments_in_past_m_iva_bool": "boolean",
-        "dynamodb_new_image_customer_m_about_m_payments_in_past_m_missed_secured_loan12_months_bool": "boolean",
-        "dynamodb_new_image_customer_m_about_m_payments_in_past_m_defaulted12_months_bool": "boolean",
-        "dynamodb_new_image_customer_m_about_m_payments_in_past_m_ccj_bool": "boolean",
-        "dynamodb_new_image_customer_m_about_m_payments_in_past_m_bankruptcy_bool": "boolean",
-        "dynamodb_new_image_customer_m_about_m_payments_in_past_m_debt_relief_order_bool": "boolean",
-        "dynamodb_new_image_customer_m_about_m_payments_in_past_m_repossession_bool": "boolean",
-        "dynamodb_new_image_customer_m_about_m_payments_in_past_m_missed_credit_payment24_months_bool": "boolean",
-        "dynamodb_new_image_customer_m_about_m_dependent_people_age_l_0_m_index_n": "bigint",
-        "dynamodb_new_image_customer_m_about_m_dependent_people_age_l_0_m_age_n": "bigint",
-        "dynamodb_new_image_customer_m_residential_addresses_l_0_m_index_n": "bigint",
-        "dynamodb_new_image_customer_m_residential_addresses_l_0_m_country_specific_address_data_m_area_s": "string",
-        "dynamodb_new_image_customer_m_residential_addresses_l_0_m_country_specific_address_data_m_building_apartment_number_s": "string",
-        "dynamodb_new_image_customer_m_residential_addresses_l_0_m_country_specific_address_data_m_emirate_s": "string",
-        "dynamodb_new_image_customer_m_residential_addresses_l_0_m_country_specific_address_data_m_street_s": "string",
-        "dynamodb_new_image_customer_m_residential_addresses_l_0_m_address_m_line2_s": "string",
-        "dynamodb_new_image_customer_m_residential_addresses_l_0_m_address_m_city_s": "string",
-        "dynamodb_new_image_customer_m_residential_addresses_l_0_m_address_m_line1_s": "string",
-        "dynamodb_new_image_customer_m_residential_addresses_l_0_m_address_m_country_code_s": "string",
-        "dynamodb_new_image_customer_m_residential_addresses_l_0_m_address_m_postal_code_s": "string",
-        "dynamodb_new_image_customer_m_residential_addresses_l_0_m_years_n": "bigint",
-        "dynamodb_new_image_customer_m_income_m_sources_l_0_m_monthly_amount_m_value_s": "string",
-        "dynamodb_new_image_customer_m_income_m_sources_l_0_m_monthly_amount_m_currency_s": "string",
-        "dynamodb_new_image_customer_m_income_m_sources_l_0_m_source_type_s": "string",
-        "dynamodb_new_image_customer_m_income_m_commissions_m_year1_m_value_s": "string",
-        "dynamodb_new_image_customer_m_income_m_commissions_m_year1_m_currency_s": "string",
-        "dynamodb_new_image_customer_m_income_m_commissions_m_year2_m_value_s": "string",
-        "dynamodb_new_image_customer_m_income_m_commissions_m_year2_m_currency_s": "string",
-        "dynamodb_new_image_customer_m_income_m_commissions_m_year3_m_value_s": "string",
-        "dynamodb_new_image_customer_m_income_m_commissions_m_year3_m_currency_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_other_currency_expenses_l": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_monthly_non_essential_costs_l_0_m_type_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_monthly_non_essential_costs_l_0_m_monthly_amount_m_value_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_monthly_non_essential_costs_l_0_m_monthly_amount_m_currency_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_monthly_rents_l_0_m_value_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_monthly_rents_l_0_m_currency_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_monthly_essential_costs_l_0_m_type_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_monthly_essential_costs_l_0_m_monthly_amount_m_value_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_monthly_essential_costs_l_0_m_monthly_amount_m_currency_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_credits_l_0_m_finance_provider_s": "string",
-        "dynamodb_new_image_salesforce_data_m_is_the_property_standard_construction_s": "string",
-        "dynamodb_new_image_customer_m_income_m_sources_l_0_m_property_m_monthly_repayment_m_value_s": "string",
-        "dynamodb_new_image_customer_m_income_m_sources_l_0_m_property_m_monthly_repayment_m_currency_s": "string",
-        "dynamodb_new_image_customer_m_income_m_sources_l_0_m_property_m_outstanding_m_value_s": "string",
-        "dynamodb_new_image_customer_m_income_m_sources_l_0_m_property_m_outstanding_m_currency_s": "string",
-        "dynamodb_new_image_customer_m_income_m_sources_l_0_m_property_m_country_code_s": "string",
-        "dynamodb_new_image_customer_m_income_m_sources_l_0_m_property_m_owning_term_n": "bigint",
-        "dynamodb_new_image_customer_m_income_m_bonus_m_year1_m_value_s": "string",
-        "dynamodb_new_image_customer_m_income_m_bonus_m_year1_m_currency_s": "string",
-        "dynamodb_new_image_customer_m_income_m_bonus_m_year2_m_value_s": "string",
-        "dynamodb_new_image_customer_m_income_m_bonus_m_year2_m_currency_s": "string",
-        "dynamodb_new_image_customer_m_income_m_bonus_m_year3_m_value_s": "string",
-        "dynamodb_new_image_customer_m_income_m_bonus_m_year3_m_currency_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_non_credit_m_monthly_m": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_monthly_essential_costs_l_1_m_type_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_monthly_essential_costs_l_1_m_monthly_amount_m_value_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_monthly_essential_costs_l_1_m_monthly_amount_m_currency_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_monthly_essential_costs_l_2_m_type_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_monthly_essential_costs_l_2_m_monthly_amount_m_value_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_monthly_essential_costs_l_2_m_monthly_amount_m_currency_s": "string",
-        "dynamodb_new_image_customer_m_about_m_dependent_people_age_l_1_m_index_n": "bigint",
-        "dynamodb_new_image_customer_m_about_m_dependent_people_age_l_1_m_age_n": "bigint",
-        "dynamodb_new_image_customer_m_income_m_sources_l_0_m_reason_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_monthly_non_essential_costs_l_1_m_type_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_monthly_non_essential_costs_l_1_m_monthly_amount_m_value_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_monthly_non_essential_costs_l_1_m_monthly_amount_m_currency_s": "string",
-        "dynamodb_new_image_salesforce_data_m_loan_type_s": "string",
-        "dynamodb_new_image_customer_m_about_m_dependent_people_age_l_2_m_index_n": "bigint",
-        "dynamodb_new_image_customer_m_about_m_dependent_people_age_l_2_m_age_n": "bigint",
-        "dynamodb_new_image_customer_m_outgoing_m_monthly_essential_costs_l_3_m_type_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_monthly_essential_costs_l_3_m_monthly_amount_m_value_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_monthly_essential_costs_l_3_m_monthly_amount_m_currency_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_monthly_essential_costs_l_4_m_type_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_monthly_essential_costs_l_4_m_monthly_amount_m_value_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_monthly_essential_costs_l_4_m_monthly_amount_m_currency_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_credits_l_1_m_finance_provider_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_credits_l_1_m_remaining_term_m_years_n": "bigint",
-        "dynamodb_new_image_customer_m_outgoing_m_credits_l_1_m_remaining_term_m_months_n": "bigint",
-        "dynamodb_new_image_customer_m_outgoing_m_credits_l_2_m_finance_provider_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_credits_l_0_m_remaining_term_m_years_n": "bigint",
-        "dynamodb_new_image_customer_m_outgoing_m_credits_l_0_m_remaining_term_m_months_n": "bigint",
-        "dynamodb_new_image_customer_m_onboarding_data_m_businesses_l_0_m_is_family_company_bool": "boolean",
-        "dynamodb_new_image_customer_m_outgoing_m_monthly_non_essential_costs_l_0_m_explanation_s": "string",
-        "dynamodb_new_image_customer_m_about_m_dependent_people_age_l_3_m_index_n": "bigint",
-        "dynamodb_new_image_customer_m_about_m_dependent_people_age_l_3_m_age_n": "bigint",
-        "dynamodb_new_image_customer_m_residential_addresses_l_0_m_country_specific_address_data_m_zip_code_s": "string",
-        "dynamodb_new_image_customer_m_residential_addresses_l_0_m_country_specific_address_data_m_district_s": "string",
-        "dynamodb_new_image_customer_m_about_m_dependent_people_age_l": "string",
-        "dynamodb_new_image_customer_m_income_m_sources_l_0_m_property_m_address_m_line2_s": "string",
-        "dynamodb_new_image_customer_m_income_m_sources_l_0_m_property_m_address_m_city_s": "string",
-        "dynamodb_new_image_customer_m_income_m_sources_l_0_m_property_m_address_m_line1_s": "string",
-        "dynamodb_new_image_customer_m_income_m_sources_l_0_m_property_m_address_m_country_code_s": "string",
-        "dynamodb_new_image_customer_m_income_m_sources_l_0_m_property_m_address_m_postal_code_s": "string",
-        "dynamodb_new_image_customer_m_income_m_sources_l_0_m_property_m_lender_type_s": "string",
-        "dynamodb_new_image_customer_m_residential_addresses_l_0_m_country_specific_address_data_m_extended_code_s": "string",
-        "dynamodb_new_image_customer_m_residential_addresses_l_1_m_index_n": "bigint",
-        "dynamodb_new_image_customer_m_residential_addresses_l_1_m_country_specific_address_data_m_building_apartment_number_s": "string",
-        "dynamodb_new_image_customer_m_residential_addresses_l_1_m_country_specific_address_data_m_zip_code_s": "string",
-        "dynamodb_new_image_customer_m_residential_addresses_l_1_m_country_specific_address_data_m_extended_code_s": "string",
-        "dynamodb_new_image_customer_m_residential_addresses_l_1_m_country_specific_address_data_m_street_s": "string",
-        "dynamodb_new_image_customer_m_residential_addresses_l_1_m_country_specific_address_data_m_district_s": "string",
-        "dynamodb_new_image_customer_m_residential_addresses_l_1_m_address_m_line2_s": "string",
-        "dynamodb_new_image_customer_m_residential_addresses_l_1_m_address_m_city_s": "string",
-        "dynamodb_new_image_customer_m_residential_addresses_l_1_m_address_m_line1_s": "string",
-        "dynamodb_new_image_customer_m_residential_addresses_l_1_m_address_m_country_code_s": "string",
-        "dynamodb_new_image_customer_m_residential_addresses_l_1_m_address_m_postal_code_s": "string",
-        "dynamodb_new_image_customer_m_residential_addresses_l_1_m_years_n": "bigint",
-        "dynamodb_new_image_customer_m_about_m_dependent_people_age_l_4_m_index_n": "bigint",
-        "dynamodb_new_image_customer_m_about_m_dependent_people_age_l_4_m_age_n": "bigint",
-        "dynamodb_new_image_customer_m_about_m_dependent_people_age_l_5_m_index_n": "bigint",
-        "dynamodb_new_image_customer_m_about_m_dependent_people_age_l_5_m_age_n": "bigint",
-        "dynamodb_new_image_customer_m_about_m_dependent_people_age_l_6_m_index_n": "bigint",
-        "dynamodb_new_image_customer_m_about_m_dependent_people_age_l_6_m_age_n": "bigint",
-        "dynamodb_new_image_customer_m_about_m_dependent_people_age_l_7_m_index_n": "bigint",
-        "dynamodb_new_image_customer_m_about_m_dependent_people_age_l_7_m_age_n": "bigint",
-        "dynamodb_new_image_financing_m_funding_sources_l_1_m_type_s": "string",
-        "dynamodb_new_image_financing_m_funding_sources_l_1_m_amount_m_value_s": "string",
-        "dynamodb_new_image_financing_m_funding_sources_l_1_m_amount_m_currency_s": "string",
-        "dynamodb_new_image_customer_m_residential_addresses_l_0_m_country_specific_address_data_m_neighborhood_s": "string",
-        "dynamodb_new_image_salesforce_data_m_offer_expiry_null": "string",
-        "dynamodb_new_image_salesforce_data_m_credit_expiry_null": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_non_credit_m": "string",
-        "dynamodb_new_image_customer_m_onboarding_data_m_businesses_l": "string",
-        "dynamodb_new_image_salesforce_data_m_credit_expiry_s": "string",
-        "dynamodb_new_image_salesforce_data_m_offer_expiry_s": "string",
-        "dynamodb_new_image_customer_m_income_m_sources_l_1_m_monthly_amount_m_value_s": "string",
-        "dynamodb_new_image_customer_m_income_m_sources_l_1_m_monthly_amount_m_currency_s": "string",
-        "dynamodb_new_image_customer_m_income_m_sources_l_1_m_property_m_monthly_repayment_m_value_s": "string",
-        "dynamodb_new_image_customer_m_income_m_sources_l_1_m_property_m_monthly_repayment_m_currency_s": "string",
-        "dynamodb_new_image_customer_m_income_m_sources_l_1_m_property_m_outstanding_m_value_s": "string",
-        "dynamodb_new_image_customer_m_income_m_sources_l_1_m_property_m_outstanding_m_currency_s": "string",
-        "dynamodb_new_image_customer_m_income_m_sources_l_1_m_property_m_country_code_s": "string",
-        "dynamodb_new_image_customer_m_income_m_sources_l_1_m_property_m_owning_term_n": "bigint",
-        "dynamodb_new_image_customer_m_income_m_sources_l_1_m_source_type_s": "string",
-        "dynamodb_new_image_customer_m_residential_addresses_l_0_m_country_specific_address_data_m": "string",
-        "dynamodb_new_image_customer_m_country_specific_address_data_m": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_monthly_non_essential_costs_l_2_m_type_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_monthly_non_essential_costs_l_2_m_monthly_amount_m_value_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_monthly_non_essential_costs_l_2_m_monthly_amount_m_currency_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_monthly_non_essential_costs_l_3_m_type_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_monthly_non_essential_costs_l_3_m_monthly_amount_m_value_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_monthly_non_essential_costs_l_3_m_monthly_amount_m_currency_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_monthly_non_essential_costs_l_1_m_explanation_s": "string",
-        "dynamodb_new_image_customer_m_residential_addresses_l_1_m_country_specific_address_data_m_area_s": "string",
-        "dynamodb_new_image_customer_m_residential_addresses_l_1_m_country_specific_address_data_m_emirate_s": "string",
-        "dynamodb_new_image_customer_m_outgoing_m_monthly_non_essential_costs_l_2_m_explanation_s": "string",
-        "dynamodb_new_image_customer_m_income_m_sources_l_1_m_property_m_address_m_city_s": "string",
-        "dynamodb_new_image_customer_m_income_m_sources_l_1_m_property_m_address_m_line2_s": "string",
-        "dynamodb_new_image_customer_m_income_m_sources_l_1_m_property_m_address_m_country_code_s": "string",
-        "dynamodb_new_image_customer_m_income_m_sources_l_1_m_property_m_address_m_line1_s": "string",
-        "dynamodb_new_image_customer_m_income_m_sources_l_1_m_property_m_address_m_postal_code_s": "string",
-        "dynamodb_new_image_customer_m_income_m_sources_l_1_m_property_m_lender_type_s": "string",
-        "dynamodb_new_image_customer_m_income_m_sources_l_1_m_property_m_lender_name_s": "string",
-        "dynamodb_new_image_customer_m_income_m_sources_l_2_m_property_m_outstanding_m_value_s": "string",
-        "dynamodb_new_image_customer_m_income_m_sources_l_2_m_property_m_outstanding_m_currency_s": "string",
-        "dynamodb_new_image_customer_m_income_m_sources_l_2_m_property_m_monthly_repayment_m_value_s": "string",
-        "dynamodb_new_image_customer_m_income_m_sources_l_2_m_property_m_monthly_repayment_m_currency_s": "string",
-        "dynamodb_new_image_customer_m_income_m_sources_l_2_m_property_m_address_m_city_s": "string",
-        "dynamodb_new_image_customer_m_income_m_sources_l_2_m_property_m_address_m_line2_s": "string",
-        "dynamodb_new_image_customer_m_income_m_sources_l_2_m_property_m_address_m_country_code_s": "string",
-        "dynamodb_new_image_customer_m_income_m_sources_l_2_m_property_m_address_m_line1_s": "string",
-        "dynamodb_new_image_customer_m_income_m_sources_l_2_m_property_m_address_m_postal_code_s": "string",
-        "dynamodb_new_image_customer_m_income_m_sources_l_2_m_property_m_lender_type_s": "string",
-        "dynamodb_new_image_customer_m_income_m_sources_l_2_m_property_m_country_code_s": "string",
-        "dynamodb_new_image_customer_m_income_m_sources_l_2_m_property_m_owning_term_n": "bigint",
-        "dynamodb_new_image_customer_m_income_m_sources_l_2_m_property_m_lender_name_s": "string",
-        "dynamodb_new_image_customer_m_income_m_sources_l_2_m_monthly_amount_m_value_s": "string",
-        "dynamodb_new_image_customer_m_income_m_sources_l_2_m_monthly_amount_m_currency_s": "string",
-        "dynamodb_new_image_customer_m_income_m_sources_l_2_m_source_type_s": "string",
-        "dynamodb_new_image_salesforce_data_m_stages_l_13_m_comments_s": "string",
-        "date": "string",
-    },
-    "dynamo_card_fast_messages_default": {
-        "aws_region": "string",
-        "dynamodb_approximate_creation_date_time": "string",
-        "dynamodb_keys_id_s": "string",
-        "dynamodb_new_image_created_at_n": "timestamp",
-        "dynamodb_new_image_id_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de10_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de11_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de12_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de13_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de14_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de15_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de16_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de18_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de22_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de23_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de2_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de32_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de33_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de35_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de37_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de38_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de39_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de3_1_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de3_2_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de3_3_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de41_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de42_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de43_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de48_m_1_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de48_m_61_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de49_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de4_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de51_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de55_m_82_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de55_m_95_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de55_m_9_f10_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de55_m_9_f27_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de55_m_9_f33_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de55_m_9_f34_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de55_m_9_f36_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de61_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de63_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de6_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de7_s": "string",
-        "dynamodb_new_image_message_m_message_type_m_message_desc_s": "string",
-        "dynamodb_new_image_message_m_message_type_m_message_type_s": "string",
-        "dynamodb_new_image_message_m_processor_validations_m_3_ds_check_s": "string",
-        "dynamodb_new_image_message_m_processor_validations_m_arqc_check_s": "string",
-        "dynamodb_new_image_message_m_processor_validations_m_cvv_check_s": "string",
-        "dynamodb_new_image_message_m_processor_validations_m_cvv_type_s": "string",
-        "dynamodb_new_image_message_m_processor_validations_m_expiry_check_s": "string",
-        "dynamodb_new_image_message_m_processor_validations_m_pan_check_s": "string",
-        "dynamodb_new_image_message_m_processor_validations_m_pin_check_s": "string",
-        "dynamodb_new_image_message_m_processor_validations_m_rules_checked_s": "string",
-        "dynamodb_new_image_message_m_processor_validations_m_rules_decision_s": "string",
-        "dynamodb_new_image_message_m_processor_validations_m_rules_triggered_s": "string",
-        "dynamodb_new_image_message_m_processor_validations_m_test_matrix_s": "string",
-        "dynamodb_new_image_message_m_processor_validations_m_test_results_s": "string",
-        "dynamodb_new_image_message_m_processor_validations_m_track_check_s": "string",
-        "dynamodb_new_image_message_m_rules_l_0_m_aggregate_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_0_m_count_deviation_n": "int",
-        "dynamodb_new_image_message_m_rules_l_0_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_0_m_pattern_result_bool": "boolean",
-        "dynamodb_new_image_message_m_rules_l_0_m_rule_check_result_n": "int",
-        "dynamodb_new_image_message_m_rules_l_0_m_rule_id_n": "int",
-        "dynamodb_new_image_message_m_rules_l_0_m_rule_type_s": "string",
-        "dynamodb_new_image_message_m_rules_l_10_m_aggregate_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_10_m_count_deviation_n": "int",
-        "dynamodb_new_image_message_m_rules_l_10_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_10_m_pattern_result_bool": "boolean",
-        "dynamodb_new_image_message_m_rules_l_10_m_rule_check_result_n": "int",
-        "dynamodb_new_image_message_m_rules_l_10_m_rule_id_n": "int",
-        "dynamodb_new_image_message_m_rules_l_10_m_rule_type_s": "string",
-        "dynamodb_new_image_message_m_rules_l_11_m_aggregate_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_11_m_count_deviation_n": "int",
-        "dynamodb_new_image_message_m_rules_l_11_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_11_m_pattern_result_bool": "boolean",
-        "dynamodb_new_image_message_m_rules_l_11_m_rule_check_result_n": "int",
-        "dynamodb_new_image_message_m_rules_l_11_m_rule_id_n": "int",
-        "dynamodb_new_image_message_m_rules_l_11_m_rule_type_s": "string",
-        "dynamodb_new_image_message_m_rules_l_12_m_aggregate_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_12_m_count_deviation_n": "int",
-        "dynamodb_new_image_message_m_rules_l_12_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_12_m_pattern_result_bool": "boolean",
-        "dynamodb_new_image_message_m_rules_l_12_m_rule_check_result_n": "int",
-        "dynamodb_new_image_message_m_rules_l_12_m_rule_id_n": "int",
-        "dynamodb_new_image_message_m_rules_l_12_m_rule_type_s": "string",
-        "dynamodb_new_image_message_m_rules_l_13_m_aggregate_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_13_m_count_deviation_n": "int",
-        "dynamodb_new_image_message_m_rules_l_13_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_13_m_pattern_result_bool": "boolean",
-        "dynamodb_new_image_message_m_rules_l_13_m_rule_check_result_n": "int",
-        "dynamodb_new_image_message_m_rules_l_13_m_rule_id_n": "int",
-        "dynamodb_new_image_message_m_rules_l_13_m_rule_type_s": "string",
-        "dynamodb_new_image_message_m_rules_l_14_m_aggregate_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_14_m_count_deviation_n": "int",
-        "dynamodb_new_image_message_m_rules_l_14_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_14_m_pattern_result_bool": "boolean",
-        "dynamodb_new_image_message_m_rules_l_14_m_rule_check_result_n": "int",
-        "dynamodb_new_image_message_m_rules_l_14_m_rule_id_n": "int",
-        "dynamodb_new_image_message_m_rules_l_14_m_rule_type_s": "string",
-        "dynamodb_new_image_message_m_rules_l_15_m_aggregate_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_15_m_count_deviation_n": "int",
-        "dynamodb_new_image_message_m_rules_l_15_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_15_m_pattern_result_bool": "boolean",
-        "dynamodb_new_image_message_m_rules_l_15_m_rule_check_result_n": "int",
-        "dynamodb_new_image_message_m_rules_l_15_m_rule_id_n": "int",
-        "dynamodb_new_image_message_m_rules_l_15_m_rule_type_s": "string",
-        "dynamodb_new_image_message_m_rules_l_16_m_aggregate_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_16_m_count_deviation_n": "int",
-        "dynamodb_new_image_message_m_rules_l_16_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_16_m_pattern_result_bool": "boolean",
-        "dynamodb_new_image_message_m_rules_l_16_m_rule_check_result_n": "int",
-        "dynamodb_new_image_message_m_rules_l_16_m_rule_id_n": "int",
-        "dynamodb_new_image_message_m_rules_l_16_m_rule_type_s": "string",
-        "dynamodb_new_image_message_m_rules_l_17_m_aggregate_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_17_m_count_deviation_n": "int",
-        "dynamodb_new_image_message_m_rules_l_17_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_17_m_pattern_result_bool": "boolean",
-        "dynamodb_new_image_message_m_rules_l_17_m_rule_check_result_n": "int",
-        "dynamodb_new_image_message_m_rules_l_17_m_rule_id_n": "int",
-        "dynamodb_new_image_message_m_rules_l_17_m_rule_type_s": "string",
-        "dynamodb_new_image_message_m_rules_l_18_m_aggregate_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_18_m_count_deviation_n": "int",
-        "dynamodb_new_image_message_m_rules_l_18_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_18_m_pattern_result_bool": "boolean",
-        "dynamodb_new_image_message_m_rules_l_18_m_rule_check_result_n": "int",
-        "dynamodb_new_image_message_m_rules_l_18_m_rule_id_n": "int",
-        "dynamodb_new_image_message_m_rules_l_18_m_rule_type_s": "string",
-        "dynamodb_new_image_message_m_rules_l_19_m_aggregate_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_19_m_count_deviation_n": "int",
-        "dynamodb_new_image_message_m_rules_l_19_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_19_m_pattern_result_bool": "boolean",
-        "dynamodb_new_image_message_m_rules_l_19_m_rule_check_result_n": "int",
-        "dynamodb_new_image_message_m_rules_l_19_m_rule_id_n": "int",
-        "dynamodb_new_image_message_m_rules_l_19_m_rule_type_s": "string",
-        "dynamodb_new_image_message_m_rules_l_1_m_aggregate_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_1_m_count_deviation_n": "int",
-        "dynamodb_new_image_message_m_rules_l_1_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_1_m_pattern_result_bool": "boolean",
-        "dynamodb_new_image_message_m_rules_l_1_m_rule_check_result_n": "int",
-        "dynamodb_new_image_message_m_rules_l_1_m_rule_id_n": "int",
-        "dynamodb_new_image_message_m_rules_l_1_m_rule_type_s": "string",
-        "dynamodb_new_image_message_m_rules_l_20_m_aggregate_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_20_m_count_deviation_n": "int",
-        "dynamodb_new_image_message_m_rules_l_20_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_20_m_pattern_result_bool": "boolean",
-        "dynamodb_new_image_message_m_rules_l_20_m_rule_check_result_n": "int",
-        "dynamodb_new_image_message_m_rules_l_20_m_rule_id_n": "int",
-        "dynamodb_new_image_message_m_rules_l_20_m_rule_type_s": "string",
-        "dynamodb_new_image_message_m_rules_l_21_m_aggregate_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_21_m_count_deviation_n": "int",
-        "dynamodb_new_image_message_m_rules_l_21_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_21_m_pattern_result_bool": "boolean",
-        "dynamodb_new_image_message_m_rules_l_21_m_rule_check_result_n": "int",
-        "dynamodb_new_image_message_m_rules_l_21_m_rule_id_n": "int",
-        "dynamodb_new_image_message_m_rules_l_21_m_rule_type_s": "string",
-        "dynamodb_new_image_message_m_rules_l_22_m_aggregate_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_22_m_count_deviation_n": "int",
-        "dynamodb_new_image_message_m_rules_l_22_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_22_m_pattern_result_bool": "boolean",
-        "dynamodb_new_image_message_m_rules_l_22_m_rule_check_result_n": "int",
-        "dynamodb_new_image_message_m_rules_l_22_m_rule_id_n": "int",
-        "dynamodb_new_image_message_m_rules_l_22_m_rule_type_s": "string",
-        "dynamodb_new_image_message_m_rules_l_23_m_aggregate_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_23_m_count_deviation_n": "int",
-        "dynamodb_new_image_message_m_rules_l_23_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_23_m_pattern_result_bool": "boolean",
-        "dynamodb_new_image_message_m_rules_l_23_m_rule_check_result_n": "int",
-        "dynamodb_new_image_message_m_rules_l_23_m_rule_id_n": "int",
-        "dynamodb_new_image_message_m_rules_l_23_m_rule_type_s": "string",
-        "dynamodb_new_image_message_m_rules_l_24_m_aggregate_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_24_m_count_deviation_n": "int",
-        "dynamodb_new_image_message_m_rules_l_24_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_24_m_pattern_result_bool": "boolean",
-        "dynamodb_new_image_message_m_rules_l_24_m_rule_check_result_n": "int",
-        "dynamodb_new_image_message_m_rules_l_24_m_rule_id_n": "int",
-        "dynamodb_new_image_message_m_rules_l_24_m_rule_type_s": "string",
-        "dynamodb_new_image_message_m_rules_l_25_m_aggregate_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_25_m_count_deviation_n": "int",
-        "dynamodb_new_image_message_m_rules_l_25_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_25_m_pattern_result_bool": "boolean",
-        "dynamodb_new_image_message_m_rules_l_25_m_rule_check_result_n": "int",
-        "dynamodb_new_image_message_m_rules_l_25_m_rule_id_n": "int",
-        "dynamodb_new_image_message_m_rules_l_25_m_rule_type_s": "string",
-        "dynamodb_new_image_message_m_rules_l_26_m_aggregate_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_26_m_count_deviation_n": "int",
-        "dynamodb_new_image_message_m_rules_l_26_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_26_m_pattern_result_bool": "boolean",
-        "dynamodb_new_image_message_m_rules_l_26_m_rule_check_result_n": "int",
-        "dynamodb_new_image_message_m_rules_l_26_m_rule_id_n": "int",
-        "dynamodb_new_image_message_m_rules_l_26_m_rule_type_s": "string",
-        "dynamodb_new_image_message_m_rules_l_27_m_aggregate_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_27_m_count_deviation_n": "int",
-        "dynamodb_new_image_message_m_rules_l_27_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_27_m_pattern_result_bool": "boolean",
-        "dynamodb_new_image_message_m_rules_l_27_m_rule_check_result_n": "int",
-        "dynamodb_new_image_message_m_rules_l_27_m_rule_id_n": "int",
-        "dynamodb_new_image_message_m_rules_l_27_m_rule_type_s": "string",
-        "dynamodb_new_image_message_m_rules_l_2_m_aggregate_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_2_m_count_deviation_n": "int",
-        "dynamodb_new_image_message_m_rules_l_2_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_2_m_pattern_result_bool": "boolean",
-        "dynamodb_new_image_message_m_rules_l_2_m_rule_check_result_n": "int",
-        "dynamodb_new_image_message_m_rules_l_2_m_rule_id_n": "int",
-        "dynamodb_new_image_message_m_rules_l_2_m_rule_type_s": "string",
-        "dynamodb_new_image_message_m_rules_l_3_m_aggregate_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_3_m_count_deviation_n": "int",
-        "dynamodb_new_image_message_m_rules_l_3_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_3_m_pattern_result_bool": "boolean",
-        "dynamodb_new_image_message_m_rules_l_3_m_rule_check_result_n": "int",
-        "dynamodb_new_image_message_m_rules_l_3_m_rule_id_n": "int",
-        "dynamodb_new_image_message_m_rules_l_3_m_rule_type_s": "string",
-        "dynamodb_new_image_message_m_rules_l_4_m_aggregate_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_4_m_count_deviation_n": "int",
-        "dynamodb_new_image_message_m_rules_l_4_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_4_m_pattern_result_bool": "boolean",
-        "dynamodb_new_image_message_m_rules_l_4_m_rule_check_result_n": "int",
-        "dynamodb_new_image_message_m_rules_l_4_m_rule_id_n": "int",
-        "dynamodb_new_image_message_m_rules_l_4_m_rule_type_s": "string",
-        "dynamodb_new_image_message_m_rules_l_5_m_aggregate_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_5_m_count_deviation_n": "int",
-        "dynamodb_new_image_message_m_rules_l_5_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_5_m_pattern_result_bool": "boolean",
-        "dynamodb_new_image_message_m_rules_l_5_m_rule_check_result_n": "int",
-        "dynamodb_new_image_message_m_rules_l_5_m_rule_id_n": "int",
-        "dynamodb_new_image_message_m_rules_l_5_m_rule_type_s": "string",
-        "dynamodb_new_image_message_m_rules_l_6_m_aggregate_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_6_m_count_deviation_n": "int",
-        "dynamodb_new_image_message_m_rules_l_6_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_6_m_pattern_result_bool": "boolean",
-        "dynamodb_new_image_message_m_rules_l_6_m_rule_check_result_n": "int",
-        "dynamodb_new_image_message_m_rules_l_6_m_rule_id_n": "int",
-        "dynamodb_new_image_message_m_rules_l_6_m_rule_type_s": "string",
-        "dynamodb_new_image_message_m_rules_l_7_m_aggregate_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_7_m_count_deviation_n": "int",
-        "dynamodb_new_image_message_m_rules_l_7_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_7_m_pattern_result_bool": "boolean",
-        "dynamodb_new_image_message_m_rules_l_7_m_rule_check_result_n": "int",
-        "dynamodb_new_image_message_m_rules_l_7_m_rule_id_n": "int",
-        "dynamodb_new_image_message_m_rules_l_7_m_rule_type_s": "string",
-        "dynamodb_new_image_message_m_rules_l_8_m_aggregate_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_8_m_count_deviation_n": "int",
-        "dynamodb_new_image_message_m_rules_l_8_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_8_m_pattern_result_bool": "boolean",
-        "dynamodb_new_image_message_m_rules_l_8_m_rule_check_result_n": "int",
-        "dynamodb_new_image_message_m_rules_l_8_m_rule_id_n": "int",
-        "dynamodb_new_image_message_m_rules_l_8_m_rule_type_s": "string",
-        "dynamodb_new_image_message_m_rules_l_9_m_aggregate_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_9_m_count_deviation_n": "int",
-        "dynamodb_new_image_message_m_rules_l_9_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_9_m_pattern_result_bool": "boolean",
-        "dynamodb_new_image_message_m_rules_l_9_m_rule_check_result_n": "int",
-        "dynamodb_new_image_message_m_rules_l_9_m_rule_id_n": "int",
-        "dynamodb_new_image_message_m_rules_l_9_m_rule_type_s": "string",
-        "dynamodb_new_image_message_m_summary_m_account_id_s": "string",
-        "dynamodb_new_image_message_m_summary_m_billing_amount_s": "float",
-        "dynamodb_new_image_message_m_summary_m_billing_currency_s": "string",
-        "dynamodb_new_image_message_m_summary_m_card_use_type_s": "string",
-        "dynamodb_new_image_message_m_summary_m_client_id_s": "string",
-        "dynamodb_new_image_message_m_summary_m_customer_ac_s": "string",
-        "dynamodb_new_image_message_m_summary_m_customer_validation_s": "string",
-        "dynamodb_new_image_message_m_summary_m_merchant_category_s": "string",
-        "dynamodb_new_image_message_m_summary_m_network_s": "string",
-        "dynamodb_new_image_message_m_summary_m_pid_s": "string",
-        "dynamodb_new_image_message_m_summary_m_processor_decision_code_s": "string",
-        "dynamodb_new_image_message_m_summary_m_processor_decision_desc_s": "string",
-        "dynamodb_new_image_message_m_summary_m_processor_reason_code_s": "string",
-        "dynamodb_new_image_message_m_summary_m_rid_s": "string",
-        "dynamodb_new_image_message_m_summary_m_spend_location_s": "string",
-        "dynamodb_new_image_message_m_summary_m_spend_type_s": "string",
-        "dynamodb_new_image_message_m_summary_m_tid_s": "string",
-        "dynamodb_new_image_message_m_summary_m_total_fee_bill_s": "string",
-        "dynamodb_new_image_message_m_summary_m_transaction_amount_s": "float",
-        "dynamodb_new_image_message_m_summary_m_transaction_currency_s": "string",
-        "dynamodb_new_image_message_m_summary_m_transaction_date_time_s": "string",
-        "dynamodb_new_image_token_n": "int",
-        "dynamodb_new_image_updated_at_n": "timestamp",
-        "dynamodb_size_bytes": "string",
-        "event_id": "string",
-        "event_name": "string",
-        "event_source": "string",
-        "record_format": "string",
-        "table_name": "string",
-        "user_identity": "string",
-        "timestamp_extracted": "timestamp",
-        "dynamodb_new_image_message_m_iso_msg_m_de48_m_23_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de26_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de48_m_80_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de48_m_63_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de55_m": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de62_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de90_s": "string",
-        "dynamodb_new_image_message_m_rules_l_21_m_actions_l_0_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_21_m_actions_l_0_m_de39_s": "string",
-        "dynamodb_new_image_message_m_rules_l_21_m_actions_l_1_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_21_m_actions_l_1_m_exit_code_n": "int",
-        "dynamodb_new_image_message_m_rules_l_21_m_actions_l_2_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_21_m_actions_l_2_m_nwk_status_n": "int",
-        "dynamodb_new_image_message_m_iso_msg_m_de48_m_22_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de48_m_32_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de48_m_42_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de48_m_64_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de120_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de48_m_82_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de48_m_92_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de48_m_43_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de48_m_66_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de48_m_21_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de48_m_37_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de20_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de48_m_20_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de60_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de121_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de48_m_71_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de48_m_72_s": "string",
-        "dynamodb_new_image_message_m_rules_l_19_m_actions_l_0_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_19_m_actions_l_0_m_de39_s": "string",
-        "dynamodb_new_image_message_m_rules_l_19_m_actions_l_1_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_19_m_actions_l_1_m_exit_code_n": "int",
-        "dynamodb_new_image_message_m_rules_l_19_m_actions_l_2_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_19_m_actions_l_2_m_nwk_status_n": "int",
-        "dynamodb_new_image_message_m_iso_msg_m_de95_s": "string",
-        "dynamodb_new_image_message_m_rules_l_12_m_actions_l_0_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_12_m_actions_l_0_m_de39_s": "string",
-        "dynamodb_new_image_message_m_rules_l_12_m_actions_l_1_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_12_m_actions_l_1_m_exit_code_n": "int",
-        "dynamodb_new_image_message_m_rules_l_12_m_actions_l_2_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_12_m_actions_l_2_m_nwk_status_n": "int",
-        "dynamodb_new_image_message_m_iso_msg_m_de28_s": "string",
-        "dynamodb_new_image_message_m_rules_l_25_m_actions_l_0_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_25_m_actions_l_0_m_de39_s": "string",
-        "dynamodb_new_image_message_m_rules_l_25_m_actions_l_1_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_25_m_actions_l_1_m_exit_code_n": "int",
-        "dynamodb_new_image_message_m_rules_l_25_m_actions_l_2_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_25_m_actions_l_2_m_nwk_status_n": "int",
-        "dynamodb_new_image_message_m_rules_l_25_m_actions_l_3_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_25_m_actions_l_3_m_alert_id_n": "int",
-        "dynamodb_new_image_message_m_rules_l": "string",
-        "dynamodb_new_image_message_m_rules_l_11_m_actions_l_0_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_11_m_actions_l_0_m_de39_s": "string",
-        "dynamodb_new_image_message_m_rules_l_11_m_actions_l_1_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_11_m_actions_l_1_m_exit_code_n": "int",
-        "dynamodb_new_image_message_m_rules_l_11_m_actions_l_2_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_11_m_actions_l_2_m_nwk_status_n": "int",
-        "dynamodb_new_image_message_m_rules_l_26_m_actions_l_0_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_26_m_actions_l_0_m_de39_s": "string",
-        "dynamodb_new_image_message_m_rules_l_26_m_actions_l_1_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_26_m_actions_l_1_m_exit_code_n": "int",
-        "dynamodb_new_image_message_m_rules_l_26_m_actions_l_2_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_26_m_actions_l_2_m_nwk_status_n": "int",
-        "dynamodb_new_image_message_m_rules_l_26_m_actions_l_3_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_26_m_actions_l_3_m_alert_id_n": "int",
-        "dynamodb_new_image_message_m_iso_msg_m_de48_m_16_s": "string",
-        "source": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de48_m_77_s": "string",
-        "dynamodb_new_image_message_m_rules_l_4_m_actions_l_0_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_4_m_actions_l_0_m_de39_s": "string",
-        "dynamodb_new_image_message_m_rules_l_4_m_actions_l_1_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_4_m_actions_l_1_m_exit_code_n": "int",
-        "dynamodb_new_image_message_m_rules_l_4_m_actions_l_2_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_4_m_actions_l_2_m_nwk_status_n": "int",
-        "dynamodb_new_image_message_m_iso_msg_m_de55_m_91_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de3_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de48_m": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de48_m_26_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de108_s": "string",
-        "dynamodb_new_image_message_m_rules_l_22_m_actions_l_0_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_22_m_actions_l_0_m_de39_s": "string",
-        "dynamodb_new_image_message_m_rules_l_22_m_actions_l_1_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_22_m_actions_l_1_m_exit_code_n": "int",
-        "dynamodb_new_image_message_m_rules_l_22_m_actions_l_2_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_22_m_actions_l_2_m_nwk_status_n": "int",
-        "dynamodb_new_image_message_m_rules_l_18_m_actions_l_0_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_18_m_actions_l_0_m_de39_s": "string",
-        "dynamodb_new_image_message_m_rules_l_18_m_actions_l_1_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_18_m_actions_l_1_m_exit_code_n": "int",
-        "dynamodb_new_image_message_m_rules_l_18_m_actions_l_2_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_18_m_actions_l_2_m_nwk_status_n": "int",
-        "dynamodb_new_image_message_m_iso_msg_m_de45_s": "string",
-        "dynamodb_new_image_message_m_rules_l_23_m_actions_l_0_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_23_m_actions_l_0_m_de39_s": "string",
-        "dynamodb_new_image_message_m_rules_l_23_m_actions_l_1_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_23_m_actions_l_1_m_exit_code_n": "int",
-        "dynamodb_new_image_message_m_rules_l_23_m_actions_l_2_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_23_m_actions_l_2_m_nwk_status_n": "int",
-        "dynamodb_new_image_message_m_rules_l_23_m_actions_l_3_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_23_m_actions_l_3_m_alert_id_n": "int",
-        "dynamodb_new_image_message_m_rules_l_7_m_actions_l_0_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_7_m_actions_l_0_m_de39_s": "string",
-        "dynamodb_new_image_message_m_rules_l_7_m_actions_l_1_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_7_m_actions_l_1_m_exit_code_n": "int",
-        "dynamodb_new_image_message_m_rules_l_7_m_actions_l_2_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_7_m_actions_l_2_m_nwk_status_n": "int",
-        "dynamodb_new_image_message_m_rules_l_24_m_actions_l_0_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_24_m_actions_l_0_m_de39_s": "string",
-        "dynamodb_new_image_message_m_rules_l_24_m_actions_l_1_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_24_m_actions_l_1_m_exit_code_n": "int",
-        "dynamodb_new_image_message_m_rules_l_24_m_actions_l_2_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_24_m_actions_l_2_m_nwk_status_n": "int",
-        "dynamodb_new_image_message_m_iso_msg_m_de48_m_75_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de48_m_83_s": "string",
-        "dynamodb_new_image_message_m_rules_l_20_m_actions_l_0_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_20_m_actions_l_0_m_de39_s": "string",
-        "dynamodb_new_image_message_m_rules_l_20_m_actions_l_1_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_20_m_actions_l_1_m_exit_code_n": "int",
-        "dynamodb_new_image_message_m_rules_l_20_m_actions_l_2_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_20_m_actions_l_2_m_nwk_status_n": "int",
-        "dynamodb_new_image_message_m_rules_l_20_m_actions_l_3_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_20_m_actions_l_3_m_alert_id_n": "int",
-        "dynamodb_new_image_message_m_iso_msg_m_de48_m_15_s": "string",
-        "dynamodb_new_image_message_m_rules_l_8_m_actions_l_0_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_8_m_actions_l_0_m_de39_s": "string",
-        "dynamodb_new_image_message_m_rules_l_8_m_actions_l_1_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_8_m_actions_l_1_m_exit_code_n": "int",
-        "dynamodb_new_image_message_m_rules_l_8_m_actions_l_2_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_8_m_actions_l_2_m_nwk_status_n": "int",
-        "dynamodb_new_image_message_m_iso_msg_m_de48_m_68_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de112_s": "string",
-        "dynamodb_new_image_message_m_rules_l_1_m_actions_l_0_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_1_m_actions_l_0_m_de39_s": "string",
-        "dynamodb_new_image_message_m_rules_l_1_m_actions_l_1_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_1_m_actions_l_1_m_exit_code_n": "int",
-        "dynamodb_new_image_message_m_rules_l_1_m_actions_l_2_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_1_m_actions_l_2_m_nwk_status_n": "int",
-        "dynamodb_new_image_message_m_iso_msg_m_de104_s": "string",
-        "dynamodb_new_image_message_m_rules_l_0_m_actions_l_0_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_0_m_actions_l_0_m_de39_s": "string",
-        "dynamodb_new_image_message_m_rules_l_0_m_actions_l_1_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_0_m_actions_l_1_m_exit_code_n": "int",
-        "dynamodb_new_image_message_m_rules_l_0_m_actions_l_2_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_0_m_actions_l_2_m_nwk_status_n": "int",
-        "dynamodb_new_image_message_m_iso_msg_m_de54_s": "string",
-        "dynamodb_new_image_message_m_rules_l_10_m_actions_l_0_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_10_m_actions_l_0_m_de39_s": "string",
-        "dynamodb_new_image_message_m_rules_l_10_m_actions_l_1_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_10_m_actions_l_1_m_exit_code_n": "int",
-        "dynamodb_new_image_message_m_rules_l_10_m_actions_l_2_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_10_m_actions_l_2_m_nwk_status_n": "int",
-        "dynamodb_new_image_message_m_rules_l_24_m_actions_l_3_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_24_m_actions_l_3_m_alert_id_n": "int",
-        "dynamodb_new_image_message_m_rules_l_17_m_actions_l_0_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_17_m_actions_l_0_m_de39_s": "string",
-        "dynamodb_new_image_message_m_rules_l_17_m_actions_l_1_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_17_m_actions_l_1_m_exit_code_n": "int",
-        "dynamodb_new_image_message_m_rules_l_17_m_actions_l_2_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_17_m_actions_l_2_m_nwk_status_n": "int",
-        "dynamodb_new_image_message_m_rules_l_22_m_actions_l_3_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_22_m_actions_l_3_m_alert_id_n": "int",
-        "dynamodb_new_image_message_m_rules_l_6_m_actions_l_0_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_6_m_actions_l_0_m_de39_s": "string",
-        "dynamodb_new_image_message_m_rules_l_6_m_actions_l_1_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_6_m_actions_l_1_m_exit_code_n": "int",
-        "dynamodb_new_image_message_m_rules_l_6_m_actions_l_2_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_6_m_actions_l_2_m_nwk_status_n": "int",
-        "dynamodb_new_image_message_m_rules_l_3_m_actions_l_0_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_3_m_actions_l_0_m_de39_s": "string",
-        "dynamodb_new_image_message_m_rules_l_3_m_actions_l_1_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_3_m_actions_l_1_m_exit_code_n": "int",
-        "dynamodb_new_image_message_m_rules_l_3_m_actions_l_2_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_3_m_actions_l_2_m_nwk_status_n": "int",
-        "dynamodb_new_image_message_m_rules_l_19_m_actions_l_3_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_19_m_actions_l_3_m_alert_id_n": "int",
-        "dynamodb_new_image_message_m_iso_msg_m_de124_m": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de48_m_33_m_1_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de48_m_33_m_6_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de48_m_33_m_8_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de124_m_10_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de124_m_11_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de124_m_12_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de124_m_13_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de124_m_14_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de124_m_1_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de124_m_2_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de124_m_3_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de124_m_4_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de124_m_5_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de124_m_6_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de124_m_7_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de124_m_8_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de124_m_9_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de48_m_33_m_2_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de48_m_33_m_3_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de56_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de48_m_30_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de48_m_34_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de48_m_33_m_5_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de124_m_15_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de124_m_16_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de48_m_01_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de48_m_02_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de48_m_03_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de48_m_06_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de48_m_08_s": "string",
-        "dynamodb_new_image_message_m_rules_l_27_m_actions_l_0_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_27_m_actions_l_0_m_de39_s": "string",
-        "dynamodb_new_image_message_m_rules_l_27_m_actions_l_1_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_27_m_actions_l_1_m_exit_code_n": "int",
-        "dynamodb_new_image_message_m_rules_l_27_m_actions_l_2_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_27_m_actions_l_2_m_nwk_status_n": "int",
-        "dynamodb_new_image_message_m_iso_msg_m_de48_m_89_s": "string",
-        "dynamodb_new_image_message_m_rules_l_28_m_aggregate_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_28_m_count_deviation_n": "int",
-        "dynamodb_new_image_message_m_rules_l_28_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_28_m_pattern_result_bool": "boolean",
-        "dynamodb_new_image_message_m_rules_l_28_m_rule_check_result_n": "int",
-        "dynamodb_new_image_message_m_rules_l_28_m_rule_id_n": "int",
-        "dynamodb_new_image_message_m_rules_l_28_m_rule_type_s": "string",
-        "dynamodb_new_image_message_m_rules_l_28_m_actions_l_0_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_28_m_actions_l_0_m_de39_s": "string",
-        "dynamodb_new_image_message_m_rules_l_28_m_actions_l_1_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_28_m_actions_l_1_m_exit_code_n": "int",
-        "dynamodb_new_image_message_m_rules_l_28_m_actions_l_2_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_28_m_actions_l_2_m_nwk_status_n": "int",
-        "dynamodb_new_image_message_m_rules_l_29_m_actions_l_0_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_29_m_actions_l_0_m_de39_s": "string",
-        "dynamodb_new_image_message_m_rules_l_29_m_actions_l_1_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_29_m_actions_l_1_m_exit_code_n": "int",
-        "dynamodb_new_image_message_m_rules_l_29_m_actions_l_2_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_29_m_actions_l_2_m_nwk_status_n": "int",
-        "dynamodb_new_image_message_m_rules_l_29_m_aggregate_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_29_m_count_deviation_n": "int",
-        "dynamodb_new_image_message_m_rules_l_29_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_29_m_pattern_result_bool": "boolean",
-        "dynamodb_new_image_message_m_rules_l_29_m_rule_check_result_n": "int",
-        "dynamodb_new_image_message_m_rules_l_29_m_rule_id_n": "int",
-        "dynamodb_new_image_message_m_rules_l_29_m_rule_type_s": "string",
-        "dynamodb_new_image_message_m_rules_l_29_m_actions_l_3_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_29_m_actions_l_3_m_alert_id_n": "int",
-        "dynamodb_new_image_message_m_iso_msg_m_de48_m_79_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de48_m_95_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de48_m_76_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de48_m_18_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de48_m_65_s": "string",
-        "dynamodb_new_image_message_m_rules_l_2_m_actions_l_0_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_2_m_actions_l_0_m_de39_s": "string",
-        "dynamodb_new_image_message_m_rules_l_2_m_actions_l_1_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_2_m_actions_l_1_m_exit_code_n": "int",
-        "dynamodb_new_image_message_m_rules_l_2_m_actions_l_2_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_2_m_actions_l_2_m_nwk_status_n": "int",
-        "dynamodb_new_image_message_m_iso_msg_m_de44_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de48_m_90_s": "string",
-        "dynamodb_new_image_message_m_rules_l_30_m_aggregate_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_30_m_count_deviation_n": "int",
-        "dynamodb_new_image_message_m_rules_l_30_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_30_m_pattern_result_bool": "boolean",
-        "dynamodb_new_image_message_m_rules_l_30_m_rule_check_result_n": "int",
-        "dynamodb_new_image_message_m_rules_l_30_m_rule_id_n": "int",
-        "dynamodb_new_image_message_m_rules_l_30_m_rule_type_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de48_m_87_s": "string",
-        "dynamodb_new_image_message_m_rules_l_31_m_aggregate_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_31_m_count_deviation_n": "int",
-        "dynamodb_new_image_message_m_rules_l_31_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_31_m_pattern_result_bool": "boolean",
-        "dynamodb_new_image_message_m_rules_l_31_m_rule_check_result_n": "int",
-        "dynamodb_new_image_message_m_rules_l_31_m_rule_id_n": "int",
-        "dynamodb_new_image_message_m_rules_l_31_m_rule_type_s": "string",
-        "dynamodb_new_image_message_m_rules_l_32_m_aggregate_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_32_m_count_deviation_n": "int",
-        "dynamodb_new_image_message_m_rules_l_32_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_32_m_pattern_result_bool": "boolean",
-        "dynamodb_new_image_message_m_rules_l_32_m_rule_check_result_n": "int",
-        "dynamodb_new_image_message_m_rules_l_32_m_rule_id_n": "int",
-        "dynamodb_new_image_message_m_rules_l_32_m_rule_type_s": "string",
-        "dynamodb_new_image_message_m_rules_l_33_m_aggregate_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_33_m_count_deviation_n": "int",
-        "dynamodb_new_image_message_m_rules_l_33_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_33_m_pattern_result_bool": "boolean",
-        "dynamodb_new_image_message_m_rules_l_33_m_rule_check_result_n": "int",
-        "dynamodb_new_image_message_m_rules_l_33_m_rule_id_n": "int",
-        "dynamodb_new_image_message_m_rules_l_33_m_rule_type_s": "string",
-        "dynamodb_new_image_message_m_rules_l_34_m_aggregate_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_34_m_count_deviation_n": "int",
-        "dynamodb_new_image_message_m_rules_l_34_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_34_m_pattern_result_bool": "boolean",
-        "dynamodb_new_image_message_m_rules_l_34_m_rule_check_result_n": "int",
-        "dynamodb_new_image_message_m_rules_l_34_m_rule_id_n": "int",
-        "dynamodb_new_image_message_m_rules_l_34_m_rule_type_s": "string",
-        "dynamodb_new_image_message_m_rules_l_35_m_aggregate_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_35_m_count_deviation_n": "int",
-        "dynamodb_new_image_message_m_rules_l_35_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_35_m_pattern_result_bool": "boolean",
-        "dynamodb_new_image_message_m_rules_l_35_m_rule_check_result_n": "int",
-        "dynamodb_new_image_message_m_rules_l_35_m_rule_id_n": "int",
-        "dynamodb_new_image_message_m_rules_l_35_m_rule_type_s": "string",
-        "dynamodb_new_image_message_m_rules_l_36_m_aggregate_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_36_m_count_deviation_n": "int",
-        "dynamodb_new_image_message_m_rules_l_36_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_36_m_pattern_result_bool": "boolean",
-        "dynamodb_new_image_message_m_rules_l_36_m_rule_check_result_n": "int",
-        "dynamodb_new_image_message_m_rules_l_36_m_rule_id_n": "int",
-        "dynamodb_new_image_message_m_rules_l_36_m_rule_type_s": "string",
-        "dynamodb_new_image_message_m_rules_l_37_m_aggregate_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_37_m_count_deviation_n": "int",
-        "dynamodb_new_image_message_m_rules_l_37_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_37_m_pattern_result_bool": "boolean",
-        "dynamodb_new_image_message_m_rules_l_37_m_rule_check_result_n": "int",
-        "dynamodb_new_image_message_m_rules_l_37_m_rule_id_n": "int",
-        "dynamodb_new_image_message_m_rules_l_37_m_rule_type_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de48_m_09_s": "string",
-        "dynamodb_new_image_message_m_rules_l_38_m_aggregate_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_38_m_count_deviation_n": "int",
-        "dynamodb_new_image_message_m_rules_l_38_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_38_m_pattern_result_bool": "boolean",
-        "dynamodb_new_image_message_m_rules_l_38_m_rule_check_result_n": "int",
-        "dynamodb_new_image_message_m_rules_l_38_m_rule_id_n": "int",
-        "dynamodb_new_image_message_m_rules_l_38_m_rule_type_s": "string",
-        "dynamodb_new_image_message_m_rules_l_38_m_actions_l_0_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_38_m_actions_l_0_m_de39_s": "string",
-        "dynamodb_new_image_message_m_rules_l_38_m_actions_l_1_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_38_m_actions_l_1_m_exit_code_n": "int",
-        "dynamodb_new_image_message_m_rules_l_38_m_actions_l_2_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_38_m_actions_l_2_m_nwk_status_n": "int",
-        "dynamodb_new_image_message_m_rules_l_37_m_actions_l_0_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_37_m_actions_l_0_m_de39_s": "string",
-        "dynamodb_new_image_message_m_rules_l_37_m_actions_l_1_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_37_m_actions_l_1_m_exit_code_n": "int",
-        "dynamodb_new_image_message_m_rules_l_37_m_actions_l_2_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_37_m_actions_l_2_m_nwk_status_n": "int",
-        "dynamodb_new_image_message_m_rules_l_16_m_actions_l_0_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_16_m_actions_l_0_m_de39_s": "string",
-        "dynamodb_new_image_message_m_rules_l_16_m_actions_l_1_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_16_m_actions_l_1_m_exit_code_n": "int",
-        "dynamodb_new_image_message_m_rules_l_16_m_actions_l_2_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_16_m_actions_l_2_m_nwk_status_n": "int",
-        "dynamodb_new_image_message_m_rules_l_16_m_actions_l_3_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_16_m_actions_l_3_m_alert_id_n": "int",
-        "dynamodb_new_image_message_m_rules_l_15_m_actions_l_0_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_15_m_actions_l_0_m_de39_s": "string",
-        "dynamodb_new_image_message_m_rules_l_15_m_actions_l_1_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_15_m_actions_l_1_m_exit_code_n": "int",
-        "dynamodb_new_image_message_m_rules_l_15_m_actions_l_2_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_15_m_actions_l_2_m_nwk_status_n": "int",
-        "dynamodb_new_image_message_m_rules_l_15_m_actions_l_3_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_15_m_actions_l_3_m_alert_id_n": "int",
-        "dynamodb_new_image_message_m_rules_l_18_m_actions_l_3_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_18_m_actions_l_3_m_alert_id_n": "int",
-        "dynamodb_new_image_message_m_rules_l_10_m_actions_l_3_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_10_m_actions_l_3_m_alert_id_n": "int",
-        "dynamodb_new_image_message_m_rules_l_6_m_actions_l_3_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_6_m_actions_l_3_m_alert_id_n": "int",
-        "dynamodb_new_image_message_m_rules_l_17_m_actions_l_3_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_17_m_actions_l_3_m_alert_id_n": "int",
-        "dynamodb_new_image_message_m_rules_l_38_m_actions_l_3_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_38_m_actions_l_3_m_alert_id_n": "int",
-        "dynamodb_new_image_message_m_rules_l_11_m_actions_l_3_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_11_m_actions_l_3_m_alert_id_n": "int",
-        "dynamodb_new_image_message_m_rules_l_0_m_actions_l_3_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_0_m_actions_l_3_m_alert_id_n": "int",
-        "dynamodb_new_image_message_m_rules_l_12_m_actions_l_3_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_12_m_actions_l_3_m_alert_id_n": "int",
-        "dynamodb_new_image_message_m_rules_l_28_m_actions_l_3_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_28_m_actions_l_3_m_alert_id_n": "int",
-        "dynamodb_new_image_message_m_iso_msg_m_de124_m_17_s": "string",
-        "dynamodb_new_image_message_m_rules_l_27_m_actions_l_3_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_27_m_actions_l_3_m_alert_id_n": "int",
-        "dynamodb_new_image_message_m_rules_l_37_m_actions_l_3_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_37_m_actions_l_3_m_alert_id_n": "int",
-        "dynamodb_new_image_message_m_rules_l_3_m_actions_l_3_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_3_m_actions_l_3_m_alert_id_n": "int",
-        "dynamodb_new_image_message_m_rules_l_21_m_actions_l_3_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_21_m_actions_l_3_m_alert_id_n": "int",
-        "dynamodb_new_image_message_m_rules_l_39_m_actions_l_0_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_39_m_actions_l_0_m_de39_s": "string",
-        "dynamodb_new_image_message_m_rules_l_39_m_actions_l_1_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_39_m_actions_l_1_m_exit_code_n": "int",
-        "dynamodb_new_image_message_m_rules_l_39_m_actions_l_2_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_39_m_actions_l_2_m_nwk_status_n": "int",
-        "dynamodb_new_image_message_m_rules_l_39_m_aggregate_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_39_m_count_deviation_n": "int",
-        "dynamodb_new_image_message_m_rules_l_39_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_39_m_pattern_result_bool": "boolean",
-        "dynamodb_new_image_message_m_rules_l_39_m_rule_check_result_n": "int",
-        "dynamodb_new_image_message_m_rules_l_39_m_rule_id_n": "int",
-        "dynamodb_new_image_message_m_rules_l_39_m_rule_type_s": "string",
-        "dynamodb_new_image_message_m_rules_l_40_m_actions_l_0_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_40_m_actions_l_0_m_de39_s": "string",
-        "dynamodb_new_image_message_m_rules_l_40_m_actions_l_1_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_40_m_actions_l_1_m_exit_code_n": "int",
-        "dynamodb_new_image_message_m_rules_l_40_m_actions_l_2_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_40_m_actions_l_2_m_nwk_status_n": "int",
-        "dynamodb_new_image_message_m_rules_l_40_m_aggregate_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_40_m_count_deviation_n": "int",
-        "dynamodb_new_image_message_m_rules_l_40_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_40_m_pattern_result_bool": "boolean",
-        "dynamodb_new_image_message_m_rules_l_40_m_rule_check_result_n": "int",
-        "dynamodb_new_image_message_m_rules_l_40_m_rule_id_n": "int",
-        "dynamodb_new_image_message_m_rules_l_40_m_rule_type_s": "string",
-        "dynamodb_new_image_message_m_rules_l_1_m_actions_l_3_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_1_m_actions_l_3_m_alert_id_n": "int",
-        "dynamodb_new_image_message_m_rules_l_2_m_actions_l_3_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_2_m_actions_l_3_m_alert_id_n": "int",
-        "awsregion": "string",
-        "eventid": "string",
-        "eventname": "string",
-        "useridentity": "string",
-        "recordformat": "string",
-        "tablename": "string",
-        "dynamodb_approximatecreationdatetime": "string",
-        "dynamodb_newimage_createdat_n": "timestamp",
-        "dynamodb_newimage_message_m_message_type_m_message_desc_s": "string",
-        "dynamodb_newimage_message_m_message_type_m_message_type_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de51_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de124_m": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de2_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de120_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de4_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de6_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de7_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de3_3_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de49_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de48_m_33_m_8_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de48_m_33_m_1_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de48_m_33_m_2_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de48_m_33_m_3_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de48_m_33_m_6_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de48_m_1_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de48_m_34_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de48_m_26_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de48_m_71_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de48_m_82_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de48_m_30_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de48_m_42_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de3_1_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de3_2_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de22_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de43_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de42_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de63_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de41_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de61_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de18_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de39_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de38_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de16_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de37_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de15_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de14_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de13_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de12_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de56_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de55_m": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de11_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de33_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de32_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de10_s": "string",
-        "dynamodb_newimage_message_m_processor_validations_m_expiry_check_s": "string",
-        "dynamodb_newimage_message_m_processor_validations_m_test_matrix_s": "string",
-        "dynamodb_newimage_message_m_processor_validations_m_arqc_check_s": "string",
-        "dynamodb_newimage_message_m_processor_validations_m_rules_triggered_s": "string",
-        "dynamodb_newimage_message_m_processor_validations_m_rules_decision_s": "string",
-        "dynamodb_newimage_message_m_processor_validations_m_track_check_s": "string",
-        "dynamodb_newimage_message_m_processor_validations_m_cvv_check_s": "string",
-        "dynamodb_newimage_message_m_processor_validations_m_test_results_s": "string",
-        "dynamodb_newimage_message_m_processor_validations_m_pin_check_s": "string",
-        "dynamodb_newimage_message_m_processor_validations_m_pan_check_s": "string",
-        "dynamodb_newimage_message_m_processor_validations_m_cvv_type_s": "string",
-        "dynamodb_newimage_message_m_processor_validations_m_rules_checked_s": "string",
-        "dynamodb_newimage_message_m_processor_validations_m_3ds_check_s": "string",
-        "dynamodb_newimage_message_m_rules_l_0_m_pattern_result_bool": "boolean",
-        "dynamodb_newimage_message_m_rules_l_0_m_rule_id_n": "int",
-        "dynamodb_newimage_message_m_rules_l_0_m_rule_check_result_n": "int",
-        "dynamodb_newimage_message_m_rules_l_0_m_count_deviation_n": "int",
-        "dynamodb_newimage_message_m_rules_l_0_m_aggregate_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_0_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_0_m_rule_type_s": "string",
-        "dynamodb_newimage_message_m_rules_l_1_m_pattern_result_bool": "boolean",
-        "dynamodb_newimage_message_m_rules_l_1_m_rule_id_n": "int",
-        "dynamodb_newimage_message_m_rules_l_1_m_rule_check_result_n": "int",
-        "dynamodb_newimage_message_m_rules_l_1_m_count_deviation_n": "int",
-        "dynamodb_newimage_message_m_rules_l_1_m_aggregate_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_1_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_1_m_rule_type_s": "string",
-        "dynamodb_newimage_message_m_rules_l_2_m_pattern_result_bool": "boolean",
-        "dynamodb_newimage_message_m_rules_l_2_m_rule_id_n": "int",
-        "dynamodb_newimage_message_m_rules_l_2_m_rule_check_result_n": "int",
-        "dynamodb_newimage_message_m_rules_l_2_m_count_deviation_n": "int",
-        "dynamodb_newimage_message_m_rules_l_2_m_aggregate_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_2_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_2_m_rule_type_s": "string",
-        "dynamodb_newimage_message_m_rules_l_3_m_pattern_result_bool": "boolean",
-        "dynamodb_newimage_message_m_rules_l_3_m_rule_id_n": "int",
-        "dynamodb_newimage_message_m_rules_l_3_m_rule_check_result_n": "int",
-        "dynamodb_newimage_message_m_rules_l_3_m_count_deviation_n": "int",
-        "dynamodb_newimage_message_m_rules_l_3_m_aggregate_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_3_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_3_m_rule_type_s": "string",
-        "dynamodb_newimage_message_m_rules_l_4_m_pattern_result_bool": "boolean",
-        "dynamodb_newimage_message_m_rules_l_4_m_rule_id_n": "int",
-        "dynamodb_newimage_message_m_rules_l_4_m_rule_check_result_n": "int",
-        "dynamodb_newimage_message_m_rules_l_4_m_count_deviation_n": "int",
-        "dynamodb_newimage_message_m_rules_l_4_m_aggregate_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_4_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_4_m_rule_type_s": "string",
-        "dynamodb_newimage_message_m_rules_l_5_m_pattern_result_bool": "boolean",
-        "dynamodb_newimage_message_m_rules_l_5_m_rule_id_n": "int",
-        "dynamodb_newimage_message_m_rules_l_5_m_rule_check_result_n": "int",
-        "dynamodb_newimage_message_m_rules_l_5_m_count_deviation_n": "int",
-        "dynamodb_newimage_message_m_rules_l_5_m_aggregate_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_5_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_5_m_rule_type_s": "string",
-        "dynamodb_newimage_message_m_rules_l_6_m_pattern_result_bool": "boolean",
-        "dynamodb_newimage_message_m_rules_l_6_m_rule_id_n": "int",
-        "dynamodb_newimage_message_m_rules_l_6_m_rule_check_result_n": "int",
-        "dynamodb_newimage_message_m_rules_l_6_m_count_deviation_n": "int",
-        "dynamodb_newimage_message_m_rules_l_6_m_aggregate_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_6_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_6_m_rule_type_s": "string",
-        "dynamodb_newimage_message_m_rules_l_7_m_pattern_result_bool": "boolean",
-        "dynamodb_newimage_message_m_rules_l_7_m_rule_id_n": "int",
-        "dynamodb_newimage_message_m_rules_l_7_m_rule_check_result_n": "int",
-        "dynamodb_newimage_message_m_rules_l_7_m_count_deviation_n": "int",
-        "dynamodb_newimage_message_m_rules_l_7_m_aggregate_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_7_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_7_m_rule_type_s": "string",
-        "dynamodb_newimage_message_m_rules_l_8_m_pattern_result_bool": "boolean",
-        "dynamodb_newimage_message_m_rules_l_8_m_rule_id_n": "int",
-        "dynamodb_newimage_message_m_rules_l_8_m_rule_check_result_n": "int",
-        "dynamodb_newimage_message_m_rules_l_8_m_count_deviation_n": "int",
-        "dynamodb_newimage_message_m_rules_l_8_m_aggregate_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_8_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_8_m_rule_type_s": "string",
-        "dynamodb_newimage_message_m_rules_l_9_m_pattern_result_bool": "boolean",
-        "dynamodb_newimage_message_m_rules_l_9_m_rule_id_n": "int",
-        "dynamodb_newimage_message_m_rules_l_9_m_rule_check_result_n": "int",
-        "dynamodb_newimage_message_m_rules_l_9_m_count_deviation_n": "int",
-        "dynamodb_newimage_message_m_rules_l_9_m_aggregate_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_9_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_9_m_rule_type_s": "string",
-        "dynamodb_newimage_message_m_rules_l_10_m_pattern_result_bool": "boolean",
-        "dynamodb_newimage_message_m_rules_l_10_m_rule_id_n": "int",
-        "dynamodb_newimage_message_m_rules_l_10_m_rule_check_result_n": "int",
-        "dynamodb_newimage_message_m_rules_l_10_m_count_deviation_n": "int",
-        "dynamodb_newimage_message_m_rules_l_10_m_aggregate_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_10_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_10_m_rule_type_s": "string",
-        "dynamodb_newimage_message_m_rules_l_11_m_pattern_result_bool": "boolean",
-        "dynamodb_newimage_message_m_rules_l_11_m_rule_id_n": "int",
-        "dynamodb_newimage_message_m_rules_l_11_m_rule_check_result_n": "int",
-        "dynamodb_newimage_message_m_rules_l_11_m_count_deviation_n": "int",
-        "dynamodb_newimage_message_m_rules_l_11_m_aggregate_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_11_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_11_m_rule_type_s": "string",
-        "dynamodb_newimage_message_m_rules_l_12_m_pattern_result_bool": "boolean",
-        "dynamodb_newimage_message_m_rules_l_12_m_rule_id_n": "int",
-        "dynamodb_newimage_message_m_rules_l_12_m_rule_check_result_n": "int",
-        "dynamodb_newimage_message_m_rules_l_12_m_count_deviation_n": "int",
-        "dynamodb_newimage_message_m_rules_l_12_m_aggregate_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_12_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_12_m_rule_type_s": "string",
-        "dynamodb_newimage_message_m_rules_l_13_m_pattern_result_bool": "boolean",
-        "dynamodb_newimage_message_m_rules_l_13_m_rule_id_n": "int",
-        "dynamodb_newimage_message_m_rules_l_13_m_rule_check_result_n": "int",
-        "dynamodb_newimage_message_m_rules_l_13_m_count_deviation_n": "int",
-        "dynamodb_newimage_message_m_rules_l_13_m_aggregate_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_13_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_13_m_rule_type_s": "string",
-        "dynamodb_newimage_message_m_rules_l_14_m_pattern_result_bool": "boolean",
-        "dynamodb_newimage_message_m_rules_l_14_m_rule_id_n": "int",
-        "dynamodb_newimage_message_m_rules_l_14_m_rule_check_result_n": "int",
-        "dynamodb_newimage_message_m_rules_l_14_m_count_deviation_n": "int",
-        "dynamodb_newimage_message_m_rules_l_14_m_aggregate_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_14_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_14_m_rule_type_s": "string",
-        "dynamodb_newimage_message_m_rules_l_15_m_pattern_result_bool": "boolean",
-        "dynamodb_newimage_message_m_rules_l_15_m_rule_id_n": "int",
-        "dynamodb_newimage_message_m_rules_l_15_m_rule_check_result_n": "int",
-        "dynamodb_newimage_message_m_rules_l_15_m_count_deviation_n": "int",
-        "dynamodb_newimage_message_m_rules_l_15_m_aggregate_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_15_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_15_m_rule_type_s": "string",
-        "dynamodb_newimage_message_m_rules_l_16_m_pattern_result_bool": "boolean",
-        "dynamodb_newimage_message_m_rules_l_16_m_rule_id_n": "int",
-        "dynamodb_newimage_message_m_rules_l_16_m_rule_check_result_n": "int",
-        "dynamodb_newimage_message_m_rules_l_16_m_count_deviation_n": "int",
-        "dynamodb_newimage_message_m_rules_l_16_m_aggregate_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_16_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_16_m_rule_type_s": "string",
-        "dynamodb_newimage_message_m_rules_l_17_m_pattern_result_bool": "boolean",
-        "dynamodb_newimage_message_m_rules_l_17_m_rule_id_n": "int",
-        "dynamodb_newimage_message_m_rules_l_17_m_rule_check_result_n": "int",
-        "dynamodb_newimage_message_m_rules_l_17_m_count_deviation_n": "int",
-        "dynamodb_newimage_message_m_rules_l_17_m_aggregate_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_17_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_17_m_rule_type_s": "string",
-        "dynamodb_newimage_message_m_rules_l_18_m_pattern_result_bool": "boolean",
-        "dynamodb_newimage_message_m_rules_l_18_m_rule_id_n": "int",
-        "dynamodb_newimage_message_m_rules_l_18_m_rule_check_result_n": "int",
-        "dynamodb_newimage_message_m_rules_l_18_m_count_deviation_n": "int",
-        "dynamodb_newimage_message_m_rules_l_18_m_aggregate_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_18_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_18_m_rule_type_s": "string",
-        "dynamodb_newimage_message_m_rules_l_19_m_pattern_result_bool": "boolean",
-        "dynamodb_newimage_message_m_rules_l_19_m_rule_id_n": "int",
-        "dynamodb_newimage_message_m_rules_l_19_m_rule_check_result_n": "int",
-        "dynamodb_newimage_message_m_rules_l_19_m_count_deviation_n": "int",
-        "dynamodb_newimage_message_m_rules_l_19_m_aggregate_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_19_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_19_m_rule_type_s": "string",
-        "dynamodb_newimage_message_m_rules_l_20_m_pattern_result_bool": "boolean",
-        "dynamodb_newimage_message_m_rules_l_20_m_rule_id_n": "int",
-        "dynamodb_newimage_message_m_rules_l_20_m_rule_check_result_n": "int",
-        "dynamodb_newimage_message_m_rules_l_20_m_count_deviation_n": "int",
-        "dynamodb_newimage_message_m_rules_l_20_m_aggregate_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_20_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_20_m_rule_type_s": "string",
-        "dynamodb_newimage_message_m_rules_l_21_m_pattern_result_bool": "boolean",
-        "dynamodb_newimage_message_m_rules_l_21_m_rule_id_n": "int",
-        "dynamodb_newimage_message_m_rules_l_21_m_rule_check_result_n": "int",
-        "dynamodb_newimage_message_m_rules_l_21_m_count_deviation_n": "int",
-        "dynamodb_newimage_message_m_rules_l_21_m_aggregate_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_21_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_21_m_rule_type_s": "string",
-        "dynamodb_newimage_message_m_rules_l_22_m_pattern_result_bool": "boolean",
-        "dynamodb_newimage_message_m_rules_l_22_m_rule_id_n": "int",
-        "dynamodb_newimage_message_m_rules_l_22_m_rule_check_result_n": "int",
-        "dynamodb_newimage_message_m_rules_l_22_m_count_deviation_n": "int",
-        "dynamodb_newimage_message_m_rules_l_22_m_aggregate_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_22_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_22_m_rule_type_s": "string",
-        "dynamodb_newimage_message_m_rules_l_23_m_pattern_result_bool": "boolean",
-        "dynamodb_newimage_message_m_rules_l_23_m_rule_id_n": "int",
-        "dynamodb_newimage_message_m_rules_l_23_m_rule_check_result_n": "int",
-        "dynamodb_newimage_message_m_rules_l_23_m_count_deviation_n": "int",
-        "dynamodb_newimage_message_m_rules_l_23_m_aggregate_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_23_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_23_m_rule_type_s": "string",
-        "dynamodb_newimage_message_m_rules_l_24_m_pattern_result_bool": "boolean",
-        "dynamodb_newimage_message_m_rules_l_24_m_rule_id_n": "int",
-        "dynamodb_newimage_message_m_rules_l_24_m_rule_check_result_n": "int",
-        "dynamodb_newimage_message_m_rules_l_24_m_count_deviation_n": "int",
-        "dynamodb_newimage_message_m_rules_l_24_m_aggregate_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_24_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_24_m_rule_type_s": "string",
-        "dynamodb_newimage_message_m_rules_l_25_m_pattern_result_bool": "boolean",
-        "dynamodb_newimage_message_m_rules_l_25_m_rule_id_n": "int",
-        "dynamodb_newimage_message_m_rules_l_25_m_rule_check_result_n": "int",
-        "dynamodb_newimage_message_m_rules_l_25_m_count_deviation_n": "int",
-        "dynamodb_newimage_message_m_rules_l_25_m_aggregate_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_25_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_25_m_rule_type_s": "string",
-        "dynamodb_newimage_message_m_rules_l_26_m_pattern_result_bool": "boolean",
-        "dynamodb_newimage_message_m_rules_l_26_m_rule_id_n": "int",
-        "dynamodb_newimage_message_m_rules_l_26_m_rule_check_result_n": "int",
-        "dynamodb_newimage_message_m_rules_l_26_m_count_deviation_n": "int",
-        "dynamodb_newimage_message_m_rules_l_26_m_aggregate_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_26_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_26_m_rule_type_s": "string",
-        "dynamodb_newimage_message_m_rules_l_27_m_pattern_result_bool": "boolean",
-        "dynamodb_newimage_message_m_rules_l_27_m_rule_id_n": "int",
-        "dynamodb_newimage_message_m_rules_l_27_m_rule_check_result_n": "int",
-        "dynamodb_newimage_message_m_rules_l_27_m_count_deviation_n": "int",
-        "dynamodb_newimage_message_m_rules_l_27_m_aggregate_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_27_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_27_m_rule_type_s": "string",
-        "dynamodb_newimage_message_m_rules_l_28_m_pattern_result_bool": "boolean",
-        "dynamodb_newimage_message_m_rules_l_28_m_rule_id_n": "int",
-        "dynamodb_newimage_message_m_rules_l_28_m_rule_check_result_n": "int",
-        "dynamodb_newimage_message_m_rules_l_28_m_count_deviation_n": "int",
-        "dynamodb_newimage_message_m_rules_l_28_m_aggregate_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_28_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_28_m_rule_type_s": "string",
-        "dynamodb_newimage_message_m_rules_l_29_m_pattern_result_bool": "boolean",
-        "dynamodb_newimage_message_m_rules_l_29_m_rule_id_n": "int",
-        "dynamodb_newimage_message_m_rules_l_29_m_rule_check_result_n": "int",
-        "dynamodb_newimage_message_m_rules_l_29_m_count_deviation_n": "int",
-        "dynamodb_newimage_message_m_rules_l_29_m_aggregate_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_29_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_29_m_rule_type_s": "string",
-        "dynamodb_newimage_message_m_rules_l_30_m_pattern_result_bool": "boolean",
-        "dynamodb_newimage_message_m_rules_l_30_m_rule_id_n": "int",
-        "dynamodb_newimage_message_m_rules_l_30_m_rule_check_result_n": "int",
-        "dynamodb_newimage_message_m_rules_l_30_m_count_deviation_n": "int",
-        "dynamodb_newimage_message_m_rules_l_30_m_aggregate_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_30_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_30_m_rule_type_s": "string",
-        "dynamodb_newimage_message_m_rules_l_31_m_pattern_result_bool": "boolean",
-        "dynamodb_newimage_message_m_rules_l_31_m_rule_id_n": "int",
-        "dynamodb_newimage_message_m_rules_l_31_m_rule_check_result_n": "int",
-        "dynamodb_newimage_message_m_rules_l_31_m_count_deviation_n": "int",
-        "dynamodb_newimage_message_m_rules_l_31_m_aggregate_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_31_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_31_m_rule_type_s": "string",
-        "dynamodb_newimage_message_m_rules_l_32_m_pattern_result_bool": "boolean",
-        "dynamodb_newimage_message_m_rules_l_32_m_rule_id_n": "int",
-        "dynamodb_newimage_message_m_rules_l_32_m_rule_check_result_n": "int",
-        "dynamodb_newimage_message_m_rules_l_32_m_count_deviation_n": "int",
-        "dynamodb_newimage_message_m_rules_l_32_m_aggregate_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_32_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_32_m_rule_type_s": "string",
-        "dynamodb_newimage_message_m_rules_l_33_m_pattern_result_bool": "boolean",
-        "dynamodb_newimage_message_m_rules_l_33_m_rule_id_n": "int",
-        "dynamodb_newimage_message_m_rules_l_33_m_rule_check_result_n": "int",
-        "dynamodb_newimage_message_m_rules_l_33_m_count_deviation_n": "int",
-        "dynamodb_newimage_message_m_rules_l_33_m_aggregate_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_33_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_33_m_rule_type_s": "string",
-        "dynamodb_newimage_message_m_rules_l_34_m_pattern_result_bool": "boolean",
-        "dynamodb_newimage_message_m_rules_l_34_m_rule_id_n": "int",
-        "dynamodb_newimage_message_m_rules_l_34_m_rule_check_result_n": "int",
-        "dynamodb_newimage_message_m_rules_l_34_m_count_deviation_n": "int",
-        "dynamodb_newimage_message_m_rules_l_34_m_aggregate_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_34_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_34_m_rule_type_s": "string",
-        "dynamodb_newimage_message_m_rules_l_35_m_pattern_result_bool": "boolean",
-        "dynamodb_newimage_message_m_rules_l_35_m_rule_id_n": "int",
-        "dynamodb_newimage_message_m_rules_l_35_m_rule_check_result_n": "int",
-        "dynamodb_newimage_message_m_rules_l_35_m_count_deviation_n": "int",
-        "dynamodb_newimage_message_m_rules_l_35_m_aggregate_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_35_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_35_m_rule_type_s": "string",
-        "dynamodb_newimage_message_m_rules_l_36_m_pattern_result_bool": "boolean",
-        "dynamodb_newimage_message_m_rules_l_36_m_rule_id_n": "int",
-        "dynamodb_newimage_message_m_rules_l_36_m_rule_check_result_n": "int",
-        "dynamodb_newimage_message_m_rules_l_36_m_count_deviation_n": "int",
-        "dynamodb_newimage_message_m_rules_l_36_m_aggregate_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_36_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_36_m_rule_type_s": "string",
-        "dynamodb_newimage_message_m_rules_l_37_m_pattern_result_bool": "boolean",
-        "dynamodb_newimage_message_m_rules_l_37_m_rule_id_n": "int",
-        "dynamodb_newimage_message_m_rules_l_37_m_rule_check_result_n": "int",
-        "dynamodb_newimage_message_m_rules_l_37_m_count_deviation_n": "int",
-        "dynamodb_newimage_message_m_rules_l_37_m_aggregate_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_37_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_37_m_rule_type_s": "string",
-        "dynamodb_newimage_message_m_rules_l_38_m_pattern_result_bool": "boolean",
-        "dynamodb_newimage_message_m_rules_l_38_m_rule_id_n": "int",
-        "dynamodb_newimage_message_m_rules_l_38_m_rule_check_result_n": "int",
-        "dynamodb_newimage_message_m_rules_l_38_m_count_deviation_n": "int",
-        "dynamodb_newimage_message_m_rules_l_38_m_aggregate_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_38_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_38_m_rule_type_s": "string",
-        "dynamodb_newimage_message_m_rules_l_39_m_pattern_result_bool": "boolean",
-        "dynamodb_newimage_message_m_rules_l_39_m_rule_id_n": "int",
-        "dynamodb_newimage_message_m_rules_l_39_m_rule_check_result_n": "int",
-        "dynamodb_newimage_message_m_rules_l_39_m_count_deviation_n": "int",
-        "dynamodb_newimage_message_m_rules_l_39_m_aggregate_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_39_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_39_m_rule_type_s": "string",
-        "dynamodb_newimage_message_m_rules_l_40_m_pattern_result_bool": "boolean",
-        "dynamodb_newimage_message_m_rules_l_40_m_rule_id_n": "int",
-        "dynamodb_newimage_message_m_rules_l_40_m_rule_check_result_n": "int",
-        "dynamodb_newimage_message_m_rules_l_40_m_count_deviation_n": "int",
-        "dynamodb_newimage_message_m_rules_l_40_m_aggregate_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_40_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_newimage_message_m_rules_l_40_m_rule_type_s": "string",
-        "dynamodb_newimage_message_m_summary_m_merchant_category_s": "string",
-        "dynamodb_newimage_message_m_summary_m_account_id_s": "string",
-        "dynamodb_newimage_message_m_summary_m_spend_location_s": "string",
-        "dynamodb_newimage_message_m_summary_m_total_fee_bill_s": "string",
-        "dynamodb_newimage_message_m_summary_m_customer_ac_s": "string",
-        "dynamodb_newimage_message_m_summary_m_pid_s": "string",
-        "dynamodb_newimage_message_m_summary_m_rid_s": "string",
-        "dynamodb_newimage_message_m_summary_m_tid_s": "string",
-        "dynamodb_newimage_message_m_summary_m_spend_type_s": "string",
-        "dynamodb_newimage_message_m_summary_m_processor_reason_code_s": "string",
-        "dynamodb_newimage_message_m_summary_m_billing_amount_s": "float",
-        "dynamodb_newimage_message_m_summary_m_card_use_type_s": "string",
-        "dynamodb_newimage_message_m_summary_m_network_s": "string",
-        "dynamodb_newimage_message_m_summary_m_transaction_date_time_s": "string",
-        "dynamodb_newimage_message_m_summary_m_client_id_s": "string",
-        "dynamodb_newimage_message_m_summary_m_customer_validation_s": "string",
-        "dynamodb_newimage_message_m_summary_m_processor_decision_code_s": "string",
-        "dynamodb_newimage_message_m_summary_m_transaction_currency_s": "string",
-        "dynamodb_newimage_message_m_summary_m_billing_currency_s": "string",
-        "dynamodb_newimage_message_m_summary_m_processor_decision_desc_s": "string",
-        "dynamodb_newimage_message_m_summary_m_transaction_amount_s": "float",
-        "dynamodb_newimage_token_n": "int",
-        "dynamodb_newimage_id_s": "string",
-        "dynamodb_newimage_updatedat_n": "timestamp",
-        "dynamodb_sizebytes": "string",
-        "eventsource": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de48_m_23_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de48_m_61_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de48_m_22_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de48_m_63_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de90_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de124_m_1_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de124_m_2_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de124_m_3_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de124_m_4_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de124_m_5_s": "string",
-        "dynamodb_newimage_message_m_rules_l_25_m_actions_l_0_m_de39_s": "string",
-        "dynamodb_newimage_message_m_rules_l_25_m_actions_l_0_m_act_s": "string",
-        "dynamodb_newimage_message_m_rules_l_25_m_actions_l_1_m_exit_code_n": "int",
-        "dynamodb_newimage_message_m_rules_l_25_m_actions_l_1_m_act_s": "string",
-        "dynamodb_newimage_message_m_rules_l_25_m_actions_l_2_m_act_s": "string",
-        "dynamodb_newimage_message_m_rules_l_25_m_actions_l_2_m_nwk_status_n": "int",
-        "dynamodb_newimage_message_m_rules_l_25_m_actions_l_3_m_alert_id_n": "int",
-        "dynamodb_newimage_message_m_rules_l_25_m_actions_l_3_m_act_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de48_m_37_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de48_m_32_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de62_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de124_m_11_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de124_m_12_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de124_m_13_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de124_m_14_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de124_m_15_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de124_m_16_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de124_m_6_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de124_m_7_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de124_m_8_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de124_m_9_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de124_m_10_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de23_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de35_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de55_m_9f27_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de55_m_82_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de55_m_9f36_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de55_m_95_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de55_m_9f34_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de55_m_9f10_s": "string",
-        "dynamodb_newimage_message_m_rules_l_29_m_actions_l_0_m_de39_s": "string",
-        "dynamodb_newimage_message_m_rules_l_29_m_actions_l_0_m_act_s": "string",
-        "dynamodb_newimage_message_m_rules_l_29_m_actions_l_1_m_exit_code_n": "int",
-        "dynamodb_newimage_message_m_rules_l_29_m_actions_l_1_m_act_s": "string",
-        "dynamodb_newimage_message_m_rules_l_29_m_actions_l_2_m_act_s": "string",
-        "dynamodb_newimage_message_m_rules_l_29_m_actions_l_2_m_nwk_status_n": "int",
-        "dynamodb_newimage_message_m_rules_l_29_m_actions_l_3_m_alert_id_n": "int",
-        "dynamodb_newimage_message_m_rules_l_29_m_actions_l_3_m_act_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de55_m_9f33_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de48_m_77_s": "string",
-        "dynamodb_newimage_message_m_rules_l_10_m_actions_l_0_m_de39_s": "string",
-        "dynamodb_newimage_message_m_rules_l_10_m_actions_l_0_m_act_s": "string",
-        "dynamodb_newimage_message_m_rules_l_10_m_actions_l_1_m_exit_code_n": "int",
-        "dynamodb_newimage_message_m_rules_l_10_m_actions_l_1_m_act_s": "string",
-        "dynamodb_newimage_message_m_rules_l_10_m_actions_l_2_m_act_s": "string",
-        "dynamodb_newimage_message_m_rules_l_10_m_actions_l_2_m_nwk_status_n": "int",
-        "dynamodb_newimage_message_m_rules_l_10_m_actions_l_3_m_alert_id_n": "int",
-        "dynamodb_newimage_message_m_rules_l_10_m_actions_l_3_m_act_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de28_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de48_m_80_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de26_s": "string",
-        "dynamodb_newimage_message_m_rules_l_26_m_actions_l_0_m_de39_s": "string",
-        "dynamodb_newimage_message_m_rules_l_26_m_actions_l_0_m_act_s": "string",
-        "dynamodb_newimage_message_m_rules_l_26_m_actions_l_1_m_exit_code_n": "int",
-        "dynamodb_newimage_message_m_rules_l_26_m_actions_l_1_m_act_s": "string",
-        "dynamodb_newimage_message_m_rules_l_26_m_actions_l_2_m_act_s": "string",
-        "dynamodb_newimage_message_m_rules_l_26_m_actions_l_2_m_nwk_status_n": "int",
-        "dynamodb_newimage_message_m_rules_l_26_m_actions_l_3_m_alert_id_n": "int",
-        "dynamodb_newimage_message_m_rules_l_26_m_actions_l_3_m_act_s": "string",
-        "dynamodb_newimage_message_m_rules_l_38_m_actions_l_0_m_de39_s": "string",
-        "dynamodb_newimage_message_m_rules_l_38_m_actions_l_0_m_act_s": "string",
-        "dynamodb_newimage_message_m_rules_l_38_m_actions_l_1_m_exit_code_n": "int",
-        "dynamodb_newimage_message_m_rules_l_38_m_actions_l_1_m_act_s": "string",
-        "dynamodb_newimage_message_m_rules_l_38_m_actions_l_2_m_act_s": "string",
-        "dynamodb_newimage_message_m_rules_l_38_m_actions_l_2_m_nwk_status_n": "int",
-        "dynamodb_newimage_message_m_rules_l_38_m_actions_l_3_m_alert_id_n": "int",
-        "dynamodb_newimage_message_m_rules_l_38_m_actions_l_3_m_act_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de48_m_33_m_5_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de108_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de48_m_66_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de48_m_92_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de48_m_43_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de48_m_21_s": "string",
-        "dynamodb_newimage_message_m_rules_l_20_m_actions_l_0_m_de39_s": "string",
-        "dynamodb_newimage_message_m_rules_l_20_m_actions_l_0_m_act_s": "string",
-        "dynamodb_newimage_message_m_rules_l_20_m_actions_l_1_m_exit_code_n": "int",
-        "dynamodb_newimage_message_m_rules_l_20_m_actions_l_1_m_act_s": "string",
-        "dynamodb_newimage_message_m_rules_l_20_m_actions_l_2_m_act_s": "string",
-        "dynamodb_newimage_message_m_rules_l_20_m_actions_l_2_m_nwk_status_n": "int",
-        "dynamodb_newimage_message_m_rules_l_20_m_actions_l_3_m_alert_id_n": "int",
-        "dynamodb_newimage_message_m_rules_l_20_m_actions_l_3_m_act_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de48_m_64_s": "string",
-        "dynamodb_newimage_message_m_rules_l_18_m_actions_l_0_m_de39_s": "string",
-        "dynamodb_newimage_message_m_rules_l_18_m_actions_l_0_m_act_s": "string",
-        "dynamodb_newimage_message_m_rules_l_18_m_actions_l_1_m_exit_code_n": "int",
-        "dynamodb_newimage_message_m_rules_l_18_m_actions_l_1_m_act_s": "string",
-        "dynamodb_newimage_message_m_rules_l_18_m_actions_l_2_m_act_s": "string",
-        "dynamodb_newimage_message_m_rules_l_18_m_actions_l_2_m_nwk_status_n": "int",
-        "dynamodb_newimage_message_m_rules_l_18_m_actions_l_3_m_alert_id_n": "int",
-        "dynamodb_newimage_message_m_rules_l_18_m_actions_l_3_m_act_s": "string",
-        "dynamodb_newimage_message_m_rules_l": "string",
-        "dynamodb_newimage_message_m_rules_l_24_m_actions_l_0_m_de39_s": "string",
-        "dynamodb_newimage_message_m_rules_l_24_m_actions_l_0_m_act_s": "string",
-        "dynamodb_newimage_message_m_rules_l_24_m_actions_l_1_m_exit_code_n": "int",
-        "dynamodb_newimage_message_m_rules_l_24_m_actions_l_1_m_act_s": "string",
-        "dynamodb_newimage_message_m_rules_l_24_m_actions_l_2_m_act_s": "string",
-        "dynamodb_newimage_message_m_rules_l_24_m_actions_l_2_m_nwk_status_n": "int",
-        "dynamodb_newimage_message_m_rules_l_24_m_actions_l_3_m_alert_id_n": "int",
-        "dynamodb_newimage_message_m_rules_l_24_m_actions_l_3_m_act_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de48_m_65_s": "string",
-        "dynamodb_newimage_message_m_rules_l_17_m_actions_l_0_m_de39_s": "string",
-        "dynamodb_newimage_message_m_rules_l_17_m_actions_l_0_m_act_s": "string",
-        "dynamodb_newimage_message_m_rules_l_17_m_actions_l_1_m_exit_code_n": "int",
-        "dynamodb_newimage_message_m_rules_l_17_m_actions_l_1_m_act_s": "string",
-        "dynamodb_newimage_message_m_rules_l_17_m_actions_l_2_m_act_s": "string",
-        "dynamodb_newimage_message_m_rules_l_17_m_actions_l_2_m_nwk_status_n": "int",
-        "dynamodb_newimage_message_m_rules_l_17_m_actions_l_3_m_alert_id_n": "int",
-        "dynamodb_newimage_message_m_rules_l_17_m_actions_l_3_m_act_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de95_s": "string",
-        "dynamodb_newimage_message_m_rules_l_11_m_actions_l_0_m_de39_s": "string",
-        "dynamodb_newimage_message_m_rules_l_11_m_actions_l_0_m_act_s": "string",
-        "dynamodb_newimage_message_m_rules_l_11_m_actions_l_1_m_exit_code_n": "int",
-        "dynamodb_newimage_message_m_rules_l_11_m_actions_l_1_m_act_s": "string",
-        "dynamodb_newimage_message_m_rules_l_11_m_actions_l_2_m_act_s": "string",
-        "dynamodb_newimage_message_m_rules_l_11_m_actions_l_2_m_nwk_status_n": "int",
-        "dynamodb_newimage_message_m_rules_l_11_m_actions_l_3_m_alert_id_n": "int",
-        "dynamodb_newimage_message_m_rules_l_11_m_actions_l_3_m_act_s": "string",
-        "dynamodb_newimage_message_m_rules_l_16_m_actions_l_0_m_de39_s": "string",
-        "dynamodb_newimage_message_m_rules_l_16_m_actions_l_0_m_act_s": "string",
-        "dynamodb_newimage_message_m_rules_l_16_m_actions_l_1_m_exit_code_n": "int",
-        "dynamodb_newimage_message_m_rules_l_16_m_actions_l_1_m_act_s": "string",
-        "dynamodb_newimage_message_m_rules_l_16_m_actions_l_2_m_act_s": "string",
-        "dynamodb_newimage_message_m_rules_l_16_m_actions_l_2_m_nwk_status_n": "int",
-        "dynamodb_newimage_message_m_rules_l_16_m_actions_l_3_m_alert_id_n": "int",
-        "dynamodb_newimage_message_m_rules_l_16_m_actions_l_3_m_act_s": "string",
-        "dynamodb_newimage_message_m_rules_l_6_m_actions_l_0_m_de39_s": "string",
-        "dynamodb_newimage_message_m_rules_l_6_m_actions_l_0_m_act_s": "string",
-        "dynamodb_newimage_message_m_rules_l_6_m_actions_l_1_m_exit_code_n": "int",
-        "dynamodb_newimage_message_m_rules_l_6_m_actions_l_1_m_act_s": "string",
-        "dynamodb_newimage_message_m_rules_l_6_m_actions_l_2_m_act_s": "string",
-        "dynamodb_newimage_message_m_rules_l_6_m_actions_l_2_m_nwk_status_n": "int",
-        "dynamodb_newimage_message_m_rules_l_6_m_actions_l_3_m_alert_id_n": "int",
-        "dynamodb_newimage_message_m_rules_l_6_m_actions_l_3_m_act_s": "string",
-        "dynamodb_newimage_message_m_rules_l_37_m_actions_l_0_m_de39_s": "string",
-        "dynamodb_newimage_message_m_rules_l_37_m_actions_l_0_m_act_s": "string",
-        "dynamodb_newimage_message_m_rules_l_37_m_actions_l_1_m_exit_code_n": "int",
-        "dynamodb_newimage_message_m_rules_l_37_m_actions_l_1_m_act_s": "string",
-        "dynamodb_newimage_message_m_rules_l_37_m_actions_l_2_m_act_s": "string",
-        "dynamodb_newimage_message_m_rules_l_37_m_actions_l_2_m_nwk_status_n": "int",
-        "dynamodb_newimage_message_m_rules_l_37_m_actions_l_3_m_alert_id_n": "int",
-        "dynamodb_newimage_message_m_rules_l_37_m_actions_l_3_m_act_s": "string",
-        "dynamodb_newimage_message_m_rules_l_22_m_actions_l_0_m_de39_s": "string",
-        "dynamodb_newimage_message_m_rules_l_22_m_actions_l_0_m_act_s": "string",
-        "dynamodb_newimage_message_m_rules_l_22_m_actions_l_1_m_exit_code_n": "int",
-        "dynamodb_newimage_message_m_rules_l_22_m_actions_l_1_m_act_s": "string",
-        "dynamodb_newimage_message_m_rules_l_22_m_actions_l_2_m_act_s": "string",
-        "dynamodb_newimage_message_m_rules_l_22_m_actions_l_2_m_nwk_status_n": "int",
-        "dynamodb_newimage_message_m_rules_l_22_m_actions_l_3_m_alert_id_n": "int",
-        "dynamodb_newimage_message_m_rules_l_22_m_actions_l_3_m_act_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de121_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de48_m_16_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de60_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de104_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de48_m_18_s": "string",
-        "dynamodb_newimage_message_m_rules_l_15_m_actions_l_0_m_de39_s": "string",
-        "dynamodb_newimage_message_m_rules_l_15_m_actions_l_0_m_act_s": "string",
-        "dynamodb_newimage_message_m_rules_l_15_m_actions_l_1_m_exit_code_n": "int",
-        "dynamodb_newimage_message_m_rules_l_15_m_actions_l_1_m_act_s": "string",
-        "dynamodb_newimage_message_m_rules_l_15_m_actions_l_2_m_act_s": "string",
-        "dynamodb_newimage_message_m_rules_l_15_m_actions_l_2_m_nwk_status_n": "int",
-        "dynamodb_newimage_message_m_rules_l_15_m_actions_l_3_m_alert_id_n": "int",
-        "dynamodb_newimage_message_m_rules_l_15_m_actions_l_3_m_act_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de48_m_83_s": "string",
-        "dynamodb_newimage_message_m_iso_msg_m_de45_s": "string",
-        "dynamodb_newimage_message_m_rules_l_0_m_actions_l_0_m_de39_s": "string",
-        "dynamodb_newimage_message_m_rules_l_0_m_actions_l_0_m_act_s": "string",
-        "dynamodb_newimage_message_m_rules_l_0_m_actions_l_1_m_exit_code_n": "int",
-        "dynamodb_newimage_message_m_rules_l_0_m_actions_l_1_m_act_s": "string",
-        "dynamodb_newimage_message_m_rules_l_0_m_actions_l_2_m_act_s": "string",
-        "dynamodb_newimage_message_m_rules_l_0_m_actions_l_2_m_nwk_status_n": "int",
-        "dynamodb_newimage_message_m_rules_l_0_m_actions_l_3_m_alert_id_n": "int",
-        "dynamodb_newimage_message_m_rules_l_0_m_actions_l_3_m_act_s": "string",
-        "dynamodb_newimage_message_m_rules_l_40_m_actions_l_0_m_de39_s": "string",
-        "dynamodb_newimage_message_m_rules_l_40_m_actions_l_0_m_act_s": "string",
-        "dynamodb_newimage_message_m_rules_l_40_m_actions_l_1_m_exit_code_n": "int",
-        "dynamodb_newimage_message_m_rules_l_40_m_actions_l_1_m_act_s": "string",
-        "dynamodb_newimage_message_m_rules_l_40_m_actions_l_2_m_act_s": "string",
-        "dynamodb_newimage_message_m_rules_l_40_m_actions_l_2_m_nwk_status_n": "int",
-        "dynamodb_newimage_message_m_rules_l_27_m_actions_l_0_m_de39_s": "string",
-        "dynamodb_newimage_message_m_rules_l_27_m_actions_l_0_m_act_s": "string",
-        "dynamodb_newimage_message_m_rules_l_27_m_actions_l_1_m_exit_code_n": "int",
-        "dynamodb_newimage_message_m_rules_l_27_m_actions_l_1_m_act_s": "string",
-        "dynamodb_newimage_message_m_rules_l_27_m_actions_l_2_m_act_s": "string",
-        "dynamodb_newimage_message_m_rules_l_27_m_actions_l_2_m_nwk_status_n": "int",
-        "dynamodb_newimage_message_m_rules_l_27_m_actions_l_3_m_alert_id_n": "int",
-        "dynamodb_newimage_message_m_rules_l_27_m_actions_l_3_m_act_s": "string",
-        "dynamodb_newimage_message_m_rules_l_39_m_actions_l_0_m_de39_s": "string",
-        "dynamodb_newimage_message_m_rules_l_39_m_actions_l_0_m_act_s": "string",
-        "dynamodb_newimage_message_m_rules_l_39_m_actions_l_1_m_exit_code_n": "int",
-        "dynamodb_newimage_message_m_rules_l_39_m_actions_l_1_m_act_s": "string",
-        "dynamodb_newimage_message_m_rules_l_39_m_actions_l_2_m_act_s": "string",
-        "dynamodb_newimage_message_m_rules_l_39_m_actions_l_2_m_nwk_status_n": "int",
-        "dynamodb_newimage_message_m_iso_msg_m_de54_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de122_s": "string",
-        "dynamodb_new_image_message_m_rules_l_41_m_aggregate_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_41_m_count_deviation_n": "int",
-        "dynamodb_new_image_message_m_rules_l_41_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_41_m_pattern_result_bool": "boolean",
-        "dynamodb_new_image_message_m_rules_l_41_m_rule_check_result_n": "int",
-        "dynamodb_new_image_message_m_rules_l_41_m_rule_id_n": "int",
-        "dynamodb_new_image_message_m_rules_l_41_m_rule_type_s": "string",
-        "dynamodb_new_image_message_m_rules_l_42_m_aggregate_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_42_m_count_deviation_n": "int",
-        "dynamodb_new_image_message_m_rules_l_42_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_42_m_pattern_result_bool": "boolean",
-        "dynamodb_new_image_message_m_rules_l_42_m_rule_check_result_n": "int",
-        "dynamodb_new_image_message_m_rules_l_42_m_rule_id_n": "int",
-        "dynamodb_new_image_message_m_rules_l_42_m_rule_type_s": "string",
-        "dynamodb_new_image_message_m_rules_l_43_m_actions_l_0_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_43_m_actions_l_0_m_de39_s": "string",
-        "dynamodb_new_image_message_m_rules_l_43_m_actions_l_1_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_43_m_actions_l_1_m_exit_code_n": "int",
-        "dynamodb_new_image_message_m_rules_l_43_m_actions_l_2_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_43_m_actions_l_2_m_nwk_status_n": "int",
-        "dynamodb_new_image_message_m_rules_l_43_m_aggregate_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_43_m_count_deviation_n": "int",
-        "dynamodb_new_image_message_m_rules_l_43_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_43_m_pattern_result_bool": "boolean",
-        "dynamodb_new_image_message_m_rules_l_43_m_rule_check_result_n": "int",
-        "dynamodb_new_image_message_m_rules_l_43_m_rule_id_n": "int",
-        "dynamodb_new_image_message_m_rules_l_43_m_rule_type_s": "string",
-        "dynamodb_new_image_message_m_rules_l_44_m_actions_l_0_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_44_m_actions_l_0_m_de39_s": "string",
-        "dynamodb_new_image_message_m_rules_l_44_m_actions_l_1_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_44_m_actions_l_1_m_exit_code_n": "int",
-        "dynamodb_new_image_message_m_rules_l_44_m_actions_l_2_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_44_m_actions_l_2_m_nwk_status_n": "int",
-        "dynamodb_new_image_message_m_rules_l_44_m_aggregate_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_44_m_count_deviation_n": "int",
-        "dynamodb_new_image_message_m_rules_l_44_m_current_txn_amt_deviation_n": "float",
-        "dynamodb_new_image_message_m_rules_l_44_m_pattern_result_bool": "boolean",
-        "dynamodb_new_image_message_m_rules_l_44_m_rule_check_result_n": "int",
-        "dynamodb_new_image_message_m_rules_l_44_m_rule_id_n": "int",
-        "dynamodb_new_image_message_m_rules_l_44_m_rule_type_s": "string",
-        "dynamodb_new_image_message_m_rules_l_42_m_actions_l_0_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_42_m_actions_l_0_m_de39_s": "string",
-        "dynamodb_new_image_message_m_rules_l_42_m_actions_l_1_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_42_m_actions_l_1_m_exit_code_n": "int",
-        "dynamodb_new_image_message_m_rules_l_42_m_actions_l_2_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_42_m_actions_l_2_m_nwk_status_n": "int",
-        "dynamodb_new_image_message_m_iso_msg_m_de48_m_73_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de48_m_41_s": "string",
-        "dynamodb_new_image_message_m_rules_l_14_m_actions_l_0_m_de39_s": "string",
-        "dynamodb_new_image_message_m_rules_l_14_m_actions_l_0_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_14_m_actions_l_1_m_exit_code_n": "int",
-        "dynamodb_new_image_message_m_rules_l_14_m_actions_l_1_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_14_m_actions_l_2_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_14_m_actions_l_2_m_nwk_status_n": "int",
-        "dynamodb_new_image_message_m_processor_validations_m_rules_decision_null": "string",
-        "dynamodb_new_image_message_m_rules_l_32_m_actions_l_0_m_de39_s": "string",
-        "dynamodb_new_image_message_m_rules_l_32_m_actions_l_0_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_32_m_actions_l_1_m_exit_code_n": "bigint",
-        "dynamodb_new_image_message_m_rules_l_32_m_actions_l_1_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_32_m_actions_l_2_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_32_m_actions_l_2_m_nwk_status_n": "bigint",
-        "dynamodb_new_image_message_m_rules_l_33_m_actions_l_0_m_de39_s": "string",
-        "dynamodb_new_image_message_m_rules_l_33_m_actions_l_0_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_33_m_actions_l_1_m_exit_code_n": "bigint",
-        "dynamodb_new_image_message_m_rules_l_33_m_actions_l_1_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_33_m_actions_l_2_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_33_m_actions_l_2_m_nwk_status_n": "bigint",
-        "dynamodb_new_image_message_m_rules_l_14_m_actions_l_3_m_alert_id_n": "int",
-        "dynamodb_new_image_message_m_rules_l_14_m_actions_l_3_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_30_m_actions_l_0_m_de39_s": "string",
-        "dynamodb_new_image_message_m_rules_l_30_m_actions_l_0_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_30_m_actions_l_1_m_exit_code_n": "bigint",
-        "dynamodb_new_image_message_m_rules_l_30_m_actions_l_1_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_30_m_actions_l_2_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_30_m_actions_l_2_m_nwk_status_n": "bigint",
-        "dynamodb_new_image_message_m_rules_l_13_m_actions_l_0_m_de39_s": "string",
-        "dynamodb_new_image_message_m_rules_l_13_m_actions_l_0_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_13_m_actions_l_1_m_exit_code_n": "int",
-        "dynamodb_new_image_message_m_rules_l_13_m_actions_l_1_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_13_m_actions_l_2_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_13_m_actions_l_2_m_nwk_status_n": "int",
-        "dynamodb_new_image_message_m_rules_l_34_m_actions_l_0_m_de39_s": "string",
-        "dynamodb_new_image_message_m_rules_l_34_m_actions_l_0_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_34_m_actions_l_1_m_exit_code_n": "bigint",
-        "dynamodb_new_image_message_m_rules_l_34_m_actions_l_1_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_34_m_actions_l_2_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_34_m_actions_l_2_m_nwk_status_n": "bigint",
-        "dynamodb_new_image_message_m_iso_msg_m_de48_m_05_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de19_s": "string",
-        "dynamodb_new_image_message_m_rules_l_35_m_actions_l_0_m_de39_s": "string",
-        "dynamodb_new_image_message_m_rules_l_35_m_actions_l_0_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_35_m_actions_l_1_m_exit_code_n": "bigint",
-        "dynamodb_new_image_message_m_rules_l_35_m_actions_l_1_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_35_m_actions_l_2_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_35_m_actions_l_2_m_nwk_status_n": "bigint",
-        "dynamodb_new_image_message_m_rules_l_35_m_actions_l_3_m_alert_id_n": "bigint",
-        "dynamodb_new_image_message_m_rules_l_35_m_actions_l_3_m_act_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de48_m_48_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de48_m_14_s": "string",
-        "dynamodb_new_image_message_m_rules_l_33_m_actions_l_3_m_alert_id_n": "bigint",
-        "dynamodb_new_image_message_m_rules_l_33_m_actions_l_3_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_31_m_actions_l_0_m_de39_s": "string",
-        "dynamodb_new_image_message_m_rules_l_31_m_actions_l_0_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_31_m_actions_l_1_m_exit_code_n": "bigint",
-        "dynamodb_new_image_message_m_rules_l_31_m_actions_l_1_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_31_m_actions_l_2_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_31_m_actions_l_2_m_nwk_status_n": "bigint",
-        "dynamodb_new_image_message_m_rules_l_31_m_actions_l_3_m_alert_id_n": "bigint",
-        "dynamodb_new_image_message_m_rules_l_31_m_actions_l_3_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_30_m_actions_l_3_m_alert_id_n": "bigint",
-        "dynamodb_new_image_message_m_rules_l_30_m_actions_l_3_m_act_s": "string",
-        "dynamodb_new_image_message_m_iso_msg_m_de48_m_33_s": "string",
-        "dynamodb_new_image_message_m_rules_l_32_m_actions_l_3_m_alert_id_n": "bigint",
-        "dynamodb_new_image_message_m_rules_l_32_m_actions_l_3_m_act_s": "string",
-        "dynamodb_new_image_message_m_rules_l_0_m": "string",
-        "date": "string",
-    },
-    "dynamo_sls_riskscore_history": {
-        "aws_region": "string",
-        "event_id": "string",
-        "event_name": "string",
-        "user_identity": "string",
-        "record_format": "string",
-        "table_name": "string",
-        "dynamodb_approximate_creation_date_time": "timestamp",
-        "dynamodb_keys_created_at_n": "bigint",
-        "dynamodb_keys_customer_id_s": "string",
-        "dynamodb_new_image_created_at_n": "timestamp",
-        "dynamodb_new_image_customer_s": "string",
-        "dynamodb_new_image_risk_m_rating_s": "string",
-        "dynamodb_new_image_risk_m_initial_overall_score_m_rating_s": "string",
-        "dynamodb_new_image_risk_m_initial_overall_score_m_score_n": "bigint",
-        "dynamodb_new_image_risk_m_initial_overall_score_m_factors_m_delivery_channel_score_m_rating_s": "string",
-        "dynamodb_new_image_risk_m_initial_overall_score_m_factors_m_delivery_channel_score_m_score_n": "bigint",
-        "dynamodb_new_image_risk_m_initial_overall_score_m_factors_m_customer_risk_score_m_rating_s": "string",
-        "dynamodb_new_image_risk_m_initial_overall_score_m_factors_m_customer_risk_score_m_score_n": "bigint",
-        "dynamodb_new_image_risk_m_initial_overall_score_m_factors_m_account_purpose_and_expected_activity_score_m_rating_s": "string",
-        "dynamodb_new_image_risk_m_initial_overall_score_m_factors_m_account_purpose_and_expected_activity_score_m_score_n": "bigint",
-        "dynamodb_new_image_risk_m_initial_overall_score_m_factors_m_jurisdiction_risk_score_m_rating_s": "string",
-        "dynamodb_new_image_risk_m_initial_overall_score_m_factors_m_jurisdiction_risk_score_m_score_n": "bigint",
-        "dynamodb_new_image_risk_m_initial_overall_score_m_factors_m_product_type_score_m_rating_s": "string",
-        "dynamodb_new_image_risk_m_initial_overall_score_m_factors_m_product_type_score_m_score_n": "bigint",
-        "dynamodb_new_image_risk_m_final_overall_score_m_rating_s": "string",
-        "dynamodb_new_image_risk_m_final_overall_score_m_score_n": "bigint",
-        "dynamodb_new_image_risk_m_final_overall_score_m_factors_m_additional_risk_score_m_rating_s": "string",
-        "dynamodb_new_image_risk_m_final_overall_score_m_factors_m_additional_risk_score_m_score_n": "bigint",
-        "dynamodb_new_image_status_s": "string",
-        "dynamodb_new_image_customer_id_s": "string",
-        "dynamodb_size_bytes": "string",
-        "event_source": "string",
-        "timestamp_extracted": "string",
-        "dynamodb_new_image_grouping_m_group_s": "string",
-        "dynamodb_new_image_grouping_m_subgroup_s": "string",
-        "date": "string",
-    },
-    "dynamo_sls_cards_rules": {
-        "aws_region": "string",
-        "event_id": "string",
-        "event_name": "string",
-        "record_format": "string",
-        "table_name": "string",
-        "dynamodb_approximate_creation_date_time": "string",
-        "dynamodb_keys_id_s": "string",
-        "dynamodb_new_image_notification_type_s": "string",
-        "dynamodb_new_image_rule_type_s": "string",
-        "dynamodb_new_image_rule_id_n": "string",
-        "dynamodb_new_image_id_s": "string",
-        "dynamodb_new_image_notification_channels_l_0_s": "string",
-        "dynamodb_new_image_notification_channels_l_1_s": "string",
-        "dynamodb_new_image_rule_description_s": "string",
-        "dynamodb_size_bytes": "string",
-        "event_source": "string",
-        "timestamp_extracted": "timestamp",
-        "date": "string",
-    },
-    "dynamo_sls_cards_disabled_rules_history": {
-        "aws_region": "string",
-        "event_id": "string",
-        "event_name": "string",
-        "record_format": "string",
-        "table_name": "string",
-        "dynamodb_approximate_creation_date_time": "string",
-        "dynamodb_keys_id_s": "string",
-        "dynamodb_new_image_token_n": "bigint",
-        "dynamodb_new_image_caller_id_s": "string",
-        "dynamodb_new_image_expires_at_n": "string",
-        "dynamodb_new_image_updated_at_n": "string",
-        "dynamodb_new_image_created_at_n": "string",
-        "dynamodb_new_image_rule_id_n": "string",
-        "dynamodb_new_image_id_s": "string",
-        "dynamodb_size_bytes": "string",
-        "event_source": "string",
-        "timestamp_extracted": "timestamp",
-        "date": "string",
-    },
-    "dynamo_sls_investments_model_portfolio": {
-        "aws_region": "string",
-        "event_id": "string",
-        "event_name": "string",
-        "record_format": "string",
-        "table_name": "string",
-        "dynamodb_approximate_creation_date_time": "string",
-        "dynamodb_keys_id_s": "string",
-        "dynamodb_new_image_currency_s": "string",
-        "dynamodb_new_image_risk_id_n": "string",
-        "dynamodb_new_image_created_at_n": "string",
-        "dynamodb_new_image_name_s": "string",
-        "dynamodb_new_image_distribution_l_0_m_weight_n": "string",
-        "dynamodb_new_image_distribution_l_0_m_description_s": "string",
-        "dynamodb_new_image_distribution_l_0_m_key_s": "string",
-        "dynamodb_new_image_distribution_l_1_m_weight_n": "string",
-        "dynamodb_new_image_distribution_l_1_m_description_s": "string",
-        "dynamodb_new_image_distribution_l_1_m_key_s": "string",
-        "dynamodb_new_image_distribution_l_2_m_weight_n": "string",
-        "dynamodb_new_image_distribution_l_2_m_description_s": "string",
-        "dynamodb_new_image_distribution_l_2_m_key_s": "string",
-        "dynamodb_new_image_distribution_l_3_m_weight_n": "string",
-        "dynamodb_new_image_distribution_l_3_m_description_s": "string",
-        "dynamodb_new_image_distribution_l_3_m_key_s": "string",
-        "dynamodb_new_image_distribution_l_4_m_weight_n": "string",
-        "dynamodb_new_image_distribution_l_4_m_description_s": "string",
-        "dynamodb_new_image_distribution_l_4_m_key_s": "string",
-        "dynamodb_new_image_compositions_m_date_s": "string",
-        "dynamodb_new_image_compositions_m_date_as_string_s": "string",
-        "dynamodb_new_image_compositions_m_instruments_l_0_m_weight_n": "string",
-        "dynamodb_new_image_compositions_m_instruments_l_0_m_instrument_id_s": "string",
-        "dynamodb_new_image_compositions_m_instruments_l_0_m_provider_instrument_id_s": "string",
-        "dynamodb_new_image_compositions_m_instruments_l_1_m_weight_n": "string",
-        "dynamodb_new_image_compositions_m_instruments_l_1_m_instrument_id_s": "string",
-        "dynamodb_new_image_compositions_m_instruments_l_1_m_provider_instrument_id_s": "string",
-        "dynamodb_new_image_compositions_m_instruments_l_2_m_weight_n": "string",
-        "dynamodb_new_image_compositions_m_instruments_l_2_m_instrument_id_s": "string",
-        "dynamodb_new_image_compositions_m_instruments_l_2_m_provider_instrument_id_s": "string",
-        "dynamodb_new_image_compositions_m_instruments_l_3_m_weight_n": "string",
-        "dynamodb_new_image_compositions_m_instruments_l_3_m_instrument_id_s": "string",
-        "dynamodb_new_image_compositions_m_instruments_l_3_m_provider_instrument_id_s": "string",
-        "dynamodb_new_image_compositions_m_instruments_l_4_m_weight_n": "string",
-        "dynamodb_new_image_compositions_m_instruments_l_4_m_instrument_id_s": "string",
-        "dynamodb_new_image_compositions_m_instruments_l_4_m_provider_instrument_id_s": "string",
-        "dynamodb_new_image_compositions_m_instruments_l_5_m_weight_n": "string",
-        "dynamodb_new_image_compositions_m_instruments_l_5_m_instrument_id_s": "string",
-        "dynamodb_new_image_compositions_m_instruments_l_5_m_provider_instrument_id_s": "string",
-        "dynamodb_new_image_compositions_m_instruments_l_6_m_weight_n": "string",
-        "dynamodb_new_image_compositions_m_instruments_l_6_m_instrument_id_s": "string",
-        "dynamodb_new_image_compositions_m_instruments_l_6_m_provider_instrument_id_s": "string",
-        "dynamodb_new_image_compositions_m_instruments_l_7_m_weight_n": "string",
-        "dynamodb_new_image_compositions_m_instruments_l_7_m_instrument_id_s": "string",
-        "dynamodb_new_image_compositions_m_instruments_l_7_m_provider_instrument_id_s": "string",
-        "dynamodb_new_image_compositions_m_instruments_l_8_m_weight_n": "string",
-        "dynamodb_new_image_compositions_m_instruments_l_8_m_instrument_id_s": "string",
-        "dynamodb_new_image_compositions_m_instruments_l_8_m_provider_instrument_id_s": "string",
-        "dynamodb_new_image_management_fee_n": "string",
-        "dynamodb_new_image_benchmark10_yperformance_n": "string",
-        "dynamodb_new_image_provider_model_porfolio_id_s": "string",
-        "dynamodb_new_image_volatility_n": "double",
-        "dynamodb_new_image_annual_performance_m_performance_n": "string",
-        "dynamodb_new_image_annual_performance_m_performance_ytd_n": "string",
-        "dynamodb_new_image_annual_performance_m_performance1_m_n": "string",
-        "dynamodb_new_image_annual_performance_m_performance_mtd_n": "string",
-        "dynamodb_new_image_annual_performance_m_performance3_m_n": "string",
-        "dynamodb_new_image_annual_performance_m_performance1_y_n": "string",
-        "dynamodb_new_image_annual_performance_m_performance6_m_n": "string",
-        "dynamodb_new_image_annual_performance_m_performance2_y_n": "string",
-        "dynamodb_new_image_annual_performance_m_performance3_y_n": "string",
-        "dynamodb_new_image_annual_performance_m_performance9_m_n": "string",
-        "dynamodb_new_image_annual_performance_m_performance5_y_n": "string",
-        "dynamodb_new_image_thematic_id_s": "string",
-        "dynamodb_new_image_updated_at_n": "string",
-        "dynamodb_new_image_performance_annualized_null": "boolean",
-        "dynamodb_new_image_provider_s": "string",
-        "dynamodb_new_image_volatility_annualized_n": "string",
-        "dynamodb_new_image_id_s": "string",
-        "dynamodb_new_image_benchmark_id_s": "string",
-        "dynamodb_size_bytes": "string",
-        "event_source": "string",
-        "dynamodb_new_image_compositions_m_instruments_l_9_m_weight_n": "string",
-        "dynamodb_new_image_compositions_m_instruments_l_9_m_instrument_id_s": "string",
-        "dynamodb_new_image_compositions_m_instruments_l_9_m_provider_instrument_id_s": "string",
-        "dynamodb_new_image_performance_annualized_n": "string",
-        "timestamp_extracted": "timestamp",
-        "dynamodb_new_image_performance_annualized_s": "string",
-        "dynamodb_new_image_benchmark5_yperformance_n": "string",
-        "date": "string",
-    },
-    "dynamo_sls_investments_model_portfolio_rebalance": {
-        "aws_region": "string",
-        "event_id": "string",
-        "event_name": "string",
-        "record_format": "string",
-        "table_name": "string",
-        "dynamodb_approximate_creation_date_time": "string",
-        "dynamodb_keys_id_s": "string",
-        "dynamodb_new_image_rebalance_type_s": "string",
-        "dynamodb_new_image_internal_status_history_l_0_m_created_at_s": "string",
-        "dynamodb_new_image_internal_status_history_l_0_m_status_s": "string",
-        "dynamodb_new_image_currency_s": "string",
-        "dynamodb_new_image_user_id_s": "string",
-        "dynamodb_new_image_updated_at_n": "string",
-        "dynamodb_new_image_requested_amount_n": "string",
-        "dynamodb_new_image_is_fees_collection_bool": "boolean",
-        "dynamodb_new_image_created_at_n": "string",
-        "dynamodb_new_image_internal_status_s": "string",
-        "dynamodb_new_image_scope_s": "string",
-        "dynamodb_new_image_id_s": "string",
-        "dynamodb_new_image_name_s": "string",
-        "dynamodb_size_bytes": "bigint",
-        "event_source": "string",
-        "dynamodb_new_image_internal_status_history_l_1_m_created_at_s": "string",
-        "dynamodb_new_image_internal_status_history_l_1_m_status_s": "string",
-        "timestamp_extracted": "timestamp",
-        "dynamodb_new_image_internal_status_history_l_2_m_created_at_s": "string",
-        "dynamodb_new_image_internal_status_history_l_2_m_status_s": "string",
-        "dynamodb_new_image_entity_s": "string",
-        "dynamodb_new_image_status_s": "string",
-        "dynamodb_new_image_rebalance_id_s": "string",
-        "dynamodb_new_image_status_history_l_0_m_date_s": "string",
-        "dynamodb_new_image_status_history_l_0_m_user_id_s": "string",
-        "dynamodb_new_image_status_history_l_0_m_status_s": "string",
-        "dynamodb_new_image_date_s": "string",
-        "dynamodb_new_image_contract_id_s": "string",
-        "dynamodb_new_image_contribution_m_destination_s": "string",
-        "dynamodb_new_image_contribution_m_quantity_n": "double",
-        "dynamodb_new_image_date_as_string_s": "string",
-        "dynamodb_new_image_status_extra_data_s": "string",
-        "dynamodb_new_image_internal_status_history_l_3_m_created_at_s": "string",
-        "dynamodb_new_image_internal_status_history_l_3_m_status_s": "string",
-        "dynamodb_new_image_internal_status_history_l_4_m_created_at_s": "string",
-        "dynamodb_new_image_internal_status_history_l_4_m_status_s": "string",
-        "dynamodb_new_image_internal_status_history_l_5_m_created_at_s": "string",
-        "dynamodb_new_image_internal_status_history_l_5_m_status_s": "string",
-        "dynamodb_new_image_internal_status_history_l_6_m_created_at_s": "string",
-        "dynamodb_new_image_internal_status_history_l_6_m_status_s": "string",
-        "dynamodb_new_image_internal_status_history_l_7_m_created_at_s": "string",
-        "dynamodb_new_image_internal_status_history_l_7_m_status_s": "string",
-        "dynamodb_new_image_provider_model_portfolio_id_s": "string",
-        "dynamodb_new_image_internal_status_history_l_8_m_created_at_s": "string",
-        "dynamodb_new_image_internal_status_history_l_8_m_status_s": "string",
-        "dynamodb_new_image_internal_status_history_l_9_m_created_at_s": "string",
-        "dynamodb_new_image_internal_status_history_l_9_m_status_s": "string",
-        "dynamodb_new_image_internal_status_history_l_10_m_created_at_s": "string",
-        "dynamodb_new_image_internal_status_history_l_10_m_status_s": "string",
-        "dynamodb_new_image_internal_status_history_l_11_m_created_at_s": "string",
-        "dynamodb_new_image_internal_status_history_l_11_m_status_s": "string",
-        "dynamodb_new_image_internal_status_history_l_12_m_created_at_s": "string",
-        "dynamodb_new_image_internal_status_history_l_12_m_status_s": "string",
-        "dynamodb_new_image_refund_m_quantity_type_s": "string",
-        "dynamodb_new_image_refund_m_total_bool": "boolean",
-        "dynamodb_new_image_refund_m_quantity_n": "string",
-        "dynamodb_new_image_refund_m_origin_s": "string",
-        "dynamodb_new_image_sell_entire_holdings_bool": "boolean",
-        "dynamodb_new_image_trigger_type_s": "string",
-        "date": "string",
-    },
-    "dynamo_sls_investments_instrument": {
-        "aws_region": "string",
-        "event_id": "string",
-        "event_name": "string",
-        "record_format": "string",
-        "table_name": "string",
-        "dynamodb_approximate_creation_date_time": "string",
-        "dynamodb_keys_id_s": "string",
-        "dynamodb_new_image_provider_instrument_id_s": "string",
-        "dynamodb_new_image_currency_s": "string",
-        "dynamodb_new_image_updated_at_n": "string",
-        "dynamodb_new_image_created_at_n": "string",
-        "dynamodb_new_image_provider_s": "string",
-        "dynamodb_new_image_instrument_type_n": "string",
-        "dynamodb_new_image_id_s": "string",
-        "dynamodb_new_image_name_s": "string",
-        "dynamodb_new_image_isin_s": "string",
-        "dynamodb_size_bytes": "bigint",
-        "event_source": "string",
-        "timestamp_extracted": "timestamp",
-        "dynamodb_new_image_fund_manager_s": "string",
-        "date": "string",
-    },
-    "dynamo_sls_investments_dividend": {
-        "dynamodb_new_image_encoded_key_s": "string",
-        "dynamodb_new_image_provider_account_id_s": "int",
-        "dynamodb_new_image_settlement_amount_n": "double",
-        "dynamodb_new_image_status_s": "string",
-        "dynamodb_new_image_trace_l_0_s": "string",
-        "dynamodb_new_image_trace_l_1_s": "string",
-        "dynamodb_new_image_created_at_n": "bigint",
-        "dynamodb_new_image_settlement_currency_s": "string",
-        "dynamodb_new_image_settlement_date_s": "string",
-        "dynamodb_new_image_provider_dividend_id_s": "string",
-        "dynamodb_new_image_confirmed_at_s": "timestamp",
-        "dynamodb_new_image_investment_name_s": "string",
-        "dynamodb_new_image_updated_at_n": "string",
-        "dynamodb_new_image_user_id_s": "string",
-        "dynamodb_new_image_confirmation_m_dividend_general_data_m_confirmation_date_s": "date",
-        "dynamodb_new_image_confirmation_m_dividend_general_data_m_ccc_s": "string",
-        "dynamodb_new_image_confirmation_m_dividend_general_data_m_calculated_cross_amount_n": "double",
-        "dynamodb_new_image_confirmation_m_dividend_general_data_m_distribution_type_s": "string",
-        "dynamodb_new_image_confirmation_m_dividend_general_data_m_secondary_key_s": "string",
-        "dynamodb_new_image_confirmation_m_dividend_general_data_m_franked_percentage_n": "string",
-        "dynamodb_new_image_confirmation_m_dividend_general_data_m_fund_code_s": "string",
-        "dynamodb_new_image_confirmation_m_dividend_general_data_m_price_n": "string",
-        "dynamodb_new_image_confirmation_m_dividend_general_data_m_ccv_s": "string",
-        "dynamodb_new_image_confirmation_m_dividend_general_data_m_gross_interest_n": "double",
-        "dynamodb_new_image_confirmation_m_dividend_general_data_m_transfer_reference_s": "string",
-        "dynamodb_new_image_confirmation_m_dividend_general_data_m_net_liability_to_corporation_tax_per_share_n": "string",
-        "dynamodb_new_image_confirmation_m_dividend_general_data_m_all_funds_fund_code_s": "string",
-        "dynamodb_new_image_confirmation_m_dividend_general_data_m_source_contract_s": "string",
-        "dynamodb_new_image_confirmation_m_dividend_general_data_m_fund_identification_type_s": "string",
-        "dynamodb_new_image_confirmation_m_dividend_general_data_m_distribution_number_s": "string",
-        "dynamodb_new_image_confirmation_m_dividend_general_data_m_type_of_distribution_s": "string",
-        "dynamodb_new_image_confirmation_m_dividend_general_data_m_settlement_date_s": "date",
-        "dynamodb_new_image_confirmation_m_dividend_general_data_m_operation_number2_s": "string",
-        "dynamodb_new_image_confirmation_m_dividend_general_data_m_shares_on_ex_dividend_date_n": "string",
-        "dynamodb_new_image_confirmation_m_dividend_general_data_m_sequence_s": "string",
-        "dynamodb_new_image_confirmation_m_dividend_general_data_m_data_time_s": "string",
-        "dynamodb_new_image_confirmation_m_dividend_general_data_m_amount_to_be_settled_n": "double",
-        "dynamodb_new_image_confirmation_m_dividend_general_data_m_deposit_s": "string",
-        "dynamodb_new_image_confirmation_m_dividend_general_data_m_operation_type_s": "string",
-        "dynamodb_new_image_confirmation_m_dividend_general_data_m_group_one_shares_n": "double",
-        "dynamodb_new_image_confirmation_m_dividend_general_data_m_fund_name_s": "string",
-        "dynamodb_new_image_confirmation_m_dividend_general_data_m_payment_currency_s": "string",
-        "dynamodb_new_image_confirmation_m_dividend_general_data_m_confirmed_shares_n": "string",
-        "dynamodb_new_image_confirmation_m_dividend_general_data_m_f_hofficial_payment_date_s": "date",
-        "dynamodb_new_image_confirmation_m_dividend_general_data_m_operation_date_s": "date",
-        "dynamodb_new_image_confirmation_m_dividend_general_data_m_distributor_code_s": "string",
-        "dynamodb_new_image_confirmation_m_dividend_general_data_m_ratio_per_share_group_two_n": "double",
-        "dynamodb_new_image_confirmation_m_dividend_general_data_m_operation_number_s": "string",
-        "dynamodb_new_image_confirmation_m_dividend_general_data_m_record_date_s": "date",
-        "dynamodb_new_image_confirmation_m_dividend_general_data_m_currency_s": "string",
-        "dynamodb_new_image_confirmation_m_dividend_general_data_m_group_two_shares_n": "double",
-        "dynamodb_new_image_confirmation_m_dividend_general_data_m_all_funds_operation_number2_s": "string",
-        "dynamodb_new_image_confirmation_m_dividend_general_data_m_product_s": "string",
-        "dynamodb_new_image_confirmation_m_dividend_general_data_m_data_date_s": "date",
-        "dynamodb_new_image_confirmation_m_dividend_general_data_m_all_funds_operation_number_s": "string",
-        "dynamodb_new_image_confirmation_m_dividend_general_data_m_record_type_s": "string",
-        "dynamodb_new_image_confirmation_m_dividend_general_data_m_record_subtype_s": "string",
-        "dynamodb_new_image_confirmation_m_dividend_general_data_m_agreed_fixing_currency_s": "string",
-        "dynamodb_new_image_confirmation_m_dividend_general_data_m_value_date_s": "date",
-        "dynamodb_new_image_confirmation_m_dividend_general_data_m_total_net_liability_to_corporation_tax_per_fund_n": "string",
-        "dynamodb_new_image_confirmation_m_dividend_general_data_m_distributor_s": "string",
-        "dynamodb_new_image_confirmation_m_dividend_general_data_m_calculated_net_amount_n": "double",
-        "dynamodb_new_image_confirmation_m_dividend_general_data_m_counter_value_n": "double",
-        "dynamodb_new_image_confirmation_m_dividend_general_data_m_all_funds_contract_n": "string",
-        "dynamodb_new_image_confirmation_m_dividend_general_data_m_total_exchange_rate_n": "string",
-        "dynamodb_new_image_confirmation_m_dividend_general_data_m_reinvested_amount_n": "string",
-        "dynamodb_new_image_confirmation_m_dividend_general_data_m_equalisation_amount_net_n": "double",
-        "dynamodb_new_image_confirmation_m_dividend_general_data_m_equalization_init_date_s": "date",
-        "dynamodb_new_image_confirmation_m_dividend_general_data_m_net_income_n": "double",
-        "dynamodb_new_image_confirmation_m_dividend_general_data_m_sub_distributor_s": "string",
-        "dynamodb_new_image_confirmation_m_dividend_general_data_m_ratio_per_share_n": "double",
-        "dynamodb_new_image_confirmation_m_dividend_general_data_m_primary_key_s": "string",
-        "dynamodb_new_image_confirmation_m_dividend_general_data_m_equalization_ratio_n": "double",
-        "dynamodb_new_image_provider_s": "string",
-        "dynamodb_new_image_provider_investment_id_s": "string",
-        "dynamodb_new_image_id_s": "string",
-        "dynamodb_new_image_trace_l_0_m_created_at_s": "timestamp",
-        "dynamodb_new_image_trace_l_0_m_status_s": "string",
-        "dynamodb_new_image_trace_l_1_m_created_at_s": "timestamp",
-        "dynamodb_new_image_trace_l_1_m_status_s": "string",
-        "dynamodb_keys_id_s": "string",
-        "event_source": "string",
-        "timestamp_extracted": "timestamp",
-        "aws_region": "string",
-        "event_id": "string",
-        "event_name": "string",
-        "record_format": "string",
-        "table_name": "string",
-        "dynamodb_approximate_creation_date_time": "string",
-        "dynamodb_size_bytes": "bigint",
-        "date": "string",
-    },
-    "dynamo_sls_investments_daily_fees": {
-        "dynamodb_new_image_fees_m_value_n": "double",
-        "dynamodb_new_image_fees_m_currency_s": "string",
-        "dynamodb_new_image_user_id_s": "string",
-        "dynamodb_new_image_updated_at_n": "string",
-        "dynamodb_new_image_created_at_n": "bigint",
-        "dynamodb_new_image_aum_n": "double",
-        "dynamodb_new_image_creation_date_s": "timestamp",
-        "dynamodb_new_image_id_s": "string",
-        "dynamodb_new_image_fund_provider_s": "string",
-        "dynamodb_keys_id_s": "string",
-        "event_source": "string",
-        "timestamp_extracted": "timestamp",
-        "aws_region": "string",
-        "event_id": "string",
-        "event_name": "string",
-        "record_format": "string",
-        "table_name": "string",
-        "dynamodb_approximate_creation_date_time": "string",
-        "dynamodb_size_bytes": "bigint",
-        "date": "string",
-    },
-    "dynamo_sls_investments_monthly_fees": {
-        "dynamodb_new_image_collection_status_s": "string",
-        "dynamodb_new_image_fees_m_value_n": "double",
-        "dynamodb_new_image_fees_m_currency_s": "string",
-        "dynamodb_new_image_user_id_s": "string",
-        "dynamodb_new_image_updated_at_n": "string",
-        "dynamodb_new_image_created_at_n": "bigint",
-        "dynamodb_new_image_creation_date_s": "timestamp",
-        "dynamodb_new_image_id_s": "string",
-        "dynamodb_new_image_fund_provider_s": "string",
-        "dynamodb_new_image_rebalance_record_id_s": "string",
-        "dynamodb_new_image_collection_method_s": "string",
-        "dynamodb_keys_id_s": "string",
-        "event_source": "string",
-        "timestamp_extracted": "timestamp",
-        "aws_region": "string",
-        "event_id": "string",
-        "event_name": "string",
-        "record_format": "string",
-        "table_name": "string",
-        "dynamodb_approximate_creation_date_time": "string",
-        "dynamodb_size_bytes": "bigint",
-        "dynamodb_new_image_transaction_id_s": "string",
-        "date": "string",
-    },
-    "dynamo_sls_instant_savings_accounts_products": {
-        "dynamodb_new_image_max_amount_n": "int",
-        "dynamodb_new_image_updated_at_n": "string",
-        "dynamodb_new_image_tiers_l_0_m_tier_n": "int",
-        "dynamodb_new_image_tiers_l_0_m_min_amount_n": "int",
-        "dynamodb_new_image_tiers_l_0_m_rate_n": "double",
-        "dynamodb_new_image_tiers_l_1_m_tier_n": "int",
-        "dynamodb_new_image_tiers_l_1_m_min_amount_n": "int",
-        "dynamodb_new_image_tiers_l_1_m_rate_n": "double",
-        "dynamodb_new_image_tiers_l_2_m_tier_n": "int",
-        "dynamodb_new_image_tiers_l_2_m_min_amount_n": "int",
-        "dynamodb_new_image_tiers_l_2_m_rate_n": "double",
-        "dynamodb_new_image_currency_code_s": "string",
-        "dynamodb_new_image_sk_s": "string",
-        "dynamodb_new_image_customer_tier_s": "string",
-        "dynamodb_new_image_pk_s": "string",
-        "dynamodb_new_image_name_s": "string",
-        "dynamodb_new_image_min_amount_n": "int",
-        "dynamodb_new_image_product_encoded_key_s": "string",
-        "dynamodb_new_image_product_id_s": "string",
-        "dynamodb_keys_pk_s": "string",
-        "event_source": "string",
-        "timestamp_extracted": "timestamp",
-        "aws_region": "string",
-        "event_id": "string",
-        "event_name": "string",
-        "record_format": "string",
-        "table_name": "string",
-        "dynamodb_approximate_creation_date_time": "string",
-        "dynamodb_keys_sk_s": "string",
-        "dynamodb_size_bytes": "bigint",
-        "date": "string",
-    },
-}
+Each Athena table is stored in its own JSON file under `catalog/`
+({"schema": {...}, "column_comments": {...}}), and `schemas` / `column_comments`
+load a table on first access only, so a stream only ever parses its own table.
+
+CATALOG_DIR defaults to the `catalog/` folder next to this module and can be
+pointed elsewhere (including an s3:// prefix) with the DATA_CATALOG_DIR
+environment variable or by assigning it before the first lookup.
+"""
+import json
+import os
+from collections.abc import Mapping
+from functools import lru_cache
+
+CATALOG_DIR = os.environ.get(
+    "DATA_CATALOG_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "catalog"),
+)
+
+
+def _catalog_path(name: str) -> str:
+    return f"{CATALOG_DIR.rstrip('/')}/{name}"
+
+
+def _read_catalog_file(name: str) -> bytes:
+    path = _catalog_path(name)
+
+    if path.startswith("s3://"):
+        import boto3
+        from botocore.exceptions import ClientError
+
+        bucket, key = path[len("s3://") :].split("/", 1)
+        try:
+            response = boto3.client("s3").get_object(Bucket=bucket, Key=key)
+        except ClientError as e:
+            if e.response["Error"]["Code"] in ("NoSuchKey", "404"):
+                raise FileNotFoundError(path) from e
+            raise
+        return response["Body"].read()
+
+    with open(path, "rb") as catalog_file:
+        return catalog_file.read()
+
+
+@lru_cache(maxsize=None)
+def load_table(athena_table: str) -> dict:
+    """
+    Loads the catalog entry of an Athena table, once per container.
+    :param athena_table: The Athena table name
+    :return: Dict with the table "schema" and "column_comments"
+    """
+    try:
+        return json.loads(_read_catalog_file(f"{athena_table}.json"))
+    except FileNotFoundError as e:
+        raise KeyError(athena_table) from e
+
+
+def table_exists(athena_table: str) -> bool:
+    """
+    Whether the catalog has an entry for an Athena table. Only a missing entry
+    answers False, other S3 errors (ex. AccessDenied) are raised.
+    """
+    path = _catalog_path(f"{athena_table}.json")
+
+    if path.startswith("s3://"):
+        import boto3
+        from botocore.exceptions import ClientError
+
+        bucket, key = path[len("s3://") :].split("/", 1)
+        try:
+            boto3.client("s3").head_object(Bucket=bucket, Key=key)
+        except ClientError as e:
+            if e.response["Error"]["Code"] in ("NoSuchKey", "404"):
+                return False
+            raise
+        return True
+
+    return os.path.isfile(path)
+
+
+def list_tables() -> list:
+    """
+    Lists the Athena tables available in the catalog directory, local or s3://.
+    """
+    if CATALOG_DIR.startswith("s3://"):
+        import awswrangler as wr
+
+        prefix = f"{CATALOG_DIR.rstrip('/')}/"
+        file_names = [
+            path[len(prefix) :] for path in wr.s3.list_objects(prefix, suffix=".json")
+        ]
+    else:
+        file_names = os.listdir(CATALOG_DIR)
+
+    return sorted(
+        file_name[: -len(".json")]
+        for file_name in file_names
+        if file_name.endswith(".json") and "/" not in file_name
+    )
+
+
+class LazyCatalog(Mapping):
+    """
+    Read-only mapping of Athena table name -> one section of its catalog entry.
+    """
+
+    def __init__(self, section: str):
+        self.section = section
+
+    def __getitem__(self, athena_table: str) -> dict:
+        return load_table(athena_table)[self.section]
+
+    def __contains__(self, athena_table) -> bool:
+        if not isinstance(athena_table, str):
+            return False
+        return table_exists(athena_table)
+
+    def __iter__(self):
+        return iter(list_tables())
+
+    def __len__(self) -> int:
+        return len(list_tables())
+
+
+schemas = LazyCatalog("schema")
+column_comments = LazyCatalog("column_comments")
@@ -1,13 +1,20 @@
+import os
+
+from buffered_writer import batch_id, flush_due_tables, write_buffered_to_s3
 from utils import (
     parse_payload,
     apply_schema,
     write_processed_to_s3,
     log_function,
     log_event,
+    trace_invocation,
 )
 
 from data_catalog import schemas
 
+# Stage batches and write them as right-sized files instead of one file per invocation
+BUFFERED_WRITES = os.environ.get("BUFFERED_WRITES", "false").lower() == "true"
+
 
 # Dynamo to Athena table mapping
 TABLE_MAPPING = {
@@ -61,6 +68,7 @@ TABLE_MAPPING = {
 }
 
 
+@trace_invocation
 @log_function
 def lambda_handler(event, context):
     """
@@ -71,6 +79,11 @@ def lambda_handler(event, context):
     :return: The result of the specified action.
     """
     try:
+        if event.get("buffer_flush"):
+            flushed = flush_due_tables()
+            log_event("info", "buffer_flush", f"Flushed staged tables: {flushed}")
+            return True
+
         event_id = event["Records"][0]["eventID"]
         log_event("info", "event_id", f"Processing event with ID: {event_id}")
 
@@ -96,12 +109,17 @@ def lambda_handler(event, context):
         )
 
         try:
-            final_df = apply_schema(df, schemas[athena_table_name])
+            final_df = apply_schema(df, schemas[athena_table_name], athena_table_name)
         except Exception as e:
             log_event("error", "apply_schema_error", f"Schema applying failed: {e}")
             raise ValueError(f"Schema mismatch for {athena_table_name}") from e
 
-        write_processed_to_s3(final_df, athena_table_name)
+        if BUFFERED_WRITES:
+            write_buffered_to_s3(
+                final_df, athena_table_name, staged_batch_id=batch_id(event["Records"])
+            )
+        else:
+            write_processed_to_s3(final_df, athena_table_name)
 
         return True
 
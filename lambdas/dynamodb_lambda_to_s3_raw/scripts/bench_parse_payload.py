@@ -0,0 +1,88 @@
+"""
+Benchmarks the batch decoder used by parse_payload against the legacy
+replace("{}")/replace("[]") + json.loads + flatten_json chain.
+
+Usage (from the lambda directory):
+    python scripts/bench_parse_payload.py [recorded_event.json ...] [--repeat N]
+
+Each recorded event is a Kinesis Lambda event as delivered to the function
+({"Records": [...]}). Without arguments a synthetic 10,000 record batch is used.
+"""
+import argparse
+import base64
+import json
+import os
+import sys
+import timeit
+
+import pandas as pd
+from flatten_json import flatten
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from utils import decode_records  # noqa: E402
+
+
+def legacy_decode(records: list) -> pd.DataFrame:
+    frames = []
+    for record in records:
+        payload = base64.b64decode(record["kinesis"]["data"]).decode("UTF-8")
+        payload = payload.replace("{}", "null").replace("[]", "null")
+        json_payload = json.loads(payload)
+        if "OldImage" in json_payload.get("dynamodb", {}):
+            del json_payload["dynamodb"]["OldImage"]
+        frames.append(flatten(json_payload))
+    return pd.DataFrame(frames)
+
+
+def columnar_decode(records: list) -> pd.DataFrame:
+    return pd.DataFrame(decode_records(records))
+
+
+def synthetic_records(count: int = 10000) -> list:
+    records = []
+    for i in range(count):
+        image = {
+            "id": {"S": f"id-{i}"},
+            "amount": {"N": str(i)},
+            "isActive": {"BOOL": i % 2 == 0},
+            "details": {"M": {"createdAt": {"N": "1700000000000"}, "tags": {"L": [{"S": "a"}]}}},
+            "rules": {"M": {}},
+        }
+        payload = {
+            "eventName": "MODIFY",
+            "dynamodb": {
+                "ApproximateCreationDateTime": 1700000000000 + i,
+                "Keys": {"id": {"S": f"id-{i}"}},
+                "NewImage": image,
+                "OldImage": image,
+            },
+        }
+        data = base64.b64encode(json.dumps(payload).encode("utf-8")).decode("utf-8")
+        records.append({"kinesis": {"data": data}})
+    return records
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("events", nargs="*", help="Recorded Kinesis event JSON files")
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    batches = {}
+    for path in args.events:
+        with open(path, "r") as event_file:
+            batches[path] = json.load(event_file)["Records"]
+    if not batches:
+        batches["synthetic"] = synthetic_records()
+
+    for name, records in batches.items():
+        legacy = min(timeit.repeat(lambda: legacy_decode(records), number=1, repeat=args.repeat))
+        columnar = min(timeit.repeat(lambda: columnar_decode(records), number=1, repeat=args.repeat))
+        print(
+            f"{name}: {len(records)} records | legacy {legacy:.3f}s | "
+            f"columnar {columnar:.3f}s | speedup x{legacy / columnar:.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""
+Measures the cold-start cost of importing data_catalog and looking up one table.
+
+Usage (from the lambda directory):
+    python scripts/measure_catalog_import.py [athena_table]
+
+Run it without bytecode (PYTHONDONTWRITEBYTECODE=1, no __pycache__) to match a
+Lambda cold start. Each run must happen in a fresh interpreter.
+"""
+import os
+import resource
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+
+def main():
+    athena_table = sys.argv[1] if len(sys.argv) > 1 else "dynamo_sls_cards"
+
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+
+    import data_catalog
+
+    schema = data_catalog.schemas[athena_table]
+    data_catalog.column_comments[athena_table]
+
+    elapsed = time.perf_counter() - start
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    print(
+        f"{athena_table}: {len(schema)} columns | import + lookup {elapsed * 1000:.1f} ms | "
+        f"max RSS +{(rss_after - rss_before) / 1024:.1f} MB"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+import os
+import sys
+import json
+from datetime import datetime
+from datetime import timezone
+from unittest.mock import patch
+
+import boto3
+import pandas as pd
+import awswrangler as wr
+import pytest
+from moto import mock_aws
+
+sys.path.append(os.path.abspath("../"))
+import buffered_writer
+from buffered_writer import (
+    batch_id,
+    flush_due,
+    flush_table,
+    list_staged_batches,
+    select_flush_batches,
+    stage_batch,
+    write_buffered_to_s3,
+)
+
+BUCKET = "test-raw-bucket"
+TABLE = "test_table"
+
+
+@pytest.fixture
+def s3():
+    with patch.dict(
+        os.environ,
+        {
+            "AWS_DEFAULT_REGION": "eu-west-2",
+            "AWS_ACCESS_KEY_ID": "testing",
+            "AWS_SECRET_ACCESS_KEY": "testing",
+            "S3_RAW": BUCKET,
+        },
+    ), mock_aws(), patch("utils.data_catalog") as mock_data_catalog:
+        mock_data_catalog.schemas = {TABLE: {"id": "string", "amount": "bigint"}}
+        mock_data_catalog.column_comments = {TABLE: {}}
+        buffered_writer._s3_client = None
+
+        client = boto3.client("s3")
+        client.create_bucket(
+            Bucket=BUCKET,
+            CreateBucketConfiguration={"LocationConstraint": "eu-west-2"},
+        )
+        boto3.client("glue").create_database(DatabaseInput={"Name": "datalake_raw"})
+
+        yield client
+
+        buffered_writer._s3_client = None
+
+
+def batch(start: int, rows: int = 3) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "id": [str(i) for i in range(start, start + rows)],
+            "amount": list(range(start, start + rows)),
+            "date": ["2025-01-31"] * rows,
+        }
+    )
+
+
+def table_rows() -> pd.DataFrame:
+    return wr.s3.read_parquet(f"s3://{BUCKET}/{TABLE}/", dataset=True)
+
+
+def test_flush_due():
+    now = datetime(2025, 1, 31, 12, 0, tzinfo=timezone.utc)
+    fresh = {"Size": 10, "LastModified": now}
+    old = {"Size": 10, "LastModified": datetime(2025, 1, 31, 11, 0, tzinfo=timezone.utc)}
+
+    assert not flush_due([], now)
+    assert not flush_due([fresh], now)
+    assert flush_due([fresh, old], now)
+    with patch("buffered_writer.FLUSH_SIZE_BYTES", 20):
+        assert flush_due([fresh, fresh], now)
+
+
+def test_write_buffered_stages_until_due(s3):
+    assert write_buffered_to_s3(batch(0), TABLE) is None
+    assert write_buffered_to_s3(batch(3), TABLE) is None
+
+    assert len(list_staged_batches(TABLE, BUCKET)) == 2
+    assert wr.s3.list_objects(f"s3://{BUCKET}/{TABLE}/") == []
+
+
+def test_write_buffered_flushes_when_due(s3):
+    write_buffered_to_s3(batch(0), TABLE)
+    with patch("buffered_writer.FLUSH_SIZE_BYTES", 1):
+        res = write_buffered_to_s3(batch(3), TABLE)
+
+    assert len(res["paths"]) == 1
+    assert sorted(table_rows()["id"].astype(int)) == list(range(6))
+    assert list_staged_batches(TABLE, BUCKET) == []
+    assert "Contents" not in s3.list_objects_v2(Bucket=BUCKET, Prefix="_staging/")
+
+
+def test_flush_skips_when_another_flush_holds_the_lock(s3):
+    stage_batch(batch(0), TABLE, BUCKET)
+    s3.put_object(
+        Bucket=BUCKET,
+        Key=f"_staging/{TABLE}/_flush.json",
+        Body=json.dumps({"flush_id": "other", "keys": [], "status": "pending"}),
+    )
+
+    assert flush_table(TABLE, BUCKET) is None
+    assert len(list_staged_batches(TABLE, BUCKET)) == 1
+
+
+def test_flush_resumes_stale_flush_without_duplicates(s3):
+    keys = [stage_batch(batch(0), TABLE, BUCKET), stage_batch(batch(3), TABLE, BUCKET)]
+    s3.put_object(
+        Bucket=BUCKET,
+        Key=f"_staging/{TABLE}/_flush.json",
+        Body=json.dumps({"flush_id": "crashed", "keys": keys, "status": "pending"}),
+    )
+    # Output of the crashed attempt, written before its staged batches were deleted
+    wr.s3.to_parquet(
+        df=batch(0, 6).drop(columns="date"),
+        path=f"s3://{BUCKET}/{TABLE}/date=2025-01-31/crashed_partial.snappy.parquet",
+    )
+    # Staged after the crashed flush started, not part of its manifest
+    stage_batch(batch(6), TABLE, BUCKET)
+
+    with patch("buffered_writer.LOCK_TIMEOUT_SECONDS", 0):
+        flush_table(TABLE, BUCKET)
+
+    assert sorted(table_rows()["id"].astype(int)) == list(range(6))
+    assert len(list_staged_batches(TABLE, BUCKET)) == 1
+
+
+def test_batch_id():
+    records = [
+        {"eventID": "shardId-000000000003:111", "kinesis": {"sequenceNumber": "111"}},
+        {"eventID": "shardId-000000000003:222", "kinesis": {"sequenceNumber": "222"}},
+    ]
+
+    assert batch_id(records) == "shardId-000000000003-111-222"
+    assert batch_id([{"eventID": "x"}]) is None
+
+
+def test_select_flush_batches_caps_the_flush_size():
+    batches = [
+        {"Key": key, "Size": 10, "LastModified": datetime(2025, 1, 31, 11, minute)}
+        for key, minute in (("c", 50), ("a", 0), ("b", 30))
+    ]
+
+    with patch("buffered_writer.FLUSH_MAX_BYTES", 25):
+        assert [batch["Key"] for batch in select_flush_batches(batches)] == ["a", "b"]
+    with patch("buffered_writer.FLUSH_MAX_BYTES", 1):
+        assert [batch["Key"] for batch in select_flush_batches(batches)] == ["a"]
+
+
+def test_retried_batch_is_staged_once(s3):
+    write_buffered_to_s3(batch(0), TABLE, staged_batch_id="shard-1-3")
+    write_buffered_to_s3(batch(0), TABLE, staged_batch_id="shard-1-3")
+
+    assert [b["Key"] for b in list_staged_batches(TABLE, BUCKET)] == [
+        f"_staging/{TABLE}/batches/shard-1-3.snappy.parquet"
+    ]
+
+
+def test_failed_flush_does_not_fail_the_staged_batch(s3):
+    with patch("buffered_writer.FLUSH_SIZE_BYTES", 1), patch(
+        "buffered_writer.write_processed_to_s3", side_effect=RuntimeError("boom")
+    ):
+        assert write_buffered_to_s3(batch(0), TABLE) is None
+
+    assert len(list_staged_batches(TABLE, BUCKET)) == 1
+
+
+def test_flush_resumes_stale_flush_whose_keys_were_flushed(s3):
+    key = stage_batch(batch(0), TABLE, BUCKET)
+    s3.put_object(
+        Bucket=BUCKET,
+        Key=f"_staging/{TABLE}/_flush.json",
+        Body=json.dumps(
+            {
+                "flush_id": "crashed",
+                "keys": [f"_staging/{TABLE}/batches/flushed.snappy.parquet", key],
+                "status": "pending",
+            }
+        ),
+    )
+
+    with patch("buffered_writer.LOCK_TIMEOUT_SECONDS", 0):
+        flush_table(TABLE, BUCKET)
+
+    assert sorted(table_rows()["id"].astype(int)) == list(range(3))
+    assert list_staged_batches(TABLE, BUCKET) == []
+    assert "Contents" not in s3.list_objects_v2(Bucket=BUCKET, Prefix="_staging/")
@@ -4,19 +4,25 @@ import sys
 
 
 import unittest
+import pytest
 from unittest.mock import patch, MagicMock
 
+import boto3
 import pandas as pd
 import awswrangler as wr
+from botocore.exceptions import ClientError
+from moto import mock_aws
 import base64
 import json
 from datetime import datetime
 from datetime import date
 from datetime import timezone
+from flatten_json import flatten
 
 sys.path.append(os.path.abspath("../"))
 from utils import (
     camel_to_snake_case,
+    decode_records,
     parse_payload,
     is_unix_timestamp,
     parse_unix_timestamp,
@@ -24,15 +30,53 @@ from utils import (
     parse_date,
     apply_schema,
     apply_type_conversions,
+    get_schema_plan,
     handle_datetime_column,
     write_processed_to_s3,
+    log_event,
+    log_function,
+    set_trace_id,
 )
+import data_catalog
 from lambda_function import (
     lambda_handler,
     TABLE_MAPPING
 )
 
 
+def test_log_event_skips_formatting_for_disabled_level():
+    message = MagicMock(return_value="expensive")
+
+    with patch("utils.logger.log") as mock_log:
+        log_event("debug", "debug_event", message)
+
+    message.assert_not_called()
+    mock_log.assert_not_called()
+
+
+def test_log_event_uses_invocation_trace_id():
+    set_trace_id("request-1")
+
+    with patch("utils.logger.log") as mock_log:
+        log_event("info", "first", lambda: "lazy message")
+        log_event("info", "second")
+
+    logged = [json.loads(call.args[1]) for call in mock_log.call_args_list]
+    assert [line["trace_id"] for line in logged] == ["request-1", "request-1"]
+    assert logged[0]["message"] == "lazy message"
+
+
+def test_log_function_sample_rate():
+    def add_one(value):
+        return value + 1
+
+    assert log_function(sample_rate=0)(add_one) is add_one
+
+    with patch("utils.log_event") as mock_log_event:
+        assert log_function(add_one)(1) == 2
+        assert mock_log_event.call_count == 2
+
+
 def test_camel_to_snake_case():
     assert camel_to_snake_case("CamelCase") == "camel_case"
     assert camel_to_snake_case("camelCase") == "camel_case"
@@ -84,6 +128,78 @@ def test_parse_payload():
     assert isinstance(df.iloc[0]["timestamp_extracted"], datetime)
     assert df.iloc[0]["timestamp_extracted"].tzinfo == timezone.utc
 
+def test_decode_records_matches_flatten():
+    payloads = [
+        {
+            "eventName": "MODIFY",
+            "dynamodb": {
+                "ApproximateCreationDateTime": 1700000000000,
+                "Keys": {"id": {"S": "1"}},
+                "NewImage": {
+                    "id": {"S": "1"},
+                    "amount": {"N": "10.5"},
+                    "isActive": {"BOOL": True},
+                    "meta": {"M": {"S": {"S": "nested"}, "tags": {"L": [{"S": "a"}, {"N": "2"}]}}},
+                    "optional": {"S": "only-first"},
+                },
+                "OldImage": {"id": {"S": "0"}},
+            },
+        },
+        {
+            "eventName": "INSERT",
+            "dynamodb": {
+                "ApproximateCreationDateTime": 1700000000001,
+                "Keys": {"id": {"S": "2"}},
+                "NewImage": {"id": {"S": "2"}, "nothing": {"NULL": True}},
+            },
+        },
+    ]
+    records = [
+        {"kinesis": {"data": base64.b64encode(json.dumps(p).encode("utf-8")).decode("utf-8")}}
+        for p in payloads
+    ]
+
+    columns = decode_records(records)
+
+    expected = []
+    for p in payloads:
+        p["dynamodb"].pop("OldImage", None)
+        expected.append(flatten(p))
+    expected_df = pd.DataFrame(expected)
+
+    assert list(columns) == list(expected_df.columns)
+    assert all(len(values) == 2 for values in columns.values())
+    assert columns["dynamodb_NewImage_meta_M_S_S"] == ["nested", None]
+    assert columns["dynamodb_NewImage_meta_M_tags_L_1_N"] == ["2", None]
+    assert columns["dynamodb_NewImage_nothing_NULL"] == [None, True]
+    assert not any("OldImage" in c for c in columns)
+
+
+def test_parse_payload_keeps_braces_inside_strings():
+    payload = {
+        "dynamodb": {
+            "NewImage": {
+                "rules": {"S": "{}"},
+                "items": {"S": "[]"},
+                "emptyMap": {"M": {}},
+                "emptyList": {"L": []},
+            }
+        }
+    }
+    event = {
+        "Records": [
+            {"kinesis": {"data": base64.b64encode(json.dumps(payload).encode("utf-8")).decode("utf-8")}}
+        ]
+    }
+
+    df = parse_payload(event)
+
+    assert df.iloc[0]["dynamodb_new_image_rules_s"] == "{}"
+    assert df.iloc[0]["dynamodb_new_image_items_s"] == "[]"
+    assert "dynamodb_new_image_empty_map_m" not in df.columns
+    assert "dynamodb_new_image_empty_list_l" not in df.columns
+
+
 def test_is_unix_timestamp():
     assert is_unix_timestamp(1627765200)  # Unix timestamp in seconds
     assert is_unix_timestamp(1627765200000)  # Unix timestamp in milliseconds
@@ -174,6 +290,34 @@ def test_apply_schema():
     result_df = apply_schema(df, schema)
 
 
+def test_apply_schema_does_not_mutate_catalog_schema():
+    df = pd.DataFrame(
+        [[1, "a", "x", "dropped", "new"]],
+        columns=["id", "name", "name", "items_100_s", "unknown"],
+    )
+    schema = {"id": "bigint", "name": "string", "items_100_s": "string"}
+    catalog_schema = dict(schema)
+
+    result_df = apply_schema(df, schema, "test_table_mutation")
+
+    assert schema == catalog_schema
+    assert list(result_df.columns) == ["id", "name", "unknown"]
+    assert result_df.iloc[0]["name"] == "a"
+    assert result_df["id"].dtype == "int64"
+    assert result_df["unknown"].dtype == "string[python]"
+
+
+def test_get_schema_plan_is_cached_per_table_and_columns():
+    schema = {"id": "int", "created_at": "timestamp"}
+
+    plan = get_schema_plan(schema, ("id", "created_at"), "test_table_cache")
+
+    assert get_schema_plan(schema, ("id", "created_at"), "test_table_cache") is plan
+    assert get_schema_plan(schema, ("id",), "test_table_cache") is not plan
+    assert get_schema_plan(schema, ("id", "created_at"), "other_table") is not plan
+    assert get_schema_plan(schema, ("id", "created_at")) is not plan
+
+
 def test_apply_type_conversions():
     df = pd.DataFrame({
         'id': [1, 2, 3],
@@ -247,6 +391,31 @@ def test_numeric_timestamps_milliseconds():
     pd.testing.assert_series_equal(result_series, expected)
 
 
+def test_string_timestamps():
+    """Test conversion of ISO and other supported string formats"""
+    series = pd.Series([
+        "2024-07-30T18:27:00Z",
+        "2024-07-30T20:27:00+02:00",
+        "7/30/2024 6:27:00 PM",
+        "2024-07-30 18:27:00",
+        "30-07-2024 18:27:00",
+    ])
+    result_series = handle_datetime_column(series)
+
+    expected = pd.Series([pd.Timestamp("2024-07-30T18:27:00Z")] * 5)
+    pd.testing.assert_series_equal(result_series, expected)
+
+
+def test_mixed_timestamps():
+    """Test a column mixing epochs, strings and invalid values"""
+    series = pd.Series([1633072800, "1633072800000", "2021-10-01T07:20:00Z", None, "invalid"])
+    result_series = handle_datetime_column(series)
+
+    assert result_series.dtype == "datetime64[ns, UTC]"
+    assert (result_series.iloc[:3] == pd.Timestamp("2021-10-01T07:20:00Z")).all()
+    assert result_series.iloc[3:].isna().all()
+
+
 def test_already_datetime_column():
     """Test that already datetime columns are returned unchanged"""
     series = pd.to_datetime(['2021-10-01', '2021-10-02', '2021-10-03'], utc=True)
@@ -283,6 +452,7 @@ def test_write_to_s3(mock_data_catalog, mock_to_parquet):
         compression="snappy",
         schema_evolution="true",
         partition_cols=["date"],
+        filename_prefix=None,
         dtype={"col1": "bigint", "date": "string"},
         glue_table_settings=wr.typing.GlueTableSettings(
             columns_comments={"col1": "Column 1", "date": "Date"}
@@ -292,6 +462,58 @@ def test_write_to_s3(mock_data_catalog, mock_to_parquet):
     assert result == mock_result
 
 
+def test_data_catalog_loads_tables_lazily():
+    data_catalog.load_table.cache_clear()
+
+    schema = data_catalog.schemas["dynamo_sls_referral"]
+
+    assert data_catalog.load_table.cache_info().currsize == 1
+    assert schema["dynamodb_new_image_created_at_n"] == "timestamp"
+    assert data_catalog.column_comments["dynamo_sls_referral"] == {}
+    assert data_catalog.schemas["dynamo_sls_referral"] is schema
+    assert "dynamo_sls_referral" in data_catalog.schemas
+    assert "missing_table" not in data_catalog.schemas
+    assert set(TABLE_MAPPING.values()) <= set(data_catalog.schemas)
+
+
+def test_data_catalog_on_s3():
+    env = {
+        "AWS_DEFAULT_REGION": "eu-west-2",
+        "AWS_ACCESS_KEY_ID": "testing",
+        "AWS_SECRET_ACCESS_KEY": "testing",
+    }
+    with patch.dict(os.environ, env), mock_aws(), patch.object(
+        data_catalog, "CATALOG_DIR", "s3://catalog-bucket/catalog/"
+    ):
+        data_catalog.load_table.cache_clear()
+        s3 = boto3.client("s3")
+        s3.create_bucket(
+            Bucket="catalog-bucket",
+            CreateBucketConfiguration={"LocationConstraint": "eu-west-2"},
+        )
+        for table in ("table_b", "table_a"):
+            s3.put_object(
+                Bucket="catalog-bucket",
+                Key=f"catalog/{table}.json",
+                Body=json.dumps({"schema": {"id": "string"}, "column_comments": {}}),
+            )
+        s3.put_object(Bucket="catalog-bucket", Key="catalog/old/table_c.json", Body=b"{}")
+
+        assert list(data_catalog.schemas) == ["table_a", "table_b"]
+        assert len(data_catalog.schemas) == 2
+        assert data_catalog.schemas["table_a"] == {"id": "string"}
+        assert "table_b" in data_catalog.schemas
+        assert "missing_table" not in data_catalog.schemas
+
+        with patch("boto3.client") as client:
+            client.return_value.head_object.side_effect = ClientError(
+                {"Error": {"Code": "403"}}, "HeadObject"
+            )
+            with pytest.raises(ClientError):
+                "table_a" in data_catalog.schemas
+    data_catalog.load_table.cache_clear()
+
+
 def test_lambda_handler_success():
     sample_payload = {
         "dynamodb": {
@@ -5,6 +5,7 @@ import re
 import json
 import uuid
 import base64
+import random
 import logging
 import data_catalog
 import awswrangler as wr
@@ -15,12 +16,11 @@ from datetime import datetime
 from datetime import timezone
 from dateutil import parser
 from functools import wraps
-from flatten_json import flatten
-from typing import Any, Callable, Dict
+from typing import Any, Callable, Dict, Optional, Union
 
 
 logger = logging.getLogger()
-logger.setLevel(logging.INFO)
+logger.setLevel(os.environ.get("LOG_LEVEL", "INFO").upper())
 
 
 DEFAULT_ATTRIBUTES = {
@@ -28,40 +28,78 @@ DEFAULT_ATTRIBUTES = {
     "environment": os.environ.get("ENVIRONMENT", "unknown"),
 }
 
+LOG_LEVELS = {
+    "error": logging.ERROR,
+    "warning": logging.WARNING,
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+}
+
+# Share of calls logged by log_function for per-row helpers, 0 removes the wrapper
+ROW_LOG_SAMPLE_RATE = float(os.environ.get("ROW_LOG_SAMPLE_RATE", "0"))
+
+# One trace id per invocation, set by trace_invocation
+_trace_id = str(uuid.uuid4())
+
+
+def set_trace_id(trace_id: Optional[str] = None) -> str:
+    """
+    Sets the trace id attached to every log line, a new random one if not provided.
+    """
+    global _trace_id
+    _trace_id = trace_id or str(uuid.uuid4())
+    return _trace_id
+
 
-def log_event(level: str, event: str, message: str = "", **kwargs):
+def log_event(
+    level: str, event: str, message: Union[str, Callable[[], Any]] = "", **kwargs
+):
     """
     Logs an event with structured JSON format for Datadog.
+    Nothing is formatted when the level is disabled.
     :param level: Log level ('info', 'error', 'warning', 'debug')
     :param event: A descriptive name of the event
-    :param message: Optional message to include in the log
+    :param message: Optional message to include in the log, or a callable returning
+                    it to defer expensive formatting until the level is known enabled
     :param kwargs: Additional attributes to include in the log
     """
+    log_level = LOG_LEVELS.get(level.lower(), logging.INFO)
+    if not logger.isEnabledFor(log_level):
+        return
+
+    if callable(message):
+        message = message()
+
     log_object = {
         **DEFAULT_ATTRIBUTES,
         "level": level.lower(),
         "event": event,
-        "trace_id": str(uuid.uuid4()),
+        "trace_id": _trace_id,
         "message": message,
         **kwargs,
     }
 
-    log_json = json.dumps(log_object)
+    logger.log(log_level, json.dumps(log_object))
 
-    log_methods = {
-        "error": logger.error,
-        "warning": logger.warning,
-        "debug": logger.debug,
-        "info": logger.info,
-    }
 
-    # Call appropriate logger method
-    log_methods.get(level.lower(), logger.info)(log_json)
+def log_function(func: Optional[Callable] = None, *, sample_rate: float = 1.0):
+    """
+    Logs entering/exiting a function and its exceptions.
+    Use as @log_function, or @log_function(sample_rate=...) for functions called per
+    row: only that share of calls is logged, and a rate of 0 returns the function
+    unwrapped.
+    """
+    if func is None:
+        return lambda f: log_function(f, sample_rate=sample_rate)
 
+    if sample_rate <= 0:
+        return func
 
-def log_function(func: Callable):
     @wraps(func)
     def wrapper(*args, **kwargs):
+        if sample_rate < 1 and random.random() >= sample_rate:
+            return func(*args, **kwargs)
+
         func_name = func.__name__
         log_event("info", f"{func_name}_start", f"Entering function: {func_name}")
         try:
@@ -77,6 +115,19 @@ def log_function(func: Callable):
     return wrapper
 
 
+def trace_invocation(func: Callable):
+    """
+    Starts a new trace id for each Lambda invocation, using the AWS request id.
+    """
+
+    @wraps(func)
+    def wrapper(event, context):
+        set_trace_id(getattr(context, "aws_request_id", None))
+        return func(event, context)
+
+    return wrapper
+
+
 def camel_to_snake_case(column_name):
     """
     Converts a string from CamelCase to snake_case.
@@ -84,26 +135,105 @@ def camel_to_snake_case(column_name):
     return re.sub(r"(?!^)([A-Z]+)", r"_\1", column_name).lower().replace("__", "_")
 
 
-@log_function
-def parse_payload(event):
+# DynamoDB attribute-value type descriptors that wrap a single scalar
+DYNAMODB_SCALAR_TYPES = frozenset({"S", "N", "B", "BOOL", "NULL"})
+
+
+def _set_cell(columns: Dict[str, list], row: int, key: str, value) -> None:
     """
-    Accepts an event and returns a pandas DataFrame with snake_case column names.
+    Stores a value in the column array for the given row, padding rows where the
+    column was absent with None.
+    """
+    column = columns.get(key)
+    if column is None:
+        column = columns[key] = [None] * row
+    missing = row - len(column)
+    if missing < 0:
+        # key already seen for this row, keep the last value like a dict would
+        column[row] = value
+        return
+    if missing:
+        column.extend([None] * missing)
+    column.append(value)
+
+
+def _flatten_into(
+    columns: Dict[str, list], keys: Dict[tuple, str], row: int, key: str, value
+) -> None:
+    """
+    Writes the leaves of a decoded JSON value into the column arrays, using the same
+    key layout as flatten_json.flatten (keys joined with '_', list items by index).
+    Empty maps and lists are stored as None, so string values are never rewritten.
+    Joined keys are memoised in `keys` as records of a batch share the same shape.
     """
-    frames = []
+    value_type = type(value)
+    if value_type is dict and value:
+        if len(value) == 1:
+            type_tag, attribute = next(iter(value.items()))
+            if type_tag in DYNAMODB_SCALAR_TYPES and type(attribute) not in (dict, list):
+                child_key = keys.get((key, type_tag))
+                if child_key is None:
+                    child_key = keys[(key, type_tag)] = f"{key}_{type_tag}"
+                column = columns.get(child_key)
+                if column is not None and len(column) == row:
+                    column.append(attribute)
+                else:
+                    _set_cell(columns, row, child_key, attribute)
+                return
+        items = value.items()
+    elif value_type is list and value:
+        items = enumerate(value)
+    elif value_type is dict or value_type is list:
+        _set_cell(columns, row, key, None)
+        return
+    else:
+        _set_cell(columns, row, key, value)
+        return
+
+    for child, child_value in items:
+        child_key = keys.get((key, child))
+        if child_key is None:
+            child_key = keys[(key, child)] = f"{key}_{child}"
+        _flatten_into(columns, keys, row, child_key, child_value)
+
+
+def decode_records(records: list) -> Dict[str, list]:
+    """
+    Decodes a batch of Kinesis records straight into column arrays keyed by the
+    flattened attribute path, without building a flat dict per record.
+    """
+    columns: Dict[str, list] = {}
+    keys: Dict[tuple, str] = {}
+    row_count = 0
+
+    for row, record in enumerate(records):
+        json_payload = json.loads(base64.b64decode(record["kinesis"]["data"]))
 
-    for record in event["Records"]:
-        log_event("info", "decode_payload", "Decoding payload from Base64...")
-        payload = base64.b64decode(record["kinesis"]["data"]).decode("UTF-8")
-        payload = payload.replace("{}", "null").replace("[]", "null")
-        json_payload = json.loads(payload)
+        if isinstance(json_payload.get("dynamodb"), dict):
+            json_payload["dynamodb"].pop("OldImage", None)
 
-        if "OldImage" in json_payload.get("dynamodb", {}):
-            del json_payload["dynamodb"]["OldImage"]
+        for field, value in json_payload.items():
+            _flatten_into(columns, keys, row, field, value)
+        row_count = row + 1
 
-        flat_json = flatten(json_payload)
-        frames.append(flat_json)
+    for column in columns.values():
+        if len(column) < row_count:
+            column.extend([None] * (row_count - len(column)))
 
-    final_df = pd.DataFrame(frames)
+    return columns
+
+
+@log_function
+def parse_payload(event):
+    """
+    Accepts an event and returns a pandas DataFrame with snake_case column names.
+    """
+    log_event(
+        "info",
+        "decode_payload",
+        f"Decoding {len(event['Records'])} payloads from Base64...",
+    )
+    final_df = pd.DataFrame(decode_records(event["Records"]))
 
     # Drop totally empty columns
     final_df = final_df.dropna(axis=1, how="all")
@@ -125,7 +255,7 @@ def parse_payload(event):
     return final_df
 
 
-@log_function
+@log_function(sample_rate=ROW_LOG_SAMPLE_RATE)
 def parse_date(value) -> pd.Timestamp:
     """
     Parse a single value into a valid datetime object.
@@ -139,24 +269,24 @@ def parse_date(value) -> pd.Timestamp:
     return parse_string_date(str(value))
 
 
-@log_function
+@log_function(sample_rate=ROW_LOG_SAMPLE_RATE)
 def is_unix_timestamp(value) -> bool:
     if isinstance(value, (int, float)) or str(value).replace(".", "", 1).isdigit():
         return True
     return False
 
 
-@log_function
+@log_function(sample_rate=ROW_LOG_SAMPLE_RATE)
 def parse_unix_timestamp(value) -> pd.Timestamp:
     value = float(value)
-    log_event("info", "parse_unix_timestamp_input", f"Parsing value: {value}")
+    log_event("debug", "parse_unix_timestamp_input", lambda: f"Parsing value: {value}")
     if value > 1e12:
         return pd.to_datetime(int(value), unit="ms", errors="coerce", utc=True)
     else:
         return pd.to_datetime(int(value), unit="s", errors="coerce", utc=True)
 
 
-@log_function
+@log_function(sample_rate=ROW_LOG_SAMPLE_RATE)
 def parse_string_date(value: str) -> pd.Timestamp:
     """
     Use dateutil.parser to automatically parse string dates.
@@ -167,71 +297,152 @@ def parse_string_date(value: str) -> pd.Timestamp:
         return pd.NaT
 
 
+SCHEMA_TYPE_MAPPING = {
+    "int": "int32",
+    "bigint": "int64",
+    "string": "string[python]",
+    "timestamp": "datetime64[ns, UTC]",
+    "double": "float64",
+    "boolean": "bool",
+    "date": "datetime64[ns]",
+}
+
+# Columns that include an underscore + >2 digits + underscore (flattened list items)
+REDUNDANT_COLUMN_PATTERN = re.compile(r"_\d{3,}_")
+
+# Upper bound of compiled schema plans kept per container
+MAX_SCHEMA_PLANS = 256
+
+_schema_plans: Dict[tuple, "SchemaPlan"] = {}
+
+
+def _column_converter(
+    dtype: str, schema_type_mapping: dict = SCHEMA_TYPE_MAPPING
+) -> Callable[[pd.Series], pd.Series]:
+    """
+    Returns the callable converting a column to the given Athena data type.
+    """
+    if dtype in ["timestamp", "date"]:
+        return handle_datetime_column
+
+    if dtype in ["int", "bigint", "double"]:
+        numeric_dtype = (
+            "int32" if dtype == "int" else "int64" if dtype == "bigint" else "float64"
+        )
+        return lambda column: (
+            pd.to_numeric(column, errors="coerce").fillna(0).astype(numeric_dtype)
+        )
+
+    pandas_dtype = schema_type_mapping.get(dtype, "string[python]")
+    return lambda column: column.astype(pandas_dtype)
+
+
+class SchemaPlan:
+    """
+    Schema application compiled for one Athena table and one observed column layout.
+
+    Holds the positions of the columns to keep (first occurrence of duplicated
+    columns, minus the '_<3+digits>_' ones) and a typed converter per kept column,
+    columns unknown to the schema being converted to string. The catalog schema
+    the plan is built from is never modified.
+    """
+
+    def __init__(self, schema: dict, columns: tuple):
+        self.columns = columns
+
+        duplicated = pd.Index(columns).duplicated()
+        dup_cols = [column for column, dup in zip(columns, duplicated) if dup]
+        if dup_cols:
+            log_event(
+                "info",
+                "Drop duplicate column",
+                f"Dropping duplicate columns (keeping first occurrence): {dup_cols}",
+            )
+
+        drop_cols = [
+            column
+            for column, dup in zip(columns, duplicated)
+            if not dup and REDUNDANT_COLUMN_PATTERN.search(column)
+        ]
+        if drop_cols:
+            log_event(
+                "info",
+                "Drop redundant column",
+                f"Dropping columns matching pattern '_<3+digits>_': {drop_cols}",
+            )
+
+        self.keep_positions = [
+            position
+            for position, (column, dup) in enumerate(zip(columns, duplicated))
+            if not dup and not REDUNDANT_COLUMN_PATTERN.search(column)
+        ]
+        kept_columns = [columns[position] for position in self.keep_positions]
+
+        for column in kept_columns:
+            if column not in schema:
+                log_event(
+                    "info",
+                    "Unknown column",
+                    f"{column} not in schema, consider as string.",
+                )
+
+        self.converters = {
+            column: _column_converter(schema.get(column, "string"))
+            for column in kept_columns
+        }
+
+    def apply(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Applies the plan to a DataFrame with the column layout it was compiled for.
+        """
+        if len(self.keep_positions) != len(self.columns):
+            df = df.iloc[:, self.keep_positions]
+
+        return pd.DataFrame(
+            {column: convert(df[column]) for column, convert in self.converters.items()},
+            index=df.index,
+        )
+
+
+def get_schema_plan(
+    schema: dict, columns: tuple, athena_table: Optional[str] = None
+) -> SchemaPlan:
+    """
+    Returns the schema plan for the given column layout, compiled once per container
+    for each Athena table. Without an Athena table name the plan is not cached.
+    """
+    if athena_table is None:
+        return SchemaPlan(schema, columns)
+
+    key = (athena_table, columns)
+    plan = _schema_plans.get(key)
+    if plan is None:
+        if len(_schema_plans) >= MAX_SCHEMA_PLANS:
+            _schema_plans.pop(next(iter(_schema_plans)))
+        plan = _schema_plans[key] = SchemaPlan(schema, columns)
+
+    return plan
+
+
 @log_function
-def apply_schema(df: pd.DataFrame, schema: dict) -> pd.DataFrame:
+def apply_schema(
+    df: pd.DataFrame, schema: dict, athena_table: Optional[str] = None
+) -> pd.DataFrame:
     """
     Apply specified data types to the columns of a DataFrame based on the input schema.
 
     Args:
         df (pd.DataFrame): DataFrame with generic data types.
         schema (dict): Athena schema containing columns' dtypes.
+        athena_table (str, optional): Athena table name, caches the compiled schema
+            plan across warm invocations when provided.
 
     Returns:
         pd.DataFrame: DataFrame with data types specified in the schema.
     """
-    schema_type_mapping = {
-        "int": "int32",
-        "bigint": "int64",
-        "string": "string[python]",
-        "timestamp": "datetime64[ns, UTC]",
-        "double": "float64",
-        "boolean": "bool",
-        "date": "datetime64[ns]",
-    }
-
-    # Drop duplicated columns (keep first occurrence only)
-    if df.columns.duplicated().any():
-        dup_cols = df.columns[df.columns.duplicated()].tolist()
-        log_event(
-            "info",
-            "Drop duplicate column",
-            f"Dropping duplicate columns (keeping first occurrence): {dup_cols}",
-        )
-        df = df.loc[:, ~df.columns.duplicated()]
-        # also remove duplicates from schema
-        for c in dup_cols:
-            if c in schema:
-                schema.pop(c, None)
-
-    # Drop columns that include an underscore + >2 digits + underscore
-    pattern = re.compile(r"_\d{3,}_")
-    drop_cols = [col for col in df.columns if pattern.search(col)]
-    if drop_cols:
-        log_event(
-            "info",
-            "Drop redundant column",
-            f"Dropping columns matching pattern '_<3+digits>_': {drop_cols}",
-        )
-        # drop from dataframe
-        df = df.drop(columns=drop_cols)
-        # remove from schema if present
-        for c in drop_cols:
-            if c in schema:
-                schema.pop(c, None)
-
-    # Add any df columns missing in schema as strings (after dropping unwanted columns)
-    for column in df.columns:
-        if column not in schema.keys():
-            log_event(
-                "info",
-                "Unknown column",
-                f"{column} not in schema, consider as string.",
-            )
-            schema[column] = "string"
+    plan = get_schema_plan(schema, tuple(df.columns), athena_table)
 
-    df = apply_type_conversions(df, schema, schema_type_mapping)
-
-    return df
+    return plan.apply(df)
 
 
 @log_function
@@ -243,59 +454,90 @@ def apply_type_conversions(
     """
     for column, dtype in schema.items():
         if column in df.columns:
-            pandas_dtype = schema_type_mapping.get(dtype, "string[python]")
+            convert = _column_converter(dtype, schema_type_mapping)
 
             if dtype in ["timestamp", "date"]:
                 log_event(
-                    "info",
+                    "debug",
                     "before_datetime_conversion",
-                    f"Before conversion: {df[column].head(5)}",
+                    lambda: f"Before conversion: {df[column].head(5)}",
                 )
-                df[column] = handle_datetime_column(df[column])
+                df[column] = convert(df[column])
                 log_event(
-                    "info",
+                    "debug",
                     "after_datetime_conversion",
-                    f"After conversion: {df[column].head(5)}",
-                )
-            elif dtype in ["int", "bigint", "double"]:
-                df[column] = (
-                    pd.to_numeric(df[column], errors="coerce")
-                    .fillna(0)
-                    .astype(
-                        "int32"
-                        if dtype == "int"
-                        else "int64" if dtype == "bigint" else "float64"
-                    )
+                    lambda: f"After conversion: {df[column].head(5)}",
                 )
             else:
-                df[column] = df[column].astype(pandas_dtype)
+                df[column] = convert(df[column])
 
     return df
 
 
+# String formats tried in order, same as apply_iso_format in common/dynamo_custom_functions.py
+DATETIME_FORMATS = [
+    "ISO8601",  # Ex: 2024-07-30T18:27:00Z
+    "%m/%d/%Y %I:%M:%S %p",  # Ex: 7/30/2024 6:27:00 PM
+    "%Y-%m-%d %H:%M:%S",  # Ex: 2024-07-30 18:27:00
+    "%d-%m-%Y %H:%M:%S",  # Ex: 30-07-2024 18:27:00
+]
+
+UTC_OFFSET_PATTERN = re.compile(
+    r"\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?(?:Z|[+-]\d{2}(?::?\d{2})?)$"
+)
+
+
 @log_function
 def handle_datetime_column(column: pd.Series) -> pd.Series:
     """
     Handle conversion of a column to datetime, supporting numeric timestamps and ISO strings.
+
+    The column is split once into millisecond epochs, second epochs and strings (with
+    and without UTC offset), each partition converted with a single array call per
+    format; values matching none of them are NaT.
     """
     if pd.api.types.is_datetime64_any_dtype(column):
         return column
 
-    # Ensure the column is treated as numeric only if it doesn't already have datetime values
+    result = pd.Series(
+        pd.NaT, index=column.index, dtype="datetime64[ns, UTC]", name=column.name
+    )
+
     numeric_column = pd.to_numeric(column, errors="coerce")
+    is_numeric = numeric_column.notna()
+    is_ms_epoch = numeric_column > 1e12
+    is_s_epoch = is_numeric & ~is_ms_epoch
+
+    for mask, unit in ((is_ms_epoch, "ms"), (is_s_epoch, "s")):
+        if mask.any():
+            result.loc[mask] = pd.to_datetime(
+                numeric_column[mask], unit=unit, errors="coerce", utc=True
+            )
 
-    return numeric_column.apply(
-        lambda x: (
-            pd.to_datetime(x, unit="ms", errors="coerce", utc=True)
-            if x > 1e12
-            else pd.to_datetime(x, unit="s", errors="coerce", utc=True)
-        )
-    )
+    strings = column[~is_numeric & column.notna()].astype(str)
+    # Parsed apart as pandas applies a previous value's UTC offset to naive strings
+    has_offset = strings.str.contains(UTC_OFFSET_PATTERN)
+
+    for remaining in (strings[has_offset], strings[~has_offset]):
+        for date_format in DATETIME_FORMATS:
+            if remaining.empty:
+                break
+            parsed = pd.to_datetime(
+                remaining, format=date_format, errors="coerce", utc=True
+            )
+            is_parsed = parsed.notna()
+            result.loc[parsed.index[is_parsed]] = parsed[is_parsed]
+            remaining = remaining[~is_parsed]
+
+    return result
 
 
 @log_function
 def write_processed_to_s3(
-    df: pd.DataFrame, athena_table: str, s3_bucket=None
+    df: pd.DataFrame,
+    athena_table: str,
+    s3_bucket=None,
+    filename_prefix: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     Writes processed data to S3 as a Parquet file and registers it with Athena.
@@ -303,6 +545,7 @@ def write_processed_to_s3(
     :param df: The DataFrame to write
     :param s3_bucket: The S3 bucket to write to
     :param athena_table: The Athena table name
+    :param filename_prefix: Optional prefix of the written file names
     :return: The result of the write operation
     """
     if s3_bucket is None:
@@ -322,6 +565,7 @@ def write_processed_to_s3(
         table=athena_table,
         mode="append",
         schema_evolution="true",
+        filename_prefix=filename_prefix,
         dtype=data_catalog.schemas[athena_table],
         glue_table_settings=wr.typing.GlueTableSettings(
             columns_comments=data_catalog.column_comments[athena_table]
@@ -0,0 +1,33 @@
+# ###########################################################
+# # AWS Glue job: compact datalake_raw partitions glue job
+# ###########################################################
+
+resource "aws_glue_job" "compact_partitions" {
+  name         = "${local.prefix}-compact-partitions"
+  role_arn     = aws_iam_role.iam_for_glue.arn
+  max_capacity = 1.0
+  max_retries  = "0"
+  timeout      = 2880 # 48 hours
+
+  command {
+    name            = "pythonshell"
+    script_location = "s3://${local.aws_glue_bucket_name}/scripts/ddb_compact_partitions/ddb_compact_partitions.py"
+    python_version  = "3.9"
+  }
+
+  default_arguments = {
+    "--S3_BUCKET_NAME"      = local.raw_datalake_bucket_name
+    "--ATHENA_TABLE_NAME"   = "athena_table_name"
+    "--START_DATE"          = "2025-01-01" // first partition date to compact, format %Y-%m-%d
+    "--END_DATE"            = "2025-01-31" // last partition date to compact, format %Y-%m-%d
+    "--PARALLELISM"         = "4"          // partitions compacted at the same time
+    "--TARGET_FILE_SIZE_MB" = "256"
+    "--ROW_GROUP_SIZE_MB"   = "128"
+
+    "--extra-py-files"                   = "s3://${local.aws_glue_bucket_name}/scripts/ddb_read_write_parquet/ddb_read_write_parquet.py"
+    "--TempDir"                          = "s3://${local.aws_glue_bucket_name}/temporary/"
+    "--enable-continuous-cloudwatch-log" = "true"
+    "--enable-continuous-log-filter"     = "true"
+    "--enable-glue-datacatalog"          = "true"
+  }
+}
@@ -24,9 +24,22 @@ resource "aws_glue_job" "dynamodb_to_athena_generic_backfill" {
     "--WRANGLER_WRITE_MODE"    = "append"                         // mode for writing data to S3. Can be `append`, `overwrite`, or `overwrite_partitions`
     "--START_DATE"             = "01-07-2024"                     // in format %d-%m-%Y to filter records with property updatedAt > START_DATE
     "--AUTO_SCHEMA"            = "False"                          // bool, if True, schema will be auto inferred, else from generic lambda data_catalog
+    "--DATA_CATALOG_DIR"       = "s3://${local.aws_glue_bucket_name}/scripts/ddb_generic/catalog/" // per table json files of the generic lambda data_catalog
+    "--TOTAL_SEGMENTS"         = "1"                              // number of parallel scan segments, 1 = sequential scan
+    "--MAX_CONSUMED_RCU"       = "0"                              // max read capacity units consumed per second by the scan, 0 = unlimited
+    "--RESUME"                 = "False"                          // bool, if True, continue the last run of RESULT_ATHENA_TABLE from its checkpoint
+    "--CHECKPOINT_LOCATION"    = "s3://${local.aws_glue_bucket_name}/checkpoints/ddb_generic_backfill/" // s3:// prefix or local directory of the checkpoints
+    "--BULK_WINDOW_PAGES"      = "50"                             // scan pages held in memory at once in bulk mode (INCREMENTAL_MODE False)
+    "--PIPELINE_QUEUE_SIZE"    = "2"                              // pages queued between the scan, transform and write stages in incremental mode, 0 = sequential
+    "--PROJECTION"             = "False"                          // bool, if True, only fetch the attributes of the data_catalog schema
+    "--QUERY_INDEX_NAME"       = "None"                           // GSI to query instead of scanning the table, None = scan
+    "--QUERY_PARTITION_KEY"    = "None"                           // GSI partition key attribute (string)
+    "--QUERY_PARTITION_VALUES" = "None"                           // comma separated GSI partition key values, queried in parallel
+    "--QUERY_SORT_KEY"         = "None"                           // GSI sort key compared to START_DATE, None = START_DATE stays a filter
+    "--INFERENCE_SAMPLE_SIZE"  = "1000"                           // rows sampled per page/window to infer column types with AUTO_SCHEMA
 
 
-    "--extra-py-files"                   = "s3://${local.aws_glue_bucket_name}/scripts/ddb_generic/data_catalog.py"
+    "--extra-py-files"                   = "s3://${local.aws_glue_bucket_name}/scripts/ddb_generic/data_catalog.py,s3://${local.aws_glue_bucket_name}/scripts/ddb_common/dynamo_custom_functions.py"
     "--TempDir"                          = "s3://${local.aws_glue_bucket_name}/temporary/"
     "--additional-python-modules"        = "flatten-json==0.1.14"
     "--enable-continuous-cloudwatch-log" = "true"
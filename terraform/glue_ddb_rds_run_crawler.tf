@@ -118,6 +118,16 @@ resource "aws_iam_policy" "glue_run_crawler_policy" {
         "Resource" : [
           aws_glue_crawler.rds_export_crawler.arn
         ]
+      },
+      {
+        Action : "cloudwatch:PutMetricData"
+        Effect : "Allow"
+        Resource : "*"
+        Condition : {
+          StringEquals : {
+            "cloudwatch:namespace" : "Datalake/RdsExport"
+          }
+        }
       }
     ]
   })
@@ -12,12 +12,19 @@ module "lambda_ddb_datalake_recon" {
   layers        = [local.lambda_layer_aws_wrangler_arn]
   memory_size   = 10240
 
+  # Sorted key runs of the key level diff are spilled to /tmp
+  ephemeral_storage_size = 10240
+
   source_path = [
     "../lambdas/ddb_reconciliation",
   ]
 
   environment_variables = {
     S3_RECON                          = local.reconciliation_bucket_name,
+    DYNAMO_COUNT_MODE                 = var.dynamo_recon_count_mode,
+    DYNAMO_COUNT_SEGMENTS             = 8,
+    ATHENA_READ_MODE                  = "count",
+    RECON_MAX_WORKERS                 = 8,
     DYNAMODB_CUSTOMERS                = data.aws_ssm_parameter.users_customers_table_name.value,
     DYNAMODB_CARD_FAST_MESSAGES       = data.aws_ssm_parameter.cards_fast_messages_table_name.value,
     DYNAMODB_CARDS                    = data.aws_ssm_parameter.cards_cards_table_name.value,
@@ -86,3 +93,32 @@ resource "aws_lambda_permission" "dynamodb_datalake_recon_allow_cloudwatch_event
   principal     = "events.amazonaws.com"
   source_arn    = aws_cloudwatch_event_rule.schedule_ddb_datalake_recon[each.key].arn
 }
+
+###########################################################
+# Multi table reconciliation, all tables in one invocation
+###########################################################
+resource "aws_cloudwatch_event_rule" "schedule_ddb_datalake_recon_all" {
+  count               = var.dynamo_recon_all_tables_schedule == null ? 0 : 1
+  name                = "datalake_raw_dynamo_recon_all_events"
+  description         = "Schedule Lambda function execution for the Reconciliation of all tables"
+  schedule_expression = var.dynamo_recon_all_tables_schedule
+}
+
+resource "aws_cloudwatch_event_target" "dynamodb_datalake_recon_all_lambdaexecution" {
+  count = var.dynamo_recon_all_tables_schedule == null ? 0 : 1
+  arn   = module.lambda_ddb_datalake_recon.lambda_function_arn
+  rule  = aws_cloudwatch_event_rule.schedule_ddb_datalake_recon_all[0].name
+
+  input = jsonencode({
+    dynamo_recon_tables = "all"
+  })
+}
+
+resource "aws_lambda_permission" "dynamodb_datalake_recon_all_allow_cloudwatch_event_rule" {
+  count         = var.dynamo_recon_all_tables_schedule == null ? 0 : 1
+  statement_id  = "AllowExecutionFromCloudWatch_dynamo_recon_all"
+  action        = "lambda:InvokeFunction"
+  function_name = module.lambda_ddb_datalake_recon.lambda_function_arn
+  principal     = "events.amazonaws.com"
+  source_arn    = aws_cloudwatch_event_rule.schedule_ddb_datalake_recon_all[0].arn
+}
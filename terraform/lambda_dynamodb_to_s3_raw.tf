@@ -10,7 +10,12 @@ module "lambda_dynamodb_to_s3_raw" {
   runtime       = "python3.12"
   layers        = [local.lambda_layer_aws_wrangler_arn]
   timeout       = 900
-  memory_size   = var.lambda_ddb_to_s3_memory_size
+  # A buffer flush merges up to BUFFER_FLUSH_MAX_BYTES of compressed Parquet in memory
+  memory_size = (
+    var.lambda_ddb_to_s3_buffered_writes
+    ? max(var.lambda_ddb_to_s3_memory_size, 1024)
+    : var.lambda_ddb_to_s3_memory_size
+  )
 
   source_path = [
     {
@@ -25,7 +30,8 @@ module "lambda_dynamodb_to_s3_raw" {
   ]
 
   environment_variables = {
-    S3_RAW = local.raw_datalake_bucket_name
+    S3_RAW          = local.raw_datalake_bucket_name
+    BUFFERED_WRITES = tostring(var.lambda_ddb_to_s3_buffered_writes)
   }
 
   hash_extra   = "${local.prefix}-dynamodb-to-s3-raw"
@@ -34,6 +40,35 @@ module "lambda_dynamodb_to_s3_raw" {
   tracing_mode = "Active"
 }
 
+###########################################################
+# Scheduled flush of buffered stream batches
+###########################################################
+resource "aws_cloudwatch_event_rule" "schedule_ddb_to_s3_raw_buffer_flush" {
+  count               = var.lambda_ddb_to_s3_buffered_writes ? 1 : 0
+  name                = "${local.prefix}-dynamodb-to-s3-raw-buffer-flush"
+  description         = "Flush buffered stream batches to datalake_raw"
+  schedule_expression = var.lambda_ddb_to_s3_buffer_flush_schedule
+}
+
+resource "aws_cloudwatch_event_target" "dynamodb_to_s3_raw_buffer_flush" {
+  count = var.lambda_ddb_to_s3_buffered_writes ? 1 : 0
+  arn   = module.lambda_dynamodb_to_s3_raw.lambda_function_arn
+  rule  = aws_cloudwatch_event_rule.schedule_ddb_to_s3_raw_buffer_flush[0].name
+
+  input = jsonencode({
+    buffer_flush = true
+  })
+}
+
+resource "aws_lambda_permission" "dynamodb_to_s3_raw_allow_buffer_flush_rule" {
+  count         = var.lambda_ddb_to_s3_buffered_writes ? 1 : 0
+  statement_id  = "AllowExecutionFromCloudWatchBufferFlush"
+  action        = "lambda:InvokeFunction"
+  function_name = module.lambda_dynamodb_to_s3_raw.lambda_function_arn
+  principal     = "events.amazonaws.com"
+  source_arn    = aws_cloudwatch_event_rule.schedule_ddb_to_s3_raw_buffer_flush[0].arn
+}
+
 ###########################################################
 # AWS Lambda Triggers - customers
 ###########################################################
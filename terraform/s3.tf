@@ -27,3 +27,13 @@ resource "aws_s3_object" "glue_generic_lambda_py_files" {
   acl                    = "private"
   server_side_encryption = "AES256"
 }
+
+resource "aws_s3_object" "glue_generic_lambda_catalog_files" {
+  bucket                 = local.aws_glue_bucket_name
+  for_each               = fileset("${path.module}/../lambdas/dynamodb_lambda_to_s3_raw/catalog/", "*.json")
+  source                 = "${path.module}/../lambdas/dynamodb_lambda_to_s3_raw/catalog/${each.value}"
+  etag                   = filemd5("${path.module}/../lambdas/dynamodb_lambda_to_s3_raw/catalog/${each.value}")
+  key                    = "/scripts/ddb_generic/catalog/${each.value}"
+  acl                    = "private"
+  server_side_encryption = "AES256"
+}
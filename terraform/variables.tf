@@ -38,6 +38,18 @@ variable "lambda_ddb_to_s3_memory_size" {
   default     = 512
 }
 
+variable "lambda_ddb_to_s3_buffered_writes" {
+  description = "Stage stream batches and flush them to datalake_raw in larger files"
+  type        = bool
+  default     = false
+}
+
+variable "lambda_ddb_to_s3_buffer_flush_schedule" {
+  description = "Schedule of the flush of buffered stream batches"
+  type        = string
+  default     = "rate(15 minutes)"
+}
+
 variable "lambda_ddb_rds_memory_size" {
   description = "Memory size for the RDS lambda function"
   type        = number
@@ -66,3 +78,15 @@ variable "dynamo_recon_table_events" {
   description = "List of dynamo_tables that will be recocile"
   default     = {}
 }
+
+variable "dynamo_recon_count_mode" {
+  description = "How the reconciliation counts DynamoDB items: scan (exact), describe (approximate) or cached"
+  type        = string
+  default     = "scan"
+}
+
+variable "dynamo_recon_all_tables_schedule" {
+  description = "Schedule of the reconciliation of all dynamo_tables in one invocation, null to disable"
+  type        = string
+  default     = null
+}